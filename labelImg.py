@@ -6,9 +6,15 @@ import os.path
 import platform
 import shutil
 import sys
-import webbrowser as wb
+import time
+from bisect import bisect_left, bisect_right
+from collections import deque
+from contextlib import contextmanager
 from functools import partial
 
+# Taken before the Qt and libs imports so that --profile-startup includes them
+STARTUP_BEGIN = time.perf_counter()
+
 try:
     from PyQt5.QtGui import *
     from PyQt5.QtCore import *
@@ -32,26 +38,39 @@ from libs.utils import *
 from libs.settings import Settings
 from libs.shape import Shape, DEFAULT_LINE_COLOR, DEFAULT_FILL_COLOR
 from libs.stringBundle import StringBundle
-from libs.canvas import Canvas
+from libs.glCanvas import create_canvas, CANVAS_BACKEND_RASTER, CANVAS_BACKEND_OPENGL
+from libs.labelColors import label_colors, PALETTE_FILE_NAME
+from libs.shapeRenderer import LOD_VERTEX_MIN_SIZE, LOD_LABEL_MIN_SIZE, LOD_TINY_MAX_SIZE
+from libs.tiledImage import TiledImage
+from libs.displayPolicy import (DisplayPolicy, ImageDecodeWorker, available_memory, scale_factor,
+                                DISPLAY_RESOLUTION_AUTO, DISPLAY_RESOLUTION_FULL)
 from libs.zoomWidget import ZoomWidget
 from libs.lightWidget import LightWidget
 from libs.labelDialog import LabelDialog
 from libs.colorDialog import ColorDialog
 from libs.labelFile import LabelFile, LabelFileError, LabelFileFormat
+from libs.saveQueue import SaveQueue, SaveSnapshot, write_snapshot
+from libs.imageTrash import TrashWorker, trash_dir_for
+from libs.folderWatcher import FolderWatcher
+from libs.annotationIndex import (AnnotationIndex, ImageFilter, FILTER_MODES, FILTER_ALL, FILTER_CLASS,
+                                  FILTER_BOX_COUNT, parse_count_range, read_annotation_summary)
 from libs.toolBar import ToolBar, DropdownToolButton
 from libs.styles import TOOLBAR_STYLE, get_combined_style
-from libs.pascal_voc_io import PascalVocReader
 from libs.pascal_voc_io import XML_EXT
-from libs.yolo_io import YoloReader
 from libs.yolo_io import TXT_EXT
-from libs.create_ml_io import CreateMLReader
 from libs.create_ml_io import JSON_EXT
 from libs.ustr import ustr
 from libs.hashableQListWidgetItem import HashableQListWidgetItem
-from libs.galleryWidget import GalleryWidget, AnnotationStatus
-from libs.commands import UndoStack, CreateShapeCommand, DeleteShapeCommand, MoveShapeCommand, EditLabelCommand
+from libs.galleryWidget import GalleryWidget
+from libs.startupProfiler import StartupProfiler
+from libs.commands import (UndoStack, UndoHistoryStore, CreateShapeCommand, DeleteShapeCommand, MoveShapeCommand,
+                           EditLabelCommand, MacroCommand)
 
 __appname__ = 'labelImg'
+# Seconds --profile-startup waits for the image given on the command line
+STARTUP_PROFILE_TIMEOUT = 60
+# Settings changed while running are written this many ms after the last change
+SETTINGS_SAVE_DELAY = 2000
 
 
 class WindowMixin(object):
@@ -83,6 +102,7 @@ class MainWindow(QMainWindow, WindowMixin):
         # Load setting in the main thread
         self.settings = Settings()
         self.settings.load()
+        self.settings.save_delay = SETTINGS_SAVE_DELAY
         settings = self.settings
 
         self.os_name = platform.system()
@@ -93,16 +113,35 @@ class MainWindow(QMainWindow, WindowMixin):
 
         # Save as Pascal voc xml
         self.default_save_dir = default_save_dir
-        self.label_file_format = settings.get(SETTING_LABEL_FILE_FORMAT, LabelFileFormat.PASCAL_VOC)
+        try:
+            self.label_file_format = LabelFileFormat(settings.get(SETTING_LABEL_FILE_FORMAT, LabelFileFormat.PASCAL_VOC))
+        except ValueError:
+            self.label_file_format = LabelFileFormat.PASCAL_VOC  # Hand-edited settings hold an unknown format
 
         # For loading all image under a directory
         self.m_img_list = []
         self._path_to_idx = {}  # O(1) lookup: path -> index
-        self._annotation_status_cache = {}  # Cache: path -> status (reduces I/O)
+        self.annotation_index = AnnotationIndex()  # path -> status and classes (reduces I/O)
+        self.image_filter = None  # ImageFilter of the images shown and stepped through, None for all
+        self._filter_rows = []  # Sorted rows of m_img_list passing image_filter
+        self._index_queue = deque()  # Images waiting for _index_next_batch() to read their annotations
+        self._index_done = 0  # Images read by the running indexing pass, for its progress
+        self._index_generation = 0  # Bumped to cancel the running indexing pass
 
         # Memory optimization for large images (Issue #31)
         self._image_scale_factor = 1.0  # Display size / Original size
         self._original_image_size = None  # QSize of original image
+        self._decoded_size = None  # QSize of the pixmap currently shown
+        self._dataset_zoom = {}  # dir -> last native zoom, backed by the folder settings
+        # Older versions kept the zoom of every folder in the global settings
+        for dir_name, zoom in settings.pop(SETTING_DATASET_ZOOM, {}).items():
+            settings.dataset(dir_name)[DATASET_ZOOM] = zoom
+        self._decode_pool = QThreadPool()
+        self._decode_pool.setMaxThreadCount(1)
+        self._redecode_timer = QTimer(self)
+        self._redecode_timer.setSingleShot(True)
+        self._redecode_timer.setInterval(250)
+        self._redecode_timer.timeout.connect(self._request_redecode)
 
         self.dir_name = None
         self.label_hist = []
@@ -124,17 +163,23 @@ class MainWindow(QMainWindow, WindowMixin):
 
         # Load predefined classes to the list
         self.load_predefined_classes(default_prefdef_class_file)
+        # Optional user colours for the labels, next to the classes file
+        self.load_label_palette(os.path.join(os.path.dirname(default_prefdef_class_file), PALETTE_FILE_NAME))
 
         if self.label_hist:
             self.default_label = self.label_hist[0]
         else:
             print("Not find:/data/predefined_classes.txt (optional)")
 
-        # Main widgets and related state.
-        self.label_dialog = LabelDialog(parent=self, list_item=self.label_hist)
+        # Main widgets and related state. The label and colour dialogs are
+        # built on first use, see the label_dialog and color_dialog properties.
+        self._label_dialog = None
+        self._color_dialog = None
 
         self.items_to_shapes = {}
         self.shapes_to_items = {}
+        # Label each list item is counted under in the label filter combo box
+        self._item_labels = {}
         self.prev_label_text = ''
 
         list_layout = QVBoxLayout()
@@ -186,22 +231,43 @@ class MainWindow(QMainWindow, WindowMixin):
 
         # File list widget (existing list view)
         self.file_list_widget = QListWidget()
+        self.file_list_widget.setSelectionMode(QAbstractItemView.ExtendedSelection)
         self.file_list_widget.itemDoubleClicked.connect(self.file_item_double_clicked)
         self.file_list_widget.itemClicked.connect(self.file_item_clicked)
 
-        # Gallery widget (new thumbnail view)
-        self.gallery_widget = GalleryWidget()
-        self.gallery_widget.image_selected.connect(self.gallery_image_selected)
-        self.gallery_widget.image_activated.connect(self.gallery_image_activated)
+        # Gallery widget (new thumbnail view), built when its tab is first opened
+        self.gallery_widget = None
+        self._pending_gallery_row = None  # Gallery scroll row to restore once it is built
+        self.gallery_container = QWidget()
+        gallery_layout = QVBoxLayout(self.gallery_container)
+        gallery_layout.setContentsMargins(0, 0, 0, 0)
 
         # Tab widget to hold both views
         self.file_view_tabs = QTabWidget()
         self.file_view_tabs.addTab(self.file_list_widget, get_str('listView'))
-        self.file_view_tabs.addTab(self.gallery_widget, get_str('galleryView'))
+        self.file_view_tabs.addTab(self.gallery_container, get_str('galleryView'))
         self.file_view_tabs.currentChanged.connect(self.on_file_view_tab_changed)
 
+        # Filter of both views by annotation status, class or box count
+        self.filter_combo = QComboBox()
+        for mode in FILTER_MODES:
+            self.filter_combo.addItem(get_str(mode), mode)
+        self.filter_combo.currentIndexChanged.connect(self._filter_mode_changed)
+        self.filter_value_combo = QComboBox()
+        self.filter_value_combo.setEditable(True)
+        self.filter_value_combo.setInsertPolicy(QComboBox.NoInsert)
+        self.filter_value_combo.setToolTip(get_str('filterValueTip'))
+        self.filter_value_combo.activated.connect(self._apply_filter_controls)
+        self.filter_value_combo.lineEdit().returnPressed.connect(self._apply_filter_controls)
+        self.filter_value_combo.setHidden(True)
+        filter_layout = QHBoxLayout()
+        filter_layout.setContentsMargins(0, 0, 0, 0)
+        filter_layout.addWidget(self.filter_combo)
+        filter_layout.addWidget(self.filter_value_combo, 1)
+
         file_list_layout = QVBoxLayout()
         file_list_layout.setContentsMargins(0, 0, 0, 0)
+        file_list_layout.addLayout(filter_layout)
         file_list_layout.addWidget(self.file_view_tabs)
         file_list_container = QWidget()
         file_list_container.setLayout(file_list_layout)
@@ -211,12 +277,16 @@ class MainWindow(QMainWindow, WindowMixin):
 
         self.zoom_widget = ZoomWidget()
         self.light_widget = LightWidget(get_str('lightWidgetTitle'))
-        self.color_dialog = ColorDialog(parent=self)
 
-        self.canvas = Canvas(parent=self)
+        self.canvas = create_canvas(settings.get(SETTING_CANVAS_BACKEND, CANVAS_BACKEND_RASTER), parent=self)
         self.canvas.zoomRequest.connect(self.zoom_request)
         self.canvas.lightRequest.connect(self.light_request)
         self.canvas.set_drawing_shape_to_square(settings.get(SETTING_DRAW_SQUARE, False))
+        # Level-of-detail thresholds for dense annotations at low zoom
+        renderer = self.canvas.renderer
+        renderer.vertex_min_size = settings.get(SETTING_LOD_VERTEX_MIN_SIZE, LOD_VERTEX_MIN_SIZE)
+        renderer.label_min_size = settings.get(SETTING_LOD_LABEL_MIN_SIZE, LOD_LABEL_MIN_SIZE)
+        renderer.tiny_max_size = settings.get(SETTING_LOD_TINY_MAX_SIZE, LOD_TINY_MAX_SIZE)
 
         scroll = QScrollArea()
         scroll.setWidget(self.canvas)
@@ -230,12 +300,32 @@ class MainWindow(QMainWindow, WindowMixin):
 
         self.canvas.newShape.connect(self.new_shape)
         self.canvas.shapeMoved.connect(self.set_dirty)
+        self.canvas.shapeMoveFinished.connect(self.shape_move_finished)
         self.canvas.selectionChanged.connect(self.shape_selection_changed)
         self.canvas.drawingPolygon.connect(self.toggle_drawing_sensitive)
 
-        # Initialize undo/redo system
-        self.undo_stack = UndoStack(max_size=50)
+        # Initialize undo/redo system; each image keeps its own history
+        self.undo_stack = UndoStack()
         self.undo_stack.add_callback(self.update_undo_redo_actions)
+        self._undo_histories = UndoHistoryStore()
+        # Nesting depth of bulk_edit() blocks
+        self._bulk_edit_depth = 0
+
+        # Watches the open folder for images and annotations changed by others
+        self.folder_watcher = None
+        # (annotation dir, file stem) -> image paths, for the save dir it was built for
+        self._annotation_keys = None
+        self._annotation_keys_save_dir = None
+
+        # Batches of trashed images are moved one after the other off the GUI thread
+        self._trash_pool = QThreadPool()
+        self._trash_pool.setMaxThreadCount(1)
+        self._trash_failures = []
+
+        # Auto-saves are written in the background so navigation does not wait
+        self.save_queue = SaveQueue()
+        self.save_queue.signals.saved.connect(self._on_background_save_done)
+        self.save_queue.signals.failed.connect(self._on_background_save_failed)
 
         self.setCentralWidget(scroll)
         self.addDockWidget(Qt.RightDockWidgetArea, self.dock)
@@ -297,6 +387,8 @@ class MainWindow(QMainWindow, WindowMixin):
         close = action(get_str('closeCur'), self.close_file, 'Ctrl+W', 'close', get_str('closeCurDetail'))
 
         delete_image = action(get_str('deleteImg'), self.delete_image, 'Ctrl+Shift+D', 'close', get_str('deleteImgDetail'))
+        trash_images = action(get_str('trashImg'), self.trash_selected_images, 'Ctrl+Alt+D', 'close',
+                              get_str('trashImgDetail'))
 
         reset_all = action(get_str('resetAll'), self.reset_all, None, 'resetall', get_str('resetAllDetail'))
 
@@ -346,10 +438,6 @@ class MainWindow(QMainWindow, WindowMixin):
                           'Ctrl+A', 'hide', get_str('showAllBoxDetail'),
                           enabled=False)
 
-        help_default = action(get_str('tutorialDefault'), self.show_default_tutorial_dialog, None, 'help', get_str('tutorialDetail'))
-        show_info = action(get_str('info'), self.show_info_dialog, None, 'help', get_str('info'))
-        show_shortcut = action(get_str('shortcut'), self.show_shortcuts_dialog, None, 'help', get_str('shortcut'))
-
         zoom = QWidgetAction(self)
         zoom.setDefaultWidget(self.zoom_widget)
         self.zoom_widget.setWhatsThis(
@@ -440,6 +528,7 @@ class MainWindow(QMainWindow, WindowMixin):
 
         # Store actions for further handling.
         self.actions = Struct(save=save, save_format=save_format, saveAs=save_as, open=open, close=close, resetAll=reset_all, deleteImg=delete_image,
+                              trashImages=trash_images,
                               lineColor=color1, create=create, delete=delete, edit=edit, copy=copy,
                               copyToClipboard=copy_to_clipboard, pasteFromClipboard=paste_from_clipboard,
                               copyAllToClipboard=copy_all_to_clipboard,
@@ -526,6 +615,52 @@ class MainWindow(QMainWindow, WindowMixin):
         self.display_label_option.setChecked(settings.get(SETTING_PAINT_LABEL, False))
         self.display_label_option.triggered.connect(self.toggle_paint_labels_option)
 
+        # Show large images through a tiled pyramid at native resolution
+        self.tiled_view_option = QAction(get_str('tiledView'), self)
+        self.tiled_view_option.setCheckable(True)
+        self.tiled_view_option.setChecked(settings.get(SETTING_TILED_VIEW, False))
+        self.tiled_view_option.setToolTip(get_str('tiledViewDetail'))
+
+        # Display resolution submenu: how far large images are downsampled
+        self.display_resolution_menu = QMenu(get_str('displayResolution'), self)
+        self.display_resolution_group = QActionGroup(self)
+        self.display_resolution_group.setExclusive(True)
+        display_resolutions = [
+            (get_str('displayResolutionAuto'), DISPLAY_RESOLUTION_AUTO),
+            ('2048 px', 2048),
+            ('4096 px', 4096),
+            ('8192 px', 8192),
+            (get_str('displayResolutionFull'), DISPLAY_RESOLUTION_FULL),
+        ]
+        saved_resolution = settings.get(SETTING_DISPLAY_RESOLUTION, DISPLAY_RESOLUTION_AUTO)
+        for name, value in display_resolutions:
+            resolution_action = QAction(name, self)
+            resolution_action.setCheckable(True)
+            resolution_action.setData(value)
+            self.display_resolution_group.addAction(resolution_action)
+            self.display_resolution_menu.addAction(resolution_action)
+            if value == saved_resolution:
+                resolution_action.setChecked(True)
+        if not any(a.isChecked() for a in self.display_resolution_group.actions()):
+            self.display_resolution_group.actions()[0].setChecked(True)
+
+        # Canvas backend submenu; the canvas is created once, so changes apply on restart
+        self.canvas_backend_menu = QMenu(get_str('canvasBackend'), self)
+        self.canvas_backend_group = QActionGroup(self)
+        self.canvas_backend_group.setExclusive(True)
+        saved_backend = settings.get(SETTING_CANVAS_BACKEND, CANVAS_BACKEND_RASTER)
+        for name, backend in ((get_str('canvasBackendRaster'), CANVAS_BACKEND_RASTER),
+                              (get_str('canvasBackendOpenGL'), CANVAS_BACKEND_OPENGL)):
+            backend_action = QAction(name, self)
+            backend_action.setCheckable(True)
+            backend_action.setData(backend)
+            backend_action.setChecked(backend == saved_backend)
+            backend_action.triggered.connect(self.change_canvas_backend)
+            self.canvas_backend_group.addAction(backend_action)
+            self.canvas_backend_menu.addAction(backend_action)
+        if not any(a.isChecked() for a in self.canvas_backend_group.actions()):
+            self.canvas_backend_group.actions()[0].setChecked(True)
+
         # Icon size submenu for toolbar
         self.icon_size_menu = QMenu(get_str('iconSize'), self)
         self.icon_size_group = QActionGroup(self)
@@ -552,13 +687,16 @@ class MainWindow(QMainWindow, WindowMixin):
             self.icon_size_group.actions()[-1].setChecked(True)
 
         add_actions(self.menus.file,
-                    (open, open_dir, change_save_dir, open_annotation, copy_prev_bounding, self.menus.recentFiles, save, save_format, save_as, close, reset_all, delete_image, quit))
-        add_actions(self.menus.help, (help_default, show_info, show_shortcut))
+                    (open, open_dir, change_save_dir, open_annotation, copy_prev_bounding, self.menus.recentFiles, save, save_format, save_as, close, reset_all, delete_image,
+                     trash_images, quit))
+        # The help actions have no shortcuts; build them once the window is up
+        self.queue_event(self.populate_help_menu)
         add_actions(self.menus.view, (
             self.auto_saving,
             self.auto_save_enabled,
             self.single_class_mode,
             self.display_label_option,
+            self.tiled_view_option,
             labels, advanced_mode, gallery_mode, None,
             hide_all, show_all, None,
             zoom_in, zoom_out, zoom_org, None,
@@ -566,6 +704,8 @@ class MainWindow(QMainWindow, WindowMixin):
             light_brighten, light_darken, light_org, None))
         self.menus.view.addMenu(self.auto_save_interval_menu)
         self.menus.view.addMenu(self.icon_size_menu)
+        self.menus.view.addMenu(self.display_resolution_menu)
+        self.menus.view.addMenu(self.canvas_backend_menu)
 
         self.menus.file.aboutToShow.connect(self.update_file_menu)
 
@@ -643,11 +783,9 @@ class MainWindow(QMainWindow, WindowMixin):
             self.statusBar().show()
 
         self.restoreState(settings.get(SETTING_WIN_STATE, QByteArray()))
-        Shape.line_color = self.line_color = QColor(settings.get(SETTING_LINE_COLOR, DEFAULT_LINE_COLOR))
-        Shape.fill_color = self.fill_color = QColor(settings.get(SETTING_FILL_COLOR, DEFAULT_FILL_COLOR))
+        Shape.default_line_color = self.line_color = QColor(settings.get(SETTING_LINE_COLOR, DEFAULT_LINE_COLOR))
+        Shape.default_fill_color = self.fill_color = QColor(settings.get(SETTING_FILL_COLOR, DEFAULT_FILL_COLOR))
         self.canvas.set_drawing_color(self.line_color)
-        # Add chris
-        Shape.difficult = self.difficult
 
         def xbool(x):
             if isinstance(x, QVariant):
@@ -674,6 +812,7 @@ class MainWindow(QMainWindow, WindowMixin):
         # Callbacks:
         self.zoom_widget.valueChanged.connect(self.paint_canvas)
         self.zoom_widget.valueChanged.connect(self.update_zoom_display)
+        self.zoom_widget.valueChanged.connect(self.zoom_changed)
         self.light_widget.valueChanged.connect(self.paint_canvas)
 
         self.populate_mode_actions()
@@ -704,14 +843,68 @@ class MainWindow(QMainWindow, WindowMixin):
         self.label_coordinates = QLabel('')
         self.statusBar().addPermanentWidget(self.label_coordinates)
 
-        # Open Dir if default file
-        if self.file_path and os.path.isdir(self.file_path):
-            self.open_dir_dialog(dir_path=self.file_path, silent=True)
+        # A folder given on the command line is imported by the queued event above;
+        # its annotations are saved next to the images unless a save dir is known
+        if self.file_path and os.path.isdir(self.file_path) and self.default_save_dir is None:
+            self.default_save_dir = self.file_path
 
         # Start auto-save timer if enabled (Issue #13)
         if self.auto_save_enabled.isChecked():
             self._toggle_auto_save_timer()
 
+    @property
+    def label_dialog(self):
+        """Dialog asking for the label of a shape, built on first use."""
+        if self._label_dialog is None:
+            self._label_dialog = LabelDialog(parent=self, list_item=self.label_hist)
+        return self._label_dialog
+
+    @label_dialog.setter
+    def label_dialog(self, dialog):
+        self._label_dialog = dialog
+
+    @property
+    def color_dialog(self):
+        """Colour picker for line and fill colours, built on first use."""
+        if self._color_dialog is None:
+            self._color_dialog = ColorDialog(parent=self)
+        return self._color_dialog
+
+    def populate_help_menu(self):
+        """Create the help menu actions; deferred until after the first paint."""
+        if self.menus.help.actions():
+            return
+        action = partial(new_action, self)
+        get_str = self.string_bundle.get_string
+        add_actions(self.menus.help, (
+            action(get_str('tutorialDefault'), self.show_default_tutorial_dialog, None, 'help',
+                   get_str('tutorialDetail')),
+            action(get_str('info'), self.show_info_dialog, None, 'help', get_str('info')),
+            action(get_str('shortcut'), self.show_shortcuts_dialog, None, 'help', get_str('shortcut'))))
+
+    def ensure_gallery_widget(self):
+        """Build the gallery tab the first time it is needed and bring it up to date.
+
+        Until then the file list is the only view kept in sync, so opening
+        a folder does not pay for thumbnails nobody looks at.
+        """
+        if self.gallery_widget is None:
+            gallery = GalleryWidget()
+            gallery.image_selected.connect(self.gallery_image_selected)
+            gallery.image_activated.connect(self.gallery_image_activated)
+            gallery.set_save_dir(self.default_save_dir)
+            gallery.set_image_list(self.m_img_list)
+            self.gallery_container.layout().addWidget(gallery)
+            self.gallery_widget = gallery
+            if self.image_filter is not None:
+                self._update_filter_visibility(self.m_img_list)
+            if self.file_path:
+                gallery.select_image(self.file_path)
+            if self._pending_gallery_row is not None:
+                gallery.scroll_to_row(self._pending_gallery_row)
+                self._pending_gallery_row = None
+        return self.gallery_widget
+
     def keyReleaseEvent(self, event):
         if event.key() == Qt.Key_Control:
             self.canvas.set_drawing_shape_to_square(False)
@@ -811,8 +1004,13 @@ class MainWindow(QMainWindow, WindowMixin):
                 self.gallery_window.setWindowTitle("Gallery Mode - Double-click to select, Press Escape or close to exit")
 
                 self.full_gallery = GalleryWidget(show_size_slider=True)
+                if self.dir_name:
+                    self.full_gallery.set_icon_size(self.settings.dataset(self.dir_name).get(
+                        DATASET_THUMBNAIL_SIZE, GalleryWidget.DEFAULT_ICON_SIZE))
                 self.full_gallery.set_save_dir(self.default_save_dir)
                 self.full_gallery.set_image_list(self.m_img_list)
+                if self.image_filter is not None:
+                    self._update_filter_visibility(self.m_img_list)
                 self.full_gallery.image_selected.connect(self.gallery_image_selected)
                 self.full_gallery.image_activated.connect(self._exit_gallery_and_load)
                 # Defer status refresh to allow gallery to display first
@@ -829,6 +1027,8 @@ class MainWindow(QMainWindow, WindowMixin):
             else:
                 # Close gallery window
                 if hasattr(self, 'full_gallery') and self.full_gallery:
+                    if self.dir_name:
+                        self.settings.dataset(self.dir_name)[DATASET_THUMBNAIL_SIZE] = self.full_gallery.icon_size()
                     try:
                         self.full_gallery.image_selected.disconnect()
                         self.full_gallery.image_activated.disconnect()
@@ -856,8 +1056,8 @@ class MainWindow(QMainWindow, WindowMixin):
         cached_statuses = {}
         uncached = []
         for img_path in self.m_img_list:
-            if img_path in self._annotation_status_cache:
-                cached_statuses[img_path] = self._annotation_status_cache[img_path]
+            if img_path in self.annotation_index:
+                cached_statuses[img_path] = self.annotation_index.status(img_path)
             else:
                 uncached.append(img_path)
 
@@ -865,26 +1065,66 @@ class MainWindow(QMainWindow, WindowMixin):
         if cached_statuses:
             self.full_gallery.update_all_statuses(cached_statuses)
 
-        # Process uncached images in batches to keep UI responsive
+        # Read uncached images in batches to keep UI responsive
         if uncached:
-            self._process_full_gallery_status_batch(uncached, 0)
+            self._index_in_background(uncached)
 
-    def _process_full_gallery_status_batch(self, images, start_idx, batch_size=50):
-        """Process status updates in batches to avoid UI freeze."""
-        if not (hasattr(self, 'full_gallery') and self.full_gallery):
-            return  # Gallery was closed
+    def _index_in_background(self, image_paths=None):
+        """Read the annotations of ``image_paths`` (default: all images) into the index in batches.
 
+        One batch is read per pass of the event loop, so the window stays
+        responsive on large folders. Each batch updates the filter and the
+        galleries as it goes, and the status bar shows the progress.
+        """
+        if image_paths is None:
+            self._cancel_indexing()
+            image_paths = self.m_img_list
+        running = bool(self._index_queue)
+        self._index_queue.extend(path for path in image_paths if path not in self.annotation_index)
+        if not self._index_queue:
+            self._indexing_finished()
+        elif not running:
+            QTimer.singleShot(0, partial(self._index_next_batch, self._index_generation))
+
+    def _cancel_indexing(self):
+        self._index_generation += 1
+        self._index_queue.clear()
+        self._index_done = 0
+
+    def _index_next_batch(self, generation, batch_size=50):
+        if generation != self._index_generation:
+            return  # Cancelled, e.g. another folder was opened
+        queue = self._index_queue
         statuses = {}
-        end_idx = min(start_idx + batch_size, len(images))
-        for img_path in images[start_idx:end_idx]:
-            statuses[img_path] = self._get_annotation_status(img_path)
-
-        self.full_gallery.update_all_statuses(statuses)
+        changed = []  # Images that entered the filtered rows
+        for _ in range(min(batch_size, len(queue))):
+            path = queue.popleft()
+            if path in self._path_to_idx and path not in self.annotation_index:
+                status, labels = read_annotation_summary(path, self._annotation_dir(path))
+                self.annotation_index.update(path, status, labels)
+                statuses[path] = status
+                if self.image_filter is not None and self._filter_image_changed(path, update_view=False):
+                    changed.append(path)
+            self._index_done += 1
+        if changed:
+            self._update_filter_visibility(changed)
+        if statuses:
+            for gallery in (self.gallery_widget, getattr(self, 'full_gallery', None)):
+                if gallery is not None:
+                    gallery.update_all_statuses(statuses)
+        if queue:
+            self.status('Reading annotations: %d / %d' % (self._index_done, self._index_done + len(queue)))
+            QTimer.singleShot(0, partial(self._index_next_batch, generation))
+        else:
+            self._index_done = 0
+            self._indexing_finished()
 
-        # Schedule next batch if more images remain
-        if end_idx < len(images):
-            QTimer.singleShot(0, lambda: self._process_full_gallery_status_batch(
-                images, end_idx, batch_size))
+    def _indexing_finished(self):
+        if self.image_filter is None:
+            return
+        if self.filter_combo.itemData(self.filter_combo.currentIndex()) == FILTER_CLASS:
+            self._refresh_filter_classes()
+        self.status('%d of %d images match the filter' % (len(self._filter_rows), self.img_count))
 
     def populate_mode_actions(self):
         if self.beginner():
@@ -983,16 +1223,21 @@ class MainWindow(QMainWindow, WindowMixin):
             self.label_save_status.setToolTip('Unsaved changes')
 
     def reset_state(self):
+        # Park the history of the image being left, restored when it is reopened
+        if self.file_path:
+            self._undo_histories.park(self.file_path, self.undo_stack, self.canvas.shapes)
         self.items_to_shapes.clear()
         self.shapes_to_items.clear()
         self.label_list.clear()
+        self._item_labels.clear()
         self.file_path = None
         self.image_data = None
         self.label_file = None
+        self._decoded_size = None
+        self._redecode_timer.stop()
         self.canvas.reset_state()
         self.label_coordinates.clear()
-        self.combo_box.cb.clear()
-        # Clear undo stack when loading new file
+        self.combo_box.clear_labels()
         self.undo_stack.clear()
         # Reset status bar widgets
         self.label_box_count.setText('Boxes: 0')
@@ -1018,6 +1263,7 @@ class MainWindow(QMainWindow, WindowMixin):
         return not self.beginner()
 
     def show_tutorial_dialog(self, browser='default', link=None):
+        import webbrowser as wb
         if link is None:
             link = self.screencast
 
@@ -1105,9 +1351,8 @@ class MainWindow(QMainWindow, WindowMixin):
         text = self.label_dialog.pop_up(item.text())
         if text is not None:
             item.setText(text)
-            item.setBackground(generate_color_by_text(text))
+            item.setBackground(label_colors.brush(text))
             self.set_dirty()
-            self.update_combo_box()
 
     # Tzutalin 20160906 : Add file list and dock to move faster
     def file_item_double_clicked(self, item=None):
@@ -1126,7 +1371,8 @@ class MainWindow(QMainWindow, WindowMixin):
             item_path = ustr(item.text())
             if item_path in self._path_to_idx:
                 self.cur_img_idx = self._path_to_idx[item_path]
-                self.gallery_widget.select_image(item_path)
+                if self.gallery_widget is not None:
+                    self.gallery_widget.select_image(item_path)
 
     def gallery_image_selected(self, image_path):
         """Handle single click on gallery thumbnail - sync all views."""
@@ -1146,7 +1392,8 @@ class MainWindow(QMainWindow, WindowMixin):
                         break
                 self.file_list_widget.blockSignals(False)
                 # Sync all gallery selections
-                self.gallery_widget.select_image(image_path)
+                if self.gallery_widget is not None:
+                    self.gallery_widget.select_image(image_path)
                 if hasattr(self, 'full_gallery') and self.full_gallery:
                     self.full_gallery.select_image(image_path)
         finally:
@@ -1161,75 +1408,37 @@ class MainWindow(QMainWindow, WindowMixin):
     def on_file_view_tab_changed(self, index):
         """Handle tab switch between list and gallery view."""
         if index == 1:  # Gallery tab
+            self.ensure_gallery_widget()
             self._refresh_gallery_statuses()
 
-    def _get_annotation_status(self, image_path, use_cache=True):
-        """Determine annotation status for an image with optional caching."""
-        # Check cache first for O(1) lookup
-        if use_cache and image_path in self._annotation_status_cache:
-            return self._annotation_status_cache[image_path]
-
-        basename = os.path.splitext(os.path.basename(image_path))[0]
-
-        # Determine annotation directory
+    def _annotation_dir(self, image_path):
+        """Directory holding the annotation file of ``image_path``."""
         if self.default_save_dir is not None:
-            ann_dir = self.default_save_dir
-        else:
-            ann_dir = os.path.dirname(image_path)
-
-        # Check for annotation files
-        xml_path = os.path.join(ann_dir, basename + XML_EXT)
-        txt_path = os.path.join(ann_dir, basename + TXT_EXT)
-        json_path = os.path.join(ann_dir, 'annotations.json')
-
-        has_labels = False
-        verified = False
+            return self.default_save_dir
+        return os.path.dirname(image_path)
 
-        # Check PASCAL VOC
-        if os.path.isfile(xml_path):
-            has_labels = True
-            try:
-                reader = PascalVocReader(xml_path)
-                verified = reader.verified
-            except Exception:
-                pass
-        # Check YOLO
-        elif os.path.isfile(txt_path):
-            has_labels = os.path.getsize(txt_path) > 0
-        # Check CreateML
-        elif os.path.isfile(json_path):
-            try:
-                import json
-                with open(json_path, 'r') as f:
-                    data = json.load(f)
-                    for item in data:
-                        if item.get('image') == os.path.basename(image_path):
-                            has_labels = len(item.get('annotations', [])) > 0
-                            verified = item.get('verified', False)
-                            break
-            except Exception:
-                pass
-
-        if verified:
-            status = AnnotationStatus.VERIFIED
-        elif has_labels:
-            status = AnnotationStatus.HAS_LABELS
-        else:
-            status = AnnotationStatus.NO_LABELS
-
-        # Cache the result
-        self._annotation_status_cache[image_path] = status
+    def _get_annotation_status(self, image_path, use_cache=True):
+        """Determine annotation status for an image, reading its file only when not indexed."""
+        # Check the index first for O(1) lookup
+        if use_cache and image_path in self.annotation_index:
+            return self.annotation_index.status(image_path)
+
+        status, labels = read_annotation_summary(image_path, self._annotation_dir(image_path))
+        if self.annotation_index.update(image_path, status, labels) and self.image_filter is not None:
+            self._filter_image_changed(image_path)
         return status
 
     def _invalidate_status_cache(self, image_path=None):
-        """Invalidate annotation status cache for a path or all paths."""
+        """Invalidate the indexed annotations of a path or of all paths."""
         if image_path:
-            self._annotation_status_cache.pop(image_path, None)
+            self.annotation_index.discard(image_path)
         else:
-            self._annotation_status_cache.clear()
+            self.annotation_index.clear()
 
     def _refresh_gallery_statuses(self):
         """Update all gallery thumbnail statuses."""
+        if self.gallery_widget is None:
+            return
         statuses = {}
         for img_path in self.m_img_list:
             statuses[img_path] = self._get_annotation_status(img_path)
@@ -1238,13 +1447,18 @@ class MainWindow(QMainWindow, WindowMixin):
     def _update_current_image_gallery_status(self):
         """Update gallery status for current image after save/verify."""
         if self.file_path:
-            # Invalidate cache for this file to get fresh status
-            self._invalidate_status_cache(self.file_path)
-            status = self._get_annotation_status(self.file_path)
-            self.gallery_widget.update_status(self.file_path, status)
-            # Also update full-screen gallery if active
-            if hasattr(self, 'full_gallery') and self.full_gallery:
-                self.full_gallery.update_status(self.file_path, status)
+            self._update_gallery_status(self.file_path)
+
+    def _update_gallery_status(self, image_path):
+        """Re-read the annotation status of one image and show it in the galleries."""
+        # Invalidate cache for this file to get fresh status
+        self._invalidate_status_cache(image_path)
+        status = self._get_annotation_status(image_path)
+        if self.gallery_widget is not None:
+            self.gallery_widget.update_status(image_path, status)
+        # Also update full-screen gallery if active
+        if hasattr(self, 'full_gallery') and self.full_gallery:
+            self.full_gallery.update_status(image_path, status)
 
     # Add chris
     def button_state(self, item=None):
@@ -1291,18 +1505,76 @@ class MainWindow(QMainWindow, WindowMixin):
         # Enable copy all if there are shapes
         self.actions.copyAllToClipboard.setEnabled(len(self.canvas.shapes) > 0)
 
+    @contextmanager
+    def bulk_edit(self):
+        """Defer label list and canvas repaints to the end of a bulk edit."""
+        self._bulk_edit_depth += 1
+        if self._bulk_edit_depth == 1:
+            self.canvas.setUpdatesEnabled(False)
+            self.label_list.setUpdatesEnabled(False)
+        try:
+            yield
+        finally:
+            self._bulk_edit_depth -= 1
+            if self._bulk_edit_depth == 0:
+                self.label_list.setUpdatesEnabled(True)
+                self.canvas.setUpdatesEnabled(True)
+                self.canvas.update()
+
     def add_label(self, shape):
         shape.paint_label = self.display_label_option.isChecked()
         item = HashableQListWidgetItem(shape.label)
         item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
         item.setCheckState(Qt.Checked)
-        item.setBackground(generate_color_by_text(shape.label))
+        item.setBackground(label_colors.brush(shape.label))
         self.items_to_shapes[item] = shape
         self.shapes_to_items[shape] = item
         self.label_list.addItem(item)
         for action in self.actions.onShapesPresent:
             action.setEnabled(True)
-        self.update_combo_box()
+        self._item_labels[item] = str(item.text())
+        self.combo_box.add_label(self._item_labels[item])
+
+    def add_labels(self, shapes):
+        """Add list items for many shapes at once, e.g. when opening an annotation file.
+
+        The items are built up front and inserted with the list signals
+        blocked; the view then re-reads the model in one go instead of
+        handling every row insertion.
+        """
+        if not shapes:
+            return
+        paint_label = self.display_label_option.isChecked()
+        items = []
+        for shape in shapes:
+            shape.paint_label = paint_label
+            item = HashableQListWidgetItem(shape.label)
+            item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
+            item.setCheckState(Qt.Checked)
+            item.setBackground(label_colors.brush(shape.label))
+            self.items_to_shapes[item] = shape
+            self.shapes_to_items[shape] = item
+            items.append(item)
+
+        model = self.label_list.model()
+        self.label_list.setUpdatesEnabled(False)
+        self.label_list.blockSignals(True)
+        model.blockSignals(True)
+        try:
+            for item in items:
+                self.label_list.addItem(item)
+        finally:
+            model.blockSignals(False)
+            self.label_list.blockSignals(False)
+            # The view missed the row insertions; make it reload the model
+            self.label_list.reset()
+            self.label_list.setUpdatesEnabled(True)
+
+        for action in self.actions.onShapesPresent:
+            action.setEnabled(True)
+        for item in items:
+            self._item_labels[item] = str(item.text())
+            self.combo_box.add_label(self._item_labels[item])
 
     def remove_label(self, shape):
         if shape is None:
@@ -1312,7 +1584,9 @@ class MainWindow(QMainWindow, WindowMixin):
         self.label_list.takeItem(self.label_list.row(item))
         del self.shapes_to_items[shape]
         del self.items_to_shapes[item]
-        self.update_combo_box()
+        label = self._item_labels.pop(item, None)
+        if label is not None:
+            self.combo_box.remove_label(label)
 
     def load_labels(self, shapes):
         s = []
@@ -1346,23 +1620,32 @@ class MainWindow(QMainWindow, WindowMixin):
             else:
                 shape.fill_color = generate_color_by_text(label)
 
-            self.add_label(shape)
-        self.update_combo_box()
+        self.add_labels(s)
         self.canvas.load_shapes(s)
 
     def update_combo_box(self):
-        # Get the unique labels and add them to the Combobox.
-        items_text_list = [str(self.label_list.item(i).text()) for i in range(self.label_list.count())]
-
-        unique_text_list = list(set(items_text_list))
-        # Add a null row for showing all the labels
-        unique_text_list.append("")
-        unique_text_list.sort()
-
-        self.combo_box.update_items(unique_text_list)
-
-    def save_labels(self, annotation_file_path):
-        annotation_file_path = ustr(annotation_file_path)
+        """Rebuild the label filter from scratch; add_label and remove_label keep it up to date."""
+        self._item_labels = {}
+        for i in range(self.label_list.count()):
+            item = self.label_list.item(i)
+            self._item_labels[item] = str(item.text())
+        self.combo_box.set_labels(self._item_labels.values())
+
+    def _relabel_combo_box(self, item):
+        """Move ``item`` to its new label in the label filter after its text changed."""
+        old_label = self._item_labels.get(item)
+        label = str(item.text())
+        if old_label is not None and old_label != label:
+            self._item_labels[item] = label
+            self.combo_box.remove_label(old_label)
+            self.combo_box.add_label(label)
+
+    def label_snapshot(self, annotation_file_path):
+        """Copy what is needed to save the current annotations into a SaveSnapshot.
+
+        The snapshot holds no references to canvas shapes, so it can be
+        written while the user goes on editing or loads another image.
+        """
         if self.label_file is None:
             self.label_file = LabelFile()
             self.label_file.verified = self.canvas.verified
@@ -1379,32 +1662,62 @@ class MainWindow(QMainWindow, WindowMixin):
                         points=scaled_points,
                         difficult=s.difficult)
 
-        shapes = [format_shape(shape) for shape in self.canvas.shapes]
-        # Can add different annotation formats here
+        shapes = tuple(format_shape(shape) for shape in self.canvas.shapes)
+        return SaveSnapshot(self.file_path, ustr(annotation_file_path), self.label_file_format, shapes,
+                            self._image_shape(), tuple(self.label_hist), self.label_file.verified)
+
+    def _image_shape(self):
+        """[height, width, depth] of the current image without decoding it again."""
+        if isinstance(self.image_data, (list, tuple)):
+            return list(self.image_data)
+        size = self._original_image_size
+        if size is not None and size.isValid() and not self.image.isNull():
+            return [size.height(), size.width(), 1 if self.image.isGrayscale() else 3]
+        return self.image_data
+
+    def _write_labels(self, snapshot):
+        """Write ``snapshot`` now.
+
+        Returns True if the file was written, False if it already held these
+        annotations and None if writing failed.
+        """
+        if self.save_queue.is_pending(snapshot.image_path):
+            self.save_queue.wait()  # A queued older save must not overwrite this one
+        if self.save_queue.is_unchanged(snapshot):
+            return False
         try:
-            if self.label_file_format == LabelFileFormat.PASCAL_VOC:
-                if annotation_file_path[-4:].lower() != ".xml":
-                    annotation_file_path += XML_EXT
-                self.label_file.save_pascal_voc_format(annotation_file_path, shapes, self.file_path, self.image_data,
-                                                       self.line_color.getRgb(), self.fill_color.getRgb())
-            elif self.label_file_format == LabelFileFormat.YOLO:
-                if annotation_file_path[-4:].lower() != ".txt":
-                    annotation_file_path += TXT_EXT
-                self.label_file.save_yolo_format(annotation_file_path, shapes, self.file_path, self.image_data, self.label_hist,
-                                                 self.line_color.getRgb(), self.fill_color.getRgb())
-            elif self.label_file_format == LabelFileFormat.CREATE_ML:
-                if annotation_file_path[-5:].lower() != ".json":
-                    annotation_file_path += JSON_EXT
-                self.label_file.save_create_ml_format(annotation_file_path, shapes, self.file_path, self.image_data,
-                                                      self.label_hist, self.line_color.getRgb(), self.fill_color.getRgb())
-            else:
-                self.label_file.save(annotation_file_path, shapes, self.file_path, self.image_data,
-                                     self.line_color.getRgb(), self.fill_color.getRgb())
-            print('Image:{0} -> Annotation:{1}'.format(self.file_path, annotation_file_path))
-            return True
+            annotation_file_path = write_snapshot(snapshot)
         except LabelFileError as e:
             self.error_message(u'Error saving label data', u'<b>%s</b>' % e)
+            return None
+        self.save_queue.mark_saved(snapshot)
+        print('Image:{0} -> Annotation:{1}'.format(snapshot.image_path, annotation_file_path))
+        return True
+
+    def queue_save(self, annotation_file_path):
+        """Save the current annotations in the background and carry on.
+
+        The result comes back through _on_background_save_done() or
+        _on_background_save_failed().
+        """
+        if not annotation_file_path or not self.file_path:
             return False
+        if self.save_queue.submit(self.label_snapshot(annotation_file_path)):
+            self.status('Saving %s...' % os.path.basename(self.file_path))
+        self.set_clean()
+        return True
+
+    def _on_background_save_done(self, image_path, annotation_file_path):
+        print('Image:{0} -> Annotation:{1}'.format(image_path, annotation_file_path))
+        if image_path == self.file_path:
+            self.status('Saved to  %s' % annotation_file_path)
+        self._update_gallery_status(image_path)
+
+    def _on_background_save_failed(self, image_path, message):
+        if image_path == self.file_path:
+            self.set_dirty()  # Keep the changes marked unsaved so they can be saved again
+        self.status('Could not save %s' % os.path.basename(image_path))
+        self.error_message(u'Error saving label data', u'<b>%s</b><p>%s</p>' % (message, image_path))
 
     def copy_selected_shape(self):
         shape = self.canvas.copy_selected_shape()
@@ -1442,18 +1755,18 @@ class MainWindow(QMainWindow, WindowMixin):
         if not self.canvas.pixmap or self.canvas.pixmap.isNull():
             return
 
-        for clipboard_shape in self.clipboard_shapes:
-            # Create a new copy for each paste
-            shape = clipboard_shape.copy()
-            # Add shape to canvas
-            self.canvas.shapes.append(shape)
-            self.add_label(shape)
-            # Push command for undo support
-            cmd = CreateShapeCommand(self, shape)
-            self.undo_stack.push(cmd)
+        commands = []
+        with self.bulk_edit():
+            for clipboard_shape in self.clipboard_shapes:
+                # Create a new copy for each paste
+                shape = clipboard_shape.copy()
+                self.canvas.shapes.append(shape)
+                self.add_label(shape)
+                commands.append(CreateShapeCommand(self, shape))
+        # The whole paste is a single undo step
+        self.undo_stack.push(MacroCommand(self, commands, f'Paste {len(commands)} shapes'))
 
         self.set_dirty()
-        self.canvas.update()
         self.update_box_count()
         self.statusBar().showMessage(f'Pasted {len(self.clipboard_shapes)} annotations', 3000)
 
@@ -1481,6 +1794,7 @@ class MainWindow(QMainWindow, WindowMixin):
 
     def label_item_changed(self, item):
         shape = self.items_to_shapes[item]
+        self._relabel_combo_box(item)
         label = item.text()
         if label != shape.label:
             old_label = shape.label
@@ -1654,9 +1968,11 @@ class MainWindow(QMainWindow, WindowMixin):
             if unicode_file_path in self._path_to_idx:
                 index = self._path_to_idx[unicode_file_path]
                 file_widget_item = self.file_list_widget.item(index)
-                file_widget_item.setSelected(True)
+                # Replace the selection; the list allows selecting many images to trash
+                self.file_list_widget.setCurrentItem(file_widget_item, QItemSelectionModel.ClearAndSelect)
                 # Sync gallery selection
-                self.gallery_widget.select_image(unicode_file_path)
+                if self.gallery_widget is not None:
+                    self.gallery_widget.select_image(unicode_file_path)
             else:
                 self.file_list_widget.clear()
                 self.m_img_list.clear()
@@ -1693,12 +2009,15 @@ class MainWindow(QMainWindow, WindowMixin):
                     self.status("Error reading %s" % unicode_file_path)
                     return False
 
-                # Downsample if larger than 2048px on either dimension (Issue #31)
-                MAX_DISPLAY_DIM = 2048
-                if original_size.width() > MAX_DISPLAY_DIM or original_size.height() > MAX_DISPLAY_DIM:
-                    scaled_size = original_size.scaled(MAX_DISPLAY_DIM, MAX_DISPLAY_DIM, Qt.KeepAspectRatio)
+                # Downsample large images according to the display policy (Issue #31)
+                native_zoom = self._native_zoom(os.path.dirname(unicode_file_path))
+                scaled_size = self.display_policy().decode_size(original_size, native_zoom)
+                too_large = scaled_size != original_size
+                if too_large and self.tiled_view_option.isChecked() and TiledImage.supports(unicode_file_path):
+                    return self._load_tiled_image(unicode_file_path, file_path)
+                if too_large:
                     reader.setScaledSize(scaled_size)
-                    self._image_scale_factor = scaled_size.width() / original_size.width()
+                    self._image_scale_factor = scale_factor(original_size, scaled_size)
                 else:
                     self._image_scale_factor = 1.0
 
@@ -1713,36 +2032,185 @@ class MainWindow(QMainWindow, WindowMixin):
 
                 # Don't store full image data - saves memory
                 self.image_data = None
+                self._decoded_size = image.size()
 
             self.status("Loaded %s" % os.path.basename(unicode_file_path))
             self.image = image
             self.file_path = unicode_file_path
             self.canvas.load_pixmap(QPixmap.fromImage(image))
-            if self.label_file:
-                self.load_labels(self.label_file.shapes)
-            self.set_clean()
-            self.canvas.setEnabled(True)
-            self.adjust_scale(initial=True)
-            self.paint_canvas()
-            self.add_recent_file(self.file_path)
-            self.toggle_actions(True)
-            self.show_bounding_box_from_annotation_file(self.file_path)
+            self._finish_loading(file_path)
+            return True
+        return False
 
-            counter = self.counter_str()
-            self.setWindowTitle(__appname__ + ' ' + file_path + ' ' + counter)
+    def _load_tiled_image(self, unicode_file_path, file_path):
+        """Open a large image as a tiled pyramid at native resolution.
 
-            # Update status bar widgets
-            self.update_status_bar()
-            self.update_save_status(saved=True)
+        Only a small overview is decoded up front; the canvas decodes the
+        visible tiles on demand, so shapes are placed on real pixels.
+        """
+        tiled = TiledImage(unicode_file_path)
+        overview = tiled.overview()
+        if overview.isNull():
+            self.error_message(u'Error opening file',
+                               u"<p>Make sure <i>%s</i> is a valid image file." % unicode_file_path)
+            self.status("Error reading %s" % unicode_file_path)
+            return False
 
-            # Default : select last item if there is at least one item
-            if self.label_list.count():
-                self.label_list.setCurrentItem(self.label_list.item(self.label_list.count() - 1))
-                self.label_list.item(self.label_list.count() - 1).setSelected(True)
+        self._image_scale_factor = 1.0
+        self._original_image_size = tiled.size()
+        # Writers only need the image shape; never decode the full image to get it.
+        self.image_data = [tiled.height(), tiled.width(), 1 if overview.isGrayscale() else 3]
+
+        self.status("Loaded %s (tiled)" % os.path.basename(unicode_file_path))
+        self.image = overview
+        self.file_path = unicode_file_path
+        self.canvas.load_tiled_image(tiled, QPixmap.fromImage(overview))
+        self._finish_loading(file_path)
+        return True
+
+    def _finish_loading(self, file_path):
+        """Shared tail of load_file once the canvas holds the new image."""
+        if self.label_file:
+            self.load_labels(self.label_file.shapes)
+        self.set_clean()
+        self.canvas.setEnabled(True)
+        self.adjust_scale(initial=True)
+        self.paint_canvas()
+        self.add_recent_file(self.file_path)
+        self.toggle_actions(True)
+        self.show_bounding_box_from_annotation_file(self.file_path)
+        self._undo_histories.restore(self.file_path, self.undo_stack, self.canvas.shapes)
+        self._store_dataset_state()
 
-            self.canvas.setFocus(True)
-            return True
-        return False
+        counter = self.counter_str()
+        self.setWindowTitle(__appname__ + ' ' + file_path + ' ' + counter)
+
+        # Update status bar widgets
+        self.update_status_bar()
+        self.update_save_status(saved=True)
+
+        # Default : select last item if there is at least one item
+        if self.label_list.count():
+            self.label_list.setCurrentItem(self.label_list.item(self.label_list.count() - 1))
+            self.label_list.item(self.label_list.count() - 1).setSelected(True)
+
+        self.canvas.setFocus(True)
+
+    def display_policy(self):
+        """Build the display resolution policy for the current screen and memory."""
+        action = self.display_resolution_group.checkedAction()
+        max_dim = action.data() if action else DISPLAY_RESOLUTION_AUTO
+        screen = QApplication.primaryScreen()
+        if screen is None:
+            return DisplayPolicy(max_dim, memory=available_memory())
+        return DisplayPolicy(max_dim, screen.size(), screen.devicePixelRatio(), available_memory())
+
+    def zoom_changed(self):
+        """Remember the dataset zoom and re-decode if zoomed past the decoded resolution."""
+        if self._decoded_size is None or not self.file_path:
+            return
+        if self.zoom_mode == self.MANUAL_ZOOM:
+            native_zoom = 0.01 * self.zoom_widget.value() * self._image_scale_factor
+            self._dataset_zoom[os.path.dirname(self.file_path)] = native_zoom
+        self._redecode_timer.start()
+
+    def _native_zoom(self, dir_name):
+        """Zoom last used for images in ``dir_name``, from this session or the folder settings."""
+        if dir_name not in self._dataset_zoom:
+            zoom = self.settings.dataset(dir_name).get(DATASET_ZOOM)
+            if zoom is None:
+                return None
+            self._dataset_zoom[dir_name] = zoom
+        return self._dataset_zoom[dir_name]
+
+    def _store_dataset_state(self):
+        """Write the per-folder state of this session to the folder settings.
+
+        Besides the zoom of each folder this records where the open folder
+        was left: image, zoom, scroll offsets and the rows at the top of the
+        file list and gallery. Only changed values mark the settings dirty,
+        and they reach the disk with the next background save.
+        """
+        for dir_name, zoom in self._dataset_zoom.items():
+            self.settings.dataset(dir_name)[DATASET_ZOOM] = zoom
+        index = self._path_to_idx.get(self.file_path)
+        if not self.dir_name or index is None:
+            return
+        session = self.settings.dataset(self.dir_name)
+        session[DATASET_LAST_IMAGE] = self.file_path
+        session[DATASET_INDEX] = index
+        session[DATASET_ZOOM_MODE] = self.zoom_mode
+        session[DATASET_ZOOM_VALUE] = self.zoom_widget.value()
+        session[DATASET_SCROLL] = [self.scroll_bars[Qt.Horizontal].value(),
+                                   self.scroll_bars[Qt.Vertical].value()]
+        session[DATASET_FILE_LIST_ROW] = max(0, self.file_list_widget.indexAt(QPoint(1, 1)).row())
+        if self.gallery_widget is not None:
+            session[DATASET_GALLERY_ROW] = self.gallery_widget.top_row()
+
+    def _resume_session(self):
+        """Reopen the image the current folder was left at, with its view state.
+
+        The image is found through _path_to_idx; if it is gone the stored
+        index is used instead, so the image that took its place opens.
+        Without a record the first image opens.
+        """
+        session = self.settings.dataset(self.dir_name)
+        index = self._path_to_idx.get(session.get(DATASET_LAST_IMAGE))
+        if index is None:
+            index = session.get(DATASET_INDEX)
+        if not isinstance(index, int) or not self.m_img_list:
+            self.open_next_image()
+            return
+        # Loading the image records a new session state, so read the old one first
+        zoom_mode = session.get(DATASET_ZOOM_MODE)
+        zoom_value = session.get(DATASET_ZOOM_VALUE)
+        scroll = session.get(DATASET_SCROLL)
+        file_list_row = session.get(DATASET_FILE_LIST_ROW)
+        gallery_row = session.get(DATASET_GALLERY_ROW)
+
+        self.cur_img_idx = min(max(index, 0), self.img_count - 1)
+        if not self.load_file(self.m_img_list[self.cur_img_idx]):
+            return
+        if zoom_mode == self.FIT_WIDTH:
+            self.actions.fitWidth.setChecked(True)
+            self.set_fit_width(True)
+        elif zoom_mode == self.FIT_WINDOW:
+            self.actions.fitWindow.setChecked(True)
+            self.set_fit_window(True)
+        elif zoom_mode == self.MANUAL_ZOOM and zoom_value:
+            self.set_zoom(zoom_value)
+        if scroll:
+            self.scroll_bars[Qt.Horizontal].setValue(scroll[0])
+            self.scroll_bars[Qt.Vertical].setValue(scroll[1])
+        item = self.file_list_widget.item(file_list_row or 0)
+        if item is not None:
+            self.file_list_widget.scrollToItem(item, QAbstractItemView.PositionAtTop)
+        self._pending_gallery_row = gallery_row
+        if self.gallery_widget is not None and gallery_row is not None:
+            self.gallery_widget.scroll_to_row(gallery_row)
+            self._pending_gallery_row = None
+        self._store_dataset_state()
+
+    def _request_redecode(self):
+        """Decode the current image at a higher resolution in the background."""
+        if self._decoded_size is None or self._original_image_size is None:
+            return
+        native_zoom = self.canvas.scale * self._image_scale_factor
+        size = self.display_policy().upgrade_size(self._original_image_size, self._decoded_size, native_zoom)
+        if size is None:
+            return
+        worker = ImageDecodeWorker(self.file_path, size)
+        worker.signals.decoded.connect(self._on_redecoded)
+        self._decode_pool.start(worker)
+
+    def _on_redecoded(self, path, image):
+        """Show a background re-decode if it still matches the current image."""
+        if path != self.file_path or self._decoded_size is None:
+            return
+        if image.width() <= self._decoded_size.width():
+            return
+        self._decoded_size = image.size()
+        self.canvas.set_detail_pixmap(QPixmap.fromImage(image))
 
     def counter_str(self):
         """
@@ -1751,6 +2219,8 @@ class MainWindow(QMainWindow, WindowMixin):
         return '[{} / {}]'.format(self.cur_img_idx + 1, self.img_count)
 
     def show_bounding_box_from_annotation_file(self, file_path):
+        if self.save_queue.is_pending(file_path):
+            self.save_queue.wait()  # Read the annotations being saved, not the old ones
         if self.default_save_dir is not None:
             basename = os.path.basename(os.path.splitext(file_path)[0])
             xml_path = os.path.join(self.default_save_dir, basename + XML_EXT)
@@ -1790,7 +2260,8 @@ class MainWindow(QMainWindow, WindowMixin):
         assert not self.image.isNull(), "cannot paint null image"
         self.canvas.scale = 0.01 * self.zoom_widget.value()
         self.canvas.overlay_color = self.light_widget.color()
-        self.canvas.label_font_size = int(0.02 * max(self.image.width(), self.image.height()))
+        image_size = self.canvas.image_size()
+        self.canvas.label_font_size = int(0.02 * max(image_size.width(), image_size.height()))
         self.canvas.adjustSize()
         self.canvas.update()
 
@@ -1805,19 +2276,21 @@ class MainWindow(QMainWindow, WindowMixin):
         h1 = self.centralWidget().height() - e
         a1 = w1 / h1
         # Calculate a new scale value based on the pixmap's aspect ratio.
-        w2 = self.canvas.pixmap.width() - 0.0
-        h2 = self.canvas.pixmap.height() - 0.0
+        image_size = self.canvas.image_size()
+        w2 = image_size.width() - 0.0
+        h2 = image_size.height() - 0.0
         a2 = w2 / h2
         return w1 / w2 if a2 >= a1 else h1 / h2
 
     def scale_fit_width(self):
         # The epsilon does not seem to work too well here.
         w = self.centralWidget().width() - 2.0
-        return w / self.canvas.pixmap.width()
+        return w / self.canvas.image_size().width()
 
     def closeEvent(self, event):
         if not self.may_continue():
             event.ignore()
+        self.save_queue.wait()
         settings = self.settings
         # If it loads images from dir, don't load it at the beginning
         if self.dir_name is None:
@@ -1848,6 +2321,14 @@ class MainWindow(QMainWindow, WindowMixin):
         settings[SETTING_AUTO_SAVE_INTERVAL] = self._get_current_auto_save_interval()
         settings[SETTING_SINGLE_CLASS] = self.single_class_mode.isChecked()
         settings[SETTING_PAINT_LABEL] = self.display_label_option.isChecked()
+        settings[SETTING_TILED_VIEW] = self.tiled_view_option.isChecked()
+        resolution_action = self.display_resolution_group.checkedAction()
+        if resolution_action:
+            settings[SETTING_DISPLAY_RESOLUTION] = resolution_action.data()
+        self._store_dataset_state()
+        settings[SETTING_LOD_VERTEX_MIN_SIZE] = self.canvas.renderer.vertex_min_size
+        settings[SETTING_LOD_LABEL_MIN_SIZE] = self.canvas.renderer.label_min_size
+        settings[SETTING_LOD_TINY_MAX_SIZE] = self.canvas.renderer.tiny_max_size
         settings[SETTING_DRAW_SQUARE] = self.draw_squares_option.isChecked()
         settings[SETTING_LABEL_FILE_FORMAT] = self.label_file_format
         settings[SETTING_TOOLBAR_EXPANDED] = self.tools.is_expanded()
@@ -1862,6 +2343,8 @@ class MainWindow(QMainWindow, WindowMixin):
         images = []
 
         for root, dirs, files in os.walk(folder_path):
+            if TRASH_DIR_NAME in dirs:
+                dirs.remove(TRASH_DIR_NAME)
             for file in files:
                 if file.lower().endswith(tuple(extensions)):
                     relative_path = os.path.join(root, file)
@@ -1884,8 +2367,13 @@ class MainWindow(QMainWindow, WindowMixin):
             self.default_save_dir = dir_path
             # Clear status cache since annotation directory changed
             self._invalidate_status_cache()
+            if self.image_filter is not None:
+                self._reapply_image_filter()
+            if self.folder_watcher is not None:
+                self._watch_folders()
             # Update gallery to reload thumbnails with annotations from new dir
-            self.gallery_widget.set_save_dir(self.default_save_dir)
+            if self.gallery_widget is not None:
+                self.gallery_widget.set_save_dir(self.default_save_dir)
 
         self.show_bounding_box_from_annotation_file(self.file_path)
 
@@ -1948,10 +2436,12 @@ class MainWindow(QMainWindow, WindowMixin):
         if not self.may_continue() or not dir_path:
             return
 
+        self._store_dataset_state()
         self.last_open_dir = dir_path
         self.dir_name = dir_path
         self.file_path = None
         self.file_list_widget.clear()
+        self._reset_image_filter()
 
         # Show progress dialog for scanning
         progress = QProgressDialog("Scanning directory...", "Cancel", 0, 0, self)
@@ -1963,7 +2453,9 @@ class MainWindow(QMainWindow, WindowMixin):
 
         self.m_img_list = self.scan_all_images(dir_path)
         self._path_to_idx = {path: idx for idx, path in enumerate(self.m_img_list)}
-        self._annotation_status_cache.clear()  # Clear cache for new directory
+        self.annotation_index.clear()  # Clear cache for new directory
+        self._annotation_keys = None
+        self._cancel_indexing()
         self.img_count = len(self.m_img_list)
 
         if progress.wasCanceled():
@@ -1989,9 +2481,10 @@ class MainWindow(QMainWindow, WindowMixin):
         progress.setValue(self.img_count)
 
         # Populate gallery widget with annotation directory
-        self.gallery_widget.set_save_dir(self.default_save_dir)
-        self.gallery_widget.set_image_list(self.m_img_list)
-        self._refresh_gallery_statuses()
+        if self.gallery_widget is not None:
+            self.gallery_widget.set_save_dir(self.default_save_dir)
+            self.gallery_widget.set_image_list(self.m_img_list)
+            self._refresh_gallery_statuses()
 
         # Update full-screen gallery if active
         if hasattr(self, 'full_gallery') and self.full_gallery:
@@ -2003,7 +2496,8 @@ class MainWindow(QMainWindow, WindowMixin):
 
         # Update image count in status bar
         self.update_image_count()
-        self.open_next_image()
+        self._resume_session()
+        self.queue_event(self._watch_folders)
 
     def verify_image(self, _value=False):
         # Proceeding next image without dialog if having any label
@@ -2029,8 +2523,8 @@ class MainWindow(QMainWindow, WindowMixin):
         # Proceeding prev image without dialog if having any label
         if self.auto_saving.isChecked():
             if self.default_save_dir is not None:
-                if self.dirty is True:
-                    self.save_file()
+                if self.dirty is True and self.file_path:
+                    self.queue_save(self._save_dir_annotation_path())
             else:
                 self.change_save_dir_dialog()
                 return
@@ -2044,8 +2538,9 @@ class MainWindow(QMainWindow, WindowMixin):
         if self.file_path is None:
             return
 
-        if self.cur_img_idx - 1 >= 0:
-            self.cur_img_idx -= 1
+        idx = self._step_image_index(self.cur_img_idx, -1)
+        if idx is not None:
+            self.cur_img_idx = idx
             filename = self.m_img_list[self.cur_img_idx]
             if filename:
                 self.load_file(filename)
@@ -2054,8 +2549,8 @@ class MainWindow(QMainWindow, WindowMixin):
         # Proceeding next image without dialog if having any label
         if self.auto_saving.isChecked():
             if self.default_save_dir is not None:
-                if self.dirty is True:
-                    self.save_file()
+                if self.dirty is True and self.file_path:
+                    self.queue_save(self._save_dir_annotation_path())
             else:
                 self.change_save_dir_dialog()
                 return
@@ -2070,17 +2565,142 @@ class MainWindow(QMainWindow, WindowMixin):
             return
 
         filename = None
-        if self.file_path is None:
-            filename = self.m_img_list[0]
-            self.cur_img_idx = 0
-        else:
-            if self.cur_img_idx + 1 < self.img_count:
-                self.cur_img_idx += 1
-                filename = self.m_img_list[self.cur_img_idx]
+        idx = self._step_image_index(-1 if self.file_path is None else self.cur_img_idx, 1)
+        if idx is not None:
+            self.cur_img_idx = idx
+            filename = self.m_img_list[self.cur_img_idx]
 
         if filename:
             self.load_file(filename)
 
+    def _step_image_index(self, idx, step):
+        """Row after (step 1) or before (step -1) row ``idx`` to open next, None past either end.
+
+        With a filter only the matching rows count, found by binary search
+        in the sorted rows that pass it.
+        """
+        if self.image_filter is None:
+            idx += step
+            return idx if 0 <= idx < self.img_count else None
+        rows = self._filter_rows
+        pos = bisect_right(rows, idx) if step > 0 else bisect_left(rows, idx) - 1
+        return rows[pos] if 0 <= pos < len(rows) else None
+
+    def set_image_filter(self, image_filter):
+        """Show only the images passing ``image_filter`` and step through them with next/prev.
+
+        None or a FILTER_ALL filter shows every image. Images not indexed yet
+        are read once; after that the filter is kept up to date image by image.
+        """
+        if image_filter is not None and image_filter.mode == FILTER_ALL:
+            image_filter = None
+        if image_filter == self.image_filter:
+            return
+        self.image_filter = image_filter
+        self._reapply_image_filter()
+
+    def _reapply_image_filter(self):
+        """Apply the filter to what is indexed now; images not indexed yet stay hidden until read."""
+        self._refresh_filter_rows()
+        self._update_filter_visibility(self.m_img_list)
+        if self.image_filter is not None:
+            self._index_in_background()
+
+    def _reset_image_filter(self):
+        """Show every image again and reset the filter controls, e.g. for a new folder."""
+        self.image_filter = None
+        self._filter_rows = []
+        self.filter_combo.blockSignals(True)
+        self.filter_combo.setCurrentIndex(0)
+        self.filter_combo.blockSignals(False)
+        self.filter_value_combo.setHidden(True)
+
+    def _refresh_filter_rows(self):
+        """Recompute the matching rows, e.g. after rows were inserted or removed."""
+        if self.image_filter is None:
+            self._filter_rows = []
+            return
+        matched = self.annotation_index.query(self.image_filter)
+        self._filter_rows = sorted(self._path_to_idx[path] for path in matched if path in self._path_to_idx)
+
+    def _filter_image_changed(self, image_path, update_view=True):
+        """Move one re-indexed image into or out of the filtered rows; return whether it moved.
+
+        With ``update_view`` False the caller shows or hides the image, e.g.
+        once for a whole batch.
+        """
+        row = self._path_to_idx.get(image_path)
+        if row is None:
+            return False
+        rows = self._filter_rows
+        pos = bisect_left(rows, row)
+        listed = pos < len(rows) and rows[pos] == row
+        if self.annotation_index.matches(image_path, self.image_filter) == listed:
+            return False
+        if listed:
+            del rows[pos]
+        else:
+            rows.insert(pos, row)
+        if update_view:
+            self._update_filter_visibility([image_path])
+        return True
+
+    def _update_filter_visibility(self, image_paths):
+        """Hide the rows and thumbnails of ``image_paths`` that do not pass the filter."""
+        hidden, shown = [], []
+        for path in image_paths:
+            row = self._path_to_idx.get(path)
+            if row is None:
+                continue
+            hide = self.image_filter is not None and not self.annotation_index.matches(path, self.image_filter)
+            self.file_list_widget.setRowHidden(row, hide)
+            (hidden if hide else shown).append(path)
+        for gallery in (self.gallery_widget, getattr(self, 'full_gallery', None)):
+            if gallery is not None:
+                if hidden:
+                    gallery.set_images_hidden(hidden, True)
+                if shown:
+                    gallery.set_images_hidden(shown, False)
+
+    def _filter_mode_changed(self, _index=None):
+        mode = self.filter_combo.itemData(self.filter_combo.currentIndex())
+        self.filter_value_combo.setHidden(mode not in (FILTER_CLASS, FILTER_BOX_COUNT))
+        self.filter_value_combo.blockSignals(True)
+        self.filter_value_combo.clear()
+        if mode == FILTER_CLASS:
+            # Classes found so far; the rest are added once every image is indexed
+            self.filter_value_combo.addItems(self.annotation_index.classes())
+        elif mode == FILTER_BOX_COUNT:
+            self.filter_value_combo.setEditText('0')
+        self.filter_value_combo.blockSignals(False)
+        self._apply_filter_controls()
+
+    def _refresh_filter_classes(self):
+        """Offer every indexed class in the value box, keeping the class typed or picked."""
+        combo = self.filter_value_combo
+        text = ustr(combo.currentText())
+        combo.blockSignals(True)
+        combo.clear()
+        combo.addItems(self.annotation_index.classes())
+        if text:
+            combo.setEditText(text)
+        combo.blockSignals(False)
+        if not text and combo.count():
+            self._apply_filter_controls()
+
+    def _apply_filter_controls(self, *_args):
+        """Filter the images as the filter controls say."""
+        mode = self.filter_combo.itemData(self.filter_combo.currentIndex())
+        value = None
+        if mode == FILTER_CLASS:
+            value = ustr(self.filter_value_combo.currentText())
+        elif mode == FILTER_BOX_COUNT:
+            value = parse_count_range(ustr(self.filter_value_combo.currentText()))
+            if value is None:
+                self.status(self.string_bundle.get_string('filterValueTip'))
+                return
+        self.set_image_filter(ImageFilter(mode, value))
+
     def open_file(self, _value=False):
         if not self.may_continue():
             return
@@ -2095,13 +2715,16 @@ class MainWindow(QMainWindow, WindowMixin):
             self.img_count = 1
             self.load_file(filename)
 
+    def _save_dir_annotation_path(self):
+        """Annotation path of the current image in the default save dir, without extension."""
+        image_file_name = os.path.basename(self.file_path)
+        saved_file_name = os.path.splitext(image_file_name)[0]
+        return os.path.join(ustr(self.default_save_dir), saved_file_name)
+
     def save_file(self, _value=False):
         if self.default_save_dir is not None and len(ustr(self.default_save_dir)):
             if self.file_path:
-                image_file_name = os.path.basename(self.file_path)
-                saved_file_name = os.path.splitext(image_file_name)[0]
-                saved_path = os.path.join(ustr(self.default_save_dir), saved_file_name)
-                self._save_file(saved_path)
+                self._save_file(self._save_dir_annotation_path())
         else:
             image_file_dir = os.path.dirname(self.file_path)
             image_file_name = os.path.basename(self.file_path)
@@ -2133,12 +2756,18 @@ class MainWindow(QMainWindow, WindowMixin):
         return ''
 
     def _save_file(self, annotation_file_path):
-        if annotation_file_path and self.save_labels(annotation_file_path):
-            self.set_clean()
-            self.statusBar().showMessage('Saved to  %s' % annotation_file_path)
-            self.statusBar().show()
-            # Update gallery status after save
+        if not annotation_file_path:
+            return False
+        written = self._write_labels(self.label_snapshot(annotation_file_path))
+        if written is None:
+            return False
+        self.set_clean()
+        self.statusBar().showMessage('Saved to  %s' % annotation_file_path)
+        self.statusBar().show()
+        # Update gallery status only when the file on disk changed
+        if written:
             self._update_current_image_gallery_status()
+        return True
 
     def close_file(self, _value=False):
         if not self.may_continue():
@@ -2152,16 +2781,207 @@ class MainWindow(QMainWindow, WindowMixin):
     def delete_image(self):
         delete_path = self.file_path
         if delete_path is not None:
-            idx = self.cur_img_idx
+            idx = self._path_to_idx.get(delete_path, self.cur_img_idx)
             if os.path.exists(delete_path):
                 os.remove(delete_path)
-            self.import_dir_images(self.last_open_dir)
-            if self.img_count > 0:
-                self.cur_img_idx = min(idx, self.img_count - 1)
-                filename = self.m_img_list[self.cur_img_idx]
-                self.load_file(filename)
+            self.remove_image_paths([delete_path])
+            self._open_image_at(idx)
+
+    def _open_image_at(self, idx):
+        """Open the image now at ``idx`` (or the last one), or close if none is left."""
+        self.set_clean()  # The changes belonged to an image that is gone
+        self.file_path = None
+        if self.img_count > 0:
+            self.cur_img_idx = min(idx, self.img_count - 1)
+            self.load_file(self.m_img_list[self.cur_img_idx])
+        else:
+            self.close_file()
+
+    def remove_image_paths(self, paths):
+        """Drop ``paths`` from the image list, the list views and every per-image cache.
+
+        Nothing is rescanned or rebuilt: rows are taken out of the file list
+        and gallery, and only indexes after the first removed image are
+        renumbered. Returns the paths that were in the list.
+        """
+        rows = sorted(self._path_to_idx[path] for path in set(paths) if path in self._path_to_idx)
+        if not rows:
+            return []
+        removed = [self.m_img_list[row] for row in rows]
+        removed_set = set(removed)
+        first = rows[0]
+        self.m_img_list[first:] = [path for path in self.m_img_list[first:] if path not in removed_set]
+        self.file_list_widget.blockSignals(True)
+        for row in reversed(rows):
+            self.file_list_widget.takeItem(row)
+        self.file_list_widget.blockSignals(False)
+        for path in removed:
+            del self._path_to_idx[path]
+            self.annotation_index.discard(path)
+            self._undo_histories.discard(path)
+            self._forget_annotation_key(path)
+        for idx in range(first, len(self.m_img_list)):
+            self._path_to_idx[self.m_img_list[idx]] = idx
+        self.img_count = len(self.m_img_list)
+
+        if self.gallery_widget is not None:
+            self.gallery_widget.remove_images(removed)
+        if hasattr(self, 'full_gallery') and self.full_gallery:
+            self.full_gallery.remove_images(removed)
+        if self.file_path in self._path_to_idx:
+            self.cur_img_idx = self._path_to_idx[self.file_path]
+        if self.image_filter is not None:
+            self._refresh_filter_rows()
+        self.update_image_count()
+        return removed
+
+    def add_image_paths(self, paths):
+        """Insert ``paths`` into the image list and views at their sorted places.
+
+        Each path is placed by binary search; as in remove_image_paths(),
+        only indexes after the first inserted image are renumbered.
+        Returns the paths that were not listed yet.
+        """
+        sort_key = lambda x: x.lower()
+        new = [path for path in dict.fromkeys(paths) if path not in self._path_to_idx]
+        if not new:
+            return []
+        natural_sort(new, key=sort_key)
+        first = len(self.m_img_list)
+        for path in new:
+            row = natural_insert_index(self.m_img_list, path, key=sort_key)
+            first = min(first, row)
+            self.m_img_list.insert(row, path)
+            self.file_list_widget.insertItem(row, QListWidgetItem(path))
+            if self.gallery_widget is not None:
+                self.gallery_widget.insert_image(row, path)
+            if hasattr(self, 'full_gallery') and self.full_gallery:
+                self.full_gallery.insert_image(row, path)
+            if self._annotation_keys is not None:
+                key = self._annotation_key(path, self._annotation_keys_save_dir)
+                self._annotation_keys.setdefault(key, []).append(path)
+        for idx in range(first, len(self.m_img_list)):
+            self._path_to_idx[self.m_img_list[idx]] = idx
+        self.img_count = len(self.m_img_list)
+        if self.file_path in self._path_to_idx:
+            self.cur_img_idx = self._path_to_idx[self.file_path]
+        if self.gallery_widget is not None or (hasattr(self, 'full_gallery') and self.full_gallery):
+            for path in new:
+                self._update_gallery_status(path)
+        if self.image_filter is not None:
+            self._refresh_filter_rows()
+            self._update_filter_visibility(new)
+            self._index_in_background(new)
+        self.update_image_count()
+        return new
+
+    def _watch_folders(self):
+        """Follow changes made by others to the open folder and the save dir."""
+        if self.folder_watcher is None:
+            extensions = ['.%s' % fmt.data().decode("ascii").lower() for fmt in QImageReader.supportedImageFormats()]
+            self.folder_watcher = FolderWatcher(extensions, parent=self)
+            self.folder_watcher.images_added.connect(self._on_images_added)
+            self.folder_watcher.images_removed.connect(self._on_images_removed)
+            self.folder_watcher.annotations_changed.connect(self._on_annotations_changed)
+        self.folder_watcher.watch(self.dir_name, self.default_save_dir)
+
+    def _on_images_added(self, paths):
+        added = self.add_image_paths(paths)
+        if added:
+            self.status('%d new images in the folder' % len(added))
+
+    def _on_images_removed(self, paths):
+        current = self.file_path
+        current_idx = self._path_to_idx.get(current)
+        removed = self.remove_image_paths(paths)
+        if current in removed:
+            if self.dirty:
+                self.status('The open image was removed from the folder')
             else:
-                self.close_file()
+                self._open_image_at(current_idx)
+
+    def _annotation_key(self, image_path, save_dir=None):
+        """(annotation dir, file stem) under which the annotation of ``image_path`` is written."""
+        ann_dir = save_dir or os.path.dirname(image_path)
+        return ann_dir, os.path.splitext(os.path.basename(image_path))[0]
+
+    def _images_by_annotation_key(self):
+        """Map of _annotation_key() to image paths, rebuilt when the save dir changed."""
+        save_dir = os.path.abspath(self.default_save_dir) if self.default_save_dir else None
+        if self._annotation_keys is None or self._annotation_keys_save_dir != save_dir:
+            keys = {}
+            for path in self.m_img_list:
+                keys.setdefault(self._annotation_key(path, save_dir), []).append(path)
+            self._annotation_keys = keys
+            self._annotation_keys_save_dir = save_dir
+        return self._annotation_keys
+
+    def _forget_annotation_key(self, image_path):
+        if self._annotation_keys is None:
+            return
+        key = self._annotation_key(image_path, self._annotation_keys_save_dir)
+        paths = self._annotation_keys.get(key)
+        if paths and image_path in paths:
+            paths.remove(image_path)
+            if not paths:
+                del self._annotation_keys[key]
+
+    def _on_annotations_changed(self, annotation_paths):
+        """Refresh the status of every image whose annotation file changed on disk."""
+        keys = self._images_by_annotation_key()
+        images = []
+        for path in set(annotation_paths):
+            images.extend(keys.get((os.path.dirname(path), os.path.splitext(os.path.basename(path))[0]), ()))
+        images = list(dict.fromkeys(images))
+        for image_path in images:
+            self._update_gallery_status(image_path)
+        for gallery in (self.gallery_widget, getattr(self, 'full_gallery', None)):
+            if gallery is not None:
+                gallery.invalidate_thumbnails(images)
+
+    def selected_image_paths(self):
+        """Paths selected in the file list, in list order."""
+        paths = [ustr(item.text()) for item in self.file_list_widget.selectedItems()]
+        return sorted((path for path in paths if path in self._path_to_idx), key=self._path_to_idx.get)
+
+    def trash_selected_images(self, _value=False):
+        """Move the images selected in the file list (or the current one) to the trash folder."""
+        paths = self.selected_image_paths() or ([self.file_path] if self.file_path in self._path_to_idx else [])
+        if paths:
+            self.trash_images(paths)
+
+    def trash_images(self, paths):
+        """Take ``paths`` out of the lists now and move the files to the trash in the background.
+
+        The trash is the TRASH_DIR_NAME folder of the open folder, annotation
+        files go along with their image. Files that cannot be moved are
+        reported once the batch is done.
+        """
+        if not self.dir_name:
+            return
+        current = self.file_path
+        current_idx = self._path_to_idx.get(current)
+        removed = self.remove_image_paths(paths)
+        if not removed:
+            return
+        if self.save_queue.pending_count():
+            self.save_queue.wait()  # A late auto-save would bring an annotation back
+        worker = TrashWorker(removed, trash_dir_for(self.dir_name), self.default_save_dir)
+        worker.signals.failed.connect(self._on_trash_failed)
+        worker.signals.finished.connect(self._on_trash_finished)
+        self._trash_pool.start(worker)
+        self.status('Moving %d images to %s...' % (len(removed), TRASH_DIR_NAME))
+        if current in removed:
+            self._open_image_at(current_idx)
+
+    def _on_trash_failed(self, image_path, message):
+        self._trash_failures.append('%s: %s' % (image_path, message))
+
+    def _on_trash_finished(self, moved):
+        self.status('Moved %d images to %s' % (moved, TRASH_DIR_NAME))
+        if self._trash_failures:
+            self.error_message(u'Error moving images to trash', u'<p>%s</p>' % '<br>'.join(self._trash_failures))
+            self._trash_failures = []
 
     def reset_all(self):
         self.settings.reset()
@@ -2199,7 +3019,7 @@ class MainWindow(QMainWindow, WindowMixin):
                                            default=DEFAULT_LINE_COLOR)
         if color:
             self.line_color = color
-            Shape.line_color = color
+            Shape.default_line_color = color
             self.canvas.set_drawing_color(color)
             self.canvas.update()
             self.set_dirty()
@@ -2221,6 +3041,10 @@ class MainWindow(QMainWindow, WindowMixin):
             for action in self.actions.onShapesPresent:
                 action.setEnabled(False)
 
+    def shape_move_finished(self, shape, old_points):
+        """Record a finished move of a shape on the canvas for undo."""
+        self.undo_stack.push(MoveShapeCommand(self, shape, old_points, shape.points))
+
     def undo_action(self):
         """Undo the last action."""
         if self.undo_stack.can_undo():
@@ -2281,6 +3105,13 @@ class MainWindow(QMainWindow, WindowMixin):
         self.canvas.end_move(copy=False)
         self.set_dirty()
 
+    def load_label_palette(self, palette_file):
+        if os.path.exists(palette_file):
+            try:
+                label_colors.load_palette(palette_file)
+            except (IOError, OSError, UnicodeDecodeError) as e:
+                print("Failed to read label palette %s: %s" % (palette_file, e))
+
     def load_predefined_classes(self, predef_classes_file):
         if os.path.exists(predef_classes_file) is True:
             with codecs.open(predef_classes_file, 'r', 'utf8') as f:
@@ -2299,6 +3130,7 @@ class MainWindow(QMainWindow, WindowMixin):
 
         self.set_format(FORMAT_PASCALVOC)
 
+        from libs.pascal_voc_io import PascalVocReader
         t_voc_parse_reader = PascalVocReader(xml_path)
         shapes = t_voc_parse_reader.get_shapes()
         self.load_labels(shapes)
@@ -2311,6 +3143,7 @@ class MainWindow(QMainWindow, WindowMixin):
             return
 
         self.set_format(FORMAT_YOLO)
+        from libs.yolo_io import YoloReader
         # Use original image size for YOLO coordinate conversion (Issue #31)
         # YOLO stores normalized coords, so we need original dimensions
         if hasattr(self, '_original_image_size') and self._original_image_size is not None:
@@ -2341,6 +3174,7 @@ class MainWindow(QMainWindow, WindowMixin):
 
         self.set_format(FORMAT_CREATEML)
 
+        from libs.create_ml_io import CreateMLReader
         create_ml_parse_reader = CreateMLReader(json_path, file_path)
         shapes = create_ml_parse_reader.get_shapes()
         self.load_labels(shapes)
@@ -2376,6 +3210,13 @@ class MainWindow(QMainWindow, WindowMixin):
             if hasattr(self, 'tools') and self.tools:
                 self.tools.update_icon_size(size)
 
+    def change_canvas_backend(self):
+        """Store the selected canvas backend; it is used from the next start."""
+        action = self.sender()
+        if action:
+            self.settings[SETTING_CANVAS_BACKEND] = action.data()
+            self.status(self.string_bundle.get_string('canvasBackendRestart'))
+
     # Auto-save timer methods (Issue #13)
     def _toggle_auto_save_timer(self):
         """Toggle timer-based auto-save."""
@@ -2408,16 +3249,16 @@ class MainWindow(QMainWindow, WindowMixin):
         if not self.file_path:
             return  # No file loaded
 
-        # Determine save path
+        # Determine save path; without a save dir only files saved before are auto-saved
         if self.default_save_dir:
-            save_path = self._generate_save_path()
+            save_path = self._save_dir_annotation_path()
+        elif self.label_file is not None:
+            save_path = os.path.splitext(self.file_path)[0]
         else:
-            save_path = self.file_path
+            return
 
-        if save_path:
-            self.status("Auto-saving...")
-            if self._save_file(save_path):
-                self.status("Auto-saved to %s" % os.path.basename(save_path))
+        self.status("Auto-saving...")
+        self.queue_save(save_path)
 
 
 def inverted(color):
@@ -2443,6 +3284,9 @@ def get_main_app(argv=None):
     """
     if not argv:
         argv = []
+    profiler = StartupProfiler(start=STARTUP_BEGIN) if '--profile-startup' in argv else None
+    if profiler:
+        profiler.mark('imports')
 
     # Enable high-DPI scaling for better icon rendering on HiDPI displays
     try:
@@ -2451,11 +3295,20 @@ def get_main_app(argv=None):
     except AttributeError:
         pass  # Qt4 doesn't have these attributes
 
+    # Coalesce mouse and tablet moves so high-rate devices deliver one event per frame
+    try:
+        QApplication.setAttribute(Qt.AA_CompressHighFrequencyEvents, True)
+        QApplication.setAttribute(Qt.AA_CompressTabletEvents, True)
+    except AttributeError:
+        pass  # Qt < 5.10
+
     app = QApplication(argv)
     app.setStyle('Fusion')  # Use Fusion style for consistent cross-platform styling
     app.setStyleSheet(get_combined_style())  # Apply global stylesheet
     app.setApplicationName(__appname__)
     app.setWindowIcon(new_icon("app"))
+    if profiler:
+        profiler.mark('application')
     # Tzutalin 201705+: Accept extra agruments to change predefined class file
     argparser = argparse.ArgumentParser()
     argparser.add_argument("image_dir", nargs="?")
@@ -2463,6 +3316,8 @@ def get_main_app(argv=None):
                            default=os.path.join(os.path.dirname(__file__), "data", "predefined_classes.txt"),
                            nargs="?")
     argparser.add_argument("save_dir", nargs="?")
+    argparser.add_argument("--profile-startup", action="store_true",
+                           help="print how long each startup phase took and quit")
     args = argparser.parse_args(argv[1:])
 
     args.image_dir = args.image_dir and os.path.normpath(args.image_dir)
@@ -2473,10 +3328,28 @@ def get_main_app(argv=None):
     win = MainWindow(args.image_dir,
                      args.class_file,
                      args.save_dir)
+    if profiler:
+        profiler.mark('main window')
     win.show()
+    if profiler:
+        profiler.mark('show')
+        QTimer.singleShot(0, partial(finish_startup_profile, app, win, profiler, bool(args.image_dir)))
     return app, win
 
 
+def finish_startup_profile(app, win, profiler, wait_for_image=False):
+    """Report the startup phases once the first window (and image) is up, then quit."""
+    if not profiler.has_mark('first paint'):
+        profiler.mark('first paint')
+    if wait_for_image:
+        if not win.file_path and profiler.elapsed() < STARTUP_PROFILE_TIMEOUT:
+            QTimer.singleShot(10, partial(finish_startup_profile, app, win, profiler, True))
+            return
+        profiler.mark('first image' if win.file_path else 'no image loaded')
+    print(profiler.report())
+    app.quit()
+
+
 def main():
     """construct main app and run it"""
     app, _win = get_main_app(sys.argv)
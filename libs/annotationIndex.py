@@ -0,0 +1,262 @@
+# libs/annotationIndex.py
+"""In-memory index of what the annotations of each image contain.
+
+The main window reads the annotation file of an image once and records its
+status and the labels of its boxes in an AnnotationIndex. The index keeps
+a set of images per status, per class and per box count, so filters such
+as "no labels" or "contains class cat" are answered from those sets
+instead of by reading files, and stay correct as single images change.
+"""
+
+import json
+import os
+from collections import Counter, namedtuple
+
+from libs.galleryWidget import AnnotationStatus
+from libs.pascal_voc_io import PascalVocReader, XML_EXT
+from libs.yolo_io import TXT_EXT
+
+FILTER_ALL = 'filterAll'
+FILTER_NO_LABELS = 'filterNoLabels'
+FILTER_HAS_LABELS = 'filterHasLabels'
+FILTER_VERIFIED = 'filterVerified'
+FILTER_CLASS = 'filterClass'
+FILTER_BOX_COUNT = 'filterBoxCount'
+
+# Filter modes in the order they are offered; each one is also the string id of its name
+FILTER_MODES = (FILTER_ALL, FILTER_NO_LABELS, FILTER_HAS_LABELS, FILTER_VERIFIED, FILTER_CLASS, FILTER_BOX_COUNT)
+
+STATUS_FILTERS = {
+    FILTER_NO_LABELS: AnnotationStatus.NO_LABELS,
+    FILTER_HAS_LABELS: AnnotationStatus.HAS_LABELS,
+    FILTER_VERIFIED: AnnotationStatus.VERIFIED,
+}
+
+# ``value`` is a class name for FILTER_CLASS, a (low, high) pair for
+# FILTER_BOX_COUNT (high None for no upper bound) and unused otherwise.
+ImageFilter = namedtuple('ImageFilter', ['mode', 'value'])
+
+_class_lists = {}  # classes.txt path -> ((mtime_ns, size), class names)
+
+
+def parse_count_range(text):
+    """Parse '3', '2-5', '5-' or '5+' into (low, high); None if malformed."""
+    text = text.strip().replace(' ', '')
+    if not text:
+        return None
+    if text.endswith('+'):
+        text = text[:-1] + '-'
+    low, sep, high = text.partition('-')
+    try:
+        low = int(low) if low else 0
+        if not sep:
+            return low, low
+        high = int(high) if high else None
+    except ValueError:
+        return None
+    if low < 0 or (high is not None and high < low):
+        return None
+    return low, high
+
+
+def yolo_class_names(classes_path):
+    """Class names in a YOLO classes.txt; the file is read again only after it changed."""
+    try:
+        stat = os.stat(classes_path)
+    except OSError:
+        return []
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    cached = _class_lists.get(classes_path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    with open(classes_path, 'r') as f:
+        names = [line.strip() for line in f if line.strip()]
+    _class_lists[classes_path] = (stamp, names)
+    return names
+
+
+def yolo_labels(txt_path, class_names):
+    """Labels of the boxes in a YOLO annotation file, named from ``class_names``."""
+    labels = []
+    with open(txt_path, 'r') as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) >= 5:
+                class_idx = int(parts[0])
+                labels.append(class_names[class_idx] if 0 <= class_idx < len(class_names)
+                              else 'class_%d' % class_idx)
+    return labels
+
+
+def read_annotation_summary(image_path, ann_dir):
+    """Status and box labels of ``image_path`` from its annotation file in ``ann_dir``.
+
+    Returns (AnnotationStatus, list of labels). A Pascal VOC file marks the
+    image as labeled even when it holds no boxes, a YOLO file only when it
+    is not empty.
+    """
+    basename = os.path.splitext(os.path.basename(image_path))[0]
+    xml_path = os.path.join(ann_dir, basename + XML_EXT)
+    txt_path = os.path.join(ann_dir, basename + TXT_EXT)
+    json_path = os.path.join(ann_dir, 'annotations.json')
+
+    has_labels = False
+    verified = False
+    labels = []
+
+    # Check PASCAL VOC
+    if os.path.isfile(xml_path):
+        has_labels = True
+        try:
+            reader = PascalVocReader(xml_path)
+            verified = reader.verified
+            labels = [shape[0] for shape in reader.get_shapes()]
+        except Exception:
+            pass
+    # Check YOLO
+    elif os.path.isfile(txt_path):
+        has_labels = os.path.getsize(txt_path) > 0
+        try:
+            labels = yolo_labels(txt_path, yolo_class_names(os.path.join(ann_dir, 'classes.txt')))
+        except (IOError, OSError, ValueError):
+            pass
+    # Check CreateML
+    elif os.path.isfile(json_path):
+        try:
+            with open(json_path, 'r') as f:
+                data = json.load(f)
+            for item in data:
+                if item.get('image') == os.path.basename(image_path):
+                    annotations = item.get('annotations', [])
+                    has_labels = len(annotations) > 0
+                    verified = item.get('verified', False)
+                    labels = [annotation.get('label') for annotation in annotations]
+                    break
+        except Exception:
+            pass
+
+    if verified:
+        status = AnnotationStatus.VERIFIED
+    elif has_labels:
+        status = AnnotationStatus.HAS_LABELS
+    else:
+        status = AnnotationStatus.NO_LABELS
+    return status, labels
+
+
+class AnnotationIndex(object):
+    """Annotation status, classes and box count of each image, with reverse sets for queries.
+
+    The sets returned by the queries belong to the index; copy them before
+    changing them.
+    """
+
+    def __init__(self):
+        self._records = {}  # Image path -> (status, Counter of labels)
+        self._by_status = {status: set() for status in AnnotationStatus}
+        self._by_class = {}  # Label -> image paths with at least one box of it
+        self._by_box_count = {}  # Number of boxes -> image paths
+
+    def __contains__(self, image_path):
+        return image_path in self._records
+
+    def __len__(self):
+        return len(self._records)
+
+    def status(self, image_path, default=None):
+        record = self._records.get(image_path)
+        return record[0] if record is not None else default
+
+    def labels(self, image_path):
+        """Counter of the box labels of ``image_path``."""
+        record = self._records.get(image_path)
+        return Counter(record[1]) if record is not None else Counter()
+
+    def box_count(self, image_path):
+        record = self._records.get(image_path)
+        return sum(record[1].values()) if record is not None else 0
+
+    def update(self, image_path, status, labels):
+        """Record the status and box labels of an image; return whether anything changed."""
+        counts = Counter(labels)
+        old = self._records.get(image_path)
+        if old is not None and old[0] == status and old[1] == counts:
+            return False
+        self.discard(image_path)
+        self._records[image_path] = (status, counts)
+        self._by_status[status].add(image_path)
+        for label in counts:
+            self._by_class.setdefault(label, set()).add(image_path)
+        self._by_box_count.setdefault(sum(counts.values()), set()).add(image_path)
+        return True
+
+    def discard(self, image_path):
+        """Forget an image, if it is indexed."""
+        old = self._records.pop(image_path, None)
+        if old is None:
+            return
+        status, counts = old
+        self._by_status[status].discard(image_path)
+        for label in counts:
+            self._remove_from(self._by_class, label, image_path)
+        self._remove_from(self._by_box_count, sum(counts.values()), image_path)
+
+    @staticmethod
+    def _remove_from(sets, key, image_path):
+        paths = sets[key]
+        paths.discard(image_path)
+        if not paths:
+            del sets[key]
+
+    def clear(self):
+        self._records.clear()
+        for paths in self._by_status.values():
+            paths.clear()
+        self._by_class.clear()
+        self._by_box_count.clear()
+
+    def classes(self):
+        """Labels used by at least one indexed image, sorted."""
+        return sorted(label for label in self._by_class if label is not None)
+
+    def with_status(self, status):
+        return self._by_status[status]
+
+    def with_class(self, label):
+        return self._by_class.get(label, frozenset())
+
+    def with_box_count(self, low, high=None):
+        """Images with ``low`` to ``high`` boxes, both included; ``high`` None means no limit."""
+        matches = set()
+        for count, paths in self._by_box_count.items():
+            if count >= low and (high is None or count <= high):
+                matches |= paths
+        return matches
+
+    def query(self, image_filter):
+        """Indexed images that pass ``image_filter``."""
+        mode, value = image_filter
+        if mode in STATUS_FILTERS:
+            return self.with_status(STATUS_FILTERS[mode])
+        if mode == FILTER_CLASS:
+            return self.with_class(value)
+        if mode == FILTER_BOX_COUNT:
+            return self.with_box_count(*value)
+        return set(self._records)
+
+    def matches(self, image_path, image_filter):
+        """Whether one indexed image passes ``image_filter``."""
+        record = self._records.get(image_path)
+        if record is None:
+            return False
+        status, counts = record
+        mode, value = image_filter
+        if mode in STATUS_FILTERS:
+            return status == STATUS_FILTERS[mode]
+        if mode == FILTER_CLASS:
+            return value in counts
+        if mode == FILTER_BOX_COUNT:
+            low, high = value
+            count = sum(counts.values())
+            return count >= low and (high is None or count <= high)
+        return True
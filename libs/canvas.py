@@ -7,9 +7,9 @@ except ImportError:
     from PyQt4.QtGui import *
     from PyQt4.QtCore import *
 
-# from PyQt4.QtOpenGL import *
-
 from libs.shape import Shape
+from libs.shapeRenderer import ShapeRenderer
+from libs.spatialIndex import IndexedShapeList
 from libs.utils import distance
 
 CURSOR_DEFAULT = Qt.ArrowCursor
@@ -18,9 +18,6 @@ CURSOR_DRAW = Qt.CrossCursor
 CURSOR_MOVE = Qt.ClosedHandCursor
 CURSOR_GRAB = Qt.OpenHandCursor
 
-# class Canvas(QGLWidget):
-
-
 class Canvas(QWidget):
     zoomRequest = pyqtSignal(int)
     lightRequest = pyqtSignal(int)
@@ -28,17 +25,21 @@ class Canvas(QWidget):
     newShape = pyqtSignal()
     selectionChanged = pyqtSignal(bool)
     shapeMoved = pyqtSignal()
+    shapeMoveFinished = pyqtSignal(object, list)  # shape, points before the move
     drawingPolygon = pyqtSignal(bool)
 
     CREATE, EDIT = list(range(2))
 
+    # Backends that do not auto-fill the widget background clear it themselves.
+    fills_background = False
+
     epsilon = 24.0
 
     def __init__(self, *args, **kwargs):
         super(Canvas, self).__init__(*args, **kwargs)
         # Initialise local state.
         self.mode = self.EDIT
-        self.shapes = []
+        self._shapes = IndexedShapeList()
         self.current = None
         self.selected_shape = None  # save the selected shape here
         self.selected_shape_copy = None
@@ -46,17 +47,27 @@ class Canvas(QWidget):
         self.drawing_rect_color = QColor(0, 0, 255)
         self.line = Shape(line_color=self.drawing_line_color)
         self.prev_point = QPointF()
+        # Points of the selected shape when the current drag started.
+        self._move_origin = None
         self.offsets = QPointF(), QPointF()
         self.scale = 1.0
         self.overlay_color = None
+        self._overlay_cache = None  # ((pixmap cacheKey, overlay rgba), adjusted pixmap)
         self.label_font_size = 8
         self.pixmap = QPixmap()
+        # Tiled pyramid source for very large images; when set, ``pixmap``
+        # only holds a low resolution overview and shapes live in native
+        # image coordinates.
+        self.tiled_image = None
+        self._image_size = None
+        self._tile_level = None
         self.visible = {}
         self._hide_background = False
         self.hide_background = False
         self.h_shape = None
         self.h_vertex = None
         self._painter = QPainter()
+        self.renderer = ShapeRenderer()
         self._cursor = CURSOR_DEFAULT
         # Menus:
         self.menus = (QMenu(), QMenu())
@@ -69,6 +80,66 @@ class Canvas(QWidget):
         # initialisation for panning
         self.pan_initial_pos = QPoint()
 
+        # Status bar readout: mouse moves can arrive at over 1000 Hz, so
+        # the text is applied at most once per display refresh.
+        self._status_window = None
+        self._status_text = None
+        self._status_timer = QTimer(self)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.setInterval(self.refresh_interval())
+        self._status_timer.timeout.connect(self.flush_status_text)
+
+    @property
+    def shapes(self):
+        """Shapes on the canvas, kept in a spatial index for hit-testing."""
+        return self._shapes
+
+    @shapes.setter
+    def shapes(self, shapes):
+        old = self._shapes
+        self._shapes = IndexedShapeList(shapes)
+        for shape in old:
+            if shape.spatial_index is old.spatial_index:
+                shape.spatial_index = None
+
+    def shapes_near(self, point, radius=0.0):
+        """Visible shapes whose bounds lie within ``radius`` of ``point``, in paint order."""
+        return [s for s in self._shapes.near(point, radius) if self.isVisible(s)]
+
+    @staticmethod
+    def refresh_interval():
+        """Milliseconds per frame of the primary screen."""
+        screen = QApplication.primaryScreen() if QApplication.instance() else None
+        rate = screen.refreshRate() if screen is not None else 0
+        return int(1000 / rate) if rate > 0 else 16
+
+    def status_window(self):
+        """Main window showing the coordinate readout (cached), or None."""
+        if self._status_window is None:
+            window = self.window()
+            if hasattr(window, 'label_coordinates'):
+                self._status_window = window
+        return self._status_window
+
+    def changeEvent(self, ev):
+        if ev.type() == QEvent.ParentChange:
+            self._status_window = None
+        super(Canvas, self).changeEvent(ev)
+
+    def set_status_text(self, text):
+        """Queue ``text`` for the coordinate readout; applied on the next frame."""
+        self._status_text = text
+        if not self._status_timer.isActive():
+            self._status_timer.start()
+
+    def flush_status_text(self):
+        """Apply the latest queued coordinate readout."""
+        window = self.status_window()
+        if window is not None and self._status_text is not None:
+            if window.label_coordinates.text() != self._status_text:
+                window.label_coordinates.setText(self._status_text)
+        self._status_text = None
+
     def set_drawing_color(self, qcolor):
         self.drawing_line_color = qcolor
         self.drawing_rect_color = qcolor
@@ -113,19 +184,19 @@ class Canvas(QWidget):
         pos = self.transform_pos(ev.pos())
 
         # Update coordinates in status bar if image is opened
-        window = self.parent().window()
-        if window.file_path is not None:
-            self.parent().window().label_coordinates.setText(
-                'X: %d; Y: %d' % (pos.x(), pos.y()))
+        window = self.status_window()
+        if window is not None and window.file_path is not None:
+            self.set_status_text('X: %d; Y: %d' % (pos.x(), pos.y()))
 
         # Polygon drawing.
         if self.drawing():
+            self.update_drawing_area()
             self.override_cursor(CURSOR_DRAW)
             if self.current:
                 # Display annotation width and height while drawing
                 current_width = abs(self.current[0].x() - pos.x())
                 current_height = abs(self.current[0].y() - pos.y())
-                self.parent().window().label_coordinates.setText(
+                self.set_status_text(
                         'Width: %d, Height: %d / X: %d; Y: %d' % (current_width, current_height, pos.x(), pos.y()))
 
                 color = self.drawing_line_color
@@ -133,7 +204,7 @@ class Canvas(QWidget):
                     # Don't allow the user to draw outside the pixmap.
                     # Clip the coordinates to 0 or max,
                     # if they are outside the range [0, max]
-                    size = self.pixmap.size()
+                    size = self.image_size()
                     clipped_x = min(max(0, pos.x()), size.width())
                     clipped_y = min(max(0, pos.y()), size.height())
                     pos = QPointF(clipped_x, clipped_y)
@@ -161,46 +232,49 @@ class Canvas(QWidget):
                 self.current.highlight_clear()
             else:
                 self.prev_point = pos
-            self.repaint()
+            self.update_drawing_area()
             return
 
         # Polygon copy moving.
         if Qt.RightButton & ev.buttons():
             if self.selected_shape_copy and self.prev_point:
                 self.override_cursor(CURSOR_MOVE)
+                self.update_shapes(self.selected_shape_copy)
                 self.bounded_move_shape(self.selected_shape_copy, pos)
-                self.repaint()
+                self.update_shapes(self.selected_shape_copy)
             elif self.selected_shape:
                 self.selected_shape_copy = self.selected_shape.copy()
-                self.repaint()
+                self.update_shapes(self.selected_shape_copy)
             return
 
         # Polygon/Vertex moving.
         if Qt.LeftButton & ev.buttons():
             if self.selected_vertex():
+                self.update_shapes(self.h_shape)
                 self.bounded_move_vertex(pos)
                 self.shapeMoved.emit()
-                self.repaint()
+                self.update_shapes(self.h_shape)
 
                 # Display annotation width and height while moving vertex
                 point1 = self.h_shape[1]
                 point3 = self.h_shape[3]
                 current_width = abs(point1.x() - point3.x())
                 current_height = abs(point1.y() - point3.y())
-                self.parent().window().label_coordinates.setText(
+                self.set_status_text(
                         'Width: %d, Height: %d / X: %d; Y: %d' % (current_width, current_height, pos.x(), pos.y()))
             elif self.selected_shape and self.prev_point:
                 self.override_cursor(CURSOR_MOVE)
+                self.update_shapes(self.selected_shape)
                 self.bounded_move_shape(self.selected_shape, pos)
                 self.shapeMoved.emit()
-                self.repaint()
+                self.update_shapes(self.selected_shape)
 
                 # Display annotation width and height while moving shape
                 point1 = self.selected_shape[1]
                 point3 = self.selected_shape[3]
                 current_width = abs(point1.x() - point3.x())
                 current_height = abs(point1.y() - point3.y())
-                self.parent().window().label_coordinates.setText(
+                self.set_status_text(
                         'Width: %d, Height: %d / X: %d; Y: %d' % (current_width, current_height, pos.x(), pos.y()))
             else:
                 # pan
@@ -215,8 +289,12 @@ class Canvas(QWidget):
         # - Highlight vertex
         # Update shape/vertex fill and tooltip value accordingly.
         self.setToolTip("Image")
-        priority_list = self.shapes + ([self.selected_shape] if self.selected_shape else [])
-        visible_shapes = [s for s in priority_list if self.isVisible(s)]
+        previous_shape = self.h_shape
+        # The selected shape is on top, so it is checked first.
+        visible_shapes = self.shapes_near(pos, self.epsilon)
+        if self.selected_shape in visible_shapes:
+            visible_shapes.remove(self.selected_shape)
+            visible_shapes.append(self.selected_shape)
 
         # First pass: check for nearby vertices (these take priority)
         vertex_found = False
@@ -230,7 +308,7 @@ class Canvas(QWidget):
                 self.override_cursor(CURSOR_POINT)
                 self.setToolTip("Click & drag to move point")
                 self.setStatusTip(self.toolTip())
-                self.update()
+                self.update_shapes(previous_shape, shape)
                 vertex_found = True
                 break
 
@@ -250,19 +328,19 @@ class Canvas(QWidget):
                     "Click & drag to move shape '%s'" % shape.label)
                 self.setStatusTip(self.toolTip())
                 self.override_cursor(CURSOR_GRAB)
-                self.update()
+                self.update_shapes(previous_shape, shape)
 
                 # Display annotation width and height while hovering inside
                 point1 = self.h_shape[1]
                 point3 = self.h_shape[3]
                 current_width = abs(point1.x() - point3.x())
                 current_height = abs(point1.y() - point3.y())
-                self.parent().window().label_coordinates.setText(
+                self.set_status_text(
                         'Width: %d, Height: %d / X: %d; Y: %d' % (current_width, current_height, pos.x(), pos.y()))
             else:  # Nothing found, clear highlights, reset state.
                 if self.h_shape:
                     self.h_shape.highlight_clear()
-                    self.update()
+                    self.update_shapes(self.h_shape)
                 self.h_vertex, self.h_shape = None, None
                 self.override_cursor(CURSOR_DEFAULT)
 
@@ -275,6 +353,8 @@ class Canvas(QWidget):
             else:
                 selection = self.select_shape_point(pos)
                 self.prev_point = pos
+                if self.selected_shape is not None:
+                    self._move_origin = [QPointF(p) for p in self.selected_shape.points]
 
                 if selection is None:
                     # pan
@@ -300,6 +380,7 @@ class Canvas(QWidget):
                 self.override_cursor(CURSOR_POINT)
             else:
                 self.override_cursor(CURSOR_GRAB)
+            self.finish_move(self.selected_shape, self._move_origin)
         elif ev.button() == Qt.LeftButton:
             pos = self.transform_pos(ev.pos())
             if self.drawing():
@@ -307,6 +388,8 @@ class Canvas(QWidget):
             else:
                 # pan
                 QApplication.restoreOverrideCursor()
+        if ev.button() == Qt.LeftButton:
+            self._move_origin = None
 
     def end_move(self, copy=False):
         assert self.selected_shape and self.selected_shape_copy
@@ -319,9 +402,18 @@ class Canvas(QWidget):
             self.selected_shape = shape
             self.repaint()
         else:
+            old_points = self.selected_shape.points
             self.selected_shape.points = [p for p in shape.points]
+            self.finish_move(self.selected_shape, old_points)
         self.selected_shape_copy = None
 
+    def finish_move(self, shape, old_points):
+        """Report a completed move of ``shape`` if its points changed."""
+        if shape is None or old_points is None or len(old_points) != len(shape):
+            return
+        if any(old != new for old, new in zip(old_points, shape.points)):
+            self.shapeMoveFinished.emit(shape, list(old_points))
+
     def hide_background_shapes(self, value):
         self.hide_background = value
         if self.selected_shape:
@@ -381,10 +473,7 @@ class Canvas(QWidget):
             return self.h_vertex
 
         # Find all shapes containing the point
-        candidates = []
-        for shape in self.shapes:
-            if self.isVisible(shape) and shape.contains_point(point):
-                candidates.append(shape)
+        candidates = [s for s in self.shapes_near(point) if s.contains_point(point)]
 
         if candidates:
             # Select the smallest shape (by bounding rect area) for nested box support
@@ -410,11 +499,12 @@ class Canvas(QWidget):
         Moves a point x,y to within the boundaries of the canvas.
         :return: (x,y,snapped) where snapped is True if x or y were changed, False if not.
         """
-        if x < 0 or x > self.pixmap.width() or y < 0 or y > self.pixmap.height():
+        size = self.image_size()
+        if x < 0 or x > size.width() or y < 0 or y > size.height():
             x = max(x, 0)
             y = max(y, 0)
-            x = min(x, self.pixmap.width())
-            y = min(y, self.pixmap.height())
+            x = min(x, size.width())
+            y = min(y, size.height())
             return x, y, True
 
         return x, y, False
@@ -423,7 +513,7 @@ class Canvas(QWidget):
         index, shape = self.h_vertex, self.h_shape
         point = shape[index]
         if self.out_of_pixmap(pos):
-            size = self.pixmap.size()
+            size = self.image_size()
             clipped_x = min(max(0, pos.x()), size.width())
             clipped_y = min(max(0, pos.y()), size.height())
             pos = QPointF(clipped_x, clipped_y)
@@ -463,8 +553,9 @@ class Canvas(QWidget):
             pos -= QPointF(min(0, o1.x()), min(0, o1.y()))
         o2 = pos + self.offsets[1]
         if self.out_of_pixmap(o2):
-            pos += QPointF(min(0, self.pixmap.width() - o2.x()),
-                           min(0, self.pixmap.height() - o2.y()))
+            size = self.image_size()
+            pos += QPointF(min(0, size.width() - o2.x()),
+                           min(0, size.height() - o2.y()))
         # The next line tracks the new position of the cursor
         # relative to the shape, but also results in making it
         # a bit "shaky" when nearing the border and allows it to
@@ -507,7 +598,7 @@ class Canvas(QWidget):
     def bounded_shift_shape(self, shape):
         # Try to move in one direction, and if it fails in another.
         # Give up if both fail.
-        point = shape[0]
+        point = QPointF(shape[0])
         offset = QPointF(2.0, 2.0)
         self.calculate_offsets(shape, point)
         self.prev_point = point
@@ -517,9 +608,14 @@ class Canvas(QWidget):
     def paintEvent(self, event):
         if not self.pixmap:
             return super(Canvas, self).paintEvent(event)
+        self.paint_scene(event.rect())
 
+    def paint_scene(self, exposed_rect):
+        """Paint the image, shapes and drawing aids within ``exposed_rect`` (widget coordinates)."""
         p = self._painter
         p.begin(self)
+        if self.fills_background:
+            p.fillRect(exposed_rect, self.palette().color(self.backgroundRole()))
         p.setRenderHint(QPainter.Antialiasing)
         p.setRenderHint(QPainter.HighQualityAntialiasing)
         p.setRenderHint(QPainter.SmoothPixmapTransform)
@@ -527,21 +623,30 @@ class Canvas(QWidget):
         p.scale(self.scale, self.scale)
         p.translate(self.offset_to_center())
 
-        temp = self.pixmap
-        if self.overlay_color:
-            temp = QPixmap(self.pixmap)
-            painter = QPainter(temp)
-            painter.setCompositionMode(painter.CompositionMode_Overlay)
-            painter.fillRect(temp.rect(), self.overlay_color)
-            painter.end()
-
-        p.drawPixmap(0, 0, temp)
+        # Only the damaged area is repainted; skip everything outside it.
+        exposed = self.to_image_rect(exposed_rect)
+        if self.tiled_image is not None:
+            self.paint_tiles(p, exposed_rect)
+        else:
+            temp = self.adjusted_pixmap()
+            size = self.image_size()
+            target = QRectF(exposed.toAlignedRect().intersected(QRect(QPoint(0, 0), size)))
+            if not target.isEmpty():
+                # A re-decoded detail pixmap covers the same logical area
+                ratio_x = temp.width() / size.width()
+                ratio_y = temp.height() / size.height()
+                source = QRectF(target.x() * ratio_x, target.y() * ratio_y,
+                                target.width() * ratio_x, target.height() * ratio_y)
+                p.drawPixmap(target, temp, source)
         Shape.scale = self.scale
         Shape.label_font_size = self.label_font_size
+        visible_shapes = []
         for shape in self.shapes:
-            if (shape.selected or not self._hide_background) and self.isVisible(shape):
+            if (shape.selected or not self._hide_background) and self.isVisible(shape) \
+                    and exposed.intersects(self.shape_paint_rect(shape)):
                 shape.fill = shape.selected or shape == self.h_shape
-                shape.paint(p)
+                visible_shapes.append(shape)
+        self.renderer.paint(p, visible_shapes)
         if self.current:
             self.current.paint(p)
             self.line.paint(p)
@@ -560,9 +665,10 @@ class Canvas(QWidget):
             p.drawRect(int(left_top.x()), int(left_top.y()), int(rect_width), int(rect_height))
 
         if self.drawing() and not self.prev_point.isNull() and not self.out_of_pixmap(self.prev_point):
+            size = self.image_size()
             p.setPen(QColor(0, 0, 0))
-            p.drawLine(int(self.prev_point.x()), 0, int(self.prev_point.x()), int(self.pixmap.height()))
-            p.drawLine(0, int(self.prev_point.y()), int(self.pixmap.width()), int(self.prev_point.y()))
+            p.drawLine(int(self.prev_point.x()), 0, int(self.prev_point.x()), int(size.height()))
+            p.drawLine(0, int(self.prev_point.y()), int(size.width()), int(self.prev_point.y()))
 
         self.setAutoFillBackground(True)
         if self.verified:
@@ -576,6 +682,118 @@ class Canvas(QWidget):
 
         p.end()
 
+    def adjusted_pixmap(self):
+        """Return the pixmap with the brightness overlay applied.
+
+        The overlay composite runs over the whole image, so the result is
+        cached per (pixmap, overlay color) instead of being redone on
+        every repaint.
+        """
+        if not self.overlay_color:
+            return self.pixmap
+        key = (self.pixmap.cacheKey(), self.overlay_color.rgba())
+        if self._overlay_cache is not None and self._overlay_cache[0] == key:
+            return self._overlay_cache[1]
+        temp = QPixmap(self.pixmap)
+        painter = QPainter(temp)
+        painter.setCompositionMode(painter.CompositionMode_Overlay)
+        painter.fillRect(temp.rect(), self.overlay_color)
+        painter.end()
+        self._overlay_cache = (key, temp)
+        return temp
+
+    def paint_tiles(self, p, exposed):
+        """Paint the overview and the visible tiles of ``tiled_image``.
+
+        ``exposed`` is the repainted area in widget coordinates; only the
+        tiles intersecting it at the pyramid level matching ``scale`` are
+        drawn, missing tiles are queued and the overview shows through
+        until they arrive.
+        """
+        tiled = self.tiled_image
+        image_rect = QRectF(0, 0, tiled.width(), tiled.height())
+        visible = self.to_image_rect(exposed).intersected(image_rect)
+
+        if self.pixmap and not self.pixmap.isNull():
+            p.drawPixmap(image_rect, self.pixmap, QRectF(self.pixmap.rect()))
+
+        level = tiled.level_for_scale(self.scale)
+        if level != self._tile_level:
+            tiled.cancel_pending()
+            self._tile_level = level
+        for key in tiled.visible_tiles(visible, level):
+            tile = tiled.tile(key)
+            if tile is not None:
+                p.drawPixmap(QRectF(tiled.tile_rect(*key)), tile, QRectF(tile.rect()))
+
+        if self.overlay_color:
+            p.setCompositionMode(QPainter.CompositionMode_Overlay)
+            p.fillRect(visible, self.overlay_color)
+            p.setCompositionMode(QPainter.CompositionMode_SourceOver)
+
+    def shape_paint_rect(self, shape):
+        """Area (in image coordinates) painted by ``shape``, including vertices and label."""
+        if not shape.points:
+            return QRectF()
+        # Highlighted vertices are drawn up to 4x point_size wide, plus the pen.
+        pad = (2.0 * Shape.point_size + 2.0) / self.scale
+        rect = shape.bounding_rect().adjusted(-pad, -pad, pad, pad)
+        if shape.paint_label and shape.label:
+            font = QFont()
+            font.setPointSize(self.label_font_size)
+            font.setBold(True)
+            label_rect = QFontMetricsF(font).boundingRect(shape.label)
+            label_rect.translate(rect.left() + pad, rect.top() + pad)
+            # The label is pushed below the top edge when it would not fit.
+            label_rect.adjust(0, 0, 0, 1.25 * self.label_font_size)
+            rect = rect.united(label_rect)
+        return rect
+
+    def crosshair_rects(self, point):
+        """Areas (in image coordinates) covered by the crosshair lines through ``point``."""
+        size = self.image_size()
+        pad = 2.0 / self.scale
+        return (QRectF(0, point.y() - pad, size.width(), 2 * pad),
+                QRectF(point.x() - pad, 0, 2 * pad, size.height()))
+
+    def to_widget_rect(self, rect):
+        """Map a rectangle from image to widget coordinates, rounded outwards."""
+        offset = self.offset_to_center()
+        return QRectF((rect.x() + offset.x()) * self.scale,
+                      (rect.y() + offset.y()) * self.scale,
+                      rect.width() * self.scale,
+                      rect.height() * self.scale).toAlignedRect().adjusted(-1, -1, 1, 1)
+
+    def to_image_rect(self, rect):
+        """Map a rectangle from widget to image coordinates."""
+        offset = self.offset_to_center()
+        return QRectF(rect.x() / self.scale - offset.x(),
+                      rect.y() / self.scale - offset.y(),
+                      rect.width() / self.scale,
+                      rect.height() / self.scale)
+
+    def update_shapes(self, *shapes):
+        """Schedule a repaint of only the area covered by ``shapes``."""
+        for shape in shapes:
+            if shape is not None:
+                self.update(self.to_widget_rect(self.shape_paint_rect(shape)))
+
+    def update_drawing_area(self):
+        """Schedule a repaint of the in-progress shape and the crosshair."""
+        if self.current:
+            self.update_shapes(self.current, self.line)
+        elif not self.prev_point.isNull():
+            for rect in self.crosshair_rects(self.prev_point):
+                self.update(self.to_widget_rect(rect))
+
+    def image_size(self):
+        """Size of the image in canvas (shape) coordinates."""
+        if self._image_size is not None:
+            return self._image_size
+        if self.pixmap is None:
+            return QSize()
+        return self.pixmap.size()
+
     def transform_pos(self, point):
         """Convert from widget-logical coordinates to painter-logical coordinates."""
         return point / self.scale - self.offset_to_center()
@@ -583,14 +801,16 @@ class Canvas(QWidget):
     def offset_to_center(self):
         s = self.scale
         area = super(Canvas, self).size()
-        w, h = self.pixmap.width() * s, self.pixmap.height() * s
+        size = self.image_size()
+        w, h = size.width() * s, size.height() * s
         aw, ah = area.width(), area.height()
         x = (aw - w) / (2 * s) if aw > w else 0
         y = (ah - h) / (2 * s) if ah > h else 0
         return QPointF(x, y)
 
     def out_of_pixmap(self, p):
-        w, h = self.pixmap.width(), self.pixmap.height()
+        size = self.image_size()
+        w, h = size.width(), size.height()
         return not (0 <= p.x() <= w and 0 <= p.y() <= h)
 
     def finalise(self):
@@ -621,7 +841,7 @@ class Canvas(QWidget):
 
     def minimumSizeHint(self):
         if self.pixmap:
-            return self.scale * self.pixmap.size()
+            return self.scale * self.image_size()
         return super(Canvas, self).minimumSizeHint()
 
     def wheelEvent(self, ev):
@@ -667,33 +887,20 @@ class Canvas(QWidget):
             self.move_one_pixel('Down')
 
     def move_one_pixel(self, direction):
-        # print(self.selectedShape.points)
-        if direction == 'Left' and not self.move_out_of_bound(QPointF(-1.0, 0)):
-            # print("move Left one pixel")
-            self.selected_shape.points[0] += QPointF(-1.0, 0)
-            self.selected_shape.points[1] += QPointF(-1.0, 0)
-            self.selected_shape.points[2] += QPointF(-1.0, 0)
-            self.selected_shape.points[3] += QPointF(-1.0, 0)
-        elif direction == 'Right' and not self.move_out_of_bound(QPointF(1.0, 0)):
-            # print("move Right one pixel")
-            self.selected_shape.points[0] += QPointF(1.0, 0)
-            self.selected_shape.points[1] += QPointF(1.0, 0)
-            self.selected_shape.points[2] += QPointF(1.0, 0)
-            self.selected_shape.points[3] += QPointF(1.0, 0)
-        elif direction == 'Up' and not self.move_out_of_bound(QPointF(0, -1.0)):
-            # print("move Up one pixel")
-            self.selected_shape.points[0] += QPointF(0, -1.0)
-            self.selected_shape.points[1] += QPointF(0, -1.0)
-            self.selected_shape.points[2] += QPointF(0, -1.0)
-            self.selected_shape.points[3] += QPointF(0, -1.0)
-        elif direction == 'Down' and not self.move_out_of_bound(QPointF(0, 1.0)):
-            # print("move Down one pixel")
-            self.selected_shape.points[0] += QPointF(0, 1.0)
-            self.selected_shape.points[1] += QPointF(0, 1.0)
-            self.selected_shape.points[2] += QPointF(0, 1.0)
-            self.selected_shape.points[3] += QPointF(0, 1.0)
+        steps = {
+            'Left': QPointF(-1.0, 0),
+            'Right': QPointF(1.0, 0),
+            'Up': QPointF(0, -1.0),
+            'Down': QPointF(0, 1.0),
+        }
+        step = steps.get(direction)
+        self.update_shapes(self.selected_shape)
+        old_points = [QPointF(p) for p in self.selected_shape.points]
+        if step is not None and not self.move_out_of_bound(step):
+            self.selected_shape.move_by(step)
         self.shapeMoved.emit()
-        self.repaint()
+        self.finish_move(self.selected_shape, old_points)
+        self.update_shapes(self.selected_shape)
 
     def move_out_of_bound(self, step):
         points = [p1 + p2 for p1, p2 in zip(self.selected_shape.points, [step] * 4)]
@@ -728,18 +935,51 @@ class Canvas(QWidget):
         self.update()
 
     def load_pixmap(self, pixmap):
+        self.release_tiled_image()
         self.pixmap = pixmap
+        self._overlay_cache = None
+        self.shapes = []
+        self.repaint()
+
+    def load_tiled_image(self, tiled_image, overview):
+        """Show ``tiled_image`` at native resolution, with ``overview`` as placeholder."""
+        self.release_tiled_image()
+        self.pixmap = overview
+        self.tiled_image = tiled_image
+        self._image_size = tiled_image.size()
+        self._tile_level = None
+        tiled_image.tile_ready.connect(self.update)
         self.shapes = []
         self.repaint()
 
+    def set_detail_pixmap(self, pixmap):
+        """Swap in a higher resolution decode of the current image.
+
+        Shape coordinates stay in the space of the initially loaded
+        pixmap; the detail pixmap is drawn scaled into that area.
+        """
+        if self.pixmap is None or self.tiled_image is not None:
+            return
+        if self._image_size is None:
+            self._image_size = self.pixmap.size()
+        self.pixmap = pixmap
+        self.update()
+
+    def release_tiled_image(self):
+        if self.tiled_image is not None:
+            self.tiled_image.tile_ready.disconnect(self.update)
+            self.tiled_image.close()
+        self.tiled_image = None
+        self._image_size = None
+
     def load_shapes(self, shapes):
         self.shapes = list(shapes)
         self.current = None
-        self.repaint()
+        self.update()
 
     def set_shape_visible(self, shape, value):
         self.visible[shape] = value
-        self.repaint()
+        self.update_shapes(shape)
 
     def current_cursor(self):
         cursor = QApplication.overrideCursor()
@@ -761,9 +1001,14 @@ class Canvas(QWidget):
         self.de_select_shape()
         self.un_highlight()
         self.selected_shape_copy = None
+        self._move_origin = None
 
         self.restore_cursor()
+        self.release_tiled_image()
+        self._status_timer.stop()
+        self._status_text = None
         self.pixmap = None
+        self._overlay_cache = None
         self.update()
 
     def set_drawing_shape_to_square(self, status):
@@ -1,4 +1,5 @@
 import sys
+from bisect import bisect_left
 try:
     from PyQt5.QtWidgets import QWidget, QHBoxLayout, QComboBox
 except ImportError:
@@ -13,12 +14,22 @@ except ImportError:
 
 
 class ComboBox(QWidget):
+    """Label filter of the label list.
+
+    Besides setting the items directly, the combo box can keep a count of
+    the shapes per label: a label is inserted at its sorted position when
+    its first shape is added and removed with its last one, instead of
+    rebuilding the list on every change. The empty item (show all) is
+    always first.
+    """
+
     def __init__(self, parent=None, items=[]):
         super(ComboBox, self).__init__(parent)
 
         layout = QHBoxLayout()
         self.cb = QComboBox()
-        self.items = items
+        self.items = list(items)
+        self.label_counts = {}
         self.cb.addItems(self.items)
 
         self.cb.currentIndexChanged.connect(parent.combo_selection_changed)
@@ -27,7 +38,48 @@ class ComboBox(QWidget):
         self.setLayout(layout)
 
     def update_items(self, items):
-        self.items = items
+        self.items = list(items)
 
         self.cb.clear()
         self.cb.addItems(self.items)
+
+    def set_labels(self, labels):
+        """Rebuild the items from the labels of all shapes (an iterable, with repeats)."""
+        self.label_counts = {}
+        for label in labels:
+            self.label_counts[label] = self.label_counts.get(label, 0) + 1
+        self.update_items(sorted(set(self.label_counts) | {""}))
+
+    def add_label(self, label):
+        """Count one more shape with ``label``, inserting the label if it is new."""
+        count = self.label_counts.get(label, 0)
+        self.label_counts[label] = count + 1
+        if not self.items or self.items[0] != "":
+            self._insert_item(0, "")
+        if count == 0 and label != "":
+            self._insert_item(bisect_left(self.items, label, 1), label)
+
+    def remove_label(self, label):
+        """Count one shape less with ``label``, removing the label with its last shape."""
+        count = self.label_counts.get(label, 0)
+        if count > 1:
+            self.label_counts[label] = count - 1
+            return
+        self.label_counts.pop(label, None)
+        if count == 1 and label != "":
+            index = bisect_left(self.items, label, 1)
+            if index < len(self.items) and self.items[index] == label:
+                if self.cb.currentIndex() == index:
+                    # Show all labels again rather than jump to a neighbouring filter
+                    self.cb.setCurrentIndex(0)
+                del self.items[index]
+                self.cb.removeItem(index)
+
+    def clear_labels(self):
+        """Forget all labels."""
+        self.label_counts = {}
+        self.update_items([])
+
+    def _insert_item(self, index, label):
+        self.items.insert(index, label)
+        self.cb.insertItem(index, label)
@@ -1,17 +1,49 @@
 # libs/commands.py
 """Command pattern implementation for undo/redo functionality.
 
-This module provides undoable command classes for annotation actions.
+This module provides undoable command classes for annotation actions,
+and the bounded per-image histories they are kept in.
 """
 
 from abc import ABC, abstractmethod
+from array import array
+from collections import OrderedDict, deque
+from contextlib import nullcontext
 from copy import deepcopy
+import time
 
 try:
+    from PyQt5.QtGui import QColor
     from PyQt5.QtCore import QPointF
 except ImportError:
+    from PyQt4.QtGui import QColor
     from PyQt4.QtCore import QPointF
 
+from libs.labelColors import label_colors
+from libs.shape import Shape
+
+# Rough memory cost of history entries, in bytes. Only used to keep the
+# history within its budget, so they need not be exact.
+COMMAND_SIZE = 200
+DELTA_SIZE = 80
+COORDINATE_SIZE = 8
+
+# Budget of the history of the open image.
+UNDO_MEMORY_BUDGET = 4 * 1024 * 1024
+# Budget shared by the histories of all other images.
+PARKED_HISTORY_BUDGET = 32 * 1024 * 1024
+
+# Maximum distance (in display pixels) a reloaded point may be off from the
+# parked one; saving rounds coordinates in the original image space.
+SIGNATURE_TOLERANCE = 1.0
+
+# Vertex index of a delta that translates the whole shape.
+ALL_VERTICES = -1
+
+# Moves of the same shape pushed within this many seconds of each other
+# are merged into one undo step (e.g. holding an arrow key).
+MOVE_MERGE_INTERVAL = 1.0
+
 
 class Command(ABC):
     """Base class for all undoable commands."""
@@ -31,6 +63,36 @@ class Command(ABC):
         """Return a description of this command."""
         return "Command"
 
+    def size_estimate(self):
+        """Return the approximate memory held by this command, in bytes."""
+        return COMMAND_SIZE
+
+    def shapes(self):
+        """Return the shapes this command refers to."""
+        shape = getattr(self, 'shape', None)
+        return [] if shape is None else [shape]
+
+    def remap_shapes(self, mapping):
+        """Replace the shapes this command refers to.
+
+        Args:
+            mapping: Dict from the current references to the new ones.
+        """
+        shape = getattr(self, 'shape', None)
+        if shape is not None:
+            self.shape = mapping.get(shape, shape)
+
+    def merge_with(self, command):
+        """Try to absorb ``command``, pushed right after this one.
+
+        Args:
+            command: The newer, already executed command.
+
+        Returns:
+            True if this command now also covers ``command``.
+        """
+        return False
+
 
 class CreateShapeCommand(Command):
     """Command for creating a new shape.
@@ -126,25 +188,147 @@ class MoveShapeCommand(Command):
         """
         self.main_window = main_window
         self.shape = shape
-        # Store copies of points to avoid reference issues
-        self.old_points = [QPointF(p.x(), p.y()) for p in old_points]
-        self.new_points = [QPointF(p.x(), p.y()) for p in new_points]
+        self.deltas = move_deltas(old_points, new_points)
+        self.timestamp = time.monotonic()
 
     def execute(self):
         """Move shape to new position."""
-        self.shape.points = [QPointF(p.x(), p.y()) for p in self.new_points]
-        self.main_window.canvas.update()
+        self._apply(1)
 
     def undo(self):
         """Restore shape to original position."""
-        self.shape.points = [QPointF(p.x(), p.y()) for p in self.old_points]
+        self._apply(-1)
+
+    def _apply(self, sign):
+        """Offset the shape by the stored deltas, forwards (1) or backwards (-1)."""
+        for index, dx, dy in self.deltas:
+            offset = QPointF(sign * dx, sign * dy)
+            if index == ALL_VERTICES:
+                self.shape.move_by(offset)
+            else:
+                self.shape.move_vertex_by(index, offset)
         self.main_window.canvas.update()
 
+    def size_estimate(self):
+        return COMMAND_SIZE + DELTA_SIZE * len(self.deltas)
+
+    def merge_with(self, command):
+        """Merge a following move of the same shape made shortly after this one."""
+        if not isinstance(command, MoveShapeCommand) or command.shape is not self.shape:
+            return False
+        if command.timestamp - self.timestamp > MOVE_MERGE_INTERVAL:
+            return False
+        self.deltas = combine_deltas(self.deltas, command.deltas, len(self.shape))
+        self.timestamp = command.timestamp
+        return True
+
     @property
     def description(self):
         return f"Move shape '{self.shape.label}'"
 
 
+def move_deltas(old_points, new_points):
+    """Compute the compact delta between two positions of a shape.
+
+    Args:
+        old_points: Points before the move.
+        new_points: Points after the move.
+
+    Returns:
+        Tuple of (vertex index, dx, dy). A move of the whole shape is a
+        single delta with index ALL_VERTICES; vertices that did not move
+        are left out.
+
+    Raises:
+        ValueError: If the point lists differ in length.
+    """
+    if len(old_points) != len(new_points):
+        raise ValueError("A move cannot change the number of points")
+    return _compact_offsets([(new.x() - old.x(), new.y() - old.y())
+                             for old, new in zip(old_points, new_points)])
+
+
+def combine_deltas(first, second, count):
+    """Combine two consecutive move deltas of a shape into one.
+
+    Args:
+        first: Deltas of the earlier move.
+        second: Deltas of the later move.
+        count: Number of points of the shape.
+
+    Returns:
+        Deltas equivalent to applying ``first`` and then ``second``.
+    """
+    offsets = [[0, 0] for _ in range(count)]
+    for index, dx, dy in first + second:
+        for offset in (offsets if index == ALL_VERTICES else [offsets[index]]):
+            offset[0] += dx
+            offset[1] += dy
+    return _compact_offsets([tuple(offset) for offset in offsets])
+
+
+def _compact_offsets(offsets):
+    """Turn per-vertex (dx, dy) offsets into compact deltas."""
+    if not offsets or all(offset == (0, 0) for offset in offsets):
+        return ()
+    if len(offsets) > 1 and all(offset == offsets[0] for offset in offsets):
+        return ((ALL_VERTICES,) + offsets[0],)
+    return tuple((i, dx, dy) for i, (dx, dy) in enumerate(offsets) if (dx, dy) != (0, 0))
+
+
+class MacroCommand(Command):
+    """Group of commands undone and redone as a single step.
+
+    Used for bulk edits such as pasting many shapes. While the group runs,
+    the main window defers label list and canvas refreshes if it provides
+    a ``bulk_edit()`` context manager.
+    """
+
+    def __init__(self, main_window, commands, description=None):
+        """Initialize with the commands of the group.
+
+        Args:
+            main_window: The MainWindow instance.
+            commands: The commands, in execution order.
+            description: Optional description of the whole group.
+        """
+        self.main_window = main_window
+        self.commands = list(commands)
+        self._description = description
+
+    def execute(self):
+        """Execute all commands in order."""
+        with self._bulk_edit():
+            for command in self.commands:
+                command.execute()
+
+    def undo(self):
+        """Undo all commands in reverse order."""
+        with self._bulk_edit():
+            for command in reversed(self.commands):
+                command.undo()
+
+    def _bulk_edit(self):
+        bulk_edit = getattr(self.main_window, 'bulk_edit', None)
+        return bulk_edit() if bulk_edit is not None else nullcontext()
+
+    def size_estimate(self):
+        return COMMAND_SIZE + sum(command.size_estimate() for command in self.commands)
+
+    def shapes(self):
+        return [shape for command in self.commands for shape in command.shapes()]
+
+    def remap_shapes(self, mapping):
+        for command in self.commands:
+            command.remap_shapes(mapping)
+
+    @property
+    def description(self):
+        if self._description:
+            return self._description
+        return f"{len(self.commands)} changes"
+
+
 class EditLabelCommand(Command):
     """Command for editing a shape's label.
 
@@ -182,49 +366,188 @@ class EditLabelCommand(Command):
         if self.shape in self.main_window.shapes_to_items:
             item = self.main_window.shapes_to_items[self.shape]
             item.setText(self.shape.label)
-            from libs.hashableQListWidgetItem import generate_color_by_text
-            item.setBackground(generate_color_by_text(self.shape.label))
+            item.setBackground(label_colors.brush(self.shape.label))
 
     @property
     def description(self):
         return f"Edit label '{self.old_label}' -> '{self.new_label}'"
 
 
+class ShapeSnapshot:
+    """Compact copy of a shape that is not on the canvas.
+
+    Parked histories keep these instead of Shape objects for shapes that
+    were deleted or whose creation was undone.
+    """
+
+    __slots__ = ('label', 'coordinates', 'closed', 'difficult', 'paint_label', 'line_color', 'fill_color')
+
+    def __init__(self, shape):
+        self.label = shape.label
+        self.coordinates = array('d', (c for p in shape.points for c in (p.x(), p.y())))
+        self.closed = shape.is_closed()
+        self.difficult = shape.difficult
+        self.paint_label = shape.paint_label
+        self.line_color = shape.line_color.rgba()
+        self.fill_color = shape.fill_color.rgba()
+
+    def to_shape(self):
+        """Build a new Shape from the snapshot."""
+        shape = Shape(label=self.label, difficult=self.difficult, paint_label=self.paint_label)
+        coordinates = self.coordinates
+        shape.points = [QPointF(coordinates[i], coordinates[i + 1])
+                        for i in range(0, len(coordinates), 2)]
+        if self.closed:
+            shape.close()
+        shape.line_color = QColor.fromRgba(self.line_color)
+        shape.fill_color = QColor.fromRgba(self.fill_color)
+        return shape
+
+    def size_estimate(self):
+        return COMMAND_SIZE + COORDINATE_SIZE * len(self.coordinates) + len(self.label or '')
+
+
+class ShapesSignature:
+    """Labels and coordinates of the shapes an image had when its history was parked.
+
+    A history only applies to the shapes it was recorded on; if the
+    reloaded annotation differs (e.g. unsaved edits were discarded), the
+    history is dropped.
+    """
+
+    __slots__ = ('labels', 'coordinates')
+
+    def __init__(self, shapes):
+        self.labels = tuple(shape.label for shape in shapes)
+        self.coordinates = array('d', (c for shape in shapes
+                                       for p in shape.points for c in (p.x(), p.y())))
+
+    def matches(self, shapes, tolerance=SIGNATURE_TOLERANCE):
+        """Check whether ``shapes`` are the shapes the signature was taken from."""
+        other = ShapesSignature(shapes)
+        if other.labels != self.labels or len(other.coordinates) != len(self.coordinates):
+            return False
+        return all(abs(a - b) <= tolerance for a, b in zip(self.coordinates, other.coordinates))
+
+    def size_estimate(self):
+        return COMMAND_SIZE + COORDINATE_SIZE * len(self.coordinates) + sum(
+            len(label or '') for label in self.labels)
+
+
+class UndoHistory:
+    """Undo and redo commands of an image that is not open.
+
+    Commands refer to the shapes still on the canvas by their index and to
+    the others by a ShapeSnapshot, so no Shape objects are kept alive.
+    """
+
+    def __init__(self, undo_commands, redo_commands, shapes):
+        self.undo_commands = undo_commands
+        self.redo_commands = redo_commands
+        self.signature = ShapesSignature(shapes)
+        positions = {shape: i for i, shape in enumerate(shapes)}
+        references = {}
+        for command in self.commands():
+            for shape in command.shapes():
+                if shape not in references:
+                    references[shape] = positions[shape] if shape in positions else ShapeSnapshot(shape)
+            command.remap_shapes(references)
+        self.snapshots = [ref for ref in references.values() if isinstance(ref, ShapeSnapshot)]
+
+    def commands(self):
+        """Iterate over all commands of the history."""
+        for command in self.undo_commands:
+            yield command
+        for command in self.redo_commands:
+            yield command
+
+    def resolve(self, shapes):
+        """Point the commands back at real shapes.
+
+        Args:
+            shapes: The shapes of the reloaded image, in canvas order.
+
+        Returns:
+            True if the history was restored, False if ``shapes`` no longer
+            match the shapes the history was recorded on.
+        """
+        if not self.signature.matches(shapes):
+            return False
+        mapping = {i: shape for i, shape in enumerate(shapes)}
+        for snapshot in self.snapshots:
+            mapping[snapshot] = snapshot.to_shape()
+        for command in self.commands():
+            command.remap_shapes(mapping)
+        return True
+
+    def size_estimate(self):
+        return (sum(command.size_estimate() for command in self.commands()) +
+                sum(snapshot.size_estimate() for snapshot in self.snapshots) +
+                self.signature.size_estimate())
+
+
 class UndoStack:
     """Manages command history for undo/redo operations.
 
     Maintains two stacks: one for undo operations and one for redo.
-    When a new command is pushed, the redo stack is cleared.
+    When a new command is pushed, the redo stack is cleared. The oldest
+    commands are dropped once the history exceeds its memory budget (or
+    the optional maximum number of commands).
     """
 
-    def __init__(self, max_size=50):
+    def __init__(self, max_size=None, memory_budget=UNDO_MEMORY_BUDGET):
         """Initialize the undo stack.
 
         Args:
-            max_size: Maximum number of commands to store (default 50).
+            max_size: Maximum number of commands to store, or None for no limit.
+            memory_budget: Approximate memory the history may use in bytes,
+                or None for no limit. The latest command is always kept.
         """
-        self._undo_stack = []
-        self._redo_stack = []
+        self._undo_stack = deque()
+        self._redo_stack = deque()
         self._max_size = max_size
+        self._memory_budget = memory_budget
+        self._size = 0
         self._callbacks = []
 
     def push(self, command):
         """Add a command to the undo stack.
 
         The command should already be executed before pushing.
-        Clears the redo stack since we're branching history.
+        Clears the redo stack since we're branching history. The command
+        is merged into the previous one when that one accepts it.
 
         Args:
             command: The Command object to push.
         """
-        self._undo_stack.append(command)
+        top = self._undo_stack[-1] if self._undo_stack else None
+        top_size = top.size_estimate() if top is not None else 0
+        if top is not None and top.merge_with(command):
+            self._size += top.size_estimate() - top_size
+        else:
+            self._undo_stack.append(command)
+            self._size += command.size_estimate()
+        for dropped in self._redo_stack:
+            self._size -= dropped.size_estimate()
         self._redo_stack.clear()
+        self._trim()
+        self._notify_callbacks()
 
-        # Trim stack if it exceeds max size
-        while len(self._undo_stack) > self._max_size:
-            self._undo_stack.pop(0)
+    def _trim(self):
+        """Drop the oldest commands until the history fits its limits."""
+        while self._undo_stack and (self._over_max_size() or self._over_budget()):
+            self._size -= self._undo_stack.popleft().size_estimate()
 
-        self._notify_callbacks()
+    def _over_max_size(self):
+        return self._max_size is not None and len(self._undo_stack) > self._max_size
+
+    def _over_budget(self):
+        return (self._memory_budget is not None and self._size > self._memory_budget and
+                len(self._undo_stack) > 1)
+
+    def size_estimate(self):
+        """Return the approximate memory held by the history, in bytes."""
+        return self._size
 
     def undo(self):
         """Undo the last command.
@@ -279,7 +602,47 @@ class UndoStack:
         """
         self._undo_stack.clear()
         self._redo_stack.clear()
+        self._size = 0
+        self._notify_callbacks()
+
+    def detach(self, shapes):
+        """Take the history out of the stack, leaving the stack empty.
+
+        Args:
+            shapes: The shapes currently on the canvas, in order.
+
+        Returns:
+            An UndoHistory that attach() can restore, or None if there is
+            no history.
+        """
+        if not self._undo_stack and not self._redo_stack:
+            return None
+        history = UndoHistory(self._undo_stack, self._redo_stack, shapes)
+        self._undo_stack = deque()
+        self._redo_stack = deque()
+        self._size = 0
         self._notify_callbacks()
+        return history
+
+    def attach(self, history, shapes):
+        """Replace the stack contents with a detached history.
+
+        Args:
+            history: An UndoHistory returned by detach().
+            shapes: The shapes now on the canvas, in order.
+
+        Returns:
+            True if the history was restored; False if the shapes changed
+            since it was detached, in which case the stack is left as is.
+        """
+        if not history.resolve(shapes):
+            return False
+        self._undo_stack = history.undo_commands
+        self._redo_stack = history.redo_commands
+        self._size = sum(command.size_estimate() for command in history.commands())
+        self._trim()
+        self._notify_callbacks()
+        return True
 
     def add_callback(self, callback):
         """Register a callback to be notified when stack changes.
@@ -326,3 +689,79 @@ class UndoStack:
     def __len__(self):
         """Return number of commands in undo stack."""
         return len(self._undo_stack)
+
+
+class UndoHistoryStore:
+    """Histories of the images that are not open, keyed by file path.
+
+    The least recently parked histories are dropped once the store
+    exceeds its memory budget.
+    """
+
+    def __init__(self, memory_budget=PARKED_HISTORY_BUDGET):
+        """Initialize the store.
+
+        Args:
+            memory_budget: Approximate memory all parked histories may use,
+                in bytes.
+        """
+        self._histories = OrderedDict()
+        self._memory_budget = memory_budget
+        self._size = 0
+
+    def park(self, key, undo_stack, shapes):
+        """Move the history of an image out of ``undo_stack`` into the store.
+
+        Args:
+            key: The image file path.
+            undo_stack: The UndoStack holding the image history.
+            shapes: The shapes of the image, in canvas order.
+        """
+        self.discard(key)
+        history = undo_stack.detach(shapes)
+        if history is None:
+            return
+        size = history.size_estimate()
+        self._histories[key] = (history, size)
+        self._size += size
+        while self._size > self._memory_budget and self._histories:
+            _, (_, dropped_size) = self._histories.popitem(last=False)
+            self._size -= dropped_size
+
+    def restore(self, key, undo_stack, shapes):
+        """Move the parked history of an image back into ``undo_stack``.
+
+        Args:
+            key: The image file path.
+            undo_stack: The (empty) UndoStack to restore into.
+            shapes: The shapes of the reloaded image, in canvas order.
+
+        Returns:
+            True if a history was restored.
+        """
+        entry = self._histories.pop(key, None)
+        if entry is None:
+            return False
+        history, size = entry
+        self._size -= size
+        return undo_stack.attach(history, shapes)
+
+    def discard(self, key):
+        """Forget the parked history of an image, if any."""
+        entry = self._histories.pop(key, None)
+        if entry is not None:
+            self._size -= entry[1]
+
+    def clear(self):
+        self._histories.clear()
+        self._size = 0
+
+    def size_estimate(self):
+        """Return the approximate memory held by the parked histories, in bytes."""
+        return self._size
+
+    def __contains__(self, key):
+        return key in self._histories
+
+    def __len__(self):
+        return len(self._histories)
@@ -23,4 +23,23 @@ SETTING_FILE_VIEW_MODE = 'fileViewMode'
 SETTING_GALLERY_MODE = 'galleryMode'
 SETTING_ICON_SIZE = 'iconSize'
 SETTING_TOOLBAR_EXPANDED = 'toolbarExpanded'
+SETTING_TILED_VIEW = 'tiledView'
+SETTING_DISPLAY_RESOLUTION = 'displayResolution'
+SETTING_DATASET_ZOOM = 'datasetZoom'
+SETTING_LOD_VERTEX_MIN_SIZE = 'lodVertexMinSize'
+SETTING_LOD_LABEL_MIN_SIZE = 'lodLabelMinSize'
+SETTING_LOD_TINY_MAX_SIZE = 'lodTinyMaxSize'
+SETTING_CANVAS_BACKEND = 'canvasBackend'
+# Keys of the per-folder settings, see Settings.dataset()
+DATASET_ZOOM = 'zoom'
+DATASET_LAST_IMAGE = 'lastImage'
+DATASET_THUMBNAIL_SIZE = 'thumbnailSize'
+DATASET_INDEX = 'index'
+DATASET_ZOOM_MODE = 'zoomMode'
+DATASET_ZOOM_VALUE = 'zoomValue'
+DATASET_SCROLL = 'scroll'
+DATASET_FILE_LIST_ROW = 'fileListRow'
+DATASET_GALLERY_ROW = 'galleryRow'
 DEFAULT_ENCODING = 'utf-8'
+# Folder inside an image folder that trashed images are moved to; never scanned
+TRASH_DIR_NAME = '.labelImgTrash'
@@ -0,0 +1,158 @@
+# libs/displayPolicy.py
+"""Display resolution policy for decoding large images.
+
+Chooses how far an image is downsampled when it is loaded, based on the
+screen, the memory available and the zoom the user last worked at for
+the dataset, instead of a fixed 2048px cap.
+"""
+
+try:
+    from PyQt5.QtGui import QImage, QImageReader
+    from PyQt5.QtCore import Qt, QSize, QObject, pyqtSignal, QRunnable
+except ImportError:
+    from PyQt4.QtGui import QImage, QImageReader
+    from PyQt4.QtCore import Qt, QSize, QObject, pyqtSignal, QRunnable
+
+import os
+
+DISPLAY_RESOLUTION_AUTO = 0
+DISPLAY_RESOLUTION_FULL = -1
+LEGACY_MAX_DISPLAY_DIM = 2048
+
+MIN_AUTO_DIM = 1024
+# Share of the available memory a single decoded image may use.
+MEMORY_SHARE = 0.125
+BYTES_PER_PIXEL = 4
+
+
+def available_memory():
+    """Return the available physical memory in bytes, or None if unknown."""
+    try:
+        with open('/proc/meminfo') as f:
+            for line in f:
+                if line.startswith('MemAvailable:'):
+                    return int(line.split()[1]) * 1024
+    except (IOError, OSError, ValueError, IndexError):
+        pass
+    try:
+        return os.sysconf('SC_AVPHYS_PAGES') * os.sysconf('SC_PAGE_SIZE')
+    except (AttributeError, ValueError, OSError):
+        return None
+
+
+def scale_factor(original_size, scaled_size):
+    """Display size / original size, measured on the longer side.
+
+    The shorter side is rounded when scaling with KeepAspectRatio, so the
+    longer side gives the more accurate factor.
+    """
+    if original_size.width() >= original_size.height():
+        return scaled_size.width() / original_size.width()
+    return scaled_size.height() / original_size.height()
+
+
+class DisplayPolicy(object):
+    """Decide the decode size of an image.
+
+    ``max_dim`` is the user setting: DISPLAY_RESOLUTION_AUTO, a fixed cap
+    in pixels, or DISPLAY_RESOLUTION_FULL for no downsampling at all.
+    """
+
+    def __init__(self, max_dim=DISPLAY_RESOLUTION_AUTO, screen_size=None,
+                 device_pixel_ratio=1.0, memory=None):
+        self.max_dim = max_dim
+        self.screen_size = screen_size
+        self.device_pixel_ratio = device_pixel_ratio
+        self.memory = memory
+
+    def memory_limit_dim(self, original_size):
+        """Longest side allowed by the memory budget, or None for no limit."""
+        if not self.memory:
+            return None
+        max_pixels = self.memory * MEMORY_SHARE / BYTES_PER_PIXEL
+        longest = max(original_size.width(), original_size.height())
+        shortest = max(1, min(original_size.width(), original_size.height()))
+        return int((max_pixels * longest / shortest) ** 0.5)
+
+    def target_dim(self, original_size, native_scale=None):
+        """Longest side the image should be decoded at.
+
+        ``native_scale`` is the screen pixels per original pixel the user
+        last worked at in this dataset; decoding at least that finely means
+        the usual zoom level shows real detail without a re-decode.
+        """
+        longest = max(original_size.width(), original_size.height())
+        if self.max_dim == DISPLAY_RESOLUTION_FULL:
+            return longest
+        if self.max_dim and self.max_dim > 0:
+            return min(longest, self.max_dim)
+
+        screen_dim = LEGACY_MAX_DISPLAY_DIM
+        if self.screen_size is not None and self.screen_size.isValid():
+            screen_dim = max(self.screen_size.width(), self.screen_size.height())
+            screen_dim = int(screen_dim * self.device_pixel_ratio)
+        target = max(MIN_AUTO_DIM, screen_dim)
+        if native_scale:
+            target = max(target, int(longest * min(native_scale * self.device_pixel_ratio, 1.0)))
+        memory_dim = self.memory_limit_dim(original_size)
+        if memory_dim is not None:
+            target = min(target, max(MIN_AUTO_DIM, memory_dim))
+        return min(longest, target)
+
+    def decode_size(self, original_size, native_scale=None):
+        """Size to decode ``original_size`` at (never larger than the original)."""
+        dim = self.target_dim(original_size, native_scale)
+        if original_size.width() > dim or original_size.height() > dim:
+            return original_size.scaled(dim, dim, Qt.KeepAspectRatio)
+        return QSize(original_size)
+
+    def upgrade_size(self, original_size, current_size, native_scale):
+        """Size to re-decode at once the user zoomed past the decoded resolution.
+
+        ``native_scale`` is the current zoom in screen pixels per original
+        pixel. Returns None when the current decode is already fine enough,
+        the memory budget does not allow anything larger, or the user picked
+        a fixed resolution.
+        """
+        if self.max_dim != DISPLAY_RESOLUTION_AUTO:
+            return None
+        longest = max(original_size.width(), original_size.height())
+        current_dim = max(current_size.width(), current_size.height())
+        needed = int(longest * native_scale * self.device_pixel_ratio)
+        if current_dim >= longest or needed <= current_dim:
+            return None
+        # Overshoot a little so each zoom step does not trigger a decode.
+        wanted = min(longest, int(needed * 1.5))
+        memory_dim = self.memory_limit_dim(original_size)
+        if memory_dim is not None:
+            wanted = min(wanted, memory_dim)
+        if wanted <= current_dim:
+            return None
+        return original_size.scaled(wanted, wanted, Qt.KeepAspectRatio)
+
+
+class ImageDecodeSignals(QObject):
+    """Signals for background re-decoding."""
+    decoded = pyqtSignal(str, QImage)  # path, image
+
+
+class ImageDecodeWorker(QRunnable):
+    """Worker decoding an image at a given size in a background thread."""
+
+    def __init__(self, path, scaled_size):
+        super().__init__()
+        self.path = path
+        self.scaled_size = scaled_size
+        self.signals = ImageDecodeSignals()
+
+    def run(self):
+        """Decode the image and hand it back to the GUI thread."""
+        try:
+            reader = QImageReader(self.path)
+            reader.setAutoTransform(True)
+            reader.setScaledSize(self.scaled_size)
+            image = reader.read()
+            if not image.isNull():
+                self.signals.decoded.emit(self.path, image)
+        except Exception:
+            pass
@@ -0,0 +1,214 @@
+# libs/folderWatcher.py
+"""Watching the open image folder and the annotation folder for changes.
+
+Other people or pre-labelling jobs may add images or write annotations
+into a shared folder while it is open. FolderWatcher notices this with a
+QFileSystemWatcher on every watched directory, or by polling where the
+platform cannot watch a directory. Change notifications only mark a
+directory; after a short quiet period each marked directory is listed
+once and compared with its previous listing, and the differences are
+reported as added images, removed images and changed annotation files.
+"""
+
+import os
+
+try:
+    from PyQt5.QtCore import QObject, QTimer, QFileSystemWatcher, pyqtSignal
+except ImportError:
+    from PyQt4.QtCore import QObject, QTimer, QFileSystemWatcher, pyqtSignal
+
+from libs.constants import TRASH_DIR_NAME
+from libs.create_ml_io import JSON_EXT
+from libs.pascal_voc_io import XML_EXT
+from libs.yolo_io import TXT_EXT
+
+ANNOTATION_EXTENSIONS = (XML_EXT, TXT_EXT, JSON_EXT)
+
+
+class DirectoryListing(object):
+    """What FolderWatcher last saw in one directory."""
+
+    def __init__(self, images=(), annotations=None, subdirs=()):
+        self.images = set(images)  # Image file names
+        self.annotations = dict(annotations or {})  # Annotation file name -> (mtime_ns, size)
+        self.subdirs = set(subdirs)  # Subdirectory names
+
+
+def list_directory(path, image_extensions, with_images=True, with_annotations=True):
+    """List ``path`` into a DirectoryListing; None if it cannot be read.
+
+    Only annotation files are stat()ed, images are known by name alone.
+    """
+    images, annotations, subdirs = [], {}, []
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                name = entry.name
+                if entry.is_dir():
+                    if name != TRASH_DIR_NAME:
+                        subdirs.append(name)
+                    continue
+                lower = name.lower()
+                if with_images and lower.endswith(image_extensions):
+                    images.append(name)
+                elif with_annotations and lower.endswith(ANNOTATION_EXTENSIONS):
+                    try:
+                        stat = entry.stat()
+                    except OSError:
+                        continue
+                    annotations[name] = (stat.st_mtime_ns, stat.st_size)
+    except OSError:
+        return None
+    return DirectoryListing(images, annotations, subdirs)
+
+
+class FolderWatcher(QObject):
+    """Report images added to or removed from an image folder tree and
+    annotation files changed in it or in the save folder.
+
+    Paths in the signals are absolute. Events arriving within ``delay`` ms
+    of each other are handled together.
+    """
+
+    images_added = pyqtSignal(list)
+    images_removed = pyqtSignal(list)
+    annotations_changed = pyqtSignal(list)
+
+    DEFAULT_DELAY = 500
+    DEFAULT_POLL_INTERVAL = 3000
+
+    def __init__(self, image_extensions, delay=DEFAULT_DELAY, poll_interval=DEFAULT_POLL_INTERVAL,
+                 use_polling=False, parent=None):
+        super(FolderWatcher, self).__init__(parent)
+        self.image_extensions = tuple(ext.lower() for ext in image_extensions)
+        self.use_polling = use_polling
+        self.image_dir = None
+        self.save_dir = None
+        self._listings = {}  # Directory -> DirectoryListing
+        self._polled = set()  # Directories the system watcher could not take
+        self._changed = set()  # Directories to list again when the delay is over
+
+        self._watcher = QFileSystemWatcher(self)
+        self._watcher.directoryChanged.connect(self._directory_changed)
+        self._delay_timer = QTimer(self)
+        self._delay_timer.setSingleShot(True)
+        self._delay_timer.setInterval(delay)
+        self._delay_timer.timeout.connect(self.flush)
+        self._poll_timer = QTimer(self)
+        self._poll_timer.setInterval(poll_interval)
+        self._poll_timer.timeout.connect(self.poll)
+
+    def watch(self, image_dir, save_dir=None):
+        """Watch the tree under ``image_dir`` and the folder ``save_dir``, dropping earlier folders."""
+        self.stop()
+        self.image_dir = os.path.abspath(image_dir) if image_dir else None
+        self.save_dir = os.path.abspath(save_dir) if save_dir else None
+        if self.image_dir:
+            self._add_tree(self.image_dir)
+        if self.save_dir and self.save_dir not in self._listings:
+            self._add_directory(self.save_dir)
+
+    def stop(self):
+        """Stop watching; pending changes are dropped."""
+        directories = self._watcher.directories()
+        if directories:
+            self._watcher.removePaths(directories)
+        self._listings.clear()
+        self._polled.clear()
+        self._changed.clear()
+        self._delay_timer.stop()
+        self._poll_timer.stop()
+
+    def watched_directories(self):
+        return sorted(self._listings)
+
+    def is_polling(self):
+        return bool(self._polled)
+
+    def _in_image_tree(self, directory):
+        return self.image_dir is not None and (directory == self.image_dir or
+                                               directory.startswith(self.image_dir + os.sep))
+
+    def _list(self, directory):
+        with_images = self._in_image_tree(directory)
+        return list_directory(directory, self.image_extensions, with_images=with_images)
+
+    def _add_directory(self, directory):
+        listing = self._list(directory)
+        if listing is None:
+            return None
+        self._listings[directory] = listing
+        if self.use_polling or not self._watcher.addPath(directory):
+            self._polled.add(directory)
+            if not self._poll_timer.isActive():
+                self._poll_timer.start()
+        return listing
+
+    def _add_tree(self, root):
+        """Watch ``root`` and its subdirectories; return the images found in them."""
+        images = []
+        stack = [root]
+        while stack:
+            directory = stack.pop()
+            listing = self._add_directory(directory)
+            if listing is None:
+                continue
+            images.extend(os.path.join(directory, name) for name in listing.images)
+            stack.extend(os.path.join(directory, name) for name in listing.subdirs)
+        return images
+
+    def _remove_tree(self, root):
+        """Stop watching ``root`` and its subdirectories; return the images they held."""
+        images = []
+        prefix = root + os.sep
+        for directory in [d for d in self._listings if d == root or d.startswith(prefix)]:
+            listing = self._listings.pop(directory)
+            images.extend(os.path.join(directory, name) for name in listing.images)
+            if directory in self._polled:
+                self._polled.discard(directory)
+            else:
+                self._watcher.removePath(directory)
+            self._changed.discard(directory)
+        return images
+
+    def _directory_changed(self, directory):
+        self._changed.add(directory)
+        self._delay_timer.start()  # Restarted by every event, so a burst is handled once
+
+    def poll(self):
+        """List the directories that are polled instead of watched now."""
+        if self._polled:
+            self._changed.update(self._polled)
+            self.flush()
+
+    def flush(self):
+        """List the changed directories now and emit the differences."""
+        self._delay_timer.stop()
+        added, removed, annotations = [], [], []
+        changed, self._changed = self._changed, set()
+        for directory in sorted(changed):
+            old = self._listings.get(directory)
+            if old is None:
+                continue
+            new = self._list(directory)
+            if new is None:  # The directory itself is gone
+                removed.extend(self._remove_tree(directory))
+                continue
+            self._listings[directory] = new
+            added.extend(os.path.join(directory, name) for name in new.images - old.images)
+            removed.extend(os.path.join(directory, name) for name in old.images - new.images)
+            annotations.extend(os.path.join(directory, name) for name, stamp in new.annotations.items()
+                               if old.annotations.get(name) != stamp)
+            annotations.extend(os.path.join(directory, name) for name in old.annotations
+                               if name not in new.annotations)
+            if self._in_image_tree(directory):
+                for name in new.subdirs - old.subdirs:
+                    added.extend(self._add_tree(os.path.join(directory, name)))
+                for name in old.subdirs - new.subdirs:
+                    removed.extend(self._remove_tree(os.path.join(directory, name)))
+        if removed:
+            self.images_removed.emit(removed)
+        if added:
+            self.images_added.emit(added)
+        if annotations:
+            self.annotations_changed.emit(annotations)
@@ -3,17 +3,16 @@
 
 try:
     from PyQt5.QtGui import QPixmap, QImage, QPainter, QColor, QPen, QImageReader, QIcon, QBrush, QPolygonF
-    from PyQt5.QtCore import Qt, QSize, QObject, pyqtSignal, QRunnable, QThreadPool, QTimer, QPointF
+    from PyQt5.QtCore import Qt, QSize, QObject, pyqtSignal, QRunnable, QThreadPool, QTimer, QPoint, QPointF
     from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QListWidget, QListWidgetItem,
                                   QListView, QSlider, QLabel, QPushButton, QFrame)
 except ImportError:
     from PyQt4.QtGui import (QPixmap, QImage, QPainter, QColor, QPen, QImageReader, QIcon, QBrush,
                               QWidget, QVBoxLayout, QHBoxLayout, QListWidget, QListWidgetItem,
                               QListView, QSlider, QLabel, QPolygonF)
-    from PyQt4.QtCore import Qt, QSize, QObject, pyqtSignal, QRunnable, QThreadPool, QPointF
+    from PyQt4.QtCore import Qt, QSize, QObject, pyqtSignal, QRunnable, QThreadPool, QPoint, QPointF
 
 import os
-import hashlib
 from collections import OrderedDict
 from enum import IntEnum
 try:
@@ -21,18 +20,12 @@ try:
 except ImportError:
     ElementTree = None
 
+from libs.labelColors import label_colors
+
 
 def generate_color_by_text(text):
-    """Generate a consistent color based on text hash."""
-    hash_val = int(hashlib.md5(text.encode('utf-8')).hexdigest()[:8], 16)
-    r = (hash_val & 0xFF0000) >> 16
-    g = (hash_val & 0x00FF00) >> 8
-    b = hash_val & 0x0000FF
-    # Ensure colors are bright enough
-    r = max(100, r)
-    g = max(100, g)
-    b = max(100, b)
-    return QColor(r, g, b)
+    """Opaque colour of a label, matching its colour on the canvas."""
+    return QColor(*label_colors.rgb(text))
 
 
 def parse_yolo_annotations(txt_path, classes_path=None):
@@ -193,6 +186,8 @@ class ThumbnailLoaderWorker(QRunnable):
         self.image_path = image_path
         self.size = size
         self.save_dir = save_dir
+        # Taken in the GUI thread; run() only reads this snapshot
+        self.label_colors = label_colors.snapshot()
         self.signals = ThumbnailLoaderSignals()
 
     def run(self):
@@ -257,7 +252,7 @@ class ThumbnailLoaderWorker(QRunnable):
             y2 = int((y_center + h / 2) * img_h)
 
             # Get color for this label
-            color = generate_color_by_text(label)
+            color = self.label_colors.color(label)
             pen = QPen(color)
             pen.setWidth(2)
             painter.setPen(pen)
@@ -443,6 +438,29 @@ class GalleryWidget(QWidget):
         self._loading_paths.clear()
         self._reload_all_thumbnails()
 
+    def icon_size(self):
+        """Current thumbnail size in pixels."""
+        return self._icon_size
+
+    def set_icon_size(self, size):
+        """Change the thumbnail size, moving the size slider if there is one."""
+        size = max(self.MIN_ICON_SIZE, min(self.MAX_ICON_SIZE, int(size)))
+        if size != self._icon_size:
+            self._set_preset_size(size)
+
+    def top_row(self):
+        """Row of the first visible thumbnail, 0 when the gallery is empty."""
+        spacing = self.list_widget.spacing()
+        index = self.list_widget.indexAt(QPoint(spacing + 1, spacing + 1))
+        return max(0, index.row())
+
+    def scroll_to_row(self, row):
+        """Scroll so that the thumbnail at ``row`` is the first visible one."""
+        item = self.list_widget.item(row)
+        if item is not None:
+            self.list_widget.scrollToItem(item, QListView.PositionAtTop)
+            QTimer.singleShot(0, self._load_visible_thumbnails)
+
     def _set_preset_size(self, size):
         """Set thumbnail size from preset button."""
         if hasattr(self, 'size_slider'):
@@ -471,8 +489,8 @@ class GalleryWidget(QWidget):
         # Defer thumbnail loading to next event loop cycle to prevent blocking
         QTimer.singleShot(0, self._load_visible_thumbnails)
 
-    def _add_item(self, image_path):
-        """Add an item to the list widget."""
+    def _add_item(self, image_path, row=None):
+        """Add an item to the list widget, at the end or at ``row``."""
         filename = os.path.basename(image_path)
         if len(filename) > 12:
             display_name = filename[:10] + "..."
@@ -495,7 +513,10 @@ class GalleryWidget(QWidget):
         # Store path in item's data
         item.setData(Qt.UserRole, image_path)
 
-        self.list_widget.addItem(item)
+        if row is None:
+            self.list_widget.addItem(item)
+        else:
+            self.list_widget.insertItem(row, item)
         self._path_to_item[image_path] = item
 
     def _on_scroll(self):
@@ -625,6 +646,46 @@ class GalleryWidget(QWidget):
         self._loading_paths.clear()
         self._statuses.clear()
 
+    def insert_image(self, row, image_path):
+        """Insert a thumbnail at ``row`` without rebuilding the gallery."""
+        if image_path in self._path_to_item:
+            return
+        self._image_list.insert(row, image_path)
+        self._add_item(image_path, row)
+        QTimer.singleShot(0, self._load_visible_thumbnails)
+
+    def set_images_hidden(self, image_paths, hidden):
+        """Hide or show the thumbnails of ``image_paths``, e.g. for a filter."""
+        for path in image_paths:
+            item = self._path_to_item.get(path)
+            if item is not None:
+                item.setHidden(hidden)
+        QTimer.singleShot(0, self._load_visible_thumbnails)
+
+    def invalidate_thumbnails(self, image_paths):
+        """Drop cached thumbnails, e.g. after their annotations changed; visible ones reload."""
+        for path in image_paths:
+            self.thumbnail_cache.remove(path)
+            self._loading_paths.discard(path)
+        QTimer.singleShot(0, self._load_visible_thumbnails)
+
+    def remove_images(self, image_paths):
+        """Remove the thumbnails of ``image_paths`` without rebuilding the gallery."""
+        removed = set()
+        for path in image_paths:
+            item = self._path_to_item.pop(path, None)
+            if item is None:
+                continue
+            self.list_widget.takeItem(self.list_widget.row(item))
+            self._statuses.pop(path, None)
+            self._loading_paths.discard(path)
+            self.thumbnail_cache.remove(path)
+            removed.add(path)
+        if removed:
+            self._image_list = [path for path in self._image_list if path not in removed]
+            # Thumbnails that moved into view still need loading
+            QTimer.singleShot(0, self._load_visible_thumbnails)
+
     def refresh_thumbnail(self, image_path):
         """Force reload of a specific thumbnail."""
         self.thumbnail_cache.remove(image_path)
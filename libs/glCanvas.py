@@ -0,0 +1,62 @@
+# libs/glCanvas.py
+"""OpenGL canvas backend.
+
+GLCanvas is the regular Canvas (same signals, editing and hit-testing)
+rendered into a QOpenGLWidget: QPainter then uses the OpenGL paint
+engine, which keeps the image as a cached texture and draws the shape
+paths as vertex arrays, so antialiasing and smooth pixmap scaling run
+on the GPU (or Mesa llvmpipe) instead of the CPU raster engine.
+"""
+
+try:
+    from PyQt5.QtGui import QOpenGLContext, QPainter
+    from PyQt5.QtWidgets import QOpenGLWidget
+except ImportError:
+    QOpenGLWidget = None
+
+from libs.canvas import Canvas
+
+CANVAS_BACKEND_RASTER = 'raster'
+CANVAS_BACKEND_OPENGL = 'opengl'
+
+_opengl_available = None
+
+
+def opengl_available():
+    """Check once whether an OpenGL context can be created on this platform."""
+    global _opengl_available
+    if _opengl_available is None:
+        if QOpenGLWidget is None:
+            _opengl_available = False
+        else:
+            context = QOpenGLContext()
+            _opengl_available = bool(context.create())
+    return _opengl_available
+
+
+if QOpenGLWidget is not None:
+    class GLCanvas(Canvas, QOpenGLWidget):
+        """Canvas painted through OpenGL; repaints always redraw the full frame."""
+
+        fills_background = True
+
+        def paintEvent(self, event):
+            # Let QOpenGLWidget bind its framebuffer and call paintGL
+            QOpenGLWidget.paintEvent(self, event)
+
+        def paintGL(self):
+            if not self.pixmap:
+                p = QPainter(self)
+                p.fillRect(self.rect(), self.palette().color(self.backgroundRole()))
+                p.end()
+                return
+            self.paint_scene(self.rect())
+else:
+    GLCanvas = None
+
+
+def create_canvas(backend=CANVAS_BACKEND_RASTER, *args, **kwargs):
+    """Create the canvas for ``backend``, falling back to raster without OpenGL."""
+    if backend == CANVAS_BACKEND_OPENGL and GLCanvas is not None and opengl_available():
+        return GLCanvas(*args, **kwargs)
+    return Canvas(*args, **kwargs)
@@ -0,0 +1,91 @@
+# libs/imageTrash.py
+"""Moving images (and their annotations) to a trash folder in the background."""
+
+import os
+import shutil
+
+try:
+    from PyQt5.QtCore import QObject, pyqtSignal, QRunnable
+except ImportError:
+    from PyQt4.QtCore import QObject, pyqtSignal, QRunnable
+
+from libs.constants import TRASH_DIR_NAME
+from libs.create_ml_io import JSON_EXT
+from libs.pascal_voc_io import XML_EXT
+from libs.yolo_io import TXT_EXT
+
+ANNOTATION_EXTENSIONS = (XML_EXT, TXT_EXT, JSON_EXT)
+
+
+def trash_dir_for(folder):
+    """The trash folder of the image folder ``folder``."""
+    return os.path.join(folder, TRASH_DIR_NAME)
+
+
+def free_path(directory, name):
+    """Path for ``name`` in ``directory`` that does not exist yet, e.g. 'img (2).jpg'."""
+    stem, ext = os.path.splitext(name)
+    path = os.path.join(directory, name)
+    counter = 1
+    while os.path.exists(path):
+        counter += 1
+        path = os.path.join(directory, '%s (%d)%s' % (stem, counter, ext))
+    return path
+
+
+def annotation_files(image_path, save_dir=None):
+    """Existing annotation files of ``image_path``, next to it or in ``save_dir``."""
+    stem = os.path.splitext(os.path.basename(image_path))[0]
+    folders = [os.path.dirname(image_path)]
+    if save_dir and os.path.abspath(save_dir) != os.path.abspath(folders[0]):
+        folders.append(save_dir)
+    return [os.path.join(folder, stem + ext) for folder in folders for ext in ANNOTATION_EXTENSIONS
+            if os.path.isfile(os.path.join(folder, stem + ext))]
+
+
+def move_to_trash(image_path, trash_dir, save_dir=None):
+    """Move an image and its annotation files into ``trash_dir``.
+
+    Returns the new path of the image. Names already taken in the trash get
+    a counter, and the annotations are renamed to match their image.
+    """
+    if not os.path.isdir(trash_dir):
+        os.makedirs(trash_dir)
+    annotations = annotation_files(image_path, save_dir)
+    target = free_path(trash_dir, os.path.basename(image_path))
+    shutil.move(image_path, target)
+    target_stem = os.path.splitext(target)[0]
+    for annotation in annotations:
+        shutil.move(annotation, free_path(trash_dir, os.path.basename(target_stem) +
+                                          os.path.splitext(annotation)[1]))
+    return target
+
+
+class TrashSignals(QObject):
+    """Signals of a TrashWorker, delivered on the GUI thread."""
+    moved = pyqtSignal(str, str)  # image path, path in the trash
+    failed = pyqtSignal(str, str)  # image path, error message
+    finished = pyqtSignal(int)  # number of images moved
+
+
+class TrashWorker(QRunnable):
+    """Move a batch of images to the trash folder in a background thread."""
+
+    def __init__(self, image_paths, trash_dir, save_dir=None):
+        super(TrashWorker, self).__init__()
+        self.image_paths = list(image_paths)
+        self.trash_dir = trash_dir
+        self.save_dir = save_dir
+        self.signals = TrashSignals()
+
+    def run(self):
+        moved = 0
+        for path in self.image_paths:
+            try:
+                target = move_to_trash(path, self.trash_dir, self.save_dir)
+            except (IOError, OSError) as e:
+                self.signals.failed.emit(path, str(e))
+            else:
+                moved += 1
+                self.signals.moved.emit(path, target)
+        self.signals.finished.emit(moved)
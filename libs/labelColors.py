@@ -0,0 +1,154 @@
+# libs/labelColors.py
+"""Shared registry of label colours.
+
+Every label gets its colour from a hash of its text, unless the user
+palette file assigns one. The canvas, the label list and the gallery
+thumbnails all read it from here, so a label looks the same everywhere
+and the hash is computed once per label instead of once per box.
+"""
+
+try:
+    from PyQt5.QtGui import QColor, QBrush
+except ImportError:
+    from PyQt4.QtGui import QColor, QBrush
+
+import codecs
+import hashlib
+import threading
+from collections import OrderedDict
+
+# Optional palette next to the predefined classes file. One label per line
+# followed by a colour name (#RRGGBB, or any name QColor accepts):
+#   person #ff0000
+#   traffic light #00ff00
+PALETTE_FILE_NAME = 'label_colors.txt'
+
+# Alpha of label colours on the canvas and in the label list.
+LABEL_ALPHA = 100
+# Labels whose colours are memoized; datasets rarely have more classes.
+MAX_CACHED_LABELS = 4096
+
+
+def hashed_rgb(label):
+    """Colour components derived from the label text."""
+    hash_code = int(hashlib.sha256(label.encode('utf-8')).hexdigest(), 16)
+    r = int((hash_code / 255) % 255)
+    g = int((hash_code / 65025) % 255)
+    b = int((hash_code / 16581375) % 255)
+    return r, g, b
+
+
+def read_palette(path):
+    """Read a palette file into a {label: (r, g, b)} dict.
+
+    Blank lines, comments (starting with '#' and no colour after them) and
+    lines with an invalid colour are skipped.
+    """
+    palette = {}
+    with codecs.open(path, 'r', 'utf8') as f:
+        for line in f:
+            parts = line.strip().rsplit(None, 1)
+            if len(parts) != 2:
+                continue
+            label, name = parts
+            color = QColor(name)
+            if label.startswith('#') or not color.isValid():
+                continue
+            palette[label] = (color.red(), color.green(), color.blue())
+    return palette
+
+
+class LabelColorSnapshot(object):
+    """Frozen view of the registry for worker threads.
+
+    Taken in the GUI thread and handed to a worker; it memoizes privately,
+    so the worker never touches the shared registry.
+    """
+
+    def __init__(self, palette):
+        self._palette = palette
+        self._rgb = {}
+
+    def rgb(self, label):
+        rgb = self._rgb.get(label)
+        if rgb is None:
+            rgb = self._palette.get(label) or hashed_rgb(label)
+            self._rgb[label] = rgb
+        return rgb
+
+    def color(self, label, alpha=255):
+        return QColor(*self.rgb(label), alpha)
+
+
+class LabelColors(object):
+    """Memoized label colours and brushes.
+
+    ``color()`` and ``brush()`` return shared objects that callers must not
+    modify. They are meant for the GUI thread; other threads use
+    ``snapshot()``.
+    """
+
+    def __init__(self, max_size=MAX_CACHED_LABELS):
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._palette = {}
+        self._colors = OrderedDict()  # (label, alpha) -> QColor
+        self._brushes = OrderedDict()  # label -> QBrush
+
+    def load_palette(self, path):
+        """Use the colours of a palette file; returns the number of labels it sets."""
+        palette = read_palette(path)
+        self.set_palette(palette)
+        return len(palette)
+
+    def set_palette(self, palette):
+        """Replace the user palette ({label: (r, g, b)})."""
+        with self._lock:
+            self._palette = dict(palette)
+            self._colors.clear()
+            self._brushes.clear()
+
+    def rgb(self, label):
+        """Colour components of ``label``; safe to call from any thread."""
+        with self._lock:
+            rgb = self._palette.get(label)
+        return rgb or hashed_rgb(label)
+
+    def color(self, label, alpha=LABEL_ALPHA):
+        """Colour of ``label``."""
+        key = (label, alpha)
+        color = self._colors.get(key)
+        if color is None:
+            color = QColor(*self.rgb(label), alpha)
+            self._colors[key] = color
+            if len(self._colors) > self.max_size:
+                self._colors.popitem(last=False)
+        else:
+            self._colors.move_to_end(key)
+        return color
+
+    def brush(self, label):
+        """Brush for the label list item background of ``label``."""
+        brush = self._brushes.get(label)
+        if brush is None:
+            brush = QBrush(self.color(label))
+            self._brushes[label] = brush
+            if len(self._brushes) > self.max_size:
+                self._brushes.popitem(last=False)
+        else:
+            self._brushes.move_to_end(label)
+        return brush
+
+    def snapshot(self):
+        """Thread-safe copy of the registry for a worker."""
+        with self._lock:
+            return LabelColorSnapshot(dict(self._palette))
+
+    def clear(self):
+        """Drop the memoized colours (the palette is kept)."""
+        with self._lock:
+            self._colors.clear()
+            self._brushes.clear()
+
+
+label_colors = LabelColors()
@@ -3,7 +3,6 @@
 import sys
 from xml.etree import ElementTree
 from xml.etree.ElementTree import Element, SubElement
-from lxml import etree
 import codecs
 from libs.constants import DEFAULT_ENCODING
 from libs.ustr import ustr
@@ -27,6 +26,8 @@ class PascalVocWriter:
         """
             Return a pretty-printed XML string for the Element.
         """
+        # lxml is only needed when writing or reading files; keep it out of startup
+        from lxml import etree
         rough_string = ElementTree.tostring(elem, 'utf8')
         root = etree.fromstring(rough_string)
         return etree.tostring(root, pretty_print=True, encoding=ENCODE_METHOD).replace("  ".encode(), "\t".encode())
@@ -154,6 +155,7 @@ class PascalVocReader:
 
     def parse_xml(self):
         assert self.file_path.endswith(XML_EXT), "Unsupported file format"
+        from lxml import etree
         parser = etree.XMLParser(encoding=ENCODE_METHOD)
         xml_tree = ElementTree.parse(self.file_path, parser=parser).getroot()
         filename = xml_tree.find('filename').text
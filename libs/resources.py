@@ -0,0 +1,4312 @@
+# -*- coding: utf-8 -*-
+
+# Resource object code
+#
+# Created by: The Resource Compiler for PyQt5 (Qt v5.15.14)
+#
+# WARNING! All changes made in this file will be lost!
+
+from PyQt5 import QtCore
+
+qt_resource_data = b"\
+\x00\x00\x7a\x93\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x01\x00\x00\x00\x01\x00\x08\x06\x00\x00\x00\x5c\x72\xa8\x66\
+\x00\x00\x00\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\
+\x00\x00\x00\x20\x63\x48\x52\x4d\x00\x00\x7a\x26\x00\x00\x80\x84\
+\x00\x00\xfa\x00\x00\x00\x80\xe8\x00\x00\x75\x30\x00\x00\xea\x60\
+\x00\x00\x3a\x98\x00\x00\x17\x70\x9c\xba\x51\x3c\x00\x00\x00\x09\
+\x70\x48\x59\x73\x00\x00\x0b\x13\x00\x00\x0b\x13\x01\x00\x9a\x9c\
+\x18\x00\x00\x40\x00\x49\x44\x41\x54\x78\x01\xec\xbd\x67\x90\x24\
+\x49\x76\x26\xe6\x21\x53\x67\x96\x16\xad\x75\xcf\xf4\xc8\x55\xb3\
+\x6a\x76\x56\x00\xbb\xc0\x01\x38\x80\x00\x81\x23\x70\x86\x33\x10\
+\x76\x76\x24\x8f\x3f\x48\xf0\xf7\x99\xd1\xc8\xff\xa4\x91\x3f\x8e\
+\x24\x8c\x66\x34\xa3\x1d\xcd\x08\x9c\xf1\x40\x10\xb7\x10\xe4\x6a\
+\x2c\x76\x31\xbb\x98\xd5\x33\xdb\xd3\xd3\x33\xad\x55\xe9\xaa\xd4\
+\x19\x9a\xdf\xe7\x91\x91\x95\x55\x95\x11\x59\x5d\x5d\xd5\x55\xd5\
+\x15\x5e\xe5\x19\xc2\xf5\x0b\x7f\xcf\x9f\x3f\x7f\xfe\x5c\x11\x4f\
+\xe0\x82\x20\x50\x91\xbc\x04\x7f\x09\xfe\x33\xf0\x27\xe0\x5f\x83\
+\x9f\x81\xcf\x77\xaf\x0a\xae\xa9\x4b\x21\x70\x18\x21\xe0\xa0\xd2\
+\x4b\xf0\xf3\xf0\x0b\xf0\xdf\x83\xff\x4e\xf7\xf9\x1a\xae\x8e\xa2\
+\x28\x01\xae\x87\xd6\xe9\x8f\x5b\x73\x20\x3d\x11\xba\x08\x4f\xa4\
+\xbf\x02\x7f\x0c\xfe\x3c\xfc\x29\xf8\x32\xfc\x71\x78\x86\x1b\xf0\
+\x29\xf2\x03\x08\xa9\x3b\xb4\x10\xe0\x00\xc7\xbe\xcc\x7e\xcc\x81\
+\x2e\x03\x7f\x16\x7e\x0d\xfe\x36\xfc\xbb\xc0\x87\x07\xb8\x1e\x5a\
+\x62\xf0\x58\x08\x8a\xc6\x6a\x68\x6c\x01\x9e\x48\xff\xcb\xf0\xbf\
+\x0e\x1f\x21\x3f\x6e\x53\x97\x42\xe0\x48\x40\xc0\x42\x2b\xc9\x15\
+\xfc\x35\xfc\x8f\xe0\xff\x12\x9e\x44\x81\x1c\x81\x8b\xeb\xa1\x71\
+\xdb\x22\x00\x7d\xa3\x3e\x91\xfd\x5f\xc1\x9f\x84\xbf\x00\x4f\x62\
+\x40\x2e\xe2\xb1\x39\x09\xa4\x49\x5d\x0a\x81\xc3\x0a\x01\xb2\xfd\
+\x1e\x7c\x0b\x9e\x88\xff\x1e\xfc\xff\x01\x7f\x1d\x9e\x04\xc1\x3d\
+\x2c\x53\x83\xa1\x88\x0b\xe4\x67\x1c\xb2\xfa\xa7\xe1\xff\x31\xfc\
+\xc7\xe0\x2b\xf0\x23\xf0\x3d\x17\x00\x24\xf0\x81\xe3\x07\xcd\x86\
+\xe5\x05\xae\x1f\x08\x5f\xf0\x3f\x75\x29\x04\x0e\x2b\x04\x14\xa1\
+\x01\x93\xf3\xa6\x50\x0d\x55\xd1\x32\xba\xca\x29\x00\xa7\x05\x1c\
+\x38\x89\x17\x9c\xf2\xe6\xe0\xb3\xf0\x36\xfc\xdd\xee\xf3\x3b\xc0\
+\x9b\x2a\x92\x52\x86\x70\xa0\x5d\x22\x01\x40\x23\xa2\x39\x10\x91\
+\xfe\x55\xf8\x7f\xb1\xb9\x35\x92\x14\x02\xd9\x3d\x20\xbf\xe7\x05\
+\x7e\xc3\xf6\x9b\xf3\x0d\xc7\x6f\x39\x41\x00\x12\xe9\x32\x3c\x75\
+\x29\x04\x0e\x27\x04\x02\xc5\x50\x55\x75\x26\xaf\x69\x59\x43\x33\
+\xca\xd9\xc0\x00\x42\xa8\x2a\xd0\x5f\xc3\x8f\x12\xf2\xcf\x94\x75\
+\x4d\xc1\xff\x2a\x7c\x15\x7e\x19\x7e\x05\xde\xed\x12\x81\x03\x8d\
+\x02\xb1\x53\x80\x2e\xf2\x93\xd5\xff\x67\xf0\x7f\x08\x3f\x0e\xcf\
+\x91\xbf\xe7\x30\xca\x5b\x35\xcb\xf7\xae\x2f\x76\xbc\xdb\x6b\x4e\
+\xbe\xe1\x78\x1a\x9f\x3d\x10\x84\xb0\xd5\x07\xba\xed\xbd\x76\xa4\
+\x37\x29\x04\x36\x43\x20\xea\xb9\x40\x73\xa1\x02\xd3\x0d\x4d\x15\
+\x79\x43\xd1\xce\x8d\x19\xcd\xb1\xac\x26\x9e\x9f\xcc\x09\x53\x13\
+\x59\x84\x45\x1c\x01\xb3\x20\xc7\x5b\x83\xff\xdf\xe0\xdf\x81\xff\
+\x73\xf8\x3a\x38\x81\x03\xcb\x09\x0f\xe4\x00\x80\xfc\x24\x0c\xa4\
+\x6a\xa7\xe0\x5f\x84\x9f\x86\xe7\x7c\x5f\x3a\xe2\xb7\x0d\x2e\x7f\
+\xb1\xe5\x8a\x95\x96\xab\xce\x35\xdc\x60\xa9\xed\x29\x1d\x27\x10\
+\x4d\xd7\xd7\x62\xa9\x4a\x94\x41\x7a\x4d\x21\x70\x68\x20\x80\xce\
+\x8e\xb9\xad\x0a\x1c\xb6\x5c\x4d\x2c\xd4\x3d\xd5\xf6\x94\xa0\x68\
+\x3a\xca\x44\x5e\xf3\x72\xba\x12\x64\x74\x45\x07\x92\xb3\x45\x24\
+\x06\x9c\x1a\x3f\xc7\x07\xb8\x1f\xc2\xdf\x44\xfa\xf6\x41\x25\x02\
+\x5b\x70\xb5\x3b\xf2\x73\x5e\xf3\x3b\xf0\x1f\x82\xff\x2f\xe0\x7b\
+\x0e\x73\xfc\xa0\xed\xf8\xee\xfd\xaa\x5d\xfb\xce\x9d\x56\x65\xb9\
+\xe5\xe9\xe0\xf6\x7b\xe1\xe9\x4d\x0a\x81\x67\x19\x02\xec\xea\x9c\
+\x02\x64\x75\x4d\xbc\x3c\x63\xd6\x4f\x96\x0d\x71\x6e\x34\x93\x37\
+\x35\x45\x93\x73\x83\xf5\xc6\x73\x3a\xf0\xc7\xf0\x14\x0e\xde\x05\
+\x01\xa8\xaf\x07\x1d\x9c\xbb\x0d\x04\xa0\x3b\xf2\x93\xed\x27\x05\
+\xfb\x1f\xe1\xb9\xdc\xd7\x63\xfb\x81\xfb\xe2\xfb\xf7\x5b\xd6\x62\
+\xd3\x55\xde\x5b\xb6\x74\xcb\xf5\x55\x5f\x32\x0b\x88\x95\xba\x14\
+\x02\x47\x05\x02\xc0\x1a\x22\x8e\xae\xaa\x7e\xc9\x50\x82\x0b\x13\
+\xa6\xfb\xea\x4c\xd6\x18\xcd\xea\x0a\x04\x85\x11\x4e\x91\xed\x27\
+\xd2\xff\xd7\xf0\xe4\x04\xe8\xed\x83\xc6\x09\x6c\x9e\x02\xf0\x99\
+\x48\xff\x32\x3c\xd9\xfe\x1e\xf2\x3b\x90\xf2\xad\x75\x5c\x1f\x6c\
+\xbf\xb2\xdc\x76\x95\x96\xed\x73\x6a\x04\x97\x8e\xfe\x84\x42\xea\
+\x8e\x10\x04\xd0\xe5\xd9\xeb\x2d\xc7\x53\x95\x40\x09\x16\x30\x20\
+\x2e\xb5\x80\x20\x20\x0b\x53\x05\x55\xe9\x92\x00\x4e\x07\x88\x3f\
+\xcf\xc3\x73\x85\xe0\xe7\xf0\xd4\x11\x38\x50\xf2\x80\x88\x5a\x71\
+\x9e\xc3\x7b\x56\xf8\x3f\x87\xff\x97\xf0\xb3\xf0\x1a\xbc\xe0\xc8\
+\xbf\xdc\x72\xfd\xef\xdc\x6d\x5a\xd7\x96\xac\x2c\xe6\xff\x5d\x01\
+\x28\x43\xf7\xc9\x1d\x42\xba\x73\x08\xab\xbc\x4f\x1f\xf7\xf0\x14\
+\xcb\x6f\xea\x01\xa5\x2f\x4e\x98\xf6\x64\x41\x0f\x3e\x7f\xa6\x68\
+\x9a\x58\x22\xe8\xf1\x01\x42\x34\x11\xe5\x2e\xfc\x6f\xc2\x3f\x00\
+\x07\xd0\xc0\xf5\xc0\xb8\x7e\x0e\x80\x6b\x9c\xff\x04\xfe\x0d\xf8\
+\x1e\xf2\x43\xa2\x1f\xdc\x5e\xb3\xeb\x0f\xab\xb6\x7a\x6d\xc1\x2a\
+\xd8\x5d\x9e\x3f\xed\xcc\x07\xe6\x1b\xa6\x15\x79\x6a\x10\x18\xdc\
+\xeb\xb1\x40\x20\x6e\xad\xd8\xe6\x7c\xdd\x09\xa6\x0a\x5a\xed\x3c\
+\x64\x02\x05\x43\xd3\x0c\x4d\xae\x10\xe4\xbb\xf8\xf4\x9f\xe2\xfa\
+\x55\x0c\xb4\xdf\x06\x11\x20\x51\x38\x10\xae\x9f\x00\x90\x65\xb9\
+\x08\x4f\xe9\xbf\x1c\xf9\x51\x59\xe1\x78\x3e\xd8\x7e\x5f\x59\xee\
+\xf8\x0a\x47\x7e\x39\xf9\xd9\xe5\xaa\x43\xd9\x02\xf3\x29\x68\x54\
+\x98\xba\xad\x61\x6f\x05\x00\x1a\x70\x29\x81\x74\x14\x57\x03\xc1\
+\x3d\x4e\x65\x97\x8b\x4e\xb3\x4b\x21\xf0\x18\x10\x18\x4c\x00\x98\
+\x01\xb9\x80\x0c\x3a\x6b\x4e\xd7\xd4\x3e\x1d\x01\x06\xb1\xef\x9a\
+\xf0\xdc\x3b\xf3\x3e\xfc\x55\xe0\x55\x07\x44\xc0\xc3\xfd\xbe\x3b\
+\x49\x00\xba\xec\x3f\x39\x00\xea\xf7\x93\x08\x48\x47\xfd\x1e\xe0\
+\x7e\xe3\x07\xf7\xeb\x65\xac\xef\x03\x0d\xe3\x01\x10\xa5\x79\xdc\
+\x2b\x05\x09\xa5\x8c\x1a\x8c\x64\x54\xff\xe2\x44\x66\x6d\xa2\xa0\
+\xdb\xe5\x8c\xe6\x67\x00\x45\xc8\x53\xcc\xa2\xa9\x72\x59\x25\xb3\
+\xff\x73\x8e\xc7\x6d\x59\x1a\xff\x08\x42\x80\xc8\x5e\x1a\xd0\x6e\
+\x72\x01\xbf\x04\x4f\x19\x00\x57\x07\xbe\x0c\x9c\x6b\x1d\x04\x22\
+\x10\x71\x00\xe7\x51\x29\x6a\xfa\x51\xd9\x87\x9a\x4d\x98\xf7\x43\
+\xa3\x01\x48\xff\xe3\x87\x6d\xa3\x05\x85\x46\x97\xa2\x8b\x5d\xc0\
+\x7f\x22\x72\x4e\x53\x83\xb1\x82\x66\xcf\x96\x0c\xeb\xec\x68\x46\
+\xcf\x9b\xaa\x91\x51\x15\xa3\x98\xd1\x47\x42\x0e\x40\x91\x1c\x00\
+\x00\x44\x80\x92\x03\x48\x5d\x0a\x81\xc3\x0e\x01\x72\xd5\xaf\xc3\
+\x73\x80\xfd\xe7\xf0\x1f\x80\x08\x5c\xc7\xf5\xcb\xf0\x4b\xf0\x6b\
+\xe8\xee\xc4\xb2\xa7\xea\x22\x02\x40\xb6\x9f\xd2\x4a\xea\x34\x73\
+\x2a\x40\xbd\x7e\x17\xeb\xfd\xe2\x7e\xdd\xd1\x6c\xcf\x53\x48\x10\
+\x76\xea\x88\xbf\x4c\x0e\x16\x29\xc8\xea\x6a\x30\x5d\x34\xfc\x19\
+\xf8\x59\xac\xa1\x9e\x1d\xd5\xa5\x96\x15\xa7\x01\x70\x60\x95\x52\
+\x6c\x27\x20\x52\xf7\xcc\x41\x80\x1d\x9b\x03\x2c\xfd\x05\xf8\xe3\
+\xf0\xb4\x9b\x41\x8e\xe0\x26\xfc\x5d\x10\x84\xbb\xb8\x3e\x55\x1b\
+\x03\x7a\x97\xfd\x3f\x8d\x82\x3f\x01\x4f\x02\x40\x17\x58\x9e\xdf\
+\x5c\xb3\x3c\xf5\xe6\x72\xbb\xb4\x1b\x23\x30\x94\x24\x82\xf1\xbc\
+\xea\x9c\xa9\x64\x9c\x37\xce\x95\x3c\x48\x4a\x31\xe8\xcb\xcd\x14\
+\x61\x89\xe9\x6f\x0a\x81\xa3\x03\x01\xca\x04\x2e\x77\xfd\x97\x70\
+\xa5\x8e\xc0\xdf\xc1\xff\x6b\xf8\x05\xf8\xa7\xb6\x89\x28\xe2\x00\
+\x48\x89\xa8\xf2\xcb\x8a\x41\xa0\x11\x88\xb9\x9a\x43\x85\x1f\xb0\
+\x2d\x18\xbb\x9f\x60\xf4\xd7\xe4\xa8\xaf\x04\x1f\x3f\x56\x6c\x4e\
+\x97\x0c\x73\xaa\xa8\xe7\x80\xfc\x5c\x73\x94\x9c\x06\xcb\x8b\x1c\
+\x88\x91\x6f\xbb\x41\xc7\x72\x45\xbb\xe1\xfa\xae\x0d\x2d\xcc\x8e\
+\x7d\x20\x64\x25\x51\x15\xd3\x6b\x0a\x81\x6d\x42\x20\xa0\x7e\xb0\
+\x1a\xca\xb3\x14\xb5\x94\xd5\x46\x31\x90\x52\xb6\xbd\x99\xc5\x25\
+\xce\xbd\x04\x7f\x02\x9e\x0a\x78\x7f\x01\x3c\xf8\x1b\x5c\x97\xe1\
+\x3d\x4c\x0b\x9e\x00\xfb\x90\xc3\x10\x47\x02\x40\x4f\x21\x05\x85\
+\x6d\x5d\xf6\x3f\x10\x35\x28\x3c\x63\x5b\xef\xe6\xca\x22\xca\xf6\
+\x9c\x4c\x88\x9f\xa2\xa1\xf9\x10\xe4\x05\xc7\x2a\xa6\x3f\x59\xd0\
+\x44\x05\x73\x80\xfe\x1c\xd0\x3a\x1f\x4a\x46\x0a\xb7\x0f\x63\x89\
+\x51\x74\xec\xc0\x07\xd2\x7b\xab\x8e\xef\x39\x9e\xf0\x5b\xa0\x02\
+\xa9\x4b\x21\x70\xd8\x20\xc0\x05\x40\x2c\x66\xe9\x18\xd0\x3c\x74\
+\x79\x15\x5b\x03\xb1\xd2\x85\x25\x2d\x78\x53\x57\xa8\x45\x47\x5d\
+\x01\xa2\x09\xf1\x81\xdb\x8a\x29\x3c\x24\x2e\xde\x82\xbf\x06\xdf\
+\xe9\x7a\x1a\x1f\xd9\x33\xc7\x02\x49\x79\x26\xe1\x59\x09\xe9\x7c\
+\x6c\x74\xbc\xbd\x6a\x4d\x72\xb3\xcf\x4e\xd1\x8f\xd3\x06\x20\x7f\
+\xf0\x4b\x17\x4b\x8d\x63\x25\xd3\xaf\xe4\xf4\x11\xbc\x62\x83\x23\
+\x07\x42\x27\x02\x10\x9a\xfa\x9d\x55\x4b\xdc\xaa\x3a\xe2\x83\x25\
+\xab\xdc\x76\x45\x11\xaa\x07\x34\xc3\x94\xba\x14\x02\xcf\x04\x04\
+\x88\x43\xe8\xeb\x02\x2b\x5c\xee\x89\xb2\xe6\xbc\x32\x95\xab\x8f\
+\xe6\xb5\x3c\xb8\x83\x3c\x08\x41\x34\x20\x12\x37\x28\x17\xf8\x2f\
+\xe1\xff\x10\xfe\x3f\x83\x7f\x0f\x48\xf2\x36\x68\xc5\x9e\xb1\xc1\
+\x24\x00\x64\xff\x7b\x08\xc7\xca\x52\xe0\xd7\xc4\xf0\xdb\x86\xe8\
+\xbf\x1f\x63\x11\xb4\x2d\x07\x4a\x17\xe4\xa0\x23\xfd\xc6\x99\x52\
+\x1d\xc8\x9f\x2b\x52\x35\xaa\x0f\xf9\x31\xda\x07\xf3\x4d\xc7\x79\
+\x50\x73\x9d\xeb\x4b\x56\xa1\x0e\x4e\x83\x02\x47\x94\x07\x61\xe3\
+\x4e\x4a\xdc\x56\xb5\xd2\x48\x29\x04\xf6\x05\x02\xb2\x47\xe3\x07\
+\xfd\x5c\xbb\xb1\xec\x6a\x0f\x6b\xae\x3e\x96\xd3\x02\x68\x0e\x3a\
+\x9f\x38\x51\x90\xbb\x09\x81\x33\x5c\x25\x60\x54\x12\x04\xe2\xe3\
+\x7f\x05\xff\x63\xf8\xff\x06\x44\x60\xcf\xa6\x03\x24\x00\x14\xfc\
+\xf1\xba\xc1\x41\xe9\x47\x38\x5c\xfb\x23\xe9\x7a\x0c\xc7\x16\x98\
+\x20\x00\x05\x5d\x85\x94\xdf\xf4\x0b\x40\x7e\x5d\x53\xa2\xfc\x03\
+\x6a\x4c\x37\x2c\x5f\x2c\x37\xfd\xe0\x11\x26\xfa\x0f\xaa\x0e\x76\
+\x13\x86\xea\xc6\x7d\x34\xe2\x31\x4a\x4c\xa3\xa6\x10\x38\xf8\x10\
+\x20\x5e\x70\xaa\x8b\x71\x55\x34\x6c\xcf\x80\x9c\xcb\xc5\xf4\xc0\
+\x5d\x1d\xf7\x82\x4a\x56\xf3\xf3\xa6\x42\xa5\x37\x12\x01\x3a\x5e\
+\x29\x0f\xe0\x34\xe0\x24\x3c\x57\x0a\x76\x69\x21\x1e\x39\xf5\xb9\
+\x08\x31\xfb\x5e\x85\x1c\xc0\x1a\x16\xff\x6b\x1d\xef\xb1\xa7\x00\
+\x94\xf6\xbf\x30\x93\x6b\x91\xed\x9f\x2e\xe8\x23\x50\x87\x64\xdb\
+\xe9\x02\x17\x36\x04\xd6\xda\x9e\xf7\xff\xdd\x6a\x64\x57\x9a\x6e\
+\xa6\x6a\x79\x19\x72\x1b\xa9\x4b\x21\x70\xa4\x20\x00\x8c\xa8\xdb\
+\x9e\x0e\x03\x3a\xfa\x9f\x5d\xab\x89\x17\x26\x32\x9d\x97\x27\x33\
+\xed\x89\x92\x81\xad\x44\x12\xf9\x89\x33\x9c\x92\x7f\x04\xfe\x7f\
+\x80\xff\xe7\xf0\xf7\xe1\x5b\xf0\xbb\xea\x06\x12\x00\x96\xe0\x83\
+\xde\xd0\xf7\xd0\x77\x48\xb1\x8c\x47\x9d\x68\xcc\x73\x14\x58\x4b\
+\xc9\x61\x9d\x5f\x60\xe4\x67\x43\xc0\xc1\x04\x30\xa6\x10\xd8\xef\
+\x2d\x59\xda\xd5\x25\xdb\x84\x2d\x01\x01\xbb\x02\x34\x23\xb6\xa3\
+\x29\xc6\x90\xaa\xa4\xc1\x29\x04\x0e\x34\x04\x88\x14\x74\x1c\xfb\
+\xea\x1d\x57\xbc\xb3\xe8\x9b\x0f\x6a\xb6\xfe\x85\xb3\xa5\x0e\x96\
+\xca\x8d\x9c\xa1\x82\x1f\x90\xb8\x43\xe1\xfc\x0b\xf0\xbf\x0b\xff\
+\x73\xe0\xd1\x97\xf1\x9a\x3b\x0b\x77\xcd\xc5\x12\x80\xc7\x2d\x81\
+\x8d\xd2\x80\xce\x23\x60\x67\x4a\xa6\xa6\x81\xf5\xef\x65\x11\x40\
+\x87\x18\x6c\x8f\xbf\x84\x65\xc5\xb9\xba\xa5\xc2\x8e\x80\x0c\x8b\
+\x00\xd1\x8b\x98\xde\xa4\x10\x38\x4a\x10\xe0\xd4\x17\xed\xad\x5b\
+\xbe\xda\xc1\xf6\xfa\xe5\x8e\xe7\xe7\xa1\x12\x9f\x35\x04\x25\x61\
+\x44\x0f\xca\x03\x68\x89\x8b\x4a\x7a\x5c\x0d\xa0\xde\xce\xae\x2a\
+\x0a\xc5\x12\x00\x08\xe8\x51\x5e\xf8\x8b\x9b\xa1\x0e\x94\x29\xc8\
+\x1a\x8a\xff\x8b\xe7\x47\x97\x47\x73\xda\x28\x12\x48\x95\x62\x8e\
+\xf4\x4d\xdb\x17\x7f\x7b\xa7\x11\x3c\xaa\xbb\x01\xd4\x8b\x87\xe6\
+\x95\x46\x48\x21\x70\x94\x20\x20\x39\x64\xa0\xfa\xb7\x6e\xd6\x4a\
+\x1f\x39\x56\x70\x3f\x7a\x2c\x67\x65\x4d\x25\xd3\x25\x02\xd4\x13\
+\xf8\xc7\xf0\xb4\xcf\xf1\x7f\xc2\x3f\x84\xdf\xb5\x55\x01\x52\x98\
+\xc1\x8e\xc2\x3f\x29\x00\x0c\x09\x41\xc8\xb0\x0c\xbe\x57\x40\x28\
+\x4a\x90\xfc\x8d\xe5\x75\xb5\x9c\x55\x0b\x98\x0a\xc8\xe1\x1f\xc9\
+\x83\x6a\xc7\xeb\xc0\x4a\x70\x67\xae\xee\x1a\xb0\x18\xac\x91\xae\
+\x30\x97\xd4\xa5\x10\x48\x21\x10\x42\x40\xe2\x03\x7e\x80\x1f\xca\
+\xfd\x9a\xad\xbc\xbb\x6c\x89\x0e\xec\x69\xf7\xc9\xc7\x72\x88\xc9\
+\xa5\xfa\x4f\xc0\x17\x40\x30\xd6\xd9\xeb\x30\x8b\x1d\xff\xc6\x70\
+\x00\x11\x8a\xe2\x1a\xdd\x26\x15\x01\x52\x05\xe4\xf7\x26\x31\xef\
+\x87\xd2\xc3\xba\xf1\x50\x70\x38\x8f\x6a\xb6\x3d\xdf\x70\xbd\xd5\
+\xb6\x97\xc3\xf2\x9f\x9c\xd9\x90\xb7\xd9\x33\x87\xcc\x09\x1d\xce\
+\xa0\xa0\x7f\x01\x4a\xc9\x06\x40\x9b\x2a\x34\x78\xb2\x67\xc5\xa6\
+\x19\xa7\x10\x78\x52\x08\x70\xbc\x85\x90\xdc\xbd\xb5\x6a\xb9\x67\
+\x47\x4c\x13\xfd\x97\x16\x89\x89\x2e\x1c\xa8\xb9\x87\xe0\x8b\xf0\
+\x6f\xc1\x93\x03\xd8\x15\x9b\x02\x31\x04\x80\x63\x3a\xe7\x27\xc3\
+\x37\xe2\xb3\x76\x90\xf5\x05\x57\xa6\x0a\x2b\xa7\x47\x4c\x56\x8c\
+\x7a\x05\x92\x7f\xb0\x1d\xdf\xfe\xc9\x9c\x55\x04\x55\x03\x26\x72\
+\x3b\x31\x42\xf6\xd2\x21\x7f\x6e\x1d\xc4\x2e\x43\xaf\x94\xd1\x5c\
+\x08\x22\x57\xf1\xe8\x50\x0c\x99\x8a\x1b\xf7\x12\xf0\x69\xde\xbb\
+\x01\x01\xe2\x1c\x11\x0f\xf6\x46\x15\xa8\xd1\x08\x15\xca\x83\x78\
+\xc3\x65\x7a\x62\x0e\x37\xec\xfd\x47\xf0\x7f\x0d\xff\x3e\xba\xf4\
+\xbb\xa0\x0d\x4f\x3c\x9f\x8e\x21\x00\xcc\x37\x24\x01\xf2\x82\xa7\
+\x38\x17\xe2\xb4\xa2\x94\x33\x6a\x1e\x6a\xbe\xb2\x42\x44\x37\xaa\
+\xf6\xc2\x54\xb8\xdd\xb0\x5c\xd3\x86\x82\x4f\x24\xd5\x88\xcb\x67\
+\x27\xef\xa9\x5d\x84\x65\x46\x31\x96\x33\xbc\xf1\xbc\xd6\xc1\xb6\
+\x62\xbf\x68\xa8\x25\xac\xab\x2a\x98\x91\xe8\xa8\x0f\xb8\x91\xc0\
+\x97\xe4\x48\x01\x38\x53\x2e\x60\x27\x60\x4e\xd3\x3c\x45\x08\x80\
+\x47\x86\x95\xc1\x40\xc9\x18\x1a\x56\x02\x7a\x4b\x82\xac\x01\x19\
+\x5b\x72\xd7\xff\x14\x9e\x1b\x86\x6e\x83\x08\x7c\x80\xeb\x23\x78\
+\x5e\x79\x1e\xc1\x63\x1f\x49\x16\x43\x00\x90\xd5\x36\x1d\x39\x14\
+\xea\x38\xc3\x2e\x72\x21\xcb\x73\x53\x42\x47\x85\x1f\x48\xfd\x6d\
+\xa7\x83\xd3\x82\xa0\x07\xad\xb1\xf6\x92\xc2\x45\x31\x9e\xe0\x4a\
+\xa2\x03\xee\x08\xdb\x8b\xd5\xa0\x98\xd1\x82\x53\x65\xc3\x7f\x6e\
+\x3a\xd3\xc2\x81\x0d\x7e\x39\xa3\x53\xa7\x3a\xaa\x08\xef\x53\x97\
+\x42\xe0\x59\x81\x00\xd1\xe8\x77\xe0\xb9\x14\x48\xed\xc0\x6f\xc0\
+\xbf\x0d\xcf\xdd\x83\x77\xe1\x9b\x20\x0a\xb4\x36\xb4\x6d\x54\x8b\
+\x25\x00\xcc\x61\x58\x2e\xc0\x7d\x61\x02\xe9\x8f\x97\x33\xd8\xe0\
+\x10\xe1\x9c\x1c\xfd\xd5\x96\xe3\xab\xef\x2c\x76\xc6\xdb\x8e\xd7\
+\x53\x76\x46\x96\x4f\xec\x68\x7b\x3d\x8f\x32\x4f\x96\x33\xde\x47\
+\x8f\xe7\x5b\xd8\x5d\x08\xb9\x83\x52\xc2\x34\x64\x22\xe4\x46\x9e\
+\xb8\x88\x34\x83\x14\x02\x07\x1d\x02\x5c\x19\xe0\x54\x9b\xc4\xe0\
+\xb7\xe0\xff\x15\xfc\x5f\xc1\x5f\x83\xff\xd7\x20\x02\x3c\x97\xd0\
+\xc5\xfd\x50\x17\x4b\x00\x24\xfa\x93\x97\x1f\xe2\x0c\x35\xf0\xa7\
+\xf2\x7a\xdb\x54\xe5\x21\x89\x92\x0a\x70\xf1\x10\xa6\x04\x05\xb4\
+\xfd\x14\x68\xff\x0d\xc9\x61\x7b\xc1\x44\x6e\xd0\x98\xe0\xfc\xb8\
+\x69\x8d\x00\xe3\x4f\x8f\x64\x0c\x18\x60\x34\xf3\x3a\xf8\x24\xce\
+\x05\x06\x4c\xf2\x51\x72\x80\xad\xcd\x16\x75\x8e\xe0\x79\x4e\x21\
+\x66\x22\xe9\x66\x83\xed\x41\x3c\x8d\xb5\xdf\x10\xa0\xfe\x0c\x7a\
+\x36\xce\x1a\x50\x8a\xb8\x12\xb7\x64\x47\xef\xd6\x8b\xf7\x24\x04\
+\x91\xfb\x10\x6e\x8e\xc1\x53\x0e\xf7\xff\x82\x08\xdc\xc7\x75\x7e\
+\x18\x37\x10\x4f\x00\x88\xb7\xf4\xfd\x45\xe2\x71\xa3\x53\x70\x5a\
+\xa2\xea\x4e\x16\xcc\x06\x54\xfe\x59\x19\x49\x00\x80\x6c\xf2\x74\
+\xe0\x6a\xc7\x55\x88\x79\x9c\x26\x0c\x65\x27\x36\x66\xdc\x7b\x92\
+\xc5\xe3\x07\x83\x7e\x00\x43\x02\xde\x95\xa9\x5c\x67\x02\xaa\x52\
+\xc7\xca\x06\x6d\x18\xd2\x4b\x17\xd1\x2a\xec\x33\xc2\xa4\x9f\x62\
+\x7f\x40\xc2\x17\x3e\x94\x8e\x2c\xcf\x13\x36\x76\x15\xb7\xa5\x6a\
+\x23\xe7\x0e\xa9\x4b\x21\x70\x28\x20\x00\xdc\x81\x24\xbe\x9c\x55\
+\x70\x3c\x29\x91\x48\x60\xbf\x80\x24\x0a\x72\x0a\x8c\x17\x12\x3d\
+\xba\x4d\xa1\x81\x91\x0b\xf0\x34\x39\xb6\x0a\x4f\x7c\xac\x03\x1d\
+\x68\x7b\x90\xe8\x30\xd0\xc5\x12\x00\x8e\xe2\xfc\x4b\x72\x61\xe9\
+\x81\x0f\x61\x24\x4e\x3c\x09\x0f\x3c\x40\x0a\xbf\xed\x06\xcb\x35\
+\xdb\xa7\x0d\xe1\x69\xa2\x7f\x52\x1e\x43\xc3\x90\xba\x0c\xe1\xe2\
+\x74\xc1\xf0\xbe\x78\xbe\xdc\xaa\x64\xd5\x52\x57\xc5\xb8\x3f\x29\
+\x08\x0e\xcd\x08\x04\xee\x9d\xaa\xdd\xba\xbd\xea\x8e\xd5\x6d\xdf\
+\x98\x6b\x38\x1a\x08\x02\xe4\x00\x5c\x53\x55\x50\x4f\x24\x49\x05\
+\x81\xfd\x70\x4b\xef\x0f\x32\x04\x80\xb8\x1c\xd8\x20\xea\xd2\xb9\
+\x24\x08\x35\x1b\x71\x66\xc4\x68\x54\x72\x30\xa0\x3b\x9a\x73\xb1\
+\x81\xa8\x0c\xf9\x1b\x71\x38\xc2\x31\xca\x08\xb8\x5a\xf0\xdf\xc2\
+\xcf\xc3\xff\xf7\xf0\x7f\x8d\x4c\x16\x40\x04\xa4\x80\x1e\xcf\x1b\
+\x5c\x2c\x01\x90\x92\x73\x96\x1e\x65\xbd\x21\xd9\xfa\x03\x0d\x1c\
+\x8c\xe1\xd8\x54\x0a\x02\x23\x87\x51\xdf\x07\xe2\x75\xd7\xe0\xf1\
+\x36\x99\x8e\x44\xc9\xb6\x5c\x39\xdf\x2f\x60\x8e\xf1\xca\x74\x16\
+\x87\x2e\x18\xc1\x78\x41\xc7\x11\x6c\xeb\xac\x10\x0b\xc1\x61\x45\
+\x30\x5b\xee\x59\x0f\xea\x8e\xda\xb4\x03\x63\xb1\xe5\xe4\xab\x6d\
+\xa8\x56\xa2\x74\x6c\xbf\x64\xd1\xdd\x9a\xc9\xa3\xce\xb7\x94\x91\
+\xbe\x48\x21\x70\x70\x21\x10\x22\x0e\x7f\x55\x98\x04\x68\x62\x21\
+\x0b\x02\x75\x33\x5b\xc7\x69\x44\x75\x5f\x87\x4d\x01\x75\x1c\xdb\
+\x8a\xcf\x8d\x9a\x1e\xa6\xc1\x44\x7e\x22\x21\xaf\xd4\x19\xe0\x3e\
+\x82\xdf\x86\xe7\x4e\xc2\xeb\x20\x02\x57\x41\x04\x38\x3d\xd8\xe0\
+\xe2\x09\x40\x14\x2d\x01\x79\x39\xa2\x82\x28\x29\x63\xd8\x00\x04\
+\xed\xbf\x75\x0a\xc0\x34\x91\x8f\xf2\x79\xcc\x2b\x33\x33\xf0\x83\
+\xf3\xd6\xbc\x57\x66\x0a\x36\x96\xf6\x54\x20\xff\xba\xdd\x02\xe4\
+\x0f\xad\x62\x7f\xcd\x0e\xdc\xf7\x96\x3b\xd6\xbb\x0b\x76\x09\xdb\
+\x8c\x75\x98\x30\xc9\xae\x57\x64\x28\xfd\x7a\xcc\x5a\xa5\xd1\x53\
+\x08\x3c\x7d\x08\xb0\x3f\x73\x2c\x86\x9d\x4e\x31\x57\xf7\xe5\xb4\
+\xf7\xd6\x8a\x23\x26\xf3\xba\x38\x5e\x31\xfc\xe9\xa2\xee\xe6\xb0\
+\x1e\xce\xc1\x11\xa3\x5d\xd4\xfd\xa9\x3d\xf8\x8f\xe0\xdf\x87\xe7\
+\x6a\xd8\x0d\x10\x01\xae\x10\x6c\xe0\x04\xe2\x09\x00\x4b\x84\x27\
+\x1e\xc7\xb9\x6e\x18\x38\x7d\x0d\xb6\xc3\xb6\xce\x33\xb0\x00\x9f\
+\x98\x3e\x2e\x5f\xb6\xc0\x30\x54\x7f\x1c\xda\x85\x9f\x39\x57\x22\
+\xdb\x0f\xe3\x42\xbd\xa9\x04\xe5\x0b\x41\xcb\xf6\x9c\xef\xde\x6d\
+\x9b\x0f\xeb\x4e\x06\x96\x8b\x0c\xc7\xf7\x41\x1f\xd7\x5b\x1f\x97\
+\x77\xfa\x3e\x85\xc0\xb3\x00\x01\x62\xc3\x0a\x76\x12\xd6\x1d\x57\
+\x7d\x58\xb3\x33\xaf\x9d\xcc\xd7\x31\x4d\xf6\x8f\x97\x8d\x0a\x82\
+\x22\x22\xc0\xa6\xfe\x01\xfc\x2f\xc0\x5f\x87\xbf\x09\x22\xb0\x41\
+\x30\x18\x4f\x00\x10\x7b\xa8\x23\x05\x90\x54\x80\x44\x65\x77\x84\
+\x6b\x6c\x18\x79\x76\x58\x11\xf2\x47\x32\x7a\x00\x0e\x00\x54\x4d\
+\xae\x24\xca\x46\x01\xf9\x29\x63\x08\x60\x55\x45\x59\x82\xfd\x30\
+\xd8\x14\xc0\x56\xe3\xf4\xa0\xd2\xa1\xdf\x2a\x8d\xf0\xcc\x41\x00\
+\xf2\x75\x01\xd3\x9d\x38\xb4\xd7\x53\x1e\xd6\x5d\xd5\x05\x83\x8f\
+\xdd\xb8\xe0\x06\x68\x83\xa7\x47\x04\x2a\x68\x38\xf5\x04\x5e\x81\
+\xef\xc0\x53\x7f\x80\xcf\xd2\x25\x10\x80\x1e\x76\x47\x71\x63\xae\
+\x92\x02\x0c\x0e\x93\x5c\xc4\xe0\xa0\xb8\xb7\x24\x23\x30\x9a\x18\
+\x3c\x3f\x91\x81\x2a\xaf\xa9\xc0\x6c\x12\xd9\x17\xe9\xc8\x90\x80\
+\xea\xb9\x8f\x80\xfc\xdf\xb8\xd5\x34\x9b\xb0\x18\x1c\xae\x32\x44\
+\x31\xd2\x6b\x0a\x81\xa3\x05\x01\x8c\xe8\x82\x16\xb5\x7e\xf4\xa0\
+\x55\x84\x22\x9e\x8f\x55\xf1\xea\xc5\x89\x6c\xa1\x60\x4a\x22\x10\
+\x8d\xca\xdc\x9d\x4b\x5d\x81\xff\x15\xfe\x3e\xd2\x2c\x46\x2b\x03\
+\xb1\x04\x20\xc2\xdd\x8d\x8c\xfd\x26\x64\x97\x34\x02\x3f\x8c\x3c\
+\xc0\xc9\xe0\x01\xef\x93\x5e\x19\x10\x26\xe0\xb0\x20\xf1\xa1\x63\
+\x79\xad\xc2\xc3\xd6\x42\x27\x35\x0b\xc9\xf6\x7f\xed\x46\xd3\xc4\
+\x86\x09\xa5\xde\x67\xad\x28\xa6\xf8\xa4\x62\xd2\xb0\x14\x02\xcf\
+\x1c\x04\xc8\x09\x7f\xfd\x66\xa3\xd2\x76\xbd\xd6\x6c\xc9\xec\x9c\
+\x19\x31\x4b\x10\x0e\x12\x87\x28\x18\xa4\xe2\xd0\xa7\xe0\xe7\xe0\
+\xff\x0d\x3c\xb9\x81\x64\xbe\x5d\x12\x81\x2e\x7e\xc7\xdd\x33\x93\
+\x81\x6e\x30\x4d\x18\x18\x35\x7a\xc9\x9a\x82\x7d\xf1\x81\xf8\x5e\
+\x4e\x57\x54\x68\x17\x4a\x02\x20\x59\x1d\xa8\xf1\x2c\x37\xc1\xf2\
+\x13\xf9\x61\x44\x14\x62\x80\x1d\x4a\x18\xa2\xd2\xd2\x6b\x0a\x81\
+\x67\x0b\x02\xc4\x51\x18\xd7\x55\x97\x70\xa0\x27\x0f\xf4\xe5\xc1\
+\xbe\xe4\x10\xba\x8e\x44\x80\x4b\x84\xd4\x13\x30\xf1\x5e\x72\x07\
+\x09\x1c\x00\x10\x8c\x89\xa3\x31\xb8\x9b\x4b\xff\x85\x59\xf7\xb2\
+\xef\x0f\x88\xee\x99\x3e\x31\x42\x14\x31\x2c\x06\xa3\xbf\x3f\x5b\
+\xd2\xed\xe7\xa7\x72\xb6\xa9\x91\xf5\x0f\x09\x00\x1a\x22\x56\xdb\
+\x8e\xf2\xa3\xb9\x96\xb2\xdc\xb4\x15\x18\x10\x96\x8a\x10\xeb\xa9\
+\xd3\xbb\x14\x02\x29\x04\x24\x04\x80\xaf\x57\x17\xda\x85\xfb\x55\
+\x2b\xb8\x34\x39\x51\x33\x02\x51\x04\x1f\x4d\xe4\xa7\xbb\x02\xcf\
+\x55\x84\xff\x09\x9e\x72\x80\x76\x34\x47\xc0\xfd\xee\xb9\x70\x6c\
+\x5e\xc7\x7c\xde\x0d\xf3\x14\x23\x1a\xba\x50\xb0\x95\xd7\x78\x7e\
+\xcc\xcc\x47\x52\x7f\x90\x30\xbf\xe1\x04\xcd\xb9\xa6\xdf\xf9\xd9\
+\x5c\x3b\x43\x05\xe7\x54\x99\x6f\xf7\xbe\x55\x9a\xd3\xb3\x07\x01\
+\xca\x04\xea\xf8\xf9\xd6\x07\x55\x63\xa5\xed\x4a\x6e\xb9\xdb\x4a\
+\x6a\x07\x92\x0b\xf8\x75\xf8\xe7\xf9\x2e\x96\x03\x60\xe0\xb6\x87\
+\xef\x30\xf2\x86\x5f\xc9\xa2\xa3\x22\xe4\x22\x7a\x0b\x78\x1b\x62\
+\x6c\x7c\xe0\x54\x05\x67\x09\x70\x0a\xa0\x98\x06\x08\x16\x9e\x49\
+\x34\x78\xee\xfa\x6a\x57\xda\xcf\x86\x51\x37\x80\xef\x53\x97\x42\
+\x20\x85\x40\x0c\x04\x80\x73\xc4\x9b\xe5\xb6\xa7\x62\x91\x4c\x4e\
+\x04\xa0\x44\x43\x2e\x80\xfc\x3c\x89\xc0\x39\xf8\xab\xf0\xf1\x04\
+\x80\x88\x2b\xa7\x00\x8c\x15\xe3\x24\x87\xcf\x9f\x58\x87\xb0\xc4\
+\xf0\x30\x21\x19\x7d\xec\xdf\x17\xb3\x90\xfa\x97\x33\x40\x71\x35\
+\xe4\x58\x98\x14\xbb\x0a\x95\x77\xe6\x5b\xc6\x52\xcb\x09\x77\x15\
+\x6e\x23\xbf\xd8\xea\xa4\x01\x29\x04\x8e\x08\x04\xb0\x09\x4f\x81\
+\xf5\xed\x2c\x54\xf2\x1b\xb0\xd6\xe5\x6b\x41\x50\x86\xe4\x9f\xad\
+\xa7\x82\xd0\x17\xe0\x79\xea\xd0\xd7\x13\x38\x00\x22\x76\x12\x72\
+\x23\x58\xba\xf8\x38\xdb\xce\x01\x83\xbd\xaa\xa9\xde\x89\x91\x4c\
+\x6d\x34\xaf\xd3\x02\x0a\xd5\x18\x03\x4a\x30\x20\xd4\x70\x6f\xaf\
+\xd9\x46\xad\xe3\xcb\x93\x15\xc3\x32\xd3\xdf\x14\x02\x29\x04\x86\
+\x42\x00\xf8\x8e\xd3\xbd\x71\xde\xa6\x23\x5e\x9e\x29\x06\x58\x22\
+\x24\x05\x20\xce\x93\x03\x38\x05\x3f\x13\x4b\x00\xe2\xd1\x1a\xc9\
+\xfa\x5c\x84\xe4\x89\xf1\x13\x03\x43\xbe\x84\x0c\x3f\x2c\xf8\xd8\
+\x50\x69\x8c\xea\x04\x02\x20\x3c\x10\x00\xbb\x65\xf9\x06\x74\xfe\
+\x15\x6e\x04\x48\x5d\x0a\x81\x14\x02\xdb\x87\xc0\x72\xcb\x55\x39\
+\x6d\xc6\x7a\x00\x38\x6b\x89\x3f\xfc\xa1\x65\x21\xea\xd7\x8c\x44\
+\xc8\xb6\x25\xc7\x6d\x4d\x01\x90\x8a\x02\xbf\x58\x27\xd9\xf5\x84\
+\xf0\x6e\x42\x12\x26\x32\xfd\xd8\x54\xe4\xc1\xd8\x87\x4c\x00\xe4\
+\xc7\x51\xe1\x3e\x4f\x12\xaa\xa1\xee\x39\xb0\x2f\xe0\x62\x86\xe7\
+\x15\x5b\x97\x34\x20\x85\xc0\x11\x84\xc0\x5c\xc3\xcd\xe3\x08\x32\
+\x69\x24\x80\xd8\xd3\x37\x84\x72\x5f\x4d\x3c\x07\xd0\x83\x55\x12\
+\xce\x31\x2c\x21\x7c\xf3\x6a\x40\x2f\xcf\xbe\x9b\x6e\x72\x6e\x26\
+\xd2\x73\xba\x3a\xd1\xdd\xd5\x24\xe5\x0f\x38\x2e\x3c\x58\x96\xe7\
+\x83\xfb\x20\x5e\x09\x05\xf5\xe5\x97\xde\xa6\x10\x48\x21\xb0\x0e\
+\x81\x0e\x0e\x23\x6c\x71\x74\xdd\x8a\x3e\x3c\x67\xe0\x95\xc1\x1c\
+\x80\x8c\xcc\x9f\xad\xa9\xd6\xb3\xde\xbd\x3b\xca\x26\xa4\xc7\x1a\
+\x65\x44\xa1\x58\x32\xcd\x88\xe3\x84\xf2\x90\x25\x78\x4a\x75\xd9\
+\xbd\x56\xa5\x39\xa5\x10\xd8\x7f\x08\xd0\x20\x17\x0d\xf4\xc2\xd3\
+\x48\x17\x44\x6d\xa1\x24\x10\x35\xa3\xac\x2d\x61\x0a\x00\x84\xe3\
+\x6e\xbe\x24\x45\x81\x90\x3c\x24\x10\x09\xb2\xec\xdb\x61\xdb\x61\
+\x31\x7c\x33\x7e\xe3\x24\x55\xbd\x65\xfb\x3a\x0e\x15\xc9\xb1\xe6\
+\xf2\x94\x84\x5e\xdd\xf7\x1f\xb0\x69\x0d\x52\x08\x1c\x16\x08\x78\
+\x5e\xe0\xe1\xa0\xdf\x07\xaa\xaa\x55\xf2\xaa\xc2\xdd\x82\x3d\x37\
+\x98\x03\x40\x70\x24\x03\xa0\x51\xb2\x38\x17\xe2\xf7\x20\x02\x00\
+\x84\x05\x46\x47\x79\xc4\xa5\x5f\x7f\xbf\x95\x50\x30\x6f\x52\x2f\
+\x1c\x29\xd8\xa3\x0d\x89\xf2\x86\xf5\xcc\xd2\xbb\x14\x02\x29\x04\
+\xba\x10\x20\x76\x26\xe1\x4d\x2c\x01\x90\x43\xb2\x1c\xbd\x93\x28\
+\xc0\x93\xc3\x99\x15\x8c\x75\x28\x9f\x0a\x45\xdb\xe2\x22\x62\x33\
+\x49\x03\x52\x08\xa4\x10\x88\x83\x40\x3c\x01\x08\x49\x07\xd2\x25\
+\xa0\xa8\x8c\x13\x8e\xf6\x61\xbc\x04\x62\x11\x57\x83\x61\xef\xa3\
+\x32\x64\x35\xf6\x20\xff\x61\xe5\xa7\xe1\x29\x04\x0e\x3b\x04\xe4\
+\x40\x3e\xb8\x11\x31\x04\x40\x62\x1d\x52\x90\x79\x88\x47\xba\x28\
+\xd6\x96\xac\x19\x40\xba\x40\xe2\x91\x50\x78\x37\x86\x1c\xe5\xb7\
+\xb2\x29\x51\xee\x61\x08\x9f\x42\x22\x23\x6f\xd2\x9f\x14\x02\x29\
+\x04\xb6\x0d\x81\x10\x7b\x06\x45\x1f\x48\x00\xd6\xa3\xaf\xdf\x0d\
+\x4a\x3c\xec\x5d\x8f\x7b\x8f\xa7\x21\x89\x59\xb0\xf4\xad\x84\x21\
+\x31\x49\x1a\x98\x42\x20\x85\xc0\x26\x08\x24\x61\xf1\x40\x02\xc0\
+\xf4\xdb\x11\xe0\x85\x19\x83\x47\xc0\xcd\x46\x1c\x0f\x51\x37\x1c\
+\xb1\x93\x8a\x8f\x6a\x1a\xc5\x8f\x9e\x37\x5d\x87\x04\x6f\x8a\x9d\
+\x3e\xa6\x10\x48\x21\xd0\x0f\x81\x04\x14\x8c\x25\x00\x3d\xe4\x4d\
+\x5c\x06\x40\x29\x09\x99\x4b\x0e\xa0\xbf\x22\x09\xf7\x71\xd9\x84\
+\xef\xa3\xd0\x8d\x64\x26\x21\xbb\x34\x28\x85\x40\x0a\x01\x40\x80\
+\x98\x13\x61\xcf\x20\x80\xc4\x13\x00\xa4\x0a\x13\xc6\x27\x4f\x0e\
+\x87\x10\x40\xce\xff\x7b\x19\x0d\x2a\x3f\x2c\xa3\x37\x57\x18\x14\
+\x25\x9c\x04\x0c\xd3\x49\x18\x94\x32\x7d\x97\x42\xe0\xa8\x43\x20\
+\xc2\xde\x38\xad\x9e\x58\x02\x10\xcd\xbd\xc3\x5d\xf9\x83\xc1\xb8\
+\x6e\x78\x74\x70\xb8\x24\x00\x92\x08\xc4\x84\x47\xaf\x63\x09\x00\
+\xaa\x4f\x25\xa0\x88\x8e\x45\xad\x89\xd2\xa5\xd7\x14\x02\x29\x04\
+\x86\x43\x20\x01\x07\x63\x09\x00\x91\x57\xca\x01\x12\xb4\xef\x42\
+\x22\xf1\x64\x58\xc9\xd4\xc3\x72\x60\x39\xe1\x5f\x3a\x05\x18\xfe\
+\xb5\xd3\x18\x29\x04\xb6\x0f\x81\x78\x02\xc0\x3c\x12\x28\x87\x2c\
+\x22\x1a\x9c\x07\x95\x07\xac\x96\x48\xcb\x3c\x86\xe0\x6d\x84\xde\
+\x31\xd9\xf4\xbd\x1e\x46\x2a\xfa\xa2\xa6\xb7\x29\x04\x52\x08\xc8\
+\xc1\x95\xf8\x15\xe7\x62\x09\x40\xb4\x0a\x10\x9f\x94\xf4\x01\x13\
+\x84\x01\x11\xf8\x8a\xb2\xc3\x1e\x62\x0f\x88\x13\x55\x48\x06\x75\
+\xb9\x8d\xe8\x5d\xef\x2a\x33\x62\x66\xf0\x24\x36\x43\x08\x49\x2f\
+\x5d\x7a\x93\x42\x20\x85\xc0\xb6\x20\x10\x4f\x00\xba\xc9\x49\x08\
+\xe2\x1c\x43\x78\xda\x60\x84\xa7\x1b\xe2\x45\xc9\x78\x7d\x52\xc4\
+\x65\x1d\xf8\xff\xa4\xf9\x6c\xa8\x60\xfa\x90\x42\x20\x85\x40\x2c\
+\x01\x90\x43\x3b\x11\x2f\x41\x06\xd0\x43\xfd\x01\x7b\xf5\x89\xf7\
+\x74\xbc\x3e\x11\xde\xf6\x13\xa0\xfe\x7b\x99\x7b\xfa\x93\x42\x20\
+\x85\x40\x12\x04\x88\x7f\x49\x83\x78\x3c\x01\xe8\xe5\x1a\xa1\x72\
+\xef\x45\xdf\x8d\xcc\xbe\xef\x79\xfd\x56\x22\x3d\x10\x16\x27\x9c\
+\x4b\x22\xb0\x1e\xb2\xf1\x8e\x39\xf0\xe0\x8f\x78\xdc\x8e\xca\xe0\
+\xf5\x89\x48\xc9\xc6\x82\xd3\xa7\x14\x02\x47\x06\x02\xc4\x9d\xc1\
+\x6e\x08\x01\x88\x4f\x18\x66\x17\x1f\x2e\x43\xf0\xc3\xeb\x00\x06\
+\x61\x63\x6d\x88\xfd\x91\xdf\x18\xd2\x7d\x62\x2e\x8c\x93\x12\x80\
+\x81\xe0\x49\x5f\xa6\x10\x48\x82\x00\xd1\x27\xc6\xc5\x12\x80\x75\
+\x01\x5e\x3c\xd2\x45\x82\xc2\x98\xbc\xf1\xba\x8b\xb8\xf1\x11\xba\
+\x21\xf1\x35\x94\xf5\x20\xee\x33\xca\x50\x4a\x32\xb4\xa0\x34\x42\
+\x0a\x81\x23\x08\x81\x78\xfc\x8a\x27\x00\xc0\x38\xee\xc5\x0f\x0d\
+\x89\x0e\x86\x19\x57\x01\x42\xfe\x7e\x30\x91\xe8\x11\x91\xc1\xc9\
+\xe5\xdb\xa8\x6a\xc3\x27\x0a\x51\xcc\x84\xcc\xd2\xa0\x14\x02\x29\
+\x04\x06\x40\x20\x1e\x77\x62\x09\x80\xcc\x25\x3e\x5d\x58\xc8\xb0\
+\xf0\x01\x55\xd9\xee\x2b\x66\x1d\x11\x05\xc9\x69\x6c\x37\x61\x1a\
+\x2f\x85\x40\x0a\x81\x6d\x43\x20\x81\x00\x84\x28\x98\x9c\x53\x52\
+\x1c\x84\xc9\x79\x3d\x17\xf0\x93\x5d\xc8\x49\x44\xe8\xbe\x31\xae\
+\xcc\x02\xaf\x58\x12\x05\x8a\xa9\x4b\x21\x90\x42\x60\xfb\x10\x90\
+\x18\x2a\x91\x88\xf8\xb8\x35\x5d\x2c\x01\x08\xe7\xf7\xeb\xa3\xf0\
+\xd6\xa4\xc4\x6f\x20\x6d\x84\xa1\xfd\x11\x64\xa9\xa1\x92\x50\x40\
+\x83\x9f\x83\x67\x08\x32\x85\xac\x93\x8c\x3f\xd8\xf4\x48\xaf\xee\
+\xa0\x23\xa9\x0c\xb0\x1f\xc8\xe9\x7d\x0a\x81\xe1\x10\xe8\xa2\x56\
+\x6c\xc4\x58\x02\x10\xa6\x90\xe8\x19\x9b\x78\x20\x49\xe9\xc5\x8e\
+\xd2\x46\xd7\x5e\x40\xef\x26\x0a\x09\xc7\xfe\xc1\x1c\x40\x2f\xf2\
+\x20\xf2\xb5\x1e\x98\xde\xa5\x10\x48\x21\xb0\x03\x08\xc4\x13\x80\
+\xee\xd0\x3b\x78\x5c\x0e\x4b\x22\xca\x26\xa1\xed\xf0\xf0\x88\x39\
+\x48\xce\x25\x24\x34\x24\x17\x09\xac\xc4\x0e\x1a\x9f\x26\x49\x21\
+\x70\xd4\x21\x90\x4c\x00\x38\xea\x46\xc3\xf4\x20\x48\xf5\x56\x01\
+\x06\x05\xe2\x5d\x40\xbe\x3d\x29\x83\x6e\x3a\x46\xd9\x1c\x4f\xbe\
+\x63\x38\x88\x43\x8f\x18\x75\xe3\xa7\x97\x14\x02\x29\x04\xb6\x05\
+\x81\x10\xb5\xe2\x71\x30\x9e\x00\x6c\x2b\xfb\xe4\x48\x3d\x0e\x20\
+\x61\xf2\x2e\xab\xd6\x43\xf6\x4d\xf9\x45\xf5\x8e\xae\x9b\x82\xd3\
+\xc7\x14\x02\x29\x04\x9e\x0c\x02\xb1\x04\xa0\x87\xbc\x09\xf9\x87\
+\x71\x12\xa4\xfc\x3d\xec\x8e\xcf\x84\x51\x7c\x79\x06\x51\x12\x96\
+\x33\x2c\x29\x3c\x3e\xff\x34\x24\x85\x40\x0a\x81\x78\xdc\x89\x27\
+\x00\x48\x43\xce\x5b\x49\xd2\xbe\xeb\xb2\xe6\xf1\x00\x8e\x2f\x78\
+\x6b\x9a\xc1\x71\x25\x91\xe9\xd6\x25\x25\x02\x5b\xa1\x96\xbe\x49\
+\x21\x30\x14\x02\xc0\xd3\xc1\xd8\x25\x44\x0c\x01\x08\xa3\xcb\x65\
+\xbe\x84\xdc\xe5\xdc\x3c\x21\x7c\x3d\x28\xae\xf8\x28\x46\x14\x1e\
+\x5d\xf9\x9e\xf7\xf0\x24\x32\xd1\x3d\x5f\x1f\x66\xc7\xe6\xa0\xfe\
+\x38\xa0\x51\xe8\xf0\xbc\xd2\x49\x3a\x8a\xab\x8b\x63\xd0\x3c\x7e\
+\x2c\x44\x4a\xdc\x84\x29\x53\xa5\x3f\x29\x04\xb6\x07\x81\x78\xf4\
+\x8f\x25\x00\xc8\x58\xf6\x4a\x76\xd7\x04\xc9\x7b\x2f\xce\xe0\x8a\
+\x48\x02\xc2\x38\x09\x4e\x86\x26\xc5\x09\x23\x20\x07\xdc\x24\xc8\
+\x12\x12\x8a\x38\x50\x41\x84\x66\x16\x67\xa1\x97\x73\x86\x28\x65\
+\x74\x80\x19\x67\xb7\x63\x3b\xa4\x83\x99\x54\xad\xe3\x88\xb6\xed\
+\x09\x9b\xc2\x53\xce\xac\x12\x40\x7f\xa0\x1a\x95\x56\xe6\x60\x43\
+\x20\x01\x05\x63\x38\x00\xe2\x3f\x47\xa2\x24\xda\xc1\x36\x77\x47\
+\xb0\x4d\xcd\x0f\x2d\x90\xd2\x8e\x6f\x98\xc7\xa6\xe0\x0d\x8f\xac\
+\x9b\xf4\xb1\x44\x40\xe6\x22\xf3\x3a\x6c\xf8\xa0\x6b\x8a\x98\x28\
+\x98\x5e\x31\xab\x7b\x17\xc6\x4b\xed\x4a\xd6\x50\x81\xf4\x46\xc6\
+\x50\x40\x03\x54\xc9\x05\x10\x18\x6c\x3f\x6d\x9f\x7a\x40\x7c\x17\
+\x27\xb9\x3a\x6e\xe0\xcc\x35\xda\x9d\x6a\xc7\x55\x6e\x2d\x37\x0a\
+\x8b\x75\x4b\x77\x11\x89\x84\xe2\xb0\xc1\x80\xed\x4b\xdd\xfe\x41\
+\x40\xf6\x2d\xd9\xc3\x06\xd7\x21\x96\x00\x0c\x8e\xfe\x18\x6f\x89\
+\xd0\x91\xdf\x21\x3f\xcb\xca\xd3\xd3\xc9\xac\xc2\xdb\x83\xfb\xdb\
+\xc5\x4e\xb2\xf6\xc0\x7d\x51\xca\x9a\xfe\x44\x21\x13\x54\x72\x46\
+\x70\x7a\x2c\xe7\x8d\xe7\x32\x18\xf9\x75\x3f\x62\xfd\x07\x35\x04\
+\xed\x0c\x5c\xdf\x0f\x32\x19\xd5\x5d\x69\xda\x5a\xa3\xe3\x04\x20\
+\x08\x41\xc7\xf5\x45\xd3\x71\x05\x8e\x4d\x97\x86\x9a\x53\x42\x30\
+\x00\x7a\x00\x0a\xe1\x92\x33\xb5\x40\x41\x9f\xb3\x1d\x4f\x71\x41\
+\x34\xd9\x77\x8e\xaa\xeb\x35\xbd\x77\xb3\x11\x12\xb1\x04\x80\xe3\
+\x2e\xd1\x2f\x26\x9d\xcc\x85\xa1\xc9\x31\x18\x2d\x29\x07\x99\x4d\
+\x62\x9c\x1e\x27\x42\xcc\x38\x04\xbd\x5e\x45\xc7\x3b\x31\x92\x73\
+\x80\xf8\xde\x2f\x5d\x9e\xb2\x46\xf2\x46\x01\xef\x32\x68\x24\xfd\
+\x50\x87\xe4\xba\xa1\xa9\xfa\xd9\xd1\x7c\x0e\x5e\x7c\xf8\x58\x39\
+\x58\xed\x78\xad\x85\x7a\x5b\xfc\xc3\xdd\x35\xf1\xf6\xa3\xb5\x3c\
+\x89\x40\x12\x11\x19\x5a\xc8\x33\x18\x81\x48\xce\xee\x61\xea\x9a\
+\xf8\xb5\x2b\xb3\x36\xe0\x1e\x7c\xfb\x83\x45\xf3\xf6\x4a\x53\x6d\
+\x73\x7e\x75\x44\xdd\x30\x2c\x8e\x25\x00\x3d\x78\x25\x91\x4f\x86\
+\x0d\x0a\x0f\x4b\x45\x10\x90\x96\xf7\xc3\x5c\x92\x49\x20\x59\x06\
+\x32\x90\xf9\x6c\x27\xb3\x61\x85\xed\x7e\x38\xab\x98\x31\x74\x3f\
+\x67\xa8\xc1\x4b\xc7\xcb\xce\x0b\x53\x25\x6d\x34\x67\xe8\x18\xf9\
+\x21\xeb\x53\xb4\x27\x29\x51\x51\x55\xa5\x9c\x55\xb2\x39\xa3\x40\
+\x4e\xc2\x9b\x29\x9a\x9d\x85\x86\xad\xbc\xf3\xa8\x96\x75\x3c\x4f\
+\xc2\x77\x87\x0c\xd6\x93\x54\xeb\xc0\xa5\x05\x83\x24\xb2\xba\x1a\
+\x7c\xee\xfc\x44\x13\xdc\x96\x59\x32\x35\xf5\x0b\x97\x26\x9b\x5f\
+\xbb\x16\x64\xe6\xea\x96\xba\xd6\xb6\x21\x70\x01\x91\x38\x04\x83\
+\xc8\xae\x03\x97\x32\x25\x89\x40\x5b\xf1\x67\x30\x01\x90\xf1\xf0\
+\xb3\x35\xfe\xc6\xba\x31\xbc\xdf\xf7\x85\xf6\xbf\x4e\xda\xc5\xd7\
+\x1f\xaf\x2f\x79\xef\x76\x38\x87\xd1\x8b\xfa\xd4\x6f\x58\x77\x3a\
+\x0a\xf3\x0b\x40\x7e\xb2\xf7\xc7\xcb\xd9\x60\xb6\x9c\x95\x02\x3e\
+\x04\xf4\xc1\x97\x64\xc2\x43\x73\x28\xe7\xb7\x54\x68\x49\x82\x4b\
+\xe5\x87\x89\x7a\x24\xaf\x58\x73\x55\x0c\xc4\xa3\x87\xa4\x50\x86\
+\x29\x0a\xa8\x88\xa6\xab\x5a\x90\xd5\xb3\x7e\x75\xd4\xf1\x0d\x4d\
+\x51\xef\xac\x68\xa2\x6e\xf9\x9c\x12\xb0\x0a\x47\xd8\x85\x3d\xc4\
+\x50\x55\x3f\x6b\x68\xc1\xf1\x91\x8c\x0f\xe4\x57\x70\xaf\x1e\x2b\
+\xe7\xfc\x91\x9c\xe1\x37\x21\x58\xad\x76\xec\xa1\xdd\xf9\x28\x02\
+\xb1\xaf\x83\x6e\x6c\x7e\x28\x00\x44\x07\x4d\x20\x99\x52\xd8\xc7\
+\x7e\x1d\x07\xda\x6e\x58\x52\x17\x0d\x53\x93\x53\x18\x1c\x2b\x42\
+\x0f\xd6\x6e\x70\x8c\x8d\xf5\x7e\x9a\x4f\xac\x32\x04\x7d\x01\x84\
+\x7b\xee\x67\x2f\x4c\x76\x8e\x55\xb2\x98\xeb\x17\xca\x5b\xd9\x73\
+\xb4\x2e\xb0\x2d\x11\xcc\xb5\x7c\xf7\x96\x15\xd8\x57\x4b\x41\xb0\
+\x8a\x29\x41\xc3\xe0\x56\x68\xce\x57\x45\x00\x7c\xd7\x26\x6c\x45\
+\x39\xd3\x56\xf5\x8b\x1d\xd5\x38\x5b\x10\x8a\x89\xef\xa3\xe5\xba\
+\x6d\x42\x34\xc5\xbc\x38\x59\x30\x8f\x55\x32\xc1\x64\x29\x6f\x7d\
+\xeb\xfa\xbc\x39\x57\xb3\x14\xca\x06\x12\x3e\xd3\xd3\x04\xc9\x53\
+\x2f\x8b\x62\x51\xac\x9e\x8a\x17\x67\x8b\x2d\x10\x5e\xff\xd4\x58\
+\x31\x97\x31\x40\x2f\xc1\x7a\x65\xb1\xd8\xf2\xa1\x93\x63\xed\xd9\
+\x91\x8e\xdb\x7a\xcf\xd5\x6a\x8e\xab\xda\x2e\x09\xef\x53\xaf\xe6\
+\xbe\x15\x18\xe2\x57\x7c\xf1\x5b\x09\x40\x37\x85\x24\x00\x94\x3a\
+\x27\x00\x8b\xc0\x8f\xc1\xdb\x6e\x89\xc3\x8a\x8f\xaf\x58\x14\xc2\
+\x1c\x64\x21\xb2\xa0\x84\xca\x44\x09\x9e\xd2\x95\xd5\xc9\x9a\xba\
+\x3f\x86\xb9\xe6\x2b\xc7\xcb\xfe\xa5\xa9\x62\x6e\x24\x6f\xf6\x24\
+\xfb\x21\xb9\xf2\x1c\xcf\x79\xcf\x11\xc1\x7c\xe0\x77\xbe\x06\x44\
+\xae\x6a\x81\x5f\x2f\xf8\x7e\xcb\xc0\xaa\x3f\x40\x4b\xa3\xea\x52\
+\xa6\x27\xaf\x8a\xab\x1b\xbe\xf2\x7d\xcd\xb3\x73\x79\x55\x9b\x54\
+\x14\x75\x3a\x50\x8d\x4f\x77\x14\xfd\x55\x1d\xb8\xcf\x93\xd8\x34\
+\x38\x51\xcc\xa8\xca\xb9\x31\xcd\x6c\x9f\x1d\xf7\x6e\x2d\xb7\xc4\
+\x9b\xb7\x96\x24\x7b\xfb\x94\x9a\x7e\x60\x8a\x89\x08\xf0\x44\x49\
+\x77\x5e\x3a\x36\x6a\x1c\x1f\xc9\x89\x82\x09\xe4\x5f\x47\x71\xe5\
+\xe4\x68\x2e\x33\x92\xd7\xc5\x83\x95\xa6\xf6\xa0\xda\x16\xf3\x75\
+\x0b\x4b\xae\xec\xb9\x47\xc8\x25\xa0\xe1\x56\x02\xd0\x07\x97\x84\
+\x74\x32\x96\x44\xce\xbe\xf8\x5b\x6e\x87\x46\xe8\xa6\x90\xc8\x8d\
+\xc8\x5b\xe2\xf3\x45\xbf\xdf\x52\xc2\x53\x7f\x11\x56\x31\xec\x3e\
+\x59\x5d\x11\xe5\x8c\x26\x66\x4b\x39\x51\x84\xf4\x29\xd3\x1b\xfa\
+\x81\xd8\x01\xe7\xe7\x35\x2c\xf2\xdf\x83\x76\xcf\xdd\xc0\xf3\xae\
+\xaa\x4a\xd0\x52\x83\xc0\x41\x9d\xc3\xf4\x9b\x9b\x8b\x67\x4c\x0d\
+\xe0\xe1\xfc\x60\xd9\x53\xb4\x15\x5f\xd1\x8e\x07\x81\x77\x42\x28\
+\x6a\x59\xa8\x5a\x01\x51\x40\x17\x30\xe7\xc8\x83\xcd\x9d\x2a\x65\
+\x82\xa6\xe5\x0a\xac\x2e\x06\x1c\xd9\x68\xc2\xed\xa8\x74\xec\x08\
+\x76\x06\xa6\x46\xe3\x79\xd3\x1f\x03\xe6\x97\x33\x72\xe0\xdf\x00\
+\x02\xc8\x05\x34\x11\xe8\x62\xb2\x68\x4a\x3d\x8b\xe5\x06\x08\x00\
+\x63\xc8\x3e\x47\x48\x1f\x0d\xc7\x45\xf9\x41\x2e\x96\x00\x70\x66\
+\x15\xfe\x0d\x4a\x16\xbd\x63\xa6\x83\x33\x66\x0c\x99\x5e\x0a\x20\
+\x36\x7c\x93\x28\xb1\xbc\x86\x39\x74\x4b\xda\x1c\x0d\x81\x92\x13\
+\xc1\xc7\xe2\x5f\x42\x51\x1b\xf2\xdc\xeb\x07\x8e\xd9\x98\x87\x8b\
+\x53\xa3\x39\xf5\xdc\x44\x51\x5c\x99\x2d\x6b\x3d\xdc\x47\xe1\x81\
+\x5f\xf3\x03\x6f\x59\xb8\xd6\xbf\x13\xbe\xf3\x56\x5e\x04\x6b\x92\
+\x55\x92\x6d\xd8\x56\xe5\x10\xd3\xaf\x6b\xc2\x6f\x68\xae\xf3\xbf\
+\x1b\x5a\xe6\x67\x76\xa0\x5d\xf4\x95\xec\xef\x39\x8a\x62\x14\xe5\
+\xbc\x0c\xfc\x03\xe5\x0d\x39\x5d\xf5\x2c\xd7\x6b\x7d\xf7\xc6\x62\
+\x71\xad\xe5\x80\x41\xd8\x0c\xc4\x6d\x15\x78\xb8\x22\x75\xbb\x9c\
+\xd4\xb3\x00\x62\xff\xc2\xa5\x59\x71\xbc\x92\xd1\x20\x84\x95\xc4\
+\x73\x73\x63\x20\x0f\x10\x6f\x9c\x1f\x17\xf9\x8c\x1e\x34\x20\x34\
+\x79\xb0\xda\x52\x49\x2c\x8f\x8c\x43\x5b\x07\x02\x06\x00\x88\x25\
+\x00\x12\xd9\x08\xa3\xa4\xbd\x00\xbd\x48\x31\xa0\xdc\x06\x90\x59\
+\x04\xa3\xc9\xa8\x03\xbe\x49\xf8\x4a\xc6\x62\x65\x62\x0a\x7a\x7a\
+\xaf\x49\x49\x35\x20\x5f\xc1\xd4\xbd\xb3\xe3\x05\xf7\xcc\x78\x81\
+\x2a\xbd\xdd\x25\x3e\x36\xa4\xe9\x07\xee\x4f\x40\x00\xee\x07\x81\
+\xfb\xae\x26\xbc\xba\x2a\x94\x90\xd5\xdf\x7e\xfd\xd9\xce\xa8\xcd\
+\x10\x1d\xb8\x37\x41\x0c\x3a\x8a\xa7\x4c\x07\x7a\xe6\x0d\x4b\x70\
+\x76\x2b\x54\x13\x54\x47\x43\xa7\x56\x28\x74\x9c\x2c\x65\xa8\x4b\
+\x14\xd4\x2d\x07\x7c\xc9\xd0\x73\x9b\x9f\x1e\xc0\xf6\xa0\x24\x8a\
+\x4e\xa9\x14\x75\x6e\xb2\x68\x9f\x1b\xcb\x07\x53\x25\x53\x01\x43\
+\x44\x27\x4b\xf3\x7c\x08\x45\x00\x0b\x55\x25\x89\x50\x64\xdf\x37\
+\xb0\x3c\x88\x29\x82\xfb\xd2\x6c\xd9\xad\xb6\xec\x4c\x8b\x3a\x02\
+\x9e\x2f\x7b\xf7\xfe\xf7\xaa\x3d\x00\x52\x37\xcb\xa8\x17\x11\x66\
+\x83\xdc\x40\x02\xc0\x44\x61\x07\x64\x97\x4a\x02\x0f\xb3\x0d\x63\
+\xcb\x24\x9b\x7e\x24\x62\x33\x4a\x22\x11\x61\xa2\xa8\x9a\x9b\x32\
+\xe8\x3e\x32\x94\xd9\x90\x3f\xde\x77\x87\x46\x61\x71\x2f\x18\x81\
+\x86\xdf\xb9\x89\x92\x8d\x39\x26\x01\x04\x02\x40\x58\x61\xba\xef\
+\xcf\x79\x81\xfd\x7d\xdf\xf7\x6e\x62\x16\x70\xd7\x08\x69\x56\x1c\
+\xfd\x4d\x6e\x4d\xd8\x5a\xcc\x22\xbc\x47\x9a\xe2\xd7\xc9\xf9\x07\
+\x9e\x7e\xde\x51\xd4\x09\x74\xee\x51\x66\xad\x99\xaa\xaa\xcd\x94\
+\xb3\xea\x6c\x39\x87\xf5\x00\xc5\x87\xb4\x1b\x5d\x7d\xc8\x67\x4b\
+\x2e\x76\x60\x68\xd8\x0b\x58\x01\xa8\x29\xf9\x9e\xf0\xec\xb6\x12\
+\xf8\xb0\xf7\x26\x29\xf7\xc0\x24\xeb\x2f\x81\x98\xaa\x6e\x78\xaa\
+\x6e\x2a\xaa\x4e\xfa\x84\x59\x3a\x42\x77\xfa\x35\x99\x16\x1c\x98\
+\x7f\x71\xb2\xe4\x5c\x9c\x2a\x62\xf5\xc5\xc8\x84\xf5\x63\x9e\x81\
+\xdf\xb0\x57\x3d\xc7\x77\x82\xa2\x51\x51\x32\x7a\x1e\x74\x01\x90\
+\x03\x1d\x20\x8c\x32\x9a\xe2\xbc\xb7\x50\xd5\x17\xeb\x81\x56\xf5\
+\x3c\x99\x6c\xa7\xf5\x58\x6f\xe0\xc1\xbd\x8b\xfa\x50\x5c\x0d\x07\
+\x12\x80\x10\x2a\x4c\x0a\x70\x26\x40\x27\xee\x70\xd0\xf5\xc2\xc2\
+\x3c\xd6\x9f\xe3\xee\x12\xe2\x45\x3a\x02\xdb\x22\x24\x71\xf9\xef\
+\xce\x7b\xc2\x22\x07\xc1\xdf\x78\xc1\xf4\x5f\x9a\xad\xf8\x95\x2c\
+\x7a\x17\xe9\x12\x5c\xe0\xb7\xdd\xc0\xaf\xfa\x5e\xe7\x2b\x6d\xcf\
+\x79\xab\x28\x82\x25\xe0\x21\x21\xb9\x33\xe4\xdf\x58\x63\xe2\x59\
+\x53\xf1\xec\x9f\x98\x42\xfc\x89\xa6\x68\x97\x84\xab\xff\xae\x30\
+\x20\x4a\xe4\x54\x04\x0b\x03\xe2\xf2\x54\xd1\x83\x9a\x71\x70\x6d\
+\x6e\x0d\xb2\x02\xf4\xf7\x44\xc2\xbd\x31\xf7\x6d\x3d\xc9\xa6\xa8\
+\xa2\xbd\xf0\x68\xa5\xb5\xf8\x40\x59\xf8\xd9\x77\xb2\x56\x6d\x25\
+\x17\xb8\x8e\x0a\xa1\x44\x6c\x16\x10\x7e\x08\x0d\xb2\xcd\xf2\xf9\
+\x17\x96\xcb\xa7\x9e\x37\xcb\xa7\x2e\x65\xf4\x5c\x29\x27\xa7\x43\
+\x49\x9d\x2b\x26\x47\x0a\xf0\xb8\xea\xf2\xd2\xb1\x4a\xe3\xb9\xe9\
+\x62\x16\x9c\x0f\x28\x4a\xc8\xc9\x12\xf9\xdb\x4e\xa3\xf6\xb7\x0f\
+\xfe\x24\x57\xb5\x17\xb5\x8f\xcc\xfc\xa3\xe6\xe9\xe2\x4b\xb9\xbc\
+\x5e\xa2\x5c\x90\x0a\x56\x99\xd1\x7c\xd6\x7c\xfd\xfc\x54\xf3\xed\
+\x07\x6b\xc6\xbb\x73\x35\xa3\x65\xb9\x1a\x7b\x5f\x97\x79\x88\x29\
+\xf5\x90\xbf\x4e\x80\xf3\x40\x02\x20\xd1\x11\x89\x38\xff\x4e\x86\
+\x8c\x8c\x19\x0b\x9d\x70\xfe\x1e\x1b\xbc\x1e\xc0\x6c\xe2\x1c\xeb\
+\x21\xff\x80\x64\xbb\xdd\xa9\xe3\xca\x1c\xf8\x9e\xb5\x90\xca\x26\
+\x7e\x39\x6b\xf8\x67\xc6\x8b\x0e\x96\x9b\x80\x82\xc0\x35\x59\xff\
+\x3a\xd4\x4f\x17\x21\xb0\xfb\x49\x46\x01\xb2\x86\xef\x88\x35\xbb\
+\xe5\x58\x08\x38\x8c\xe0\x1e\x00\x61\x62\xd1\xf0\x03\xb0\xb9\x27\
+\xc0\xf8\x66\x25\x6a\x96\xa1\xff\x0a\x59\x40\x30\x96\x37\xbd\xa6\
+\xed\x6a\xe1\xbe\x81\xdd\x2c\x1f\x44\x05\x7f\x18\xf5\x83\xc0\x77\
+\x85\x6f\x75\xe0\x5b\xe4\x08\x00\x81\x78\x02\x20\xc0\x2d\x20\x7e\
+\xe0\xdb\x16\xd3\x05\x12\x30\x21\x70\xd0\x96\xc7\x81\x4d\x08\xff\
+\x72\x56\x77\x27\x8a\x46\x70\x11\x7c\x7f\x25\x6f\xea\x19\x5d\xef\
+\x12\x60\x21\x6c\xdf\x52\xae\xad\x7c\x2f\xb3\xdc\x79\xa8\x35\xed\
+\x35\xf5\xfa\xf2\xf7\xb2\x25\x1d\x9c\x52\xee\xb8\x9f\xd5\x20\x44\
+\x05\x15\xc0\x74\x4d\x99\xad\xe4\x32\x50\xb3\x56\x57\x5b\xb6\x7a\
+\x77\xa5\x25\xa7\x13\xcf\xb4\x4c\x20\x01\xce\x03\x09\x40\xef\xb3\
+\xc8\x84\xf1\xa9\x69\xf1\x37\xfe\x23\x46\xe9\xe4\xd0\xdd\xcb\x72\
+\xf3\x0d\x63\x6d\x10\xf4\xf5\x45\x90\x61\x32\xbc\xfb\xb3\x9b\xfd\
+\xb9\xaf\x9c\xed\xde\xb2\x9e\x59\x53\x09\xca\x59\xcd\x3f\x3d\x9a\
+\xf7\xc0\x93\xcb\x46\x4a\x42\xe9\xaf\x81\x57\x7f\x84\xf9\xfa\x7b\
+\x59\x60\x04\xb2\x64\xbf\xdc\xed\x0a\x03\xde\xde\x02\xf2\x35\x30\
+\xca\xbf\x0b\xcc\x1a\xd5\x20\x0f\x40\x31\x8a\x82\x81\x50\x73\x3c\
+\x53\x4c\x15\x33\xee\xbd\x35\x4f\x75\x30\xbf\xdd\x75\x79\x20\xda\
+\x1f\x6e\xf4\x8a\xbe\xed\x76\x21\xb7\x1e\x8f\xbd\x41\x4e\x51\xe4\
+\xab\xc7\xcb\x87\x70\x26\x81\x9b\x29\xe7\x14\xe8\x5b\x64\x20\x87\
+\xe1\x9a\x9f\xcc\xc9\x03\x51\x6a\xdb\x0d\xe5\xfa\xda\x9b\x99\xaa\
+\xb5\xa8\x5a\x5e\x4b\xdc\xae\xff\x2c\x73\xaa\xfc\x82\xad\xa9\x66\
+\x30\x95\x83\x5a\x05\xf4\xb2\x28\xac\x05\xe3\x60\xae\x96\x2d\xb1\
+\xda\xc8\x8a\x87\xb5\x8e\xc0\xee\x2b\xd9\x07\x77\xfb\x6b\xad\xb7\
+\x7a\xff\xee\x42\x1c\x8a\x87\x73\x02\x01\x88\x12\x45\xd7\x41\x8d\
+\x08\xb3\x07\x0a\x0f\x08\x04\x38\xa3\xd7\xf1\x54\xa2\x9b\x0e\x11\
+\xb7\xc4\x61\x62\x76\x17\x5e\x23\xdf\x8d\xbe\x4f\x17\x76\x1e\x2c\
+\x2b\x1b\x23\x39\x13\xf2\x66\x29\xf8\x43\x23\x31\xaa\x89\xba\xe7\
+\x39\x3f\x70\x85\x7b\x03\x15\xf5\x20\x0f\x20\x58\x77\xbb\x3b\x85\
+\xf9\x05\xfe\xaa\x86\xa1\x14\xf4\xe5\x07\x8a\x2b\x5e\x52\x54\x6d\
+\x5c\x4e\x05\x2a\x39\x13\x93\x7f\xd5\x03\x67\xd2\x99\xaf\x77\x2a\
+\x2d\xdb\xed\xca\x1f\x76\x13\x58\xd1\x77\xe0\x35\x22\xec\xdb\x6d\
+\x67\x7f\xda\xfe\xfb\xe1\xf5\x63\xd7\x00\x8d\x13\x26\xa4\xf9\x9f\
+\xbf\x38\x2d\xa6\xca\x39\xee\xb2\x04\xf7\xb3\xce\x79\xfc\x7c\xf5\
+\xdb\x62\xb1\x75\x57\x2c\xb4\xee\xa8\x6e\x00\x39\x29\xaa\x65\xb9\
+\x2d\xf1\xd3\xc5\x6f\x04\x77\x6a\x57\x83\xcf\x1e\xff\x27\x7e\xc1\
+\x1c\x53\x32\x1a\x67\x6d\x42\x5c\x9c\x2c\x8a\x13\x10\x9e\x2e\x34\
+\x3b\xfe\x5c\xad\xa3\xac\xb5\xec\xed\x36\x64\x78\x85\x0f\x5c\x8c\
+\x08\xde\x5b\x2b\x16\x4b\x00\x08\x74\xb2\x45\x5d\x02\xbb\x35\x25\
+\xde\x84\x4c\x59\x88\x9e\x5b\x23\x84\xa1\x51\x9c\xad\xe1\x7d\x6f\
+\x58\x18\x7d\x8c\x8b\x42\xe4\x48\x1b\x13\x67\xaf\x5f\xb3\x43\x01\
+\xc1\x82\xd1\x9c\xe9\x95\xb2\x06\x3b\x0b\x07\x32\x54\xdb\x03\x57\
+\xdb\x50\x7d\x08\xfc\x02\xff\x16\x21\x86\xb7\x7b\xd5\x97\x98\x2f\
+\x61\xe5\x00\xac\x6b\xae\x2a\x96\x6d\x55\x19\xc7\xcb\x52\x16\xdf\
+\x49\x37\x30\x1b\x07\x71\xf2\x71\x2f\x97\xb9\x12\x40\xca\xaa\x3f\
+\x96\xe3\x37\xa0\x10\x36\xfa\x16\x8f\x95\x98\x91\x39\x7d\x93\x9e\
+\xf7\x61\xea\xed\x7e\x4f\x6c\x86\xa4\x9e\x45\x70\x79\xaa\x6c\xcf\
+\x8c\xe4\x94\x0a\xd8\x30\x4e\x47\xe8\x1c\xdf\x0e\xea\xf6\x92\xb3\
+\xd0\xbe\xa3\x2d\x75\xee\x29\x8e\x0f\x35\x6b\x10\xa7\x30\x54\x15\
+\x75\x7b\x59\x83\x22\x86\xff\xb0\x71\xd3\x9a\x2a\xb8\xfa\x58\xf6\
+\x38\xb8\x06\x68\x0f\x40\x6e\x91\x35\x35\xf1\xca\xf1\xb1\x8e\xa9\
+\xad\xe9\x1d\xc7\xd3\xdb\xb6\xab\xb2\x6a\x61\x5a\x99\xfd\xb3\xf1\
+\x83\x01\x83\x5f\x6e\xd0\xd7\x8b\x25\x00\xe1\x57\x02\x38\x12\xe6\
+\xdd\x04\x56\xf7\x5b\x0e\x06\x14\x7b\x60\x62\x84\x6e\x29\xc3\xa2\
+\xc9\x7c\x10\x89\x58\xb8\x0f\x8e\xc5\xb3\x64\xa8\xe3\x41\xed\x57\
+\x77\x2b\xd8\xd0\x8f\x47\x49\x00\xa8\xcd\xe7\x43\x42\x2f\xdc\x07\
+\x6a\x80\x29\x40\xf8\x7a\x0f\xeb\x89\x51\x8f\x13\x2f\xc5\xab\x79\
+\x9a\xb9\x68\x29\xca\x04\x3a\x7c\x89\x82\x00\xe0\xbf\xc0\x5a\x37\
+\x36\x0a\x80\x10\xb0\xce\xbb\xee\xf8\x9d\x22\xff\x98\x99\xb3\x3a\
+\x44\x78\xe9\x87\x75\x8a\x4d\x79\x63\x75\x23\xe0\xb2\xeb\xab\x27\
+\xc6\x3a\x93\x85\x0c\xe4\xb0\xbd\xc9\x0d\xb6\x4e\x5b\x1e\x46\x7d\
+\x6b\xa9\x75\x37\xb3\x62\x3d\x52\xbd\x00\x42\x49\xf9\xb5\xf0\x8b\
+\xfe\xd2\x72\x6b\xba\x13\x58\xfe\xfd\xfa\xd5\x36\x14\x2a\xb0\x4f\
+\x60\xc2\xd4\x55\xc8\x0d\x10\xa6\xeb\x7a\xf0\xf2\xf1\x51\x1b\x88\
+\x1f\xcc\x55\x3b\xaa\x05\x02\x20\xb7\x56\xec\xe1\xe7\xdb\xd4\xb4\
+\x3d\x7f\x94\x70\x4f\x28\x65\x20\x01\xd8\xf8\xb1\x12\x52\x47\xbd\
+\x61\x53\x14\xa6\x0f\x99\xf7\xc1\x54\xa7\x3f\x7a\x58\xc1\x41\xb4\
+\x29\x8c\x15\xe5\xc0\x78\xb2\xf7\xf5\x27\x7e\x4a\xf7\xb2\x6c\x20\
+\x3f\xa6\x00\x0e\x96\x9c\xea\xa5\x9c\x5c\x69\xe3\xda\x3f\x16\xf8\
+\x3d\x4f\x15\x55\xcb\x13\x6b\x79\x21\xa0\xbc\xb3\xbd\x5d\xbf\x3b\
+\xaf\x39\xc4\x7f\x98\x87\xab\x9e\x5f\xcd\x29\xde\x6d\x8c\xfc\x45\
+\xa1\x68\xa7\x25\x71\xa4\x34\x1e\xd4\xc0\x24\x9c\x7c\x52\x7d\xee\
+\x2f\xd8\x2d\x07\x20\x40\x82\x87\x1f\x64\x48\xff\x98\x2e\xfc\x8e\
+\xdd\x5f\x12\x02\x66\xc2\xfe\x93\xe0\x64\x30\x90\xf1\xc3\xc7\x46\
+\x1b\xc7\x30\xf2\x5f\x98\x2c\x42\xe9\x51\x85\x4e\x74\xe8\x6c\xaf\
+\xd3\x5c\x6c\xdd\x0f\x7e\xb4\xf0\x95\xcc\x62\xeb\x8e\x81\x79\x3f\
+\x70\x3e\x0a\x0d\xe3\x70\x3f\x16\xe4\x03\xea\x3b\xab\x7f\x5b\x82\
+\x35\x05\x3b\xab\x97\x3b\x27\x4a\x17\x21\x1f\x91\xc2\x43\x15\x84\
+\xa5\x7c\x71\xba\xec\xe0\xdb\x76\xbe\xfd\xc1\x5c\x76\xad\xcd\xfd\
+\x02\x1e\x69\xe9\x33\xe3\x92\x38\xad\x81\x04\x80\x2d\x8f\x3e\x8d\
+\xfc\x50\x3b\x01\x45\x94\x01\x97\xf1\x76\x0a\x4d\xe6\xc1\x5e\x20\
+\xf3\x92\x3f\x3b\xa9\xc9\xae\xa4\xc1\x90\x11\x40\xe6\x17\x60\xd9\
+\xcd\x43\x67\xe9\xb6\x88\x93\x71\x17\x22\xee\xb6\x85\x2b\xa4\x71\
+\x01\x08\xc0\x4e\x1b\xbb\xb1\x9a\x2c\x81\x38\xdc\xe9\x04\xde\x9d\
+\x7b\x8a\xd7\x68\xfa\xca\xe2\xb2\xc0\x42\x3a\xc6\x43\xcc\xfe\x55\
+\xa5\xa5\x68\xe6\x75\x4c\x83\x21\x89\x57\x1b\x92\x39\xe2\xe8\x35\
+\xdf\x70\xc5\xda\x83\x15\x61\xb5\x6c\xd1\x70\x3a\xa8\xf5\xc6\x7c\
+\x77\xfc\x84\x0a\x91\xc0\x58\x2b\x0b\x79\xab\xbe\xa2\xf8\x8e\xa5\
+\x43\x16\x31\xbc\xb1\x6c\x88\xef\xab\x76\x6d\xb9\xd0\x7c\x70\x43\
+\xf3\xad\xb6\xae\x19\xb9\x90\xb1\x24\xf8\x12\x5c\x54\xf5\x87\xab\
+\x63\x66\x2b\x6f\x28\xde\xdd\x82\x14\xfa\xb1\x50\x8e\xf2\x2d\x77\
+\xcd\x58\xb5\xe6\xc5\x07\x6b\x37\xb4\x96\x53\x87\x2a\x34\x37\x45\
+\x0d\xae\x92\xeb\x3b\x6a\x23\x7f\x55\x7f\x58\x72\x94\xa9\xec\x35\
+\xb5\x90\x2d\x28\x79\x08\x06\x5f\x7e\xf9\x65\xb5\x84\xcd\x43\xe7\
+\x27\xcb\xe2\x83\xc5\x9a\x1a\xf8\x2d\x65\x05\x4b\x97\x84\x25\x38\
+\xad\x84\xda\x3d\x1b\x41\x31\x04\x80\x0d\xef\xfa\xed\x4c\x01\x62\
+\xe1\x14\x1b\xb0\x15\x7a\x89\xa3\x41\x54\x9f\xc1\x1f\x77\x6b\x66\
+\x7b\xf3\x86\x7d\x8b\xb8\xbf\x8e\xff\xa0\xad\x3e\xf6\xa2\x05\x96\
+\x4d\x89\x09\x3b\x5f\x62\x33\x1e\xa3\x5a\x94\x6f\x81\x76\x06\xcd\
+\x8e\x70\x7e\xfe\x9e\x67\xcd\xcd\x0b\xed\xdd\xf7\x02\x6c\x75\x41\
+\xc7\x84\x66\xa1\xa6\x76\xb0\x12\x70\x03\x39\xce\xa3\xb3\xde\x92\
+\x04\x80\x3f\xbe\x96\xc1\x36\x61\x17\x02\x30\x57\xd4\xaa\xd5\xc7\
+\x28\x71\x1b\x51\xd1\x7e\xd7\x6a\x15\x02\xc7\x11\x5e\xa7\x1d\x76\
+\x11\x02\x25\xc9\xa1\x21\xf8\x7a\x8a\x5d\x5d\x29\x7a\x58\x3a\x6c\
+\x2d\x3d\x44\xbd\xb9\x7a\xba\x0d\x07\x60\x82\xdc\x89\xdb\x0b\x23\
+\x19\x6c\xef\x17\x1f\x80\xaf\xa4\x12\x52\x88\xfe\x8a\x68\xfa\xab\
+\x19\x1b\xd2\xfe\x96\x5d\x07\xb1\x64\xdc\xa4\xfe\x16\x88\x79\xfd\
+\x86\x7e\x4d\xbf\xaf\x17\xd5\x9f\x89\x4a\x71\x54\x4c\x8c\x4f\x89\
+\xb3\x67\xcf\x8a\x91\x91\x11\xad\x58\xce\x69\x27\x46\xf2\x82\x7b\
+\x2b\xaa\x96\x23\x7c\x1a\x18\x38\x02\x2e\x86\x00\xe0\xa3\xf6\x70\
+\x2e\x01\xa8\xec\xed\x1c\xe1\x63\x5c\x38\xe7\x23\x20\xe3\x3b\x89\
+\x2c\x86\x43\xdd\xa6\x8f\x27\xdf\x23\x65\x98\x07\x59\xda\x64\x81\
+\x64\x4c\x15\x76\xe5\xb5\xac\x1d\x86\x9c\x0c\x14\xed\xa7\x60\xe7\
+\x0b\xbb\xfe\xe4\xfc\x7f\x57\x32\x8f\xc9\x44\x42\x0c\xa0\xf3\x5c\
+\xc5\x5b\x58\x0a\xec\x7b\x0f\x85\xfe\xde\x07\x01\xe6\xad\x80\xa6\
+\x0c\xf4\x70\x25\x82\xd7\x00\xa3\xb9\xf5\x5c\x80\x70\xfc\x24\x21\
+\xdc\x80\x2c\xf1\x9f\x67\x3d\xcd\x76\xee\x64\x99\x24\x70\x32\x73\
+\x5c\xf9\x5d\xb7\x9f\xb9\x6f\x43\x6f\xc0\xc1\x46\x9c\x46\x15\xbd\
+\x81\x99\x6d\x33\x2d\xa2\xde\x5e\x7e\x28\xdb\x2c\xdb\xcd\xf2\xbb\
+\x2e\x5a\x92\x0c\xeb\x12\xbd\x1d\x7c\x65\x32\x72\x4e\x58\x1b\x00\
+\x11\xa9\x8a\x91\xca\x88\x68\x36\xda\xa2\xdd\x6e\x8b\x52\xa9\x24\
+\xf2\x10\x2b\x7c\xf6\xfc\x84\xc8\xe9\x4a\xd0\xc6\x7e\x81\xb9\x5a\
+\x4b\xa5\x39\xb1\xc3\xee\xd8\x82\xcd\xb8\xd5\xdf\xa6\x18\x02\xd0\
+\x6d\x78\x1f\xb0\xfb\x13\xf5\xee\x87\x85\xaf\x47\xec\xdd\x6d\xbe\
+\x49\x06\x71\x54\x75\xc4\x4a\x8e\xb8\x39\xdb\xdd\x7d\x66\xf1\xe1\
+\x88\x2c\xd0\x29\x30\xe8\x3f\x9d\xda\xb0\xc9\xc4\x33\x17\x78\xec\
+\x80\xc7\xb0\xc9\x67\xe0\x79\x7d\xd0\xe5\x68\x78\x38\x5c\x44\x38\
+\xd0\x82\xc7\x06\x1e\x4c\xa5\xee\x62\x23\x03\x4c\xda\xb0\x62\x8b\
+\xb5\x7f\xd7\xa5\x62\x15\xfa\x58\xb7\x1f\xc3\x80\x93\x18\x2b\x64\
+\x7d\xc8\x1b\xbc\xd5\x66\x07\xb6\x1a\x40\x80\xa9\xee\xfc\x2c\x38\
+\xd9\x99\xb6\x36\x24\x86\x00\x10\xdf\xf8\xa1\x48\xe5\xe3\xdb\xbf\
+\x1e\x67\x73\xc6\x61\x69\x44\x5f\xde\x85\x3f\x9b\xe3\x6c\x7e\x96\
+\x31\x37\xbc\x94\xb9\xe0\x27\xfa\x48\x5b\x63\x6c\x88\xbe\x77\x0f\
+\xac\x03\x90\xbe\xe3\x38\xc1\x42\xc3\x72\x54\x55\x0d\x4a\x30\xeb\
+\x4d\x27\xd9\x7e\xfc\xc8\xeb\xde\xd5\x20\xcd\x79\x97\x21\x20\x65\
+\x29\x3a\xfb\x37\xa7\x6e\x32\x73\x58\x5b\xd0\xc5\xe5\x99\x11\x07\
+\x04\xa0\xb3\xd2\xe8\xe4\x97\x9a\x1d\x6d\xb5\xe1\x41\xd9\x6a\x97\
+\x0b\x7f\x8a\xd9\x85\x38\x14\x8f\x39\xf1\x04\x00\xe4\x4f\xb2\xdd\
+\x09\x95\x0d\x59\x4d\x46\xd8\x54\x80\x2c\x95\xaf\xbb\x37\xc3\x00\
+\xc8\x61\xae\x4b\x85\xb7\x16\x17\x65\x36\xa0\x9c\xad\x91\xf7\xf0\
+\x4d\x7f\x3d\xc2\x62\x7c\x98\xeb\x80\x5a\x2e\xd6\xdd\xc6\xb1\xec\
+\xa6\xe9\x64\x0d\x0e\x73\x67\xd9\x43\xe0\x1d\xa8\xac\xb1\x99\x42\
+\xca\x0d\xe6\xab\xae\x58\xb1\xe6\xeb\x45\xa7\x60\x16\xb0\xbf\x53\
+\x85\x64\x85\x66\x1d\xca\xd9\x8c\xf9\xa9\x0b\xd3\xad\xfb\x30\x28\
+\xfa\xf7\x37\xe7\x33\x6d\x07\xfb\x05\xf0\xf9\x87\x75\xe3\x03\xd5\
+\xc8\x0d\x95\x61\xdf\x1d\xec\x62\x09\xc0\x16\xa4\x1e\x9c\x3e\xf6\
+\x6d\x1f\xf3\x3e\x34\xab\xad\xa8\x35\x28\xdb\xf8\x46\x0c\x8a\xbd\
+\xdb\xef\xd0\x1e\x05\x6a\xf0\x6a\xc7\x76\x4d\x28\x8d\x44\x32\x00\
+\xf4\x09\x2e\xcc\xd3\x74\x17\x36\xa4\x29\xd8\xab\x23\x89\xe1\xe1\
+\xed\x2a\xbb\x0d\xb7\x83\x9a\x1f\xe5\x06\xd0\x19\x10\x8b\xcd\xbb\
+\xea\x98\x33\x22\xc6\x82\x31\x1f\xc7\x35\x50\x87\x00\xfb\x05\x54\
+\x05\xfa\x06\xaa\xed\xb8\x0a\x94\xbe\x84\xcd\x55\x01\xb9\xd9\xfa\
+\xa0\xb6\x66\x58\xbd\xe2\x71\x27\x9e\x00\xf4\xb0\x32\x3e\xb1\x1c\
+\xb5\x63\x47\x6e\x0e\xea\x48\x9b\x10\xce\x6a\xcb\x62\x7a\x3f\x83\
+\x1a\xd2\xcd\x03\xf9\x50\x22\xbc\x1f\x8e\x4d\x00\xf2\x2b\xd8\x6c\
+\x63\x2e\xd4\x5a\x63\x52\xe3\x66\x0a\x9b\x4b\xb8\xcc\x1e\xc0\x28\
+\xa0\x07\x5b\x60\xea\x04\xee\x57\x11\x71\x0d\x2f\x19\xb0\x3f\x75\
+\xdd\x0f\xf8\x1c\xc6\x32\xa9\x1f\x80\xf5\x1c\xf1\xc3\xc5\xbf\x2a\
+\x6a\x95\x8e\x5b\x19\x19\x71\xc7\xcc\x63\x58\x6b\x90\x8a\x54\xe2\
+\xec\x44\x39\x5f\xc8\x18\xe2\xe6\x52\x43\x34\x71\x62\x53\x07\xec\
+\x2e\x35\x12\x0f\x9b\x63\x95\xa5\xbc\x36\xa6\xe2\xb1\x04\x40\xce\
+\xbb\x29\x07\x48\x58\x06\xa4\x40\x27\x44\xe1\xc1\xb9\x87\x85\xa3\
+\x06\x09\xb8\x10\x82\x34\xe2\x17\xb6\xe6\xb3\x3e\xff\x67\x4b\xb6\
+\x86\x3f\xad\x37\x9c\x0e\x75\x6c\x5f\x3c\xaa\xb6\x60\x7b\x9e\x08\
+\xde\x75\x8a\x09\x0b\x21\xb3\x8e\x66\x7e\xbc\xa3\x38\xe3\x38\xd6\
+\xe7\xcb\x15\x4c\x0b\x10\x98\xd0\xe8\x28\x6d\x7a\xdd\x57\x08\xb0\
+\x3b\xd9\x7e\x5b\xdc\xa8\xfe\x54\x38\x0f\xeb\xc1\x27\x66\xfe\x43\
+\xbf\x62\x4e\xc0\xd2\x8a\xb4\xf1\x20\xc6\x0b\x19\xf1\x6b\x2f\x1e\
+\x0b\x6a\x1d\x4b\x2c\x34\x3a\x62\xb1\xda\x3e\x9c\x1f\x35\x81\x70\
+\xc5\x12\x00\xf9\x65\x86\x21\x5c\x62\x38\x03\x23\x3f\xe4\x3b\x4b\
+\x4a\xc1\xe8\x9b\x32\xec\x4f\xbe\x29\x68\x48\x8e\xbb\x1e\x1c\x55\
+\xa5\x83\x63\x7a\x30\x05\x08\xb0\xdd\xd6\x85\x3e\x80\x41\xe1\x1f\
+\xb4\x70\xa1\x90\x33\x89\x8d\x39\x75\xec\x2c\x8b\x66\x07\x4c\x71\
+\x38\xfb\xcb\xae\x03\xef\x80\x66\xc8\xaf\xc3\x01\xce\x72\x1b\x0a\
+\x14\x8a\xd4\x9a\xbd\x04\x83\x21\x79\xd8\x58\x80\xd5\x55\x68\x7b\
+\x40\xe1\x0b\x06\x58\x4d\x71\xac\x92\x77\xb1\x00\xaa\xac\xd6\x3a\
+\xfa\xb3\xb0\x34\xd8\xff\x39\xe2\x09\x80\x44\x4a\xce\x7c\xfb\xa3\
+\x6f\xbc\x8f\x46\xe7\x8d\x6f\xfb\x9f\x1e\x07\x6b\x13\xe2\x76\xeb\
+\xb2\xdf\xf8\xc4\x6a\xd4\x3a\xae\x0d\x93\x52\x4e\xa3\x63\x35\x8a\
+\xd9\xcc\x18\x18\x46\xec\x4c\xc9\x18\x81\x76\x96\xe6\x39\xd0\xa3\
+\x0a\x00\x00\xd6\xeb\x7a\xc4\x2f\x01\x80\xfd\xa0\x4a\xef\xf7\x05\
+\x02\x54\x9e\x6e\x79\x35\x6d\xa1\xdd\x54\x3f\x58\xfb\x41\x15\x32\
+\x00\x23\x0b\x43\x6b\x86\x46\x93\xaf\xdc\x81\x68\x88\x2f\x5e\x39\
+\xd9\xbc\xbd\x50\x53\x1f\xac\xb4\x0a\xd5\x96\xa5\x49\xf5\x80\xc3\
+\xf2\x59\x89\x56\x9b\x07\xd6\x3e\x48\xf7\xf1\xb2\x7d\x6f\x99\x66\
+\x5b\x7f\x51\x37\x1f\x0c\x8d\x88\x40\x0c\xbb\x86\x7a\xeb\x83\x09\
+\x80\xac\xbf\xac\x0f\xeb\xd7\xff\xb4\x3f\xf7\x75\xcb\x36\xe7\xeb\
+\xad\xfc\x5b\xb7\x17\xc7\x6a\x1d\xbb\xa7\xd2\x86\x4d\x39\xb0\xe2\
+\x7b\xce\xd1\x72\xbf\xd6\x80\x05\x5f\x2c\x07\x90\x08\xa4\xee\x30\
+\x40\x80\x44\x00\x9c\x80\xf2\xde\xca\x9b\xc5\x1b\x6b\x3f\xd4\x96\
+\xdb\xf7\xdb\x7e\x68\x57\x90\x8a\x16\x4a\xde\xd0\x8a\xd8\x85\x98\
+\xfb\xcc\x85\x99\x4e\x09\xf6\x08\x0c\x5d\x07\x0d\x08\xff\x0e\x42\
+\x9f\x4c\xaa\xc3\x7a\x3d\x07\x7f\x89\x78\x0e\x60\x70\xfc\xc7\x7a\
+\x1b\xa1\x68\x9c\x3e\x3a\xc3\x93\x1d\x63\x50\xce\xc0\x26\xf2\x6f\
+\xff\x9d\x03\xd5\x3c\x18\x92\x51\x1e\xae\x35\x8d\xe7\x2d\xc7\x2f\
+\x41\x50\x84\x6d\xc2\xa1\x61\x0e\x54\x4f\xd5\x5f\x82\x31\xd0\x6b\
+\xd8\x23\x4c\xf9\x09\x37\x07\xb1\xde\x83\x09\xe4\xfe\xb7\x26\xad\
+\x41\x08\x01\x8e\xf5\x50\x2d\x76\xd6\xf4\xa5\xf6\x3d\xff\x51\xf3\
+\x03\xa5\x9c\x99\xf4\xb1\xdb\x0b\xfb\x06\x4d\x2c\x0e\xaa\x7a\x21\
+\x63\xfa\xe7\x20\xf8\x7d\xfb\xe1\x32\xd6\x09\x1c\x61\xb7\x68\xde\
+\x1d\x5f\x37\x61\x74\x0d\xf3\xde\xdf\xdf\x75\x9c\x09\xf1\x68\x73\
+\x6d\xe2\x09\x00\x53\xca\xd4\xeb\x59\x6c\x4e\x2c\x59\x8b\x24\x00\
+\x20\x2c\x09\x71\x99\xb3\x44\x0d\xdc\xc4\x02\x92\xf9\x47\x7e\x9f\
+\x11\x89\x75\x75\x1c\x4f\xd4\x02\x3b\xb8\xb1\x58\x73\x5f\x3e\xd9\
+\x69\x17\x73\xa6\x52\xd1\xcc\x12\x16\x8f\x60\xa0\x22\xa7\x05\xc6\
+\x47\x11\x6b\xad\x43\xe3\x20\x4e\xfb\xdf\x97\x43\xd4\x4f\x09\xc0\
+\x96\xbe\x73\x00\x5f\x68\x58\xc6\x05\xf2\x9b\xab\xd6\x9c\x39\x96\
+\x3b\x6e\x8d\x66\xa6\xfd\xb2\x39\x2d\x35\x2f\x61\x7d\x4c\xbd\x3c\
+\x33\x5a\x38\x3f\xb9\x22\x05\xc1\x75\xec\xff\xa2\xd9\xb5\xa4\xee\
+\x7f\x20\x9a\x48\x24\xa3\x8f\x71\xb1\x04\x80\xeb\xa4\x30\x76\x01\
+\x94\x8b\x9d\x25\xc8\x70\xa9\x87\x2d\x27\x45\xfd\x25\xb0\x44\x2a\
+\xf7\xe0\xb2\x1d\x08\x49\x04\xef\x4f\xcf\xfb\xb0\xe6\x92\x80\x20\
+\x5c\x4e\x23\x36\x47\xd9\x87\x67\xa2\x32\xcd\x49\x2f\x37\x3b\xfa\
+\xf7\x6e\xce\xe5\x56\xa0\x4f\xfe\x85\x4b\xc7\x60\x06\x80\xc2\x3f\
+\x6e\x33\xe7\x51\x14\xaf\x65\x02\xe5\xa2\x0f\xc3\x5d\x0d\xd7\xfe\
+\x4e\x4e\xc0\x8a\x4f\xb8\x16\xb3\xf7\x84\xc0\xc3\x9a\xf5\xf4\xf4\
+\xb4\x8d\x0d\x2e\xde\xe7\x3e\xf7\xb9\xfa\xd8\xd8\x58\x60\x18\xd0\
+\x6a\xdd\xce\x77\x48\x80\x27\x85\x9d\xd0\x80\x14\xef\xbf\xff\xbe\
+\x31\x37\x37\xa7\xff\xf4\xa7\x3f\xcd\x57\xab\x55\x1d\xe5\x49\x2d\
+\xc8\xb8\xa4\x30\x21\xcc\xe3\x8c\x82\x73\xe7\xce\xb5\xcf\x9f\x3f\
+\x6f\x5f\xbc\x78\xd1\xae\x54\x2a\xf2\x7c\xae\x27\xad\x13\xeb\xe3\
+\x38\x8e\x52\xab\xd5\xc4\x37\xbf\xf9\xcd\xf2\xc2\xc2\x82\xbe\xbc\
+\xbc\x2c\xa7\x65\xa1\x70\x36\xae\x56\x83\xdf\x33\x8d\x87\x1d\x85\
+\x6d\xb7\x01\x4b\x42\x5f\x0d\x26\x73\x67\xc5\x87\xa6\xbe\xe8\x67\
+\xb1\x7d\x88\x1c\x02\xdd\x67\x2f\x4e\x07\xf7\x56\x9b\x58\x15\x68\
+\xc3\xa4\x58\x47\xc1\x81\x2c\x83\x33\x3b\x20\x6f\x25\x6a\x11\x7f\
+\x62\xea\x33\x98\x00\x74\x63\x47\x28\x18\x93\x16\x99\x0e\xeb\xd0\
+\x51\x0e\xf1\xf1\xc2\x18\x61\x09\xdd\x62\x37\x16\x37\xf0\xe5\xc6\
+\x28\x4f\xfb\x89\x1d\x17\x7b\xc6\x95\xa5\x7a\x5b\xc3\x89\xbd\xa2\
+\x81\xcd\x80\xb9\x6c\x86\xac\x22\xaa\x42\x4b\x55\x13\xe8\x2f\x79\
+\xcc\x02\x9e\xf3\x15\x15\x3b\x78\x48\xbe\xbc\x26\x80\xc0\x29\x25\
+\x7d\xbc\x5b\x87\x14\x96\x12\x15\x18\xac\x85\x11\x0b\x15\x5b\x7e\
+\x15\x8d\xfa\xf0\x1d\xf8\xf5\x18\x9b\x73\x61\xbd\x88\x70\x99\x4c\
+\x26\x00\x01\xf0\xaf\x5c\xb9\x62\xcf\xce\xce\x0a\xd3\x34\xe5\xfb\
+\xcd\xf1\x1f\xe7\x99\xc8\x46\xdf\x45\x68\x71\xf5\xea\xd5\x1e\x12\
+\x27\x21\x1b\xeb\xc4\x70\x6c\xb8\x71\x4e\x9c\x38\xe1\xbe\xf0\xc2\
+\x0b\xee\xe4\xe4\xe4\xae\x60\x0d\xeb\x63\x63\x83\xc4\xca\xca\x8a\
+\xff\xa3\x1f\xfd\xc8\x5d\x5d\x5d\x85\x46\x66\x58\xde\xe3\xb4\xad\
+\x3f\x2e\x51\x85\xf6\x05\x97\x3a\x0f\x61\x33\x20\x23\x3a\x6e\xd3\
+\xc7\xb2\x20\x54\x83\xa8\x11\xac\xc0\x14\x59\x56\x60\x15\x48\x4c\
+\xe0\x34\xa2\x46\xdb\x86\x1d\x46\x0e\x94\x07\xb0\x93\xf6\x37\x2a\
+\xe1\x7e\x30\x01\x40\x02\x39\xf2\xf2\x77\x07\x6d\x63\x12\x7e\xe1\
+\x70\x2f\x01\x4b\x8f\xcf\x84\x21\x21\x7d\x8a\x8f\x03\x10\x77\xff\
+\x98\xd7\xc1\x70\xac\xed\x83\xb5\xa6\x8a\x83\x38\xa0\x29\xe6\xfb\
+\xbf\x74\xe5\xa4\x98\xc1\x11\x61\xd8\xeb\x0a\x36\xc0\xc0\xba\x60\
+\x05\x97\x5f\xc6\xa9\xe1\xaf\x58\x81\xb7\xe8\x7a\xd6\xbf\x55\x60\
+\x36\x0c\xea\xc2\x0b\xe0\x06\x28\x20\x1c\x84\xc8\xcc\x15\x44\x04\
+\xac\xa8\x66\xbc\x60\x05\xd0\x2f\xc8\x55\x3e\xde\x28\x96\xbf\x97\
+\xcd\x17\xee\x63\x18\xff\x1e\xc2\xf9\xc9\x06\xa5\xc5\x6b\x38\x76\
+\x46\x10\x00\x1f\x08\xe7\x63\xd4\xcd\x8c\x8e\x8e\x8e\x00\x51\x7a\
+\xc2\xca\x30\xd6\xce\x7f\xcf\x9e\x3d\xbb\x88\x51\x37\x40\x19\xa4\
+\x48\x64\x2d\xe2\x2b\xd3\xad\x0f\x08\x80\x8f\x7a\x74\x8e\x1f\x3f\
+\x6e\x9e\x3c\x79\x72\x14\x1c\x40\x2e\x89\x68\x3c\x4e\xed\x40\x90\
+\xec\x89\x89\x89\x25\xe4\xa9\x90\xd0\x3d\x29\x01\x90\x1c\x2f\x5a\
+\x04\x03\x23\x50\x01\x6e\xb8\xa3\x99\x63\xf5\x57\xa7\x3e\x5f\xc8\
+\x68\xb4\x45\x80\x5d\xa0\x9a\xae\xcc\x8c\x96\xdc\x3f\xf8\xd4\x73\
+\xb5\x7f\xf3\xbd\xeb\x85\x5b\x4b\x35\xbd\x0e\x42\x20\x57\x83\x1f\
+\xa7\xe2\x4f\x29\xee\x3a\x7e\x0d\x2e\x30\x96\x00\x48\x9c\x45\x6a\
+\x69\x05\x66\x70\x5a\x09\xec\x58\xea\xc7\xb4\xe8\x8c\xdc\xa7\x9d\
+\xd0\x5f\x11\x07\x99\x33\x9e\x2c\x70\x40\x41\x8c\x20\xe3\x30\x8c\
+\x37\x07\xc3\xb1\xd7\x7b\xd0\xfd\xaf\xb7\x3b\xe2\xda\xa3\xd5\xa0\
+\x9c\x31\xdc\x63\x23\x85\xe0\xe3\x67\xa7\x4d\x0c\x79\xc4\xe2\xae\
+\xa6\xe0\xb8\xc1\x73\xfd\x84\xfa\x2f\x60\x2d\xa4\x86\x13\x41\xab\
+\x4d\xdf\xbe\x8b\xcd\xf4\x0d\xcc\x9e\x5a\xc8\x45\x4e\xb1\x30\xb8\
+\xf0\x3a\x02\x43\x35\xe3\x3a\xf6\x16\x60\x09\x6a\x3c\xaf\xf8\xe0\
+\x9d\x5b\x8a\x6b\x59\x9a\x63\x75\x8e\xd6\xa9\xb6\xfb\xfd\x95\xa9\
+\x29\xd8\xf1\xea\xda\xcf\x96\xbe\x5e\x9a\x2c\x9c\xea\x8c\x65\x67\
+\xd4\x89\xec\x09\x5a\x81\xc2\x81\x4c\x38\xa5\x31\x6b\x96\x3f\x7a\
+\x66\xd2\xe6\xf1\xe3\x6f\xdd\x5a\xcc\x58\x38\x1f\x61\x48\x57\xdf\
+\xc7\x26\xc5\xe3\x4d\x2c\x01\x90\x08\x19\x9f\x2e\x6c\x4c\x62\x38\
+\x02\x65\x38\x7f\x12\x06\x09\x06\x47\x7e\x13\x88\x42\xa2\xc0\xdf\
+\xae\x3c\x61\x53\xf8\x7e\x3f\x92\x36\x51\x3d\xb4\x06\xeb\x3b\x0f\
+\x6b\x2d\x58\xa2\x54\x82\x06\x84\x43\x39\x8c\xc0\xdd\x33\xfa\xb8\
+\x4f\x00\x98\x0d\x4d\x61\xbd\x80\x46\xd8\x68\x4c\xdb\x57\xcd\x0a\
+\xf6\xa2\xd6\x30\x76\x36\xd0\x04\xc0\x86\xfb\xd1\x38\x7d\x50\x46\
+\x03\x45\x9f\x06\x31\x98\x80\x8e\x11\xf6\x16\xe0\x38\xeb\x20\x58\
+\xd6\x21\x72\xb0\x29\x6f\xda\xef\xf6\x1e\xa5\xf2\xc9\xee\xe3\x7c\
+\x37\x05\x06\x47\xf5\x35\x6b\x2e\x30\x14\xc3\x1f\xcd\xcc\x40\xf1\
+\x5b\x4e\x05\x60\x50\x4c\xd5\x71\x20\xb4\x8d\x6f\x1f\xf0\xec\x41\
+\x17\xe7\x23\xc8\xc1\xee\xa0\x02\x29\xa6\xf7\xc4\x12\x80\x10\x2b\
+\xc9\xc8\x27\x21\x2f\x11\x73\x53\xce\x7c\xa4\xef\x9e\x19\x10\x06\
+\x6f\x8a\xd3\x07\x24\x19\x15\x09\x06\x71\x12\xb2\x64\x99\x1f\x7b\
+\x3f\xfe\x0e\x20\x9f\x45\x08\x59\x9e\xab\x5d\xbd\xbf\x9c\xbb\x35\
+\x5f\xa5\xde\xb8\xfd\xf9\xcb\xc7\xad\xe9\x4a\x81\x36\x04\xcb\x7d\
+\xac\x2e\x90\xd9\x80\xd9\x30\x78\xf5\x4a\x05\x34\x01\x90\xdd\x08\
+\x97\x90\xfd\x24\x27\x20\x5b\xce\x9f\x8d\x11\xfa\xe0\x96\xde\xee\
+\x3d\x04\x48\x04\x68\x53\xed\x1f\xe6\xfe\xa2\x38\x5d\x38\x87\x03\
+\x61\x26\x9d\x11\x73\x5a\xee\x17\x60\x57\x3c\x83\xfd\x02\xd0\x18\
+\x12\xf7\x56\x6a\xe2\xbd\xf9\x35\x51\xc7\x9e\x01\xb9\x69\x68\xef\
+\xab\xb6\xfd\x12\xd0\x83\x24\x6e\x91\x3d\x61\x6f\xa2\x97\xdd\x2b\
+\xcc\x22\x96\x00\x48\xf6\x7d\x33\x72\x6f\x2a\xb6\x8b\x96\x9b\xde\
+\xe2\x91\x58\xc1\xb4\x32\xfd\x30\x22\xc2\xf8\x51\xdc\x8d\x59\xc9\
+\x2c\x50\x63\x6c\xc4\x39\xd8\xd4\x15\xd5\xb6\xb1\x62\xe2\x42\x02\
+\xff\x83\xdb\x73\xc6\x1c\xf6\x0b\x8c\xc3\xb0\xc4\x27\x2f\xce\x34\
+\xce\x8c\x97\x4d\x8c\x10\x1c\xde\x61\x54\x38\x82\x3c\x4f\xb3\xda\
+\x8e\x53\x68\x80\x44\xb5\x21\x02\x84\x21\x70\xa9\x53\xb0\x9d\x54\
+\x69\x9c\xdd\x84\x80\x22\xda\xb0\x37\xb8\xd8\xbc\xa3\xfc\xc3\xa3\
+\xbf\x08\x3e\x35\xf3\x5b\x7e\xce\x28\xe3\x30\xd2\x9c\x34\x2d\x3e\
+\x55\xca\x8b\x5f\x7b\xe9\x4c\xe0\xb8\x37\xc5\x9d\x95\x86\x58\xae\
+\xb7\xb6\xf9\x6d\x77\xb3\x8e\xf1\x79\x85\x68\x48\xac\x1f\xec\x62\
+\x09\xc0\xe0\xe8\xdb\x7f\xcb\x22\x23\xdf\x3d\x27\x2b\x21\x71\x14\
+\x73\x6b\x45\x25\x0d\xe9\xcb\x2b\x21\x93\x7d\x0d\x22\xc1\xa4\x21\
+\xc9\x5a\xdb\x56\xee\xc3\x3a\x70\xb5\x6d\x29\xa7\x70\x7a\x2d\x8f\
+\xa4\x86\x15\xb1\xc0\x54\xf5\x00\xd6\xac\x03\xb0\x8e\x98\xcc\xd3\
+\xac\xa0\x24\x07\x1b\x3a\x0b\xf2\x60\x36\xe0\x24\x83\x00\x5b\x50\
+\x61\xa6\xda\x09\x56\xdb\xd8\x89\x66\x63\xc6\x00\xe9\x3e\x53\xf4\
+\x68\xc8\xbe\xb6\xf6\xa8\x14\x1e\x7e\x1e\xb9\x11\xcc\x6b\x0b\x9c\
+\x3d\xa0\x34\xdc\x2a\x56\x65\x0c\x15\xaa\xc2\x18\x48\xa1\x2a\x0c\
+\xda\x8e\x93\x8a\xc4\x44\x31\xe7\x43\x33\x54\xac\x34\x5a\xd2\x76\
+\xc0\xd6\x9e\xbc\x3f\x30\x1b\x56\x8f\x58\x02\xc0\x9e\xb8\x5d\x83\
+\x20\x52\x7e\x35\xb0\x7d\xe4\x11\x48\x08\x36\xf4\xf3\x0d\x31\xa3\
+\x0a\x46\xd7\x0d\x81\xbd\x87\x30\x97\xe4\x38\xbd\xc8\xfb\x7a\x43\
+\x04\x6d\x40\x6a\xd7\xb0\x2d\xed\xff\xfa\xfe\x7b\x46\x31\x97\x11\
+\x79\xd3\x08\xae\xcc\x8e\x5b\xc7\x47\x0b\xcd\x93\xe3\xc5\xd6\x58\
+\x36\x9b\xc9\x66\x0c\x58\xa4\x56\xb9\x71\x80\x4e\x22\x3d\x46\xfb\
+\x06\x74\xcd\xad\xe5\x66\xdb\xc1\x21\x9f\xb9\xc5\x6a\x5d\xfb\xf9\
+\x07\x77\xf4\xbb\xb7\x1e\x79\xad\xe5\x1a\xf7\xa9\x23\x6a\x3c\x2c\
+\x65\x4e\xe9\xcf\xae\x43\x80\x46\x60\x71\xfe\x80\xfa\xa8\x71\x23\
+\x7b\x6d\xe5\xcd\xea\x54\xee\x8c\x7a\x79\xec\xe3\x79\xae\x0a\xe0\
+\x08\x06\x88\x05\x75\xe5\x8b\x2f\x9c\x6e\x62\xab\xb8\xff\xbf\x7c\
+\xeb\x67\xa5\x86\x6d\x6b\xe4\x5a\x0f\xc2\x97\x1a\x86\x39\x31\x04\
+\x20\x42\x5c\x72\xf1\x49\x68\x17\x66\x1f\x07\x71\x99\x8b\x4c\x1f\
+\x9f\x47\x98\x03\x3b\xf6\xe0\x38\x61\x4d\xa2\x12\x06\xc7\x89\x42\
+\x0f\xca\x35\x6a\xb2\x8d\x9b\x3a\x46\x85\x8e\xed\x28\xd7\x17\x84\
+\xfe\x68\xad\x9e\xbb\xf6\xc8\xd0\x71\x34\x1d\xcd\x5b\x9b\xb0\x3e\
+\x23\xab\x8c\x68\x92\x1d\xc0\x9a\xb2\xb4\x3e\xd3\xc4\xf0\x8f\x91\
+\xc4\x6c\x41\xa0\x88\x55\x06\x8f\xab\x0d\x54\xca\x3a\x08\xae\x58\
+\x2c\x6a\x33\x33\x33\xfe\x2b\xaf\xbc\xd2\xc2\xba\x3e\x96\xe1\x6d\
+\x58\x0b\xe7\xf7\x1b\xec\x68\x7f\x0f\xcb\x73\xc1\xe5\xcb\x97\x5d\
+\x28\x28\x19\xb8\x3f\x08\x78\x31\xb8\xb2\x09\x6f\x59\x69\x7e\xa4\
+\x7b\x8d\xab\x99\xb6\xd7\x0c\x8e\x15\x2f\x5a\xe5\xcc\x84\x89\xcf\
+\xc8\xc6\xab\xb0\x1d\x90\x19\x2f\xe5\xfc\x17\x66\xc7\x9c\x77\xe7\
+\x97\x29\x0f\xc0\x21\x23\x14\x84\x25\x64\xfa\x34\x82\x24\x82\xc5\
+\x57\x22\x86\x00\xa0\x66\xb2\x17\x0f\x99\xbf\xcb\xc9\xbe\x9c\xf0\
+\x33\x41\x5f\x73\x64\xa9\x61\x1e\xd4\x28\x4c\xe2\x5b\x65\xb2\x6e\
+\xfc\xbe\x1c\xc2\x5b\xbe\x47\xfe\x51\x5d\x92\x97\x9c\xb7\xa4\xde\
+\xef\x17\xec\x34\xd2\x00\x25\xae\x77\x16\xab\x84\x75\x3c\xbc\xc3\
+\xa1\x9d\xcb\x4c\xf4\x58\x15\x44\xdf\x01\xea\x83\xf5\x6f\xc9\xe6\
+\xf3\xe5\x01\x70\xd0\x2f\xd0\x81\xf8\xce\x1b\x6f\xbc\xd1\x69\x34\
+\x1a\x16\x35\x0f\x25\xf5\x8a\xa9\x1b\x15\x87\x48\x20\xb0\xfe\xaf\
+\x40\x2b\x11\x1a\x12\xdc\x41\x7d\x18\x69\x00\x45\xb4\x9a\x78\xd4\
+\x78\x3f\x8b\x33\x07\xdd\xf9\xca\x2b\x8d\x8c\x9e\x07\x07\x80\x75\
+\x01\xac\x0c\x18\xba\x9a\x81\xf5\xa0\xe0\xc3\x67\xa6\x1a\x4b\xad\
+\xb6\xe6\x41\xf1\x0b\x1b\xc7\xba\x04\x40\x76\xf2\x18\x08\xed\xef\
+\xeb\x01\x1d\xb2\x8b\x8c\xec\x75\x14\xce\x25\x7d\xab\x18\xe1\x5d\
+\xaf\x49\xcc\x63\x58\xef\x95\xc5\x25\xc4\x43\x7a\x39\x31\xe6\xb5\
+\x97\xf1\x11\xb8\x91\x20\x89\x54\xa0\x36\x92\xd7\xfd\x6c\x3d\x08\
+\x40\x09\x5c\x80\x80\x36\x9f\xfc\x2e\xdb\xad\x0b\x89\x00\x31\x3f\
+\x89\x5b\xd8\x6e\x5e\xfb\x19\x4f\x55\xa0\xf9\x89\x4d\x43\x6f\x3e\
+\xf8\x77\x15\xe3\x64\xc6\x3e\x56\xb8\xe0\x16\x8c\x11\x72\x01\x30\
+\x0c\xa7\x29\x2f\x9f\x9c\x2c\xdd\x5b\xad\x09\xec\x20\x14\xef\x62\
+\xe3\x10\x55\x85\xf7\xb3\xe7\x86\xe8\x15\x8f\x39\x03\x08\x40\x04\
+\x5e\x99\x14\x3d\x2f\x9e\x02\x74\x63\x44\x09\x06\x5e\x87\xe1\xff\
+\xc0\x44\x7d\x2f\xc3\xf4\x61\x49\x07\x63\x56\xd5\x57\xb9\x3d\xbc\
+\xed\x41\x9d\x00\xd8\x0e\xa0\xf7\xb0\x2e\xfd\x59\x13\x89\xe1\xe4\
+\xa8\xde\xff\xfe\xa8\xdc\x53\xc7\x0b\xd6\x04\x45\xdd\x59\x55\xee\
+\xd6\xae\xe2\x34\x22\x5f\x9c\xaf\xbc\x0a\x35\x70\x1e\xc6\x8c\xf3\
+\x06\x21\x14\x7c\x7e\x16\x16\x06\xf3\x19\x71\x1f\x7b\x06\x56\x9b\
+\x6d\x65\x5f\x8d\x88\x0c\xe9\x3b\x03\x09\x00\xd3\x44\x9d\x2e\x49\
+\x13\x30\x8a\x13\xf7\xf1\xd7\xe5\x07\x32\xc7\x81\xd1\x64\xff\xc6\
+\x8f\xa4\x92\x31\xd1\x64\x1c\xcc\x04\x68\xca\xf9\xa8\x38\x6a\xd8\
+\x46\xb8\x7f\x54\xda\x7c\x18\xda\x49\xc2\xcc\x0d\x70\x1d\xbf\x29\
+\xee\x37\xde\x45\xbf\xf5\xc5\xf1\xe2\xc5\x20\xa7\x94\x78\xde\xa0\
+\x6c\xc2\xa5\xe9\xd1\x60\xba\x98\x13\x6f\xde\x78\x04\x19\x4e\x1b\
+\x27\x16\x63\xe8\x42\xd7\x65\xef\xed\x11\xf6\xa7\xd5\x58\x89\x32\
+\xf1\x3c\x48\xac\xf4\xa6\x8b\x92\x12\x31\xc3\xfb\x01\xbf\x44\x5c\
+\xf6\xd2\x18\x37\x20\x45\x42\x7e\x31\x99\x48\xb0\x45\x65\xf0\x7a\
+\xd4\x7c\x1c\x5c\xd2\xf7\xfb\x05\x01\x8e\xf4\x44\xf6\xb9\xd6\x0d\
+\xf3\x46\xf5\x87\xea\xfb\xab\x6f\xd5\x9a\xee\x9a\xe5\x06\x3c\xc2\
+\x05\x0e\x13\x9d\x62\x3e\x27\xfe\xe3\x4f\xbf\x58\x3d\x37\x31\x62\
+\x97\x0d\x1c\x40\x00\x0a\x10\x0a\x04\xf6\xbb\xff\x6e\x84\xda\x40\
+\x0e\x80\x51\x58\x4d\xce\x5e\x92\x06\x5d\xa9\xa2\x2b\x63\x6e\xcc\
+\x34\x7c\x8a\x1a\x4a\x21\xde\xe3\xd3\x3d\x59\x3e\x7e\x22\xfa\x12\
+\x12\x93\x41\xe5\x3c\x7b\xef\xe4\x28\x43\xb8\x4a\x16\x20\x19\xca\
+\xcf\x5e\xeb\x0f\x51\x8b\xf0\x89\x3a\x6e\x43\xfd\xa0\xfa\x83\xcc\
+\x68\x76\xc6\x15\x38\xaf\xb9\x6c\x8c\x61\x47\x18\x65\x1d\x8a\x32\
+\x92\xcf\x66\x2e\xcc\x8c\xfa\xa6\xa1\x39\x57\x1f\x2d\x99\x0e\x76\
+\x90\x72\x69\xfd\xa9\x3a\x16\x87\x32\xe5\x65\x40\xc1\xb1\x04\x20\
+\xea\x7c\x68\xcb\x80\x64\xe1\xab\xb8\x4c\x65\x68\x14\xc8\x6b\x7c\
+\x16\xa8\x1c\xc2\xa5\xe7\x4f\x9f\xeb\xbd\x23\x97\x01\x52\x24\x91\
+\x21\x29\xa3\xbe\xb4\x87\xfc\x56\x42\x42\xb6\x3f\x04\x8d\xe4\x1f\
+\xe3\xcc\x2a\x1d\xf2\xb6\x1e\xe6\xea\x73\x8b\xb0\xed\x77\xd4\x3b\
+\xb5\x77\x72\xa7\xca\x2f\xd6\xc0\x15\xf8\x25\x7d\x54\x6e\x18\xa2\
+\xa0\x04\x88\x9f\xbf\x3c\x3b\xd6\xc4\x29\x52\xfe\xed\x85\x55\xa3\
+\x89\xa9\x00\xb7\x91\x87\x04\xfe\xe9\xb4\xbc\xdb\x8d\x62\x0b\x8b\
+\x27\x00\x5c\x7e\xa3\x4f\x1c\xbd\x07\x37\x45\x8e\xd6\xe8\xb0\xfc\
+\x1b\xc6\x45\x10\xf9\x7b\x08\xbe\xa1\x9a\x12\x0d\x42\xda\x20\xdf\
+\x93\x10\x6c\x88\xf0\xcc\x3e\x48\x32\x27\x1b\x2b\x81\xd3\x25\x90\
+\xcf\x6c\x73\x0f\x77\xc3\xf0\x9d\x38\xaa\xbf\xbd\xf8\x8d\xe2\xbd\
+\xec\xcf\x83\x91\xcc\x94\x93\x37\x46\xb0\x60\x28\x6d\xc7\x2b\x17\
+\xa6\x46\xf3\x54\x17\x7e\x7f\x6e\x55\xb9\xb7\x5c\x83\x35\xa1\x26\
+\xb4\xbe\x88\x15\x4f\xc7\xb1\x1b\x25\x4d\xd3\x13\x08\x00\x2a\x38\
+\xac\x96\x49\xe1\xa4\x1f\xcc\x40\xd2\x90\xa4\x88\x49\x80\x88\xd2\
+\x6d\xbe\x26\xa5\x39\xfc\x61\x6c\x2d\xe7\x8b\xf2\x0f\x0f\x50\x32\
+\x3e\xfc\x8d\x7a\x86\x5b\x40\x82\x5d\xb7\x57\x54\x37\x70\x82\x0f\
+\xd6\x7e\x1c\x9c\xab\xbc\x22\xb0\x34\x08\x12\x60\xe2\x0c\x09\x0d\
+\xa7\x0b\x99\xe2\x63\xe7\x8e\x59\x54\x1a\x80\x8a\xb8\xd6\xb4\xac\
+\xae\x7e\xc0\xd3\x02\x8a\xec\x44\x12\x17\x37\x97\x18\x4b\x00\x42\
+\xca\x81\xce\x97\xc4\x7a\xb2\xa7\xd2\x87\x3f\x9b\xf3\x4e\xa4\x3c\
+\x32\x72\xb7\x5e\xa4\x50\x21\x95\x92\x99\x6d\xcc\xa7\x57\x11\x86\
+\xc9\xb1\x71\x63\xf8\xb3\xfa\xc4\xe6\x0e\x00\xc7\xb3\xda\xdc\xc3\
+\xdb\x2e\xf4\x49\xfc\xdb\x1e\x8e\x3f\x87\xb6\xe6\x07\x6b\x6f\x29\
+\x93\xb9\xe3\x81\xa1\x66\xb1\xef\xc3\x90\x81\xb0\x0a\x13\x7c\xe4\
+\xf4\xb4\x55\x6b\x75\x8c\xdb\x0b\x55\xa5\xdd\xb1\x34\xee\x1b\x39\
+\x08\x2e\x81\x00\xa0\x86\x44\xcc\x24\xa4\x93\xc8\x29\x87\xfa\x81\
+\x6d\x09\x71\x37\xb9\xa5\x32\x94\x3f\xf2\x66\x2b\x82\x47\x41\xe1\
+\x55\x46\x1a\x58\xd6\xb3\xf7\xb2\xcb\x01\xa4\x54\xe0\x50\x7c\x5a\
+\x18\x85\xc5\x66\x30\x5f\xb9\x53\x7f\x3b\x33\x99\x3f\xdd\x9c\xc5\
+\xa6\xa1\x33\xa5\x57\x8b\xa6\x86\xf3\x06\xa9\x38\xa1\x28\xa5\x17\
+\x4f\x4e\x75\xb0\x33\xb4\xf1\xa7\xff\x70\xb5\xd8\x80\xaa\x30\x85\
+\x82\x5b\x7b\xfc\xee\x36\x77\x18\xde\xc4\x12\x80\xb0\x1a\xc3\x10\
+\x6e\x58\x38\x89\x03\xe3\xc4\x34\xb3\x1b\x14\x76\x75\xc6\x1c\x94\
+\x5f\xf7\x1d\xa9\xc9\x91\x71\x80\x57\x7f\x7b\x01\x46\x42\x30\x06\
+\x8a\x47\x06\x2a\x07\xb9\xa1\xfc\x36\xec\xbf\xae\xef\x2a\x2b\xd6\
+\x03\x6c\x15\xd6\xc5\xb1\xc2\x65\xd7\xd0\xa0\xfb\x4c\x3b\x91\xa0\
+\x00\xc5\x8c\xa1\x4c\x8f\x14\x15\xec\x1c\xc4\xd6\x0e\x3f\xa8\xba\
+\xf2\xc0\x21\x99\x72\x2f\xdb\x16\x62\xce\x60\xfc\x89\xd7\x03\x40\
+\x07\x8c\x58\xf3\x61\xd7\xe4\xca\xa3\xe0\x90\x15\xd8\x7a\x25\xc2\
+\xf7\x3a\xfa\xe0\x0a\x6e\x28\xbb\x0b\x2a\xc6\x7c\xe6\x7d\x3f\xfc\
+\xbb\xed\x4d\x86\xf3\xd1\x0d\xe5\x00\x7b\x10\x1c\x6b\x41\xfd\x80\
+\x9b\xab\x3f\xce\xbf\xbd\xf4\xcd\xfc\x5c\xf3\x7d\xec\xeb\x6a\x43\
+\x0f\x08\x52\x3f\x38\xec\x0a\xcd\x1e\x1f\x29\x95\x3e\x7d\xf1\xa4\
+\x7b\x6e\x7a\xcc\xc3\x6e\x30\xd9\xe9\xf7\xb2\x2f\xf7\x10\x25\x06\
+\x40\xb1\x1c\x00\x11\x6f\x98\x04\x9f\xe1\x83\x46\xed\x5e\x83\xd8\
+\x89\x59\x83\xb8\xef\x83\x20\x19\x37\x5a\xe6\x1b\x54\x49\x12\x88\
+\x9e\x1f\x14\xe1\x19\x7e\xc7\x76\xfb\xbe\x06\x89\x91\x89\x95\x12\
+\x98\x08\x8e\x07\x65\x3f\x14\x80\x10\x24\xec\x1a\x36\x22\x21\x5d\
+\xe2\x32\x4e\x7f\xb2\x43\x79\xcf\xf6\x61\x47\xe2\x81\x3a\x8d\x95\
+\xab\x02\x2d\xbb\xa1\x7e\xf7\xd1\xff\x5d\x79\x43\xcd\xb8\xd3\xb9\
+\xb3\x4e\xde\x2c\x63\x1b\x24\x0f\x91\xd3\x95\x4f\x5d\x3c\x99\x41\
+\xc7\x57\xea\xad\x8e\xb8\xbd\x58\xa5\xd1\x17\x39\xd8\xee\xc9\x07\
+\x08\x11\x2c\x36\xeb\x58\x02\x10\xa2\x66\x6c\xba\xa1\x01\x2c\x97\
+\xd8\xcd\x3e\x9c\x24\xf2\x64\x78\xe8\x7a\x37\xd1\x8b\x90\x38\xe0\
+\x89\x71\x18\xba\x35\x46\x2f\xea\xe1\xbb\x21\x53\x88\x5a\x7b\x56\
+\x5b\x78\xed\xa6\xf0\x3a\x4d\x3c\x03\x6f\xbb\xc4\x92\xa3\x1a\xd8\
+\x44\xc5\x6b\x37\x34\xaf\x55\xd7\x85\x63\x71\x2e\x99\xd8\x4e\x86\
+\x73\xb3\x4d\xa7\xd3\x51\xd6\xd6\xd6\xd4\x77\xde\x79\x47\x83\x79\
+\x70\x1c\x59\x12\x6e\x3b\x8e\x12\x73\x07\x5f\x3e\x9f\x17\x85\x42\
+\x81\xbb\xf4\xd0\x2d\x93\xf3\x8d\xd2\xed\xc7\x95\x03\x11\xec\xfd\
+\xb3\x4d\x02\xe7\x10\x48\xb3\xe4\x7c\x17\xd5\x19\x44\x4e\x6d\xb7\
+\xdb\x06\xce\x03\xd0\x41\x08\x86\xc2\x88\x6d\x90\x69\xb1\x53\xd7\
+\x85\x89\xc6\xea\x3d\x6c\xd7\x5e\x53\x85\x9e\x05\xec\xbb\xfd\x8c\
+\x71\x58\x86\x06\x23\xc3\xc5\x49\xc3\xd6\x33\x38\xff\x11\x64\x98\
+\x49\x93\x3b\xe1\x3a\x1c\x39\x7c\x36\xec\x55\xb5\xda\x99\x0b\x32\
+\x6a\x3e\xc8\xe8\x39\xc9\x1d\x90\x36\xe7\x40\x04\xa6\xca\x05\xff\
+\xf4\xf8\x48\xf0\x70\xb5\xa6\xf9\x0e\xea\xc2\x4e\xbe\x0f\x2e\x81\
+\x00\x44\xb5\x79\x92\x8a\x81\x47\x40\xc3\x12\x73\x20\xd0\x93\x38\
+\x00\x54\x23\xe4\x23\x18\x31\xaa\xd3\xb3\x70\x65\x67\x09\x84\xb5\
+\xb2\x20\x1a\xef\xff\x54\x34\x6e\xbc\x23\x54\x83\x86\x02\xd7\x3b\
+\x11\x22\xf0\x81\xa3\x1b\x3d\x9e\x62\x67\x6c\x32\x98\x3f\xba\xae\
+\x8b\x07\x0f\x1e\x98\xf0\xe2\xc7\x3f\xfe\x71\xef\x7d\x74\xc3\xef\
+\x41\x64\xc2\xfe\x7c\xf1\xf2\xcb\x2f\x8b\x3f\xfa\xa3\x3f\xa2\x19\
+\xf1\x28\xf8\xc0\x5d\x61\x82\x5c\x7c\xf5\xab\x5f\x15\xb7\x6e\xdd\
+\x12\xdf\xfe\xf6\xb7\x65\xdd\x37\x55\x92\xd4\xad\x12\xbd\xdb\xd6\
+\x6e\x43\x80\xd1\xb1\x7c\xe1\x2c\xfa\xe2\xc7\x7f\xba\x1a\x25\xdd\
+\x70\x25\x71\x28\x4d\x1b\xf6\x4b\xbf\x5d\x59\x9a\x38\x9f\x1d\x07\
+\xfe\xc3\x5a\x73\xe2\x76\xee\x5e\xfa\xf0\x13\xfa\x38\x6a\x6c\x55\
+\xbc\xbb\xfa\xf7\x62\xbe\x7d\x57\x54\xb2\xbf\x2d\xb2\x5a\x11\x99\
+\x84\x9f\xf2\xc5\x13\x93\xce\xf9\xe9\x51\xeb\xda\xa3\xa5\xd2\x4a\
+\xb3\x2d\xdc\x8e\xb7\xe1\xc3\xf7\x32\x7b\xc2\x1b\xd2\x15\x7e\xf3\
+\x38\xe4\xd9\x06\x01\x78\x82\x1a\xc8\x72\x87\x60\x6d\x54\x37\x59\
+\xc9\xcd\x65\x85\xa8\x1f\x55\x7e\x08\x29\xd9\x9c\xf8\x40\x3f\x73\
+\x28\x89\xfe\xa2\xf6\x1d\xe8\x0a\xa7\x95\x7b\x6c\x08\x50\x53\xf0\
+\x51\xf3\xba\xb9\xd2\x79\x14\x4c\x17\xce\xd4\x66\xf3\x17\xb0\x42\
+\x70\xd2\xd4\x14\x83\x9c\x8a\x99\xd1\x75\xe3\xf7\x3f\xf5\x52\xf5\
+\xbb\xd7\xef\x9a\xdf\xbf\xf9\x00\x76\x06\x68\x05\xfa\xb1\x8b\x49\
+\x4c\x10\xa2\x57\x7c\xa6\xc3\x87\x94\xc4\xec\x93\x02\xa3\x42\x43\
+\xb4\x0d\x2b\x12\x76\xf5\xfe\xfb\xa4\x1c\xe4\x88\x1f\x45\xde\xf0\
+\x10\xbd\x3c\xe4\x57\x59\xfd\xf8\x65\xd4\x44\xd8\xa4\x81\x07\x1c\
+\x02\x1c\xd0\x69\x4a\xcc\x57\x1c\xaf\xad\x2c\xb4\xee\xaa\x75\x7b\
+\x31\x70\x7d\x18\x78\x94\x7d\x59\xce\x44\x54\x58\x8f\x56\xa6\x2a\
+\x45\x31\x5e\xca\x43\xd8\x03\x9b\x09\x7b\xd1\xcf\x13\xa8\xca\x9e\
+\x72\x00\xeb\xa8\x1f\xff\xad\x42\x14\x0e\x63\x0e\x8e\x45\x73\x58\
+\x9c\x4a\x50\xe4\xb8\x27\x5c\xd2\xe0\x8b\x43\x39\xb5\x00\x00\x39\
+\xfd\x49\x44\x41\x54\x62\xf7\xf8\x2d\x15\xac\x86\x4c\x28\xf7\xb8\
+\x06\x69\xf6\x4f\x03\x02\xe4\x02\x5c\x9c\x2f\x80\x55\x81\x12\x34\
+\x3a\x5b\x30\x2b\xde\x1c\x2f\x9c\xa4\x69\x71\xee\x17\x52\x26\xca\
+\x85\xca\xf3\x27\x26\x5d\xd7\xf7\xdc\x6f\xfc\xfc\xa6\x5a\xb3\x7c\
+\x85\xb2\x9f\xdd\xaa\x5b\x84\x5f\x71\xf9\xed\x11\x01\xe8\x16\x0b\
+\xca\x93\x40\x7c\x64\x9d\x18\x73\x9d\x2f\x90\x0f\x1b\x7f\x64\x56\
+\xf8\x61\x46\xbb\x06\x96\x8d\x45\xec\xcb\x13\x08\x5a\x48\xec\xbb\
+\x6d\xdb\x97\x4a\xa4\x85\x3e\x1d\x08\x70\xbf\x80\x27\x60\x40\x24\
+\xeb\xf9\x8e\xf1\xd9\xe3\xbf\xe7\x64\xf5\x12\x8f\x1a\x23\xfe\x29\
+\xa7\xc6\x2a\x5a\x29\x63\xaa\x37\xe7\x57\xd4\xbb\xcb\x55\xb1\x06\
+\x99\x00\x87\xbb\x5d\x71\xcc\x26\x01\x09\xf7\x88\x00\x6c\xaa\x7a\
+\x42\x05\x18\x93\xc1\x32\xca\x96\x36\xcb\xda\x33\x86\xfc\xdf\x2d\
+\x98\x6c\xaa\xdd\x3e\x3e\x6e\x69\xf0\x3e\xd6\x25\x2d\x7a\x4f\x21\
+\x80\x4f\xdd\x72\xd6\xd4\xc5\xd6\x6d\x65\xa9\x7d\xcf\x19\xcf\x1d\
+\x53\x8b\xc6\x04\xe6\x01\x58\x15\x30\x75\x58\x7c\xce\x2b\x17\xa6\
+\x47\x3d\x1a\x90\xc5\xe9\x52\xaa\x83\x95\x9a\x5d\xe9\x1d\x43\x32\
+\xd9\x53\x02\x10\xae\x00\x24\xd7\x20\x44\x7e\xc6\x19\x1c\x2f\x22\
+\x0e\xeb\xf1\xf6\xf4\x33\x3d\xb5\xcc\xb9\x14\x25\xdb\x84\x76\xcb\
+\x96\x3f\x4b\xdc\xcd\x53\x83\xe2\x61\x29\x88\x1a\x00\xdc\x2f\x60\
+\x89\x95\xce\x9c\xf8\xd1\xc2\x57\x94\xcb\x63\x9f\x54\x2e\x8e\x94\
+\x70\xae\x00\xcc\x07\xc0\xf1\xec\x98\xdf\x7c\xed\xc5\xa6\xa9\xbf\
+\x67\x2e\x34\x9a\x99\xd5\x7a\x1b\xc7\x69\x0c\xc6\x89\xc7\x6a\xb5\
+\x44\xad\xf8\x29\xf6\x9e\x12\x00\x59\xd1\x61\x8d\x88\xda\x18\x5d\
+\x37\xb5\x2e\x22\x22\xb2\x09\xcf\x80\x4e\x0b\xdb\x41\x90\xe4\x4d\
+\xcd\xe7\xa1\x21\x67\xd5\x49\xe7\xe6\x5c\x5e\xaf\x79\x81\x4e\x8b\
+\x52\x29\x1d\xd8\xd4\x01\x9e\xa1\x47\x12\x7d\x0f\xf2\x80\x7b\x8d\
+\x77\x33\x19\xbd\x60\x67\xd5\x42\xe7\x54\xe5\x85\x82\xae\xd0\x52\
+\xb2\x4a\x84\x2f\xbc\x7c\x72\xca\xc6\x7e\x81\xda\x9f\xbf\x85\xfd\
+\x02\x38\x64\x86\x07\xc4\x3c\x09\x08\xe4\x20\x23\x89\xc0\xe0\x5c\
+\xf6\x8e\x00\xc8\x42\xf1\xc3\x1a\x84\x0b\xa3\x5b\x6a\xc0\x28\xa1\
+\x93\x91\x71\xbb\xfe\x26\x0a\x89\x5e\x49\xc4\xe9\xbd\x3c\xfc\x37\
+\x19\x9c\x09\x50\xce\x66\x83\x19\xb3\x10\x2c\x80\x10\x48\x02\x77\
+\xf8\x9b\x95\xb6\x60\x08\x04\xf8\x9d\xdb\x6e\x4d\xad\xda\x8b\x62\
+\xd9\x7a\xe8\xcf\xfa\x17\x7d\x15\xe7\x0d\x6b\xe1\x61\x51\xda\x68\
+\x31\xa7\x9c\x99\x18\x09\x4a\xb9\x8c\xef\xf8\xbe\x6a\xb7\xc2\xad\
+\xe0\x3b\xed\x1f\x03\x30\x6a\x43\x0d\xf7\x8e\x00\xa0\x18\x8e\xde\
+\x49\xa7\x0b\xb1\x72\x72\xb7\x71\xa2\x2a\x64\x02\x71\xd8\xd0\x94\
+\x83\xff\x20\x69\x21\xaa\x89\x39\x9f\x38\x3d\x39\xa2\x5e\x39\x3e\
+\xa9\x9e\x54\x3a\xfa\xca\xf5\xb7\xc5\x0f\x60\x4e\xce\x38\xb8\xfa\
+\x38\x07\x1f\xb8\x87\xa4\x86\xe4\xf0\xa0\x07\x20\x1e\xd6\xdf\xcb\
+\x2e\xb7\xef\x66\x66\xf2\x67\x57\x21\x0f\xc8\xc0\x7e\x00\x4d\x89\
+\xa9\xa5\x5c\x36\x9b\xc5\x9e\x81\xcf\x5d\x39\x6b\xdd\x59\x5a\x0b\
+\xfe\xee\xbd\xdb\xaa\xe7\x72\x55\x60\x18\x2a\x27\x01\x20\x1e\x87\
+\x9e\x88\xbd\x48\x2a\x92\x61\x54\x87\x0c\x5d\x7f\x05\x36\xde\x93\
+\xb2\x51\xe2\xb9\x1e\xb7\x9b\xa4\xff\x42\xcc\xe1\x18\x79\xc8\x3d\
+\x2d\x32\xf0\xd8\xf0\x53\x13\x23\xfe\xab\xa7\x67\x83\x4f\x5e\x38\
+\x29\xdb\x84\x8d\x61\xfd\xad\x4d\xef\x8f\x00\x04\xd8\xe3\x21\x13\
+\x50\xbe\xff\xe8\x2f\xca\x37\xab\x3f\x36\x2c\x88\xff\xd0\xc9\x89\
+\x30\x38\x43\x52\x13\xaf\x9d\x3f\x69\xc0\xeb\xc7\x46\x60\x6d\x18\
+\x87\xc4\xd0\xed\xa8\xff\x4b\xec\x8a\xf0\x50\x66\xb3\xe1\x67\x0f\
+\x39\x80\x08\xd1\x93\xd7\xef\x89\xdb\x68\xda\x86\x4a\x45\x0f\x5d\
+\xbc\x0f\x43\x07\x47\x89\xa2\x1e\x8a\x2b\xd6\x7d\x21\xf4\xd1\xc4\
+\x64\xb9\xe8\x4f\x95\x0a\xea\x78\x31\xaf\xdc\xa1\x79\xa8\x10\x08\
+\x87\xa2\x0d\x69\x25\x9f\x14\x02\x5d\x29\x0f\xfa\xb3\x8f\xbf\xe5\
+\xce\x03\x7d\xb5\xb3\xe0\x34\x61\x3f\x00\x47\x8e\x62\x22\xa0\x4b\
+\x39\xd0\x58\x31\xa7\xb6\x6c\x5b\x4c\x97\x0b\xc1\x62\xb5\xa9\xf0\
+\xac\x41\xef\x49\xfa\x49\x0c\xfe\xec\x2d\x07\x80\x0a\x0f\xa5\x5a\
+\x00\x02\x41\x11\x8b\x04\x51\x1e\x88\x45\xe5\x99\x43\xe9\x41\xc2\
+\x70\x72\xbc\x28\xe4\x32\xde\x85\xe9\x31\xeb\xb7\x3f\xf6\x62\xf3\
+\xca\x89\x29\xe7\x49\xbb\x52\x9a\xfe\x10\x43\xa0\x4b\x07\x6a\xce\
+\x92\x80\x69\x71\xe5\x87\x73\x5f\x56\x70\xe2\x10\xa6\xcc\x50\x14\
+\xec\xba\xd9\x91\x92\xf7\x87\x9f\xfb\x68\x6d\x66\xa4\xe8\xe7\x73\
+\xd8\xd8\xb9\x93\xfe\x8f\xbc\x62\x71\x0b\x61\x7b\xc0\x01\x80\xd4\
+\x90\x52\x49\x45\x17\x92\x9d\x18\xd2\xd3\x6d\xa4\x0c\x96\x51\x36\
+\xc5\xeb\x26\x95\x59\x91\x08\x50\x4e\x70\x18\x65\xe4\x68\x07\x65\
+\xa0\xa3\xb9\x9c\xf7\xfc\xb1\x49\xef\xa3\xe7\x4f\xf8\x63\xa5\x1c\
+\x4e\x06\xa6\xd1\xc8\x40\x5c\xba\x7c\xc9\xfb\x9d\x7f\xf6\x2b\xde\
+\xc7\x7e\xf1\xb8\x3f\x67\x7f\x37\xe3\x09\x07\xd1\x35\xb9\xef\xc7\
+\xc7\x16\xb1\xc6\x9a\xeb\x5c\x7b\xb3\x66\xaf\x2d\x79\xea\xdc\xcd\
+\x4e\x1e\xd2\xa2\x44\xc7\xb3\x08\x4f\x9f\x3e\x6d\x4f\x4d\x4d\xf9\
+\xbf\xf1\x1b\xbf\xe1\x62\x37\x60\x0e\xbb\x01\x37\xa4\xea\xdf\x0d\
+\x88\xc3\x3a\x13\xf3\xdb\xef\x40\x9c\x25\x28\xbe\xf8\xc5\x2f\xca\
+\x4d\x40\x68\xcf\xa0\xdd\x80\x1e\x76\x03\x36\xfe\xec\xcf\xfe\x2c\
+\x7b\xff\xfe\x7d\xf5\xd1\xa3\x47\x14\xa9\x03\xe6\x5d\x0c\x1b\xd4\
+\x00\x8c\x39\x46\x4e\x15\x66\x59\x15\x97\x7e\xa1\x24\x32\xa5\xd8\
+\xdd\x80\x26\x76\x03\x4e\x68\x86\x30\xb7\xb1\x0f\x6b\x50\x49\x43\
+\xdf\x71\x4f\xe8\x9a\x35\xa7\xb5\xbc\x86\x3a\x53\xb8\xd0\x3a\x56\
+\xbc\x64\x8c\x9a\x33\xa6\xaa\x42\x31\x18\x66\x86\x60\x4f\xb0\xf8\
+\x1b\x1f\xbd\xd2\xa0\x92\xd0\x5f\xfe\xf8\x5a\xc1\xf5\x3c\xac\x16\
+\x0c\xcd\x76\x3d\x42\x88\x40\xeb\xcf\x9b\xee\xf6\x80\x00\x6c\x2a\
+\x81\x8f\x43\x6a\x2c\x83\xd1\xa8\xad\xed\xe2\x9b\xc8\x93\x53\xd8\
+\x53\x86\x85\x35\xdd\x7d\x47\x95\x5f\xcc\xe1\xca\xb9\x4c\x30\x89\
+\x2d\xa0\xd3\x95\x12\xe6\x78\xaa\x1e\xf6\x4f\x45\xe4\x8b\x99\x60\
+\xe6\xe4\x88\xc8\x4c\xcd\x04\x66\x23\x0f\xb5\x51\x4b\xb2\x81\xf8\
+\xfe\xc2\x75\x82\xa0\xba\xe8\x78\xf7\xdf\x6b\xbb\x9d\x96\x87\x73\
+\xe7\x09\x8b\xf8\x8e\xcd\x70\x1e\xc6\x09\x31\x52\x00\xc4\xf7\x5f\
+\x7c\xf1\x45\x6f\x62\x62\x22\xd8\x84\xff\xbb\xdf\xc6\x3d\xcc\x91\
+\x88\x8c\x53\x85\x63\x4b\x00\x31\xf3\x5b\xad\x96\xf3\xad\x6f\x7d\
+\x4b\xc7\xb6\x61\x2c\xa7\x00\xde\x49\xc8\x8f\x9c\x24\x1c\x71\xe0\
+\x85\x8e\x1d\xfa\x95\x93\xa6\xc8\x8d\x6a\xc2\x2c\xa8\xe1\x0c\x7c\
+\x63\x49\x04\x76\x28\x9a\xdd\xda\x39\x37\xc6\xdc\xf1\x93\x22\x1c\
+\xdf\x52\x3c\xdb\x85\x82\xd0\x43\xbf\x6c\x4c\xfb\x25\x63\xdc\xc7\
+\x64\x00\x66\x84\x78\xd4\x98\xa6\x9e\x9c\x1c\xf1\x2d\xcf\x15\x38\
+\x81\x38\xa8\xb7\xc3\xb3\x05\xb6\x5f\x1d\x0e\x9c\xf1\x6e\x8f\x08\
+\x00\x91\x15\x05\xe3\x63\x48\xb1\x46\x7c\x9f\x0d\x3f\x06\xa7\x01\
+\xfc\x70\x03\xeb\x89\xea\x23\x8c\xf9\x0d\xfa\x42\x03\x93\x1c\x90\
+\x97\x6c\x3f\x46\x7a\x51\xcc\x98\xe2\x85\x93\xd3\xfa\x4b\xa7\x66\
+\xf4\x8b\x33\xe3\xd4\x02\x97\x4d\xe2\xfe\x86\x9a\x7d\xcf\x5b\xe8\
+\xfc\x50\x7b\xd4\x7e\xcb\xf4\x85\x8b\xce\xdb\x3f\x58\x93\x78\x08\
+\x0f\x4a\xe3\x36\x6e\xb6\xfd\xad\x50\x2e\x3f\x80\x87\xad\xc1\x36\
+\x3a\x51\xfe\x80\x80\x63\x4f\xaa\x81\xf6\x05\xe0\x62\x20\x40\x13\
+\xd9\x3d\x29\xe0\x29\x64\x2a\xed\x40\xa0\x9c\xb7\x97\xbf\x52\xf2\
+\x03\xbb\x5d\xd0\x4b\xb5\xb1\xfc\xb1\x12\xfa\x02\xb7\x0b\xa8\xb3\
+\x95\x52\x05\x7b\x91\xfd\xcf\x5f\x39\x67\x7f\xed\xed\xf7\x33\x2d\
+\x9c\x3a\xec\x85\x46\x86\x86\xd7\x8e\xb8\x23\xbb\xc3\xe0\xa8\x7b\
+\x3b\xa4\xb2\xec\x21\x7f\x12\xaf\x65\x3c\x89\xe2\xbd\x5a\xe2\x15\
+\x83\xe4\x6f\x94\x47\xf8\x26\x0a\x39\xf8\x57\xd6\x70\x04\xf6\xdf\
+\x66\xc6\x4a\xc1\x87\x4e\xcf\x88\xe3\xa3\x65\x89\xfc\x6c\x95\x1f\
+\x58\x81\xed\xaf\xf9\x4b\xd6\xcf\x45\xdd\xbd\x8f\x91\xbf\x85\xb7\
+\x64\x08\x07\x93\x41\xa6\x49\xdd\x60\x08\xc8\x11\x7d\x70\xd0\xa1\
+\x79\xcb\x3e\xce\x55\x81\xf9\xe6\x2d\xf3\x5a\xf5\xfb\xd9\x8e\x57\
+\xf7\xbc\xf0\xa8\xb1\x80\x54\x00\x7a\x01\xea\xab\x67\x8f\xeb\x30\
+\x24\xa2\x80\x9b\xec\xb6\x6b\x38\x0e\x44\x31\xe2\x00\xb1\xed\x51\
+\x25\x2e\x83\xb8\xf7\x61\xc1\x68\x96\x1c\xd9\xe3\x3b\x35\x1b\x2e\
+\x31\x9d\x09\x06\x38\xae\x21\xd0\x85\x44\x60\x40\x84\x03\xf8\x2a\
+\xac\x31\xd8\x37\x90\xd7\x13\xa3\x65\xff\x24\x14\x3b\x5e\x3a\x39\
+\xa3\x9b\x98\xcf\xd2\x71\x80\x76\x82\xa6\xdf\xf4\xe6\xfc\xc5\xf6\
+\xdb\x38\x68\x72\x49\x0a\x7f\x38\xf7\x4f\xdd\x51\x84\x40\x88\x1f\
+\x5c\x0d\x5e\xb2\x1e\xe8\x9d\x95\x96\x7e\xb6\xfc\x62\xbb\x62\x4e\
+\x06\x45\x73\x5c\xe2\x28\xec\x09\x2a\x57\x8e\x4f\xe9\xe7\xa6\xc6\
+\x03\x72\x95\xd5\x76\x47\xae\x0c\x48\xfc\x49\x00\xd9\x3a\x5a\xad\
+\xdf\xf5\x47\xdf\x33\x02\xc0\x42\x24\x65\x06\x01\x18\x5c\x74\x58\
+\x0d\xc6\x21\x92\xc7\x52\x71\xc9\xc2\x20\x07\xf9\x1f\x4f\x48\xfa\
+\x1b\xb5\xdf\xf7\x54\x7e\xa2\x05\xa9\xe3\xe3\x15\xfb\x4b\xaf\x3e\
+\x67\x9d\x9f\x1a\x0b\x74\xc3\x28\x53\x1a\x28\x91\xdf\x6f\xdb\x6b\
+\xce\x6d\x67\xb1\x73\xd5\xad\xba\x77\x60\xcd\x06\x67\x47\xa6\xc8\
+\xbf\xdf\x9f\x6d\xdf\xcb\x67\xef\xee\xb8\x4d\x79\xc6\xc0\x0f\xe7\
+\xff\x4a\x99\xca\x9f\x57\x3e\x3a\xfd\x2b\xf2\x80\x91\xa8\x72\xff\
+\xf4\x8d\x8f\xd6\xaf\x3f\x58\x54\xff\xe7\xaf\x7c\xa7\x50\x07\x11\
+\x80\xbd\x81\x28\x68\xe0\x55\x0e\x9c\xc4\x21\x4e\xb3\x25\x26\xf2\
+\x7e\x1d\x8f\xf6\x76\x0a\x20\xab\xc4\x02\x93\xbc\x8c\x14\xf3\x13\
+\x12\x8f\x90\x44\xb0\x01\x07\xdf\x13\xc1\xb3\xba\xea\x57\x0a\x19\
+\xef\xf9\x93\x33\x1e\x0c\x3e\x18\x85\x6c\x26\x43\x1d\x00\x36\x00\
+\x6d\x71\x9b\xfe\xbc\x5b\xb5\x6e\xa9\xab\xd6\x7b\xe0\xe5\x36\x7e\
+\x90\x18\x40\xa4\xaf\x8f\x10\x04\x60\x33\x1c\x27\x0f\xdf\xd5\x1f\
+\x36\x6e\xa8\xd0\x13\xe8\xe0\xc4\x21\xae\x81\xb1\xa3\x60\x0f\x89\
+\x9e\x81\x69\x71\xfd\x53\x97\x4e\xb5\x2b\x85\xac\x07\x19\x11\xde\
+\xc7\xe3\x05\x07\xd6\x30\xe5\x60\x00\xee\x29\x07\x10\x76\xee\xc1\
+\x05\xaf\xbf\x8d\x88\x03\xdf\xc8\x36\xf6\x82\xc2\x8a\xa3\x01\xdd\
+\xf6\x05\x4f\x81\x5c\xf5\x0a\xdf\xe1\x0d\xeb\x5c\xc8\x9a\xc1\x58\
+\x31\xef\xbf\x74\xf2\x98\x37\x56\x2c\x40\xf3\x37\x5c\x86\xe3\xa7\
+\x80\x45\x18\xbf\xee\xdc\x77\x57\x9d\x5b\x99\xaa\x73\x27\xa3\x09\
+\x4e\x0b\xd6\x29\xf2\x0e\x8b\x4d\x93\x3d\x23\x10\x88\x64\x40\xab\
+\x9d\x47\x3a\x6c\x08\xb8\x8f\x9a\x37\xac\x72\x66\xd2\x80\xad\x43\
+\xae\x0a\x72\x41\x29\x33\x5e\xcc\xba\x9f\x7d\xe1\x42\xf5\xc6\xdc\
+\x92\xd1\x68\x77\xd4\x8e\x47\x04\x89\x71\x12\x89\x36\xe2\x55\x7f\
+\xcc\x3d\x26\x00\xfd\x45\xed\xf0\x5e\xd2\x07\xfc\x44\xd7\x1d\x66\
+\xb3\xd7\xc9\x48\x69\xf9\xf1\xb2\xa6\x26\x9e\x3f\x36\xa3\x61\xde\
+\xaf\xbd\x72\x7a\xd6\xc8\x99\xdd\x79\x3f\xbe\x51\xc7\x5f\x09\xaa\
+\xce\xad\xe0\x83\xea\x5f\x96\x41\x06\xb0\xa8\x49\xf0\xa7\xc8\xbf\
+\xd7\xdf\xe6\x30\xe6\x4f\x4b\x42\x30\x2a\xaa\xbf\x39\xf7\xe7\xe5\
+\x31\x73\xba\x3a\x9a\x9b\x55\x21\x0f\x28\xa3\x8f\x29\xd8\x2b\xa0\
+\x9f\x9d\x1a\x1b\x7b\xe3\xc5\x0b\xce\xf8\xbd\x39\xe7\xcd\x6b\x37\
+\x4d\x4e\x3b\x25\xae\x6f\x6e\x2c\x5f\x0e\x0c\x08\x23\x1e\x86\x31\
+\x35\xc4\x7d\xd6\x57\x12\x81\x03\x7a\x45\xb5\xb0\xba\x27\xa6\xca\
+\xa5\xe0\x85\x53\xd3\xe2\xc5\x53\x33\x02\x46\x1f\x59\x6b\x54\x1b\
+\x12\x5e\xbf\x1e\xd4\x9c\xbb\x10\xf2\xbc\x8b\x75\xdf\x06\x98\x36\
+\x2a\x02\xa6\xc8\x2f\x01\x94\xfe\x0c\x84\x00\x55\x85\x3b\x4e\x43\
+\xbd\xbe\xf6\x56\xf6\x66\xf5\xa7\x40\x72\x68\x86\x48\x24\x40\x5f\
+\xc3\xca\xc0\xa5\x99\x49\xed\xca\xf1\x19\x0d\xdc\x26\xf5\x05\xc2\
+\x3c\x36\xe3\x88\x7c\x1b\xa5\xda\x5a\xcc\x81\xe7\x00\xd8\x9e\x10\
+\x85\x28\x09\x38\xb8\x8e\xa8\x6c\x40\x4d\xef\xc4\x58\xc5\x7f\xe1\
+\xf8\x14\x38\x80\x51\xe0\x37\xdf\x92\x32\xbb\x20\x00\x55\xaf\x6a\
+\xdf\xf1\x97\xdb\xd7\xb0\xe4\xd7\x91\xdc\x42\xc4\xee\x1d\xdc\x56\
+\xa5\x35\xdb\x57\x08\x60\xe4\x46\xcf\x81\xaa\xf0\x8f\x72\x0d\x77\
+\xcd\xbf\x30\xf2\xa1\x4e\x4e\x1f\x01\x4b\x09\xec\x47\xd7\x02\x17\
+\xc0\x33\xc7\xc4\xec\x48\x19\xd6\x86\x10\x13\x53\x81\x50\x05\xa4\
+\xaf\xd6\x11\x41\xe8\x7b\xd5\x7f\x7b\xe0\x39\x00\xd2\xae\x90\x7e\
+\x51\x52\x4e\x36\xfb\x60\x79\x22\x38\xed\xbd\xc1\xb8\xa3\x7b\x76\
+\x66\xdc\xfe\xdd\xcf\x7c\xb8\x39\x35\x52\xf1\xa4\x2e\x2f\x20\xed\
+\x06\x36\x4c\xd0\xd7\xac\xf9\xf6\x0f\x5a\xcb\xf6\x55\xbf\xe9\xcf\
+\x41\xff\x8c\x60\x27\x71\x48\x5d\x0a\x81\x21\x10\x00\x11\xa8\x39\
+\x2b\x30\x2f\x7e\x43\xbc\xf9\xe8\xff\x51\xda\x5e\x95\x64\x21\x1c\
+\x17\x91\xf4\xd8\x68\xc5\xfb\x97\xbf\xf4\x7a\xed\xfc\xd4\xb8\x5b\
+\x82\xa6\xe0\x66\xfc\xa0\x80\x30\xc4\x9f\xc1\xe5\x1c\x70\x02\x80\
+\x76\xa2\xb9\x07\xf5\x8f\xf3\x2e\xa2\x31\xd6\x68\xfd\x4b\xd0\xf3\
+\x7f\xe5\xcc\x31\x0f\x53\x00\x1c\xf9\xc6\x45\x40\x39\xf6\xfb\x1d\
+\x6f\xd9\x83\xa2\x0f\xb4\xfd\xde\x31\x9b\xee\x3c\x54\x55\x77\xcf\
+\xe2\xeb\xe0\x4f\x9a\xbe\x7d\x76\x20\xc0\x6e\xc4\xa5\x63\x1c\xe6\
+\xe2\x35\x94\xbb\xf5\x9f\xeb\x8b\xed\x7b\x56\xd5\x5e\xb2\xa2\x65\
+\x73\xf6\x35\x0c\x3e\xe6\xc7\x2e\x9c\xb4\x3e\x7a\xfe\x54\x3b\x5c\
+\x6c\x5a\xc7\x98\x10\xfd\x7b\xf4\x62\x0b\x68\x0e\xf0\x14\x20\xe4\
+\x5d\x64\xd5\xc3\xdb\x44\x4a\xb6\xa5\x65\x4f\xe1\x05\xc1\x0c\x6b\
+\x2e\x41\x39\x97\xf5\x2f\x83\x00\x9c\x9d\x9a\x08\x70\xf6\x5b\x21\
+\x2c\x9a\xa1\xbe\xd7\xf4\xe6\x5d\x48\xfd\x03\x48\xfd\xa1\x92\x9b\
+\xae\xf7\x3f\x85\xcf\xf2\xcc\x15\x41\x32\xe0\x42\x4b\x70\xb1\x75\
+\xd7\x78\xd8\xb8\xde\xb2\x73\x1d\xb5\x6c\x4e\x9a\x2a\xa4\x4e\x98\
+\x46\xe2\x24\x62\x35\xfb\xea\xe9\xe3\xd5\x89\x52\xc1\xff\xee\x7b\
+\x37\x73\x38\x4d\x49\xda\x13\x0c\xd1\xbe\x8b\x3c\x31\x50\x39\xc0\
+\x04\xa0\x5b\x63\x50\x3f\x72\x01\xd2\xcb\x71\x35\xa6\x25\x4f\xf3\
+\x35\xab\x83\xf2\x0c\x08\x5e\xc6\x0a\x79\xe5\xc3\x67\x4f\xea\xaf\
+\x9c\x39\xa1\x71\x2e\x46\xc7\x65\x4b\x6e\xeb\x6c\xb8\x0f\xfc\x3b\
+\xb5\x6f\xe6\x6b\xee\x7d\x59\xf3\x48\xe7\x5b\x46\x4a\x7f\x52\x08\
+\x3c\x26\x04\xb8\x32\xf0\x93\xc5\xaf\x96\xa6\x72\x67\xdc\xa9\xec\
+\xa9\xb5\xa2\x39\x5a\x0a\x4d\x8b\x2b\xca\xf4\x68\x19\xda\xc2\x86\
+\xf8\xc5\x17\x2f\xd8\x6f\x5e\xbf\x6d\xae\x34\x5a\xe8\x73\xdd\x8e\
+\xca\xce\x2a\x7b\xec\x56\x29\xda\xc1\x26\x00\xac\xb8\xac\x3c\xaf\
+\xdd\xc6\xb0\x2d\x07\xc1\xa1\x3a\x59\x1c\xef\x3c\x92\xcf\x89\x53\
+\x93\x63\x41\x09\xba\x3e\x54\xd1\xa4\xf3\x03\x07\x92\xfe\x36\x08\
+\xc0\x82\xb0\xbc\x55\x68\x6b\x35\xbb\xa4\xeb\xa0\x50\xb0\x9d\x03\
+\x10\x5b\x6f\x1d\x78\x05\x3b\xef\x54\xcb\xb2\x54\xee\x3e\x94\x12\
+\xa9\x98\x2c\x19\xce\xf3\xfa\xc6\xc6\xc6\xec\x72\xb9\xac\x16\x8b\
+\x45\x15\x9b\x94\x0e\xf8\xd4\x33\xa6\x31\xfb\xfa\x3a\xec\x3b\x1d\
+\xa7\xa9\xd6\x95\x15\x6d\xbe\x75\x4b\x33\xb4\x6c\xa0\xa9\x06\xe6\
+\x94\x0a\xce\x18\x50\xd5\x1c\xb6\x76\x9f\x9d\x9e\x50\xae\x3e\x98\
+\x17\xd8\x30\x24\x3a\x30\x28\x42\xb4\x59\xc7\xa1\xad\x0d\x38\xd8\
+\x04\x40\xd6\x17\xac\x34\x5a\x11\xfa\x83\x82\x40\x5c\x8d\x85\xaa\
+\xef\xd8\xa8\xf7\xe2\xa9\x59\xff\x57\x3e\xf4\x3c\xb7\xf1\x71\x37\
+\x9a\xec\xd8\xb6\xa8\x7b\x6d\x7f\x59\xdc\x6b\xfd\x9d\x68\x79\x4b\
+\xb0\xe4\x82\xcd\x7c\xcf\x88\xaa\xef\xdd\xbb\x77\xd7\xae\x5f\xbf\
+\xae\xfc\xc9\x9f\xfc\x49\xee\xe1\xc3\x87\x39\x9e\xc8\x9b\xb4\xdd\
+\x98\xf6\x09\x70\xf8\xa8\xf7\xc6\x1b\x6f\xac\xbe\xfe\xfa\xeb\xe6\
+\x6b\xaf\xbd\x96\xad\x54\x2a\xb9\x24\xa2\xb1\xb5\x9b\xa6\x6f\x22\
+\x08\xe0\x94\x21\xb1\xea\xcc\x6b\x7f\xf7\xe0\xdf\x56\x7e\xe1\xd4\
+\x1f\x74\x8e\x15\x2e\xf9\xb0\x30\x2c\xd7\x00\xa9\x73\xf2\x8b\x2f\
+\x3f\x67\xde\x99\x5f\x11\x06\x54\x04\x6f\xcc\x2f\x0a\x0f\xb6\x26\
+\x23\x79\x41\x94\x47\xff\xf5\x40\x13\x80\x90\x78\x75\x91\x1f\x64\
+\x2c\xa9\x21\xfd\x8d\xda\xcb\x7b\xda\xef\x83\x1e\x46\x80\x5d\x59\
+\xee\x97\x5e\x79\xae\xf3\xdc\xf1\x69\x52\x03\xce\xfb\x69\xaf\x05\
+\xfb\xf1\x2d\x67\xc5\x7e\xd7\xaa\x3b\x0f\x82\x35\xeb\x7a\x49\x6e\
+\xf1\x3d\x8c\x76\x0c\xf6\x12\x88\x69\xde\x3b\x86\x00\x87\x40\x0f\
+\x1c\xe6\x1a\xac\x0a\xff\x74\xe9\x9b\xca\x2a\xce\x19\x78\x65\xf2\
+\x8b\xd8\x65\x4a\x1a\x10\x0e\x90\xff\xc1\x27\x5e\x6d\xce\xad\x56\
+\xfd\xff\xee\xcb\x5f\x2f\xad\xd6\x1a\x89\x78\x73\xa0\x09\xc0\x3a\
+\x94\x88\x5a\xeb\x9c\xcc\xfa\xfb\xa7\x7c\x87\x4a\xc0\x98\x07\xac\
+\xfa\x1a\x62\xba\x52\x11\x93\x95\xa2\x5a\x2e\xe4\x08\x75\x7a\x84\
+\x06\xd8\xe2\xdb\xf0\x9a\xce\xbc\xd2\x72\x1f\x29\x44\xfe\xd0\x85\
+\x1f\xa6\xfb\x90\x5e\x52\x08\x3c\x19\x04\xc0\x11\xfb\x30\x31\x57\
+\xb3\x16\x95\x15\x63\x34\x68\x39\x75\x37\x6f\x96\x60\x6f\x56\x97\
+\x1d\xad\x9c\xcf\xa8\xae\x5f\x10\xa7\xc6\xc7\x9d\x56\xc7\x0a\x5f\
+\xc6\x94\x78\xe0\xe7\x62\x14\xa8\xc9\xe9\xbf\xa4\x00\x12\xc7\xd6\
+\x5f\x44\x01\x4f\xe3\xca\x6d\x3c\xa8\x4c\x31\x6b\xfa\xc7\xb0\xc5\
+\xf7\xb3\x2f\x9e\xf7\x4f\x8d\x8f\xe6\xcb\xd9\x8c\x34\xb8\x01\xee\
+\x04\xb6\x69\x1c\x67\xd5\xbe\xd9\x99\x6b\xff\x38\x33\xdf\x7e\xbb\
+\xbb\x1a\x90\x22\x7f\x4c\xdf\x4b\x5f\xef\x18\x02\x60\x3a\xf1\xf7\
+\xa8\x79\xd3\xbc\xb9\xf6\x53\xed\x6e\xe3\x9d\x1a\x76\x11\x42\x39\
+\x80\x88\x20\x85\xd3\x39\xee\x41\xf9\xbd\xd7\x3f\x54\x9b\xaa\x94\
+\x38\x3d\x8d\x2d\xe9\xd0\x70\x00\x72\x80\x8d\x6d\xc6\xde\x06\x10\
+\xaa\x84\x21\x2d\xfa\x3e\x7f\x62\x46\x3d\x3f\x33\x29\x3e\xfd\xdc\
+\x05\x0d\x4b\x7e\xb2\x60\x12\xa9\xb6\xb7\xe0\x37\xdd\x25\xf1\x41\
+\xfd\xdf\x97\x71\x55\x49\x2c\x52\xa9\xff\xde\x7e\x97\xa3\x9e\xbb\
+\x8a\x79\x7e\xc3\x59\xd6\xff\xee\xc1\x9f\x8e\x18\xaa\xd9\x98\x2d\
+\x5e\xa0\x39\x31\x6c\x2f\x17\x0a\x56\xa8\xd4\xf3\xb3\x93\xa3\x5f\
+\x78\xe9\x92\xbb\x5a\x6f\x59\x5c\xb1\x1a\xe4\x0e\x38\x01\x90\xc3\
+\x3e\xea\x2d\x09\xdb\xa0\xfa\x3f\xb5\x77\x34\xe3\x95\xcf\x66\x82\
+\xd3\x13\xe3\xc1\x89\xb1\x11\x4e\x03\x24\xf7\xc4\xc9\x09\x2c\xb7\
+\x88\x16\x90\x1f\x6c\x3f\xa4\xfe\x55\x58\x9b\x0b\x4f\x73\x79\x6a\
+\x95\x4b\x0b\x3a\xb2\x10\xe0\x54\xa0\xed\xd4\xd4\xa5\xce\x7d\x15\
+\x44\x40\x14\xcb\xa3\x18\x8e\xb0\x6d\x10\x23\x16\x89\xc0\xf1\xb1\
+\x11\xa5\x92\xcb\x29\x50\x18\xd2\xa9\x30\xb0\x19\x50\x07\x9c\x00\
+\x6c\xae\xee\xfe\x3d\x67\x4c\x23\x38\x3d\x39\xe6\xfd\xda\xc7\x5e\
+\x74\xb8\xf6\x8f\x9a\x48\x1b\x74\x5c\xef\xb7\x83\x35\xff\x91\xf5\
+\x23\xd8\xf7\xbb\xcb\x4d\x3f\x18\xf9\x61\xd5\x37\x15\xfc\xed\xdf\
+\xc7\x3a\x42\x25\x4b\x03\x33\x90\x08\xbc\xbd\xf8\xad\xe2\xfd\xec\
+\xbb\xc1\x89\xd2\x95\x36\xce\x1a\x44\xdf\x04\x7b\x00\xf7\xda\xc5\
+\x33\x06\x34\x56\xf5\x96\xed\x14\x4c\x4d\x35\x37\xaf\xbe\x6c\xa1\
+\x08\x47\x08\x76\xc3\x9b\x0a\xc6\x83\xbc\xc7\x58\xb1\xe8\x82\xed\
+\x77\x7e\xeb\x13\xaf\xb6\x60\xdc\xc3\xc4\x7c\x40\xda\xd2\xc6\xf2\
+\x9e\x67\xf9\xab\xf6\x62\xe7\xed\xd6\x9a\xfd\xbe\xda\x70\xee\x41\
+\xcf\x7f\x5d\x1a\x3b\xbc\x80\x34\x46\x0a\x81\x27\x87\x00\x47\xa3\
+\xa6\xbb\x26\xc0\x05\x88\x1f\xcc\xfd\x95\xc2\x73\x07\xb9\x3f\x25\
+\x72\xdc\x39\x98\x33\xf4\x22\x76\x0c\x6e\xb1\x01\x9f\x72\x00\x11\
+\x94\x36\x5f\x21\x4f\xe9\xb2\x51\x62\x66\xa4\x14\x40\xe0\x17\x9c\
+\x87\x92\x05\x76\xfc\x91\x68\x12\xe6\x30\xee\xd1\xf6\xda\xee\x8a\
+\xb7\xe6\x7c\x00\x5d\x6d\x28\xfc\x04\x1d\x30\x5e\xfb\x0b\x52\xd6\
+\x99\xca\x37\x5c\x7f\xef\x74\x3a\x3e\xd6\xe9\x2d\xe8\x88\x60\x10\
+\x78\xb2\x69\x14\xf2\x0d\x98\x37\xf2\x0c\xa0\x00\x04\x7b\x74\xdb\
+\xdb\xd3\xc0\x34\x84\x17\xd4\x53\x35\xa4\x63\x5a\x87\x0a\x44\x54\
+\x0e\xda\x85\x3a\x09\x98\x05\x77\x60\x16\x3c\x40\xfe\xb2\xdd\x2c\
+\xec\x68\x39\x09\x5f\xe1\xfa\x2e\xa6\x02\x2d\xe5\x7e\xe3\x9a\x7a\
+\xbc\x78\xc9\x37\xb5\xac\x9f\xd3\xcb\x58\x01\x08\xc3\xc1\xfd\x0f\
+\x14\x02\xec\x6f\x6f\x3d\xc0\x5f\x8a\x4a\x93\xd0\xae\x12\xa3\x85\
+\xbc\xff\xe9\xcb\xe7\xfc\x93\x93\xa3\x0a\x24\xab\xa5\x6e\x95\x81\
+\x4e\x81\x0b\xa3\x9e\x9d\x15\xfb\x9a\xf2\xb0\xf5\x0f\x25\xca\x02\
+\xf6\x5b\xd9\x87\xc8\x46\x4f\xe5\x9c\x46\xa3\xa1\xde\xbe\x7d\xdb\
+\x06\x62\x74\x78\xb8\xc6\x93\x22\x1b\x10\x56\x9e\x2f\x80\xc3\x37\
+\x32\xf3\xf3\xf3\x1a\xf2\x65\xdf\x41\x71\x61\x07\x4b\xfa\x94\x28\
+\x5b\xa9\xd5\x6a\x4c\x67\xe1\xe0\x8e\x1a\x88\x93\x1c\x9e\x76\xa1\
+\x4e\x6c\xab\x58\x5a\x5a\x52\xea\xf5\xba\x40\x9d\xb6\x55\x9f\xa4\
+\xba\x1e\xd6\x30\x7e\x05\x98\x14\x17\xb7\x6a\x3f\xc5\x81\xa3\xe7\
+\x6a\xb6\x6f\xf9\x67\xcb\x2f\x57\xa0\x29\x98\xf8\x81\x9e\x88\x00\
+\xd0\xe0\x45\x1e\x2a\xb0\xb9\x4c\x26\x2f\x49\xfa\x61\x85\xde\xa6\
+\x7a\x73\xac\xa4\xd4\x14\x27\xb5\x8a\xcb\x27\xa7\xd5\x0f\x9f\x3f\
+\x65\x8e\xc2\xe8\x02\x1d\x25\xfe\x9e\x0f\x35\x4b\x7f\xd9\xbf\xd7\
+\xf8\x6e\xbe\xea\xde\xc2\x7a\xff\xc1\x91\xf8\x53\x2b\x0f\x08\x61\
+\x00\xe1\x8c\x3f\xfe\xe3\x3f\x9e\x22\xf2\x13\x49\x9f\x14\xd9\xd8\
+\x74\xe6\xd3\x6c\x36\x15\x12\x98\xb5\xb5\x35\x9d\x5c\x00\x47\xf2\
+\x24\xc7\xfa\x30\xde\x8d\x1b\x37\xf2\x73\x73\x73\xd9\x6f\x7f\xfb\
+\xdb\xa5\xdd\x20\x48\x2c\x33\x6a\x17\x47\x7f\xb6\x19\xdc\xc9\x91\
+\x25\x00\xd1\x37\xe0\x88\x7f\x6d\xf5\xcd\xc2\xa3\xd6\x2d\x7f\x3c\
+\x77\xbc\x56\xd2\xc7\x8b\x38\x87\x46\x0a\x05\xa3\x38\xfd\xd7\x1d\
+\x11\x80\x88\xa4\x70\x17\x5c\x19\xba\xf0\x10\x2f\xd2\xee\x55\x72\
+\x4f\xe8\x2f\xf5\x80\xdf\xb3\x7d\x86\xae\xd1\xb6\x1f\x6c\xf9\x57\
+\x82\xb1\x52\x41\x29\x66\xa3\x03\x62\x28\x77\xb5\x83\xb6\xb7\x02\
+\x0f\x7d\x78\x77\x55\x9a\x65\x3c\x28\x4d\x22\x52\x10\x41\x39\x32\
+\x82\x0b\x88\x0c\xc8\xef\x7b\xf5\x40\x38\x34\xfa\xbd\xae\x08\xdb\
+\x7f\x74\x5d\xd8\xf6\x86\xb3\xaa\xe1\x1c\x41\xa5\xda\x59\xf0\xf3\
+\x85\x92\xaf\x41\x4f\x90\xe4\x72\x10\x5c\x76\x84\xb4\xcc\x49\xd7\
+\xb5\xe0\x37\x5f\x7b\xb9\xf1\x3b\x9f\xfa\x70\xdb\xd0\xd4\x0a\x2d\
+\x16\x0e\x2a\xe0\x30\xbe\xe3\x71\xcc\x58\xee\x73\x3f\x7c\xee\x94\
+\xf3\xfb\x9f\xfd\x44\x0b\xc8\xdf\x9b\x40\x5b\x38\xcc\xa3\xee\xde\
+\xf6\x6f\x34\xfe\x5a\x54\x9d\x7b\x90\xfa\x37\x41\x73\x77\x04\xc6\
+\xc3\x08\x9a\xb4\xce\x87\x00\x02\xae\xef\x88\xba\xb5\xa2\x7e\xe3\
+\xde\xbf\x19\x5d\xb4\xee\xe3\x80\x11\xaf\x13\x8a\xb3\xb7\x56\xfe\
+\xb1\x39\x00\xee\x40\xae\x14\x72\xc1\x87\xcf\x9c\x74\x2e\x9d\x98\
+\xc9\x43\xd3\x68\x20\x65\xd9\x5a\xd4\xc1\x7f\xc3\x79\x3f\xce\x5f\
+\xf3\x47\xf3\x05\xff\x57\x3f\xf6\x42\x1b\x9b\x7d\x88\xd9\x39\x78\
+\xec\xaf\xc6\xc8\x1f\x38\xde\x8a\xfd\x5e\xa7\x6a\xdd\x51\xab\xce\
+\x8d\x0c\x04\x2f\x08\x4f\x91\xff\xe0\x7f\xd9\xa3\x57\x43\xae\x02\
+\x54\x71\xf2\xf0\xcf\x17\xff\x56\x59\xc8\xdd\x16\x2f\x4f\x7c\x0e\
+\x6a\xec\x5c\x04\xd8\x88\xae\x8f\x4d\x00\x60\x9f\x58\x60\xeb\x2b\
+\xec\x91\x4d\x70\x2b\xac\x01\x6d\xb8\x8d\x39\x1e\x62\x58\x4b\x6c\
+\x87\x76\xdf\x68\x29\x1b\x9c\x84\xd4\x7f\xb2\x52\xe6\xc8\x2f\x31\
+\x5c\x2a\x02\x07\x96\xd7\x70\xe6\xfc\x96\xbf\x88\xed\xbe\x2d\x90\
+\x42\xcc\xaf\x37\x01\xf4\x10\x37\x3f\xad\xfa\x33\x06\x01\xc7\xb3\
+\x04\xcc\x8b\xc3\x94\xb8\x0a\x23\x62\x8e\xaf\x05\x3c\x38\x79\xe3\
+\x54\x60\xdb\x04\x40\x62\x39\xd2\xce\x8e\x8f\x8a\xcb\xc7\x66\x94\
+\x5f\xf9\xe8\x4b\x99\x38\xf5\xc2\x43\x07\xc7\xee\x12\x59\x31\x9f\
+\xf5\x9f\x3b\x79\xcc\xff\xc8\xb9\xd3\xd0\xf7\x1f\x2d\xe5\xb1\xe4\
+\x1f\x3a\x0c\xfd\x41\xc7\x5b\xb3\x6f\x75\x1e\xb4\xfe\xbe\x6c\x7b\
+\x35\x90\x41\x82\xee\x99\xa1\x7d\x87\xee\x93\xa5\x15\x1e\x0e\x01\
+\xf6\xce\xfb\x8d\xf7\xcd\x55\x7b\xc9\xff\xd0\xe4\x2f\x2f\xab\x19\
+\x3d\x8f\xe5\xc1\xee\x1e\x95\x30\xfd\xb6\x09\x00\xb5\x08\x73\x40\
+\x88\xdf\x7b\xfd\xb5\xe6\xf1\xb1\x32\x8c\x5f\x68\x64\x8d\x0f\xbd\
+\x93\x43\x3c\xc6\x72\xea\xf9\x9f\x9b\x9a\x50\x3f\x74\xe6\x84\xfa\
+\xda\x85\x53\x1a\xac\xab\x48\x5a\xe9\x63\x13\x90\xe5\x2f\xfa\x35\
+\xf7\xa1\x72\xb3\xf1\x37\x45\xcb\xaf\xaa\xe9\x16\xdf\x43\xff\xd9\
+\x8f\x4c\x03\x28\xb2\xf6\x7d\x07\x1b\x88\x2d\x0b\x06\x6a\x61\x33\
+\x28\xb3\x81\x6b\xdd\x36\x01\xe0\x36\x58\x2c\x85\xf9\xe7\x66\xc6\
+\xfd\x89\x52\xf1\x99\x02\x20\x89\x1b\x0f\xee\x9c\x85\xc4\x7f\x1a\
+\x66\xbd\x46\x8b\x85\xde\xd0\x4e\x93\xde\x1d\xbf\x0a\x89\xff\xa2\
+\xd2\x74\xe7\x60\xd4\x73\x5d\xc3\xea\x99\x02\x42\xda\x98\x67\x1c\
+\x02\x5c\xc0\xde\xba\xa9\x66\x5b\x04\x00\x6b\xb9\xc1\xec\xd8\x88\
+\xfb\x87\x9f\xff\x54\x0d\x7a\xf0\xa3\x3a\x27\x15\xcf\x88\x23\xa6\
+\x57\x0a\xf9\xe0\xd8\xc4\x88\x8f\x15\x0d\x6b\xb2\x52\x22\x4c\x24\
+\xef\x4f\xd3\x5e\xb0\xec\xe3\xdf\x69\xfe\xad\xd2\xb4\xe7\x15\x1c\
+\xd9\x0c\x81\x80\xba\x81\x82\x3e\x23\x60\x48\x9b\x71\x44\x21\x90\
+\x48\x00\x88\x1c\x1c\xf9\xcf\x4f\xc3\xe2\xed\xcc\x38\x6d\xdf\x41\
+\xa5\x98\x3a\x05\xb4\x3e\x4e\xeb\x37\x36\xf6\x20\xfb\x50\x10\x51\
+\x71\x86\xb9\x01\x95\x23\xf0\xd2\x87\xc4\x91\xf5\x67\x65\xa1\xdb\
+\xef\x9f\x9b\x1e\x77\x5f\x3d\x7b\xd2\x2d\xe7\xb3\x68\x6e\xa8\x32\
+\x89\x4d\x3e\xbe\x0b\x71\x5f\xcd\xbd\xeb\x34\x9c\xbb\x3a\xb8\x80\
+\xc3\xd3\xb8\x43\xf2\x0d\xd2\x6a\xee\x3f\x04\x92\x09\x00\x10\x3d\
+\x0b\xd6\xf8\x95\xb3\xc7\x61\xf2\x7a\x9c\xf6\xc7\x43\x75\x38\xd4\
+\x9b\x9a\x65\x50\x86\xc1\x0c\xd9\xf3\x32\x5a\xd9\x55\x15\x68\xce\
+\x88\xc3\x63\xf8\x8e\xc8\x0f\xdd\x05\x31\x59\x2e\xfa\xcf\x1f\x9f\
+\xf1\x3e\x7d\xe9\x9c\x93\x31\x0c\xb9\xe4\x47\x4e\x09\x6a\x95\x2e\
+\xc4\x7e\xfe\xaa\x75\x0d\x04\x60\x2e\xeb\x05\x16\x62\x87\xe7\xfc\
+\xed\xff\x67\x4b\x6b\x90\x42\x60\x77\x20\x10\x4b\x00\x88\x20\x59\
+\x2c\x89\x9d\x99\x1e\x17\x5f\x7a\xf5\x85\xcc\x78\xa9\x87\xfb\x40\
+\x7e\xee\x2d\xb1\xed\xdb\x8d\xaf\x1b\x10\x31\xa8\x17\xcb\xbf\x6e\
+\x6b\x20\x08\xe1\x71\x18\xbb\x53\xb1\xbd\xcc\x85\xc4\x0b\xc8\x1e\
+\x14\x73\x99\xe0\x0b\x2f\x5e\xf6\x5e\x38\x7d\xdc\x18\x2f\x97\xb2\
+\xc0\x70\x34\x1b\x8d\xc3\x11\xde\x6b\xce\x9d\xce\x9a\x7d\x53\xbd\
+\xd7\xfc\xfb\x32\xb7\xfc\xee\xb7\x9e\xff\x5e\xc2\x23\xcd\xfb\xe8\
+\x42\x60\x20\x01\x20\xf2\xd3\xc4\xf5\x54\xd9\xf0\x3f\x77\xe5\xb2\
+\x5d\x81\x25\x0c\x2c\xf9\xf1\x35\x91\x5f\xee\x79\x5f\xb1\xaf\x6b\
+\x0d\xef\x21\x94\x0c\x73\x38\x8e\x48\xee\x14\xeb\x69\xcb\x3d\x0e\
+\x38\x31\xa5\x08\x66\x71\x94\xd6\x05\x1c\xac\x81\x32\xf6\x54\x75\
+\x35\xaa\x20\x35\xfd\xc0\xee\x8b\xd9\xb1\x8a\x02\x0b\x3f\xfa\x54\
+\xb9\xc8\x59\x0d\xdb\x17\x60\xa4\xe7\x01\xde\xc1\x42\xfb\x67\x99\
+\xa6\xf7\x10\x7a\xfe\x3c\xc4\x73\x7f\x44\x1e\xac\x14\xea\xaa\x66\
+\x61\xee\xad\x38\xaa\x6b\x95\x29\x83\xcf\xfb\xb2\xfa\x28\x3f\x3e\
+\x7e\x5c\x1b\x3c\x1f\x26\x7e\x56\x1b\x3b\x20\xbc\x08\xa2\xc9\x5f\
+\x1c\xcd\x10\x1a\xec\xa7\x18\xd8\x2c\x6d\x64\x55\x91\xcd\x66\x01\
+\x51\xe8\x50\x04\xe0\xa8\xfc\x75\xd8\x06\x84\x36\xd6\xae\x1d\xb7\
+\x0d\xd9\x35\xad\xd9\x26\xe7\xbb\xb3\x50\x4c\x5e\x3d\xd4\x03\x26\
+\x1d\xb2\x65\xd8\x6d\x60\xb7\x66\x05\xf7\xa4\xac\x9d\xd5\xf0\x69\
+\xa6\x1a\x48\x00\x88\x0a\xc5\x5c\x36\xe0\x4e\xb8\xcf\xbf\x7c\xd9\
+\x82\x21\x81\x1e\x62\x72\x09\x0c\xf3\x61\x65\xbe\xf3\x53\xad\xe5\
+\x2e\x8a\xbc\x3e\xb9\x63\xb1\x18\x8a\x91\x23\xf1\x89\x89\x51\xaa\
+\xdd\xda\xd8\x5c\xb4\x55\x55\x69\x97\xa1\xc1\x6f\xcd\x93\x54\xc7\
+\x8b\x79\xe5\xcc\xc4\xb8\x80\xd9\x24\x2d\xb2\xe7\xcf\x1e\x07\x7b\
+\xfe\x01\xac\xfb\xf8\xcb\xf6\x3b\xd9\x8e\xbb\x26\x4f\x58\xd9\x17\
+\x65\x1f\x74\x48\xc2\x07\x74\x57\x29\x8f\xe9\x3a\x28\x93\xd6\x81\
+\x6a\x3f\x15\xae\xf7\xa5\x3e\xa8\x0b\x61\xd7\xac\x82\x44\xb6\x3d\
+\xec\xbc\xf3\x15\xca\x95\xb7\x83\xa4\xdc\x27\x69\x66\x95\x20\x5f\
+\xd6\x14\x10\x32\x9c\x11\x50\x82\x16\x05\xbc\x8f\xcd\x95\xde\xfa\
+\x27\x0f\x14\x07\x47\x62\xaf\x89\x86\xbd\x8a\xc3\x2e\x9b\x72\xb0\
+\xd9\xe5\xcf\x1f\x66\x07\xd8\xea\x20\x44\x99\x22\x44\xba\x3c\x6a\
+\x73\x9d\x06\xed\x49\x71\x07\x39\xd3\x2d\x04\x80\xa3\x4e\x0e\xec\
+\xf1\x1f\x7c\xee\xe3\x6b\x98\xff\xab\x40\xfe\x0a\xdf\xd1\x81\x35\
+\x16\x2b\x9d\xf7\xbc\xaa\x73\x1b\x06\x09\xbf\x87\xc1\x08\x7b\x0e\
+\x40\x00\x76\xe2\x98\x27\xd7\xde\xaf\x9c\x9a\x55\x3f\x7e\xe9\x4c\
+\xf6\x13\x97\xce\x66\xf7\x5a\xb1\x88\xad\xc0\xc6\x25\x71\x62\x72\
+\xdc\xfb\xfc\xcb\xcf\xc1\xac\xf7\xf3\x2e\xca\xec\x1d\xe5\x85\x43\
+\x3c\x83\x85\xce\xcf\xc4\x5c\xfb\x47\x4a\xc3\x59\x80\x1c\xc0\x41\
+\xd7\xdd\x9f\xde\x41\xfd\x03\x16\x9e\x2b\xab\xb9\x17\x3f\x03\xd5\
+\x44\x20\x1b\xb6\xf9\xef\x9b\x23\x92\x90\x09\x7c\x78\xa3\xbd\x3c\
+\x7f\xbb\xa3\xbc\xf5\x37\xd5\x6c\x75\xd1\xce\x41\xed\x3c\x71\x4d\
+\xc8\xc7\xaa\xa9\x66\x04\xfe\x89\xe7\xb2\x4b\xe7\x5f\x29\x9a\x67\
+\x5f\x2e\x64\x4a\x50\x21\x9d\xc9\x7d\xc4\x9d\xcd\x7e\xdc\xab\x68\
+\x67\x33\xd2\xa4\x75\xd8\xc5\xc4\xdd\xda\xcf\xb1\xa5\xf5\x27\xe2\
+\xfa\xda\x0f\x60\x5e\xad\x89\x7d\xee\x3c\x53\xa1\x1b\xb8\x4b\xad\
+\x27\xd1\x92\x5d\x1a\xd9\x6a\x5d\x45\xd6\xed\x10\xb2\x5d\x2a\xfe\
+\x40\x65\xb3\x85\x00\xb0\x76\xb4\x20\x72\x6c\x7c\x24\x0b\x89\x38\
+\xee\x42\xe0\xd3\xf2\x1d\x46\x47\x6f\xd1\xfa\x99\x8a\xf5\x70\x90\
+\x02\x9c\xf8\xf2\x04\x32\x3f\x28\x12\x49\x36\xfc\xf5\x4b\xe7\x02\
+\x28\xe0\x70\xfb\xed\xee\x7e\xe5\x4d\x60\xe6\xbc\x1f\x23\x3d\xb8\
+\x9a\x9c\xff\x89\x8b\x67\x3a\x28\x93\x23\xbf\x94\xea\x51\xe4\x07\
+\x64\x0f\xea\xee\x43\xbb\xee\xdc\x55\x70\xa4\x17\xd7\xfb\xf7\xb4\
+\x3e\x9b\xaa\x17\xfb\x08\x3d\x4e\xb2\xfd\xfb\x5e\x17\x59\x0f\x70\
+\x1f\xba\xa9\x04\x72\x8b\xf9\x63\xd4\x08\x7d\x28\x80\x1d\x95\x40\
+\x33\xd5\xc0\xc8\xc0\x64\x8a\xe9\x0a\x57\x5b\x12\x4d\xe5\x56\x30\
+\x9a\x39\x16\x18\x5a\x11\x84\x19\x01\x70\x33\xca\x29\xa1\x61\xaa\
+\xb0\xe6\x3d\x0c\x6a\xce\xa2\x58\x83\xe9\xeb\xb0\xa8\xc7\x28\x30\
+\x16\x9a\x69\xc0\x66\x08\x0c\x26\x00\x50\x8c\x81\xb2\x4f\x9f\xa6\
+\x1f\x51\xc4\x81\x01\xac\x55\x67\xd1\x0a\x59\xe3\x27\x19\x19\xf9\
+\x29\xa1\x66\x8b\xc3\x35\x8a\xc1\xa7\x9e\x3b\x17\x40\xc3\x90\xaf\
+\xf6\xfc\x0b\x63\x0d\x93\xfa\xfd\xde\x27\x9f\x3b\xe7\x4c\x96\x8a\
+\x5c\xb5\xe8\xae\xf7\x83\xb8\x41\xd5\xb7\x6a\xdf\xb6\xab\xf6\x1d\
+\x13\x53\x1b\x9c\x5d\xa5\x73\x00\xde\x0c\xaf\xf4\xf9\x09\x20\x10\
+\x7e\x60\x58\x2c\x82\x50\x55\x0e\x22\x9e\x27\x26\x33\xcf\x79\xe0\
+\x00\x54\x5d\xb0\x0f\x60\xa3\x99\x39\x25\x72\x6a\x45\xdc\xce\xff\
+\xcc\x57\x2c\x55\x54\xed\x65\x6d\x5b\xf3\x8c\x27\xa8\xd7\x51\x4e\
+\x3a\x90\x00\x6c\x06\x08\x46\x7f\xab\x81\x83\x2e\xde\x5d\xfb\x33\
+\x39\x2f\x26\x6b\xbc\x53\x47\x8e\x02\x16\x75\xfd\x4f\x5e\x3a\xd7\
+\xf9\xe2\xcb\xcf\xdb\x19\xd3\x84\x19\xe3\xbd\x1b\xe1\xc0\xed\x49\
+\xca\x02\x99\x06\xf5\xfc\xbd\x8f\x5d\x3c\x0d\xa1\x63\xb9\x0c\x79\
+\x83\xec\x8f\xb4\xec\x03\x73\x5e\x4e\xc3\x7b\x60\xdf\x6b\x7d\xbb\
+\x68\xb9\x2b\x20\x7f\xa4\x0d\x7b\x4e\x8f\x76\x0a\xc2\x43\x9f\x8e\
+\x2b\x2a\x76\xd0\xd0\x6c\xaf\xad\x3d\x6a\xff\xb0\x3e\x9e\xb9\xa2\
+\x8f\x65\x2e\xe2\x8b\x64\x4d\x58\x18\x11\x3a\x96\x9e\x3f\x3a\xf5\
+\x2b\xad\xf9\xe6\x2d\xa5\x65\xaf\x9a\x4b\xad\x39\x93\x2a\xad\x07\
+\x80\x11\x3a\xf4\xb0\xdf\xdc\x80\xa1\x04\x20\x80\xd0\x6f\xa9\x7d\
+\x55\xab\x39\xf7\x30\x2f\x7e\xa0\x90\x7a\x53\x09\x68\x27\x08\xc2\
+\x0f\x08\xe4\x0f\xb0\xec\x66\x3f\x77\x7c\x46\x39\x31\x39\x1a\x92\
+\xfd\xcd\xb5\xda\xc5\x67\x12\x1c\xca\x1a\xa6\x47\x2b\xca\x05\x08\
+\xfc\xae\x9c\x98\x85\x89\x64\xe8\x32\x12\xc1\x31\x2d\x80\xc4\xdf\
+\xe7\x72\xdf\xb2\x75\xd5\xb4\xdd\xaa\x0a\x13\xdf\x72\x24\xda\xc5\
+\x2a\xa4\x59\x0d\x80\x00\xa6\x64\x10\xb0\x3a\x82\x70\xd7\x14\x23\
+\x30\xb5\xa2\x5b\xd6\x4f\x41\xed\x0c\x24\x00\xf3\x8d\x82\x31\x6a\
+\x8e\xe5\x9c\xe0\x64\xe9\x25\xd8\x5d\x6c\x79\x96\xd7\x52\x1c\xdf\
+\xe2\x1a\x08\x5c\x4a\x9c\x07\x80\x74\x47\xaf\x86\x10\x00\xa0\x7f\
+\x60\x89\x45\xfb\x9a\x06\xe4\xc7\xa6\x98\x1a\x40\x4f\xe0\xef\xec\
+\x03\x50\xa5\xb8\x08\xd6\xff\x63\xe7\x4f\xdb\xd8\x53\x90\x01\x31\
+\xe8\xad\x2e\xec\xa8\xf6\xdb\x48\x44\xbb\x7e\xd4\x67\x38\x3d\x3e\
+\xaa\xd0\xa8\x27\x4c\x7b\x47\x7c\x3d\xfa\x20\x96\x34\xbd\x55\xaf\
+\xe6\xdc\xd2\x97\x3a\x3f\xcb\x60\xb3\x44\x97\xb4\xed\xac\x7d\xdb\
+\xa8\xce\xa1\x8f\x12\x0a\x03\xd5\x00\xc3\x75\x60\x98\x1a\x2c\x83\
+\xfa\x50\x04\x8d\x6f\x96\x87\x13\x13\x75\x83\x32\x00\xc8\x96\x18\
+\xaf\x0b\xda\x70\x7a\xe5\x0b\xe8\x5b\x40\xf8\x5b\xb1\x72\xc6\x94\
+\x55\xd0\x66\xf1\xb9\x64\x97\xc4\xc9\xb7\x66\xa6\x94\x19\xf5\x4e\
+\x95\xaf\xb4\x1f\x35\x3f\xf0\x15\x5b\x51\x1d\x1f\x76\x2d\xa2\x0c\
+\xe2\x8b\x4c\x43\x1e\x03\x02\x09\x04\x00\xa3\xa3\xd7\x00\x85\x7e\
+\xcf\x9b\x6b\xbd\x05\x76\x2d\x42\xfe\xc7\xc8\xbd\x2f\x2a\x37\xdc\
+\x4c\xc3\x78\xc8\x65\x1c\xa6\xf9\x89\xcb\xe7\x4a\x38\x62\x2b\xc2\
+\x32\xb0\x13\x58\xe4\x02\x36\x62\xb4\xc6\x9c\x3c\x7a\xdd\x97\xf8\
+\x09\x6e\xa1\xdb\xef\xcd\x8c\x94\x83\xdf\xff\xec\xc7\xad\x91\x42\
+\x8e\x73\x7e\x29\xf8\x73\x7d\x0b\xa3\x7f\x23\xb8\xd5\xf8\x9a\xb2\
+\xe6\xdc\x56\xda\xd0\xf3\x27\x71\x0b\x09\xdc\x13\x14\xf8\xac\x26\
+\xe5\x57\x82\x2f\x95\xa1\xf2\x7d\x46\x75\x3e\xfc\xa5\xca\x6a\xab\
+\xee\x2b\xd4\x09\x48\x9a\xc0\x81\x61\xc4\x2a\x80\x22\xa6\xce\x64\
+\xfd\xb1\x19\x53\x07\xd1\xc0\xc1\x29\xf8\xca\xfc\x01\xb4\x29\x6b\
+\x59\xb3\x6e\x65\x3a\xee\xb2\x99\x19\x29\xdb\x95\xe0\x74\x90\x51\
+\x47\xe5\xd2\x5c\x46\xcb\x6b\xa7\x4a\x57\x0a\xf3\x8d\x3b\xca\x32\
+\x4c\x5e\x5b\xb5\x26\xbe\x99\x2d\x21\xbc\xbb\xbd\x44\x66\x79\x24\
+\x7f\x62\x09\x40\x57\x17\x5e\x34\xbc\x7b\x58\x8a\xa1\x62\xc6\xce\
+\x97\xc4\xc8\x86\xc3\x84\x98\x18\xaf\x14\x83\x33\x53\xe3\x02\x5c\
+\x00\x8f\x2e\x92\x00\xe7\xd2\xa2\xe3\x35\xc0\xde\x35\x95\x9c\x3e\
+\x85\x79\x5e\xf8\xfe\x49\xbf\x06\xf8\x4b\x74\x3c\x3d\x38\x36\x52\
+\xf6\x4e\x4e\x8e\xf9\x40\x7e\x75\xdd\x78\x09\x64\xfc\x41\x1b\x76\
+\x53\x57\xbc\xa6\xbb\xa0\x82\x10\xa0\x3f\x71\x8d\x6d\x77\xca\x7e\
+\xd2\xba\x1f\xc4\xf4\x9c\xf6\x71\x29\x52\xcf\xa8\x5a\xae\x28\x82\
+\x89\x63\x19\xc3\xb6\x30\x33\x07\x01\x90\x23\x7b\x4c\xa5\xb9\x0c\
+\xa8\x52\x97\x61\x5c\x13\x99\x3c\x3e\xbb\x0a\xbd\x31\xfc\x77\x29\
+\x00\x52\x81\x87\x10\x36\x07\x1b\xac\xbe\x3c\x14\x19\xa5\x0c\x92\
+\x90\xe7\xaa\x80\x24\xc6\x86\x9a\x55\xc6\xb3\xb3\x28\xdd\xc3\xd2\
+\xf3\xfb\xc2\xe1\x14\x94\x15\x49\xdd\xae\x40\x60\x20\x01\x20\x52\
+\x76\xbc\x25\x7b\xcd\xbd\xa9\xdc\xaa\x7f\x3d\x03\xd5\x0f\x49\xab\
+\x1f\xb7\x44\x49\xe4\x91\x88\x33\x6e\x48\xfc\xfd\x4f\x5d\x3c\x13\
+\xfc\xea\x47\x5e\xc4\x90\x11\xf2\x79\xcc\x8f\x1f\x7e\xb1\xf3\x73\
+\x6d\xd5\x79\x5f\xbd\x5c\xfe\x2d\xc8\x82\x77\x67\xab\x31\xad\xd5\
+\x4e\x14\x8b\xde\x97\x3e\x74\xa5\x73\x71\x76\x32\xc0\xbc\xbf\x8c\
+\xe2\xe4\x11\xde\x30\xee\xe1\x42\xa6\xe1\xac\x58\x57\x71\x94\xf7\
+\x07\x10\x42\xd2\xaa\x6f\x8a\xfc\xfc\x1e\xb1\x0e\x1f\x93\xaa\x09\
+\x66\x4e\x2d\xc1\x8b\xd2\xd8\xc0\xae\x13\x9b\x7c\x73\x00\xb9\x09\
+\x3a\xc9\x71\x01\xa1\xa1\x02\x24\xee\xd7\xbf\x2b\xbc\xbc\xed\x6b\
+\x39\xd3\x2d\x04\xd3\xe8\x36\x3a\xd4\xcb\x75\xf1\xfc\xc8\xeb\xf2\
+\xd0\x8b\x55\x6b\xce\xbb\x59\xfb\x89\xe6\x7a\xe4\x02\xa2\xde\x25\
+\xb3\x49\x7f\x76\x08\x81\x01\x5f\x91\x2b\xfe\x96\xb8\x5e\xfd\xcb\
+\x4c\xd3\x9d\x87\x09\x6c\x8b\xb4\x7f\x67\xd9\x23\x19\x46\x5d\x7f\
+\xbc\x58\xf0\xff\x93\x5f\x7c\xbd\x81\x91\x38\x0b\xe4\xef\x1e\xa9\
+\x45\x65\x4f\xd8\x74\xb7\xde\x71\x97\xec\x77\xd4\x9a\x75\x57\xf5\
+\x4b\x3b\x5f\x5d\x88\x2a\xc8\x8e\x95\x85\xa0\xb1\x04\x6e\x1f\x07\
+\x23\x7a\x10\xfc\x15\xc6\x4b\x91\xaa\x2f\xf5\xfc\x5d\x22\x7f\x1b\
+\xca\x3e\xe6\x5c\xe7\x07\x30\x68\xc8\xb6\x25\x4c\x62\xa3\x8c\xd3\
+\xeb\x1e\x42\x20\x9c\x7a\x35\xfd\x39\x73\xd9\xbe\x8a\xc5\x3f\xd1\
+\x39\xae\x7d\x26\x63\xa8\x45\x55\x57\x60\x99\x05\xbd\x74\x24\x3f\
+\xe9\xbd\x3e\xfb\xdb\xcd\x96\xbb\x96\xad\x59\x4b\x2a\xf4\x03\x40\
+\x20\x38\x11\x48\x27\x03\x4f\xf2\x61\x06\x10\x00\x66\x47\xe9\x38\
+\xd9\xf2\xc6\xce\x91\x9f\x9f\x06\x1f\x08\xc6\x35\xfc\x69\x1c\xa7\
+\x3d\x03\x29\x3c\xac\xeb\xf6\xbe\x16\xc9\x0c\xa7\x16\x55\x28\xde\
+\x74\xdc\x55\xb9\x36\xbc\x1b\x54\x9d\x7d\x02\x5b\x17\xb8\xc7\x5f\
+\x9c\x9c\x18\x55\x72\xa6\xc9\x33\x11\x65\xb9\xe4\x6c\x5c\xaf\xad\
+\xd6\xb1\x9a\xd1\xf1\x96\x55\xde\xa7\x1d\xe8\x49\xba\xcf\x6e\xa6\
+\xc5\x30\x03\x31\x50\x07\xe6\xd6\x60\x7d\x49\x1d\xf7\xd6\x40\x99\
+\x95\x40\xd7\xa4\x45\x66\x9c\x7c\x6f\x88\xa2\x39\xae\x8e\x9a\xc7\
+\x78\xf0\x32\x4e\xc5\x5d\x05\x35\xdf\xde\xe9\x44\xbb\x59\xcb\x67\
+\x2d\xaf\x18\x02\xf0\xe4\xcd\x24\xc6\x61\xc2\x27\x20\xf0\xeb\x5c\
+\x9a\x9d\xf2\x27\x2a\xc5\x4a\x34\xef\xa7\x38\x09\x73\x7e\xe8\x15\
+\xce\x7b\xb7\xea\x5f\xc3\x32\x90\x2e\x72\xda\x04\x52\xf4\xe8\xc3\
+\x8e\x2b\x40\xa9\xff\x49\x6c\xf2\x01\xf2\xe3\x60\xc4\xb3\x66\x74\
+\x84\x37\x33\x84\x26\xa3\xda\x70\xe7\xd4\xdb\xb5\xaf\x94\xb1\x9f\
+\x01\xe4\xe0\xe0\x1c\xe8\xb1\xe3\x06\x3f\x33\x09\xc9\x05\x68\x38\
+\x61\x79\x0e\x8a\x58\x0b\xe6\x48\xe6\x6c\xbd\x64\x9c\x54\xb2\xda\
+\x28\x68\xba\x02\xfb\x6c\xaa\x96\xd1\x73\xc5\xe7\xc6\x3e\xd9\x5c\
+\x68\xdf\xf1\x6b\xf6\x92\xda\xf2\xd6\x34\x58\x6d\x60\xf8\x33\x03\
+\x85\xa7\xdd\x10\x12\x80\xab\xf0\x8b\x1b\x0b\x56\xfe\xff\xf6\xce\
+\xec\x39\x8e\xeb\xba\xc3\xbd\xce\x3e\x83\x19\x6c\xc4\x46\x52\xe2\
+\x2a\x2e\x92\x4d\xd9\x94\x64\x33\x96\x93\x72\x9c\xf2\x92\x92\x92\
+\x72\x9c\xc5\x0f\xa9\xb2\x5f\xf2\x0f\xa4\x5c\xc9\x9b\x2b\xa9\x4a\
+\xde\xf2\x90\x54\xa5\x52\x95\xbc\x65\x73\xca\x4e\x25\x79\x88\x4b\
+\xf1\xa2\x8a\x6c\xd9\x96\x22\xd9\xa2\x25\x4b\xb2\x2c\x92\xa0\x08\
+\x90\x04\x48\xec\x83\xd9\x7a\xa6\xbb\xf3\xfd\x7a\x66\x20\x90\x04\
+\x29\x00\x04\x49\x80\xec\x4b\x9e\x99\x41\x4f\x77\xcf\xed\x73\xef\
+\x39\xf7\xdc\xb3\x1a\x49\xa7\x07\x13\x60\xd5\xa8\xfa\xfa\x6a\x63\
+\x08\x96\x22\x4f\xf9\x03\x8f\xee\x1e\x31\x3e\xf1\xc8\xbe\xac\x14\
+\x7f\x11\xf1\xc3\xd3\xa5\xc0\x21\xcf\x4e\xf3\x62\xf5\x25\x7b\xa2\
+\xfa\x43\x4c\x01\x10\xe1\xad\xec\x48\xd7\x76\xec\x96\x7f\xc9\xd2\
+\x40\xe6\x22\xff\x99\x93\x1f\xaa\xb1\xef\x0f\x12\xae\xa3\x52\x5e\
+\x74\x5e\x41\x3e\x15\x62\xfb\xdf\xa6\x98\xd7\x6b\x41\xc5\x9f\xc1\
+\xfc\x18\x13\xff\x2d\x91\x79\x8f\xbe\x14\x13\xd0\xa6\xec\x5c\xf9\
+\x3b\xb9\x82\x33\x16\x26\x7a\x72\xcd\x9c\x3d\x8a\x72\x98\xe8\x41\
+\xe4\xb5\xb1\xfc\xe1\x4c\xce\x2d\x1a\x14\xbd\x30\xcf\x2f\xfd\x4c\
+\x92\x00\x8a\x41\x29\xa8\xe3\xb6\x19\x0c\x68\xf3\x5b\x05\x64\x60\
+\x6d\x74\x6f\x20\xe3\x4c\xca\xea\x09\x92\x56\x7e\x53\xea\x56\x79\
+\x72\xa4\x1c\xd7\xa2\xa2\x6e\x58\xcc\x66\xf1\xef\x6a\x9b\xfc\xa4\
+\x4b\x88\xd4\x3d\xcd\x4b\x66\xad\x75\xd5\xf4\xfc\x85\x68\xb0\x37\
+\xca\x60\xba\xfd\x8c\xde\xb5\xe9\x97\xc6\x9f\x75\x20\xb2\xf7\x0f\
+\xf4\xb6\x06\x8a\x39\xa3\x48\xb4\x1f\xc7\x45\xfc\x88\x8a\x8a\x63\
+\x28\xb7\x2a\xad\x99\xb0\xd2\x9c\xe6\x98\x1e\x4b\xd3\x2c\x6e\xdb\
+\x0f\x03\x6d\x52\x26\x1b\x93\x49\x02\x56\xac\x50\x53\x21\x45\x57\
+\x15\xab\x11\x75\xd5\xa1\xc2\x75\xca\xcd\x99\x03\xe9\xdd\x46\xc6\
+\xed\x31\xdc\x28\x50\x55\x63\x19\x8f\xe7\x66\xc6\x52\x12\xc0\x32\
+\x30\x07\x4c\x03\xa3\x10\x23\x82\x3b\x26\xbb\xf4\x31\x8f\xc4\xbf\
+\xe6\x54\xfd\x34\x1b\xf7\x0d\xf1\x57\x33\x93\x70\xed\x64\x31\x6f\
+\x7c\xe9\xe9\x93\x1e\x22\xb9\x9c\x7d\xa2\x1b\xc8\x94\x23\x67\xa2\
+\xf1\xe5\xef\x39\x44\x14\xca\xf4\xc7\x17\xca\xb1\x77\x7b\x4d\x43\
+\x9f\x49\x25\x7c\x94\x7d\xc1\xb3\x4f\x3c\x56\x1b\x29\x15\xa9\x87\
+\xd6\xb6\x34\x40\xfc\x84\xad\x7b\xfe\x4c\xfd\x4c\xe5\x6a\xe3\xcd\
+\xd4\xac\xf7\x6e\xda\x8e\x5c\x01\xc4\xfb\xe2\xb6\x1d\x31\xa0\xf9\
+\x26\x45\x74\xc5\xbf\x42\x74\xe0\x0b\x46\xba\xd4\xe7\xa7\xed\x3e\
+\x33\x6d\xf4\x46\xa6\x9a\x9c\x53\x32\x3e\xd4\xf7\x69\xe2\x04\xae\
+\x10\x20\xe9\x1b\xd5\x4a\x39\x1e\xcc\x4d\x0e\x64\x57\x07\x30\xc5\
+\xf5\x3f\x07\x14\xdb\x9b\x56\x95\xaf\x82\x33\x6a\xb6\xfc\xca\x86\
+\x69\x13\xc5\x9f\x99\x4e\x25\x65\x72\x0b\x59\x95\x1d\xfd\xcd\x67\
+\x94\x7c\x3e\x03\x3a\x8d\x18\xfe\xcb\x70\xbe\xf1\x8e\xdd\x0c\x6b\
+\x0c\xb3\xc6\x73\xf3\x9c\x5b\x57\x4a\x13\x4c\x64\x61\x78\x6c\x74\
+\x34\x60\xdf\x8f\x9f\x41\x7f\x8e\x7d\x7f\xd7\xa6\xe7\x63\xeb\xf7\
+\xd8\xc6\x04\x17\x96\xbf\x9b\xaf\x06\xf3\x6c\x12\xf4\xc8\x1b\x7e\
+\x2c\xae\x89\xdb\xdd\xc4\x80\xe6\x46\x40\xe5\xa5\xb2\x31\x91\x98\
+\xae\xbd\x56\xcb\xbb\x63\xe6\x50\xfa\x71\xd7\x96\x55\x40\xbb\x7e\
+\x46\xf8\x48\xff\x27\xea\x3d\xa9\xa1\xb0\xd6\x5c\x4e\x96\x9b\x73\
+\xe8\x03\x9a\x38\x11\xc7\x63\xbb\x91\x71\xea\x32\x80\x05\x2e\xba\
+\x00\xe0\xb7\xa5\x86\xe3\x8e\x99\xb1\x30\xc3\x98\xe4\xfb\xc3\x51\
+\xa7\x0a\x99\xae\x7f\x37\xd0\xf5\xe7\x6c\xdf\x4b\xaf\x72\x29\xae\
+\x23\x7e\x4f\x19\xd8\xdd\x23\x0f\xc3\xd0\x54\x7a\xed\xdb\x63\xdc\
+\x1a\x6a\x25\x2d\x55\x81\xd2\x7d\xc3\x7d\xc6\xc3\x03\x7d\x8a\x35\
+\xe8\x3c\x13\x3d\xc6\x69\x64\xa9\x39\x69\xe0\x60\x42\x4a\xef\x69\
+\x47\xdb\x8f\x0d\x4a\x33\xea\x7c\xdc\xee\x19\x06\xb0\xda\xa0\xb8\
+\x5d\xf2\xc6\x71\x42\x6a\x85\xa5\xc4\x7e\x9f\x04\x34\x90\xbe\x38\
+\x80\x61\x96\x92\xbb\xf8\xbe\x6e\xf4\xa7\x77\xfb\x44\x73\x5a\xf5\
+\x56\x99\x31\xef\x5a\x06\x62\x46\xb0\x9e\x61\xd3\x0a\x8d\x17\x6e\
+\x78\x99\x93\xdf\x00\xda\x7e\x96\x7c\xe0\xb8\x9b\xb4\xf3\xc6\x40\
+\xea\xb1\x70\xaa\xfa\xaa\xa9\x98\x80\xcd\x10\x0f\xf7\x8e\x08\xb1\
+\xe1\xcf\x35\x95\x45\x68\x62\xf9\x07\x44\xfe\xcb\x1b\xf7\xf6\x88\
+\x9f\x1b\x10\x27\x6f\x19\x39\xd2\x4b\xc9\xd1\xe7\xd4\x91\xfd\xd6\
+\x5e\x34\xff\xdd\x26\x7d\x03\x01\xbe\xf6\x85\xf2\xf7\xd3\x4a\x60\
+\xd2\x8a\x88\x5f\xdf\xc6\x13\xa3\x8b\xa3\xed\xff\xae\xb1\x0a\x8d\
+\x2b\x8d\x9f\x67\x51\xdc\xfa\x85\xe4\xc3\xcb\x49\xea\xd0\xe2\x25\
+\xc8\xe4\x31\xd1\x32\x25\x33\xe4\x13\xf0\x1f\x1d\xf8\xd5\x6a\x63\
+\xaa\x6a\xce\x1b\x97\x2c\x94\x82\x84\x79\xc6\x63\xbc\xde\xb1\xed\
+\x52\xe1\x59\x2e\x78\x1e\x98\x05\x22\x26\xd0\x56\x04\x96\xc2\xd1\
+\xf4\x53\xcd\x84\x95\x43\x20\xeb\x0a\x0b\xeb\xbd\x75\xfb\x3c\x3c\
+\x0a\x9a\x5e\x48\x49\xcd\xa5\xff\x74\x89\x2b\x20\xb7\xc5\xd6\x89\
+\xe0\x3d\xb9\x0c\xb9\x04\x07\xbd\xdf\x3d\xf5\xd1\xe5\xc1\x42\xa4\
+\xf0\x8f\x44\x7f\x56\x85\xb0\xd6\x9a\x0f\x2f\x56\x7f\xec\x91\xdc\
+\x43\xa9\x3e\x3a\xcc\x2b\x9e\x18\x1b\x1b\xbd\xed\x70\xb6\xc8\xd9\
+\x21\x3b\x50\xd9\x3e\x57\x7e\x2e\x47\xdc\x06\x45\x5a\x66\x23\x5f\
+\x00\xf5\x2e\x61\xa7\xed\xb1\xdc\x23\x99\x3d\x85\x63\xee\x48\xee\
+\x30\x61\x07\xa8\x9c\x30\x17\x6c\x7e\x63\xb9\x1d\x9e\xf9\xee\xf5\
+\xa1\xcb\x00\xa4\x08\x94\x1e\x40\xca\x40\x59\x04\xa2\x66\x11\x9b\
+\x83\x7f\x7e\x98\xb4\x8b\x98\xf1\xae\x29\x29\xd6\x3d\xe5\x03\xdf\
+\x29\xa2\x49\x49\xcd\x05\xb2\xbb\x4c\xa2\xf4\xbb\xbd\x80\xa2\xee\
+\x8f\x89\x8c\xb5\xd7\x2b\xa6\xd3\x21\x01\x46\xc1\x43\xf8\xfa\xcb\
+\xfb\x4f\x92\xa1\x56\x0c\x52\x7a\x07\xc4\x17\x04\xcb\xcd\x49\x88\
+\xbf\x8a\x42\x49\xdb\x8d\x78\x4a\x74\xf1\xb7\xd3\xde\xb5\x18\x45\
+\xca\x3e\xff\x8a\x5d\x45\x31\x48\xfe\x06\x46\x53\x63\x8a\x14\x28\
+\x93\xb3\x93\xb3\x7b\x12\x03\x66\x31\x31\x68\xca\x2a\xa0\xf3\xe3\
+\xb6\x3e\x0c\x44\xcb\x7a\x67\x1b\x20\x33\xe0\x37\x80\x67\x80\x4f\
+\xea\x72\xec\xf9\x04\xe8\x14\x93\x07\xf2\x9f\x27\x64\xf6\xbc\xf1\
+\xce\xd2\x7f\x91\xb7\x6b\xfd\xc8\x45\xfb\x6e\x4c\x54\x5e\x74\x17\
+\x9b\xef\x19\xf5\x26\xc2\x45\x14\x02\x76\x7b\xab\xb0\xac\x7e\xca\
+\x1e\x46\x82\x0f\xff\x33\x27\x8e\xd6\x8e\xed\x19\x31\x5c\xc7\x29\
+\xaa\xbf\x22\x72\xfc\x0b\xfd\xb9\xc6\xb9\x4a\xb9\x35\x19\x5c\xae\
+\xbf\xda\xc3\xf9\xac\x07\x5d\x9d\x60\xfb\xac\xf8\x75\x67\x61\x20\
+\x12\xe9\x19\x48\x62\x38\x8c\xf1\xc5\xef\x1a\x85\xc4\x1e\xe3\x10\
+\x99\x9d\x52\x66\x89\xa9\x10\x25\x75\x32\x8e\x95\x9e\x36\xaa\xd9\
+\x45\xe3\x4a\xed\x7c\x30\x55\x39\x67\xd5\xd1\x5b\xc5\xed\x83\x31\
+\xb0\x9a\x9a\xc5\x00\xfe\x1d\xf8\x11\x20\xef\x9f\x48\xeb\x27\xe2\
+\xe9\x49\x3c\x6c\x97\x12\x87\xed\xc1\xd4\x87\xa8\x00\x24\x47\x8d\
+\x5b\x2b\x04\xa5\xf1\x97\x72\x66\xa1\x71\xd6\xbf\x5a\xff\xb9\x89\
+\xe8\xdf\xd9\x96\xdd\x26\xf1\xd3\x29\x74\x7c\xa1\xcc\x7d\x4f\x1e\
+\x7c\xc8\x3f\x3c\xb6\x2b\x3d\x54\x6c\x17\x2c\x90\xaa\x81\xe6\xe3\
+\x45\x46\x05\xdf\x17\xd3\x40\x4e\xc4\x1f\xef\x07\x41\xda\x7d\xd2\
+\x64\x19\xa8\x85\xd3\x6e\xd9\x3f\x67\x4e\xd5\x7e\x52\xad\xb5\x66\
+\x3d\xc2\xba\x23\x51\x40\x4e\x42\xc9\x44\x26\x7c\x6a\xd7\x6f\x57\
+\x86\xb3\xfb\xbd\x42\xa2\x44\x9c\xa2\x5a\x2c\xf9\xdd\x6a\xf8\x57\
+\x18\x00\x52\x80\xa8\x7a\x12\xb8\x00\x5c\x04\x56\x2c\x02\x09\xc4\
+\xff\x14\x8b\x6c\xce\x1d\xc5\xf1\x82\x74\xce\x66\x14\xcf\xc3\x29\
+\xa0\x37\xca\xec\x42\x8a\xe8\xc8\xe9\x26\x3a\x14\x1d\x65\xf5\x0f\
+\x49\x23\x66\xb0\x17\x8f\xb4\xfe\x5b\x35\x10\x14\x28\x30\xf2\xf8\
+\xfa\xef\x1d\xe8\x0b\x7b\xd2\x69\x9b\x02\x1f\x9d\xe5\x5d\x42\x21\
+\x3e\x86\xfe\x4c\x80\x98\x68\xf1\xde\xc9\xf7\xda\xed\x53\xfc\x7e\
+\x3f\x60\x00\x82\xb7\xd0\x07\xe0\xd2\x7d\x91\x70\xee\xb2\x7c\x3c\
+\xda\xab\x11\x6b\x8b\xb2\x0b\x0f\x66\xf6\x04\x85\xc4\x60\x90\x71\
+\x4b\x41\x3b\x5d\xf1\xed\x2d\x3a\xf7\x03\xce\x6e\xf5\x0c\xd7\x6b\
+\xf6\x84\xcc\xe7\x80\x09\xe0\x1f\x80\x21\x80\x3d\x95\x6d\x64\x89\
+\xd5\x3f\x54\xf8\x4d\x7c\xb3\xf3\x41\x19\xd3\xda\x44\xe5\x87\x30\
+\x0f\xd1\x9e\x92\x86\x35\xec\x84\xb1\xa2\x23\x50\xac\x7d\x83\x70\
+\xe2\xf0\x6c\xf9\xb9\x74\x23\x5c\x60\x2b\x21\x3e\x73\x7b\x03\xa1\
+\xab\xe5\xe7\x4f\x89\x32\xe3\xe0\xd0\x80\xf9\xb9\x13\x47\x49\xef\
+\xff\x7e\x26\x61\x52\x7b\x21\xf6\xcd\x19\x6f\xcf\x7f\x3d\x5f\x0b\
+\x14\x5c\x14\xbb\xfa\x82\xb2\xfb\xae\x49\x22\xf5\xfc\x8a\x3d\x59\
+\x79\xb1\x90\xb6\x07\x2a\x88\x78\xcd\x24\x59\x85\x99\x5f\x58\xb4\
+\x2c\x79\x09\x16\x8e\x94\x3e\x56\xdb\x95\xde\xd3\x7a\xb9\x05\xa3\
+\x68\xce\xda\xb8\x82\xc5\x92\xe0\x4d\x66\xc2\x35\x0c\x60\x95\x49\
+\x50\x1b\xa8\xbf\x01\x1e\x05\x7e\xbf\x7d\x2d\xa8\x67\xe5\x1f\x4a\
+\x9f\xb4\x7a\x13\x8f\x84\xc5\xc4\xfe\xe6\x64\xe5\xc7\x5c\x6f\x5b\
+\x15\x6f\xca\x49\xa6\x72\xa0\x5f\xe6\x3d\xf9\xdd\x37\x7c\x8f\x84\
+\x1b\x1e\x4a\xbf\xf6\x76\xe1\xf6\x88\x5f\xcc\x43\xb1\x04\xfd\x3d\
+\x59\xff\x0b\x4f\x9d\xa8\x50\xc6\xdb\x62\xdf\x9f\x93\x80\xaf\xfb\
+\xb3\x2a\x84\xd3\x8d\xd3\xad\xe5\xd6\x64\x58\x0d\xae\x26\x24\xf4\
+\x6d\x44\x57\xd1\x7e\xbe\xf8\x75\x67\x60\x40\x73\x49\xe3\x1e\x9a\
+\x17\xab\x2f\xa7\x71\xed\x0e\x13\x85\x2c\xfa\x80\x7e\x66\x22\x0a\
+\x40\x1c\x4b\x87\x72\xfb\x48\x27\xd6\x47\x7d\x87\x71\x6b\x7c\xf1\
+\x67\x66\x0d\x2b\x50\x4b\xa9\x89\xa2\x2b\xa3\xb7\xf8\xa5\x83\x81\
+\x6b\x18\x80\x8e\xc1\x04\x1a\x88\xf3\x72\x0c\x92\x5f\x80\x96\x78\
+\x59\x06\xa4\x64\x8b\xb6\x0b\x44\x67\xb1\x0d\xc8\x68\x55\x0f\x17\
+\x70\xd0\x40\xe3\xce\x45\x6b\x69\xd9\x19\x22\x36\xe1\xfa\x77\xbb\
+\xfb\x70\xfa\x64\x20\xe9\xb3\xf7\xcf\x06\xbb\xfb\x4a\x61\x1f\xe9\
+\xc4\xdb\x1a\xff\xb6\x87\x61\x0b\x66\x53\x69\x5d\xc6\xd1\xe8\x12\
+\xd2\x47\xbb\x8e\xdf\xed\xfe\x26\xcf\x1b\xb7\x6d\x8a\x81\xf6\x72\
+\x62\x61\x1a\x9c\xb3\xab\x56\x9a\x2d\xdf\x6c\x8b\xb8\xaf\x10\x2f\
+\x4f\x66\x8a\x1d\x99\x06\x35\xef\x8a\x89\x21\xb6\xae\x67\x09\x6d\
+\xaf\x53\xc2\x76\xf3\xc9\x6c\xb7\x29\x1a\xb6\xa4\x5b\x37\x30\x00\
+\xdd\x15\x82\xf3\x20\xde\x6f\xf3\x51\xee\xc1\xf2\x0b\xf8\x2a\xd0\
+\x0b\x44\xc4\x8c\x0e\xc0\x44\x1f\x90\x38\x5a\xfc\x12\x68\xf6\x43\
+\x94\x6f\x88\xe7\xdd\x32\x02\x24\xf6\xb3\x72\x99\x56\x28\x6f\xe0\
+\xad\x68\xa1\x91\x4d\xba\xc1\x48\x6f\xb1\xf5\x07\xa7\x3e\x5a\xed\
+\xcd\xe7\xf2\xc8\xfe\x11\x33\xe2\xb7\x7d\xe2\x09\x5a\x33\xb5\x5f\
+\x54\xa7\xaa\xa7\xf3\xe4\x9a\x27\x9f\xbf\x78\xd6\xed\x4a\x1c\x5b\
+\xd1\xef\xf8\x1e\x77\x12\x03\x62\xf0\xb2\x32\x95\x29\x52\x73\x66\
+\xf1\x5b\xc6\xc1\x9e\xcf\xfb\x39\x67\x34\x4c\x5b\xed\x78\x01\xf2\
+\x09\x1a\x1f\x19\xf8\x1c\xdf\xcf\x05\x53\xd5\x33\xc6\x95\xca\xb8\
+\x45\x49\xdb\x3b\xd9\xa5\x1d\x79\xef\x35\x19\x40\xe7\x49\x44\xf8\
+\x33\xc0\x8b\xc0\x31\x60\x1f\x70\x12\x88\xec\x2e\x12\xb1\xc9\xd6\
+\xc2\x9f\x94\x74\xb4\x5a\x28\xdc\x3a\x19\x9b\x39\xc2\xe0\x20\x89\
+\x39\x86\xdc\x88\xeb\x01\x11\x7f\xd1\x7e\x7c\x83\x44\xc9\x58\x51\
+\x72\x34\xd2\xfa\xe3\xdf\xef\xef\xc1\xcb\x6f\xac\xbf\x37\x05\xed\
+\x77\x15\x0a\x21\x2e\xca\x3e\xa5\xbb\x43\x32\xfb\xa4\x48\x60\x12\
+\xa7\x8c\x06\xf7\x0f\x52\x8b\xb6\x79\xa4\x71\xaf\x06\x53\x04\x97\
+\x8d\x37\x15\x31\x88\xf7\x2a\xa1\xa7\x28\x87\x98\x81\xae\xed\x1a\
+\x0f\xe5\x8f\x7b\x39\xa7\x27\xac\x50\x5f\xa0\xde\x5a\x26\xb3\x70\
+\x73\x83\x13\xf1\xfe\xc6\xe8\x4d\x19\x80\xf4\x01\x3c\x7a\x19\x49\
+\xe0\x55\xde\xfb\x01\x31\x01\x05\x0b\x11\x31\x18\x85\xd3\xb5\x0d\
+\xb0\x22\x76\xb3\xeb\x7f\xcf\x37\x6a\x52\xb9\x10\x8c\xa7\x24\x1f\
+\x5e\x58\x89\xec\xb7\x1b\x5f\x95\x19\x5e\x68\x3d\x8b\xc6\xff\xd1\
+\xb1\x91\x60\xac\xaf\x68\x0e\x14\x72\x1d\xf3\x43\xb4\xb5\xd0\x7e\
+\xbf\xb5\xe4\x9f\x23\xad\xd8\xeb\x99\xf6\x56\x23\x12\x0c\xda\x7d\
+\x88\x5f\x1f\x00\x0c\x48\x0a\xf0\x09\x5a\x9b\x77\x66\x1b\xef\xd6\
+\x9b\x7e\x25\xe8\x71\xf7\xd9\xd4\x18\x60\x31\xd0\x7f\xc3\xd8\x5b\
+\x38\xde\x2a\x25\x87\x83\x0b\xe5\xb7\xec\x39\xe3\x92\xd1\xf4\xe6\
+\x24\x22\x76\x5a\xcc\x0b\x3e\x90\x62\xa4\x13\x00\x5b\xb2\x0c\xfc\
+\x1d\xf0\x25\xe0\xfb\xc0\x59\xe0\xa6\x4d\xfb\x30\xd7\x48\x1b\x23\
+\xd9\x93\xad\xa4\x89\x39\x7e\x13\xa2\x97\xf2\xc8\xe7\xd2\xae\x71\
+\x74\x64\x97\xf1\x99\x8f\x1c\x37\x3e\xf6\xc8\xfe\x95\xdf\x93\x57\
+\x58\x83\xd4\x51\xe7\x96\xfe\x27\x73\x7e\xf1\xf9\x4c\xe4\x17\xaa\
+\xd0\xff\x58\xf4\x5f\xc1\xd1\x83\xf2\x41\x5b\x01\x49\x9b\xb3\xb5\
+\x37\xb2\x13\x95\x1f\xe5\x16\x5a\x67\x6b\x64\x7e\x6a\x32\xe7\x22\
+\xad\x1f\xae\xc2\xd9\x9e\xd4\x40\xee\xc4\xc0\xa7\x1b\x7b\xf2\xc7\
+\x9b\x69\x27\x8f\xc2\xaa\x9d\x09\xf2\x41\xc1\xd1\xad\x9e\xf3\xa6\
+\x12\xc0\xea\x8b\xc4\x04\x40\xa8\x34\x7d\xe7\x81\x7f\x02\x86\x81\
+\x0f\x77\x60\x17\xef\xd7\x94\x08\xe6\x7c\x34\xb2\x09\xa3\x60\x8f\
+\x85\x2e\xba\x81\xb6\x19\x90\xb3\x36\xd0\x12\x36\x85\x3c\x73\xb9\
+\xf0\xf8\xde\xb1\x00\x1d\x00\x59\xc5\xdb\xbc\x2a\xaa\x51\x18\x94\
+\xc3\xd9\xc6\x2f\x64\xef\xb7\xf1\x36\x90\xbc\xb1\x81\x3b\xc7\xa7\
+\xde\x7f\x18\x80\xa0\x99\x04\x04\xac\x99\x97\x2a\xaf\x60\x09\xcc\
+\xe2\xb3\x32\x1c\x30\x03\xa5\xcf\x42\x42\xb5\xcd\x81\xcc\x9e\xe4\
+\x62\x73\xc6\x5a\x6c\x4c\x5b\x53\xd5\x71\x24\x07\xf8\xc3\x26\x16\
+\xa6\xfb\x0d\x77\xeb\x62\x00\x7a\x68\xf0\x28\x8e\x3a\x0b\x23\xf8\
+\x3a\xef\xb2\x0a\x9c\x00\x24\x11\x1c\x07\x24\x9a\xeb\x5e\xa2\x52\
+\x12\x88\x50\x77\x1d\x19\x20\xeb\x8e\x86\x2e\x79\xde\x89\xe1\x06\
+\xe1\x12\x24\xd6\x4f\xa8\x0a\xe9\x2f\xd8\x29\x03\x57\x5f\x9f\xf4\
+\xaf\x52\x36\x44\x8d\xfb\x50\xc6\x73\x2e\xbc\x52\x3b\x4d\xc9\xa8\
+\x19\x5b\xf7\x95\xc4\x11\xb7\x07\x1d\x03\x9a\x03\x81\x41\xf5\xea\
+\x64\x29\xb9\xdf\x43\x2a\x08\x5d\x57\x96\x62\x9b\xf9\xe7\x18\xa5\
+\xd4\x70\x62\xa0\xb1\xc7\x58\x48\x4d\x53\xec\xe6\x92\xc1\x84\xe4\
+\xbf\xb2\x0c\xad\x7f\x4e\xde\x8f\x18\x5e\x37\x03\xe8\x3e\x3c\x8c\
+\x00\x65\x6a\x38\xcf\xdf\x2f\x00\x2f\x01\xf2\x00\xda\x0d\xfc\x06\
+\x70\x10\xf8\x32\x00\xe2\x19\x02\xcb\x4d\x8c\xe4\x4e\x06\xb9\xe6\
+\xae\xf0\xbd\xa5\x17\x28\x09\x21\xe7\x9c\xf5\x21\x9c\xb3\xe0\xdb\
+\x0c\x9f\xb8\x07\x2d\xda\xf5\x1b\x81\x3f\x57\x3f\x53\x5e\x68\x8e\
+\x5b\x97\x6a\xaf\x14\xc4\x68\xa2\x8d\x9e\x4e\x88\xdb\x03\x8d\x81\
+\xee\xbc\x52\xa6\xe9\xc9\xe5\x17\xc3\x39\xe7\x4c\x78\xa0\xe7\xd9\
+\x80\xe4\x61\xd4\x25\x91\x7f\x0a\x93\x34\x77\xd4\x28\xba\xbb\x8c\
+\x79\x6f\x3a\x98\xab\x4f\x9a\x65\x6f\x76\x7d\x93\xf1\x3e\xc6\xec\
+\x86\x19\x80\x70\x01\x5d\x4a\x41\xd8\xea\x6c\x0b\x64\x2d\xd0\xf6\
+\xe0\x45\xe0\x32\xf0\x7b\x80\x24\x02\xb4\x30\xb8\xed\x3a\x7b\x60\
+\x05\x09\x63\xca\x3e\x4d\xf2\xc6\x0a\x7e\x03\xed\xdc\x6e\x7c\xbf\
+\x91\x86\xb0\xe6\xe3\x58\xb4\xec\x4d\x37\x5e\x4b\x60\xf3\x47\xd2\
+\xe8\x9a\x74\x1e\xf8\x31\xdc\x08\x1e\x1f\x80\x73\x4d\x2c\x4f\x73\
+\x36\x31\x61\xc1\x72\xeb\x3d\x2f\x65\x65\x1d\xd3\xca\x92\xa6\x12\
+\x3f\x52\x14\x4b\x69\xb7\x10\x1e\x2a\x9e\x6c\x8c\x2f\x26\x1d\x2f\
+\x68\xd8\x8d\x56\xa5\xbd\xb7\x7c\x00\x30\xb3\xd6\x23\x6e\x8a\x01\
+\x74\x6f\xd4\x61\x04\xa2\x68\x6d\x0d\x64\x2d\xb8\x02\x5c\x05\xe4\
+\x42\x9c\x94\xf8\x95\x77\x86\x09\xd1\x4c\x19\x19\xa7\x9f\x94\x60\
+\x52\xde\x79\xeb\x96\x02\xb8\x47\xa7\x29\xb1\xa7\xc7\x9e\x7f\xa6\
+\x39\x53\x7f\x23\x8f\x02\x30\x72\xf8\x78\xd0\xc5\xb7\x2e\x76\xe2\
+\xf7\xf7\x31\x20\x89\x10\x0f\x54\x47\xb1\x28\x65\x6f\x7c\x29\x6f\
+\x8f\x21\x49\x26\x08\x62\x6b\xd7\x11\xa1\x1e\x6d\x78\xb0\xf4\x04\
+\x55\xcd\x6a\xe1\x5c\xe3\x12\x89\x69\xab\x16\x73\xf7\xfd\x1b\x3c\
+\x60\x9f\xb6\x92\xfb\x49\x12\x50\x62\xd1\x3f\x03\xce\x03\x51\x93\
+\x32\x90\x84\x8e\xc6\xf1\xd2\x1f\x7a\x23\x99\xa7\x7c\x27\xca\x2b\
+\xb0\x31\x84\x37\xfc\x65\x6b\xbe\x7e\xde\x7d\x6b\xee\x5f\x20\xfe\
+\x65\x36\x12\x0a\x59\x88\x57\xfe\x0e\x8a\xe3\xb7\xeb\x30\x20\xc9\
+\x13\x23\x80\x89\x55\xa0\x30\xe3\xbd\xd5\x5c\x6c\x4d\xd4\x48\x0f\
+\xc7\x42\xa5\x7c\x61\xa6\x95\x71\xf3\xf9\xb1\xdc\x61\xf7\x68\xe9\
+\x94\x9f\x71\x0b\x01\x5b\xd5\x07\x96\x05\x6c\x25\x03\x10\x55\xd7\
+\x80\x97\x01\xb9\x11\x9f\x01\xa0\x54\x78\x72\x54\xf8\xa3\xcf\xee\
+\x4f\x1c\x31\xc6\xd2\x4f\xb6\x48\xeb\x14\x29\x66\xde\x17\xe3\x39\
+\x73\xcd\x26\x45\x0d\x61\xc5\xde\xbb\xad\x85\xe6\x2f\x29\xe4\x39\
+\xc5\xde\x23\x26\xfe\x35\x51\x15\x1f\x5c\x85\x81\xb6\x99\x0f\x73\
+\xa0\x39\x57\x7f\xcb\xbd\x42\x19\xb8\xba\xbf\x10\x50\x53\x50\xaa\
+\x24\x49\xa0\x56\x4f\x72\xc0\xde\xd3\x73\xc4\xee\x4b\x8d\x9a\x30\
+\x81\x4d\x59\xaa\x56\xfd\xe0\x8e\xfd\x78\x5b\x5b\x80\xd5\x4f\xdd\
+\x51\x0e\x4a\x0a\x38\x07\xbc\x0e\xe8\xde\x52\x0e\xa2\xc4\x23\xa9\
+\x13\x79\xdc\x7a\x93\x07\xfc\x94\x9d\xf3\x17\xbd\x0b\x0e\xe1\xba\
+\xa8\xf4\xca\x8c\x47\x64\xae\xe5\xb4\x1b\x5b\x54\x44\x24\xa8\x06\
+\xb3\xde\x9b\x7e\xb9\x79\xd9\x24\x93\x70\x94\xb2\xbc\xab\xf0\xb9\
+\xf1\x8a\xf8\x48\x8c\x01\x61\xa0\x2d\x1d\x6a\xb1\x98\xf7\xce\x25\
+\x6b\xc1\x5c\x48\x2e\x8b\xba\xe5\xd8\x81\x63\x24\x58\xf4\x4c\x5c\
+\xd9\x4b\xd4\xae\xc8\x5a\xfd\xa9\xdd\x24\xbd\xf5\x28\x55\x53\x46\
+\x47\xa5\xe9\xfb\x60\xb5\xad\x94\x00\xba\xca\x41\xd9\xfb\xfe\x15\
+\xf8\x5b\x40\x52\x40\x1d\x50\xa3\xe0\x40\xda\xce\xba\xbb\xdd\x0f\
+\xf7\x7e\xb9\x71\xb0\xf0\x4c\x6b\x28\x73\x82\xed\x17\xf9\xdb\xd6\
+\x10\xc0\x54\x9e\x5c\x4a\xbf\x99\xfa\x3b\x4b\x97\xab\x3f\x75\x48\
+\x27\xee\xca\xb8\x18\xb7\x18\x03\xeb\xc5\x40\x5b\x1f\x50\x35\x2a\
+\xcd\x19\xe3\xfc\xf2\xf3\x54\xa1\x7e\x0b\xfd\x40\x19\x19\xa0\xbd\
+\x05\x95\x75\xe0\xe3\xc3\xbf\x53\x3d\x5c\x7c\xd2\x2b\xa6\x86\x7c\
+\x25\xbb\x79\xd0\xda\x96\x49\x00\xab\x10\x27\xec\x92\xff\x2b\x72\
+\x17\x7e\x8d\x77\xa5\xea\xed\x03\xa2\x02\x23\x6c\x07\x48\x35\x5e\
+\x32\xf3\xee\x10\x85\x3a\xab\x46\x2d\x35\x17\x90\x41\x48\x96\x02\
+\x84\x88\xd5\x04\x0e\xff\xc6\x62\xd0\xf0\x67\x95\x52\xdc\xc4\x66\
+\x8b\xe2\xaf\x6d\xce\xe1\x5e\x71\x8b\x31\xb0\x4e\x0c\xa0\x31\x62\
+\xee\x50\x89\x8a\x7c\x11\x57\x51\x0d\x2e\xb5\x1c\x6a\x0a\xa1\x27\
+\x88\x1c\xc8\xd2\x54\x19\x2a\xa6\x76\x05\x7d\xa9\xb1\x70\xd9\x9b\
+\xb5\x50\x0a\xb2\xed\xbc\x1f\x53\x8b\x47\xc4\x75\x83\xe2\x6c\xcb\
+\x19\x80\x2c\x03\x34\x85\x13\x97\x81\x3f\x05\xfe\x12\x78\x1c\x90\
+\x8f\x80\x52\x36\xa3\x95\x4d\x26\x48\x31\x46\x4e\x81\x43\xc6\xa8\
+\xff\xa4\x37\xef\x8d\x3b\x4b\xde\x45\xd4\xb4\xef\x13\x38\x9e\x5a\
+\x26\xda\x7e\x9b\xfc\x7e\x49\x9c\x10\xe9\xf8\x6a\xe6\xc0\x9d\xe2\
+\x16\x63\x60\x1d\x18\x68\x3b\x89\x85\x06\xbe\x23\x09\x16\x9f\x3a\
+\x3e\x65\xde\x68\x36\x4f\xb5\xd1\x0c\x2e\x26\x08\x95\x14\xc2\xd9\
+\x93\x3f\x5a\x2f\x26\x77\xd5\x96\xbd\x39\x73\xb6\x3e\xe9\xd4\x5a\
+\xe5\x1b\x08\x65\x1d\x3f\xb5\x7d\x4f\x89\x32\x75\x24\x93\x8e\x49\
+\x1d\xde\xce\xf6\xa8\xd3\x59\xe4\xef\x3b\xd0\xc4\x04\x00\x6d\xee\
+\xa7\x80\xbf\x00\xfe\x18\x90\x34\x20\x13\x61\xb7\x89\x03\xd3\xa5\
+\x62\x72\x30\xf5\xa8\xfd\x70\xfe\x53\x86\x4b\xf1\xa7\x6e\x63\xb0\
+\x02\xd7\xce\x34\xf3\xc9\x61\x72\x7a\x5b\x2b\x62\x5b\xf7\xfb\xf8\
+\x3d\xc6\xc0\xfa\x31\xa0\xcd\x80\x6d\x94\x9b\x13\xc9\x89\xea\xf7\
+\xb3\x8b\xcd\x73\x55\x32\x0b\x37\xd0\x08\x46\x0a\xa8\x84\x93\x49\
+\x16\x53\x83\x85\x23\xbd\xa7\xc2\xe1\xec\x41\x9f\xbf\xd1\x34\xdf\
+\x27\xa9\xc5\xd9\x5e\xdb\x10\x10\x92\x4e\x1f\xd6\x8e\xcc\x2a\x9c\
+\x49\xe1\xb1\xbc\xe5\x12\xc0\xaa\x1f\xd0\x47\x39\x08\x89\x09\x48\
+\x75\xff\x0a\x50\x01\xf4\xc3\x23\x40\xc4\x7c\x64\x23\x80\x0d\xf0\
+\xda\x09\x2e\xe4\x0b\x35\x0e\x2a\x9e\x20\x4c\x58\x05\xb9\x79\xc7\
+\x0c\xa0\x8d\x96\xf8\x75\xd3\x18\xe8\x44\x0e\x12\x12\x5c\xf6\x2e\
+\x5a\x4e\x32\x63\x24\xc3\x42\xa8\xfc\x96\x6d\xa9\xd4\x35\x4b\xe9\
+\x21\xb3\x50\xef\x37\xd3\xf5\x82\xb2\x4c\x91\x65\xb6\xad\x2b\xd8\
+\xf4\x4f\xde\xd3\x0b\xdb\x7d\x57\x9a\xf4\x04\xb9\x11\x70\x87\x86\
+\xd0\xae\x59\xef\xa5\xab\x5b\xba\xa3\x0c\x40\x92\x00\x3f\x32\xdf\
+\xd9\x12\x48\x0a\xf8\x15\xe0\xf3\xc0\x57\x80\x2c\x70\x53\xad\x8b\
+\x38\x36\x7b\x35\x33\xef\x8c\xd0\x6b\x8b\x1b\x29\xb3\x50\xdc\x62\
+\x0c\x6c\x16\x03\x51\x1a\x31\xc2\xd3\x6b\xe6\x85\xe5\xe7\xf3\x64\
+\x91\x6a\xa6\xcc\x7c\xcb\x76\x86\x94\x4b\x90\x19\x66\x9b\x7b\xf3\
+\xc7\x13\x78\x06\xa2\x34\x5c\x30\xea\x4b\x65\x56\xaa\x06\xb3\x4e\
+\x6b\xd8\xce\x6d\xe8\x37\x8c\xde\xd4\x88\x9e\xef\x7a\xfa\x51\xa6\
+\xaf\x33\x77\x94\x01\x74\xd1\x26\x46\x40\x13\xc7\xf9\x21\xf0\x33\
+\xe0\x9f\x81\x27\x80\x8f\x01\xcf\x02\x92\xfd\xaf\xeb\x0b\x46\x03\
+\x22\x01\x52\x76\x6f\xc2\x35\x53\x96\x1f\xb9\x18\x88\x9f\xc4\x6c\
+\x00\x24\xc4\x6d\x13\x18\xe8\xee\x7f\x6b\xbe\xea\x07\xbc\x6e\x7a\
+\xad\x25\xf3\x40\xe1\xb7\x90\x32\x73\xac\x8f\x58\xab\x69\x0f\x17\
+\x3e\xdc\x1c\xcc\xee\xf3\xbe\x33\xfe\xf7\xc9\x05\xef\x8a\xb9\xd0\
+\x98\xbe\xe9\x22\xb5\x89\x2e\xdc\xd5\x4b\x44\x2d\xa3\xb9\xc3\x4b\
+\x43\xd9\x7d\x64\x48\x76\x7a\x24\x57\xaf\xea\xc0\x24\x9f\x5f\xba\
+\x8e\xe8\x56\x7d\xbd\xc5\x1f\x3b\x4c\x40\x26\x41\x6d\x01\xb4\x25\
+\xc8\x01\xc2\xba\x2c\x04\x02\xe5\x10\xeb\x82\xbe\xa3\xbb\xe2\xcc\
+\x0c\x8d\x5d\xf2\x49\xfd\x89\x45\xa0\x7c\xbd\x12\x43\xa7\xc5\x2d\
+\xc6\xc0\x06\x31\x10\x60\x0e\x5c\xa6\x60\xec\x15\x8b\xea\xd1\x2d\
+\xaa\x0b\xd9\x5d\xff\x00\x66\x9b\x99\x31\x7a\xac\xfe\xcc\x58\x0b\
+\xdd\x99\xb2\x0a\x5b\xad\xa0\xb5\x9a\x70\x36\xf8\x5b\xf7\xea\x74\
+\x6d\x6c\xa8\x9d\x99\x2c\x9a\x85\x44\x6f\x64\xf1\xe8\xf4\x44\xb4\
+\xd7\x55\xd2\xd7\xef\x1a\x03\xd0\x8f\x77\xb6\x04\x92\xa9\x64\x26\
+\xfc\x5f\x01\x92\x81\xfc\x05\x8e\x02\xca\x40\x2c\x89\xe0\x29\x40\
+\xb9\x06\x68\x72\x20\x4a\x07\x83\xc9\xc7\xaa\x4b\xcd\x0b\xd6\x65\
+\xff\x95\x6c\x9b\x8b\xef\xc0\xf1\x68\x3f\x50\xfc\xba\x0d\x30\x20\
+\xcb\x40\xc3\x9f\xb7\xbd\x60\xd1\xba\x5a\x7b\x7d\xa9\x2f\x75\xd4\
+\x65\x9e\xa1\x22\x4f\xa8\x58\xae\x43\x2a\x31\xfb\xf1\x5d\x9f\x5d\
+\x9c\xaa\x9c\x35\xaf\xd6\x26\xad\x65\x6f\xc1\x91\x53\xd1\xce\x9a\
+\x75\x18\xcd\xb1\xaa\x0d\x67\x0e\x25\x90\x02\x42\x6a\x26\x74\xbb\
+\x2f\x49\x5c\x51\xbc\x17\x34\x14\x77\x95\x01\xe8\x07\xd7\x68\x92\
+\x08\xde\x05\x2e\x03\x6f\x75\xbe\x97\xc9\x30\x23\x05\x21\xe6\x1a\
+\xb3\x2f\x75\x8c\x01\x4a\x99\xd3\x75\x19\x12\xd4\xe2\xad\x40\x1b\
+\x0f\xf1\xeb\xe6\x31\xa0\x78\x01\xc3\xbc\x54\x7b\x39\x8b\xc9\xb9\
+\xe9\xd8\xe9\x4a\xde\x1e\xcd\x32\xe3\x88\x62\x35\xad\x9c\x53\xcc\
+\xc9\x4b\xf0\x70\xe9\x09\xff\x9d\xd9\x97\xec\x06\xfe\x01\x5e\xe8\
+\x5d\x23\x43\x6f\xfe\xb7\xef\xec\x95\xa2\x0e\x17\x05\xfa\xe1\xd2\
+\x93\x95\x9e\x44\x29\x69\x9b\xca\xaf\xd5\xa5\xff\x68\x2f\xfd\x3d\
+\x4e\x79\x57\x0b\xf2\x35\x6a\xc1\x3b\xdb\xad\xb5\xef\xae\x4e\x00\
+\xcb\x7c\xab\x40\xa2\x73\x80\xbc\x07\xcf\x03\x91\x89\x46\x11\x85\
+\x19\xbb\x0f\x1f\xc2\x01\x93\xa0\x22\x8e\xb5\x95\x39\x7c\x1f\xb7\
+\x18\x03\x9b\xc6\x80\xc8\x41\x50\x6b\xcd\x39\x54\x19\xb2\x16\x1a\
+\xe3\x66\x0b\xb7\x73\x45\x9f\xe8\xa6\x36\x95\x27\x88\x11\xb0\x87\
+\x73\x07\xcd\x6c\xa2\x68\x24\xb1\xa0\x6d\x7f\xea\x57\xd7\x43\xe5\
+\xe1\xa0\x60\x6a\xd6\x18\xce\x1d\x08\x92\x84\x42\xb3\x90\x76\xe9\
+\x5c\x34\x25\xff\x9c\xb7\x01\x45\xee\x6e\x1f\xef\x1a\x31\x02\xfa\
+\x53\x05\x7e\x02\x7c\x03\x10\x53\x60\x90\x4c\x93\xca\xc4\xe4\x7a\
+\x1d\x0e\x47\x33\xa7\x16\xe1\xd0\xec\x61\xb4\x8d\x89\x5b\x8c\x81\
+\xdb\xc1\x40\x9b\x05\x28\xb2\x74\xce\x3b\x9b\x3c\x5f\xfe\x76\x61\
+\xa9\x79\x99\xaa\xd2\xb5\x00\x1a\x8a\x98\x00\xf9\x03\xcd\x83\x3d\
+\x1f\x49\x88\x09\xa0\x49\x67\x47\xbd\x33\xf4\x81\x64\x41\x36\xfa\
+\xd0\xfc\x1f\x2a\x3d\x09\x13\xeb\x81\xb4\xba\xf4\x1f\x99\xe1\x2f\
+\x82\xb5\x1f\x03\x13\xc2\xde\xb6\x7a\xa2\xaf\x7d\xed\x6b\xa2\x6c\
+\x45\x14\x4a\x49\xf1\x09\x40\xce\x01\x69\x89\x64\x28\x03\xed\xa4\
+\xdd\xe3\x56\xfd\x69\x69\x34\xa9\x0b\xb7\xc4\xa6\x66\xe5\xc1\x38\
+\x2d\x6e\x31\x06\x36\x8e\x81\xb6\x4e\x09\x15\x33\x46\xaa\x80\xfc\
+\xc2\x78\x07\xe2\xaa\xde\x83\x51\x10\x6f\x61\x2d\x3f\xcc\x31\xe2\
+\x04\xea\x39\xa7\xd7\x9f\x69\xbc\x67\x36\x5a\x35\xbc\xd2\x22\xfe\
+\xb0\xf1\x1f\xbb\xe3\x57\xa0\x33\xc3\x9f\xe6\xf1\xa1\xcf\x2e\x1f\
+\x2e\x3d\xd5\x28\x25\x87\x32\x52\xa2\xc3\x01\xba\xbf\xfc\x03\x3e\
+\xfc\x1b\xf0\x2a\xc7\x22\x09\x7b\x5b\x51\x10\x9d\x12\x03\x58\x02\
+\x2e\x01\x72\x20\x92\xad\x32\xd2\x66\xe2\x14\x64\xa6\x9c\x5e\x27\
+\x4f\x9e\xc1\x8c\x3d\x10\x32\x40\x9d\x51\xd8\xae\x83\xa1\x9e\xc7\
+\x6d\x27\x60\x40\x59\xa5\x95\x1f\x90\x1a\x13\x06\x55\x86\x42\xc2\
+\x88\x49\x7b\x27\x5d\xb5\x0a\x50\x59\x46\x6f\x72\x24\xe8\xcb\x8c\
+\xfa\x79\x67\x20\x50\x06\xe2\x36\xd3\xd0\xbc\xdb\x5e\x73\x4f\xc9\
+\x77\x73\x89\xde\x60\x20\xbd\x3b\xe8\xcf\xec\x56\x9e\x03\x48\x2a\
+\x22\x7e\x75\x54\x0b\xab\x56\x7f\x89\xff\x7a\xb8\xa8\x6d\x2b\x09\
+\x40\x3d\xea\x48\x01\xd2\x54\xca\x52\x20\x06\xf0\x34\x10\x71\x62\
+\xb4\xb4\x98\x34\x1e\xb2\xb3\xce\x08\xc1\x1d\x0b\x5e\x23\x5c\xa2\
+\xda\x8b\x14\x33\xdb\x8a\x8f\xa9\xbb\x71\xdb\x41\x18\x10\x41\x8b\
+\x4c\x6a\xfe\x55\x87\xc0\xa1\x26\x74\x5d\xcb\xb8\x43\x44\x0b\xd9\
+\x72\xa0\x61\x05\x35\x5c\x2a\x0d\x99\xa3\xd9\x43\xe5\x89\xe5\x37\
+\x39\xa7\x45\xfd\x4b\x8f\xbd\xb5\xda\xca\xea\x1a\xfd\x75\xaf\x5e\
+\xb4\xf2\xe7\x13\x7d\xc1\x17\x0e\x7e\x75\x61\x28\xb3\x2f\x9b\x76\
+\x72\x99\x2e\xf5\xd3\x27\x99\xdf\x5f\x00\xfe\x03\xf8\x16\xc7\x57\
+\x18\xc0\x76\xb0\x02\xd0\xa7\xf7\x9b\x3a\x87\x69\x50\xdc\x4a\xba\
+\x00\x49\x03\x87\x81\xcf\x01\xf2\x1c\x44\xbb\x89\xff\x56\x62\xd8\
+\x3a\x5c\x7c\xc6\xbe\x5c\x7d\xb5\xba\xe4\x8d\x9b\x57\x1b\x6f\x62\
+\x1e\xd4\xa3\x6c\x8f\xc1\x50\x3f\xe3\xb6\xd3\x30\x20\x26\xe0\x10\
+\x2f\x70\x29\xd1\xf2\x6b\x4e\x2e\x31\x54\xcb\x3a\x03\x64\x14\x1c\
+\x4e\x31\xaf\x28\x48\xe5\xda\x85\x64\x7f\x01\xcd\x7a\x30\x5b\x9b\
+\x0c\xde\x5d\x78\xd5\x6a\x11\x65\xc8\x5c\xbd\x67\x0f\xaa\x5f\x96\
+\xc2\x2f\xeb\x14\x8d\x13\x83\xbf\x5e\x23\xf5\x79\x90\x77\xfb\x0a\
+\xea\x2b\x5f\x75\x89\x41\xd6\xb5\x49\xe0\xaf\x80\x5f\x40\x5f\xd7\
+\x28\xd0\xb6\x1d\x03\xa0\x93\x88\x5d\x51\xe6\x61\xad\xfe\xda\x0a\
+\x48\x64\x91\x3e\x40\x7d\x25\xa4\x58\x2e\xc2\x69\x93\x3a\x70\x56\
+\xc1\x9e\x36\x7c\xc7\x0b\x17\x9b\x93\xe4\x0c\x6c\x31\x18\x52\xe9\
+\x28\x45\x61\xf7\xd9\xf9\x18\xb7\x18\x03\xeb\xc4\x80\x58\x80\x1f\
+\x56\xad\x1a\x8e\x3f\x38\x09\x91\x47\xd0\x0d\x32\xce\x20\xb1\xc1\
+\xaa\x43\x8f\x83\x80\x95\x70\xfa\xd2\xa3\x8d\x20\x68\xe1\x5f\x9f\
+\x32\x48\x31\x84\x2c\xbd\xb2\x98\xae\xf3\x57\xb6\xe0\x34\xa6\xb7\
+\xa4\x5e\xd7\x4e\x05\x29\x52\xec\x95\x92\xbb\xac\xe1\xfc\x81\x48\
+\xf4\x47\x12\x50\xc4\x6d\xf7\x47\xc4\x23\x64\x5d\x3b\x0f\xc8\xc4\
+\x2e\xa9\xfa\x9a\xb6\x72\xe6\x35\x47\xb7\xc9\x1f\x70\x57\x29\x01\
+\x77\x03\x7f\x0e\xc8\x37\xe0\xa3\xc0\x4a\x63\xe7\xe6\xb7\x82\xba\
+\x8f\xe8\x56\xbb\x50\xfe\x41\x62\xd9\xbf\x6c\xcd\x35\xde\x8e\x98\
+\xc4\xca\x49\xf1\x87\x18\x03\x1b\xc2\x40\x5b\xc5\x97\x75\xfa\xc2\
+\x82\xbb\x37\x38\x52\xf8\xa2\x97\x72\xfa\x55\xeb\x42\x74\x85\x78\
+\xda\x32\x66\x6a\x93\xc6\x8f\x2e\x7d\xd3\xb8\xb4\x7c\x06\x33\xe2\
+\x32\x3b\x86\xbb\xc7\x04\x44\xd1\x36\x65\xf7\x32\x76\xde\x38\x3e\
+\xf0\xf4\xfc\x48\xf6\x90\x31\x96\x7b\xa4\x48\x96\x0d\x39\x2e\x6a\
+\xf1\xec\x3e\xad\x4e\x55\xf0\xdd\x9f\x00\x4a\xd8\xfb\x53\xa0\xc5\
+\xf7\x3a\xbe\xd2\x56\xce\x5e\x39\xb2\x8d\x3e\xc0\x00\xd4\x3f\x31\
+\x81\xe3\xc0\x23\xc0\x57\x80\x8f\x03\x88\x65\xed\x16\xad\xfa\xe4\
+\x80\x26\xbc\x93\x08\xae\x6a\x58\x6d\x5d\xad\xc0\xbd\x5b\xcd\xb0\
+\x4a\x65\xd8\x89\x3c\xe2\x1c\x76\x43\xe5\x13\xd0\x73\x6f\xeb\xc7\
+\xed\x3e\x52\xfc\xbe\x0d\x30\x20\x42\x4a\x5a\xc5\x70\x38\xf3\x44\
+\xb3\x3f\x71\xd4\x8d\x2a\x5c\xa1\x54\x53\xd7\x9a\x01\x25\x6f\xbd\
+\x2b\xb5\xd7\xae\x3c\x97\x9c\xad\x5f\xb6\x1a\xcd\x5a\xa4\x84\x5a\
+\xb5\xf2\x6e\xd9\x13\x74\x67\x2d\xa2\xbe\x9f\x73\x7b\x6b\x83\xd9\
+\xbd\xe8\x27\x7a\x1c\x72\x19\x16\xf3\x89\x5e\x5f\x55\x90\x91\x02\
+\xae\x97\xe4\x25\xf6\x4b\x89\xfe\xd7\xc0\x0b\xc0\x0c\xcf\x23\xfb\
+\xff\x0d\xed\xfa\x0b\x6f\x38\xe1\x5e\x1e\xe8\x70\x2b\x95\x25\x93\
+\xa7\xa0\xf6\x2e\xda\x0e\x48\x12\x20\xb0\x21\x8a\x1b\x88\xb4\xb4\
+\x28\x07\x51\xd1\x0c\xe2\xc4\x11\x84\x69\xa7\xdf\x77\xbd\x1e\xbf\
+\x11\x2c\x32\x1e\x44\x20\xf1\xdc\x77\x93\x43\xd3\xaf\xb8\xdd\x07\
+\x18\x90\xeb\x2f\x5e\xa8\xcc\x9d\x20\x5a\x32\x57\x2f\x9b\xe8\xa1\
+\x42\xbc\x04\x83\xde\xd4\x6e\x34\x00\x96\xd1\xb0\x2b\x12\x0e\xee\
+\xd8\x53\x4b\x26\x51\xb0\x12\xa2\x7e\x80\x5b\x2f\x8c\xa0\x68\x16\
+\x93\x43\xc8\x24\x88\x02\xd7\x36\x75\x53\xfe\x33\x13\xc0\x79\xe0\
+\xff\x00\x31\x02\x29\x01\xd7\x6c\x77\xae\xd7\x6b\xfe\xdc\xe6\x0e\
+\x76\x24\x01\x3d\x6c\x01\xf8\x22\xf0\x18\xf0\x47\xc0\x1a\xea\x7f\
+\xd5\x10\x10\x1e\x84\xb6\xee\xca\xcf\x9f\x71\x8b\x31\xb0\x09\x0c\
+\x48\xe7\x84\x2d\x7d\xcd\x2b\xfd\x40\x06\x83\xf6\xbf\x35\x4f\xd8\
+\xe2\x83\x10\x3c\x22\xb1\xa6\xbc\x36\x24\x1d\x23\xc4\xb5\xbf\x21\
+\xe2\x97\x9d\xff\x1f\x81\xb3\xc0\x14\x8b\x68\x64\xef\xe7\xf3\x9a\
+\x6d\xed\x27\x5b\xf3\xd4\x7b\x77\x50\x92\x00\x4d\x0f\xb2\x08\xbc\
+\x04\x4c\x02\xe2\x6a\x62\x04\x63\xc0\x01\x40\x9a\x4f\x1a\x96\xdb\
+\x95\x7d\x50\xe7\x50\xfb\x8b\xf8\x35\xc6\xc0\x96\x62\x00\x6d\xfb\
+\x96\xde\x6f\x1d\x37\x5b\x6b\xc1\x96\xc9\x5c\x6e\xbd\xa7\x01\xd9\
+\xf9\xff\x1b\x38\x03\xcc\x7d\x10\xf1\x73\xce\x1d\x94\x5b\x74\xf7\
+\x3b\xd0\x3a\xd2\x40\x92\x5b\xf7\x03\xcf\x02\x8a\x1c\xfc\x14\xa0\
+\x10\x62\xe9\x0b\xa4\x1f\xd0\xc8\x08\x59\x6b\x21\x8c\xc3\x71\x8b\
+\x31\xb0\x63\x31\x20\x33\x97\xb6\xc3\x0a\xa2\x93\xb9\x7c\x1e\x90\
+\x86\xff\x9b\x80\x56\xfd\x57\x20\xfc\x6b\x4c\x7d\x1c\xbb\x69\xdb\
+\xb1\x04\x02\x23\x90\x2c\x24\x82\xcf\x00\x43\xc0\x29\x40\x16\x83\
+\x5f\x03\x0e\x03\xda\x2e\x88\x51\xc4\x2d\xc6\xc0\xfd\x84\x01\x11\
+\xb9\xcc\x79\x6f\x00\xdf\x03\xb4\xda\xbf\x03\x48\x22\x0e\xd6\xb3\
+\xea\x73\xde\x4a\xdb\xb1\x0c\xa0\xfb\x04\x30\x02\xc9\xf9\x72\x12\
+\xda\x0b\x14\x81\xfd\xc0\x2e\x40\x8c\x41\x7f\x77\x53\x8f\xe9\x59\
+\x57\xeb\x72\xf8\x33\x6e\x31\x06\xb6\x3d\x06\xba\x34\x2a\x51\x5f\
+\x0a\xbd\x19\x40\xe6\x3d\xd9\xf7\x23\x51\x5f\xc7\xb4\x4d\xe6\x7d\
+\xc3\xad\x7b\xf3\x0d\x5f\xb8\x9d\x2f\x80\x29\x48\xb7\x21\xe9\x40\
+\xfa\x81\xc1\xce\xe7\x75\x8b\x45\x9c\x1f\xb7\x18\x03\xdb\x09\x03\
+\x5a\xe4\xa4\xff\x3a\xbd\xd1\x15\xfe\x83\x1e\xe2\xff\x01\x10\x24\
+\xb5\xa5\x07\x34\x90\x4c\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\
+\x60\x82\
+\x00\x00\x01\x3a\
+\x3c\
+\x73\x76\x67\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\x3a\
+\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\
+\x30\x2f\x73\x76\x67\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\
+\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x32\x34\x22\x20\x76\x69\
+\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\x30\x20\x32\x34\x20\x32\x34\
+\x22\x20\x66\x69\x6c\x6c\x3d\x22\x6e\x6f\x6e\x65\x22\x20\x73\x74\
+\x72\x6f\x6b\x65\x3d\x22\x23\x34\x39\x35\x30\x35\x37\x22\x20\x73\
+\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\x22\x32\x22\x20\
+\x73\x74\x72\x6f\x6b\x65\x2d\x6c\x69\x6e\x65\x63\x61\x70\x3d\x22\
+\x72\x6f\x75\x6e\x64\x22\x20\x73\x74\x72\x6f\x6b\x65\x2d\x6c\x69\
+\x6e\x65\x6a\x6f\x69\x6e\x3d\x22\x72\x6f\x75\x6e\x64\x22\x3e\x3c\
+\x72\x65\x63\x74\x20\x78\x3d\x22\x33\x22\x20\x79\x3d\x22\x33\x22\
+\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x38\x22\x20\x68\x65\x69\x67\
+\x68\x74\x3d\x22\x31\x38\x22\x20\x72\x78\x3d\x22\x32\x22\x20\x72\
+\x79\x3d\x22\x32\x22\x2f\x3e\x3c\x6c\x69\x6e\x65\x20\x78\x31\x3d\
+\x22\x31\x32\x22\x20\x79\x31\x3d\x22\x38\x22\x20\x78\x32\x3d\x22\
+\x31\x32\x22\x20\x79\x32\x3d\x22\x31\x36\x22\x2f\x3e\x3c\x6c\x69\
+\x6e\x65\x20\x78\x31\x3d\x22\x38\x22\x20\x79\x31\x3d\x22\x31\x32\
+\x22\x20\x78\x32\x3d\x22\x31\x36\x22\x20\x79\x32\x3d\x22\x31\x32\
+\x22\x2f\x3e\x3c\x2f\x73\x76\x67\x3e\
+\x00\x00\x02\x31\
+\x3c\
+\x73\x76\x67\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\x3a\
+\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\
+\x30\x2f\x73\x76\x67\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\
+\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x32\x34\x22\x20\x76\x69\
+\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\x30\x20\x32\x34\x20\x32\x34\
+\x22\x20\x66\x69\x6c\x6c\x3d\x22\x6e\x6f\x6e\x65\x22\x20\x73\x74\
+\x72\x6f\x6b\x65\x3d\x22\x23\x34\x39\x35\x30\x35\x37\x22\x20\x73\
+\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\x22\x32\x22\x20\
+\x73\x74\x72\x6f\x6b\x65\x2d\x6c\x69\x6e\x65\x63\x61\x70\x3d\x22\
+\x72\x6f\x75\x6e\x64\x22\x20\x73\x74\x72\x6f\x6b\x65\x2d\x6c\x69\
+\x6e\x65\x6a\x6f\x69\x6e\x3d\x22\x72\x6f\x75\x6e\x64\x22\x3e\x3c\
+\x63\x69\x72\x63\x6c\x65\x20\x63\x78\x3d\x22\x31\x32\x22\x20\x63\
+\x79\x3d\x22\x31\x32\x22\x20\x72\x3d\x22\x35\x22\x2f\x3e\x3c\x6c\
+\x69\x6e\x65\x20\x78\x31\x3d\x22\x31\x32\x22\x20\x79\x31\x3d\x22\
+\x31\x22\x20\x78\x32\x3d\x22\x31\x32\x22\x20\x79\x32\x3d\x22\x33\
+\x22\x2f\x3e\x3c\x6c\x69\x6e\x65\x20\x78\x31\x3d\x22\x31\x32\x22\
+\x20\x79\x31\x3d\x22\x32\x31\x22\x20\x78\x32\x3d\x22\x31\x32\x22\
+\x20\x79\x32\x3d\x22\x32\x33\x22\x2f\x3e\x3c\x6c\x69\x6e\x65\x20\
+\x78\x31\x3d\x22\x34\x2e\x32\x32\x22\x20\x79\x31\x3d\x22\x34\x2e\
+\x32\x32\x22\x20\x78\x32\x3d\x22\x35\x2e\x36\x34\x22\x20\x79\x32\
+\x3d\x22\x35\x2e\x36\x34\x22\x2f\x3e\x3c\x6c\x69\x6e\x65\x20\x78\
+\x31\x3d\x22\x31\x38\x2e\x33\x36\x22\x20\x79\x31\x3d\x22\x31\x38\
+\x2e\x33\x36\x22\x20\x78\x32\x3d\x22\x31\x39\x2e\x37\x38\x22\x20\
+\x79\x32\x3d\x22\x31\x39\x2e\x37\x38\x22\x2f\x3e\x3c\x6c\x69\x6e\
+\x65\x20\x78\x31\x3d\x22\x31\x22\x20\x79\x31\x3d\x22\x31\x32\x22\
+\x20\x78\x32\x3d\x22\x33\x22\x20\x79\x32\x3d\x22\x31\x32\x22\x2f\
+\x3e\x3c\x6c\x69\x6e\x65\x20\x78\x31\x3d\x22\x32\x31\x22\x20\x79\
+\x31\x3d\x22\x31\x32\x22\x20\x78\x32\x3d\x22\x32\x33\x22\x20\x79\
+\x32\x3d\x22\x31\x32\x22\x2f\x3e\x3c\x6c\x69\x6e\x65\x20\x78\x31\
+\x3d\x22\x34\x2e\x32\x32\x22\x20\x79\x31\x3d\x22\x31\x39\x2e\x37\
+\x38\x22\x20\x78\x32\x3d\x22\x35\x2e\x36\x34\x22\x20\x79\x32\x3d\
+\x22\x31\x38\x2e\x33\x36\x22\x2f\x3e\x3c\x6c\x69\x6e\x65\x20\x78\
+\x31\x3d\x22\x31\x38\x2e\x33\x36\x22\x20\x79\x31\x3d\x22\x35\x2e\
+\x36\x34\x22\x20\x78\x32\x3d\x22\x31\x39\x2e\x37\x38\x22\x20\x79\
+\x32\x3d\x22\x34\x2e\x32\x32\x22\x2f\x3e\x3c\x2f\x73\x76\x67\x3e\
+\
+\x00\x00\x01\x31\
+\x3c\
+\x73\x76\x67\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\x3a\
+\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\
+\x30\x2f\x73\x76\x67\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\
+\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x32\x34\x22\x20\x76\x69\
+\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\x30\x20\x32\x34\x20\x32\x34\
+\x22\x20\x66\x69\x6c\x6c\x3d\x22\x6e\x6f\x6e\x65\x22\x20\x73\x74\
+\x72\x6f\x6b\x65\x3d\x22\x23\x34\x39\x35\x30\x35\x37\x22\x20\x73\
+\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\x22\x32\x22\x20\
+\x73\x74\x72\x6f\x6b\x65\x2d\x6c\x69\x6e\x65\x63\x61\x70\x3d\x22\
+\x72\x6f\x75\x6e\x64\x22\x20\x73\x74\x72\x6f\x6b\x65\x2d\x6c\x69\
+\x6e\x65\x6a\x6f\x69\x6e\x3d\x22\x72\x6f\x75\x6e\x64\x22\x3e\x3c\
+\x72\x65\x63\x74\x20\x78\x3d\x22\x39\x22\x20\x79\x3d\x22\x39\x22\
+\x20\x77\x69\x64\x74\x68\x3d\x22\x31\x33\x22\x20\x68\x65\x69\x67\
+\x68\x74\x3d\x22\x31\x33\x22\x20\x72\x78\x3d\x22\x32\x22\x20\x72\
+\x79\x3d\x22\x32\x22\x2f\x3e\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\
+\x4d\x35\x20\x31\x35\x48\x34\x61\x32\x20\x32\x20\x30\x20\x30\x20\
+\x31\x2d\x32\x2d\x32\x56\x34\x61\x32\x20\x32\x20\x30\x20\x30\x20\
+\x31\x20\x32\x2d\x32\x68\x39\x61\x32\x20\x32\x20\x30\x20\x30\x20\
+\x31\x20\x32\x20\x32\x76\x31\x22\x2f\x3e\x3c\x2f\x73\x76\x67\x3e\
+\
+\x00\x00\x00\xd9\
+\x3c\
+\x73\x76\x67\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\x3a\
+\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\
+\x30\x2f\x73\x76\x67\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\
+\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x32\x34\x22\x20\x76\x69\
+\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\x30\x20\x32\x34\x20\x32\x34\
+\x22\x20\x66\x69\x6c\x6c\x3d\x22\x6e\x6f\x6e\x65\x22\x20\x73\x74\
+\x72\x6f\x6b\x65\x3d\x22\x23\x34\x39\x35\x30\x35\x37\x22\x20\x73\
+\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\x22\x32\x22\x20\
+\x73\x74\x72\x6f\x6b\x65\x2d\x6c\x69\x6e\x65\x63\x61\x70\x3d\x22\
+\x72\x6f\x75\x6e\x64\x22\x20\x73\x74\x72\x6f\x6b\x65\x2d\x6c\x69\
+\x6e\x65\x6a\x6f\x69\x6e\x3d\x22\x72\x6f\x75\x6e\x64\x22\x3e\x3c\
+\x70\x6f\x6c\x79\x6c\x69\x6e\x65\x20\x70\x6f\x69\x6e\x74\x73\x3d\
+\x22\x32\x30\x20\x36\x20\x39\x20\x31\x37\x20\x34\x20\x31\x32\x22\
+\x2f\x3e\x3c\x2f\x73\x76\x67\x3e\
+\x00\x00\x01\x0d\
+\x3c\
+\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\x22\x20\x68\
+\x65\x69\x67\x68\x74\x3d\x22\x32\x34\x22\x20\x76\x69\x65\x77\x42\
+\x6f\x78\x3d\x22\x30\x20\x30\x20\x32\x34\x20\x32\x34\x22\x20\x78\
+\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\
+\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\x30\x2f\x73\x76\x67\
+\x22\x20\x66\x69\x6c\x6c\x3d\x22\x6e\x6f\x6e\x65\x22\x20\x73\x74\
+\x72\x6f\x6b\x65\x3d\x22\x23\x34\x39\x35\x30\x35\x37\x22\x20\x73\
+\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\x22\x32\x22\x20\
+\x73\x74\x72\x6f\x6b\x65\x2d\x6c\x69\x6e\x65\x63\x61\x70\x3d\x22\
+\x72\x6f\x75\x6e\x64\x22\x20\x73\x74\x72\x6f\x6b\x65\x2d\x6c\x69\
+\x6e\x65\x6a\x6f\x69\x6e\x3d\x22\x72\x6f\x75\x6e\x64\x22\x3e\x3c\
+\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x31\x32\x20\x32\x30\x68\x39\
+\x22\x2f\x3e\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x31\x36\x2e\
+\x35\x20\x33\x2e\x35\x61\x32\x2e\x31\x32\x31\x20\x32\x2e\x31\x32\
+\x31\x20\x30\x20\x30\x20\x31\x20\x33\x20\x33\x4c\x37\x20\x31\x39\
+\x6c\x2d\x34\x20\x31\x20\x31\x2d\x34\x4c\x31\x36\x2e\x35\x20\x33\
+\x2e\x35\x7a\x22\x2f\x3e\x3c\x2f\x73\x76\x67\x3e\
+\x00\x00\x01\x1f\
+\x3c\
+\x73\x76\x67\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\x3a\
+\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\
+\x30\x2f\x73\x76\x67\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\
+\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x32\x34\x22\x20\x76\x69\
+\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\x30\x20\x32\x34\x20\x32\x34\
+\x22\x20\x66\x69\x6c\x6c\x3d\x22\x6e\x6f\x6e\x65\x22\x20\x73\x74\
+\x72\x6f\x6b\x65\x3d\x22\x23\x34\x39\x35\x30\x35\x37\x22\x20\x73\
+\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\x22\x32\x22\x20\
+\x73\x74\x72\x6f\x6b\x65\x2d\x6c\x69\x6e\x65\x63\x61\x70\x3d\x22\
+\x72\x6f\x75\x6e\x64\x22\x20\x73\x74\x72\x6f\x6b\x65\x2d\x6c\x69\
+\x6e\x65\x6a\x6f\x69\x6e\x3d\x22\x72\x6f\x75\x6e\x64\x22\x3e\x3c\
+\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x31\x33\x20\x32\x48\x36\x61\
+\x32\x20\x32\x20\x30\x20\x30\x20\x30\x2d\x32\x20\x32\x76\x31\x36\
+\x61\x32\x20\x32\x20\x30\x20\x30\x20\x30\x20\x32\x20\x32\x68\x31\
+\x32\x61\x32\x20\x32\x20\x30\x20\x30\x20\x30\x20\x32\x2d\x32\x56\
+\x39\x7a\x22\x2f\x3e\x3c\x70\x6f\x6c\x79\x6c\x69\x6e\x65\x20\x70\
+\x6f\x69\x6e\x74\x73\x3d\x22\x31\x33\x20\x32\x20\x31\x33\x20\x39\
+\x20\x32\x30\x20\x39\x22\x2f\x3e\x3c\x2f\x73\x76\x67\x3e\
+\x00\x00\x01\x30\
+\x3c\
+\x73\x76\x67\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\x3a\
+\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\
+\x30\x2f\x73\x76\x67\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\
+\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x32\x34\x22\x20\x76\x69\
+\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\x30\x20\x32\x34\x20\x32\x34\
+\x22\x20\x66\x69\x6c\x6c\x3d\x22\x6e\x6f\x6e\x65\x22\x20\x73\x74\
+\x72\x6f\x6b\x65\x3d\x22\x23\x34\x39\x35\x30\x35\x37\x22\x20\x73\
+\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\x22\x32\x22\x20\
+\x73\x74\x72\x6f\x6b\x65\x2d\x6c\x69\x6e\x65\x63\x61\x70\x3d\x22\
+\x72\x6f\x75\x6e\x64\x22\x20\x73\x74\x72\x6f\x6b\x65\x2d\x6c\x69\
+\x6e\x65\x6a\x6f\x69\x6e\x3d\x22\x72\x6f\x75\x6e\x64\x22\x3e\x3c\
+\x63\x69\x72\x63\x6c\x65\x20\x63\x78\x3d\x22\x31\x32\x22\x20\x63\
+\x79\x3d\x22\x31\x32\x22\x20\x72\x3d\x22\x31\x30\x22\x2f\x3e\x3c\
+\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x39\x2e\x30\x39\x20\x39\x61\
+\x33\x20\x33\x20\x30\x20\x30\x20\x31\x20\x35\x2e\x38\x33\x20\x31\
+\x63\x30\x20\x32\x2d\x33\x20\x33\x2d\x33\x20\x33\x22\x2f\x3e\x3c\
+\x6c\x69\x6e\x65\x20\x78\x31\x3d\x22\x31\x32\x22\x20\x79\x31\x3d\
+\x22\x31\x37\x22\x20\x78\x32\x3d\x22\x31\x32\x2e\x30\x31\x22\x20\
+\x79\x32\x3d\x22\x31\x37\x22\x2f\x3e\x3c\x2f\x73\x76\x67\x3e\
+\x00\x00\x01\x9b\
+\x3c\
+\x73\x76\x67\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\x3a\
+\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\
+\x30\x2f\x73\x76\x67\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\
+\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x32\x34\x22\x20\x76\x69\
+\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\x30\x20\x32\x34\x20\x32\x34\
+\x22\x20\x66\x69\x6c\x6c\x3d\x22\x6e\x6f\x6e\x65\x22\x20\x73\x74\
+\x72\x6f\x6b\x65\x3d\x22\x23\x34\x39\x35\x30\x35\x37\x22\x20\x73\
+\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\x22\x32\x22\x20\
+\x73\x74\x72\x6f\x6b\x65\x2d\x6c\x69\x6e\x65\x63\x61\x70\x3d\x22\
+\x72\x6f\x75\x6e\x64\x22\x20\x73\x74\x72\x6f\x6b\x65\x2d\x6c\x69\
+\x6e\x65\x6a\x6f\x69\x6e\x3d\x22\x72\x6f\x75\x6e\x64\x22\x3e\x3c\
+\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x31\x37\x2e\x39\x34\x20\x31\
+\x37\x2e\x39\x34\x41\x31\x30\x2e\x30\x37\x20\x31\x30\x2e\x30\x37\
+\x20\x30\x20\x30\x20\x31\x20\x31\x32\x20\x32\x30\x63\x2d\x37\x20\
+\x30\x2d\x31\x31\x2d\x38\x2d\x31\x31\x2d\x38\x61\x31\x38\x2e\x34\
+\x35\x20\x31\x38\x2e\x34\x35\x20\x30\x20\x30\x20\x31\x20\x35\x2e\
+\x30\x36\x2d\x35\x2e\x39\x34\x4d\x39\x2e\x39\x20\x34\x2e\x32\x34\
+\x41\x39\x2e\x31\x32\x20\x39\x2e\x31\x32\x20\x30\x20\x30\x20\x31\
+\x20\x31\x32\x20\x34\x63\x37\x20\x30\x20\x31\x31\x20\x38\x20\x31\
+\x31\x20\x38\x61\x31\x38\x2e\x35\x20\x31\x38\x2e\x35\x20\x30\x20\
+\x30\x20\x31\x2d\x32\x2e\x31\x36\x20\x33\x2e\x31\x39\x6d\x2d\x36\
+\x2e\x37\x32\x2d\x31\x2e\x30\x37\x61\x33\x20\x33\x20\x30\x20\x31\
+\x20\x31\x2d\x34\x2e\x32\x34\x2d\x34\x2e\x32\x34\x22\x2f\x3e\x3c\
+\x6c\x69\x6e\x65\x20\x78\x31\x3d\x22\x31\x22\x20\x79\x31\x3d\x22\
+\x31\x22\x20\x78\x32\x3d\x22\x32\x33\x22\x20\x79\x32\x3d\x22\x32\
+\x33\x22\x2f\x3e\x3c\x2f\x73\x76\x67\x3e\
+\x00\x00\x00\xd9\
+\x3c\
+\x73\x76\x67\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\x3a\
+\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\
+\x30\x2f\x73\x76\x67\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\
+\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x32\x34\x22\x20\x76\x69\
+\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\x30\x20\x32\x34\x20\x32\x34\
+\x22\x20\x66\x69\x6c\x6c\x3d\x22\x6e\x6f\x6e\x65\x22\x20\x73\x74\
+\x72\x6f\x6b\x65\x3d\x22\x23\x34\x39\x35\x30\x35\x37\x22\x20\x73\
+\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\x22\x32\x22\x20\
+\x73\x74\x72\x6f\x6b\x65\x2d\x6c\x69\x6e\x65\x63\x61\x70\x3d\x22\
+\x72\x6f\x75\x6e\x64\x22\x20\x73\x74\x72\x6f\x6b\x65\x2d\x6c\x69\
+\x6e\x65\x6a\x6f\x69\x6e\x3d\x22\x72\x6f\x75\x6e\x64\x22\x3e\x3c\
+\x70\x6f\x6c\x79\x6c\x69\x6e\x65\x20\x70\x6f\x69\x6e\x74\x73\x3d\
+\x22\x39\x20\x31\x38\x20\x31\x35\x20\x31\x32\x20\x39\x20\x36\x22\
+\x2f\x3e\x3c\x2f\x73\x76\x67\x3e\
+\x00\x00\x01\x0d\
+\x3c\
+\x73\x76\x67\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\x3a\
+\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\
+\x30\x2f\x73\x76\x67\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\
+\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x32\x34\x22\x20\x76\x69\
+\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\x30\x20\x32\x34\x20\x32\x34\
+\x22\x20\x66\x69\x6c\x6c\x3d\x22\x6e\x6f\x6e\x65\x22\x20\x73\x74\
+\x72\x6f\x6b\x65\x3d\x22\x23\x34\x39\x35\x30\x35\x37\x22\x20\x73\
+\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\x22\x32\x22\x20\
+\x73\x74\x72\x6f\x6b\x65\x2d\x6c\x69\x6e\x65\x63\x61\x70\x3d\x22\
+\x72\x6f\x75\x6e\x64\x22\x20\x73\x74\x72\x6f\x6b\x65\x2d\x6c\x69\
+\x6e\x65\x6a\x6f\x69\x6e\x3d\x22\x72\x6f\x75\x6e\x64\x22\x3e\x3c\
+\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x32\x32\x20\x31\x39\x61\x32\
+\x20\x32\x20\x30\x20\x30\x20\x31\x2d\x32\x20\x32\x48\x34\x61\x32\
+\x20\x32\x20\x30\x20\x30\x20\x31\x2d\x32\x2d\x32\x56\x35\x61\x32\
+\x20\x32\x20\x30\x20\x30\x20\x31\x20\x32\x2d\x32\x68\x35\x6c\x32\
+\x20\x33\x68\x39\x61\x32\x20\x32\x20\x30\x20\x30\x20\x31\x20\x32\
+\x20\x32\x7a\x22\x2f\x3e\x3c\x2f\x73\x76\x67\x3e\
+\x00\x00\x00\xda\
+\x3c\
+\x73\x76\x67\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\x3a\
+\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\
+\x30\x2f\x73\x76\x67\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\
+\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x32\x34\x22\x20\x76\x69\
+\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\x30\x20\x32\x34\x20\x32\x34\
+\x22\x20\x66\x69\x6c\x6c\x3d\x22\x6e\x6f\x6e\x65\x22\x20\x73\x74\
+\x72\x6f\x6b\x65\x3d\x22\x23\x34\x39\x35\x30\x35\x37\x22\x20\x73\
+\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\x22\x32\x22\x20\
+\x73\x74\x72\x6f\x6b\x65\x2d\x6c\x69\x6e\x65\x63\x61\x70\x3d\x22\
+\x72\x6f\x75\x6e\x64\x22\x20\x73\x74\x72\x6f\x6b\x65\x2d\x6c\x69\
+\x6e\x65\x6a\x6f\x69\x6e\x3d\x22\x72\x6f\x75\x6e\x64\x22\x3e\x3c\
+\x70\x6f\x6c\x79\x6c\x69\x6e\x65\x20\x70\x6f\x69\x6e\x74\x73\x3d\
+\x22\x31\x35\x20\x31\x38\x20\x39\x20\x31\x32\x20\x31\x35\x20\x36\
+\x22\x2f\x3e\x3c\x2f\x73\x76\x67\x3e\
+\x00\x00\x01\x0b\
+\x3c\
+\x73\x76\x67\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\x3a\
+\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\
+\x30\x2f\x73\x76\x67\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\
+\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x32\x34\x22\x20\x76\x69\
+\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\x30\x20\x32\x34\x20\x32\x34\
+\x22\x20\x66\x69\x6c\x6c\x3d\x22\x6e\x6f\x6e\x65\x22\x20\x73\x74\
+\x72\x6f\x6b\x65\x3d\x22\x23\x34\x39\x35\x30\x35\x37\x22\x20\x73\
+\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\x22\x32\x22\x20\
+\x73\x74\x72\x6f\x6b\x65\x2d\x6c\x69\x6e\x65\x63\x61\x70\x3d\x22\
+\x72\x6f\x75\x6e\x64\x22\x20\x73\x74\x72\x6f\x6b\x65\x2d\x6c\x69\
+\x6e\x65\x6a\x6f\x69\x6e\x3d\x22\x72\x6f\x75\x6e\x64\x22\x3e\x3c\
+\x70\x6f\x6c\x79\x6c\x69\x6e\x65\x20\x70\x6f\x69\x6e\x74\x73\x3d\
+\x22\x32\x33\x20\x34\x20\x32\x33\x20\x31\x30\x20\x31\x37\x20\x31\
+\x30\x22\x2f\x3e\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x32\x30\
+\x2e\x34\x39\x20\x31\x35\x61\x39\x20\x39\x20\x30\x20\x31\x20\x31\
+\x2d\x32\x2e\x31\x33\x2d\x39\x2e\x33\x36\x4c\x32\x33\x20\x31\x30\
+\x22\x2f\x3e\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x01\x34\
+\x3c\
+\x73\x76\x67\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\x3a\
+\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\
+\x30\x2f\x73\x76\x67\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\
+\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x32\x34\x22\x20\x76\x69\
+\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\x30\x20\x32\x34\x20\x32\x34\
+\x22\x20\x66\x69\x6c\x6c\x3d\x22\x6e\x6f\x6e\x65\x22\x20\x73\x74\
+\x72\x6f\x6b\x65\x3d\x22\x23\x34\x39\x35\x30\x35\x37\x22\x20\x73\
+\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\x22\x32\x22\x20\
+\x73\x74\x72\x6f\x6b\x65\x2d\x6c\x69\x6e\x65\x63\x61\x70\x3d\x22\
+\x72\x6f\x75\x6e\x64\x22\x20\x73\x74\x72\x6f\x6b\x65\x2d\x6c\x69\
+\x6e\x65\x6a\x6f\x69\x6e\x3d\x22\x72\x6f\x75\x6e\x64\x22\x3e\x3c\
+\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x39\x20\x32\x31\x48\x35\x61\
+\x32\x20\x32\x20\x30\x20\x30\x20\x31\x2d\x32\x2d\x32\x56\x35\x61\
+\x32\x20\x32\x20\x30\x20\x30\x20\x31\x20\x32\x2d\x32\x68\x34\x22\
+\x2f\x3e\x3c\x70\x6f\x6c\x79\x6c\x69\x6e\x65\x20\x70\x6f\x69\x6e\
+\x74\x73\x3d\x22\x31\x36\x20\x31\x37\x20\x32\x31\x20\x31\x32\x20\
+\x31\x36\x20\x37\x22\x2f\x3e\x3c\x6c\x69\x6e\x65\x20\x78\x31\x3d\
+\x22\x32\x31\x22\x20\x79\x31\x3d\x22\x31\x32\x22\x20\x78\x32\x3d\
+\x22\x39\x22\x20\x79\x32\x3d\x22\x31\x32\x22\x2f\x3e\x3c\x2f\x73\
+\x76\x67\x3e\
+\x00\x00\x01\x4c\
+\x3c\
+\x73\x76\x67\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\x3a\
+\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\
+\x30\x2f\x73\x76\x67\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\
+\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x32\x34\x22\x20\x76\x69\
+\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\x30\x20\x32\x34\x20\x32\x34\
+\x22\x20\x66\x69\x6c\x6c\x3d\x22\x6e\x6f\x6e\x65\x22\x20\x73\x74\
+\x72\x6f\x6b\x65\x3d\x22\x23\x34\x39\x35\x30\x35\x37\x22\x20\x73\
+\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\x22\x32\x22\x20\
+\x73\x74\x72\x6f\x6b\x65\x2d\x6c\x69\x6e\x65\x63\x61\x70\x3d\x22\
+\x72\x6f\x75\x6e\x64\x22\x20\x73\x74\x72\x6f\x6b\x65\x2d\x6c\x69\
+\x6e\x65\x6a\x6f\x69\x6e\x3d\x22\x72\x6f\x75\x6e\x64\x22\x3e\x3c\
+\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x31\x39\x20\x32\x31\x48\x35\
+\x61\x32\x20\x32\x20\x30\x20\x30\x20\x31\x2d\x32\x2d\x32\x56\x35\
+\x61\x32\x20\x32\x20\x30\x20\x30\x20\x31\x20\x32\x2d\x32\x68\x31\
+\x31\x6c\x35\x20\x35\x76\x31\x31\x61\x32\x20\x32\x20\x30\x20\x30\
+\x20\x31\x2d\x32\x20\x32\x7a\x22\x2f\x3e\x3c\x70\x6f\x6c\x79\x6c\
+\x69\x6e\x65\x20\x70\x6f\x69\x6e\x74\x73\x3d\x22\x31\x37\x20\x32\
+\x31\x20\x31\x37\x20\x31\x33\x20\x37\x20\x31\x33\x20\x37\x20\x32\
+\x31\x22\x2f\x3e\x3c\x70\x6f\x6c\x79\x6c\x69\x6e\x65\x20\x70\x6f\
+\x69\x6e\x74\x73\x3d\x22\x37\x20\x33\x20\x37\x20\x38\x20\x31\x35\
+\x20\x38\x22\x2f\x3e\x3c\x2f\x73\x76\x67\x3e\
+\x00\x00\x01\x05\
+\x3c\
+\x73\x76\x67\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\x3a\
+\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\
+\x30\x2f\x73\x76\x67\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\
+\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x32\x34\x22\x20\x76\x69\
+\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\x30\x20\x32\x34\x20\x32\x34\
+\x22\x20\x66\x69\x6c\x6c\x3d\x22\x6e\x6f\x6e\x65\x22\x20\x73\x74\
+\x72\x6f\x6b\x65\x3d\x22\x23\x34\x39\x35\x30\x35\x37\x22\x20\x73\
+\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\x22\x32\x22\x20\
+\x73\x74\x72\x6f\x6b\x65\x2d\x6c\x69\x6e\x65\x63\x61\x70\x3d\x22\
+\x72\x6f\x75\x6e\x64\x22\x20\x73\x74\x72\x6f\x6b\x65\x2d\x6c\x69\
+\x6e\x65\x6a\x6f\x69\x6e\x3d\x22\x72\x6f\x75\x6e\x64\x22\x3e\x3c\
+\x70\x6f\x6c\x79\x6c\x69\x6e\x65\x20\x70\x6f\x69\x6e\x74\x73\x3d\
+\x22\x31\x20\x34\x20\x31\x20\x31\x30\x20\x37\x20\x31\x30\x22\x2f\
+\x3e\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x33\x2e\x35\x31\x20\
+\x31\x35\x61\x39\x20\x39\x20\x30\x20\x31\x20\x30\x20\x32\x2e\x31\
+\x33\x2d\x39\x2e\x33\x36\x4c\x31\x20\x31\x30\x22\x2f\x3e\x3c\x2f\
+\x73\x76\x67\x3e\
+\x00\x00\x01\x02\
+\x3c\
+\x73\x76\x67\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\x3a\
+\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\
+\x30\x2f\x73\x76\x67\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\
+\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x32\x34\x22\x20\x76\x69\
+\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\x30\x20\x32\x34\x20\x32\x34\
+\x22\x20\x66\x69\x6c\x6c\x3d\x22\x6e\x6f\x6e\x65\x22\x20\x73\x74\
+\x72\x6f\x6b\x65\x3d\x22\x23\x34\x39\x35\x30\x35\x37\x22\x20\x73\
+\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\x22\x32\x22\x20\
+\x73\x74\x72\x6f\x6b\x65\x2d\x6c\x69\x6e\x65\x63\x61\x70\x3d\x22\
+\x72\x6f\x75\x6e\x64\x22\x20\x73\x74\x72\x6f\x6b\x65\x2d\x6c\x69\
+\x6e\x65\x6a\x6f\x69\x6e\x3d\x22\x72\x6f\x75\x6e\x64\x22\x3e\x3c\
+\x63\x69\x72\x63\x6c\x65\x20\x63\x78\x3d\x22\x31\x31\x22\x20\x63\
+\x79\x3d\x22\x31\x31\x22\x20\x72\x3d\x22\x38\x22\x2f\x3e\x3c\x6c\
+\x69\x6e\x65\x20\x78\x31\x3d\x22\x32\x31\x22\x20\x79\x31\x3d\x22\
+\x32\x31\x22\x20\x78\x32\x3d\x22\x31\x36\x2e\x36\x35\x22\x20\x79\
+\x32\x3d\x22\x31\x36\x2e\x36\x35\x22\x2f\x3e\x3c\x2f\x73\x76\x67\
+\x3e\
+\x00\x00\x01\x00\
+\x3c\
+\x73\x76\x67\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\x3a\
+\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\
+\x30\x2f\x73\x76\x67\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\
+\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x32\x34\x22\x20\x76\x69\
+\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\x30\x20\x32\x34\x20\x32\x34\
+\x22\x20\x66\x69\x6c\x6c\x3d\x22\x6e\x6f\x6e\x65\x22\x20\x73\x74\
+\x72\x6f\x6b\x65\x3d\x22\x23\x34\x39\x35\x30\x35\x37\x22\x20\x73\
+\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\x22\x32\x22\x20\
+\x73\x74\x72\x6f\x6b\x65\x2d\x6c\x69\x6e\x65\x63\x61\x70\x3d\x22\
+\x72\x6f\x75\x6e\x64\x22\x20\x73\x74\x72\x6f\x6b\x65\x2d\x6c\x69\
+\x6e\x65\x6a\x6f\x69\x6e\x3d\x22\x72\x6f\x75\x6e\x64\x22\x3e\x3c\
+\x6c\x69\x6e\x65\x20\x78\x31\x3d\x22\x31\x38\x22\x20\x79\x31\x3d\
+\x22\x36\x22\x20\x78\x32\x3d\x22\x36\x22\x20\x79\x32\x3d\x22\x31\
+\x38\x22\x2f\x3e\x3c\x6c\x69\x6e\x65\x20\x78\x31\x3d\x22\x36\x22\
+\x20\x79\x31\x3d\x22\x36\x22\x20\x78\x32\x3d\x22\x31\x38\x22\x20\
+\x79\x32\x3d\x22\x31\x38\x22\x2f\x3e\x3c\x2f\x73\x76\x67\x3e\
+\x00\x00\x00\xe7\
+\x3c\
+\x73\x76\x67\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\x3a\
+\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\
+\x30\x2f\x73\x76\x67\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\
+\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x32\x34\x22\x20\x76\x69\
+\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\x30\x20\x32\x34\x20\x32\x34\
+\x22\x20\x66\x69\x6c\x6c\x3d\x22\x6e\x6f\x6e\x65\x22\x20\x73\x74\
+\x72\x6f\x6b\x65\x3d\x22\x23\x34\x39\x35\x30\x35\x37\x22\x20\x73\
+\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\x22\x32\x22\x20\
+\x73\x74\x72\x6f\x6b\x65\x2d\x6c\x69\x6e\x65\x63\x61\x70\x3d\x22\
+\x72\x6f\x75\x6e\x64\x22\x20\x73\x74\x72\x6f\x6b\x65\x2d\x6c\x69\
+\x6e\x65\x6a\x6f\x69\x6e\x3d\x22\x72\x6f\x75\x6e\x64\x22\x3e\x3c\
+\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x31\x32\x20\x32\x2e\x36\x39\
+\x6c\x35\x2e\x36\x36\x20\x35\x2e\x36\x36\x61\x38\x20\x38\x20\x30\
+\x20\x31\x20\x31\x2d\x31\x31\x2e\x33\x31\x20\x30\x7a\x22\x2f\x3e\
+\x3c\x2f\x73\x76\x67\x3e\
+\x00\x00\x01\x4e\
+\x3c\
+\x73\x76\x67\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\x3a\
+\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\
+\x30\x2f\x73\x76\x67\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\
+\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x32\x34\x22\x20\x76\x69\
+\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\x30\x20\x32\x34\x20\x32\x34\
+\x22\x20\x66\x69\x6c\x6c\x3d\x22\x6e\x6f\x6e\x65\x22\x20\x73\x74\
+\x72\x6f\x6b\x65\x3d\x22\x23\x34\x39\x35\x30\x35\x37\x22\x20\x73\
+\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\x22\x32\x22\x20\
+\x73\x74\x72\x6f\x6b\x65\x2d\x6c\x69\x6e\x65\x63\x61\x70\x3d\x22\
+\x72\x6f\x75\x6e\x64\x22\x20\x73\x74\x72\x6f\x6b\x65\x2d\x6c\x69\
+\x6e\x65\x6a\x6f\x69\x6e\x3d\x22\x72\x6f\x75\x6e\x64\x22\x3e\x3c\
+\x63\x69\x72\x63\x6c\x65\x20\x63\x78\x3d\x22\x31\x31\x22\x20\x63\
+\x79\x3d\x22\x31\x31\x22\x20\x72\x3d\x22\x38\x22\x2f\x3e\x3c\x6c\
+\x69\x6e\x65\x20\x78\x31\x3d\x22\x32\x31\x22\x20\x79\x31\x3d\x22\
+\x32\x31\x22\x20\x78\x32\x3d\x22\x31\x36\x2e\x36\x35\x22\x20\x79\
+\x32\x3d\x22\x31\x36\x2e\x36\x35\x22\x2f\x3e\x3c\x6c\x69\x6e\x65\
+\x20\x78\x31\x3d\x22\x31\x31\x22\x20\x79\x31\x3d\x22\x38\x22\x20\
+\x78\x32\x3d\x22\x31\x31\x22\x20\x79\x32\x3d\x22\x31\x34\x22\x2f\
+\x3e\x3c\x6c\x69\x6e\x65\x20\x78\x31\x3d\x22\x38\x22\x20\x79\x31\
+\x3d\x22\x31\x31\x22\x20\x78\x32\x3d\x22\x31\x34\x22\x20\x79\x32\
+\x3d\x22\x31\x31\x22\x2f\x3e\x3c\x2f\x73\x76\x67\x3e\
+\x00\x00\x0b\xa8\
+\x6f\
+\x70\x65\x6e\x46\x69\x6c\x65\x3d\xe6\x89\x93\xe5\xbc\x80\xe6\x96\
+\x87\xe4\xbb\xb6\x0a\x6f\x70\x65\x6e\x46\x69\x6c\x65\x44\x65\x74\
+\x61\x69\x6c\x3d\xe6\x89\x93\xe5\xbc\x80\xe5\x9b\xbe\xe5\x83\x8f\
+\xe6\x96\x87\xe4\xbb\xb6\x0a\x71\x75\x69\x74\x3d\xe9\x80\x80\xe5\
+\x87\xba\x0a\x71\x75\x69\x74\x41\x70\x70\x3d\xe9\x80\x80\xe5\x87\
+\xba\xe7\xa8\x8b\xe5\xba\x8f\x0a\x6f\x70\x65\x6e\x44\x69\x72\x3d\
+\xe6\x89\x93\xe5\xbc\x80\xe7\x9b\xae\xe5\xbd\x95\x0a\x63\x6f\x70\
+\x79\x50\x72\x65\x76\x42\x6f\x75\x6e\x64\x69\x6e\x67\x3d\xe5\xa4\
+\x8d\xe5\x88\xb6\xe5\xbd\x93\xe5\x89\x8d\xe5\x9b\xbe\xe5\x83\x8f\
+\xe4\xb8\xad\xe7\x9a\x84\xe4\xb8\x8a\xe4\xb8\x80\xe4\xb8\xaa\xe8\
+\xbe\xb9\xe7\x95\x8c\xe6\xa1\x86\x0a\x63\x68\x61\x6e\x67\x65\x53\
+\x61\x76\x65\x64\x41\x6e\x6e\x6f\x74\x61\x74\x69\x6f\x6e\x44\x69\
+\x72\x3d\xe6\x9b\xb4\xe6\x94\xb9\xe4\xbf\x9d\xe5\xad\x98\xe6\xa0\
+\x87\xe7\xad\xbe\xe6\x96\x87\xe4\xbb\xb6\xe7\x9a\x84\xe9\xa2\x84\
+\xe8\xae\xbe\xe7\x9b\xae\xe5\xbd\x95\x0a\x6f\x70\x65\x6e\x41\x6e\
+\x6e\x6f\x74\x61\x74\x69\x6f\x6e\x3d\xe5\xbc\x80\xe5\x90\xaf\xe6\
+\xa0\x87\xe7\xad\xbe\x0a\x6f\x70\x65\x6e\x41\x6e\x6e\x6f\x74\x61\
+\x74\x69\x6f\x6e\x44\x65\x74\x61\x69\x6c\x3d\xe6\x89\x93\xe5\xbc\
+\x80\xe6\xa0\x87\xe7\xad\xbe\xe6\x96\x87\xe4\xbb\xb6\x0a\x63\x68\
+\x61\x6e\x67\x65\x53\x61\x76\x65\x44\x69\x72\x3d\xe6\x94\xb9\xe5\
+\x8f\x98\xe5\xad\x98\xe6\x94\xbe\xe7\x9b\xae\xe5\xbd\x95\x0a\x6e\
+\x65\x78\x74\x49\x6d\x67\x3d\xe4\xb8\x8b\xe4\xb8\x80\xe4\xb8\xaa\
+\xe5\x9b\xbe\xe5\x83\x8f\x0a\x6e\x65\x78\x74\x49\x6d\x67\x44\x65\
+\x74\x61\x69\x6c\x3d\xe4\xb8\x8b\xe4\xb8\x80\xe4\xb8\xaa\xe5\x9b\
+\xbe\xe5\x83\x8f\x0a\x70\x72\x65\x76\x49\x6d\x67\x3d\xe4\xb8\x8a\
+\xe4\xb8\x80\xe4\xb8\xaa\xe5\x9b\xbe\xe5\x83\x8f\x0a\x70\x72\x65\
+\x76\x49\x6d\x67\x44\x65\x74\x61\x69\x6c\x3d\xe4\xb8\x8a\xe4\xb8\
+\x80\xe4\xb8\xaa\xe5\x9b\xbe\xe5\x83\x8f\x0a\x76\x65\x72\x69\x66\
+\x79\x49\x6d\x67\x3d\xe9\xaa\x8c\xe8\xaf\x81\xe5\x9b\xbe\xe5\x83\
+\x8f\x0a\x76\x65\x72\x69\x66\x79\x49\x6d\x67\x44\x65\x74\x61\x69\
+\x6c\x3d\xe9\xaa\x8c\xe8\xaf\x81\xe5\x9b\xbe\xe5\x83\x8f\x0a\x73\
+\x61\x76\x65\x3d\xe4\xbf\x9d\xe5\xad\x98\x0a\x73\x61\x76\x65\x44\
+\x65\x74\x61\x69\x6c\x3d\xe4\xbf\x9d\xe5\xad\x98\xe6\xa0\x87\xe7\
+\xad\xbe\xe6\x96\x87\xe4\xbb\xb6\x0a\x63\x68\x61\x6e\x67\x65\x53\
+\x61\x76\x65\x46\x6f\x72\x6d\x61\x74\x3d\xe6\x9b\xb4\xe6\x94\xb9\
+\xe5\xad\x98\xe5\x82\xa8\xe6\xa0\xbc\xe5\xbc\x8f\x0a\x73\x61\x76\
+\x65\x41\x73\x3d\xe5\x8f\xa6\xe5\xad\x98\xe4\xb8\xba\x0a\x73\x61\
+\x76\x65\x41\x73\x44\x65\x74\x61\x69\x6c\x3d\xe5\xb0\x87\xe6\xa0\
+\x87\xe7\xad\xbe\xe4\xbf\x9d\xe5\xad\x98\xe5\x88\xb0\xe5\x85\xb6\
+\xe4\xbb\x96\xe6\x96\x87\xe4\xbb\xb6\x0a\x63\x6c\x6f\x73\x65\x43\
+\x75\x72\x3d\xe5\x85\xb3\xe9\x97\xad\xe6\x96\x87\xe4\xbb\xb6\x0a\
+\x63\x6c\x6f\x73\x65\x43\x75\x72\x44\x65\x74\x61\x69\x6c\x3d\xe5\
+\x85\xb3\xe9\x97\xad\xe5\xbd\x93\xe5\x89\x8d\xe6\x96\x87\xe4\xbb\
+\xb6\x0a\x64\x65\x6c\x65\x74\x65\x49\x6d\x67\x3d\xe5\x88\xa0\xe9\
+\x99\xa4\xe5\x9b\xbe\xe5\x83\x8f\x0a\x64\x65\x6c\x65\x74\x65\x49\
+\x6d\x67\x44\x65\x74\x61\x69\x6c\x3d\xe5\x88\xa0\xe9\x99\xa4\xe5\
+\xbd\x93\xe5\x89\x8d\xe5\x9b\xbe\xe5\x83\x8f\x0a\x74\x72\x61\x73\
+\x68\x49\x6d\x67\x3d\xe5\xb0\x86\xe6\x89\x80\xe9\x80\x89\xe5\x9b\
+\xbe\xe5\x83\x8f\xe7\xa7\xbb\xe5\x88\xb0\xe5\x9b\x9e\xe6\x94\xb6\
+\xe7\xab\x99\x0a\x74\x72\x61\x73\x68\x49\x6d\x67\x44\x65\x74\x61\
+\x69\x6c\x3d\xe5\xb0\x86\xe6\x89\x80\xe9\x80\x89\xe5\x9b\xbe\xe5\
+\x83\x8f\xe5\x8f\x8a\xe5\x85\xb6\xe6\xa0\x87\xe6\xb3\xa8\xe7\xa7\
+\xbb\xe5\x88\xb0\xe5\x9b\x9e\xe6\x94\xb6\xe7\xab\x99\xe6\x96\x87\
+\xe4\xbb\xb6\xe5\xa4\xb9\x0a\x72\x65\x73\x65\x74\x41\x6c\x6c\x3d\
+\xe5\x85\xa8\xe9\x83\xa8\xe9\x87\x8d\xe7\xbd\xae\x0a\x72\x65\x73\
+\x65\x74\x41\x6c\x6c\x44\x65\x74\x61\x69\x6c\x3d\xe9\x87\x8d\xe7\
+\xbd\xae\xe6\x89\x80\xe6\x9c\x89\xe8\xae\xbe\xe5\xae\x9a\x0a\x62\
+\x6f\x78\x4c\x69\x6e\x65\x43\x6f\x6c\x6f\x72\x3d\xe5\x8c\xba\xe5\
+\x9d\x97\xe7\xba\xbf\xe6\x9d\xa1\xe9\xa2\x9c\xe8\x89\xb2\x0a\x62\
+\x6f\x78\x4c\x69\x6e\x65\x43\x6f\x6c\x6f\x72\x44\x65\x74\x61\x69\
+\x6c\x3d\xe9\x80\x89\xe6\x8b\xa9\xe7\xba\xbf\xe6\xa1\x86\xe9\xa2\
+\x9c\xe8\x89\xb2\x0a\x63\x72\x74\x42\x6f\x78\x3d\xe5\x88\x9b\xe5\
+\xbb\xba\xe5\x8c\xba\xe5\x9d\x97\x0a\x63\x72\x74\x42\x6f\x78\x44\
+\x65\x74\x61\x69\x6c\x3d\xe5\x88\x9b\xe5\xbb\xba\xe4\xb8\x80\xe4\
+\xb8\xaa\xe6\x96\xb0\xe7\x9a\x84\xe5\x8c\xba\xe5\x9d\x97\x0a\x64\
+\x65\x6c\x42\x6f\x78\x3d\xe5\x88\xa0\xe9\x99\xa4\xe9\x80\x89\xe6\
+\x8b\xa9\xe7\x9a\x84\xe5\x8c\xba\xe5\x9d\x97\x0a\x64\x65\x6c\x42\
+\x6f\x78\x44\x65\x74\x61\x69\x6c\x3d\xe5\x88\xa0\xe9\x99\xa4\xe5\
+\x8c\xba\xe5\x9d\x97\x0a\x64\x75\x70\x42\x6f\x78\x3d\xe5\xa4\x8d\
+\xe5\x88\xb6\xe5\x8c\xba\xe5\x9d\x97\x0a\x64\x75\x70\x42\x6f\x78\
+\x44\x65\x74\x61\x69\x6c\x3d\xe5\xa4\x8d\xe5\x88\xb6\xe5\x8c\xba\
+\xe5\x9d\x97\x0a\x65\x64\x69\x74\x42\x6f\x78\x3d\xe7\xbc\x96\xe8\
+\xbe\x91\xe5\x8c\xba\xe5\x9d\x97\x0a\x65\x64\x69\x74\x42\x6f\x78\
+\x44\x65\x74\x61\x69\x6c\x3d\xe7\xbc\x96\xe8\xbe\x91\xe5\x8c\xba\
+\xe5\x9d\x97\x0a\x68\x69\x64\x65\x41\x6c\x6c\x42\x6f\x78\x3d\xe9\
+\x9a\x90\xe8\x97\x8f\xe6\x89\x80\xe6\x9c\x89\xe5\x8c\xba\xe5\x9d\
+\x97\x0a\x73\x68\x6f\x77\x41\x6c\x6c\x42\x6f\x78\x3d\xe6\x98\xbe\
+\xe7\xa4\xba\xe6\x89\x80\xe6\x9c\x89\xe5\x8c\xba\xe5\x9d\x97\x0a\
+\x74\x75\x74\x6f\x72\x69\x61\x6c\x44\x65\x66\x61\x75\x6c\x74\x3d\
+\x59\x6f\x75\x54\x75\x62\x65\xe6\x95\x99\xe5\xad\xa6\x0a\x74\x75\
+\x74\x6f\x72\x69\x61\x6c\x43\x68\x72\x6f\x6d\x65\x3d\x59\x6f\x75\
+\x54\x75\x62\x65\xe6\x95\x99\xe5\xad\xa6\x28\x43\x68\x72\x6f\x6d\
+\x65\x29\x0a\x74\x75\x74\x6f\x72\x69\x61\x6c\x44\x65\x74\x61\x69\
+\x6c\x3d\xe6\x98\xbe\xe7\xa4\xba\xe7\xa4\xba\xe8\x8c\x83\xe5\x86\
+\x85\xe5\xae\xb9\x0a\x69\x6e\x66\x6f\x3d\xe7\x89\x88\xe6\x9c\xac\
+\xe4\xbf\xa1\xe6\x81\xaf\x0a\x73\x68\x6f\x72\x74\x63\x75\x74\x3d\
+\xe5\xbf\xab\xe6\x8d\xb7\xe9\x94\xae\x0a\x7a\x6f\x6f\x6d\x69\x6e\
+\x3d\xe6\x94\xbe\xe5\xa4\xa7\xe7\x94\xbb\xe9\x9d\xa2\x0a\x7a\x6f\
+\x6f\x6d\x69\x6e\x44\x65\x74\x61\x69\x6c\x3d\xe6\x94\xbe\xe5\xa4\
+\xa7\xe7\x94\xbb\xe9\x9d\xa2\x0a\x7a\x6f\x6f\x6d\x6f\x75\x74\x3d\
+\xe7\xbc\xa9\xe5\xb0\x8f\xe7\x94\xbb\xe9\x9d\xa2\x0a\x7a\x6f\x6f\
+\x6d\x6f\x75\x74\x44\x65\x74\x61\x69\x6c\x3d\xe7\xbc\xa9\xe5\xb0\
+\x8f\xe7\x94\xbb\xe9\x9d\xa2\x0a\x6f\x72\x69\x67\x69\x6e\x61\x6c\
+\x73\x69\x7a\x65\x3d\xe5\x8e\x9f\xe5\xa7\x8b\xe5\xa4\xa7\xe5\xb0\
+\x8f\x0a\x6f\x72\x69\x67\x69\x6e\x61\x6c\x73\x69\x7a\x65\x44\x65\
+\x74\x61\x69\x6c\x3d\xe6\x94\xbe\xe5\xa4\xa7\xe5\x88\xb0\xe5\x8e\
+\x9f\xe5\xa7\x8b\xe5\xa4\xa7\xe5\xb0\x8f\x0a\x66\x69\x74\x57\x69\
+\x6e\x3d\xe8\xb0\x83\xe6\x95\xb4\xe5\x88\xb0\xe7\xaa\x97\xe5\x8f\
+\xa3\xe5\xa4\xa7\xe5\xb0\x8f\x0a\x66\x69\x74\x57\x69\x6e\x44\x65\
+\x74\x61\x69\x6c\x3d\xe7\xbc\xa9\xe6\x94\xbe\xe5\x88\xb0\xe5\xbd\
+\x93\xe5\x89\x8d\xe7\xaa\x97\xe5\x8f\xa3\xe5\xa4\xa7\xe5\xb0\x8f\
+\x0a\x66\x69\x74\x57\x69\x64\x74\x68\x3d\xe7\xbc\xa9\xe6\x94\xbe\
+\xe5\x88\xb0\xe8\xb7\x9f\xe5\xbd\x93\xe5\x89\x8d\xe7\x94\xbb\xe9\
+\x9d\xa2\xe4\xb8\x80\xe6\xa0\xb7\xe5\xae\xbd\x0a\x66\x69\x74\x57\
+\x69\x64\x74\x68\x44\x65\x74\x61\x69\x6c\x3d\xe8\xb0\x83\xe6\x95\
+\xb4\xe5\xae\xbd\xe5\xba\xa6\xe9\x80\x82\xe5\xba\x94\xe5\x88\xb0\
+\xe7\xaa\x97\xe5\x8f\xa3\xe5\xae\xbd\xe5\xba\xa6\x0a\x6c\x69\x67\
+\x68\x74\x62\x72\x69\x67\x68\x74\x65\x6e\x3d\xe6\x8f\x90\xe4\xba\
+\xae\x0a\x6c\x69\x67\x68\x74\x62\x72\x69\x67\x68\x74\x65\x6e\x44\
+\x65\x74\x61\x69\x6c\x3d\xe5\xa2\x9e\xe5\x8a\xa0\xe5\x9b\xbe\xe5\
+\x83\x8f\xe4\xba\xae\xe5\xba\xa6\x0a\x6c\x69\x67\x68\x74\x64\x61\
+\x72\x6b\x65\x6e\x3d\xe5\x8f\x98\xe6\x9a\x97\x0a\x6c\x69\x67\x68\
+\x74\x64\x61\x72\x6b\x65\x6e\x44\x65\x74\x61\x69\x6c\x3d\xe9\x99\
+\x8d\xe4\xbd\x8e\xe5\x9b\xbe\xe5\x83\x8f\xe4\xba\xae\xe5\xba\xa6\
+\x0a\x6c\x69\x67\x68\x74\x72\x65\x73\x65\x74\x3d\xe5\x8e\x9f\xe5\
+\xa7\x8b\xe4\xba\xae\xe5\xba\xa6\x0a\x6c\x69\x67\x68\x74\x72\x65\
+\x73\x65\x74\x44\x65\x74\x61\x69\x6c\x3d\xe6\x81\xa2\xe5\xa4\x8d\
+\xe5\x8e\x9f\xe6\x9d\xa5\xe7\x9a\x84\xe4\xba\xae\xe5\xba\xa6\x0a\
+\x6c\x69\x67\x68\x74\x57\x69\x64\x67\x65\x74\x54\x69\x74\x6c\x65\
+\x3d\xe5\x9b\xbe\xe5\x83\x8f\xe4\xba\xae\xe5\xba\xa6\x0a\x65\x64\
+\x69\x74\x4c\x61\x62\x65\x6c\x3d\xe7\xbc\x96\xe8\xbe\x91\xe6\xa0\
+\x87\xe7\xad\xbe\x0a\x65\x64\x69\x74\x4c\x61\x62\x65\x6c\x44\x65\
+\x74\x61\x69\x6c\x3d\xe4\xbf\xae\xe6\x94\xb9\xe5\xbd\x93\xe5\x89\
+\x8d\xe6\x89\x80\xe9\x80\x89\xe7\x9a\x84\xe5\x8c\xba\xe5\x9d\x97\
+\xe9\xa2\x9c\xe8\x89\xb2\x0a\x73\x68\x61\x70\x65\x4c\x69\x6e\x65\
+\x43\x6f\x6c\x6f\x72\x3d\xe5\xbd\xa2\xe7\x8a\xb6\xe7\xba\xbf\xe6\
+\x9d\xa1\xe9\xa2\x9c\xe8\x89\xb2\x0a\x73\x68\x61\x70\x65\x4c\x69\
+\x6e\x65\x43\x6f\x6c\x6f\x72\x44\x65\x74\x61\x69\x6c\x3d\xe6\x9b\
+\xb4\xe6\x94\xb9\xe7\xba\xbf\xe6\x9d\xa1\xe9\xa2\x9c\xe8\x89\xb2\
+\x0a\x73\x68\x61\x70\x65\x46\x69\x6c\x6c\x43\x6f\x6c\x6f\x72\x3d\
+\xe5\xa1\xab\xe5\x85\x85\xe9\xa2\x9c\xe8\x89\xb2\x0a\x73\x68\x61\
+\x70\x65\x46\x69\x6c\x6c\x43\x6f\x6c\x6f\x72\x44\x65\x74\x61\x69\
+\x6c\x3d\xe6\x9b\xb4\xe6\x94\xb9\xe5\xa1\xab\xe5\x85\x85\xe9\xa2\
+\x9c\xe8\x89\xb2\x0a\x73\x68\x6f\x77\x48\x69\x64\x65\x3d\xe6\x98\
+\xbe\xe7\xa4\xba\x2f\xe9\x9a\x90\xe8\x97\x8f\xe6\xa0\x87\xe7\xad\
+\xbe\x0a\x75\x73\x65\x44\x65\x66\x61\x75\x6c\x74\x4c\x61\x62\x65\
+\x6c\x3d\xe4\xbd\xbf\xe7\x94\xa8\xe9\xa2\x84\xe8\xae\xbe\xe6\xa0\
+\x87\xe7\xad\xbe\x0a\x75\x73\x65\x44\x69\x66\x66\x69\x63\x75\x6c\
+\x74\x3d\xe6\x9c\x89\xe9\x9a\xbe\xe5\xba\xa6\xe7\x9a\x84\x0a\x62\
+\x6f\x78\x4c\x61\x62\x65\x6c\x54\x65\x78\x74\x3d\xe5\x8c\xba\xe5\
+\x9d\x97\xe7\x9a\x84\xe6\xa0\x87\xe7\xad\xbe\x0a\x6c\x61\x62\x65\
+\x6c\x73\x3d\xe6\xa0\x87\xe7\xad\xbe\x0a\x61\x75\x74\x6f\x53\x61\
+\x76\x65\x4d\x6f\x64\x65\x3d\xe8\x87\xaa\xe5\x8a\xa8\xe4\xbf\x9d\
+\xe5\xad\x98\xe6\xa8\xa1\xe5\xbc\x8f\x0a\x73\x69\x6e\x67\x6c\x65\
+\x43\x6c\x73\x4d\x6f\x64\x65\x3d\xe5\x8d\x95\xe4\xb8\x80\xe7\xb1\
+\xbb\xe5\x88\xab\xe6\xa8\xa1\xe5\xbc\x8f\x0a\x64\x69\x73\x70\x6c\
+\x61\x79\x4c\x61\x62\x65\x6c\x3d\xe6\x98\xbe\xe7\xa4\xba\xe7\xb1\
+\xbb\xe5\x88\xab\x0a\x66\x69\x6c\x65\x4c\x69\x73\x74\x3d\xe6\x96\
+\x87\xe4\xbb\xb6\xe5\x88\x97\xe8\xa1\xa8\x0a\x66\x69\x6c\x65\x73\
+\x3d\xe6\x96\x87\xe4\xbb\xb6\x0a\x61\x64\x76\x61\x6e\x63\x65\x64\
+\x4d\x6f\x64\x65\x3d\xe4\xb8\x93\xe5\xae\xb6\xe6\xa8\xa1\xe5\xbc\
+\x8f\x0a\x61\x64\x76\x61\x6e\x63\x65\x64\x4d\x6f\x64\x65\x44\x65\
+\x74\x61\x69\x6c\x3d\xe5\x88\x87\xe6\x8d\xa2\xe5\x88\xb0\xe4\xb8\
+\x93\xe5\xae\xb6\xe6\xa8\xa1\xe5\xbc\x8f\x0a\x73\x68\x6f\x77\x41\
+\x6c\x6c\x42\x6f\x78\x44\x65\x74\x61\x69\x6c\x3d\xe6\x98\xbe\xe7\
+\xa4\xba\xe6\x89\x80\xe6\x9c\x89\xe5\x8c\xba\xe5\x9d\x97\x0a\x68\
+\x69\x64\x65\x41\x6c\x6c\x42\x6f\x78\x44\x65\x74\x61\x69\x6c\x3d\
+\xe9\x9a\x90\xe8\x97\x8f\xe6\x89\x80\xe6\x9c\x89\xe5\x8c\xba\xe5\
+\x9d\x97\x0a\x6d\x65\x6e\x75\x5f\x66\x69\x6c\x65\x3d\xe6\x96\x87\
+\xe4\xbb\xb6\x28\x26\x46\x29\x0a\x6d\x65\x6e\x75\x5f\x65\x64\x69\
+\x74\x3d\xe7\xbc\x96\xe8\xbe\x91\x28\x26\x45\x29\x0a\x6d\x65\x6e\
+\x75\x5f\x76\x69\x65\x77\x3d\xe6\x9f\xa5\xe7\x9c\x8b\x28\x26\x56\
+\x29\x0a\x6d\x65\x6e\x75\x5f\x68\x65\x6c\x70\x3d\xe5\xb8\xae\xe5\
+\x8a\xa9\x28\x26\x48\x29\x0a\x6d\x65\x6e\x75\x5f\x6f\x70\x65\x6e\
+\x52\x65\x63\x65\x6e\x74\x3d\xe6\x9c\x80\xe8\xbf\x91\xe6\x89\x93\
+\xe5\xbc\x80\x28\x26\x52\x29\x0a\x63\x68\x6f\x6f\x73\x65\x4c\x69\
+\x6e\x65\x43\x6f\x6c\x6f\x72\x3d\xe9\x80\x89\xe6\x8b\xa9\xe7\xba\
+\xbf\xe6\x9d\xa1\xe9\xa2\x9c\xe8\x89\xb2\x0a\x63\x68\x6f\x6f\x73\
+\x65\x46\x69\x6c\x6c\x43\x6f\x6c\x6f\x72\x3d\xe9\x80\x89\xe6\x8b\
+\xa9\xe5\xa1\xab\xe5\x85\x85\xe9\xa2\x9c\xe8\x89\xb2\x0a\x64\x72\
+\x61\x77\x53\x71\x75\x61\x72\x65\x73\x3d\xe7\xbb\x98\xe5\x88\xb6\
+\xe6\xad\xa3\xe6\x96\xb9\xe5\xbd\xa2\x0a\x66\x69\x6c\x74\x65\x72\
+\x41\x6c\x6c\x3d\xe5\x85\xa8\xe9\x83\xa8\xe5\x9b\xbe\xe5\x83\x8f\
+\x0a\x66\x69\x6c\x74\x65\x72\x4e\x6f\x4c\x61\x62\x65\x6c\x73\x3d\
+\xe6\x9c\xaa\xe6\xa0\x87\xe6\xb3\xa8\x0a\x66\x69\x6c\x74\x65\x72\
+\x48\x61\x73\x4c\x61\x62\x65\x6c\x73\x3d\xe5\xb7\xb2\xe6\xa0\x87\
+\xe6\xb3\xa8\xef\xbc\x8c\xe6\x9c\xaa\xe9\xaa\x8c\xe8\xaf\x81\x0a\
+\x66\x69\x6c\x74\x65\x72\x56\x65\x72\x69\x66\x69\x65\x64\x3d\xe5\
+\xb7\xb2\xe9\xaa\x8c\xe8\xaf\x81\x0a\x66\x69\x6c\x74\x65\x72\x43\
+\x6c\x61\x73\x73\x3d\xe5\x8c\x85\xe5\x90\xab\xe7\xb1\xbb\xe5\x88\
+\xab\x0a\x66\x69\x6c\x74\x65\x72\x42\x6f\x78\x43\x6f\x75\x6e\x74\
+\x3d\xe6\xa0\x87\xe6\xb3\xa8\xe6\xa1\x86\xe6\x95\xb0\xe9\x87\x8f\
+\x0a\x66\x69\x6c\x74\x65\x72\x56\x61\x6c\x75\x65\x54\x69\x70\x3d\
+\xe7\xb1\xbb\xe5\x88\xab\xe5\x90\x8d\xe7\xa7\xb0\xef\xbc\x8c\xe6\
+\x88\x96\xe6\xa0\x87\xe6\xb3\xa8\xe6\xa1\x86\xe6\x95\xb0\xe9\x87\
+\x8f\xef\xbc\x8c\xe5\xa6\x82\x20\x33\xe3\x80\x81\x32\x2d\x35\x20\
+\xe6\x88\x96\x20\x35\x2d\x0a\
+\x00\x00\x0a\xa1\
+\x73\
+\x61\x76\x65\x41\x73\x44\x65\x74\x61\x69\x6c\x3d\xe5\xb0\x87\xe6\
+\xa8\x99\xe7\xb1\xa4\xe4\xbf\x9d\xe5\xad\x98\xe5\x88\xb0\xe5\x85\
+\xb6\xe4\xbb\x96\xe6\x96\x87\xe4\xbb\xb6\x0a\x63\x68\x61\x6e\x67\
+\x65\x53\x61\x76\x65\x44\x69\x72\x3d\xe6\x94\xb9\xe8\xae\x8a\xe5\
+\xad\x98\xe6\x94\xbe\xe7\x9b\xae\xe9\x8c\x84\x0a\x6f\x70\x65\x6e\
+\x46\x69\x6c\x65\x3d\xe9\x96\x8b\xe5\x95\x9f\xe6\xaa\x94\xe6\xa1\
+\x88\x0a\x73\x68\x61\x70\x65\x4c\x69\x6e\x65\x43\x6f\x6c\x6f\x72\
+\x44\x65\x74\x61\x69\x6c\x3d\xe6\x9b\xb4\xe6\x94\xb9\xe7\xb7\x9a\
+\xe6\xa2\x9d\xe9\xa1\x8f\xe8\x89\xb2\x0a\x72\x65\x73\x65\x74\x41\
+\x6c\x6c\x3d\xe9\x87\x8d\xe7\xbd\xae\x0a\x63\x72\x74\x42\x6f\x78\
+\x3d\xe5\x89\xb5\xe5\xbb\xba\xe5\x8d\x80\xe5\xa1\x8a\x0a\x63\x72\
+\x74\x42\x6f\x78\x44\x65\x74\x61\x69\x6c\x3d\xe7\x95\xab\xe4\xb8\
+\x80\xe5\x80\x8b\xe5\x8d\x80\xe5\xa1\x8a\x0a\x64\x75\x70\x42\x6f\
+\x78\x44\x65\x74\x61\x69\x6c\x3d\xe8\xa4\x87\xe8\xa3\xbd\xe5\x8d\
+\x80\xe5\xa1\x8a\x0a\x76\x65\x72\x69\x66\x79\x49\x6d\x67\x3d\xe9\
+\xa9\x97\xe8\xad\x89\xe5\x9c\x96\xe5\x83\x8f\x0a\x7a\x6f\x6f\x6d\
+\x69\x6e\x44\x65\x74\x61\x69\x6c\x3d\xe6\x94\xbe\xe5\xa4\xa7\x0a\
+\x76\x65\x72\x69\x66\x79\x49\x6d\x67\x44\x65\x74\x61\x69\x6c\x3d\
+\xe9\xa9\x97\xe8\xad\x89\xe5\x9c\x96\xe5\x83\x8f\x0a\x73\x61\x76\
+\x65\x44\x65\x74\x61\x69\x6c\x3d\xe5\xb0\x87\xe6\xa8\x99\xe7\xb1\
+\xa4\xe5\xad\x98\xe5\x88\xb0\x0a\x6f\x70\x65\x6e\x46\x69\x6c\x65\
+\x44\x65\x74\x61\x69\x6c\x3d\xe6\x89\x93\xe9\x96\x8b\xe5\x9c\x96\
+\xe5\x83\x8f\x0a\x66\x69\x74\x57\x69\x64\x74\x68\x44\x65\x74\x61\
+\x69\x6c\x3d\xe8\xaa\xbf\xe6\x95\xb4\xe5\x88\xb0\xe7\xaa\x97\xe5\
+\x8f\xa3\xe5\xaf\xac\xe5\xba\xa6\x0a\x6c\x69\x67\x68\x74\x62\x72\
+\x69\x67\x68\x74\x65\x6e\x3d\xe8\xae\x8a\xe4\xba\xae\x0a\x6c\x69\
+\x67\x68\x74\x62\x72\x69\x67\x68\x74\x65\x6e\x44\x65\x74\x61\x69\
+\x6c\x3d\xe5\xa2\x9e\xe5\x8a\xa0\xe5\xbd\xb1\xe5\x83\x8f\xe4\xba\
+\xae\xe5\xba\xa6\x0a\x6c\x69\x67\x68\x74\x64\x61\x72\x6b\x65\x6e\
+\x3d\xe8\xae\x8a\xe6\x9a\x97\x0a\x6c\x69\x67\x68\x74\x64\x61\x72\
+\x6b\x65\x6e\x44\x65\x74\x61\x69\x6c\x3d\xe9\x99\x8d\xe4\xbd\x8e\
+\xe5\xbd\xb1\xe5\x83\x8f\xe4\xba\xae\xe5\xba\xa6\x0a\x6c\x69\x67\
+\x68\x74\x72\x65\x73\x65\x74\x3d\xe5\x8e\x9f\xe6\x9c\xac\xe4\xba\
+\xae\xe5\xba\xa6\x0a\x6c\x69\x67\x68\x74\x72\x65\x73\x65\x74\x44\
+\x65\x74\x61\x69\x6c\x3d\xe6\x81\xa2\xe5\xbe\xa9\xe5\x8e\x9f\xe6\
+\x9c\xac\xe4\xba\xae\xe5\xba\xa6\x0a\x6c\x69\x67\x68\x74\x57\x69\
+\x64\x67\x65\x74\x54\x69\x74\x6c\x65\x3d\xe5\xbd\xb1\xe5\x83\x8f\
+\xe9\x87\x8f\xe5\xba\xa6\x0a\x74\x75\x74\x6f\x72\x69\x61\x6c\x44\
+\x65\x66\x61\x75\x6c\x74\x3d\x59\x6f\x75\x54\x75\x62\x65\xe6\x95\
+\x99\xe5\xad\xb8\x0a\x74\x75\x74\x6f\x72\x69\x61\x6c\x43\x68\x72\
+\x6f\x6d\x65\x3d\x59\x6f\x75\x54\x75\x62\x65\xe6\x95\x99\xe5\xad\
+\xb8\x28\x43\x68\x72\x6f\x6d\x65\x29\x0a\x69\x6e\x66\x6f\x3d\xe7\
+\x89\x88\xe6\x9c\xac\xe4\xbf\xa1\xe6\x81\xaf\x0a\x73\x68\x6f\x72\
+\x74\x63\x75\x74\x3d\xe5\xbf\xab\xe6\x8d\xb7\xe9\x8d\xb5\x0a\x65\
+\x64\x69\x74\x4c\x61\x62\x65\x6c\x3d\xe7\xb7\xa8\xe8\xbc\xaf\xe6\
+\xa8\x99\xe7\xb1\xa4\x0a\x6f\x70\x65\x6e\x41\x6e\x6e\x6f\x74\x61\
+\x74\x69\x6f\x6e\x44\x65\x74\x61\x69\x6c\x3d\xe6\x89\x93\xe9\x96\
+\x8b\xe6\xa8\x99\xe7\xb1\xa4\xe6\x96\x87\xe4\xbb\xb6\x0a\x71\x75\
+\x69\x74\x3d\xe7\xb5\x90\xe6\x9d\x9f\x0a\x73\x68\x61\x70\x65\x46\
+\x69\x6c\x6c\x43\x6f\x6c\x6f\x72\x44\x65\x74\x61\x69\x6c\x3d\xe6\
+\x9b\xb4\xe6\x94\xb9\xe5\xa1\xab\xe5\x85\x85\xe9\xa1\x8f\xe8\x89\
+\xb2\x0a\x63\x6c\x6f\x73\x65\x43\x75\x72\x44\x65\x74\x61\x69\x6c\
+\x3d\xe9\x97\x9c\xe9\x96\x89\xe7\x9b\xae\xe5\x89\x8d\xe6\xaa\x94\
+\xe6\xa1\x88\x0a\x63\x6c\x6f\x73\x65\x43\x75\x72\x3d\xe9\x97\x9c\
+\xe9\x96\x89\x0a\x64\x65\x6c\x65\x74\x65\x49\x6d\x67\x3d\xe5\x88\
+\xaa\xe9\x99\xa4\xe5\x9c\x96\xe5\x83\x8f\x0a\x64\x65\x6c\x65\x74\
+\x65\x49\x6d\x67\x44\x65\x74\x61\x69\x6c\x3d\xe5\x88\xaa\xe9\x99\
+\xa4\xe7\x9b\xae\xe5\x89\x8d\xe5\x9c\x96\xe5\x83\x8f\x0a\x74\x72\
+\x61\x73\x68\x49\x6d\x67\x3d\xe5\xb0\x87\xe6\x89\x80\xe9\x81\xb8\
+\xe5\x9c\x96\xe5\x83\x8f\xe7\xa7\xbb\xe5\x88\xb0\xe5\x9b\x9e\xe6\
+\x94\xb6\xe7\xab\x99\x0a\x74\x72\x61\x73\x68\x49\x6d\x67\x44\x65\
+\x74\x61\x69\x6c\x3d\xe5\xb0\x87\xe6\x89\x80\xe9\x81\xb8\xe5\x9c\
+\x96\xe5\x83\x8f\xe5\x8f\x8a\xe5\x85\xb6\xe6\xa8\x99\xe8\xa8\xbb\
+\xe7\xa7\xbb\xe5\x88\xb0\xe5\x9b\x9e\xe6\x94\xb6\xe7\xab\x99\xe8\
+\xb3\x87\xe6\x96\x99\xe5\xa4\xbe\x0a\x66\x69\x74\x57\x69\x6e\x3d\
+\xe8\xaa\xbf\xe6\x95\xb4\xe5\x88\xb0\xe8\xb7\x9f\xe7\xaa\x97\xe5\
+\x8f\xa3\xe4\xb8\x80\xe6\xa8\xa3\xe5\xa4\xa7\xe5\xb0\x8f\x0a\x64\
+\x65\x6c\x42\x6f\x78\x3d\xe5\x88\xaa\xe9\x99\xa4\xe9\x81\xb8\xe5\
+\x8f\x96\xe5\x8d\x80\xe5\xa1\x8a\x0a\x62\x6f\x78\x4c\x69\x6e\x65\
+\x43\x6f\x6c\x6f\x72\x44\x65\x74\x61\x69\x6c\x3d\xe9\x81\xb8\xe6\
+\x93\x87\xe6\xa1\x86\xe7\xb7\x9a\xe9\xa1\x8f\xe8\x89\xb2\x0a\x6f\
+\x72\x69\x67\x69\x6e\x61\x6c\x73\x69\x7a\x65\x3d\xe5\x8e\x9f\xe5\
+\xa7\x8b\xe5\xa4\xa7\xe5\xb0\x8f\x0a\x72\x65\x73\x65\x74\x41\x6c\
+\x6c\x44\x65\x74\x61\x69\x6c\x3d\xe9\x87\x8d\xe8\xa8\xad\xe6\x89\
+\x80\xe6\x9c\x89\xe8\xa8\xad\xe5\xae\x9a\x0a\x7a\x6f\x6f\x6d\x6f\
+\x75\x74\x44\x65\x74\x61\x69\x6c\x3d\xe7\x95\xab\xe9\x9d\xa2\xe6\
+\x94\xbe\xe5\xa4\xa7\x0a\x73\x61\x76\x65\x3d\xe5\x84\xb2\xe5\xad\
+\x98\x0a\x73\x61\x76\x65\x41\x73\x3d\xe5\x8f\xa6\xe5\xad\x98\xe7\
+\x82\xba\x0a\x66\x69\x74\x57\x69\x6e\x44\x65\x74\x61\x69\x6c\x3d\
+\xe7\xb8\xae\xe6\x94\xbe\xe5\x88\xb0\xe7\xaa\x97\xe5\x8f\xa3\xe4\
+\xb8\x80\xe6\xa8\xa3\x0a\x6f\x70\x65\x6e\x44\x69\x72\x3d\xe9\x96\
+\x8b\xe5\x95\x9f\xe7\x9b\xae\xe9\x8c\x84\x0a\x63\x6f\x70\x79\x50\
+\x72\x65\x76\x42\x6f\x75\x6e\x64\x69\x6e\x67\x3d\xe8\xa4\x87\xe8\
+\xa3\xbd\xe7\x95\xb6\xe5\x89\x8d\xe5\x9c\x96\xe5\x83\x8f\xe4\xb8\
+\xad\xe7\x9a\x84\xe4\xb8\x8a\xe4\xb8\x80\xe5\x80\x8b\xe9\x82\x8a\
+\xe7\x95\x8c\xe6\xa1\x86\x0a\x73\x68\x6f\x77\x48\x69\x64\x65\x3d\
+\xe9\xa1\xaf\xe7\xa4\xba\x2f\xe9\x9a\xb1\xe8\x97\x8f\xe6\xa8\x99\
+\xe7\xb1\xa4\x0a\x63\x68\x61\x6e\x67\x65\x53\x61\x76\x65\x46\x6f\
+\x72\x6d\x61\x74\x3d\xe6\x9b\xb4\xe6\x94\xb9\xe5\x84\xb2\xe5\xad\
+\x98\xe6\xa0\xbc\xe5\xbc\x8f\x0a\x73\x68\x61\x70\x65\x46\x69\x6c\
+\x6c\x43\x6f\x6c\x6f\x72\x3d\xe5\xa1\xab\xe5\x85\x85\xe9\xa1\x8f\
+\xe8\x89\xb2\x0a\x71\x75\x69\x74\x41\x70\x70\x3d\xe9\x9b\xa2\xe9\
+\x96\x8b\xe6\x9c\xac\xe7\xa8\x8b\xe5\xbc\x8f\x0a\x64\x75\x70\x42\
+\x6f\x78\x3d\xe8\xa4\x87\xe8\xa3\xbd\xe5\x8d\x80\xe5\xa1\x8a\x0a\
+\x64\x65\x6c\x42\x6f\x78\x44\x65\x74\x61\x69\x6c\x3d\xe5\x88\xaa\
+\xe9\x99\xa4\xe5\x8d\x80\xe5\xa1\x8a\x0a\x7a\x6f\x6f\x6d\x69\x6e\
+\x3d\xe6\x94\xbe\xe5\xa4\xa7\xe7\x95\xab\xe9\x9d\xa2\x0a\x69\x6e\
+\x66\x6f\x3d\xe8\xb3\x87\xe8\xa8\x8a\x0a\x6f\x70\x65\x6e\x41\x6e\
+\x6e\x6f\x74\x61\x74\x69\x6f\x6e\x3d\xe9\x96\x8b\xe5\x95\x9f\xe6\
+\xa8\x99\xe7\xb1\xa4\x0a\x70\x72\x65\x76\x49\x6d\x67\x44\x65\x74\
+\x61\x69\x6c\x3d\xe4\xb8\x8a\xe4\xb8\x80\xe5\x80\x8b\xe5\x9c\x96\
+\xe5\x83\x8f\x0a\x66\x69\x74\x57\x69\x64\x74\x68\x3d\xe7\xb8\xae\
+\xe6\x94\xbe\xe5\x88\xb0\xe8\xb7\x9f\xe7\x95\xab\xe9\x9d\xa2\xe4\
+\xb8\x80\xe6\xa8\xa3\xe5\xaf\xac\x0a\x7a\x6f\x6f\x6d\x6f\x75\x74\
+\x3d\xe7\xb8\xae\xe5\xb0\x8f\xe7\x95\xab\xe9\x9d\xa2\x0a\x63\x68\
+\x61\x6e\x67\x65\x53\x61\x76\x65\x64\x41\x6e\x6e\x6f\x74\x61\x74\
+\x69\x6f\x6e\x44\x69\x72\x3d\xe6\x9b\xb4\xe6\x94\xb9\xe9\xa0\x90\
+\xe8\xa8\xad\xe6\xa8\x99\xe7\xb1\xa4\xe5\xad\x98\xe7\x9a\x84\xe7\
+\x9b\xae\xe9\x8c\x84\x0a\x6e\x65\x78\x74\x49\x6d\x67\x44\x65\x74\
+\x61\x69\x6c\x3d\xe4\xb8\x8b\xe4\xb8\x80\xe5\x80\x8b\xe5\x9c\x96\
+\xe5\x83\x8f\x0a\x6f\x72\x69\x67\x69\x6e\x61\x6c\x73\x69\x7a\x65\
+\x44\x65\x74\x61\x69\x6c\x3d\xe6\x94\xbe\xe5\xa4\xa7\xe5\x88\xb0\
+\xe5\x8e\x9f\xe5\xa7\x8b\xe5\xa4\xa7\xe5\xb0\x8f\x0a\x70\x72\x65\
+\x76\x49\x6d\x67\x3d\xe4\xb8\x8a\xe4\xb8\x80\xe5\x80\x8b\xe5\x9c\
+\x96\xe5\x83\x8f\x0a\x74\x75\x74\x6f\x72\x69\x61\x6c\x44\x65\x74\
+\x61\x69\x6c\x3d\xe9\xa1\xaf\xe7\xa4\xba\xe7\xa4\xba\xe7\xaf\x84\
+\xe5\x85\xa7\xe5\xae\xb9\x0a\x73\x68\x61\x70\x65\x4c\x69\x6e\x65\
+\x43\x6f\x6c\x6f\x72\x3d\xe5\xbd\xa2\xe7\x8b\x80\xe7\xb7\x9a\xe6\
+\xa2\x9d\xe9\xa1\x8f\xe8\x89\xb2\x0a\x62\x6f\x78\x4c\x69\x6e\x65\
+\x43\x6f\x6c\x6f\x72\x3d\xe6\x97\xa5\xe6\x9c\x9f\xe5\x88\x86\xe9\
+\x9a\x94\xe7\xb7\x9a\xe9\xa1\x8f\xe8\x89\xb2\x0a\x65\x64\x69\x74\
+\x4c\x61\x62\x65\x6c\x44\x65\x74\x61\x69\x6c\x3d\xe4\xbf\xae\xe6\
+\x94\xb9\xe6\x89\x80\xe9\x81\xb8\xe5\x8d\x80\xe5\xa1\x8a\xe7\x9a\
+\x84\xe6\xa8\x99\xe7\xb1\xa4\x0a\x6e\x65\x78\x74\x49\x6d\x67\x3d\
+\xe4\xb8\x8b\xe4\xb8\x80\xe5\xbc\xb5\xe5\x9c\x96\xe7\x89\x87\x0a\
+\x75\x73\x65\x44\x65\x66\x61\x75\x6c\x74\x4c\x61\x62\x65\x6c\x3d\
+\xe4\xbd\xbf\xe7\x94\xa8\xe9\xa0\x90\xe8\xa8\xad\xe6\xa8\x99\xe7\
+\xb1\xa4\x0a\x75\x73\x65\x44\x69\x66\x66\x69\x63\x75\x6c\x74\x3d\
+\xe6\x9c\x89\xe9\x9b\xa3\xe5\xba\xa6\xe7\x9a\x84\x0a\x62\x6f\x78\
+\x4c\x61\x62\x65\x6c\x54\x65\x78\x74\x3d\xe5\x8d\x80\xe5\xa1\x8a\
+\xe7\x9a\x84\xe6\xa8\x99\xe7\xb1\xa4\x0a\x6c\x61\x62\x65\x6c\x73\
+\x3d\xe6\xa8\x99\xe7\xb1\xa4\x0a\x61\x75\x74\x6f\x53\x61\x76\x65\
+\x4d\x6f\x64\x65\x3d\xe8\x87\xaa\xe5\x8b\x95\xe5\x84\xb2\xe5\xad\
+\x98\xe6\xa8\xa1\xe5\xbc\x8f\x0a\x73\x69\x6e\x67\x6c\x65\x43\x6c\
+\x73\x4d\x6f\x64\x65\x3d\xe5\x96\xae\xe4\xb8\x80\xe9\xa1\x9e\xe5\
+\x88\xa5\xe6\xa8\xa1\xe5\xbc\x8f\x0a\x64\x69\x73\x70\x6c\x61\x79\
+\x4c\x61\x62\x65\x6c\x3d\xe9\xa1\xaf\xe7\xa4\xba\xe9\xa1\x9e\xe5\
+\x88\xa5\x0a\x66\x69\x6c\x65\x4c\x69\x73\x74\x3d\xe6\xaa\x94\xe6\
+\xa1\x88\xe6\xb8\x85\xe5\x96\xae\x0a\x66\x69\x6c\x65\x73\x3d\xe6\
+\xaa\x94\xe6\xa1\x88\x0a\x61\x64\x76\x61\x6e\x63\x65\x64\x4d\x6f\
+\x64\x65\x3d\xe9\x80\xb2\xe9\x9a\x8e\xe6\xa8\xa1\xe5\xbc\x8f\x0a\
+\x61\x64\x76\x61\x6e\x63\x65\x64\x4d\x6f\x64\x65\x44\x65\x74\x61\
+\x69\x6c\x3d\xe5\x88\x87\xe5\x88\xb0\xe9\x80\xb2\xe9\x9a\x8e\xe6\
+\xa8\xa1\xe5\xbc\x8f\x0a\x73\x68\x6f\x77\x41\x6c\x6c\x42\x6f\x78\
+\x44\x65\x74\x61\x69\x6c\x3d\xe9\xa1\xaf\xe7\xa4\xba\xe6\x89\x80\
+\xe6\x9c\x89\xe5\x8d\x80\xe5\xa1\x8a\x0a\x68\x69\x64\x65\x41\x6c\
+\x6c\x42\x6f\x78\x44\x65\x74\x61\x69\x6c\x3d\xe9\x9a\xb1\xe8\x97\
+\x8f\xe6\x89\x80\xe6\x9c\x89\xe5\x8d\x80\xe5\xa1\x8a\x0a\x6d\x65\
+\x6e\x75\x5f\x66\x69\x6c\x65\x3d\xe6\xaa\x94\xe6\xa1\x88\x28\x26\
+\x46\x29\x0a\x6d\x65\x6e\x75\x5f\x65\x64\x69\x74\x3d\xe7\xb7\xa8\
+\xe8\xbc\xaf\x28\x26\x45\x29\x0a\x6d\x65\x6e\x75\x5f\x76\x69\x65\
+\x77\x3d\xe6\xaa\xa2\xe8\xa6\x96\x28\x26\x56\x29\x0a\x6d\x65\x6e\
+\x75\x5f\x68\x65\x6c\x70\x3d\xe8\xaa\xaa\xe6\x98\x8e\x28\x26\x48\
+\x29\x0a\x6d\x65\x6e\x75\x5f\x6f\x70\x65\x6e\x52\x65\x63\x65\x6e\
+\x74\x3d\xe6\x9c\x80\xe8\xbf\x91\xe9\x96\x8b\xe5\x95\x9f\x28\x26\
+\x52\x29\x0a\x66\x69\x6c\x74\x65\x72\x41\x6c\x6c\x3d\xe5\x85\xa8\
+\xe9\x83\xa8\xe5\x9c\x96\xe5\x83\x8f\x0a\x66\x69\x6c\x74\x65\x72\
+\x4e\x6f\x4c\x61\x62\x65\x6c\x73\x3d\xe6\x9c\xaa\xe6\xa8\x99\xe8\
+\xa8\xbb\x0a\x66\x69\x6c\x74\x65\x72\x48\x61\x73\x4c\x61\x62\x65\
+\x6c\x73\x3d\xe5\xb7\xb2\xe6\xa8\x99\xe8\xa8\xbb\xef\xbc\x8c\xe6\
+\x9c\xaa\xe9\xa9\x97\xe8\xad\x89\x0a\x66\x69\x6c\x74\x65\x72\x56\
+\x65\x72\x69\x66\x69\x65\x64\x3d\xe5\xb7\xb2\xe9\xa9\x97\xe8\xad\
+\x89\x0a\x66\x69\x6c\x74\x65\x72\x43\x6c\x61\x73\x73\x3d\xe5\x8c\
+\x85\xe5\x90\xab\xe9\xa1\x9e\xe5\x88\xa5\x0a\x66\x69\x6c\x74\x65\
+\x72\x42\x6f\x78\x43\x6f\x75\x6e\x74\x3d\xe6\xa8\x99\xe8\xa8\xbb\
+\xe6\xa1\x86\xe6\x95\xb8\xe9\x87\x8f\x0a\x66\x69\x6c\x74\x65\x72\
+\x56\x61\x6c\x75\x65\x54\x69\x70\x3d\xe9\xa1\x9e\xe5\x88\xa5\xe5\
+\x90\x8d\xe7\xa8\xb1\xef\xbc\x8c\xe6\x88\x96\xe6\xa8\x99\xe8\xa8\
+\xbb\xe6\xa1\x86\xe6\x95\xb8\xe9\x87\x8f\xef\xbc\x8c\xe5\xa6\x82\
+\x20\x33\xe3\x80\x81\x32\x2d\x35\x20\xe6\x88\x96\x20\x35\x2d\x0a\
+\
+\x00\x00\x0c\x50\
+\x6f\
+\x70\x65\x6e\x46\x69\x6c\x65\x3d\xe3\x83\x95\xe3\x82\xa1\xe3\x82\
+\xa4\xe3\x83\xab\xe3\x82\x92\xe9\x96\x8b\xe3\x81\x8f\x0a\x6f\x70\
+\x65\x6e\x46\x69\x6c\x65\x44\x65\x74\x61\x69\x6c\x3d\xe7\x94\xbb\
+\xe5\x83\x8f\xe3\x81\x8b\xe3\x83\xa9\xe3\x83\x99\xe3\x83\xab\xe3\
+\x83\x95\xe3\x82\xa1\xe3\x82\xa4\xe3\x83\xab\xe3\x82\x92\xe9\x96\
+\x8b\xe3\x81\x8d\xe3\x81\xbe\xe3\x81\x99\xe3\x80\x82\x0a\x71\x75\
+\x69\x74\x3d\xe3\x82\xa2\xe3\x83\x97\xe3\x83\xaa\xe3\x82\x92\xe7\
+\xb5\x82\xe4\xba\x86\x0a\x71\x75\x69\x74\x41\x70\x70\x3d\xe3\x81\
+\x93\xe3\x81\xae\xe3\x82\xa2\xe3\x83\x97\xe3\x83\xaa\xe3\x82\x92\
+\xe7\xb5\x82\xe4\xba\x86\xe3\x81\x97\xe3\x81\xbe\xe3\x81\x99\xe3\
+\x80\x82\x0a\x6f\x70\x65\x6e\x44\x69\x72\x3d\xe3\x83\x87\xe3\x82\
+\xa3\xe3\x83\xac\xe3\x82\xaf\xe3\x83\x88\xe3\x83\xaa\xe3\x82\x92\
+\xe9\x96\x8b\xe3\x81\x8f\x0a\x6f\x70\x65\x6e\x41\x6e\x6e\x6f\x74\
+\x61\x74\x69\x6f\x6e\x3d\xe3\x82\xa2\xe3\x83\x8e\xe3\x83\x86\xe3\
+\x83\xbc\xe3\x82\xb7\xe3\x83\xa7\xe3\x83\xb3\xe3\x82\x92\xe9\x96\
+\x8b\xe3\x81\x8f\x0a\x6f\x70\x65\x6e\x41\x6e\x6e\x6f\x74\x61\x74\
+\x69\x6f\x6e\x44\x65\x74\x61\x69\x6c\x3d\xe3\x82\xa2\xe3\x83\x8e\
+\xe3\x83\x86\xe3\x83\xbc\xe3\x82\xb7\xe3\x83\xa7\xe3\x83\xb3\xe3\
+\x83\x95\xe3\x82\xa1\xe3\x82\xa4\xe3\x83\xab\xe3\x82\x92\xe9\x96\
+\x8b\xe3\x81\x8d\xe3\x81\xbe\xe3\x81\x99\xe3\x80\x82\x0a\x63\x68\
+\x61\x6e\x67\x65\x53\x61\x76\x65\x44\x69\x72\x3d\xe4\xbf\x9d\xe5\
+\xad\x98\xe5\x85\x88\xe3\x82\x92\xe5\xa4\x89\xe6\x9b\xb4\xe3\x81\
+\x99\xe3\x82\x8b\x0a\x72\x65\x73\x65\x74\x41\x6c\x6c\x3d\xe3\x81\
+\x99\xe3\x81\xb9\xe3\x81\xa6\xe3\x83\xaa\xe3\x82\xbb\xe3\x83\x83\
+\xe3\x83\x88\xe3\x81\x99\xe3\x82\x8b\x0a\x68\x69\x64\x65\x41\x6c\
+\x6c\x3d\xe3\x81\x99\xe3\x81\xb9\xe3\x81\xa6\xe3\x81\xae\xe5\x9b\
+\xb3\xe5\xbd\xa2\xe3\x82\x92\xe9\x9d\x9e\xe8\xa1\xa8\xe7\xa4\xba\
+\xe3\x81\xab\xe3\x81\x99\xe3\x82\x8b\x0a\x76\x69\x65\x77\x41\x6c\
+\x6c\x3d\xe3\x81\x99\xe3\x81\xb9\xe3\x81\xa6\xe3\x81\xae\xe5\x9b\
+\xb3\xe5\xbd\xa2\xe3\x82\x92\xe8\xa1\xa8\xe7\xa4\xba\xe3\x81\x99\
+\xe3\x82\x8b\x0a\x63\x72\x74\x42\x6f\x78\x3d\xe7\x9f\xa9\xe5\xbd\
+\xa2\xe3\x82\x92\xe4\xbd\x9c\xe6\x88\x90\xe3\x81\x99\xe3\x82\x8b\
+\x0a\x63\x72\x74\x42\x6f\x78\x44\x65\x74\x61\x69\x6c\x3d\xe7\x9f\
+\xa9\xe5\xbd\xa2\xe3\x82\x92\xe6\x8f\x8f\xe7\x94\xbb\xe3\x81\x97\
+\xe3\x81\xbe\xe3\x81\x99\xe3\x80\x82\x0a\x64\x75\x70\x42\x6f\x78\
+\x3d\xe7\x9f\xa9\xe5\xbd\xa2\xe3\x82\x92\xe8\xa4\x87\xe8\xa3\xbd\
+\xe3\x81\x99\xe3\x82\x8b\x0a\x64\x65\x6c\x42\x6f\x78\x3d\xe7\x9f\
+\xa9\xe5\xbd\xa2\xe3\x82\x92\xe5\x89\x8a\xe9\x99\xa4\xe3\x81\x99\
+\xe3\x82\x8b\x0a\x65\x64\x69\x74\x42\x6f\x78\x3d\xe7\x9f\xa9\xe5\
+\xbd\xa2\xe3\x82\x92\xe7\xb7\xa8\xe9\x9b\x86\xe3\x81\x99\xe3\x82\
+\x8b\x28\x26\x45\x29\x0a\x68\x69\x64\x65\x41\x6c\x6c\x42\x6f\x78\
+\x3d\xe7\x9f\xa9\xe5\xbd\xa2\xe3\x82\x92\xe9\x9d\x9e\xe8\xa1\xa8\
+\xe7\xa4\xba\xe3\x81\xab\xe3\x81\x99\xe3\x82\x8b\x28\x26\x48\x29\
+\x0a\x73\x68\x6f\x77\x41\x6c\x6c\x42\x6f\x78\x3d\xe7\x9f\xa9\xe5\
+\xbd\xa2\xe3\x82\x92\xe8\xa1\xa8\xe7\xa4\xba\xe3\x81\x99\xe3\x82\
+\x8b\x28\x26\x53\x29\x0a\x74\x75\x74\x6f\x72\x69\x61\x6c\x44\x65\
+\x66\x61\x75\x6c\x74\x3d\xe3\x83\x81\xe3\x83\xa5\xe3\x83\xbc\xe3\
+\x83\x88\xe3\x83\xaa\xe3\x82\xa2\xe3\x83\xab\xe5\x8b\x95\xe7\x94\
+\xbb\xe3\x82\x92\xe8\xa6\x8b\xe3\x82\x8b\x0a\x74\x75\x74\x6f\x72\
+\x69\x61\x6c\x43\x68\x72\x6f\x6d\x65\x3d\x43\x68\x72\x6f\x6d\x65\
+\xe3\x81\xa7\xe3\x83\x81\xe3\x83\xa5\xe3\x83\xbc\xe3\x83\x88\xe3\
+\x83\xaa\xe3\x82\xa2\xe3\x83\xab\xe5\x8b\x95\xe7\x94\xbb\xe3\x82\
+\x92\xe8\xa6\x8b\xe3\x82\x8b\x0a\x74\x75\x74\x6f\x72\x69\x61\x6c\
+\x44\x65\x74\x61\x69\x6c\x3d\x4c\x61\x62\x65\x6c\x49\x6d\x67\xe3\
+\x81\xae\xe3\x83\x87\xe3\x83\xa2\xe5\x8b\x95\xe7\x94\xbb\xe3\x82\
+\x92\xe8\xa6\x8b\xe3\x81\xbe\xe3\x81\x99\xe3\x80\x82\x0a\x69\x6e\
+\x66\x6f\x3d\x4c\x61\x62\x65\x6c\x49\x6d\x67\xe3\x81\xab\xe3\x81\
+\xa4\xe3\x81\x84\xe3\x81\xa6\x0a\x76\x65\x72\x69\x66\x79\x49\x6d\
+\x67\x3d\xe7\x94\xbb\xe5\x83\x8f\xe3\x82\x92\xe6\xa4\x9c\xe8\xa8\
+\xbc\xe3\x81\x99\xe3\x82\x8b\x0a\x76\x65\x72\x69\x66\x79\x49\x6d\
+\x67\x44\x65\x74\x61\x69\x6c\x3d\xe7\x94\xbb\xe5\x83\x8f\xe3\x82\
+\x92\xe6\xa4\x9c\xe8\xa8\xbc\xe3\x81\x97\xe3\x81\xbe\xe3\x81\x99\
+\xe3\x80\x82\x0a\x73\x61\x76\x65\x3d\xe4\xbf\x9d\xe5\xad\x98\xe3\
+\x81\x99\xe3\x82\x8b\x0a\x73\x61\x76\x65\x44\x65\x74\x61\x69\x6c\
+\x3d\xe7\x8f\xbe\xe5\x9c\xa8\xe3\x81\xae\xe7\xb7\xa8\xe9\x9b\x86\
+\xe3\x82\x92\xe4\xbf\x9d\xe5\xad\x98\xe3\x81\x97\xe3\x81\xbe\xe3\
+\x81\x99\xe3\x80\x82\x0a\x73\x61\x76\x65\x41\x73\x3d\xe5\x90\x8d\
+\xe5\x89\x8d\xe3\x82\x92\xe4\xbb\x98\xe3\x81\x91\xe3\x81\xa6\xe4\
+\xbf\x9d\xe5\xad\x98\x0a\x73\x61\x76\x65\x41\x73\x44\x65\x74\x61\
+\x69\x6c\x3d\xe3\x83\x95\xe3\x82\xa1\xe3\x82\xa4\xe3\x83\xab\xe3\
+\x81\xab\xe5\x90\x8d\xe5\x89\x8d\xe3\x82\x92\xe4\xbb\x98\xe3\x81\
+\x91\xe3\x81\xa6\xe7\x8f\xbe\xe5\x9c\xa8\xe3\x81\xae\xe7\xb7\xa8\
+\xe9\x9b\x86\xe3\x82\x92\xe4\xbf\x9d\xe5\xad\x98\xe3\x81\x97\xe3\
+\x81\xbe\xe3\x81\x99\xe3\x80\x82\x0a\x63\x6c\x6f\x73\x65\x43\x75\
+\x72\x3d\xe3\x81\x93\xe3\x81\xae\xe3\x83\x95\xe3\x82\xa1\xe3\x82\
+\xa4\xe3\x83\xab\xe3\x82\x92\xe9\x96\x89\xe3\x81\x98\xe3\x82\x8b\
+\x0a\x64\x65\x6c\x65\x74\x65\x49\x6d\x67\x3d\xe3\x81\x93\xe3\x81\
+\xae\xe7\x94\xbb\xe5\x83\x8f\xe3\x82\x92\xe5\x89\x8a\xe9\x99\xa4\
+\xe3\x81\x99\xe3\x82\x8b\x0a\x72\x65\x73\x65\x74\x41\x6c\x6c\x3d\
+\xe3\x81\x99\xe3\x81\xb9\xe3\x81\xa6\xe5\x88\x9d\xe6\x9c\x9f\xe5\
+\x8c\x96\xe3\x81\x99\xe3\x82\x8b\x0a\x72\x65\x73\x65\x74\x41\x6c\
+\x6c\x44\x65\x74\x61\x69\x6c\x3d\xe3\x83\x87\xe3\x83\xbc\xe3\x82\
+\xbf\xe3\x82\x92\xe3\x81\x99\xe3\x81\xb9\xe3\x81\xa6\xe5\x88\x9d\
+\xe6\x9c\x9f\xe7\x8a\xb6\xe6\x85\x8b\xe3\x81\xab\xe6\x88\xbb\xe3\
+\x81\x97\xe3\x81\xbe\xe3\x81\x99\xe3\x80\x82\x0a\x62\x6f\x78\x4c\
+\x69\x6e\x65\x43\x6f\x6c\x6f\x72\x3d\xe7\xb7\x9a\xe3\x81\xae\xe8\
+\x89\xb2\xe3\x81\xae\xe7\xb7\xa8\xe9\x9b\x86\x0a\x62\x6f\x78\x4c\
+\x69\x6e\x65\x43\x6f\x6c\x6f\x72\x44\x65\x74\x61\x69\x6c\x3d\xe8\
+\x89\xb2\xe3\x81\xae\xe7\xb7\xa8\xe9\x9b\x86\xe3\x82\x92\xe8\xa1\
+\x8c\xe3\x81\x84\xe3\x81\xbe\xe3\x81\x99\xe3\x80\x82\x0a\x63\x68\
+\x6f\x6f\x73\x65\x4c\x69\x6e\x65\x43\x6f\x6c\x6f\x72\x3d\xe7\xb7\
+\x9a\xe3\x81\xae\xe8\x89\xb2\xe3\x81\xae\xe7\xb7\xa8\xe9\x9b\x86\
+\x0a\x63\x68\x6f\x6f\x73\x65\x46\x69\x6c\x6c\x43\x6f\x6c\x6f\x72\
+\x3d\xe5\xa1\x97\xe3\x82\x8a\xe3\x81\xa4\xe3\x81\xb6\xe3\x81\x99\
+\xe8\x89\xb2\xe3\x81\xae\xe7\xb7\xa8\xe9\x9b\x86\x0a\x73\x68\x6f\
+\x72\x74\x63\x75\x74\x3d\xe3\x82\xb7\xe3\x83\xa7\xe3\x83\xbc\xe3\
+\x83\x88\xe3\x82\xab\xe3\x83\x83\xe3\x83\x88\xe4\xb8\x80\xe8\xa6\
+\xa7\xe3\x82\x92\xe8\xa6\x8b\xe3\x82\x8b\xef\xbc\x88\xe8\x8b\xb1\
+\xe8\xaa\x9e\xef\xbc\x89\x0a\x65\x64\x69\x74\x4c\x61\x62\x65\x6c\
+\x3d\xe3\x83\xa9\xe3\x83\x99\xe3\x83\xab\xe3\x82\x92\xe7\xb7\xa8\
+\xe9\x9b\x86\xe3\x81\x99\xe3\x82\x8b\x0a\x65\x64\x69\x74\x4c\x61\
+\x62\x65\x6c\x44\x65\x74\x61\x69\x6c\x3d\xe9\x81\xb8\xe6\x8a\x9e\
+\xe3\x81\x97\xe3\x81\x9f\xe7\x9f\xa9\xe5\xbd\xa2\xe3\x81\xae\xe3\
+\x83\xa9\xe3\x83\x99\xe3\x83\xab\xe5\x90\x8d\xe3\x82\x92\xe5\xa4\
+\x89\xe6\x9b\xb4\xe3\x81\x97\xe3\x81\xbe\xe3\x81\x99\xe3\x80\x82\
+\x0a\x63\x68\x61\x6e\x67\x65\x53\x61\x76\x65\x46\x6f\x72\x6d\x61\
+\x74\x3d\xe4\xbf\x9d\xe5\xad\x98\xe3\x81\x99\xe3\x82\x8b\xe3\x83\
+\x87\xe3\x83\xbc\xe3\x82\xbf\xe3\x81\xae\xe3\x83\x95\xe3\x82\xa9\
+\xe3\x83\xbc\xe3\x83\x9e\xe3\x83\x83\xe3\x83\x88\xe3\x82\x92\xe5\
+\xa4\x89\xe6\x9b\xb4\xe3\x81\x97\xe3\x81\xbe\xe3\x81\x99\xe3\x80\
+\x82\x0a\x6e\x65\x78\x74\x49\x6d\x67\x3d\xe6\xac\xa1\xe3\x81\xae\
+\xe7\x94\xbb\xe5\x83\x8f\x0a\x6e\x65\x78\x74\x49\x6d\x67\x44\x65\
+\x74\x61\x69\x6c\x3d\xe6\xac\xa1\xe3\x81\xae\xe7\x94\xbb\xe5\x83\
+\x8f\xe3\x82\x92\xe9\x96\x8b\xe3\x81\x8d\xe3\x81\xbe\xe3\x81\x99\
+\xe3\x80\x82\x0a\x70\x72\x65\x76\x49\x6d\x67\x3d\xe5\x89\x8d\xe3\
+\x81\xae\xe7\x94\xbb\xe5\x83\x8f\x0a\x70\x72\x65\x76\x49\x6d\x67\
+\x44\x65\x74\x61\x69\x6c\x3d\xe5\x89\x8d\xe3\x81\xae\xe7\x94\xbb\
+\xe5\x83\x8f\xe3\x82\x92\xe9\x96\x8b\xe3\x81\x8d\xe3\x81\xbe\xe3\
+\x81\x99\xe3\x80\x82\x0a\x7a\x6f\x6f\x6d\x69\x6e\x3d\xe6\x8b\xa1\
+\xe5\xa4\xa7\x0a\x7a\x6f\x6f\x6d\x6f\x75\x74\x3d\xe7\xb8\xae\xe5\
+\xb0\x8f\x0a\x75\x73\x65\x44\x65\x66\x61\x75\x6c\x74\x4c\x61\x62\
+\x65\x6c\x3d\xe6\x8c\x87\xe5\xae\x9a\xe3\x81\x95\xe3\x82\x8c\xe3\
+\x81\x9f\xe3\x83\xa9\xe3\x83\x99\xe3\x83\xab\xe5\x90\x8d\xe3\x82\
+\x92\xe4\xbd\xbf\xe3\x81\x86\x0a\x61\x64\x76\x61\x6e\x63\x65\x64\
+\x4d\x6f\x64\x65\x3d\xe4\xb8\x8a\xe7\xb4\x9a\xe8\x80\x85\xe5\x90\
+\x91\xe3\x81\x91\xe6\xa9\x9f\xe8\x83\xbd\x0a\x61\x64\x76\x61\x6e\
+\x63\x65\x64\x4d\x6f\x64\x65\x44\x65\x74\x61\x69\x6c\x3d\xe4\xb8\
+\x8a\xe7\xb4\x9a\xe8\x80\x85\xe5\x90\x91\xe3\x81\x91\xe6\xa9\x9f\
+\xe8\x83\xbd\xe3\x82\x92\xe4\xbd\xbf\xe3\x81\x84\xe3\x81\xbe\xe3\
+\x81\x99\xe3\x80\x82\x0a\x62\x6f\x78\x4c\x61\x62\x65\x6c\x54\x65\
+\x78\x74\x3d\xe7\x9f\xa9\xe5\xbd\xa2\xe3\x83\xa9\xe3\x83\x99\xe3\
+\x83\xab\xe4\xb8\x80\xe8\xa6\xa7\x0a\x6c\x61\x62\x65\x6c\x73\x3d\
+\xe3\x83\xa9\xe3\x83\x99\xe3\x83\xab\xe4\xb8\x80\xe8\xa6\xa7\x0a\
+\x61\x75\x74\x6f\x53\x61\x76\x65\x4d\x6f\x64\x65\x3d\xe8\x87\xaa\
+\xe5\x8b\x95\xe3\x81\xa7\xe4\xbf\x9d\xe5\xad\x98\xe3\x81\x99\xe3\
+\x82\x8b\x0a\x73\x69\x6e\x67\x6c\x65\x43\x6c\x73\x4d\x6f\x64\x65\
+\x3d\xe5\x8d\x98\xe4\xb8\x80\xe3\x81\xae\xe3\x83\xa9\xe3\x83\x99\
+\xe3\x83\xab\xe3\x81\xa0\xe3\x81\x91\xe3\x82\x92\xe3\x82\xa2\xe3\
+\x83\x8e\xe3\x83\x86\xe3\x83\xbc\xe3\x82\xb7\xe3\x83\xa7\xe3\x83\
+\xb3\xe3\x81\x99\xe3\x82\x8b\x0a\x64\x69\x73\x70\x6c\x61\x79\x4c\
+\x61\x62\x65\x6c\x3d\xe3\x83\xa9\xe3\x83\x99\xe3\x83\xab\xe3\x82\
+\x92\xe8\xa1\xa8\xe7\xa4\xba\xe3\x81\x99\xe3\x82\x8b\x0a\x6d\x65\
+\x6e\x75\x5f\x66\x69\x6c\x65\x3d\xe3\x83\x95\xe3\x82\xa1\xe3\x82\
+\xa4\xe3\x83\xab\x28\x26\x46\x29\x0a\x6d\x65\x6e\x75\x5f\x65\x64\
+\x69\x74\x3d\xe7\xb7\xa8\xe9\x9b\x86\x28\x26\x45\x29\x0a\x6d\x65\
+\x6e\x75\x5f\x76\x69\x65\x77\x3d\xe8\xa1\xa8\xe7\xa4\xba\x28\x26\
+\x56\x29\x0a\x6d\x65\x6e\x75\x5f\x68\x65\x6c\x70\x3d\xe3\x83\x98\
+\xe3\x83\xab\xe3\x83\x97\x28\x26\x48\x29\x0a\x6d\x65\x6e\x75\x5f\
+\x6f\x70\x65\x6e\x52\x65\x63\x65\x6e\x74\x3d\xe6\x9c\x80\xe8\xbf\
+\x91\xe9\x96\x8b\xe3\x81\x84\xe3\x81\x9f\xe3\x83\x95\xe3\x82\xa1\
+\xe3\x82\xa4\xe3\x83\xab\x28\x26\x52\x29\x0a\x64\x72\x61\x77\x53\
+\x71\x75\x61\x72\x65\x73\x3d\xe5\x9b\x9b\xe8\xa7\x92\xe5\xbd\xa2\
+\xe3\x82\x92\xe6\x9b\xb8\xe3\x81\x8f\x0a\x66\x69\x74\x57\x69\x6e\
+\x3d\xe3\x82\xa6\xe3\x82\xa3\xe3\x83\xb3\xe3\x83\x89\xe3\x82\xa6\
+\xe3\x81\xab\xe5\x90\x88\xe3\x82\x8f\xe3\x81\x9b\xe3\x82\x8b\x0a\
+\x66\x69\x74\x57\x69\x6e\x44\x65\x74\x61\x69\x6c\x3d\xe3\x82\xa6\
+\xe3\x82\xa3\xe3\x83\xb3\xe3\x83\x89\xe3\x82\xa6\xe3\x82\xb5\xe3\
+\x82\xa4\xe3\x82\xba\xe3\x81\xab\xe5\x90\x88\xe3\x82\x8f\xe3\x81\
+\x9b\xe3\x81\xa6\xe6\x8b\xa1\xe5\xa4\xa7\xe3\x81\x97\xe3\x81\xbe\
+\xe3\x81\x99\xe3\x80\x82\x0a\x66\x69\x74\x57\x69\x64\x74\x68\x3d\
+\xe3\x82\xa6\xe3\x82\xa3\xe3\x83\xb3\xe3\x83\x89\xe3\x82\xa6\xe3\
+\x81\xae\xe5\xb9\x85\xe3\x81\xab\xe5\x90\x88\xe3\x82\x8f\xe3\x81\
+\x9b\xe3\x82\x8b\x0a\x66\x69\x74\x57\x69\x64\x74\x68\x44\x65\x74\
+\x61\x69\x6c\x3d\xe3\x82\xa6\xe3\x82\xa4\xe3\x83\xb3\xe3\x83\x89\
+\xe3\x82\xa6\xe3\x81\xae\xe5\xb9\x85\xe3\x81\xab\xe5\x90\x88\xe3\
+\x82\x8f\xe3\x81\x9b\xe3\x81\xa6\xe6\x8b\xa1\xe5\xa4\xa7\xe3\x81\
+\x97\xe3\x81\xbe\xe3\x81\x99\xe3\x80\x82\x0a\x6c\x69\x67\x68\x74\
+\x62\x72\x69\x67\x68\x74\x65\x6e\x3d\xe6\x98\x8e\xe3\x82\x8b\xe3\
+\x81\x8f\xe3\x81\x99\xe3\x82\x8b\x0a\x6c\x69\x67\x68\x74\x62\x72\
+\x69\x67\x68\x74\x65\x6e\x44\x65\x74\x61\x69\x6c\x3d\xe7\x94\xbb\
+\xe5\x83\x8f\xe3\x81\xae\xe6\x98\x8e\xe3\x82\x8b\xe3\x81\x95\xe3\
+\x82\x92\xe4\xb8\x8a\xe3\x81\x92\xe3\x82\x8b\x0a\x6c\x69\x67\x68\
+\x74\x64\x61\x72\x6b\x65\x6e\x3d\xe6\x9a\x97\xe3\x81\x8f\xe3\x81\
+\x99\xe3\x82\x8b\x0a\x6c\x69\x67\x68\x74\x64\x61\x72\x6b\x65\x6e\
+\x44\x65\x74\x61\x69\x6c\x3d\xe7\x94\xbb\xe5\x83\x8f\xe3\x81\xae\
+\xe6\x98\x8e\xe3\x82\x8b\xe3\x81\x95\xe3\x82\x92\xe4\xb8\x8b\xe3\
+\x81\x92\xe3\x82\x8b\x0a\x6c\x69\x67\x68\x74\x72\x65\x73\x65\x74\
+\x3d\xe5\x85\x83\xe3\x81\xae\xe6\x98\x8e\xe3\x82\x8b\xe3\x81\x95\
+\x0a\x6c\x69\x67\x68\x74\x72\x65\x73\x65\x74\x44\x65\x74\x61\x69\
+\x6c\x3d\xe5\x85\x83\xe3\x81\xae\xe6\x98\x8e\xe3\x82\x8b\xe3\x81\
+\x95\xe3\x82\x92\xe5\xbe\xa9\xe5\x85\x83\xe3\x81\x99\xe3\x82\x8b\
+\x0a\x6c\x69\x67\x68\x74\x57\x69\x64\x67\x65\x74\x54\x69\x74\x6c\
+\x65\x3d\xe7\x94\xbb\xe5\x83\x8f\xe3\x81\xae\xe6\x98\x8e\xe3\x82\
+\x8b\xe3\x81\x95\x0a\x6f\x72\x69\x67\x69\x6e\x61\x6c\x73\x69\x7a\
+\x65\x3d\xe5\x8e\x9f\xe5\xaf\xb8\xe3\x81\xab\xe6\x88\xbb\xe3\x81\
+\x99\x0a\x64\x69\x73\x70\x6c\x61\x79\x4c\x61\x62\x65\x6c\x3d\xe3\
+\x83\xa9\xe3\x83\x99\xe3\x83\xab\xe3\x82\x92\xe8\xa1\xa8\xe7\xa4\
+\xba\xe3\x81\x99\xe3\x82\x8b\x0a\x66\x69\x6c\x65\x4c\x69\x73\x74\
+\x3d\xe3\x83\x95\xe3\x82\xa1\xe3\x82\xa4\xe3\x83\xab\xe4\xb8\x80\
+\xe8\xa6\xa7\x0a\x66\x69\x6c\x65\x73\x3d\xe3\x83\x95\xe3\x82\xa1\
+\xe3\x82\xa4\xe3\x83\xab\x0a\x62\x6f\x78\x4c\x61\x62\x65\x6c\x54\
+\x65\x78\x74\x3d\xe7\x9f\xa9\xe5\xbd\xa2\xe3\x83\xa9\xe3\x83\x99\
+\xe3\x83\xab\x0a\x63\x6f\x70\x79\x50\x72\x65\x76\x42\x6f\x75\x6e\
+\x64\x69\x6e\x67\x3d\xe5\x89\x8d\xe3\x81\xae\xe7\x94\xbb\xe5\x83\
+\x8f\xe3\x81\xae\xe7\x9f\xa9\xe5\xbd\xa2\xe3\x83\xa9\xe3\x83\x99\
+\xe3\x83\xab\xe3\x82\x92\xe3\x81\x93\xe3\x81\xae\xe7\x94\xbb\xe5\
+\x83\x8f\xe3\x81\xab\xe3\x82\xb3\xe3\x83\x94\xe3\x83\xbc\x0a\
+\x00\x00\x03\x12\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x3c\x00\x00\x00\x3c\x08\x06\x00\x00\x00\x3a\xfc\xd9\x72\
+\x00\x00\x00\x06\x62\x4b\x47\x44\x00\xff\x00\xff\x00\xff\xa0\xbd\
+\xa7\x93\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0b\x13\x00\x00\
+\x0b\x13\x01\x00\x9a\x9c\x18\x00\x00\x00\x07\x74\x49\x4d\x45\x07\
+\xe2\x03\x02\x04\x32\x2f\x3b\x59\x63\x86\x00\x00\x00\x19\x74\x45\
+\x58\x74\x43\x6f\x6d\x6d\x65\x6e\x74\x00\x43\x72\x65\x61\x74\x65\
+\x64\x20\x77\x69\x74\x68\x20\x47\x49\x4d\x50\x57\x81\x0e\x17\x00\
+\x00\x02\x7a\x49\x44\x41\x54\x68\xde\xed\xd8\x4b\xa8\x8d\x6b\x1c\
+\xc7\xf1\xcf\xc6\xce\xe6\xd8\x25\xb9\x0d\x44\x88\x72\xa2\x30\xc1\
+\x84\x5c\x42\x71\x9c\x11\x29\x45\x06\x88\x94\x5c\x06\xe4\x32\x31\
+\x33\x32\xa0\x64\xe2\x96\x08\x21\x85\x93\xd2\x49\x92\x94\x5b\x29\
+\xb9\x76\x8a\x48\x31\x71\x89\xe3\xb2\x2d\x93\x47\xbd\xad\xde\x77\
+\xaf\xb5\x77\x6b\x6f\x7b\x6f\xff\x6f\xad\xc9\xfb\xfe\xff\xbf\xe7\
+\xf9\x3d\x97\xff\xf3\xac\x97\x20\x08\x82\x20\x08\x82\x20\x08\x82\
+\x20\x08\x82\xa0\x6d\x18\x8b\x26\x94\xb0\xfc\x77\x30\xfc\x4f\x32\
+\x7b\x17\xdd\xbb\xba\xd9\x39\xc9\x6c\x09\xb3\xba\xba\xd9\xee\xb8\
+\x97\xcc\x9e\xef\xcc\x46\x86\x60\x0b\xea\x2a\xc4\xad\x48\x66\x9b\
+\xf0\x67\xe6\xf9\x06\x8c\xec\xe8\x26\xbb\x61\x36\x4e\xe3\x1b\xee\
+\x54\x88\x6f\xc4\xab\x64\x78\x5f\x99\xce\x87\xa4\x71\x18\x63\x3a\
+\x9a\xd1\xfe\xd8\x84\x27\x99\xbd\x58\xc2\xa1\x0a\x79\x3b\x53\xdc\
+\x7b\x0c\xca\x3c\x1f\x55\xa6\xf3\x1d\x27\x30\xfe\x57\x9a\xac\xc3\
+\x94\x34\x03\xff\x97\x75\xb0\x84\xd7\xf8\xbb\xc2\x92\xff\x98\x62\
+\xb7\x96\xbd\x1b\x8a\x2b\x39\x9a\x25\x9c\xc3\xa4\xf6\x34\xda\x88\
+\x55\xe9\xf8\xc8\xeb\xd0\x4d\x2c\x43\x43\x05\x9d\x43\x29\xfe\x39\
+\x7a\x17\x0c\xe8\x4c\x5c\x2b\x68\xe7\x12\xa6\xb6\xa5\xd1\x71\xd8\
+\x8b\x77\x39\x8d\x7f\xc1\x51\x4c\xae\xa2\x48\xc1\xc4\xb4\x4c\x4b\
+\x58\x5a\xc5\x4a\x9a\x83\x1b\x05\xc6\xaf\xa6\xba\x51\x57\x4b\xb3\
+\x97\x0a\x1a\x7b\x89\x1d\x18\xdc\xc2\xad\xf0\x6f\xca\xbf\x9d\x0a\
+\x54\xb5\x79\xf3\x70\xab\xa0\x2f\x67\x6a\x65\x76\x40\x8e\xf8\x63\
+\x2c\x46\x7d\x2b\xf4\x16\x64\x74\xa6\xb7\xb2\x76\xac\xcb\xe9\xd3\
+\xa9\x5a\x19\x9e\x95\x23\xfe\x1d\xc7\x5a\x71\x5c\xd4\xe3\x41\xa6\
+\xf8\xb4\xd4\xe8\x4c\x9c\xcd\xdc\xb9\xb3\xbf\xed\xb5\x32\xfc\x07\
+\x36\xa6\xe5\x5b\xde\x48\x13\x8e\xa4\x63\xa4\x1a\xd6\xa6\xbc\x6f\
+\x2d\x18\xac\x46\xac\xc1\xfd\x82\xa5\x7c\x1b\x2b\xd1\xa7\xd6\x45\
+\xab\x01\xab\xf1\x5f\x81\xf1\x03\x18\xd1\x4c\x7e\x5f\xbc\x49\xf1\
+\x7b\xab\x68\x6f\x34\x76\xe3\x6d\x4e\x7b\x9f\x70\x30\x1d\x4f\x75\
+\xda\x98\xfa\x74\xec\x3c\xc8\xe9\xc8\x57\xec\xc7\xb0\x9c\xbc\x5d\
+\x29\xe6\x1d\x06\x36\xa3\x3f\x17\x17\x0b\x66\xf3\x21\xd6\xa3\xdf\
+\xaf\xba\xf4\x2f\x2a\x38\x8f\xaf\x96\xc5\x0e\xc7\xe7\xf4\x6e\x73\
+\x33\x9a\x3d\xd3\xa0\x95\x0f\xe2\x49\xcc\x68\x8f\xd9\xac\xb6\x98\
+\xcc\xc7\xf5\x4c\x27\xf7\x94\xc5\x1c\x4f\xcf\x9f\xa1\x57\x33\x5a\
+\x13\x32\x1a\xcf\xb0\xad\x85\x47\x5e\xbb\x1b\x9f\x81\xcb\xe9\x1f\
+\xd0\x4f\x26\x67\x4c\x2c\xa9\xa0\xb1\x14\x17\xf0\x57\x67\xfb\x08\
+\xd0\x23\x33\x08\xd7\x32\x57\xce\x6e\x55\xe6\x75\x5a\x16\x66\x66\
+\x77\x5a\x57\xff\x92\xd1\x13\x4f\x6b\x7d\xed\xeb\xc8\x6c\xcc\x54\
+\xd9\xd1\x1d\x71\xbf\xd5\x9a\x17\xe9\xa2\xf2\x02\x8f\x04\x41\x10\
+\x04\x41\x10\x04\x41\x10\x04\x41\x10\x04\x6d\xc8\x0f\xf0\x6b\xdf\
+\x7c\xd8\x29\x0f\xa9\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\
+\x82\
+\x00\x00\x01\x48\
+\x3c\
+\x73\x76\x67\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\x3a\
+\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\
+\x30\x2f\x73\x76\x67\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\
+\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x32\x34\x22\x20\x76\x69\
+\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\x30\x20\x32\x34\x20\x32\x34\
+\x22\x20\x66\x69\x6c\x6c\x3d\x22\x6e\x6f\x6e\x65\x22\x20\x73\x74\
+\x72\x6f\x6b\x65\x3d\x22\x23\x34\x39\x35\x30\x35\x37\x22\x20\x73\
+\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\x22\x32\x22\x20\
+\x73\x74\x72\x6f\x6b\x65\x2d\x6c\x69\x6e\x65\x63\x61\x70\x3d\x22\
+\x72\x6f\x75\x6e\x64\x22\x20\x73\x74\x72\x6f\x6b\x65\x2d\x6c\x69\
+\x6e\x65\x6a\x6f\x69\x6e\x3d\x22\x72\x6f\x75\x6e\x64\x22\x3e\x3c\
+\x70\x6f\x6c\x79\x6c\x69\x6e\x65\x20\x70\x6f\x69\x6e\x74\x73\x3d\
+\x22\x31\x35\x20\x33\x20\x32\x31\x20\x33\x20\x32\x31\x20\x39\x22\
+\x2f\x3e\x3c\x70\x6f\x6c\x79\x6c\x69\x6e\x65\x20\x70\x6f\x69\x6e\
+\x74\x73\x3d\x22\x39\x20\x32\x31\x20\x33\x20\x32\x31\x20\x33\x20\
+\x31\x35\x22\x2f\x3e\x3c\x6c\x69\x6e\x65\x20\x78\x31\x3d\x22\x32\
+\x31\x22\x20\x79\x31\x3d\x22\x33\x22\x20\x78\x32\x3d\x22\x31\x34\
+\x22\x20\x79\x32\x3d\x22\x31\x30\x22\x2f\x3e\x3c\x6c\x69\x6e\x65\
+\x20\x78\x31\x3d\x22\x33\x22\x20\x79\x31\x3d\x22\x32\x31\x22\x20\
+\x78\x32\x3d\x22\x31\x30\x22\x20\x79\x32\x3d\x22\x31\x34\x22\x2f\
+\x3e\x3c\x2f\x73\x76\x67\x3e\
+\x00\x00\x01\x28\
+\x3c\
+\x73\x76\x67\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\x3a\
+\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\
+\x30\x2f\x73\x76\x67\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\
+\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x32\x34\x22\x20\x76\x69\
+\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\x30\x20\x32\x34\x20\x32\x34\
+\x22\x20\x66\x69\x6c\x6c\x3d\x22\x6e\x6f\x6e\x65\x22\x20\x73\x74\
+\x72\x6f\x6b\x65\x3d\x22\x23\x34\x39\x35\x30\x35\x37\x22\x20\x73\
+\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\x22\x32\x22\x20\
+\x73\x74\x72\x6f\x6b\x65\x2d\x6c\x69\x6e\x65\x63\x61\x70\x3d\x22\
+\x72\x6f\x75\x6e\x64\x22\x20\x73\x74\x72\x6f\x6b\x65\x2d\x6c\x69\
+\x6e\x65\x6a\x6f\x69\x6e\x3d\x22\x72\x6f\x75\x6e\x64\x22\x3e\x3c\
+\x63\x69\x72\x63\x6c\x65\x20\x63\x78\x3d\x22\x31\x31\x22\x20\x63\
+\x79\x3d\x22\x31\x31\x22\x20\x72\x3d\x22\x38\x22\x2f\x3e\x3c\x6c\
+\x69\x6e\x65\x20\x78\x31\x3d\x22\x32\x31\x22\x20\x79\x31\x3d\x22\
+\x32\x31\x22\x20\x78\x32\x3d\x22\x31\x36\x2e\x36\x35\x22\x20\x79\
+\x32\x3d\x22\x31\x36\x2e\x36\x35\x22\x2f\x3e\x3c\x6c\x69\x6e\x65\
+\x20\x78\x31\x3d\x22\x38\x22\x20\x79\x31\x3d\x22\x31\x31\x22\x20\
+\x78\x32\x3d\x22\x31\x34\x22\x20\x79\x32\x3d\x22\x31\x31\x22\x2f\
+\x3e\x3c\x2f\x73\x76\x67\x3e\
+\x00\x00\x00\xf9\
+\x3c\
+\x73\x76\x67\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\x22\x20\x68\
+\x65\x69\x67\x68\x74\x3d\x22\x32\x34\x22\x20\x76\x69\x65\x77\x42\
+\x6f\x78\x3d\x22\x30\x20\x30\x20\x32\x34\x20\x32\x34\x22\x20\x78\
+\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x77\x77\x77\
+\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\x30\x2f\x73\x76\x67\
+\x22\x20\x66\x69\x6c\x6c\x3d\x22\x6e\x6f\x6e\x65\x22\x20\x73\x74\
+\x72\x6f\x6b\x65\x3d\x22\x23\x34\x39\x35\x30\x35\x37\x22\x20\x73\
+\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\x22\x32\x22\x20\
+\x73\x74\x72\x6f\x6b\x65\x2d\x6c\x69\x6e\x65\x63\x61\x70\x3d\x22\
+\x72\x6f\x75\x6e\x64\x22\x20\x73\x74\x72\x6f\x6b\x65\x2d\x6c\x69\
+\x6e\x65\x6a\x6f\x69\x6e\x3d\x22\x72\x6f\x75\x6e\x64\x22\x3e\x3c\
+\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x31\x37\x20\x33\x61\x32\x2e\
+\x38\x32\x38\x20\x32\x2e\x38\x32\x38\x20\x30\x20\x31\x20\x31\x20\
+\x34\x20\x34\x4c\x37\x2e\x35\x20\x32\x30\x2e\x35\x20\x32\x20\x32\
+\x32\x6c\x31\x2e\x35\x2d\x35\x2e\x35\x4c\x31\x37\x20\x33\x7a\x22\
+\x2f\x3e\x3c\x2f\x73\x76\x67\x3e\
+\x00\x00\x01\x7f\
+\x3c\
+\x73\x76\x67\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\x3a\
+\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\
+\x30\x2f\x73\x76\x67\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\
+\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x32\x34\x22\x20\x76\x69\
+\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\x30\x20\x32\x34\x20\x32\x34\
+\x22\x20\x66\x69\x6c\x6c\x3d\x22\x6e\x6f\x6e\x65\x22\x20\x73\x74\
+\x72\x6f\x6b\x65\x3d\x22\x23\x34\x39\x35\x30\x35\x37\x22\x20\x73\
+\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\x22\x32\x22\x20\
+\x73\x74\x72\x6f\x6b\x65\x2d\x6c\x69\x6e\x65\x63\x61\x70\x3d\x22\
+\x72\x6f\x75\x6e\x64\x22\x20\x73\x74\x72\x6f\x6b\x65\x2d\x6c\x69\
+\x6e\x65\x6a\x6f\x69\x6e\x3d\x22\x72\x6f\x75\x6e\x64\x22\x3e\x3c\
+\x70\x6f\x6c\x79\x6c\x69\x6e\x65\x20\x70\x6f\x69\x6e\x74\x73\x3d\
+\x22\x33\x20\x36\x20\x35\x20\x36\x20\x32\x31\x20\x36\x22\x2f\x3e\
+\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x31\x39\x20\x36\x76\x31\
+\x34\x61\x32\x20\x32\x20\x30\x20\x30\x20\x31\x2d\x32\x20\x32\x48\
+\x37\x61\x32\x20\x32\x20\x30\x20\x30\x20\x31\x2d\x32\x2d\x32\x56\
+\x36\x6d\x33\x20\x30\x56\x34\x61\x32\x20\x32\x20\x30\x20\x30\x20\
+\x31\x20\x32\x2d\x32\x68\x34\x61\x32\x20\x32\x20\x30\x20\x30\x20\
+\x31\x20\x32\x20\x32\x76\x32\x22\x2f\x3e\x3c\x6c\x69\x6e\x65\x20\
+\x78\x31\x3d\x22\x31\x30\x22\x20\x79\x31\x3d\x22\x31\x31\x22\x20\
+\x78\x32\x3d\x22\x31\x30\x22\x20\x79\x32\x3d\x22\x31\x37\x22\x2f\
+\x3e\x3c\x6c\x69\x6e\x65\x20\x78\x31\x3d\x22\x31\x34\x22\x20\x79\
+\x31\x3d\x22\x31\x31\x22\x20\x78\x32\x3d\x22\x31\x34\x22\x20\x79\
+\x32\x3d\x22\x31\x37\x22\x2f\x3e\x3c\x2f\x73\x76\x67\x3e\
+\x00\x00\x02\x08\
+\x3c\
+\x73\x76\x67\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\x3a\
+\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\
+\x30\x2f\x73\x76\x67\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\
+\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x32\x34\x22\x20\x76\x69\
+\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\x30\x20\x32\x34\x20\x32\x34\
+\x22\x20\x66\x69\x6c\x6c\x3d\x22\x6e\x6f\x6e\x65\x22\x20\x73\x74\
+\x72\x6f\x6b\x65\x3d\x22\x23\x34\x39\x35\x30\x35\x37\x22\x20\x73\
+\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\x22\x32\x22\x20\
+\x73\x74\x72\x6f\x6b\x65\x2d\x6c\x69\x6e\x65\x63\x61\x70\x3d\x22\
+\x72\x6f\x75\x6e\x64\x22\x20\x73\x74\x72\x6f\x6b\x65\x2d\x6c\x69\
+\x6e\x65\x6a\x6f\x69\x6e\x3d\x22\x72\x6f\x75\x6e\x64\x22\x3e\x3c\
+\x6c\x69\x6e\x65\x20\x78\x31\x3d\x22\x34\x22\x20\x79\x31\x3d\x22\
+\x32\x31\x22\x20\x78\x32\x3d\x22\x34\x22\x20\x79\x32\x3d\x22\x31\
+\x34\x22\x2f\x3e\x3c\x6c\x69\x6e\x65\x20\x78\x31\x3d\x22\x34\x22\
+\x20\x79\x31\x3d\x22\x31\x30\x22\x20\x78\x32\x3d\x22\x34\x22\x20\
+\x79\x32\x3d\x22\x33\x22\x2f\x3e\x3c\x6c\x69\x6e\x65\x20\x78\x31\
+\x3d\x22\x31\x32\x22\x20\x79\x31\x3d\x22\x32\x31\x22\x20\x78\x32\
+\x3d\x22\x31\x32\x22\x20\x79\x32\x3d\x22\x31\x32\x22\x2f\x3e\x3c\
+\x6c\x69\x6e\x65\x20\x78\x31\x3d\x22\x31\x32\x22\x20\x79\x31\x3d\
+\x22\x38\x22\x20\x78\x32\x3d\x22\x31\x32\x22\x20\x79\x32\x3d\x22\
+\x33\x22\x2f\x3e\x3c\x6c\x69\x6e\x65\x20\x78\x31\x3d\x22\x32\x30\
+\x22\x20\x79\x31\x3d\x22\x32\x31\x22\x20\x78\x32\x3d\x22\x32\x30\
+\x22\x20\x79\x32\x3d\x22\x31\x36\x22\x2f\x3e\x3c\x6c\x69\x6e\x65\
+\x20\x78\x31\x3d\x22\x32\x30\x22\x20\x79\x31\x3d\x22\x31\x32\x22\
+\x20\x78\x32\x3d\x22\x32\x30\x22\x20\x79\x32\x3d\x22\x33\x22\x2f\
+\x3e\x3c\x6c\x69\x6e\x65\x20\x78\x31\x3d\x22\x31\x22\x20\x79\x31\
+\x3d\x22\x31\x34\x22\x20\x78\x32\x3d\x22\x37\x22\x20\x79\x32\x3d\
+\x22\x31\x34\x22\x2f\x3e\x3c\x6c\x69\x6e\x65\x20\x78\x31\x3d\x22\
+\x39\x22\x20\x79\x31\x3d\x22\x38\x22\x20\x78\x32\x3d\x22\x31\x35\
+\x22\x20\x79\x32\x3d\x22\x38\x22\x2f\x3e\x3c\x6c\x69\x6e\x65\x20\
+\x78\x31\x3d\x22\x31\x37\x22\x20\x79\x31\x3d\x22\x31\x36\x22\x20\
+\x78\x32\x3d\x22\x32\x33\x22\x20\x79\x32\x3d\x22\x31\x36\x22\x2f\
+\x3e\x3c\x2f\x73\x76\x67\x3e\
+\x00\x00\x02\x31\
+\x3c\
+\x73\x76\x67\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\x3a\
+\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\
+\x30\x2f\x73\x76\x67\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\
+\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x32\x34\x22\x20\x76\x69\
+\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\x30\x20\x32\x34\x20\x32\x34\
+\x22\x20\x66\x69\x6c\x6c\x3d\x22\x6e\x6f\x6e\x65\x22\x20\x73\x74\
+\x72\x6f\x6b\x65\x3d\x22\x23\x34\x39\x35\x30\x35\x37\x22\x20\x73\
+\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\x22\x32\x22\x20\
+\x73\x74\x72\x6f\x6b\x65\x2d\x6c\x69\x6e\x65\x63\x61\x70\x3d\x22\
+\x72\x6f\x75\x6e\x64\x22\x20\x73\x74\x72\x6f\x6b\x65\x2d\x6c\x69\
+\x6e\x65\x6a\x6f\x69\x6e\x3d\x22\x72\x6f\x75\x6e\x64\x22\x3e\x3c\
+\x63\x69\x72\x63\x6c\x65\x20\x63\x78\x3d\x22\x31\x32\x22\x20\x63\
+\x79\x3d\x22\x31\x32\x22\x20\x72\x3d\x22\x35\x22\x2f\x3e\x3c\x6c\
+\x69\x6e\x65\x20\x78\x31\x3d\x22\x31\x32\x22\x20\x79\x31\x3d\x22\
+\x31\x22\x20\x78\x32\x3d\x22\x31\x32\x22\x20\x79\x32\x3d\x22\x33\
+\x22\x2f\x3e\x3c\x6c\x69\x6e\x65\x20\x78\x31\x3d\x22\x31\x32\x22\
+\x20\x79\x31\x3d\x22\x32\x31\x22\x20\x78\x32\x3d\x22\x31\x32\x22\
+\x20\x79\x32\x3d\x22\x32\x33\x22\x2f\x3e\x3c\x6c\x69\x6e\x65\x20\
+\x78\x31\x3d\x22\x34\x2e\x32\x32\x22\x20\x79\x31\x3d\x22\x34\x2e\
+\x32\x32\x22\x20\x78\x32\x3d\x22\x35\x2e\x36\x34\x22\x20\x79\x32\
+\x3d\x22\x35\x2e\x36\x34\x22\x2f\x3e\x3c\x6c\x69\x6e\x65\x20\x78\
+\x31\x3d\x22\x31\x38\x2e\x33\x36\x22\x20\x79\x31\x3d\x22\x31\x38\
+\x2e\x33\x36\x22\x20\x78\x32\x3d\x22\x31\x39\x2e\x37\x38\x22\x20\
+\x79\x32\x3d\x22\x31\x39\x2e\x37\x38\x22\x2f\x3e\x3c\x6c\x69\x6e\
+\x65\x20\x78\x31\x3d\x22\x31\x22\x20\x79\x31\x3d\x22\x31\x32\x22\
+\x20\x78\x32\x3d\x22\x33\x22\x20\x79\x32\x3d\x22\x31\x32\x22\x2f\
+\x3e\x3c\x6c\x69\x6e\x65\x20\x78\x31\x3d\x22\x32\x31\x22\x20\x79\
+\x31\x3d\x22\x31\x32\x22\x20\x78\x32\x3d\x22\x32\x33\x22\x20\x79\
+\x32\x3d\x22\x31\x32\x22\x2f\x3e\x3c\x6c\x69\x6e\x65\x20\x78\x31\
+\x3d\x22\x34\x2e\x32\x32\x22\x20\x79\x31\x3d\x22\x31\x39\x2e\x37\
+\x38\x22\x20\x78\x32\x3d\x22\x35\x2e\x36\x34\x22\x20\x79\x32\x3d\
+\x22\x31\x38\x2e\x33\x36\x22\x2f\x3e\x3c\x6c\x69\x6e\x65\x20\x78\
+\x31\x3d\x22\x31\x38\x2e\x33\x36\x22\x20\x79\x31\x3d\x22\x35\x2e\
+\x36\x34\x22\x20\x78\x32\x3d\x22\x31\x39\x2e\x37\x38\x22\x20\x79\
+\x32\x3d\x22\x34\x2e\x32\x32\x22\x2f\x3e\x3c\x2f\x73\x76\x67\x3e\
+\
+\x00\x00\x01\x5a\
+\x3c\
+\x73\x76\x67\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\x3a\
+\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\
+\x30\x2f\x73\x76\x67\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\
+\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x32\x34\x22\x20\x76\x69\
+\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\x30\x20\x32\x34\x20\x32\x34\
+\x22\x20\x66\x69\x6c\x6c\x3d\x22\x6e\x6f\x6e\x65\x22\x20\x73\x74\
+\x72\x6f\x6b\x65\x3d\x22\x23\x34\x39\x35\x30\x35\x37\x22\x20\x73\
+\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\x22\x32\x22\x20\
+\x73\x74\x72\x6f\x6b\x65\x2d\x6c\x69\x6e\x65\x63\x61\x70\x3d\x22\
+\x72\x6f\x75\x6e\x64\x22\x20\x73\x74\x72\x6f\x6b\x65\x2d\x6c\x69\
+\x6e\x65\x6a\x6f\x69\x6e\x3d\x22\x72\x6f\x75\x6e\x64\x22\x3e\x3c\
+\x72\x65\x63\x74\x20\x78\x3d\x22\x33\x22\x20\x79\x3d\x22\x33\x22\
+\x20\x77\x69\x64\x74\x68\x3d\x22\x37\x22\x20\x68\x65\x69\x67\x68\
+\x74\x3d\x22\x37\x22\x2f\x3e\x3c\x72\x65\x63\x74\x20\x78\x3d\x22\
+\x31\x34\x22\x20\x79\x3d\x22\x33\x22\x20\x77\x69\x64\x74\x68\x3d\
+\x22\x37\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x37\x22\x2f\x3e\
+\x3c\x72\x65\x63\x74\x20\x78\x3d\x22\x31\x34\x22\x20\x79\x3d\x22\
+\x31\x34\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x37\x22\x20\x68\x65\
+\x69\x67\x68\x74\x3d\x22\x37\x22\x2f\x3e\x3c\x72\x65\x63\x74\x20\
+\x78\x3d\x22\x33\x22\x20\x79\x3d\x22\x31\x34\x22\x20\x77\x69\x64\
+\x74\x68\x3d\x22\x37\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x37\
+\x22\x2f\x3e\x3c\x2f\x73\x76\x67\x3e\
+\x00\x00\x01\x1f\
+\x3c\
+\x73\x76\x67\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\x3a\
+\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\
+\x30\x2f\x73\x76\x67\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\
+\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x32\x34\x22\x20\x76\x69\
+\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\x30\x20\x32\x34\x20\x32\x34\
+\x22\x20\x66\x69\x6c\x6c\x3d\x22\x6e\x6f\x6e\x65\x22\x20\x73\x74\
+\x72\x6f\x6b\x65\x3d\x22\x23\x34\x39\x35\x30\x35\x37\x22\x20\x73\
+\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\x22\x32\x22\x20\
+\x73\x74\x72\x6f\x6b\x65\x2d\x6c\x69\x6e\x65\x63\x61\x70\x3d\x22\
+\x72\x6f\x75\x6e\x64\x22\x20\x73\x74\x72\x6f\x6b\x65\x2d\x6c\x69\
+\x6e\x65\x6a\x6f\x69\x6e\x3d\x22\x72\x6f\x75\x6e\x64\x22\x3e\x3c\
+\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x38\x20\x33\x48\x35\x61\x32\
+\x20\x32\x20\x30\x20\x30\x20\x30\x2d\x32\x20\x32\x76\x33\x6d\x31\
+\x38\x20\x30\x56\x35\x61\x32\x20\x32\x20\x30\x20\x30\x20\x30\x2d\
+\x32\x2d\x32\x68\x2d\x33\x6d\x30\x20\x31\x38\x68\x33\x61\x32\x20\
+\x32\x20\x30\x20\x30\x20\x30\x20\x32\x2d\x32\x76\x2d\x33\x4d\x33\
+\x20\x31\x36\x76\x33\x61\x32\x20\x32\x20\x30\x20\x30\x20\x30\x20\
+\x32\x20\x32\x68\x33\x22\x2f\x3e\x3c\x2f\x73\x76\x67\x3e\
+\x00\x00\x01\x0e\
+\x3c\
+\x73\x76\x67\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\x3a\
+\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\
+\x30\x2f\x73\x76\x67\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\
+\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x32\x34\x22\x20\x76\x69\
+\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\x30\x20\x32\x34\x20\x32\x34\
+\x22\x20\x66\x69\x6c\x6c\x3d\x22\x6e\x6f\x6e\x65\x22\x20\x73\x74\
+\x72\x6f\x6b\x65\x3d\x22\x23\x34\x39\x35\x30\x35\x37\x22\x20\x73\
+\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\x22\x32\x22\x20\
+\x73\x74\x72\x6f\x6b\x65\x2d\x6c\x69\x6e\x65\x63\x61\x70\x3d\x22\
+\x72\x6f\x75\x6e\x64\x22\x20\x73\x74\x72\x6f\x6b\x65\x2d\x6c\x69\
+\x6e\x65\x6a\x6f\x69\x6e\x3d\x22\x72\x6f\x75\x6e\x64\x22\x3e\x3c\
+\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x32\x32\x20\x31\x31\x2e\x30\
+\x38\x56\x31\x32\x61\x31\x30\x20\x31\x30\x20\x30\x20\x31\x20\x31\
+\x2d\x35\x2e\x39\x33\x2d\x39\x2e\x31\x34\x22\x2f\x3e\x3c\x70\x6f\
+\x6c\x79\x6c\x69\x6e\x65\x20\x70\x6f\x69\x6e\x74\x73\x3d\x22\x32\
+\x32\x20\x34\x20\x31\x32\x20\x31\x34\x2e\x30\x31\x20\x39\x20\x31\
+\x31\x2e\x30\x31\x22\x2f\x3e\x3c\x2f\x73\x76\x67\x3e\
+\x00\x00\x02\xa3\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x3c\x00\x00\x00\x3c\x08\x06\x00\x00\x00\x3a\xfc\xd9\x72\
+\x00\x00\x00\x06\x62\x4b\x47\x44\x00\xff\x00\xff\x00\xff\xa0\xbd\
+\xa7\x93\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0b\x13\x00\x00\
+\x0b\x13\x01\x00\x9a\x9c\x18\x00\x00\x00\x07\x74\x49\x4d\x45\x07\
+\xe2\x03\x02\x04\x34\x31\x97\x0c\xf9\x63\x00\x00\x00\x19\x74\x45\
+\x58\x74\x43\x6f\x6d\x6d\x65\x6e\x74\x00\x43\x72\x65\x61\x74\x65\
+\x64\x20\x77\x69\x74\x68\x20\x47\x49\x4d\x50\x57\x81\x0e\x17\x00\
+\x00\x02\x0b\x49\x44\x41\x54\x68\xde\xed\x98\xcd\x4b\x94\x51\x14\
+\xc6\x7f\x16\x96\x7d\x2c\xa2\x55\x1b\x3f\x90\xc0\x45\x60\x21\x6e\
+\x5b\x04\x15\x45\x14\x06\x23\xae\x5a\xbb\x90\x72\x21\x6d\x4a\xa5\
+\x76\x41\x7f\x41\xae\xda\x88\x91\xd2\x22\x17\x66\x10\xa2\x92\x50\
+\x18\x45\x05\x81\x04\xd9\x2a\x22\xa5\x60\x48\xc4\x84\x69\x73\x16\
+\x0f\x2f\x33\x13\xfa\x5e\x21\xc6\xe7\x07\x97\xfb\xce\x73\xce\x7d\
+\xee\xdc\x97\x73\xef\x65\x06\x8c\x31\xc6\x18\x63\x8c\x31\xc6\x18\
+\x63\x8c\x49\x4e\x0f\x50\x8a\x76\x26\xb5\xf9\x9e\xff\x70\xc1\xed\
+\xf2\xfc\x61\x37\x2d\xf8\x1b\xb0\xb2\x9b\x16\xfc\x7e\x27\xcc\xb7\
+\xb2\xe0\x59\xd9\x5b\xa7\x32\xb1\xe3\xc0\x9f\x88\x7d\x02\xf6\x49\
+\xac\x1e\xb8\x01\xbc\x04\x7e\x46\x9b\x03\x7a\xcb\xcc\x7f\x04\x68\
+\xaa\x50\xce\x5b\xf1\x49\xc2\x7d\x59\x70\x4f\x26\xf6\x48\x62\x67\
+\x45\xef\x00\xde\x4a\x2c\xdb\x9e\x03\x7b\x25\xff\xb4\xc4\xae\xe5\
+\xf0\x49\x42\xb7\x4c\x30\x2c\x7a\xa7\xe8\xe3\xa2\x9f\x00\xd6\x24\
+\x36\x0d\xdc\x01\x1e\x02\x9b\xa2\xdf\x94\x31\x7d\xa2\x9f\xcc\xe1\
+\x93\x84\x66\x31\x1f\x0d\xad\x0e\x78\x11\xda\x9a\x94\xe3\x81\x28\
+\xc9\x12\xb0\x01\x5c\xce\x78\x15\xc4\xeb\xb5\xe8\x0f\x42\xdb\x04\
+\xf6\xe7\xf0\x49\x42\x1d\xf0\x3d\xcc\x17\x43\xbb\x20\x13\xde\x92\
+\xdc\xeb\xa2\xdf\xae\xe0\xb5\x1a\xf1\xdf\xa2\x2f\x84\xf6\x31\xa7\
+\x4f\x32\x26\xc3\xbc\x18\x7b\xe6\x5d\x7c\xfe\x0c\x34\x48\xde\x94\
+\x7c\xd1\xd6\x32\x3e\xf5\x52\xa6\x5f\xe5\x00\x2d\x86\x36\x96\xc3\
+\x27\xe9\xb5\xf4\x2a\xfa\xc3\xc0\x80\xec\xb3\x7e\x60\x5d\xf2\x8e\
+\xc9\x73\xb1\x8c\xcf\x95\x28\x57\x80\x67\xd1\xb7\x84\xaf\x5e\x49\
+\xdb\xf1\x49\xca\x79\x79\xe3\x1b\xd1\x3f\x2d\x93\x37\x56\xa5\x14\
+\x3b\x81\x1f\x11\x5b\x05\x1a\x43\xef\x92\x31\x97\x72\xf8\x24\xe5\
+\x68\xe6\x3a\x58\xaf\x50\x6a\x85\x4c\xde\x13\x60\x08\x78\x2c\xf7\
+\x75\x09\xb8\x28\x63\x86\x45\x6f\xca\xe1\x93\x9c\x25\x99\xe8\x6e\
+\x95\xbc\x91\x2a\xf7\xe6\x97\x38\xf0\x94\x89\x88\xfd\x8a\xc3\x68\
+\xbb\x3e\x49\x69\x00\x96\x63\xb2\x65\xe0\xe0\x3f\x4e\xf5\x02\x30\
+\x13\x25\x57\x04\xde\x00\x83\xc0\xa1\x2a\x2f\x72\x3e\xa7\x4f\x52\
+\x06\xe5\xed\x5e\xad\xf5\xdf\xa9\xcd\x72\x05\x4c\x67\xca\xae\x26\
+\x99\x90\xd3\xb9\xad\xd6\x17\x7b\x4e\x4a\xf9\x9e\xff\x94\x31\xc6\
+\x18\x63\x8c\x31\xc6\x18\x63\x8c\x31\xc6\x98\x54\xfc\x05\x94\x34\
+\xe4\xeb\x87\xd7\x3b\x14\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\
+\x60\x82\
+\x00\x00\x01\x36\
+\x3c\
+\x73\x76\x67\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\x3a\
+\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\
+\x30\x2f\x73\x76\x67\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\
+\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x32\x34\x22\x20\x76\x69\
+\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\x30\x20\x32\x34\x20\x32\x34\
+\x22\x20\x66\x69\x6c\x6c\x3d\x22\x6e\x6f\x6e\x65\x22\x20\x73\x74\
+\x72\x6f\x6b\x65\x3d\x22\x23\x34\x39\x35\x30\x35\x37\x22\x20\x73\
+\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\x22\x32\x22\x20\
+\x73\x74\x72\x6f\x6b\x65\x2d\x6c\x69\x6e\x65\x63\x61\x70\x3d\x22\
+\x72\x6f\x75\x6e\x64\x22\x20\x73\x74\x72\x6f\x6b\x65\x2d\x6c\x69\
+\x6e\x65\x6a\x6f\x69\x6e\x3d\x22\x72\x6f\x75\x6e\x64\x22\x3e\x3c\
+\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x32\x31\x20\x31\x35\x76\x34\
+\x61\x32\x20\x32\x20\x30\x20\x30\x20\x31\x2d\x32\x20\x32\x48\x35\
+\x61\x32\x20\x32\x20\x30\x20\x30\x20\x31\x2d\x32\x2d\x32\x76\x2d\
+\x34\x22\x2f\x3e\x3c\x70\x6f\x6c\x79\x6c\x69\x6e\x65\x20\x70\x6f\
+\x69\x6e\x74\x73\x3d\x22\x37\x20\x31\x30\x20\x31\x32\x20\x31\x35\
+\x20\x31\x37\x20\x31\x30\x22\x2f\x3e\x3c\x6c\x69\x6e\x65\x20\x78\
+\x31\x3d\x22\x31\x32\x22\x20\x79\x31\x3d\x22\x31\x35\x22\x20\x78\
+\x32\x3d\x22\x31\x32\x22\x20\x79\x32\x3d\x22\x33\x22\x2f\x3e\x3c\
+\x2f\x73\x76\x67\x3e\
+\x00\x00\x02\x31\
+\x3c\
+\x73\x76\x67\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\x3a\
+\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\
+\x30\x2f\x73\x76\x67\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\
+\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x32\x34\x22\x20\x76\x69\
+\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\x30\x20\x32\x34\x20\x32\x34\
+\x22\x20\x66\x69\x6c\x6c\x3d\x22\x6e\x6f\x6e\x65\x22\x20\x73\x74\
+\x72\x6f\x6b\x65\x3d\x22\x23\x34\x39\x35\x30\x35\x37\x22\x20\x73\
+\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\x22\x32\x22\x20\
+\x73\x74\x72\x6f\x6b\x65\x2d\x6c\x69\x6e\x65\x63\x61\x70\x3d\x22\
+\x72\x6f\x75\x6e\x64\x22\x20\x73\x74\x72\x6f\x6b\x65\x2d\x6c\x69\
+\x6e\x65\x6a\x6f\x69\x6e\x3d\x22\x72\x6f\x75\x6e\x64\x22\x3e\x3c\
+\x63\x69\x72\x63\x6c\x65\x20\x63\x78\x3d\x22\x31\x32\x22\x20\x63\
+\x79\x3d\x22\x31\x32\x22\x20\x72\x3d\x22\x35\x22\x2f\x3e\x3c\x6c\
+\x69\x6e\x65\x20\x78\x31\x3d\x22\x31\x32\x22\x20\x79\x31\x3d\x22\
+\x31\x22\x20\x78\x32\x3d\x22\x31\x32\x22\x20\x79\x32\x3d\x22\x33\
+\x22\x2f\x3e\x3c\x6c\x69\x6e\x65\x20\x78\x31\x3d\x22\x31\x32\x22\
+\x20\x79\x31\x3d\x22\x32\x31\x22\x20\x78\x32\x3d\x22\x31\x32\x22\
+\x20\x79\x32\x3d\x22\x32\x33\x22\x2f\x3e\x3c\x6c\x69\x6e\x65\x20\
+\x78\x31\x3d\x22\x34\x2e\x32\x32\x22\x20\x79\x31\x3d\x22\x34\x2e\
+\x32\x32\x22\x20\x78\x32\x3d\x22\x35\x2e\x36\x34\x22\x20\x79\x32\
+\x3d\x22\x35\x2e\x36\x34\x22\x2f\x3e\x3c\x6c\x69\x6e\x65\x20\x78\
+\x31\x3d\x22\x31\x38\x2e\x33\x36\x22\x20\x79\x31\x3d\x22\x31\x38\
+\x2e\x33\x36\x22\x20\x78\x32\x3d\x22\x31\x39\x2e\x37\x38\x22\x20\
+\x79\x32\x3d\x22\x31\x39\x2e\x37\x38\x22\x2f\x3e\x3c\x6c\x69\x6e\
+\x65\x20\x78\x31\x3d\x22\x31\x22\x20\x79\x31\x3d\x22\x31\x32\x22\
+\x20\x78\x32\x3d\x22\x33\x22\x20\x79\x32\x3d\x22\x31\x32\x22\x2f\
+\x3e\x3c\x6c\x69\x6e\x65\x20\x78\x31\x3d\x22\x32\x31\x22\x20\x79\
+\x31\x3d\x22\x31\x32\x22\x20\x78\x32\x3d\x22\x32\x33\x22\x20\x79\
+\x32\x3d\x22\x31\x32\x22\x2f\x3e\x3c\x6c\x69\x6e\x65\x20\x78\x31\
+\x3d\x22\x34\x2e\x32\x32\x22\x20\x79\x31\x3d\x22\x31\x39\x2e\x37\
+\x38\x22\x20\x78\x32\x3d\x22\x35\x2e\x36\x34\x22\x20\x79\x32\x3d\
+\x22\x31\x38\x2e\x33\x36\x22\x2f\x3e\x3c\x6c\x69\x6e\x65\x20\x78\
+\x31\x3d\x22\x31\x38\x2e\x33\x36\x22\x20\x79\x31\x3d\x22\x35\x2e\
+\x36\x34\x22\x20\x78\x32\x3d\x22\x31\x39\x2e\x37\x38\x22\x20\x79\
+\x32\x3d\x22\x34\x2e\x32\x32\x22\x2f\x3e\x3c\x2f\x73\x76\x67\x3e\
+\
+\x00\x00\x10\xc9\
+\x6f\
+\x70\x65\x6e\x46\x69\x6c\x65\x3d\x4f\x70\x65\x6e\x0a\x6f\x70\x65\
+\x6e\x46\x69\x6c\x65\x44\x65\x74\x61\x69\x6c\x3d\x4f\x70\x65\x6e\
+\x20\x69\x6d\x61\x67\x65\x20\x6f\x72\x20\x6c\x61\x62\x65\x6c\x20\
+\x66\x69\x6c\x65\x0a\x71\x75\x69\x74\x3d\x51\x75\x69\x74\x0a\x71\
+\x75\x69\x74\x41\x70\x70\x3d\x51\x75\x69\x74\x20\x61\x70\x70\x6c\
+\x69\x63\x61\x74\x69\x6f\x6e\x0a\x6f\x70\x65\x6e\x44\x69\x72\x3d\
+\x4f\x70\x65\x6e\x20\x44\x69\x72\x0a\x63\x6f\x70\x79\x50\x72\x65\
+\x76\x42\x6f\x75\x6e\x64\x69\x6e\x67\x3d\x43\x6f\x70\x79\x20\x70\
+\x72\x65\x76\x69\x6f\x75\x73\x20\x42\x6f\x75\x6e\x64\x69\x6e\x67\
+\x20\x42\x6f\x78\x65\x73\x20\x69\x6e\x20\x74\x68\x65\x20\x63\x75\
+\x72\x72\x65\x6e\x74\x20\x69\x6d\x61\x67\x65\x0a\x63\x68\x61\x6e\
+\x67\x65\x53\x61\x76\x65\x64\x41\x6e\x6e\x6f\x74\x61\x74\x69\x6f\
+\x6e\x44\x69\x72\x3d\x43\x68\x61\x6e\x67\x65\x20\x64\x65\x66\x61\
+\x75\x6c\x74\x20\x73\x61\x76\x65\x64\x20\x41\x6e\x6e\x6f\x74\x61\
+\x74\x69\x6f\x6e\x20\x64\x69\x72\x0a\x6f\x70\x65\x6e\x41\x6e\x6e\
+\x6f\x74\x61\x74\x69\x6f\x6e\x3d\x4f\x70\x65\x6e\x20\x41\x6e\x6e\
+\x6f\x74\x61\x74\x69\x6f\x6e\x0a\x6f\x70\x65\x6e\x41\x6e\x6e\x6f\
+\x74\x61\x74\x69\x6f\x6e\x44\x65\x74\x61\x69\x6c\x3d\x4f\x70\x65\
+\x6e\x20\x61\x6e\x20\x61\x6e\x6e\x6f\x74\x61\x74\x69\x6f\x6e\x20\
+\x66\x69\x6c\x65\x0a\x63\x68\x61\x6e\x67\x65\x53\x61\x76\x65\x44\
+\x69\x72\x3d\x43\x68\x61\x6e\x67\x65\x20\x53\x61\x76\x65\x20\x44\
+\x69\x72\x0a\x6e\x65\x78\x74\x49\x6d\x67\x3d\x4e\x65\x78\x74\x20\
+\x49\x6d\x61\x67\x65\x0a\x6e\x65\x78\x74\x49\x6d\x67\x44\x65\x74\
+\x61\x69\x6c\x3d\x4f\x70\x65\x6e\x20\x74\x68\x65\x20\x6e\x65\x78\
+\x74\x20\x49\x6d\x61\x67\x65\x0a\x70\x72\x65\x76\x49\x6d\x67\x3d\
+\x50\x72\x65\x76\x20\x49\x6d\x61\x67\x65\x0a\x70\x72\x65\x76\x49\
+\x6d\x67\x44\x65\x74\x61\x69\x6c\x3d\x4f\x70\x65\x6e\x20\x74\x68\
+\x65\x20\x70\x72\x65\x76\x69\x6f\x75\x73\x20\x49\x6d\x61\x67\x65\
+\x0a\x76\x65\x72\x69\x66\x79\x49\x6d\x67\x3d\x56\x65\x72\x69\x66\
+\x79\x20\x49\x6d\x61\x67\x65\x0a\x76\x65\x72\x69\x66\x79\x49\x6d\
+\x67\x44\x65\x74\x61\x69\x6c\x3d\x56\x65\x72\x69\x66\x79\x20\x49\
+\x6d\x61\x67\x65\x0a\x73\x61\x76\x65\x3d\x53\x61\x76\x65\x0a\x73\
+\x61\x76\x65\x44\x65\x74\x61\x69\x6c\x3d\x53\x61\x76\x65\x20\x74\
+\x68\x65\x20\x6c\x61\x62\x65\x6c\x73\x20\x74\x6f\x20\x61\x20\x66\
+\x69\x6c\x65\x0a\x63\x68\x61\x6e\x67\x65\x53\x61\x76\x65\x46\x6f\
+\x72\x6d\x61\x74\x3d\x43\x68\x61\x6e\x67\x65\x20\x73\x61\x76\x65\
+\x20\x66\x6f\x72\x6d\x61\x74\x0a\x73\x61\x76\x65\x41\x73\x3d\x53\
+\x61\x76\x65\x20\x41\x73\x0a\x73\x61\x76\x65\x41\x73\x44\x65\x74\
+\x61\x69\x6c\x3d\x53\x61\x76\x65\x20\x74\x68\x65\x20\x6c\x61\x62\
+\x65\x6c\x73\x20\x74\x6f\x20\x61\x20\x64\x69\x66\x66\x65\x72\x65\
+\x6e\x74\x20\x66\x69\x6c\x65\x0a\x63\x6c\x6f\x73\x65\x43\x75\x72\
+\x3d\x43\x6c\x6f\x73\x65\x0a\x63\x6c\x6f\x73\x65\x43\x75\x72\x44\
+\x65\x74\x61\x69\x6c\x3d\x43\x6c\x6f\x73\x65\x20\x74\x68\x65\x20\
+\x63\x75\x72\x72\x65\x6e\x74\x20\x66\x69\x6c\x65\x0a\x64\x65\x6c\
+\x65\x74\x65\x49\x6d\x67\x3d\x44\x65\x6c\x65\x74\x65\x20\x63\x75\
+\x72\x72\x65\x6e\x74\x20\x69\x6d\x61\x67\x65\x0a\x64\x65\x6c\x65\
+\x74\x65\x49\x6d\x67\x44\x65\x74\x61\x69\x6c\x3d\x44\x65\x6c\x65\
+\x74\x65\x20\x74\x68\x65\x20\x63\x75\x72\x72\x65\x6e\x74\x20\x69\
+\x6d\x61\x67\x65\x0a\x74\x72\x61\x73\x68\x49\x6d\x67\x3d\x4d\x6f\
+\x76\x65\x20\x73\x65\x6c\x65\x63\x74\x65\x64\x20\x69\x6d\x61\x67\
+\x65\x73\x20\x74\x6f\x20\x74\x72\x61\x73\x68\x0a\x74\x72\x61\x73\
+\x68\x49\x6d\x67\x44\x65\x74\x61\x69\x6c\x3d\x4d\x6f\x76\x65\x20\
+\x74\x68\x65\x20\x73\x65\x6c\x65\x63\x74\x65\x64\x20\x69\x6d\x61\
+\x67\x65\x73\x20\x61\x6e\x64\x20\x74\x68\x65\x69\x72\x20\x61\x6e\
+\x6e\x6f\x74\x61\x74\x69\x6f\x6e\x73\x20\x74\x6f\x20\x74\x68\x65\
+\x20\x74\x72\x61\x73\x68\x20\x66\x6f\x6c\x64\x65\x72\x0a\x72\x65\
+\x73\x65\x74\x41\x6c\x6c\x3d\x52\x65\x73\x65\x74\x20\x41\x6c\x6c\
+\x0a\x72\x65\x73\x65\x74\x41\x6c\x6c\x44\x65\x74\x61\x69\x6c\x3d\
+\x52\x65\x73\x65\x74\x20\x41\x6c\x6c\x0a\x62\x6f\x78\x4c\x69\x6e\
+\x65\x43\x6f\x6c\x6f\x72\x3d\x42\x6f\x78\x20\x4c\x69\x6e\x65\x20\
+\x43\x6f\x6c\x6f\x72\x0a\x62\x6f\x78\x4c\x69\x6e\x65\x43\x6f\x6c\
+\x6f\x72\x44\x65\x74\x61\x69\x6c\x3d\x43\x68\x6f\x6f\x73\x65\x20\
+\x42\x6f\x78\x20\x6c\x69\x6e\x65\x20\x63\x6f\x6c\x6f\x72\x0a\x63\
+\x72\x74\x42\x6f\x78\x3d\x43\x72\x65\x61\x74\x65\x20\x52\x65\x63\
+\x74\x42\x6f\x78\x0a\x63\x72\x74\x42\x6f\x78\x44\x65\x74\x61\x69\
+\x6c\x3d\x44\x72\x61\x77\x20\x61\x20\x6e\x65\x77\x20\x62\x6f\x78\
+\x0a\x64\x65\x6c\x42\x6f\x78\x3d\x44\x65\x6c\x65\x74\x65\x20\x52\
+\x65\x63\x74\x42\x6f\x78\x0a\x64\x65\x6c\x42\x6f\x78\x44\x65\x74\
+\x61\x69\x6c\x3d\x52\x65\x6d\x6f\x76\x65\x20\x74\x68\x65\x20\x62\
+\x6f\x78\x0a\x64\x75\x70\x42\x6f\x78\x3d\x44\x75\x70\x6c\x69\x63\
+\x61\x74\x65\x20\x52\x65\x63\x74\x42\x6f\x78\x0a\x64\x75\x70\x42\
+\x6f\x78\x44\x65\x74\x61\x69\x6c\x3d\x43\x72\x65\x61\x74\x65\x20\
+\x61\x20\x64\x75\x70\x6c\x69\x63\x61\x74\x65\x20\x6f\x66\x20\x74\
+\x68\x65\x20\x73\x65\x6c\x65\x63\x74\x65\x64\x20\x62\x6f\x78\x0a\
+\x63\x6f\x70\x79\x42\x6f\x78\x3d\x43\x6f\x70\x79\x0a\x63\x6f\x70\
+\x79\x42\x6f\x78\x44\x65\x74\x61\x69\x6c\x3d\x43\x6f\x70\x79\x20\
+\x73\x65\x6c\x65\x63\x74\x65\x64\x20\x62\x6f\x78\x20\x74\x6f\x20\
+\x63\x6c\x69\x70\x62\x6f\x61\x72\x64\x0a\x70\x61\x73\x74\x65\x42\
+\x6f\x78\x3d\x50\x61\x73\x74\x65\x0a\x70\x61\x73\x74\x65\x42\x6f\
+\x78\x44\x65\x74\x61\x69\x6c\x3d\x50\x61\x73\x74\x65\x20\x62\x6f\
+\x78\x20\x66\x72\x6f\x6d\x20\x63\x6c\x69\x70\x62\x6f\x61\x72\x64\
+\x0a\x63\x6f\x70\x79\x41\x6c\x6c\x42\x6f\x78\x65\x73\x3d\x43\x6f\
+\x70\x79\x20\x41\x6c\x6c\x0a\x63\x6f\x70\x79\x41\x6c\x6c\x42\x6f\
+\x78\x65\x73\x44\x65\x74\x61\x69\x6c\x3d\x43\x6f\x70\x79\x20\x61\
+\x6c\x6c\x20\x62\x6f\x78\x65\x73\x20\x74\x6f\x20\x63\x6c\x69\x70\
+\x62\x6f\x61\x72\x64\x0a\x75\x6e\x64\x6f\x3d\x55\x6e\x64\x6f\x0a\
+\x75\x6e\x64\x6f\x44\x65\x74\x61\x69\x6c\x3d\x55\x6e\x64\x6f\x20\
+\x74\x68\x65\x20\x6c\x61\x73\x74\x20\x61\x63\x74\x69\x6f\x6e\x0a\
+\x72\x65\x64\x6f\x3d\x52\x65\x64\x6f\x0a\x72\x65\x64\x6f\x44\x65\
+\x74\x61\x69\x6c\x3d\x52\x65\x64\x6f\x20\x74\x68\x65\x20\x6c\x61\
+\x73\x74\x20\x75\x6e\x64\x6f\x6e\x65\x20\x61\x63\x74\x69\x6f\x6e\
+\x0a\x69\x63\x6f\x6e\x53\x69\x7a\x65\x3d\x49\x63\x6f\x6e\x20\x53\
+\x69\x7a\x65\x0a\x69\x63\x6f\x6e\x53\x69\x7a\x65\x53\x6d\x61\x6c\
+\x6c\x3d\x53\x6d\x61\x6c\x6c\x20\x28\x31\x36\x70\x78\x29\x0a\x69\
+\x63\x6f\x6e\x53\x69\x7a\x65\x4d\x65\x64\x69\x75\x6d\x3d\x4d\x65\
+\x64\x69\x75\x6d\x20\x28\x32\x32\x70\x78\x29\x0a\x69\x63\x6f\x6e\
+\x53\x69\x7a\x65\x4c\x61\x72\x67\x65\x3d\x4c\x61\x72\x67\x65\x20\
+\x28\x32\x38\x70\x78\x29\x0a\x69\x63\x6f\x6e\x53\x69\x7a\x65\x58\
+\x4c\x61\x72\x67\x65\x3d\x45\x78\x74\x72\x61\x20\x4c\x61\x72\x67\
+\x65\x20\x28\x33\x36\x70\x78\x29\x0a\x69\x63\x6f\x6e\x53\x69\x7a\
+\x65\x41\x75\x74\x6f\x3d\x41\x75\x74\x6f\x20\x28\x44\x50\x49\x2d\
+\x62\x61\x73\x65\x64\x29\x0a\x65\x64\x69\x74\x42\x6f\x78\x3d\x26\
+\x45\x64\x69\x74\x20\x52\x65\x63\x74\x42\x6f\x78\x0a\x65\x64\x69\
+\x74\x42\x6f\x78\x44\x65\x74\x61\x69\x6c\x3d\x4d\x6f\x76\x65\x20\
+\x61\x6e\x64\x20\x65\x64\x69\x74\x20\x42\x6f\x78\x73\x0a\x68\x69\
+\x64\x65\x41\x6c\x6c\x42\x6f\x78\x3d\x26\x48\x69\x64\x65\x20\x52\
+\x65\x63\x74\x42\x6f\x78\x0a\x73\x68\x6f\x77\x41\x6c\x6c\x42\x6f\
+\x78\x3d\x26\x53\x68\x6f\x77\x20\x52\x65\x63\x74\x42\x6f\x78\x0a\
+\x74\x75\x74\x6f\x72\x69\x61\x6c\x44\x65\x66\x61\x75\x6c\x74\x3d\
+\x54\x75\x74\x6f\x72\x69\x61\x6c\x0a\x74\x75\x74\x6f\x72\x69\x61\
+\x6c\x43\x68\x72\x6f\x6d\x65\x3d\x54\x75\x74\x6f\x72\x69\x61\x6c\
+\x28\x43\x68\x72\x6f\x6d\x65\x29\x0a\x74\x75\x74\x6f\x72\x69\x61\
+\x6c\x44\x65\x74\x61\x69\x6c\x3d\x53\x68\x6f\x77\x20\x64\x65\x6d\
+\x6f\x0a\x69\x6e\x66\x6f\x3d\x49\x6e\x66\x6f\x72\x6d\x61\x74\x69\
+\x6f\x6e\x0a\x73\x68\x6f\x72\x74\x63\x75\x74\x3d\x4b\x65\x79\x62\
+\x6f\x61\x72\x64\x20\x73\x68\x6f\x72\x74\x63\x75\x74\x73\x0a\x7a\
+\x6f\x6f\x6d\x69\x6e\x3d\x5a\x6f\x6f\x6d\x20\x49\x6e\x0a\x7a\x6f\
+\x6f\x6d\x69\x6e\x44\x65\x74\x61\x69\x6c\x3d\x49\x6e\x63\x72\x65\
+\x61\x73\x65\x20\x7a\x6f\x6f\x6d\x20\x6c\x65\x76\x65\x6c\x0a\x7a\
+\x6f\x6f\x6d\x6f\x75\x74\x3d\x5a\x6f\x6f\x6d\x20\x4f\x75\x74\x0a\
+\x7a\x6f\x6f\x6d\x6f\x75\x74\x44\x65\x74\x61\x69\x6c\x3d\x44\x65\
+\x63\x72\x65\x61\x73\x65\x20\x7a\x6f\x6f\x6d\x20\x6c\x65\x76\x65\
+\x6c\x0a\x6f\x72\x69\x67\x69\x6e\x61\x6c\x73\x69\x7a\x65\x3d\x4f\
+\x72\x69\x67\x69\x6e\x61\x6c\x20\x73\x69\x7a\x65\x0a\x6f\x72\x69\
+\x67\x69\x6e\x61\x6c\x73\x69\x7a\x65\x44\x65\x74\x61\x69\x6c\x3d\
+\x5a\x6f\x6f\x6d\x20\x74\x6f\x20\x6f\x72\x69\x67\x69\x6e\x61\x6c\
+\x20\x73\x69\x7a\x65\x0a\x66\x69\x74\x57\x69\x6e\x3d\x46\x69\x74\
+\x20\x57\x69\x6e\x64\x6f\x77\x0a\x66\x69\x74\x57\x69\x6e\x44\x65\
+\x74\x61\x69\x6c\x3d\x5a\x6f\x6f\x6d\x20\x66\x6f\x6c\x6c\x6f\x77\
+\x73\x20\x77\x69\x6e\x64\x6f\x77\x20\x73\x69\x7a\x65\x0a\x66\x69\
+\x74\x57\x69\x64\x74\x68\x3d\x46\x69\x74\x20\x57\x69\x64\x74\x68\
+\x0a\x66\x69\x74\x57\x69\x64\x74\x68\x44\x65\x74\x61\x69\x6c\x3d\
+\x5a\x6f\x6f\x6d\x20\x66\x6f\x6c\x6c\x6f\x77\x73\x20\x77\x69\x6e\
+\x64\x6f\x77\x20\x77\x69\x64\x74\x68\x0a\x6c\x69\x67\x68\x74\x62\
+\x72\x69\x67\x68\x74\x65\x6e\x3d\x42\x72\x69\x67\x68\x74\x65\x6e\
+\x0a\x6c\x69\x67\x68\x74\x62\x72\x69\x67\x68\x74\x65\x6e\x44\x65\
+\x74\x61\x69\x6c\x3d\x49\x6e\x63\x72\x65\x61\x73\x65\x20\x49\x6d\
+\x61\x67\x65\x20\x42\x72\x69\x67\x68\x74\x6e\x65\x73\x73\x0a\x6c\
+\x69\x67\x68\x74\x64\x61\x72\x6b\x65\x6e\x3d\x44\x61\x72\x6b\x65\
+\x6e\x0a\x6c\x69\x67\x68\x74\x64\x61\x72\x6b\x65\x6e\x44\x65\x74\
+\x61\x69\x6c\x3d\x44\x65\x63\x72\x65\x61\x73\x65\x20\x49\x6d\x61\
+\x67\x65\x20\x42\x72\x69\x67\x68\x74\x6e\x65\x73\x73\x0a\x6c\x69\
+\x67\x68\x74\x72\x65\x73\x65\x74\x3d\x4f\x72\x69\x67\x69\x6e\x61\
+\x6c\x20\x42\x72\x69\x67\x68\x74\x6e\x65\x73\x73\x0a\x6c\x69\x67\
+\x68\x74\x72\x65\x73\x65\x74\x44\x65\x74\x61\x69\x6c\x3d\x52\x65\
+\x73\x74\x6f\x72\x65\x20\x6f\x72\x69\x67\x69\x6e\x61\x6c\x20\x62\
+\x72\x69\x67\x68\x74\x6e\x65\x73\x73\x0a\x6c\x69\x67\x68\x74\x57\
+\x69\x64\x67\x65\x74\x54\x69\x74\x6c\x65\x3d\x49\x6d\x61\x67\x65\
+\x20\x42\x72\x69\x67\x68\x74\x6e\x65\x73\x73\x0a\x65\x64\x69\x74\
+\x4c\x61\x62\x65\x6c\x3d\x45\x64\x69\x74\x20\x4c\x61\x62\x65\x6c\
+\x0a\x65\x64\x69\x74\x4c\x61\x62\x65\x6c\x44\x65\x74\x61\x69\x6c\
+\x3d\x4d\x6f\x64\x69\x66\x79\x20\x74\x68\x65\x20\x6c\x61\x62\x65\
+\x6c\x20\x6f\x66\x20\x74\x68\x65\x20\x73\x65\x6c\x65\x63\x74\x65\
+\x64\x20\x42\x6f\x78\x0a\x73\x68\x61\x70\x65\x4c\x69\x6e\x65\x43\
+\x6f\x6c\x6f\x72\x3d\x53\x68\x61\x70\x65\x20\x4c\x69\x6e\x65\x20\
+\x43\x6f\x6c\x6f\x72\x0a\x73\x68\x61\x70\x65\x4c\x69\x6e\x65\x43\
+\x6f\x6c\x6f\x72\x44\x65\x74\x61\x69\x6c\x3d\x43\x68\x61\x6e\x67\
+\x65\x20\x74\x68\x65\x20\x6c\x69\x6e\x65\x20\x63\x6f\x6c\x6f\x72\
+\x20\x66\x6f\x72\x20\x74\x68\x69\x73\x20\x73\x70\x65\x63\x69\x66\
+\x69\x63\x20\x73\x68\x61\x70\x65\x0a\x73\x68\x61\x70\x65\x46\x69\
+\x6c\x6c\x43\x6f\x6c\x6f\x72\x3d\x53\x68\x61\x70\x65\x20\x46\x69\
+\x6c\x6c\x20\x43\x6f\x6c\x6f\x72\x0a\x73\x68\x61\x70\x65\x46\x69\
+\x6c\x6c\x43\x6f\x6c\x6f\x72\x44\x65\x74\x61\x69\x6c\x3d\x43\x68\
+\x61\x6e\x67\x65\x20\x74\x68\x65\x20\x66\x69\x6c\x6c\x20\x63\x6f\
+\x6c\x6f\x72\x20\x66\x6f\x72\x20\x74\x68\x69\x73\x20\x73\x70\x65\
+\x63\x69\x66\x69\x63\x20\x73\x68\x61\x70\x65\x0a\x73\x68\x6f\x77\
+\x48\x69\x64\x65\x3d\x53\x68\x6f\x77\x2f\x48\x69\x64\x65\x20\x4c\
+\x61\x62\x65\x6c\x20\x50\x61\x6e\x65\x6c\x0a\x75\x73\x65\x44\x65\
+\x66\x61\x75\x6c\x74\x4c\x61\x62\x65\x6c\x3d\x55\x73\x65\x20\x64\
+\x65\x66\x61\x75\x6c\x74\x20\x6c\x61\x62\x65\x6c\x0a\x75\x73\x65\
+\x44\x69\x66\x66\x69\x63\x75\x6c\x74\x3d\x64\x69\x66\x66\x69\x63\
+\x75\x6c\x74\x0a\x62\x6f\x78\x4c\x61\x62\x65\x6c\x54\x65\x78\x74\
+\x3d\x42\x6f\x78\x20\x4c\x61\x62\x65\x6c\x73\x0a\x6c\x61\x62\x65\
+\x6c\x73\x3d\x4c\x61\x62\x65\x6c\x73\x0a\x61\x75\x74\x6f\x53\x61\
+\x76\x65\x4d\x6f\x64\x65\x3d\x53\x61\x76\x65\x20\x6f\x6e\x20\x4e\
+\x61\x76\x69\x67\x61\x74\x65\x0a\x61\x75\x74\x6f\x53\x61\x76\x65\
+\x4d\x6f\x64\x65\x44\x65\x74\x61\x69\x6c\x3d\x41\x75\x74\x6f\x6d\
+\x61\x74\x69\x63\x61\x6c\x6c\x79\x20\x73\x61\x76\x65\x20\x77\x68\
+\x65\x6e\x20\x73\x77\x69\x74\x63\x68\x69\x6e\x67\x20\x74\x6f\x20\
+\x6e\x65\x78\x74\x2f\x70\x72\x65\x76\x69\x6f\x75\x73\x20\x69\x6d\
+\x61\x67\x65\x0a\x61\x75\x74\x6f\x53\x61\x76\x65\x45\x6e\x61\x62\
+\x6c\x65\x64\x3d\x54\x69\x6d\x65\x64\x20\x41\x75\x74\x6f\x2d\x73\
+\x61\x76\x65\x0a\x61\x75\x74\x6f\x53\x61\x76\x65\x45\x6e\x61\x62\
+\x6c\x65\x64\x44\x65\x74\x61\x69\x6c\x3d\x41\x75\x74\x6f\x6d\x61\
+\x74\x69\x63\x61\x6c\x6c\x79\x20\x73\x61\x76\x65\x20\x61\x74\x20\
+\x72\x65\x67\x75\x6c\x61\x72\x20\x69\x6e\x74\x65\x72\x76\x61\x6c\
+\x73\x0a\x61\x75\x74\x6f\x53\x61\x76\x65\x49\x6e\x74\x65\x72\x76\
+\x61\x6c\x3d\x41\x75\x74\x6f\x2d\x73\x61\x76\x65\x20\x49\x6e\x74\
+\x65\x72\x76\x61\x6c\x0a\x61\x75\x74\x6f\x53\x61\x76\x65\x33\x30\
+\x73\x3d\x33\x30\x20\x73\x65\x63\x6f\x6e\x64\x73\x0a\x61\x75\x74\
+\x6f\x53\x61\x76\x65\x31\x6d\x3d\x31\x20\x6d\x69\x6e\x75\x74\x65\
+\x0a\x61\x75\x74\x6f\x53\x61\x76\x65\x32\x6d\x3d\x32\x20\x6d\x69\
+\x6e\x75\x74\x65\x73\x0a\x61\x75\x74\x6f\x53\x61\x76\x65\x35\x6d\
+\x3d\x35\x20\x6d\x69\x6e\x75\x74\x65\x73\x0a\x73\x69\x6e\x67\x6c\
+\x65\x43\x6c\x73\x4d\x6f\x64\x65\x3d\x53\x69\x6e\x67\x6c\x65\x20\
+\x43\x6c\x61\x73\x73\x20\x4d\x6f\x64\x65\x0a\x64\x69\x73\x70\x6c\
+\x61\x79\x4c\x61\x62\x65\x6c\x3d\x44\x69\x73\x70\x6c\x61\x79\x20\
+\x4c\x61\x62\x65\x6c\x73\x0a\x66\x69\x6c\x65\x4c\x69\x73\x74\x3d\
+\x46\x69\x6c\x65\x20\x4c\x69\x73\x74\x0a\x66\x69\x6c\x65\x73\x3d\
+\x46\x69\x6c\x65\x73\x0a\x61\x64\x76\x61\x6e\x63\x65\x64\x4d\x6f\
+\x64\x65\x3d\x41\x64\x76\x61\x6e\x63\x65\x64\x20\x4d\x6f\x64\x65\
+\x0a\x61\x64\x76\x61\x6e\x63\x65\x64\x4d\x6f\x64\x65\x44\x65\x74\
+\x61\x69\x6c\x3d\x53\x77\x74\x69\x63\x68\x20\x74\x6f\x20\x61\x64\
+\x76\x61\x6e\x63\x65\x64\x20\x6d\x6f\x64\x65\x0a\x73\x68\x6f\x77\
+\x41\x6c\x6c\x42\x6f\x78\x44\x65\x74\x61\x69\x6c\x3d\x53\x68\x6f\
+\x77\x20\x61\x6c\x6c\x20\x62\x6f\x75\x6e\x64\x69\x6e\x67\x20\x62\
+\x6f\x78\x65\x73\x0a\x68\x69\x64\x65\x41\x6c\x6c\x42\x6f\x78\x44\
+\x65\x74\x61\x69\x6c\x3d\x48\x69\x64\x65\x20\x61\x6c\x6c\x20\x62\
+\x6f\x75\x6e\x64\x69\x6e\x67\x20\x62\x6f\x78\x65\x73\x0a\x6d\x65\
+\x6e\x75\x5f\x66\x69\x6c\x65\x3d\x26\x46\x69\x6c\x65\x0a\x6d\x65\
+\x6e\x75\x5f\x65\x64\x69\x74\x3d\x26\x45\x64\x69\x74\x0a\x6d\x65\
+\x6e\x75\x5f\x76\x69\x65\x77\x3d\x26\x56\x69\x65\x77\x0a\x6d\x65\
+\x6e\x75\x5f\x68\x65\x6c\x70\x3d\x26\x48\x65\x6c\x70\x0a\x6d\x65\
+\x6e\x75\x5f\x6f\x70\x65\x6e\x52\x65\x63\x65\x6e\x74\x3d\x4f\x70\
+\x65\x6e\x20\x26\x52\x65\x63\x65\x6e\x74\x0a\x63\x68\x6f\x6f\x73\
+\x65\x4c\x69\x6e\x65\x43\x6f\x6c\x6f\x72\x3d\x43\x68\x6f\x6f\x73\
+\x65\x20\x4c\x69\x6e\x65\x20\x43\x6f\x6c\x6f\x72\x0a\x63\x68\x6f\
+\x6f\x73\x65\x46\x69\x6c\x6c\x43\x6f\x6c\x6f\x72\x3d\x43\x68\x6f\
+\x6f\x73\x65\x20\x46\x69\x6c\x6c\x20\x43\x6f\x6c\x6f\x72\x0a\x64\
+\x72\x61\x77\x53\x71\x75\x61\x72\x65\x73\x3d\x44\x72\x61\x77\x20\
+\x53\x71\x75\x61\x72\x65\x73\x0a\x6c\x69\x73\x74\x56\x69\x65\x77\
+\x3d\x4c\x69\x73\x74\x0a\x67\x61\x6c\x6c\x65\x72\x79\x56\x69\x65\
+\x77\x3d\x47\x61\x6c\x6c\x65\x72\x79\x0a\x66\x69\x6c\x74\x65\x72\
+\x41\x6c\x6c\x3d\x41\x6c\x6c\x20\x69\x6d\x61\x67\x65\x73\x0a\x66\
+\x69\x6c\x74\x65\x72\x4e\x6f\x4c\x61\x62\x65\x6c\x73\x3d\x4e\x6f\
+\x20\x6c\x61\x62\x65\x6c\x73\x0a\x66\x69\x6c\x74\x65\x72\x48\x61\
+\x73\x4c\x61\x62\x65\x6c\x73\x3d\x4c\x61\x62\x65\x6c\x65\x64\x2c\
+\x20\x6e\x6f\x74\x20\x76\x65\x72\x69\x66\x69\x65\x64\x0a\x66\x69\
+\x6c\x74\x65\x72\x56\x65\x72\x69\x66\x69\x65\x64\x3d\x56\x65\x72\
+\x69\x66\x69\x65\x64\x0a\x66\x69\x6c\x74\x65\x72\x43\x6c\x61\x73\
+\x73\x3d\x43\x6f\x6e\x74\x61\x69\x6e\x73\x20\x63\x6c\x61\x73\x73\
+\x0a\x66\x69\x6c\x74\x65\x72\x42\x6f\x78\x43\x6f\x75\x6e\x74\x3d\
+\x42\x6f\x78\x20\x63\x6f\x75\x6e\x74\x0a\x66\x69\x6c\x74\x65\x72\
+\x56\x61\x6c\x75\x65\x54\x69\x70\x3d\x43\x6c\x61\x73\x73\x20\x6e\
+\x61\x6d\x65\x2c\x20\x6f\x72\x20\x61\x20\x62\x6f\x78\x20\x63\x6f\
+\x75\x6e\x74\x20\x73\x75\x63\x68\x20\x61\x73\x20\x33\x2c\x20\x32\
+\x2d\x35\x20\x6f\x72\x20\x35\x2d\x0a\x67\x61\x6c\x6c\x65\x72\x79\
+\x4d\x6f\x64\x65\x3d\x47\x61\x6c\x6c\x65\x72\x79\x20\x4d\x6f\x64\
+\x65\x0a\x67\x61\x6c\x6c\x65\x72\x79\x4d\x6f\x64\x65\x44\x65\x74\
+\x61\x69\x6c\x3d\x54\x6f\x67\x67\x6c\x65\x20\x66\x75\x6c\x6c\x2d\
+\x73\x63\x72\x65\x65\x6e\x20\x67\x61\x6c\x6c\x65\x72\x79\x20\x76\
+\x69\x65\x77\x0a\x6c\x65\x66\x74\x47\x61\x6c\x6c\x65\x72\x79\x3d\
+\x47\x61\x6c\x6c\x65\x72\x79\x0a\x74\x69\x6c\x65\x64\x56\x69\x65\
+\x77\x3d\x54\x69\x6c\x65\x64\x20\x56\x69\x65\x77\x20\x66\x6f\x72\
+\x20\x4c\x61\x72\x67\x65\x20\x49\x6d\x61\x67\x65\x73\x0a\x74\x69\
+\x6c\x65\x64\x56\x69\x65\x77\x44\x65\x74\x61\x69\x6c\x3d\x53\x68\
+\x6f\x77\x20\x6c\x61\x72\x67\x65\x20\x69\x6d\x61\x67\x65\x73\x20\
+\x61\x74\x20\x6e\x61\x74\x69\x76\x65\x20\x72\x65\x73\x6f\x6c\x75\
+\x74\x69\x6f\x6e\x20\x62\x79\x20\x64\x65\x63\x6f\x64\x69\x6e\x67\
+\x20\x6f\x6e\x6c\x79\x20\x74\x68\x65\x20\x76\x69\x73\x69\x62\x6c\
+\x65\x20\x74\x69\x6c\x65\x73\x0a\x64\x69\x73\x70\x6c\x61\x79\x52\
+\x65\x73\x6f\x6c\x75\x74\x69\x6f\x6e\x3d\x44\x69\x73\x70\x6c\x61\
+\x79\x20\x52\x65\x73\x6f\x6c\x75\x74\x69\x6f\x6e\x0a\x64\x69\x73\
+\x70\x6c\x61\x79\x52\x65\x73\x6f\x6c\x75\x74\x69\x6f\x6e\x41\x75\
+\x74\x6f\x3d\x41\x75\x74\x6f\x20\x28\x53\x63\x72\x65\x65\x6e\x20\
+\x61\x6e\x64\x20\x4d\x65\x6d\x6f\x72\x79\x29\x0a\x64\x69\x73\x70\
+\x6c\x61\x79\x52\x65\x73\x6f\x6c\x75\x74\x69\x6f\x6e\x46\x75\x6c\
+\x6c\x3d\x46\x75\x6c\x6c\x20\x52\x65\x73\x6f\x6c\x75\x74\x69\x6f\
+\x6e\x0a\x63\x61\x6e\x76\x61\x73\x42\x61\x63\x6b\x65\x6e\x64\x3d\
+\x43\x61\x6e\x76\x61\x73\x20\x42\x61\x63\x6b\x65\x6e\x64\x0a\x63\
+\x61\x6e\x76\x61\x73\x42\x61\x63\x6b\x65\x6e\x64\x52\x61\x73\x74\
+\x65\x72\x3d\x52\x61\x73\x74\x65\x72\x20\x28\x43\x50\x55\x29\x0a\
+\x63\x61\x6e\x76\x61\x73\x42\x61\x63\x6b\x65\x6e\x64\x4f\x70\x65\
+\x6e\x47\x4c\x3d\x4f\x70\x65\x6e\x47\x4c\x0a\x63\x61\x6e\x76\x61\
+\x73\x42\x61\x63\x6b\x65\x6e\x64\x52\x65\x73\x74\x61\x72\x74\x3d\
+\x54\x68\x65\x20\x63\x61\x6e\x76\x61\x73\x20\x62\x61\x63\x6b\x65\
+\x6e\x64\x20\x63\x68\x61\x6e\x67\x65\x20\x74\x61\x6b\x65\x73\x20\
+\x65\x66\x66\x65\x63\x74\x20\x61\x66\x74\x65\x72\x20\x72\x65\x73\
+\x74\x61\x72\x74\x69\x6e\x67\x0a\
+\x00\x00\x10\x3c\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x3c\x00\x00\x00\x3c\x08\x04\x00\x00\x00\x90\xf5\x11\xf9\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0b\x13\x00\x00\x0b\x13\
+\x01\x00\x9a\x9c\x18\x00\x00\x06\xc1\x69\x54\x58\x74\x58\x4d\x4c\
+\x3a\x63\x6f\x6d\x2e\x61\x64\x6f\x62\x65\x2e\x78\x6d\x70\x00\x00\
+\x00\x00\x00\x3c\x3f\x78\x70\x61\x63\x6b\x65\x74\x20\x62\x65\x67\
+\x69\x6e\x3d\x22\xef\xbb\xbf\x22\x20\x69\x64\x3d\x22\x57\x35\x4d\
+\x30\x4d\x70\x43\x65\x68\x69\x48\x7a\x72\x65\x53\x7a\x4e\x54\x63\
+\x7a\x6b\x63\x39\x64\x22\x3f\x3e\x20\x3c\x78\x3a\x78\x6d\x70\x6d\
+\x65\x74\x61\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x3d\x22\x61\x64\x6f\
+\x62\x65\x3a\x6e\x73\x3a\x6d\x65\x74\x61\x2f\x22\x20\x78\x3a\x78\
+\x6d\x70\x74\x6b\x3d\x22\x41\x64\x6f\x62\x65\x20\x58\x4d\x50\x20\
+\x43\x6f\x72\x65\x20\x36\x2e\x30\x2d\x63\x30\x30\x32\x20\x37\x39\
+\x2e\x31\x36\x34\x34\x36\x30\x2c\x20\x32\x30\x32\x30\x2f\x30\x35\
+\x2f\x31\x32\x2d\x31\x36\x3a\x30\x34\x3a\x31\x37\x20\x20\x20\x20\
+\x20\x20\x20\x20\x22\x3e\x20\x3c\x72\x64\x66\x3a\x52\x44\x46\x20\
+\x78\x6d\x6c\x6e\x73\x3a\x72\x64\x66\x3d\x22\x68\x74\x74\x70\x3a\
+\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x31\x39\x39\
+\x39\x2f\x30\x32\x2f\x32\x32\x2d\x72\x64\x66\x2d\x73\x79\x6e\x74\
+\x61\x78\x2d\x6e\x73\x23\x22\x3e\x20\x3c\x72\x64\x66\x3a\x44\x65\
+\x73\x63\x72\x69\x70\x74\x69\x6f\x6e\x20\x72\x64\x66\x3a\x61\x62\
+\x6f\x75\x74\x3d\x22\x22\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6d\x70\
+\x3d\x22\x68\x74\x74\x70\x3a\x2f\x2f\x6e\x73\x2e\x61\x64\x6f\x62\
+\x65\x2e\x63\x6f\x6d\x2f\x78\x61\x70\x2f\x31\x2e\x30\x2f\x22\x20\
+\x78\x6d\x6c\x6e\x73\x3a\x64\x63\x3d\x22\x68\x74\x74\x70\x3a\x2f\
+\x2f\x70\x75\x72\x6c\x2e\x6f\x72\x67\x2f\x64\x63\x2f\x65\x6c\x65\
+\x6d\x65\x6e\x74\x73\x2f\x31\x2e\x31\x2f\x22\x20\x78\x6d\x6c\x6e\
+\x73\x3a\x70\x68\x6f\x74\x6f\x73\x68\x6f\x70\x3d\x22\x68\x74\x74\
+\x70\x3a\x2f\x2f\x6e\x73\x2e\x61\x64\x6f\x62\x65\x2e\x63\x6f\x6d\
+\x2f\x70\x68\x6f\x74\x6f\x73\x68\x6f\x70\x2f\x31\x2e\x30\x2f\x22\
+\x20\x78\x6d\x6c\x6e\x73\x3a\x78\x6d\x70\x4d\x4d\x3d\x22\x68\x74\
+\x74\x70\x3a\x2f\x2f\x6e\x73\x2e\x61\x64\x6f\x62\x65\x2e\x63\x6f\
+\x6d\x2f\x78\x61\x70\x2f\x31\x2e\x30\x2f\x6d\x6d\x2f\x22\x20\x78\
+\x6d\x6c\x6e\x73\x3a\x73\x74\x45\x76\x74\x3d\x22\x68\x74\x74\x70\
+\x3a\x2f\x2f\x6e\x73\x2e\x61\x64\x6f\x62\x65\x2e\x63\x6f\x6d\x2f\
+\x78\x61\x70\x2f\x31\x2e\x30\x2f\x73\x54\x79\x70\x65\x2f\x52\x65\
+\x73\x6f\x75\x72\x63\x65\x45\x76\x65\x6e\x74\x23\x22\x20\x78\x6d\
+\x70\x3a\x43\x72\x65\x61\x74\x6f\x72\x54\x6f\x6f\x6c\x3d\x22\x41\
+\x64\x6f\x62\x65\x20\x50\x68\x6f\x74\x6f\x73\x68\x6f\x70\x20\x32\
+\x31\x2e\x32\x20\x28\x4d\x61\x63\x69\x6e\x74\x6f\x73\x68\x29\x22\
+\x20\x78\x6d\x70\x3a\x43\x72\x65\x61\x74\x65\x44\x61\x74\x65\x3d\
+\x22\x32\x30\x32\x30\x2d\x30\x39\x2d\x32\x34\x54\x31\x35\x3a\x30\
+\x32\x3a\x35\x30\x2b\x30\x32\x3a\x30\x30\x22\x20\x78\x6d\x70\x3a\
+\x4d\x6f\x64\x69\x66\x79\x44\x61\x74\x65\x3d\x22\x32\x30\x32\x30\
+\x2d\x30\x39\x2d\x32\x38\x54\x31\x35\x3a\x30\x37\x3a\x35\x38\x2b\
+\x30\x32\x3a\x30\x30\x22\x20\x78\x6d\x70\x3a\x4d\x65\x74\x61\x64\
+\x61\x74\x61\x44\x61\x74\x65\x3d\x22\x32\x30\x32\x30\x2d\x30\x39\
+\x2d\x32\x38\x54\x31\x35\x3a\x30\x37\x3a\x35\x38\x2b\x30\x32\x3a\
+\x30\x30\x22\x20\x64\x63\x3a\x66\x6f\x72\x6d\x61\x74\x3d\x22\x69\
+\x6d\x61\x67\x65\x2f\x70\x6e\x67\x22\x20\x70\x68\x6f\x74\x6f\x73\
+\x68\x6f\x70\x3a\x43\x6f\x6c\x6f\x72\x4d\x6f\x64\x65\x3d\x22\x31\
+\x22\x20\x70\x68\x6f\x74\x6f\x73\x68\x6f\x70\x3a\x49\x43\x43\x50\
+\x72\x6f\x66\x69\x6c\x65\x3d\x22\x44\x6f\x74\x20\x47\x61\x69\x6e\
+\x20\x31\x35\x25\x22\x20\x78\x6d\x70\x4d\x4d\x3a\x49\x6e\x73\x74\
+\x61\x6e\x63\x65\x49\x44\x3d\x22\x78\x6d\x70\x2e\x69\x69\x64\x3a\
+\x37\x37\x62\x66\x36\x31\x61\x62\x2d\x36\x38\x39\x64\x2d\x34\x31\
+\x39\x63\x2d\x38\x38\x64\x63\x2d\x37\x66\x39\x38\x61\x39\x61\x31\
+\x62\x64\x66\x32\x22\x20\x78\x6d\x70\x4d\x4d\x3a\x44\x6f\x63\x75\
+\x6d\x65\x6e\x74\x49\x44\x3d\x22\x61\x64\x6f\x62\x65\x3a\x64\x6f\
+\x63\x69\x64\x3a\x70\x68\x6f\x74\x6f\x73\x68\x6f\x70\x3a\x37\x33\
+\x39\x32\x34\x35\x38\x35\x2d\x30\x33\x36\x62\x2d\x32\x63\x34\x66\
+\x2d\x38\x39\x37\x34\x2d\x38\x66\x36\x63\x34\x34\x66\x38\x38\x38\
+\x35\x37\x22\x20\x78\x6d\x70\x4d\x4d\x3a\x4f\x72\x69\x67\x69\x6e\
+\x61\x6c\x44\x6f\x63\x75\x6d\x65\x6e\x74\x49\x44\x3d\x22\x78\x6d\
+\x70\x2e\x64\x69\x64\x3a\x39\x33\x62\x37\x64\x31\x63\x32\x2d\x64\
+\x63\x64\x66\x2d\x34\x32\x36\x62\x2d\x62\x62\x32\x36\x2d\x66\x31\
+\x36\x36\x37\x62\x33\x63\x36\x32\x63\x35\x22\x3e\x20\x3c\x78\x6d\
+\x70\x4d\x4d\x3a\x48\x69\x73\x74\x6f\x72\x79\x3e\x20\x3c\x72\x64\
+\x66\x3a\x53\x65\x71\x3e\x20\x3c\x72\x64\x66\x3a\x6c\x69\x20\x73\
+\x74\x45\x76\x74\x3a\x61\x63\x74\x69\x6f\x6e\x3d\x22\x63\x72\x65\
+\x61\x74\x65\x64\x22\x20\x73\x74\x45\x76\x74\x3a\x69\x6e\x73\x74\
+\x61\x6e\x63\x65\x49\x44\x3d\x22\x78\x6d\x70\x2e\x69\x69\x64\x3a\
+\x39\x33\x62\x37\x64\x31\x63\x32\x2d\x64\x63\x64\x66\x2d\x34\x32\
+\x36\x62\x2d\x62\x62\x32\x36\x2d\x66\x31\x36\x36\x37\x62\x33\x63\
+\x36\x32\x63\x35\x22\x20\x73\x74\x45\x76\x74\x3a\x77\x68\x65\x6e\
+\x3d\x22\x32\x30\x32\x30\x2d\x30\x39\x2d\x32\x34\x54\x31\x35\x3a\
+\x30\x32\x3a\x35\x30\x2b\x30\x32\x3a\x30\x30\x22\x20\x73\x74\x45\
+\x76\x74\x3a\x73\x6f\x66\x74\x77\x61\x72\x65\x41\x67\x65\x6e\x74\
+\x3d\x22\x41\x64\x6f\x62\x65\x20\x50\x68\x6f\x74\x6f\x73\x68\x6f\
+\x70\x20\x32\x31\x2e\x32\x20\x28\x4d\x61\x63\x69\x6e\x74\x6f\x73\
+\x68\x29\x22\x2f\x3e\x20\x3c\x72\x64\x66\x3a\x6c\x69\x20\x73\x74\
+\x45\x76\x74\x3a\x61\x63\x74\x69\x6f\x6e\x3d\x22\x73\x61\x76\x65\
+\x64\x22\x20\x73\x74\x45\x76\x74\x3a\x69\x6e\x73\x74\x61\x6e\x63\
+\x65\x49\x44\x3d\x22\x78\x6d\x70\x2e\x69\x69\x64\x3a\x61\x38\x34\
+\x33\x30\x62\x62\x64\x2d\x34\x30\x33\x34\x2d\x34\x61\x64\x35\x2d\
+\x61\x39\x38\x64\x2d\x65\x32\x66\x66\x31\x31\x37\x33\x66\x61\x37\
+\x66\x22\x20\x73\x74\x45\x76\x74\x3a\x77\x68\x65\x6e\x3d\x22\x32\
+\x30\x32\x30\x2d\x30\x39\x2d\x32\x34\x54\x31\x36\x3a\x30\x39\x3a\
+\x34\x36\x2b\x30\x32\x3a\x30\x30\x22\x20\x73\x74\x45\x76\x74\x3a\
+\x73\x6f\x66\x74\x77\x61\x72\x65\x41\x67\x65\x6e\x74\x3d\x22\x41\
+\x64\x6f\x62\x65\x20\x50\x68\x6f\x74\x6f\x73\x68\x6f\x70\x20\x32\
+\x31\x2e\x32\x20\x28\x4d\x61\x63\x69\x6e\x74\x6f\x73\x68\x29\x22\
+\x20\x73\x74\x45\x76\x74\x3a\x63\x68\x61\x6e\x67\x65\x64\x3d\x22\
+\x2f\x22\x2f\x3e\x20\x3c\x72\x64\x66\x3a\x6c\x69\x20\x73\x74\x45\
+\x76\x74\x3a\x61\x63\x74\x69\x6f\x6e\x3d\x22\x73\x61\x76\x65\x64\
+\x22\x20\x73\x74\x45\x76\x74\x3a\x69\x6e\x73\x74\x61\x6e\x63\x65\
+\x49\x44\x3d\x22\x78\x6d\x70\x2e\x69\x69\x64\x3a\x37\x37\x62\x66\
+\x36\x31\x61\x62\x2d\x36\x38\x39\x64\x2d\x34\x31\x39\x63\x2d\x38\
+\x38\x64\x63\x2d\x37\x66\x39\x38\x61\x39\x61\x31\x62\x64\x66\x32\
+\x22\x20\x73\x74\x45\x76\x74\x3a\x77\x68\x65\x6e\x3d\x22\x32\x30\
+\x32\x30\x2d\x30\x39\x2d\x32\x38\x54\x31\x35\x3a\x30\x37\x3a\x35\
+\x38\x2b\x30\x32\x3a\x30\x30\x22\x20\x73\x74\x45\x76\x74\x3a\x73\
+\x6f\x66\x74\x77\x61\x72\x65\x41\x67\x65\x6e\x74\x3d\x22\x41\x64\
+\x6f\x62\x65\x20\x50\x68\x6f\x74\x6f\x73\x68\x6f\x70\x20\x32\x31\
+\x2e\x32\x20\x28\x4d\x61\x63\x69\x6e\x74\x6f\x73\x68\x29\x22\x20\
+\x73\x74\x45\x76\x74\x3a\x63\x68\x61\x6e\x67\x65\x64\x3d\x22\x2f\
+\x22\x2f\x3e\x20\x3c\x2f\x72\x64\x66\x3a\x53\x65\x71\x3e\x20\x3c\
+\x2f\x78\x6d\x70\x4d\x4d\x3a\x48\x69\x73\x74\x6f\x72\x79\x3e\x20\
+\x3c\x2f\x72\x64\x66\x3a\x44\x65\x73\x63\x72\x69\x70\x74\x69\x6f\
+\x6e\x3e\x20\x3c\x2f\x72\x64\x66\x3a\x52\x44\x46\x3e\x20\x3c\x2f\
+\x78\x3a\x78\x6d\x70\x6d\x65\x74\x61\x3e\x20\x3c\x3f\x78\x70\x61\
+\x63\x6b\x65\x74\x20\x65\x6e\x64\x3d\x22\x72\x22\x3f\x3e\xde\xd3\
+\xc7\xd0\x00\x00\x09\x21\x49\x44\x41\x54\x58\x85\xed\x99\x7b\x70\
+\x94\xd5\x15\xc0\x7f\xf7\x7b\xec\x33\x09\x81\x84\xf0\x48\x0c\x6f\
+\x12\x48\xb0\x08\x88\x96\xe8\x28\x22\xd3\x76\x64\x06\x18\x14\x5a\
+\x70\x28\x45\xeb\xf8\x6a\xc5\x32\x6d\xc7\xe9\x58\xcb\x74\x1c\x1f\
+\x9d\xea\x54\xa9\x3a\xad\xb5\x50\x28\xad\x8a\x95\x3f\xa8\x4a\x88\
+\x65\x52\x83\x80\x44\x88\x10\x79\xc5\x10\x42\x12\x12\xf2\x4e\x76\
+\xb3\xd9\xdd\xef\x71\xfb\xc7\x3e\xb2\xbb\xd9\x88\x3a\xce\x38\xd3\
+\xe1\xdc\x7f\xee\x7e\xf7\x7e\xe7\x77\xce\xbd\xf7\x9c\x7b\xef\xb7\
+\x42\xf2\xcd\x88\xf2\x0d\x71\xaf\x82\xaf\x82\xaf\x82\xff\x0f\xc0\
+\xda\x50\x75\x3c\xd5\xe4\x8b\x1a\xf9\xa6\x50\x9d\xab\x9d\x32\x7c\
+\x3a\xb8\x44\xe6\x62\xe0\x4f\xb2\x4e\x60\x61\xa1\xe1\xc6\x24\x44\
+\xf6\x88\x96\xf7\xe0\xc0\x0b\x58\xa4\xe6\xc6\x08\x32\xe1\x3d\x95\
+\x02\x71\x4a\x56\xe1\x70\xef\xfc\xdb\xea\x77\xb6\x6e\x9c\x26\x72\
+\x52\x7a\x7c\x19\x11\xc3\x80\xe9\xf0\x00\xf4\xb1\x49\x8e\xe3\xc4\
+\xe2\x8f\x1f\xb9\xb0\x1c\x2e\x8f\xed\x9f\x57\xd2\x70\xcf\x2b\x13\
+\x3b\x95\x14\x15\x57\xc8\xee\xa2\x59\x9e\x65\x3e\x0e\x9c\x9f\x4b\
+\x4f\x00\x0f\x8c\xfb\x43\xce\xe3\x8d\xf3\xdd\x15\xd3\x91\x88\x9e\
+\x19\xaf\xcf\x70\xd1\x99\xb3\xf6\xcf\xa5\xa7\x12\xdf\x16\x80\x9d\
+\xa4\x62\x90\x9e\xe8\xb0\x08\xa0\x4d\xd6\x72\x7c\xdc\xc1\xc9\x37\
+\x9f\xbb\xbe\x27\x43\x8e\x8c\x56\x7f\x13\xaf\x6e\x99\xaf\xfe\x7c\
+\x43\x70\xc5\x5e\x77\x79\xed\x9c\xd0\x04\x5b\x03\xd3\x3c\xb2\x90\
+\xd6\xdb\xab\xdc\x38\x50\xd1\xd0\xd0\x70\x20\x31\x50\xd0\xb1\xb1\
+\x70\x21\x68\xa6\x92\x16\x1a\x69\xa4\x89\x8b\xfc\x55\x6f\x29\x0c\
+\xac\x7e\xfe\x7e\xdf\xc0\x35\x4d\xf9\x41\xa1\x0e\x47\x2a\xa9\x1e\
+\xa3\x5b\x65\x8f\x95\xfd\x37\xeb\xde\x6d\x0b\xd6\xfe\x6a\x4b\xf5\
+\x7d\xc0\x7b\x9b\xb6\xae\x3a\xdc\xc1\x64\x21\xa4\x88\x7b\x2c\x52\
+\x35\xa1\xa2\xc6\x3d\x1e\x7b\x7b\xc5\x83\x8d\x37\x92\xb1\xaf\x58\
+\x8c\x32\x5f\x2a\xb1\x72\x84\x26\x64\x1a\xaf\x13\x3d\x9e\xc6\x3a\
+\x7f\x5e\x7d\x51\x5f\x7e\xf1\x3b\x3f\x38\x32\xe3\x82\x52\xb3\xec\
+\xd5\x25\x95\x9d\xa1\xba\x69\x45\x3d\x10\xc6\xc4\xc4\x24\x4c\x18\
+\x99\xe4\x71\x10\x1f\x59\x78\xf0\x90\x89\x57\x79\x7b\xd5\xc1\xbb\
+\x43\xa3\xd1\x8c\xac\xa6\xf1\xca\xb9\xb2\x0b\x2e\x81\x30\xa5\xc5\
+\x50\xd1\x87\x79\x2c\x09\x41\xff\xac\xbf\xcf\x6a\x53\x1e\x7e\xe1\
+\xa6\x3f\x4e\xca\x28\xf0\xbf\x3b\xaf\xf2\x8e\x12\x6b\xf9\xb3\xd2\
+\x0c\x03\x82\x4c\x82\x84\x49\x1e\xbf\x7a\xde\x20\x1b\x01\xa8\x63\
+\xb8\x6b\x4c\x47\xf1\x7b\x67\x56\x03\x35\xfe\x03\xcd\xe1\x0c\x15\
+\xdb\x90\xc9\x6b\xc2\x1d\xa3\xc5\x0a\x4b\x68\x8b\xff\xd8\xb6\x7e\
+\xc6\x71\xb6\x16\xe7\x55\x22\xd7\x7e\xd0\xee\xee\xa3\x83\x4e\xda\
+\x39\x45\x03\x5d\x74\xd0\x43\x10\x3f\x5d\x58\x48\xb6\xc7\x54\xc1\
+\x5c\xba\x9e\xf9\xfe\xc3\x6b\xdc\x9f\xe6\x5e\xd4\xbf\xe7\xe6\x01\
+\x47\xd0\x13\x50\xfa\xe8\x4f\x2a\x11\xc0\x48\x51\x7a\xa7\x5c\xe3\
+\x77\x95\xff\xd2\x7f\x2d\xb4\x2b\xaa\xd0\x50\xf0\x62\x72\x27\xaf\
+\x91\x9d\xd2\x75\x15\xff\x8a\x55\x4d\xac\xa7\xb6\xee\x5c\xbd\x74\
+\xcb\x8e\x6f\x17\xbf\x1b\xbc\x8d\x1f\x9b\xaa\x61\x5b\xd1\x49\x8a\
+\x95\x88\x8c\x04\xf6\xb6\x4f\x69\x33\xa6\xec\x1d\xd5\x01\x7e\x55\
+\x57\x9c\x64\xe2\xc4\xcb\x79\xda\x51\x10\xb8\x14\xa7\x88\xcd\x92\
+\x97\xc5\xec\xe6\xba\xa8\xbe\xde\x9c\xde\x79\x86\x3e\xbb\xc5\x7d\
+\xa7\x7c\xba\xf3\x0e\xa7\xed\xc2\x91\x52\x86\x83\x93\xd6\xde\x99\
+\xec\xe3\xa3\xef\x78\x2b\xff\x22\xa0\x65\xaa\x2a\x3a\x82\x2c\x46\
+\xe3\x01\x34\xda\xec\x56\x19\x56\x9c\x2e\x45\x40\x18\x9d\x55\xe4\
+\x0d\xe9\x9b\x58\xbf\xb4\xdc\xdd\xb3\x86\xeb\x2f\x8d\xaf\x97\xf5\
+\xc4\xca\x79\x3e\xe3\x2c\x67\xa3\xfa\x13\x17\x57\x92\xf7\x8d\xf9\
+\xc7\xe6\x3d\x54\x91\xdb\x86\x1d\xd2\xbb\x9c\xd9\x42\x95\x83\x5c\
+\xc0\xc0\xc0\x4f\xab\xbe\x2f\xcf\x9c\x58\x6a\x5e\xd7\xe4\x35\xb0\
+\x84\x08\x4b\x27\xd7\x90\x43\x57\xc4\x78\x47\x4f\xc9\xde\x9c\xee\
+\x4c\xe8\xf7\xd7\x48\x19\x1f\x5c\x89\x86\x03\x98\x37\x0c\xe6\x4e\
+\x0a\xd1\x49\xad\x8b\x14\x67\xf6\x61\x7c\xad\xee\xd7\xb2\xba\x1c\
+\x88\x8f\x29\xa3\x9b\x0e\xca\xd9\x9d\xf9\xbb\x7b\x9f\x78\x73\xcb\
+\xe6\x43\xc6\xa0\x8d\xa2\xa8\x16\x16\xcf\xb3\x09\x64\x24\xa9\x29\
+\x86\xc3\x25\x46\x83\x6e\x65\x9b\xa3\x88\x15\x0f\x93\x58\xcc\xcd\
+\x69\xbc\xd4\x92\xc0\xb9\xfd\x65\x27\xd5\xa2\x8a\x82\x33\x3d\x9e\
+\x33\xde\xa0\x8e\x0c\xd1\x83\xed\x94\x6a\x21\x65\x81\xbe\x81\x81\
+\xec\xa3\xab\x1e\xdf\xb9\xf2\x96\xfd\x4e\xd5\xd2\x55\xa1\x64\x30\
+\x66\x68\x81\xd8\xa5\x03\x5e\xc0\x2b\x4b\xcc\xd9\xc4\xca\x1c\x0a\
+\x71\xc4\x23\x20\x79\xc7\x8b\x88\x4d\x27\x06\x9a\x2f\xbf\x42\x4c\
+\x3e\x37\xeb\xd3\xd0\xa8\xa6\x82\x80\x46\x44\xf1\xdc\xda\x92\x72\
+\x4f\x56\xf8\xc5\x3d\xdf\xaa\x30\xd5\x93\x93\x3f\x51\xc3\x21\x64\
+\x00\x53\x45\x09\xc4\x15\x79\xec\xa2\x80\xc7\x04\xdd\x1e\x2b\xf3\
+\x18\xcb\x58\x72\xc9\x61\x3c\x59\x18\xf1\x81\x4f\x9c\xe3\x98\x18\
+\x34\x92\x47\xbe\x5f\xfc\xc7\x7b\x9b\xaf\xb4\x75\x7f\xc6\x85\xeb\
+\xed\xe3\x5d\xbd\x35\x0a\x5e\xf2\x4f\x15\x3e\xb5\xa0\xeb\xf2\x4f\
+\xcb\xbb\x77\x6e\xbb\x6c\x1c\x7a\xe0\x48\x91\xa7\x5e\x6b\xeb\x2b\
+\xd5\x9d\xf6\x50\x9a\xd0\xc8\x12\x2a\x20\x09\x63\x63\x00\xa0\x62\
+\x27\xad\xde\x74\xe1\x24\x31\xf8\x0c\x5f\xd0\x73\x6c\x52\x21\xb3\
+\x83\xd0\x7a\x6b\xf6\xe8\x7f\x72\x7f\x06\x73\x38\xc3\xdc\x81\x97\
+\x5f\xd8\x5e\xbc\x66\xe2\xfe\xca\xcd\xcf\x96\x6f\xf0\x37\x2c\x7a\
+\x65\xc1\x01\x69\x46\x96\x95\x88\x24\x35\x29\x6c\xb7\x54\x13\x15\
+\x0a\xb2\x70\x24\xed\x6a\xe9\xc0\x02\x85\x3a\xea\xc9\xb5\xbf\x53\
+\xae\xd6\xf4\x41\xa0\xc4\x95\x69\x13\x36\xd0\x58\xc5\x4d\xd2\x61\
+\xe6\x04\x9f\x78\x72\xcf\xb6\xbb\xae\xb5\x1f\xdd\xbc\xf9\xb9\xfd\
+\x2b\xd4\xa1\x50\x54\x00\x7c\xda\xb1\x5c\xbf\x4e\x42\x80\x0e\xcf\
+\x54\xe9\x86\x1a\x34\x4e\xe0\x60\x1e\xcb\x9a\x5e\xe9\x38\xc2\x19\
+\xbb\xa8\xca\xd9\x08\x39\xcc\x64\x35\x53\x00\x98\x5e\x3b\xfd\x1f\
+\x9d\x13\xaa\x77\x6c\x34\x66\x4f\xac\x73\xa5\x80\x0d\xd1\xed\x34\
+\x12\x16\xaa\x40\x1b\xb6\x2d\x8f\xe4\x71\x2d\xa7\x81\x39\x7d\x73\
+\x06\x8f\xf1\x3a\xe2\xb5\x31\x95\x0e\x4a\x59\xce\xcc\xa1\x37\x06\
+\x1c\x15\x99\x5a\x3e\xb8\x7c\x12\x62\x43\x2d\x00\x5c\xb2\xd0\x74\
+\x25\x79\xab\x23\xd0\x71\x24\x6c\xaa\xe9\x3c\x16\x28\x34\x33\x1e\
+\x70\x1d\x58\xcc\x51\xd7\xe1\xa0\x3c\x98\x1f\x2a\x64\x3e\xdf\x4d\
+\xec\xaf\x99\x5e\x4b\x0d\xa5\x33\xde\xcd\x74\xcd\x2d\x48\x88\x4e\
+\x09\x18\x84\x51\xe2\x27\x92\xf4\xb9\x5a\x20\xb9\xc4\x25\xe4\xc5\
+\x7b\xbc\xb7\x2f\x3c\xcd\xe9\x82\xda\xdc\xeb\x58\x3f\xcc\x4c\x19\
+\xd5\x91\x72\x36\x10\x52\x89\xe4\x04\x01\x36\x2a\x1a\x02\x21\x9e\
+\xe1\x17\xf4\xd3\xc6\x70\x70\xe2\x34\x38\x68\xe2\x24\x96\x31\x7e\
+\x76\xc9\x5d\x8d\x9e\xa7\x6f\xaa\x9a\x3e\x95\x99\xc3\x0c\x8c\x44\
+\x48\x04\x2c\xa3\x26\x03\x61\xb5\x4b\x9a\x80\xb4\xc0\xc3\x18\xb2\
+\x70\x80\xac\x5e\x74\x74\xe9\x00\xdd\x69\xc0\x89\x99\xcb\x41\x3b\
+\xd5\x48\xf0\x15\xda\xde\x75\x3b\xf4\x71\xbe\xe8\xf6\x43\x33\xe7\
+\xe3\x86\xda\x29\x5a\xa2\x4f\x82\x4a\x8b\x19\x02\x6c\x53\xc1\xc9\
+\x29\x0e\x70\x59\xdb\x3b\xbf\xfd\xb1\x9c\xf5\x4a\x3c\xbf\x8d\x94\
+\xab\x75\x02\x9c\xc4\x82\x7f\xcf\xfd\xd3\xd2\x1f\x39\xdf\x7f\xf8\
+\xf0\xd2\x68\x4b\x15\xef\xa6\x8c\x90\x48\x00\x87\x00\x4c\xbb\xdb\
+\x34\x25\x60\x81\xc9\x6f\xb5\xf5\xae\x7d\xf3\x36\x6c\xab\x5e\xa6\
+\xbb\x33\x64\x51\xdc\xcb\x21\x51\x93\xc0\x50\x47\x00\x17\xa5\x75\
+\x3f\xdb\xa0\x36\x2e\x60\x34\x91\x4c\x70\x84\x0e\x1e\x4a\xf2\x58\
+\xa0\xc6\x33\xa1\x0d\x20\xa5\x61\xda\x80\x37\xe0\x65\x17\x9f\xfc\
+\xa4\x65\xe3\xaf\x3d\x5d\x53\x61\xa0\xdb\x85\x50\x22\x7d\x92\x97\
+\x4b\x76\xbc\x26\x80\x2e\x4e\xb1\x10\x57\x78\xd1\x39\x0f\x53\xa3\
+\x8b\xe5\x20\x07\x99\x18\xef\x25\xa3\x06\x6b\x71\x30\x00\x5e\x73\
+\x56\xc0\x6b\xc2\xa7\xb3\x1e\xdc\xf4\x61\x41\xc3\x4a\x39\xf5\x12\
+\x94\xdf\x70\xf8\xbe\xf7\x75\x1d\x6b\xb8\xc7\x67\x79\x9b\x32\xc6\
+\xa3\x47\x3d\x1f\xe4\x10\x33\xc9\x43\x65\x7e\xb4\x47\x88\xed\x9c\
+\xa6\x38\x05\xac\x24\x9c\xfe\x24\x80\x5b\x4e\x31\x5c\x36\x34\xce\
+\x7e\xf9\x49\x3c\x40\x3f\x95\xb7\xbc\xbc\xa9\x62\x99\xe1\x77\xa4\
+\x0b\xa7\x0f\xb9\x9f\xbf\xd0\x46\x10\x89\x00\x02\x7c\x4c\x6f\x42\
+\xbb\xcd\x79\x2a\xf1\xe3\x8a\x43\x86\x66\x39\xf6\x24\x04\x60\x8b\
+\x90\x66\x0b\x40\xc3\xc3\xa0\xbb\x77\xcc\x9e\xd2\xf5\xbb\x4e\xac\
+\x70\x9b\x58\xe1\xd8\x19\x3b\x79\xa8\xbb\x78\x8e\x2a\xee\x66\x0e\
+\x4e\x60\x90\x1a\x7c\x09\xad\x1d\xec\xa6\x03\xa2\x07\xe3\x21\x19\
+\xf2\xd8\xa4\x0f\x89\x90\x0a\xb1\x0b\xd7\x00\xaf\x6e\xdc\xfd\x68\
+\x5d\xd0\x3f\xca\x27\x93\xce\xf5\xc9\x60\x49\x37\xe5\x5c\x62\x26\
+\xe7\x00\x8b\x86\x78\xbc\x03\x34\xb1\x9d\x7e\x94\x38\x38\x7a\x2a\
+\x8e\xed\x49\x40\x2b\x4f\xf0\x22\xf9\x4a\x37\xfa\x40\x3e\x83\xde\
+\x5d\x6b\x3f\x9c\x71\x68\xc5\xe9\x69\x40\x20\xe5\xc6\x35\x3c\x65\
+\xda\x9c\xe0\x44\xb4\x1e\xa6\x0e\x23\x0a\xea\xa5\x92\x7a\x40\x4b\
+\x9d\xd1\x18\x38\x08\x3e\xde\x66\x9d\x63\x41\xee\x71\x53\x9f\xf6\
+\xc9\xe4\x96\xdb\x9e\x5e\xd7\x30\x15\xb0\xf0\x0d\x03\xa5\xdf\x9d\
+\x86\xe4\x28\x27\x99\x8b\x02\x1c\x65\x4f\x12\x6e\x48\x44\x64\x60\
+\x73\x19\x4b\x27\x72\x6f\xc6\xb1\x82\x6a\x6f\x68\xf5\x8b\x8b\xea\
+\x4a\x1b\x2c\x7a\xf0\xa4\x85\x5c\x09\xbc\x8f\x49\xe4\x33\x0e\x38\
+\xca\x47\x29\x6d\xb1\x38\x56\x10\x08\x93\x1f\x32\x99\x95\x84\xdf\
+\x08\x67\x79\xc4\xc2\xee\x6b\x7b\xbd\x41\x30\x47\xbc\x20\x5f\x09\
+\xdc\xc5\x0e\x4e\xb1\x88\x02\x0e\x12\x1e\xd6\x1a\xd1\xea\xc0\x25\
+\x85\xc4\xcb\x04\xc2\x10\x70\x07\xba\xf5\x72\xb5\xac\x3b\xd3\xfe\
+\xbc\x4b\xfc\x95\xc0\xd0\x4c\x33\x07\x99\xc0\xe5\x38\x4c\xc6\x6b\
+\x08\x07\x0c\x04\x43\xbd\xaa\xa5\x62\x93\xcd\x03\xbc\x45\x10\x9f\
+\x51\xad\xcc\xb2\xf3\x3f\xf7\xd3\xc1\x95\xc1\x00\x9d\x74\xc6\xeb\
+\x43\xc1\xa3\x60\x1b\x03\x4e\xa3\xf0\xd0\xd8\x0e\x1d\x05\x83\x29\
+\xbc\x44\x2d\x1f\xa0\x92\x11\x4a\x73\x23\xff\x0a\xe0\x44\x71\xc6\
+\x13\x88\x6e\x1b\xc1\x9a\x1b\xdf\x7a\xe4\xf5\x5b\x34\x87\x65\x46\
+\xfd\x33\xbe\xa0\x9a\x2f\x0f\x0e\xc7\xf2\x72\x47\x8b\xd2\xfe\xf8\
+\xb3\x37\x9c\xbb\x21\x98\xa3\x9b\xe9\x2e\xfd\x5f\x33\xd8\xe0\x00\
+\xbf\x67\xc6\x8c\x96\x95\x7b\x56\x84\x8a\xaa\x3c\x68\x08\xeb\x4b\
+\x6b\xf9\x0a\x60\xc9\x47\x7c\xc4\xd4\x5b\xbb\x97\xf7\x7a\x95\x31\
+\x04\xec\x01\x46\xd9\x57\x7e\x2d\x55\xbe\xea\x27\xc5\x06\x6f\xdf\
+\x2e\x96\xc8\x56\xdb\x93\xe6\x63\xcc\x17\x11\x71\xf5\xcf\x90\xab\
+\xe0\xab\xe0\xaf\x4b\xfe\x07\xe9\xdb\xa9\x5a\x8c\x10\x50\x76\x00\
+\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x00\xda\
+\x3c\
+\x73\x76\x67\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\x3a\
+\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\
+\x30\x2f\x73\x76\x67\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\
+\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x32\x34\x22\x20\x76\x69\
+\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\x30\x20\x32\x34\x20\x32\x34\
+\x22\x20\x66\x69\x6c\x6c\x3d\x22\x6e\x6f\x6e\x65\x22\x20\x73\x74\
+\x72\x6f\x6b\x65\x3d\x22\x23\x34\x39\x35\x30\x35\x37\x22\x20\x73\
+\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\x22\x32\x22\x20\
+\x73\x74\x72\x6f\x6b\x65\x2d\x6c\x69\x6e\x65\x63\x61\x70\x3d\x22\
+\x72\x6f\x75\x6e\x64\x22\x20\x73\x74\x72\x6f\x6b\x65\x2d\x6c\x69\
+\x6e\x65\x6a\x6f\x69\x6e\x3d\x22\x72\x6f\x75\x6e\x64\x22\x3e\x3c\
+\x70\x6f\x6c\x79\x6c\x69\x6e\x65\x20\x70\x6f\x69\x6e\x74\x73\x3d\
+\x22\x36\x20\x39\x20\x31\x32\x20\x31\x35\x20\x31\x38\x20\x39\x22\
+\x2f\x3e\x3c\x2f\x73\x76\x67\x3e\x0a\
+\x00\x00\x00\xf1\
+\x3c\
+\x73\x76\x67\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\x3a\
+\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\
+\x30\x2f\x73\x76\x67\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\
+\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x32\x34\x22\x20\x76\x69\
+\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\x30\x20\x32\x34\x20\x32\x34\
+\x22\x20\x66\x69\x6c\x6c\x3d\x22\x6e\x6f\x6e\x65\x22\x20\x73\x74\
+\x72\x6f\x6b\x65\x3d\x22\x23\x34\x39\x35\x30\x35\x37\x22\x20\x73\
+\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\x22\x32\x22\x20\
+\x73\x74\x72\x6f\x6b\x65\x2d\x6c\x69\x6e\x65\x63\x61\x70\x3d\x22\
+\x72\x6f\x75\x6e\x64\x22\x20\x73\x74\x72\x6f\x6b\x65\x2d\x6c\x69\
+\x6e\x65\x6a\x6f\x69\x6e\x3d\x22\x72\x6f\x75\x6e\x64\x22\x3e\x3c\
+\x70\x61\x74\x68\x20\x64\x3d\x22\x4d\x32\x31\x20\x31\x32\x2e\x37\
+\x39\x41\x39\x20\x39\x20\x30\x20\x31\x20\x31\x20\x31\x31\x2e\x32\
+\x31\x20\x33\x20\x37\x20\x37\x20\x30\x20\x30\x20\x30\x20\x32\x31\
+\x20\x31\x32\x2e\x37\x39\x7a\x22\x2f\x3e\x3c\x2f\x73\x76\x67\x3e\
+\
+\x00\x00\x01\x4e\
+\x3c\
+\x73\x76\x67\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\x3a\
+\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\
+\x30\x2f\x73\x76\x67\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\
+\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x32\x34\x22\x20\x76\x69\
+\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\x30\x20\x32\x34\x20\x32\x34\
+\x22\x20\x66\x69\x6c\x6c\x3d\x22\x6e\x6f\x6e\x65\x22\x20\x73\x74\
+\x72\x6f\x6b\x65\x3d\x22\x23\x34\x39\x35\x30\x35\x37\x22\x20\x73\
+\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\x22\x32\x22\x20\
+\x73\x74\x72\x6f\x6b\x65\x2d\x6c\x69\x6e\x65\x63\x61\x70\x3d\x22\
+\x72\x6f\x75\x6e\x64\x22\x20\x73\x74\x72\x6f\x6b\x65\x2d\x6c\x69\
+\x6e\x65\x6a\x6f\x69\x6e\x3d\x22\x72\x6f\x75\x6e\x64\x22\x3e\x3c\
+\x70\x6f\x6c\x79\x6c\x69\x6e\x65\x20\x70\x6f\x69\x6e\x74\x73\x3d\
+\x22\x32\x33\x20\x34\x20\x32\x33\x20\x31\x30\x20\x31\x37\x20\x31\
+\x30\x22\x2f\x3e\x3c\x70\x6f\x6c\x79\x6c\x69\x6e\x65\x20\x70\x6f\
+\x69\x6e\x74\x73\x3d\x22\x31\x20\x32\x30\x20\x31\x20\x31\x34\x20\
+\x37\x20\x31\x34\x22\x2f\x3e\x3c\x70\x61\x74\x68\x20\x64\x3d\x22\
+\x4d\x33\x2e\x35\x31\x20\x39\x61\x39\x20\x39\x20\x30\x20\x30\x20\
+\x31\x20\x31\x34\x2e\x38\x35\x2d\x33\x2e\x33\x36\x4c\x32\x33\x20\
+\x31\x30\x4d\x31\x20\x31\x34\x6c\x34\x2e\x36\x34\x20\x34\x2e\x33\
+\x36\x41\x39\x20\x39\x20\x30\x20\x30\x20\x30\x20\x32\x30\x2e\x34\
+\x39\x20\x31\x35\x22\x2f\x3e\x3c\x2f\x73\x76\x67\x3e\
+\x00\x00\x03\xbf\
+\x3c\
+\x73\x76\x67\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\x3a\
+\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\
+\x30\x2f\x73\x76\x67\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\
+\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x32\x34\x22\x20\x76\x69\
+\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\x30\x20\x32\x34\x20\x32\x34\
+\x22\x20\x66\x69\x6c\x6c\x3d\x22\x6e\x6f\x6e\x65\x22\x20\x73\x74\
+\x72\x6f\x6b\x65\x3d\x22\x23\x34\x39\x35\x30\x35\x37\x22\x20\x73\
+\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\x22\x32\x22\x20\
+\x73\x74\x72\x6f\x6b\x65\x2d\x6c\x69\x6e\x65\x63\x61\x70\x3d\x22\
+\x72\x6f\x75\x6e\x64\x22\x20\x73\x74\x72\x6f\x6b\x65\x2d\x6c\x69\
+\x6e\x65\x6a\x6f\x69\x6e\x3d\x22\x72\x6f\x75\x6e\x64\x22\x3e\x3c\
+\x63\x69\x72\x63\x6c\x65\x20\x63\x78\x3d\x22\x31\x32\x22\x20\x63\
+\x79\x3d\x22\x31\x32\x22\x20\x72\x3d\x22\x33\x22\x2f\x3e\x3c\x70\
+\x61\x74\x68\x20\x64\x3d\x22\x4d\x31\x39\x2e\x34\x20\x31\x35\x61\
+\x31\x2e\x36\x35\x20\x31\x2e\x36\x35\x20\x30\x20\x30\x20\x30\x20\
+\x2e\x33\x33\x20\x31\x2e\x38\x32\x6c\x2e\x30\x36\x2e\x30\x36\x61\
+\x32\x20\x32\x20\x30\x20\x30\x20\x31\x20\x30\x20\x32\x2e\x38\x33\
+\x20\x32\x20\x32\x20\x30\x20\x30\x20\x31\x2d\x32\x2e\x38\x33\x20\
+\x30\x6c\x2d\x2e\x30\x36\x2d\x2e\x30\x36\x61\x31\x2e\x36\x35\x20\
+\x31\x2e\x36\x35\x20\x30\x20\x30\x20\x30\x2d\x31\x2e\x38\x32\x2d\
+\x2e\x33\x33\x20\x31\x2e\x36\x35\x20\x31\x2e\x36\x35\x20\x30\x20\
+\x30\x20\x30\x2d\x31\x20\x31\x2e\x35\x31\x56\x32\x31\x61\x32\x20\
+\x32\x20\x30\x20\x30\x20\x31\x2d\x32\x20\x32\x20\x32\x20\x32\x20\
+\x30\x20\x30\x20\x31\x2d\x32\x2d\x32\x76\x2d\x2e\x30\x39\x41\x31\
+\x2e\x36\x35\x20\x31\x2e\x36\x35\x20\x30\x20\x30\x20\x30\x20\x39\
+\x20\x31\x39\x2e\x34\x61\x31\x2e\x36\x35\x20\x31\x2e\x36\x35\x20\
+\x30\x20\x30\x20\x30\x2d\x31\x2e\x38\x32\x2e\x33\x33\x6c\x2d\x2e\
+\x30\x36\x2e\x30\x36\x61\x32\x20\x32\x20\x30\x20\x30\x20\x31\x2d\
+\x32\x2e\x38\x33\x20\x30\x20\x32\x20\x32\x20\x30\x20\x30\x20\x31\
+\x20\x30\x2d\x32\x2e\x38\x33\x6c\x2e\x30\x36\x2d\x2e\x30\x36\x61\
+\x31\x2e\x36\x35\x20\x31\x2e\x36\x35\x20\x30\x20\x30\x20\x30\x20\
+\x2e\x33\x33\x2d\x31\x2e\x38\x32\x20\x31\x2e\x36\x35\x20\x31\x2e\
+\x36\x35\x20\x30\x20\x30\x20\x30\x2d\x31\x2e\x35\x31\x2d\x31\x48\
+\x33\x61\x32\x20\x32\x20\x30\x20\x30\x20\x31\x2d\x32\x2d\x32\x20\
+\x32\x20\x32\x20\x30\x20\x30\x20\x31\x20\x32\x2d\x32\x68\x2e\x30\
+\x39\x41\x31\x2e\x36\x35\x20\x31\x2e\x36\x35\x20\x30\x20\x30\x20\
+\x30\x20\x34\x2e\x36\x20\x39\x61\x31\x2e\x36\x35\x20\x31\x2e\x36\
+\x35\x20\x30\x20\x30\x20\x30\x2d\x2e\x33\x33\x2d\x31\x2e\x38\x32\
+\x6c\x2d\x2e\x30\x36\x2d\x2e\x30\x36\x61\x32\x20\x32\x20\x30\x20\
+\x30\x20\x31\x20\x30\x2d\x32\x2e\x38\x33\x20\x32\x20\x32\x20\x30\
+\x20\x30\x20\x31\x20\x32\x2e\x38\x33\x20\x30\x6c\x2e\x30\x36\x2e\
+\x30\x36\x61\x31\x2e\x36\x35\x20\x31\x2e\x36\x35\x20\x30\x20\x30\
+\x20\x30\x20\x31\x2e\x38\x32\x2e\x33\x33\x48\x39\x61\x31\x2e\x36\
+\x35\x20\x31\x2e\x36\x35\x20\x30\x20\x30\x20\x30\x20\x31\x2d\x31\
+\x2e\x35\x31\x56\x33\x61\x32\x20\x32\x20\x30\x20\x30\x20\x31\x20\
+\x32\x2d\x32\x20\x32\x20\x32\x20\x30\x20\x30\x20\x31\x20\x32\x20\
+\x32\x76\x2e\x30\x39\x61\x31\x2e\x36\x35\x20\x31\x2e\x36\x35\x20\
+\x30\x20\x30\x20\x30\x20\x31\x20\x31\x2e\x35\x31\x20\x31\x2e\x36\
+\x35\x20\x31\x2e\x36\x35\x20\x30\x20\x30\x20\x30\x20\x31\x2e\x38\
+\x32\x2d\x2e\x33\x33\x6c\x2e\x30\x36\x2d\x2e\x30\x36\x61\x32\x20\
+\x32\x20\x30\x20\x30\x20\x31\x20\x32\x2e\x38\x33\x20\x30\x20\x32\
+\x20\x32\x20\x30\x20\x30\x20\x31\x20\x30\x20\x32\x2e\x38\x33\x6c\
+\x2d\x2e\x30\x36\x2e\x30\x36\x61\x31\x2e\x36\x35\x20\x31\x2e\x36\
+\x35\x20\x30\x20\x30\x20\x30\x2d\x2e\x33\x33\x20\x31\x2e\x38\x32\
+\x56\x39\x61\x31\x2e\x36\x35\x20\x31\x2e\x36\x35\x20\x30\x20\x30\
+\x20\x30\x20\x31\x2e\x35\x31\x20\x31\x48\x32\x31\x61\x32\x20\x32\
+\x20\x30\x20\x30\x20\x31\x20\x32\x20\x32\x20\x32\x20\x32\x20\x30\
+\x20\x30\x20\x31\x2d\x32\x20\x32\x68\x2d\x2e\x30\x39\x61\x31\x2e\
+\x36\x35\x20\x31\x2e\x36\x35\x20\x30\x20\x30\x20\x30\x2d\x31\x2e\
+\x35\x31\x20\x31\x7a\x22\x2f\x3e\x3c\x2f\x73\x76\x67\x3e\
+\x00\x00\x00\xdb\
+\x3c\
+\x73\x76\x67\x20\x78\x6d\x6c\x6e\x73\x3d\x22\x68\x74\x74\x70\x3a\
+\x2f\x2f\x77\x77\x77\x2e\x77\x33\x2e\x6f\x72\x67\x2f\x32\x30\x30\
+\x30\x2f\x73\x76\x67\x22\x20\x77\x69\x64\x74\x68\x3d\x22\x32\x34\
+\x22\x20\x68\x65\x69\x67\x68\x74\x3d\x22\x32\x34\x22\x20\x76\x69\
+\x65\x77\x42\x6f\x78\x3d\x22\x30\x20\x30\x20\x32\x34\x20\x32\x34\
+\x22\x20\x66\x69\x6c\x6c\x3d\x22\x6e\x6f\x6e\x65\x22\x20\x73\x74\
+\x72\x6f\x6b\x65\x3d\x22\x23\x34\x39\x35\x30\x35\x37\x22\x20\x73\
+\x74\x72\x6f\x6b\x65\x2d\x77\x69\x64\x74\x68\x3d\x22\x32\x22\x20\
+\x73\x74\x72\x6f\x6b\x65\x2d\x6c\x69\x6e\x65\x63\x61\x70\x3d\x22\
+\x72\x6f\x75\x6e\x64\x22\x20\x73\x74\x72\x6f\x6b\x65\x2d\x6c\x69\
+\x6e\x65\x6a\x6f\x69\x6e\x3d\x22\x72\x6f\x75\x6e\x64\x22\x3e\x3c\
+\x70\x6f\x6c\x79\x6c\x69\x6e\x65\x20\x70\x6f\x69\x6e\x74\x73\x3d\
+\x22\x31\x38\x20\x31\x35\x20\x31\x32\x20\x39\x20\x36\x20\x31\x35\
+\x22\x2f\x3e\x3c\x2f\x73\x76\x67\x3e\x0a\
+"
+
+qt_resource_name = b"\
+\x00\x03\
+\x00\x00\x68\x70\
+\x00\x61\
+\x00\x70\x00\x70\
+\x00\x03\
+\x00\x00\x74\xc7\
+\x00\x6e\
+\x00\x65\x00\x77\
+\x00\x03\
+\x00\x00\x7a\xbe\
+\x00\x73\
+\x00\x75\x00\x6e\
+\x00\x04\
+\x00\x06\xa6\x79\
+\x00\x63\
+\x00\x6f\x00\x70\x00\x79\
+\x00\x04\
+\x00\x06\xb6\x45\
+\x00\x64\
+\x00\x6f\x00\x6e\x00\x65\
+\x00\x04\
+\x00\x06\xbb\x04\
+\x00\x65\
+\x00\x64\x00\x69\x00\x74\
+\x00\x04\
+\x00\x06\xd0\x25\
+\x00\x66\
+\x00\x69\x00\x6c\x00\x65\
+\x00\x04\
+\x00\x06\xec\x30\
+\x00\x68\
+\x00\x65\x00\x6c\x00\x70\
+\x00\x04\
+\x00\x06\xef\xa5\
+\x00\x68\
+\x00\x69\x00\x64\x00\x65\
+\x00\x04\
+\x00\x07\x4c\xf4\
+\x00\x6e\
+\x00\x65\x00\x78\x00\x74\
+\x00\x04\
+\x00\x07\x66\xbe\
+\x00\x6f\
+\x00\x70\x00\x65\x00\x6e\
+\x00\x04\
+\x00\x07\x78\xc6\
+\x00\x70\
+\x00\x72\x00\x65\x00\x76\
+\x00\x04\
+\x00\x07\x8b\xaf\
+\x00\x72\
+\x00\x65\x00\x64\x00\x6f\
+\x00\x04\
+\x00\x07\x8c\x04\
+\x00\x71\
+\x00\x75\x00\x69\x00\x74\
+\x00\x04\
+\x00\x07\x98\xc5\
+\x00\x73\
+\x00\x61\x00\x76\x00\x65\
+\x00\x04\
+\x00\x07\xc4\xaf\
+\x00\x75\
+\x00\x6e\x00\x64\x00\x6f\
+\x00\x04\
+\x00\x08\x16\x5d\
+\x00\x7a\
+\x00\x6f\x00\x6f\x00\x6d\
+\x00\x05\
+\x00\x6a\x36\x95\
+\x00\x63\
+\x00\x6c\x00\x6f\x00\x73\x00\x65\
+\x00\x05\
+\x00\x6a\x63\x62\
+\x00\x63\
+\x00\x6f\x00\x6c\x00\x6f\x00\x72\
+\x00\x07\
+\x01\x66\x02\xfe\
+\x00\x7a\
+\x00\x6f\x00\x6f\x00\x6d\x00\x2d\x00\x69\x00\x6e\
+\x00\x0d\
+\x03\x22\xb9\x5e\
+\x00\x73\
+\x00\x74\x00\x72\x00\x69\x00\x6e\x00\x67\x00\x73\x00\x2d\x00\x7a\x00\x68\x00\x2d\x00\x43\x00\x4e\
+\x00\x0d\
+\x03\x22\xba\xb7\
+\x00\x73\
+\x00\x74\x00\x72\x00\x69\x00\x6e\x00\x67\x00\x73\x00\x2d\x00\x7a\x00\x68\x00\x2d\x00\x54\x00\x57\
+\x00\x0d\
+\x03\x72\x49\xd0\
+\x00\x73\
+\x00\x74\x00\x72\x00\x69\x00\x6e\x00\x67\x00\x73\x00\x2d\x00\x6a\x00\x61\x00\x2d\x00\x4a\x00\x50\
+\x00\x0a\
+\x03\x87\xc0\x73\
+\x00\x66\
+\x00\x6f\x00\x72\x00\x6d\x00\x61\x00\x74\x00\x5f\x00\x76\x00\x6f\x00\x63\
+\x00\x0a\
+\x04\xd5\xeb\x87\
+\x00\x66\
+\x00\x69\x00\x74\x00\x2d\x00\x77\x00\x69\x00\x6e\x00\x64\x00\x6f\x00\x77\
+\x00\x08\
+\x06\x60\x56\xe4\
+\x00\x7a\
+\x00\x6f\x00\x6f\x00\x6d\x00\x2d\x00\x6f\x00\x75\x00\x74\
+\x00\x0a\
+\x06\x8b\x64\x25\
+\x00\x63\
+\x00\x6f\x00\x6c\x00\x6f\x00\x72\x00\x5f\x00\x6c\x00\x69\x00\x6e\x00\x65\
+\x00\x06\
+\x06\xac\x2c\xa5\
+\x00\x64\
+\x00\x65\x00\x6c\x00\x65\x00\x74\x00\x65\
+\x00\x06\
+\x06\xcf\x6c\x94\
+\x00\x65\
+\x00\x78\x00\x70\x00\x65\x00\x72\x00\x74\
+\x00\x0d\
+\x07\x06\x0f\x3e\
+\x00\x6c\
+\x00\x69\x00\x67\x00\x68\x00\x74\x00\x5f\x00\x6c\x00\x69\x00\x67\x00\x68\x00\x74\x00\x65\x00\x6e\
+\x00\x06\
+\x07\x27\x8c\x33\
+\x00\x6c\
+\x00\x61\x00\x62\x00\x65\x00\x6c\x00\x73\
+\x00\x09\
+\x07\x4d\x21\xa8\
+\x00\x66\
+\x00\x69\x00\x74\x00\x2d\x00\x77\x00\x69\x00\x64\x00\x74\x00\x68\
+\x00\x06\
+\x07\xcc\x8f\xd9\
+\x00\x76\
+\x00\x65\x00\x72\x00\x69\x00\x66\x00\x79\
+\x00\x0b\
+\x08\x7c\x58\x4f\
+\x00\x66\
+\x00\x6f\x00\x72\x00\x6d\x00\x61\x00\x74\x00\x5f\x00\x79\x00\x6f\x00\x6c\x00\x6f\
+\x00\x07\
+\x09\x8c\x83\x63\
+\x00\x73\
+\x00\x61\x00\x76\x00\x65\x00\x2d\x00\x61\x00\x73\
+\x00\x0b\
+\x0a\x8d\x32\x24\
+\x00\x6c\
+\x00\x69\x00\x67\x00\x68\x00\x74\x00\x5f\x00\x72\x00\x65\x00\x73\x00\x65\x00\x74\
+\x00\x07\
+\x0a\xb9\x04\x03\
+\x00\x73\
+\x00\x74\x00\x72\x00\x69\x00\x6e\x00\x67\x00\x73\
+\x00\x0f\
+\x0a\xc8\x56\xdc\
+\x00\x66\
+\x00\x6f\x00\x72\x00\x6d\x00\x61\x00\x74\x00\x5f\x00\x63\x00\x72\x00\x65\x00\x61\x00\x74\x00\x65\x00\x6d\x00\x6c\
+\x00\x0c\
+\x0b\x2e\x2d\xfe\
+\x00\x63\
+\x00\x68\x00\x65\x00\x76\x00\x72\x00\x6f\x00\x6e\x00\x2d\x00\x64\x00\x6f\x00\x77\x00\x6e\
+\x00\x0c\
+\x0b\xf7\x2e\xfe\
+\x00\x6c\
+\x00\x69\x00\x67\x00\x68\x00\x74\x00\x5f\x00\x64\x00\x61\x00\x72\x00\x6b\x00\x65\x00\x6e\
+\x00\x08\
+\x0c\x9c\xab\x2c\
+\x00\x72\
+\x00\x65\x00\x73\x00\x65\x00\x74\x00\x61\x00\x6c\x00\x6c\
+\x00\x08\
+\x0c\xbb\x0b\xc3\
+\x00\x73\
+\x00\x65\x00\x74\x00\x74\x00\x69\x00\x6e\x00\x67\x00\x73\
+\x00\x0a\
+\x0d\x9b\x29\x40\
+\x00\x63\
+\x00\x68\x00\x65\x00\x76\x00\x72\x00\x6f\x00\x6e\x00\x2d\x00\x75\x00\x70\
+"
+
+qt_resource_struct_v1 = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x2b\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x00\x0c\x00\x00\x00\x00\x00\x01\x00\x00\x7a\x97\
+\x00\x00\x00\x18\x00\x00\x00\x00\x00\x01\x00\x00\x7b\xd5\
+\x00\x00\x00\x24\x00\x00\x00\x00\x00\x01\x00\x00\x7e\x0a\
+\x00\x00\x00\x32\x00\x00\x00\x00\x00\x01\x00\x00\x7f\x3f\
+\x00\x00\x00\x40\x00\x00\x00\x00\x00\x01\x00\x00\x80\x1c\
+\x00\x00\x00\x4e\x00\x00\x00\x00\x00\x01\x00\x00\x81\x2d\
+\x00\x00\x00\x5c\x00\x00\x00\x00\x00\x01\x00\x00\x82\x50\
+\x00\x00\x00\x6a\x00\x00\x00\x00\x00\x01\x00\x00\x83\x84\
+\x00\x00\x00\x78\x00\x00\x00\x00\x00\x01\x00\x00\x85\x23\
+\x00\x00\x00\x86\x00\x00\x00\x00\x00\x01\x00\x00\x86\x00\
+\x00\x00\x00\x94\x00\x00\x00\x00\x00\x01\x00\x00\x87\x11\
+\x00\x00\x00\xa2\x00\x00\x00\x00\x00\x01\x00\x00\x87\xef\
+\x00\x00\x00\xb0\x00\x00\x00\x00\x00\x01\x00\x00\x88\xfe\
+\x00\x00\x00\xbe\x00\x00\x00\x00\x00\x01\x00\x00\x8a\x36\
+\x00\x00\x00\xcc\x00\x00\x00\x00\x00\x01\x00\x00\x8b\x86\
+\x00\x00\x00\xda\x00\x00\x00\x00\x00\x01\x00\x00\x8c\x8f\
+\x00\x00\x00\xe8\x00\x00\x00\x00\x00\x01\x00\x00\x8d\x95\
+\x00\x00\x00\xf8\x00\x00\x00\x00\x00\x01\x00\x00\x8e\x99\
+\x00\x00\x01\x08\x00\x00\x00\x00\x00\x01\x00\x00\x8f\x84\
+\x00\x00\x01\x1c\x00\x00\x00\x00\x00\x01\x00\x00\x90\xd6\
+\x00\x00\x01\x3c\x00\x00\x00\x00\x00\x01\x00\x00\x9c\x82\
+\x00\x00\x01\x5c\x00\x00\x00\x00\x00\x01\x00\x00\xa7\x27\
+\x00\x00\x01\x7c\x00\x00\x00\x00\x00\x01\x00\x00\xb3\x7b\
+\x00\x00\x01\x96\x00\x00\x00\x00\x00\x01\x00\x00\xb6\x91\
+\x00\x00\x01\xb0\x00\x00\x00\x00\x00\x01\x00\x00\xb7\xdd\
+\x00\x00\x01\xc6\x00\x00\x00\x00\x00\x01\x00\x00\xb9\x09\
+\x00\x00\x01\xe0\x00\x00\x00\x00\x00\x01\x00\x00\xba\x06\
+\x00\x00\x01\xf2\x00\x00\x00\x00\x00\x01\x00\x00\xbb\x89\
+\x00\x00\x02\x04\x00\x00\x00\x00\x00\x01\x00\x00\xbd\x95\
+\x00\x00\x02\x24\x00\x00\x00\x00\x00\x01\x00\x00\xbf\xca\
+\x00\x00\x02\x36\x00\x00\x00\x00\x00\x01\x00\x00\xc1\x28\
+\x00\x00\x02\x4e\x00\x00\x00\x00\x00\x01\x00\x00\xc2\x4b\
+\x00\x00\x02\x60\x00\x00\x00\x00\x00\x01\x00\x00\xc3\x5d\
+\x00\x00\x02\x7c\x00\x00\x00\x00\x00\x01\x00\x00\xc6\x04\
+\x00\x00\x02\x90\x00\x00\x00\x00\x00\x01\x00\x00\xc7\x3e\
+\x00\x00\x02\xac\x00\x00\x00\x00\x00\x01\x00\x00\xc9\x73\
+\x00\x00\x02\xc0\x00\x00\x00\x00\x00\x01\x00\x00\xda\x40\
+\x00\x00\x02\xe4\x00\x00\x00\x00\x00\x01\x00\x00\xea\x80\
+\x00\x00\x03\x02\x00\x00\x00\x00\x00\x01\x00\x00\xeb\x5e\
+\x00\x00\x03\x20\x00\x00\x00\x00\x00\x01\x00\x00\xec\x53\
+\x00\x00\x03\x36\x00\x00\x00\x00\x00\x01\x00\x00\xed\xa5\
+\x00\x00\x03\x4c\x00\x00\x00\x00\x00\x01\x00\x00\xf1\x68\
+"
+
+qt_resource_struct_v2 = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x2b\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x01\x9c\x09\x7c\x8f\x20\
+\x00\x00\x00\x0c\x00\x00\x00\x00\x00\x01\x00\x00\x7a\x97\
+\x00\x00\x01\x9c\x09\x7c\x8f\x20\
+\x00\x00\x00\x18\x00\x00\x00\x00\x00\x01\x00\x00\x7b\xd5\
+\x00\x00\x01\x9c\x09\x7c\x8f\x20\
+\x00\x00\x00\x24\x00\x00\x00\x00\x00\x01\x00\x00\x7e\x0a\
+\x00\x00\x01\x9c\x09\x7c\x8f\x20\
+\x00\x00\x00\x32\x00\x00\x00\x00\x00\x01\x00\x00\x7f\x3f\
+\x00\x00\x01\x9c\x09\x7c\x8f\x20\
+\x00\x00\x00\x40\x00\x00\x00\x00\x00\x01\x00\x00\x80\x1c\
+\x00\x00\x01\x9c\x09\x7c\x8f\x20\
+\x00\x00\x00\x4e\x00\x00\x00\x00\x00\x01\x00\x00\x81\x2d\
+\x00\x00\x01\x9c\x09\x7c\x8f\x20\
+\x00\x00\x00\x5c\x00\x00\x00\x00\x00\x01\x00\x00\x82\x50\
+\x00\x00\x01\x9c\x09\x7c\x8f\x20\
+\x00\x00\x00\x6a\x00\x00\x00\x00\x00\x01\x00\x00\x83\x84\
+\x00\x00\x01\x9c\x09\x7c\x8f\x20\
+\x00\x00\x00\x78\x00\x00\x00\x00\x00\x01\x00\x00\x85\x23\
+\x00\x00\x01\x9c\x09\x7c\x8f\x20\
+\x00\x00\x00\x86\x00\x00\x00\x00\x00\x01\x00\x00\x86\x00\
+\x00\x00\x01\x9c\x09\x7c\x8f\x20\
+\x00\x00\x00\x94\x00\x00\x00\x00\x00\x01\x00\x00\x87\x11\
+\x00\x00\x01\x9c\x09\x7c\x8f\x20\
+\x00\x00\x00\xa2\x00\x00\x00\x00\x00\x01\x00\x00\x87\xef\
+\x00\x00\x01\x9c\x09\x7c\x8f\x20\
+\x00\x00\x00\xb0\x00\x00\x00\x00\x00\x01\x00\x00\x88\xfe\
+\x00\x00\x01\x9c\x09\x7c\x8f\x20\
+\x00\x00\x00\xbe\x00\x00\x00\x00\x00\x01\x00\x00\x8a\x36\
+\x00\x00\x01\x9c\x09\x7c\x8f\x20\
+\x00\x00\x00\xcc\x00\x00\x00\x00\x00\x01\x00\x00\x8b\x86\
+\x00\x00\x01\x9c\x09\x7c\x8f\x20\
+\x00\x00\x00\xda\x00\x00\x00\x00\x00\x01\x00\x00\x8c\x8f\
+\x00\x00\x01\x9c\x09\x7c\x8f\x20\
+\x00\x00\x00\xe8\x00\x00\x00\x00\x00\x01\x00\x00\x8d\x95\
+\x00\x00\x01\x9c\x09\x7c\x8f\x20\
+\x00\x00\x00\xf8\x00\x00\x00\x00\x00\x01\x00\x00\x8e\x99\
+\x00\x00\x01\x9c\x09\x7c\x8f\x20\
+\x00\x00\x01\x08\x00\x00\x00\x00\x00\x01\x00\x00\x8f\x84\
+\x00\x00\x01\x9c\x09\x7c\x8f\x20\
+\x00\x00\x01\x1c\x00\x00\x00\x00\x00\x01\x00\x00\x90\xd6\
+\x00\x00\x01\xa1\x51\xe2\xbb\x27\
+\x00\x00\x01\x3c\x00\x00\x00\x00\x00\x01\x00\x00\x9c\x82\
+\x00\x00\x01\xa1\x51\xe2\xbb\x27\
+\x00\x00\x01\x5c\x00\x00\x00\x00\x00\x01\x00\x00\xa7\x27\
+\x00\x00\x01\x9c\x09\x7c\x8f\x20\
+\x00\x00\x01\x7c\x00\x00\x00\x00\x00\x01\x00\x00\xb3\x7b\
+\x00\x00\x01\x9c\x09\x7c\x8f\x20\
+\x00\x00\x01\x96\x00\x00\x00\x00\x00\x01\x00\x00\xb6\x91\
+\x00\x00\x01\x9c\x09\x7c\x8f\x20\
+\x00\x00\x01\xb0\x00\x00\x00\x00\x00\x01\x00\x00\xb7\xdd\
+\x00\x00\x01\x9c\x09\x7c\x8f\x20\
+\x00\x00\x01\xc6\x00\x00\x00\x00\x00\x01\x00\x00\xb9\x09\
+\x00\x00\x01\x9c\x09\x7c\x8f\x20\
+\x00\x00\x01\xe0\x00\x00\x00\x00\x00\x01\x00\x00\xba\x06\
+\x00\x00\x01\x9c\x09\x7c\x8f\x20\
+\x00\x00\x01\xf2\x00\x00\x00\x00\x00\x01\x00\x00\xbb\x89\
+\x00\x00\x01\x9c\x09\x7c\x8f\x20\
+\x00\x00\x02\x04\x00\x00\x00\x00\x00\x01\x00\x00\xbd\x95\
+\x00\x00\x01\x9c\x09\x7c\x8f\x20\
+\x00\x00\x02\x24\x00\x00\x00\x00\x00\x01\x00\x00\xbf\xca\
+\x00\x00\x01\x9c\x09\x7c\x8f\x20\
+\x00\x00\x02\x36\x00\x00\x00\x00\x00\x01\x00\x00\xc1\x28\
+\x00\x00\x01\x9c\x09\x7c\x8f\x20\
+\x00\x00\x02\x4e\x00\x00\x00\x00\x00\x01\x00\x00\xc2\x4b\
+\x00\x00\x01\x9c\x09\x7c\x8f\x20\
+\x00\x00\x02\x60\x00\x00\x00\x00\x00\x01\x00\x00\xc3\x5d\
+\x00\x00\x01\x9c\x09\x7c\x8f\x20\
+\x00\x00\x02\x7c\x00\x00\x00\x00\x00\x01\x00\x00\xc6\x04\
+\x00\x00\x01\x9c\x09\x7c\x8f\x20\
+\x00\x00\x02\x90\x00\x00\x00\x00\x00\x01\x00\x00\xc7\x3e\
+\x00\x00\x01\x9c\x09\x7c\x8f\x20\
+\x00\x00\x02\xac\x00\x00\x00\x00\x00\x01\x00\x00\xc9\x73\
+\x00\x00\x01\xa1\x51\xe2\xbb\x27\
+\x00\x00\x02\xc0\x00\x00\x00\x00\x00\x01\x00\x00\xda\x40\
+\x00\x00\x01\x9c\x09\x7c\x8f\x20\
+\x00\x00\x02\xe4\x00\x00\x00\x00\x00\x01\x00\x00\xea\x80\
+\x00\x00\x01\x9c\x09\x7c\x8f\x20\
+\x00\x00\x03\x02\x00\x00\x00\x00\x00\x01\x00\x00\xeb\x5e\
+\x00\x00\x01\x9c\x09\x7c\x8f\x20\
+\x00\x00\x03\x20\x00\x00\x00\x00\x00\x01\x00\x00\xec\x53\
+\x00\x00\x01\x9c\x09\x7c\x8f\x20\
+\x00\x00\x03\x36\x00\x00\x00\x00\x00\x01\x00\x00\xed\xa5\
+\x00\x00\x01\x9c\x09\x7c\x8f\x20\
+\x00\x00\x03\x4c\x00\x00\x00\x00\x00\x01\x00\x00\xf1\x68\
+\x00\x00\x01\x9c\x09\x7c\x8f\x20\
+"
+
+qt_version = [int(v) for v in QtCore.qVersion().split('.')]
+if qt_version < [5, 8, 0]:
+    rcc_version = 1
+    qt_resource_struct = qt_resource_struct_v1
+else:
+    rcc_version = 2
+    qt_resource_struct = qt_resource_struct_v2
+
+def qInitResources():
+    QtCore.qRegisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+def qCleanupResources():
+    QtCore.qUnregisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+qInitResources()
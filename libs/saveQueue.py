@@ -0,0 +1,207 @@
+# libs/saveQueue.py
+"""Background saving of annotations.
+
+The main window turns the shapes of an image into a SaveSnapshot, plain
+data that is no longer tied to the canvas, and hands it to a SaveQueue.
+A single worker writes the snapshots in the order they were queued, so
+two saves of the same file never overtake each other, while navigation
+goes on. A snapshot still waiting when a newer one for the same file
+arrives is replaced by the newer one.
+
+The queue also remembers a digest of the last content saved to each file
+and the modification time and size the file had afterwards, so saving
+annotations that are already on disk writes nothing, while a file that
+someone else has rewritten since is written again.
+"""
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict, namedtuple
+
+try:
+    from PyQt5.QtCore import QObject, pyqtSignal, QRunnable, QThreadPool
+except ImportError:
+    from PyQt4.QtCore import QObject, pyqtSignal, QRunnable, QThreadPool
+
+from libs.create_ml_io import JSON_EXT
+from libs.labelFile import LabelFile, LabelFileFormat
+from libs.pascal_voc_io import XML_EXT
+from libs.yolo_io import TXT_EXT
+
+# Everything needed to write one annotation file. ``shapes`` is a tuple of
+# dicts as built by MainWindow.label_snapshot, ``image_shape`` the
+# [height, width, depth] of the image so it does not have to be decoded again.
+SaveSnapshot = namedtuple('SaveSnapshot', ['image_path', 'annotation_path', 'label_format', 'shapes',
+                                           'image_shape', 'class_list', 'verified'])
+
+FORMAT_EXTENSIONS = {
+    LabelFileFormat.PASCAL_VOC: XML_EXT,
+    LabelFileFormat.YOLO: TXT_EXT,
+    LabelFileFormat.CREATE_ML: JSON_EXT,
+}
+
+
+def annotation_path_for(annotation_path, label_format):
+    """``annotation_path`` with the extension of ``label_format`` added if missing."""
+    ext = FORMAT_EXTENSIONS[label_format]
+    if annotation_path[-len(ext):].lower() != ext:
+        annotation_path += ext
+    return annotation_path
+
+
+def snapshot_digest(snapshot):
+    """Digest of everything a snapshot writes, equal for equal file contents."""
+    content = (snapshot.label_format.name, snapshot.shapes, snapshot.image_shape,
+               snapshot.class_list if snapshot.label_format != LabelFileFormat.PASCAL_VOC else None,
+               snapshot.verified, snapshot.image_path)
+    return hashlib.sha1(repr(content).encode('utf-8')).hexdigest()
+
+
+def file_stamp(path):
+    """(mtime_ns, size) of ``path``, None if it does not exist."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def write_snapshot(snapshot):
+    """Write one snapshot to disk and return the path of the annotation file."""
+    label_file = LabelFile()
+    label_file.verified = snapshot.verified
+    path = annotation_path_for(snapshot.annotation_path, snapshot.label_format)
+    shapes = list(snapshot.shapes)
+    if snapshot.label_format == LabelFileFormat.PASCAL_VOC:
+        label_file.save_pascal_voc_format(path, shapes, snapshot.image_path, snapshot.image_shape)
+    elif snapshot.label_format == LabelFileFormat.YOLO:
+        label_file.save_yolo_format(path, shapes, snapshot.image_path, snapshot.image_shape,
+                                    list(snapshot.class_list))
+    else:
+        label_file.save_create_ml_format(path, shapes, snapshot.image_path, snapshot.image_shape,
+                                         list(snapshot.class_list))
+    return path
+
+
+class SaveQueueSignals(QObject):
+    """Signals of the save queue, delivered on the GUI thread."""
+    saved = pyqtSignal(str, str)  # image path, annotation path
+    failed = pyqtSignal(str, str)  # image path, error message
+
+
+class SaveWorker(QRunnable):
+    """Write queued snapshots until the queue is empty."""
+
+    def __init__(self, queue):
+        super(SaveWorker, self).__init__()
+        self.queue = queue
+
+    def run(self):
+        while True:
+            snapshot = self.queue._take()
+            if snapshot is None:
+                return
+            try:
+                path = write_snapshot(snapshot)
+            except Exception as e:
+                self.queue._done(snapshot)
+                self.queue.forget(snapshot)
+                self.queue.signals.failed.emit(snapshot.image_path, str(e))
+            else:
+                self.queue._done(snapshot, path)
+                self.queue.signals.saved.emit(snapshot.image_path, path)
+
+
+class SaveQueue(object):
+    """Ordered queue of annotation saves written by one background worker."""
+
+    def __init__(self):
+        self.signals = SaveQueueSignals()
+        self._lock = threading.Lock()
+        self._pending = OrderedDict()  # annotation path -> snapshot not yet started
+        self._in_flight = None  # Snapshot being written
+        self._running = False
+        self._digests = {}  # annotation path -> digest of the last content saved or queued
+        self._stamps = {}  # annotation path -> file_stamp() right after our last write
+        self._pool = QThreadPool()
+        self._pool.setMaxThreadCount(1)
+
+    def submit(self, snapshot):
+        """Queue ``snapshot``; a waiting snapshot of the same file is replaced.
+
+        Returns False, without queueing, when the file already holds (or
+        is about to get) exactly this content.
+        """
+        if self.is_unchanged(snapshot):
+            return False
+        key = annotation_path_for(snapshot.annotation_path, snapshot.label_format)
+        with self._lock:
+            self._digests[key] = snapshot_digest(snapshot)
+            self._pending[key] = snapshot
+            if self._running:
+                return True
+            self._running = True
+        self._pool.start(SaveWorker(self))
+        return True
+
+    def is_unchanged(self, snapshot):
+        """Whether saving ``snapshot`` would not change its annotation file."""
+        key = annotation_path_for(snapshot.annotation_path, snapshot.label_format)
+        with self._lock:
+            digest = self._digests.get(key)
+            stamp = self._stamps.get(key)
+            in_flight = self._in_flight
+            queued = key in self._pending
+        if digest != snapshot_digest(snapshot):
+            return False
+        if in_flight is not None and annotation_path_for(in_flight.annotation_path, in_flight.label_format) == key:
+            queued = True
+        # Otherwise the file must still be the one we wrote, not changed or removed since
+        return queued or (stamp is not None and file_stamp(key) == stamp)
+
+    def mark_saved(self, snapshot):
+        """Record that ``snapshot`` was written to its file outside the queue."""
+        key = annotation_path_for(snapshot.annotation_path, snapshot.label_format)
+        stamp = file_stamp(key)
+        with self._lock:
+            self._digests[key] = snapshot_digest(snapshot)
+            self._stamps[key] = stamp
+
+    def forget(self, snapshot):
+        """Drop the digest of ``snapshot``'s file, e.g. after a failed write."""
+        key = annotation_path_for(snapshot.annotation_path, snapshot.label_format)
+        with self._lock:
+            self._digests.pop(key, None)
+            self._stamps.pop(key, None)
+
+    def is_pending(self, image_path):
+        """Whether a save of ``image_path`` is queued or being written."""
+        with self._lock:
+            if self._in_flight is not None and self._in_flight.image_path == image_path:
+                return True
+            return any(s.image_path == image_path for s in self._pending.values())
+
+    def pending_count(self):
+        with self._lock:
+            return len(self._pending) + (1 if self._in_flight is not None else 0)
+
+    def wait(self):
+        """Block until every queued save has been written."""
+        self._pool.waitForDone()
+
+    def _take(self):
+        with self._lock:
+            if not self._pending:
+                self._running = False
+                return None
+            _, self._in_flight = self._pending.popitem(last=False)
+            return self._in_flight
+
+    def _done(self, snapshot, path=None):
+        stamp = file_stamp(path) if path else None
+        with self._lock:
+            if path:
+                self._stamps[path] = stamp
+            if self._in_flight is snapshot:
+                self._in_flight = None
@@ -1,50 +1,346 @@
+import hashlib
+import json
 import os
 import pickle
+import tempfile
+from enum import Enum
 
+try:
+    from PyQt5.QtCore import QByteArray, QPoint, QSize, QTimer, QCoreApplication, QRunnable, QThreadPool
+    from PyQt5.QtGui import QColor
+except ImportError:
+    from PyQt4.QtCore import QByteArray, QPoint, QSize, QTimer, QCoreApplication, QRunnable, QThreadPool
+    from PyQt4.QtGui import QColor
+
+TYPE_KEY = '__type__'
+VALUE_KEY = 'value'
+
+
+def encode_value(value):
+    """Turn a settings value into plain JSON data.
+
+    Qt value types are stored as {'__type__': name, 'value': data} so that
+    reading the file does not need Qt; they are only turned back into Qt
+    objects when the key is read. Enum members are stored by value.
+    """
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, Enum):
+        return encode_value(value.value)
+    if isinstance(value, (list, tuple)):
+        return [encode_value(v) for v in value]
+    if isinstance(value, dict):
+        return {str(k): encode_value(v) for k, v in value.items()}
+    if isinstance(value, QSize):
+        return {TYPE_KEY: 'QSize', VALUE_KEY: [value.width(), value.height()]}
+    if isinstance(value, QPoint):
+        return {TYPE_KEY: 'QPoint', VALUE_KEY: [value.x(), value.y()]}
+    if isinstance(value, QColor):
+        return {TYPE_KEY: 'QColor', VALUE_KEY: list(value.getRgb())}
+    if isinstance(value, QByteArray):
+        return {TYPE_KEY: 'QByteArray', VALUE_KEY: bytes(value.toBase64()).decode('ascii')}
+    raise TypeError('Cannot store %s in the settings' % type(value).__name__)
+
+
+DECODERS = {
+    'QSize': lambda data: QSize(*data),
+    'QPoint': lambda data: QPoint(*data),
+    'QColor': lambda data: QColor(*data),
+    'QByteArray': lambda data: QByteArray.fromBase64(data.encode('ascii')),
+}
+
+
+def decode_value(data):
+    """Inverse of encode_value()."""
+    if isinstance(data, list):
+        return [decode_value(v) for v in data]
+    if isinstance(data, dict):
+        if TYPE_KEY in data and data[TYPE_KEY] in DECODERS and len(data) == 2:
+            return DECODERS[data[TYPE_KEY]](data[VALUE_KEY])
+        return {k: decode_value(v) for k, v in data.items()}
+    return data
+
+
+def atomic_write(path, text):
+    """Write ``text`` to ``path`` so that a crash leaves either the old or the new file."""
+    directory = os.path.dirname(os.path.abspath(path))
+    if not os.path.isdir(directory):
+        os.makedirs(directory)
+    fd, temp_path = tempfile.mkstemp(prefix='.' + os.path.basename(path), suffix='.tmp', dir=directory)
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
 
-class Settings(object):
-    def __init__(self):
-        # Be default, the home will be in the same folder as labelImg
-        home = os.path.expanduser("~")
-        self.data = {}
-        self.path = os.path.join(home, '.labelImgSettings.pkl')
+
+class JsonStore(object):
+    """Key/value store kept in one JSON file.
+
+    Values are encoded when they are set and decoded when they are first
+    read. save() only writes when a value actually changed, and writes
+    atomically.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.data = {}  # Decoded values, filled on first read of a key
+        self._raw = {}  # Encoded values, as stored in the file
+        self._dirty = False
+        self.on_change = None
 
     def __setitem__(self, key, value):
+        encoded = encode_value(value)
         self.data[key] = value
+        if key in self._raw and self._raw[key] == encoded:
+            return
+        self._raw[key] = encoded
+        self._dirty = True
+        if self.on_change is not None:
+            self.on_change()
 
     def __getitem__(self, key):
+        if key not in self.data:
+            self.data[key] = decode_value(self._raw[key])
         return self.data[key]
 
+    def __contains__(self, key):
+        return key in self._raw
+
     def get(self, key, default=None):
-        if key in self.data:
-            return self.data[key]
+        if key in self._raw:
+            return self[key]
         return default
 
+    def pop(self, key, default=None):
+        if key not in self._raw:
+            return default
+        value = self[key]
+        del self._raw[key]
+        del self.data[key]
+        self._dirty = True
+        if self.on_change is not None:
+            self.on_change()
+        return value
+
+    def is_dirty(self):
+        return self._dirty
+
+    def serialize(self):
+        return json.dumps(self._raw, indent=1, sort_keys=True, ensure_ascii=False)
+
+    def take_snapshot(self):
+        """Serialize the current values for a write elsewhere and mark the store clean."""
+        self._dirty = False
+        return self.serialize()
+
     def save(self):
-        if self.path:
-            with open(self.path, 'wb') as f:
-                pickle.dump(self.data, f, pickle.HIGHEST_PROTOCOL)
+        if not self.path:
+            return False
+        if not self._dirty and os.path.exists(self.path):
+            return True
+        try:
+            atomic_write(self.path, self.serialize())
+        except (IOError, OSError) as e:
+            print(f'Could not write settings file {self.path}: {e}')
+            return False
+        self._dirty = False
+        return True
+
+    def load(self):
+        try:
+            if self.path and os.path.exists(self.path):
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    raw = json.load(f)
+                if not isinstance(raw, dict):
+                    raise ValueError('expected a JSON object')
+                self._raw = self.unwrap(raw)
+                self.data = {}
+                self._dirty = False
                 return True
+        except ValueError as e:
+            print(f'Settings file {self.path} corrupted, using defaults: {e}')
+            self._keep_corrupted_file()
+        except IOError as e:
+            print(f'Could not read settings file: {e}')
         return False
 
+    def unwrap(self, raw):
+        """Hook for subclasses storing more than the values in the file."""
+        return raw
+
+    def _keep_corrupted_file(self):
+        try:
+            os.replace(self.path, self.path + '.corrupt')
+        except OSError:
+            pass
+
+
+class DatasetSettings(JsonStore):
+    """State of one image folder (last image, zoom, thumbnail size...).
+
+    Kept in its own small file so that saving one folder never rewrites
+    the global preferences or other folders.
+    """
+
+    def __init__(self, path, dir_name):
+        super(DatasetSettings, self).__init__(path)
+        self.dir_name = dir_name
+
+    def serialize(self):
+        return json.dumps({'dir': self.dir_name, 'values': self._raw}, indent=1, sort_keys=True,
+                          ensure_ascii=False)
+
+    def unwrap(self, raw):
+        return raw.get('values', {})
+
+
+class SaveWorker(QRunnable):
+    """Write settings snapshots to disk in a background thread."""
+
+    def __init__(self, snapshots):
+        super(SaveWorker, self).__init__()
+        self.snapshots = snapshots  # [(store, path, text)]
+
+    def run(self):
+        for store, path, text in self.snapshots:
+            try:
+                atomic_write(path, text)
+            except (IOError, OSError) as e:
+                print(f'Could not write settings file {path}: {e}')
+                store._dirty = True  # Written again by the next save
+
+
+def dataset_key(dir_name):
+    """File name stem of the settings of ``dir_name``."""
+    normalized = os.path.normcase(os.path.abspath(dir_name))
+    return hashlib.sha1(normalized.encode('utf-8')).hexdigest()[:20]
+
+
+class Settings(JsonStore):
+    """Global preferences plus per-folder settings.
+
+    Preferences are stored as typed JSON in ~/.labelImgSettings.json. A
+    pickled ~/.labelImgSettings.pkl from older versions is read once and
+    converted on the next save. With ``save_delay`` (ms) set, changes are
+    saved after the given delay; further changes in the meantime restart
+    the delay so a burst of changes is one write. Those delayed saves are
+    written by a background thread; save() writes synchronously after any
+    background write still in flight.
+    """
+
+    def __init__(self):
+        # Be default, the home will be in the same folder as labelImg
+        home = os.path.expanduser("~")
+        super(Settings, self).__init__(os.path.join(home, '.labelImgSettings.json'))
+        self.legacy_path = os.path.join(home, '.labelImgSettings.pkl')
+        self.dataset_dir = os.path.join(home, '.labelImgDatasets')
+        self.save_delay = None
+        self.on_change = self.schedule_save
+        self._datasets = {}
+        self._save_timer = None
+        self._write_pool = None
+
     def load(self):
+        if self.path and os.path.exists(self.path) and super(Settings, self).load():
+            return True
+        return self._load_legacy()
+
+    def _load_legacy(self):
+        """Read the pickled settings of older versions; they are saved back as JSON."""
         try:
-            if os.path.exists(self.path):
-                with open(self.path, 'rb') as f:
-                    self.data = pickle.load(f)
-                    return True
-        except (pickle.UnpicklingError, EOFError, AttributeError) as e:
+            if self.legacy_path and os.path.exists(self.legacy_path):
+                with open(self.legacy_path, 'rb') as f:
+                    legacy = pickle.load(f)
+                for key, value in legacy.items():
+                    try:
+                        self[key] = value
+                    except TypeError as e:
+                        print(f'Dropping old setting {key}: {e}')
+                return True
+        except (pickle.UnpicklingError, EOFError, AttributeError, ImportError) as e:
             print(f'Settings file corrupted, using defaults: {e}')
-            self.data = {}
         except IOError as e:
             print(f'Could not read settings file: {e}')
         except Exception as e:
             print(f'Unexpected error loading settings: {e}')
         return False
 
+    def dataset(self, dir_name):
+        """Settings of the image folder ``dir_name``, loaded on first use."""
+        key = dataset_key(dir_name)
+        store = self._datasets.get(key)
+        if store is None:
+            store = DatasetSettings(os.path.join(self.dataset_dir, key + '.json'), dir_name)
+            store.load()
+            store.on_change = self.schedule_save
+            self._datasets[key] = store
+        return store
+
+    def schedule_save(self):
+        """Save after ``save_delay`` ms, restarting the delay on every change."""
+        if self.save_delay is None or QCoreApplication.instance() is None:
+            return
+        if self._save_timer is None:
+            self._save_timer = QTimer()
+            self._save_timer.setSingleShot(True)
+            self._save_timer.timeout.connect(self.save_in_background)
+        self._save_timer.start(self.save_delay)
+
+    def _dirty_stores(self):
+        stores = [self] if self._dirty or not os.path.exists(self.path) else []
+        return stores + [store for store in self._datasets.values() if store.is_dirty()]
+
+    def save_in_background(self):
+        """Snapshot the changed stores now and write them off the GUI thread."""
+        if not self.path:
+            return
+        snapshots = [(store, store.path, store.take_snapshot()) for store in self._dirty_stores()]
+        if not snapshots:
+            return
+        if self._write_pool is None:
+            self._write_pool = QThreadPool()
+            self._write_pool.setMaxThreadCount(1)  # One writer keeps the writes in order
+        self._write_pool.start(SaveWorker(snapshots))
+
+    def wait_for_writes(self):
+        """Block until the background writes started so far are on disk."""
+        if self._write_pool is not None:
+            self._write_pool.waitForDone()
+
+    def save(self):
+        if self._save_timer is not None:
+            self._save_timer.stop()
+        self.wait_for_writes()
+        if not self.path:
+            return False
+        saved = super(Settings, self).save()
+        for store in self._datasets.values():
+            if store.is_dirty():
+                saved = store.save() and saved
+        return saved
+
     def reset(self):
-        if os.path.exists(self.path):
-            os.remove(self.path)
-            print('Remove setting pkl file ${0}'.format(self.path))
+        if self._save_timer is not None:
+            self._save_timer.stop()
+        self.wait_for_writes()
+        for path in (self.path, self.legacy_path):
+            if path and os.path.exists(path):
+                os.remove(path)
+                print('Remove setting file ${0}'.format(path))
+        if self.dataset_dir and os.path.isdir(self.dataset_dir):
+            for name in os.listdir(self.dataset_dir):
+                if name.endswith('.json'):
+                    os.remove(os.path.join(self.dataset_dir, name))
         self.data = {}
+        self._raw = {}
+        self._datasets = {}
+        self._dirty = False
         self.path = None
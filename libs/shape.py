@@ -10,7 +10,6 @@ except ImportError:
     from PyQt4.QtCore import *
 
 from libs.utils import distance
-import sys
 
 DEFAULT_LINE_COLOR = QColor(0, 255, 0, 128)
 DEFAULT_FILL_COLOR = QColor(255, 0, 0, 128)
@@ -25,10 +24,17 @@ class Shape(object):
 
     MOVE_VERTEX, NEAR_VERTEX = range(2)
 
+    # Shapes are created by the thousand on dense images, so keep them
+    # small: no per-instance __dict__, and the outline path and bounding
+    # rect are cached until the points change.
+    __slots__ = ('label', 'spatial_index', 'fill', 'selected', 'difficult', 'paint_label',
+                 '_points', '_closed', '_highlight_index', '_highlight_mode',
+                 '_line_color', '_fill_color', '_path', '_bounding_rect')
+
     # The following class variables influence the drawing
     # of _all_ shape objects.
-    line_color = DEFAULT_LINE_COLOR
-    fill_color = DEFAULT_FILL_COLOR
+    default_line_color = DEFAULT_LINE_COLOR
+    default_fill_color = DEFAULT_FILL_COLOR
     select_line_color = DEFAULT_SELECT_LINE_COLOR
     select_fill_color = DEFAULT_SELECT_FILL_COLOR
     vertex_fill_color = DEFAULT_VERTEX_FILL_COLOR
@@ -37,10 +43,19 @@ class Shape(object):
     point_size = 16
     scale = 1.0
     label_font_size = 8
+    highlight_settings = {
+        NEAR_VERTEX: (4, P_ROUND),
+        MOVE_VERTEX: (1.5, P_SQUARE),
+    }
 
     def __init__(self, label=None, line_color=None, difficult=False, paint_label=False):
         self.label = label
-        self.points = []
+        # Spatial index of the canvas holding this shape, kept up to date
+        # whenever the geometry changes.
+        self.spatial_index = None
+        self._points = []
+        self._path = None
+        self._bounding_rect = None
         self.fill = False
         self.selected = False
         self.difficult = difficult
@@ -48,34 +63,65 @@ class Shape(object):
 
         self._highlight_index = None
         self._highlight_mode = self.NEAR_VERTEX
-        self._highlight_settings = {
-            self.NEAR_VERTEX: (4, self.P_ROUND),
-            self.MOVE_VERTEX: (1.5, self.P_SQUARE),
-        }
 
         self._closed = False
 
-        if line_color is not None:
-            # Override the class line_color attribute
-            # with an object attribute. Currently this
-            # is used for drawing the pending line a different color.
-            self.line_color = line_color
+        # None means the class default is used.
+        # Currently line_color is used for drawing the pending line a different color.
+        self._line_color = line_color
+        self._fill_color = None
+
+    @property
+    def line_color(self):
+        return self._line_color if self._line_color is not None else self.default_line_color
+
+    @line_color.setter
+    def line_color(self, color):
+        self._line_color = color
+
+    @property
+    def fill_color(self):
+        return self._fill_color if self._fill_color is not None else self.default_fill_color
+
+    @fill_color.setter
+    def fill_color(self, color):
+        self._fill_color = color
+
+    @property
+    def points(self):
+        return self._points
+
+    @points.setter
+    def points(self, points):
+        self._points = points
+        self.geometry_changed()
+
+    def geometry_changed(self):
+        """Must be called after the points were modified in place."""
+        self._path = None
+        self._bounding_rect = None
+        if self.spatial_index is not None:
+            self.spatial_index.update(self)
 
     def close(self):
         self._closed = True
+        self._path = None
 
     def reach_max_points(self):
-        if len(self.points) >= 4:
+        if len(self._points) >= 4:
             return True
         return False
 
     def add_point(self, point):
         if not self.reach_max_points():
-            self.points.append(point)
+            self._points.append(QPointF(point))
+            self.geometry_changed()
 
     def pop_point(self):
-        if self.points:
-            return self.points.pop()
+        if self._points:
+            point = self._points.pop()
+            self.geometry_changed()
+            return point
         return None
 
     def is_closed(self):
@@ -83,68 +129,61 @@ class Shape(object):
 
     def set_open(self):
         self._closed = False
+        self._path = None
 
     def paint(self, painter):
-        if self.points:
+        if self._points:
             color = self.select_line_color if self.selected else self.line_color
             pen = QPen(color)
             # Try using integer sizes for smoother drawing(?)
             pen.setWidth(max(1, int(round(2.0 / self.scale))))
             painter.setPen(pen)
 
-            line_path = QPainterPath()
+            line_path = self.make_path()
             vertex_path = QPainterPath()
-
-            line_path.moveTo(self.points[0])
-            # Uncommenting the following line will draw 2 paths
-            # for the 1st vertex, and make it non-filled, which
-            # may be desirable.
-            # self.drawVertex(vertex_path, 0)
-
-            for i, p in enumerate(self.points):
-                line_path.lineTo(p)
+            for i in range(len(self._points)):
                 self.draw_vertex(vertex_path, i)
-            if self.is_closed():
-                line_path.lineTo(self.points[0])
 
             painter.drawPath(line_path)
             painter.drawPath(vertex_path)
-            painter.fillPath(vertex_path, self.vertex_fill_color)
+            painter.fillPath(vertex_path, self.vertex_color())
 
             # Draw text at the top-left
             if self.paint_label:
-                min_x = sys.maxsize
-                min_y = sys.maxsize
-                min_y_label = int(1.25 * self.label_font_size)
-                for point in self.points:
-                    min_x = min(min_x, point.x())
-                    min_y = min(min_y, point.y())
-                if min_x != sys.maxsize and min_y != sys.maxsize:
-                    font = QFont()
-                    font.setPointSize(self.label_font_size)
-                    font.setBold(True)
-                    painter.setFont(font)
-                    if self.label is None:
-                        self.label = ""
-                    if min_y < min_y_label:
-                        min_y += min_y_label
-                    painter.drawText(int(min_x), int(min_y), self.label)
+                font = QFont()
+                font.setPointSize(self.label_font_size)
+                font.setBold(True)
+                painter.setFont(font)
+                if self.label is None:
+                    self.label = ""
+                painter.drawText(self.label_position(), self.label)
 
             if self.fill:
                 color = self.select_fill_color if self.selected else self.fill_color
                 painter.fillPath(line_path, color)
 
+    def vertex_color(self):
+        """Fill color of the vertex markers."""
+        if self._highlight_index is not None:
+            return self.h_vertex_fill_color
+        return self.vertex_fill_color
+
+    def label_position(self):
+        """Baseline position of the label: top-left corner, pushed down near the image top."""
+        rect = self.bounding_rect()
+        min_y = rect.y()
+        min_y_label = int(1.25 * self.label_font_size)
+        if min_y < min_y_label:
+            min_y += min_y_label
+        return QPoint(int(rect.x()), int(min_y))
+
     def draw_vertex(self, path, i):
         d = self.point_size / self.scale
         shape = self.point_type
-        point = self.points[i]
+        point = self._points[i]
         if i == self._highlight_index:
-            size, shape = self._highlight_settings[self._highlight_mode]
+            size, shape = self.highlight_settings[self._highlight_mode]
             d *= size
-        if self._highlight_index is not None:
-            self.vertex_fill_color = self.h_vertex_fill_color
-        else:
-            self.vertex_fill_color = Shape.vertex_fill_color
         if shape == self.P_SQUARE:
             path.addRect(point.x() - d / 2, point.y() - d / 2, d, d)
         elif shape == self.P_ROUND:
@@ -165,19 +204,34 @@ class Shape(object):
         return self.make_path().contains(point)
 
     def make_path(self):
-        path = QPainterPath(self.points[0])
-        for p in self.points[1:]:
-            path.lineTo(p)
-        return path
+        """Outline of the shape; cached, so callers must not modify it."""
+        if self._path is None:
+            path = QPainterPath(self._points[0])
+            for p in self._points:
+                path.lineTo(p)
+            if self._closed:
+                path.lineTo(self._points[0])
+            self._path = path
+        return self._path
 
     def bounding_rect(self):
-        return self.make_path().boundingRect()
+        if self._bounding_rect is None:
+            if not self._points:
+                return QRectF()
+            xs = [p.x() for p in self._points]
+            ys = [p.y() for p in self._points]
+            self._bounding_rect = QRectF(min(xs), min(ys), max(xs) - min(xs), max(ys) - min(ys))
+        return QRectF(self._bounding_rect)
 
     def move_by(self, offset):
-        self.points = [p + offset for p in self.points]
+        # Translate in place; points are never shared between shapes.
+        for p in self._points:
+            p += offset
+        self.geometry_changed()
 
     def move_vertex_by(self, i, offset):
-        self.points[i] = self.points[i] + offset
+        self._points[i] = self._points[i] + offset
+        self.geometry_changed()
 
     def highlight_vertex(self, i, action):
         self._highlight_index = i
@@ -188,22 +242,21 @@ class Shape(object):
 
     def copy(self):
         shape = Shape("%s" % self.label)
-        shape.points = [p for p in self.points]
+        shape.points = [QPointF(p) for p in self._points]
         shape.fill = self.fill
         shape.selected = self.selected
         shape._closed = self._closed
-        if self.line_color != Shape.line_color:
-            shape.line_color = self.line_color
-        if self.fill_color != Shape.fill_color:
-            shape.fill_color = self.fill_color
+        shape._line_color = self._line_color
+        shape._fill_color = self._fill_color
         shape.difficult = self.difficult
         return shape
 
     def __len__(self):
-        return len(self.points)
+        return len(self._points)
 
     def __getitem__(self, key):
-        return self.points[key]
+        return self._points[key]
 
     def __setitem__(self, key, value):
-        self.points[key] = value
+        self._points[key] = value
+        self.geometry_changed()
@@ -0,0 +1,154 @@
+# libs/shapeRenderer.py
+"""Batched rendering of canvas shapes.
+
+Drawing each shape on its own costs several pen/font changes and draw
+calls per box. The renderer groups shapes that look the same into one
+outline path and one vertex path, so thousands of boxes are drawn with
+a handful of calls, and reuses pens, brushes, fonts and label layouts
+between repaints.
+
+At low zoom, level-of-detail rules drop what cannot be seen anyway:
+vertex handles and labels of boxes that are small on screen, and tiny
+boxes are drawn as plain rectangles. The selected and hovered shapes
+always keep full detail.
+"""
+
+try:
+    from PyQt5.QtGui import QBrush, QFont, QFontMetricsF, QPainterPath, QPen, QStaticText
+    from PyQt5.QtCore import Qt, QPointF
+except ImportError:
+    from PyQt4.QtGui import QBrush, QFont, QFontMetricsF, QPainterPath, QPen, QStaticText
+    from PyQt4.QtCore import Qt, QPointF
+
+from collections import OrderedDict
+
+from libs.shape import Shape
+
+MAX_CACHED_LABELS = 4096
+
+# Level-of-detail thresholds, in screen pixels of a box's longer side.
+LOD_VERTEX_MIN_SIZE = 8  # below: no vertex handles
+LOD_LABEL_MIN_SIZE = 12  # below: no label
+LOD_TINY_MAX_SIZE = 4  # below: drawn as a plain rectangle
+
+
+class ShapeRenderer(object):
+    """Paint lists of shapes grouped by their drawing state."""
+
+    def __init__(self, vertex_min_size=LOD_VERTEX_MIN_SIZE, label_min_size=LOD_LABEL_MIN_SIZE,
+                 tiny_max_size=LOD_TINY_MAX_SIZE):
+        self.vertex_min_size = vertex_min_size
+        self.label_min_size = label_min_size
+        self.tiny_max_size = tiny_max_size
+        self._pens = {}
+        self._brushes = {}
+        self._fonts = {}
+        self._labels = OrderedDict()
+
+    def pen(self, color, width):
+        key = (color.rgba(), width)
+        pen = self._pens.get(key)
+        if pen is None:
+            pen = self._pens[key] = QPen(color)
+            pen.setWidth(width)
+        return pen
+
+    def brush(self, color):
+        key = color.rgba()
+        brush = self._brushes.get(key)
+        if brush is None:
+            brush = self._brushes[key] = QBrush(color)
+        return brush
+
+    def font(self, size):
+        """Bold label font of ``size`` points and its ascent."""
+        font = self._fonts.get(size)
+        if font is None:
+            qfont = QFont()
+            qfont.setPointSize(size)
+            qfont.setBold(True)
+            font = self._fonts[size] = (qfont, QFontMetricsF(qfont).ascent())
+        return font
+
+    def static_text(self, label, size):
+        """Laid out label text, reused until evicted."""
+        key = (label, size)
+        text = self._labels.get(key)
+        if text is not None:
+            self._labels.move_to_end(key)
+            return text
+        text = QStaticText(label)
+        text.setTextFormat(Qt.PlainText)
+        text.prepare(font=self.font(size)[0])
+        self._labels[key] = text
+        if len(self._labels) > MAX_CACHED_LABELS:
+            self._labels.popitem(last=False)
+        return text
+
+    def paint(self, painter, shapes):
+        """Paint ``shapes`` in a few draw calls; selected shapes end up on top."""
+        scale = Shape.scale
+        groups = OrderedDict()
+        tiny = OrderedDict()
+        labelled = []
+        filled = []
+        for shape in shapes:
+            if not len(shape):
+                continue
+            line_color = shape.select_line_color if shape.selected else shape.line_color
+            rect = shape.bounding_rect()
+            screen_size = max(rect.width(), rect.height()) * scale
+            # Hovered shapes are the ones being filled.
+            focused = shape.selected or shape.fill
+            if not focused and screen_size < self.tiny_max_size:
+                tiny.setdefault(line_color.rgba(), (line_color, []))[1].append(rect)
+                continue
+
+            detailed = focused or screen_size >= self.vertex_min_size
+            vertex_color = shape.vertex_color()
+            key = (shape.selected, line_color.rgba(), vertex_color.rgba())
+            group = groups.get(key)
+            if group is None:
+                group = groups[key] = (line_color, vertex_color, [])
+            group[2].append((shape, detailed))
+            if shape.paint_label and shape.label and (focused or screen_size >= self.label_min_size):
+                labelled.append(shape)
+            if shape.fill:
+                filled.append(shape)
+
+        width = max(1, int(round(2.0 / scale)))
+        painter.setBrush(Qt.NoBrush)
+        for line_color, rects in tiny.values():
+            painter.setPen(self.pen(line_color, width))
+            painter.drawRects(rects)
+
+        for key in sorted(groups, key=lambda k: k[0]):
+            line_color, vertex_color, members = groups[key]
+            outline = QPainterPath()
+            vertices = QPainterPath()
+            vertices.setFillRule(Qt.WindingFill)
+            for shape, detailed in members:
+                outline.addPath(shape.make_path())
+                if detailed:
+                    for i in range(len(shape)):
+                        shape.draw_vertex(vertices, i)
+            painter.setPen(self.pen(line_color, width))
+            painter.drawPath(outline)
+            if not vertices.isEmpty():
+                painter.drawPath(vertices)
+                painter.fillPath(vertices, self.brush(vertex_color))
+
+        if labelled:
+            size = Shape.label_font_size
+            font, ascent = self.font(size)
+            painter.setFont(font)
+            for shape in labelled:
+                painter.setPen(self.pen(shape.select_line_color if shape.selected else shape.line_color, width))
+                position = shape.label_position()
+                painter.drawStaticText(QPointF(position.x(), position.y() - ascent),
+                                       self.static_text(shape.label, size))
+
+        # Only the selected and the hovered shape are filled.
+        for shape in filled:
+            color = shape.select_fill_color if shape.selected else shape.fill_color
+            painter.fillPath(shape.make_path(), self.brush(color))
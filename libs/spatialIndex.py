@@ -0,0 +1,197 @@
+# libs/spatialIndex.py
+"""Uniform grid spatial index for fast hit-testing of shapes.
+
+Hovering and clicking on images with thousands of boxes used to test
+every shape; the grid narrows the candidates down to the shapes whose
+bounding rect touches the cells around the cursor.
+"""
+
+try:
+    from PyQt5.QtCore import QRectF
+except ImportError:
+    from PyQt4.QtCore import QRectF
+
+import math
+
+DEFAULT_CELL_SIZE = 128
+# Items spanning more cells than this are kept in a separate list that
+# is always scanned, instead of being registered in every cell.
+MAX_CELLS_PER_ITEM = 64
+
+
+def _rect_bounds(rect):
+    return rect.left(), rect.top(), rect.right(), rect.bottom()
+
+
+class SpatialIndex(object):
+    """Grid of cells mapping to the items whose bounding rect overlaps them.
+
+    Items must be hashable and provide ``bounding_rect()``; inserting,
+    moving and removing an item only touches the cells it covers.
+    """
+
+    def __init__(self, cell_size=DEFAULT_CELL_SIZE):
+        self.cell_size = cell_size
+        self._cells = {}
+        self._large = set()
+        self._item_cells = {}
+
+    def _cell_range(self, bounds):
+        x1, y1, x2, y2 = bounds
+        size = self.cell_size
+        return (int(math.floor(x1 / size)), int(math.floor(y1 / size)),
+                int(math.floor(x2 / size)), int(math.floor(y2 / size)))
+
+    def insert(self, item):
+        """Add ``item`` at its current bounding rect."""
+        if item in self._item_cells:
+            self.remove(item)
+        c1, r1, c2, r2 = cell_range = self._cell_range(_rect_bounds(item.bounding_rect()))
+        if (c2 - c1 + 1) * (r2 - r1 + 1) > MAX_CELLS_PER_ITEM:
+            self._large.add(item)
+            self._item_cells[item] = None
+            return
+        for col in range(c1, c2 + 1):
+            for row in range(r1, r2 + 1):
+                self._cells.setdefault((col, row), set()).add(item)
+        self._item_cells[item] = cell_range
+
+    def remove(self, item):
+        """Drop ``item`` from the index (no-op if it is not indexed)."""
+        cell_range = self._item_cells.pop(item, False)
+        if cell_range is False:
+            return
+        if cell_range is None:
+            self._large.discard(item)
+            return
+        c1, r1, c2, r2 = cell_range
+        for col in range(c1, c2 + 1):
+            for row in range(r1, r2 + 1):
+                cell = self._cells.get((col, row))
+                if cell is not None:
+                    cell.discard(item)
+                    if not cell:
+                        del self._cells[(col, row)]
+
+    def update(self, item):
+        """Re-register ``item`` after its geometry changed."""
+        if item in self._item_cells:
+            self.insert(item)
+
+    def clear(self):
+        self._cells.clear()
+        self._large.clear()
+        self._item_cells.clear()
+
+    def query(self, rect):
+        """Items whose bounding rect may intersect ``rect``."""
+        c1, r1, c2, r2 = self._cell_range(_rect_bounds(rect))
+        if (c2 - c1 + 1) * (r2 - r1 + 1) > len(self._cells):
+            result = set()
+            for (col, row), cell in self._cells.items():
+                if c1 <= col <= c2 and r1 <= row <= r2:
+                    result.update(cell)
+        else:
+            result = set()
+            for col in range(c1, c2 + 1):
+                for row in range(r1, r2 + 1):
+                    cell = self._cells.get((col, row))
+                    if cell:
+                        result.update(cell)
+        result.update(self._large)
+        return result
+
+    def query_point(self, point, radius=0.0):
+        """Items whose bounding rect may lie within ``radius`` of ``point``."""
+        return self.query(QRectF(point.x() - radius, point.y() - radius, 2 * radius, 2 * radius))
+
+    def __contains__(self, item):
+        return item in self._item_cells
+
+    def __len__(self):
+        return len(self._item_cells)
+
+
+class IndexedShapeList(list):
+    """List of shapes that keeps a SpatialIndex in sync with its contents.
+
+    Shapes point back to the index through their ``spatial_index``
+    attribute so that moving a shape updates its cells.
+    """
+
+    def __init__(self, shapes=(), cell_size=DEFAULT_CELL_SIZE):
+        super(IndexedShapeList, self).__init__()
+        self.spatial_index = SpatialIndex(cell_size)
+        self._positions = None
+        self.extend(shapes)
+
+    def _added(self, shape):
+        shape.spatial_index = self.spatial_index
+        self.spatial_index.insert(shape)
+        self._positions = None
+
+    def _removed(self, shape):
+        if shape not in self:
+            shape.spatial_index = None
+            self.spatial_index.remove(shape)
+        self._positions = None
+
+    def append(self, shape):
+        super(IndexedShapeList, self).append(shape)
+        self._added(shape)
+
+    def insert(self, index, shape):
+        super(IndexedShapeList, self).insert(index, shape)
+        self._added(shape)
+
+    def extend(self, shapes):
+        for shape in shapes:
+            self.append(shape)
+
+    def __iadd__(self, shapes):
+        self.extend(shapes)
+        return self
+
+    def remove(self, shape):
+        super(IndexedShapeList, self).remove(shape)
+        self._removed(shape)
+
+    def pop(self, index=-1):
+        shape = super(IndexedShapeList, self).pop(index)
+        self._removed(shape)
+        return shape
+
+    def clear(self):
+        for shape in self:
+            shape.spatial_index = None
+        super(IndexedShapeList, self).clear()
+        self.spatial_index.clear()
+        self._positions = None
+
+    def __setitem__(self, key, value):
+        old = self[key]
+        super(IndexedShapeList, self).__setitem__(key, value)
+        for shape in (old if isinstance(key, slice) else [old]):
+            self._removed(shape)
+        for shape in (value if isinstance(key, slice) else [value]):
+            self._added(shape)
+
+    def __delitem__(self, key):
+        old = self[key]
+        super(IndexedShapeList, self).__delitem__(key)
+        for shape in (old if isinstance(key, slice) else [old]):
+            self._removed(shape)
+
+    def position(self, shape):
+        """Index of ``shape`` in the list, in O(1) between mutations."""
+        if self._positions is None:
+            self._positions = {s: i for i, s in enumerate(self)}
+        return self._positions[shape]
+
+    def in_order(self, shapes):
+        """Return ``shapes`` (members of this list) sorted by list position."""
+        return sorted(shapes, key=self.position)
+
+    def near(self, point, radius=0.0):
+        """Shapes whose bounding rect may lie within ``radius`` of ``point``, in list order."""
+        return self.in_order(self.spatial_index.query_point(point, radius))
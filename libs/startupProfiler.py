@@ -0,0 +1,53 @@
+# libs/startupProfiler.py
+"""Startup profiling for labelImg.
+
+Records named marks from the moment labelImg starts importing until the
+first window is up, so the cost of each startup phase can be compared
+between runs (``labelImg.py --profile-startup``).
+"""
+
+import time
+
+
+class StartupProfiler(object):
+    """Collect (phase, seconds) marks relative to a start time."""
+
+    def __init__(self, start=None, clock=time.perf_counter):
+        self._clock = clock
+        self.start = clock() if start is None else start
+        self.marks = []
+
+    def mark(self, name):
+        """Record that the phase ending now is called ``name``."""
+        elapsed = self.elapsed()
+        self.marks.append((name, elapsed))
+        return elapsed
+
+    def elapsed(self):
+        """Seconds since the start, without recording a mark."""
+        return self._clock() - self.start
+
+    def has_mark(self, name):
+        """Whether a phase called ``name`` has been recorded."""
+        return any(mark == name for mark, _ in self.marks)
+
+    def total(self):
+        """Seconds from the start to the last mark."""
+        return self.marks[-1][1] if self.marks else 0.0
+
+    def phases(self):
+        """Return (name, duration) pairs, each measured from the previous mark."""
+        result = []
+        previous = 0.0
+        for name, elapsed in self.marks:
+            result.append((name, elapsed - previous))
+            previous = elapsed
+        return result
+
+    def report(self):
+        """Human readable table of the phases, slowest phases are easy to spot."""
+        lines = ['Startup profile:']
+        for name, duration in self.phases():
+            lines.append('  %-24s %8.1f ms' % (name, duration * 1000))
+        lines.append('  %-24s %8.1f ms' % ('total', self.total() * 1000))
+        return '\n'.join(lines)
@@ -3,12 +3,15 @@
 """
 if items were added in files in the resources/strings folder,
 then execute "pyrcc5 resources.qrc -o resources.py" in the root directory
-and execute "pyrcc5 ../resources.qrc -o resources.py" in the libs directory
+and execute "pyrcc5 ../resources.qrc -o resources.py" in the libs directory.
+Also execute "python -m libs.stringBundle" in the root directory to rebuild
+the precompiled string table (libs/stringTable.py), or run "make qt5py3".
 """
 import re
 import os
 import sys
 import locale
+import pprint
 from libs.ustr import ustr
 
 try:
@@ -19,20 +22,94 @@ except ImportError:
         sip.setapi('QVariant', 2)
     from PyQt4.QtCore import *
 
+try:
+    # Generated from resources/strings by write_string_table(); optional
+    from libs.stringTable import STRING_TABLE
+except ImportError:
+    STRING_TABLE = None
+
+PROP_SEPERATOR = '='
+BUNDLE_NAME = 'strings'
+STRINGS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'resources', 'strings')
+STRING_TABLE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'stringTable.py')
+
+
+def parse_properties_line(line, id_to_message):
+    """Add the key=value pair of one .properties line to ``id_to_message``."""
+    key_value = line.split(PROP_SEPERATOR)
+    key = key_value[0].strip()
+    value = PROP_SEPERATOR.join(key_value[1:]).strip().strip('"')
+    id_to_message[key] = value
+
+
+def fallback_names(name):
+    """Bundle names a bundle falls back to, most generic first.
+
+    'strings-zh-TW' -> ['strings', 'strings-zh', 'strings-zh-TW']
+    """
+    parts = name.split('-')
+    return ['-'.join(parts[:i]) for i in range(1, len(parts) + 1)]
+
+
+def compile_string_table(strings_dir=STRINGS_DIR):
+    """Parse every strings*.properties file with its fallback chain applied.
+
+    Returns {bundle name: {string id: message}}, where the messages of a
+    locale are already merged over those of the locales it falls back to.
+    """
+    parsed = {}
+    for file_name in os.listdir(strings_dir):
+        name, ext = os.path.splitext(file_name)
+        if ext != '.properties' or not name.startswith(BUNDLE_NAME):
+            continue
+        id_to_message = {}
+        with open(os.path.join(strings_dir, file_name), encoding='utf-8-sig') as f:
+            for line in f.read().splitlines():
+                parse_properties_line(line, id_to_message)
+        parsed[name] = id_to_message
+
+    table = {}
+    for name in parsed:
+        merged = {}
+        for fallback in fallback_names(name):
+            merged.update(parsed.get(fallback, {}))
+        table[name] = merged
+    return table
+
+
+def write_string_table(output_path=STRING_TABLE_PATH, strings_dir=STRINGS_DIR):
+    """Generate the Python module holding the precompiled string table."""
+    table = compile_string_table(strings_dir)
+    with open(output_path, 'w', encoding='utf-8') as f:
+        f.write('# -*- coding: utf-8 -*-\n')
+        f.write('# Generated from resources/strings by "python -m libs.stringBundle".\n')
+        f.write('# WARNING! All changes made in this file will be lost!\n\n')
+        f.write('STRING_TABLE = %s\n' % pprint.pformat(table, width=120))
+    return table
+
 
 class StringBundle:
 
     __create_key = object()
 
-    def __init__(self, create_key, locale_str):
+    def __init__(self, create_key, locale_str, string_table=None):
         assert(create_key == StringBundle.__create_key), "StringBundle must be created using StringBundle.getBundle"
         self.id_to_message = {}
         paths = self.__create_lookup_fallback_list(locale_str)
+        if string_table is None:
+            string_table = STRING_TABLE
+        if string_table is not None:
+            # The most specific bundle in the table already holds its fallbacks
+            for path in reversed(paths):
+                name = path[2:]
+                if name in string_table:
+                    self.id_to_message = dict(string_table[name])
+                    return
         for path in paths:
             self.__load_bundle(path)
 
     @classmethod
-    def get_bundle(cls, locale_str=None):
+    def get_bundle(cls, locale_str=None, string_table=None):
         if locale_str is None:
             try:
                 locale_str = locale.getdefaultlocale()[0] if locale.getdefaultlocale() and len(
@@ -41,7 +118,7 @@ class StringBundle:
                 print('Invalid locale, using English')
                 locale_str = 'en'
 
-        return StringBundle(cls.__create_key, locale_str)
+        return StringBundle(cls.__create_key, locale_str, string_table)
 
     def get_string(self, string_id):
         assert(string_id in self.id_to_message), "Missing string id : " + string_id
@@ -49,7 +126,7 @@ class StringBundle:
 
     def __create_lookup_fallback_list(self, locale_str):
         result_paths = []
-        base_path = ":/strings"
+        base_path = ":/" + BUNDLE_NAME
         result_paths.append(base_path)
         if locale_str is not None:
             # Don't follow standard BCP47. Simple fallback
@@ -61,7 +138,6 @@ class StringBundle:
         return result_paths
 
     def __load_bundle(self, path):
-        PROP_SEPERATOR = '='
         f = QFile(path)
         if f.exists():
             if f.open(QIODevice.ReadOnly | QFile.Text):
@@ -69,10 +145,11 @@ class StringBundle:
                 text.setCodec("UTF-8")
 
             while not text.atEnd():
-                line = ustr(text.readLine())
-                key_value = line.split(PROP_SEPERATOR)
-                key = key_value[0].strip()
-                value = PROP_SEPERATOR.join(key_value[1:]).strip().strip('"')
-                self.id_to_message[key] = value
+                parse_properties_line(ustr(text.readLine()), self.id_to_message)
 
             f.close()
+
+
+if __name__ == '__main__':
+    write_string_table()
+    print('Wrote %s' % STRING_TABLE_PATH)
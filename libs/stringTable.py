@@ -0,0 +1,550 @@
+# -*- coding: utf-8 -*-
+# Generated from resources/strings by "python -m libs.stringBundle".
+# WARNING! All changes made in this file will be lost!
+
+STRING_TABLE = {'strings': {'advancedMode': 'Advanced Mode',
+             'advancedModeDetail': 'Swtich to advanced mode',
+             'autoSave1m': '1 minute',
+             'autoSave2m': '2 minutes',
+             'autoSave30s': '30 seconds',
+             'autoSave5m': '5 minutes',
+             'autoSaveEnabled': 'Timed Auto-save',
+             'autoSaveEnabledDetail': 'Automatically save at regular intervals',
+             'autoSaveInterval': 'Auto-save Interval',
+             'autoSaveMode': 'Save on Navigate',
+             'autoSaveModeDetail': 'Automatically save when switching to next/previous image',
+             'boxLabelText': 'Box Labels',
+             'boxLineColor': 'Box Line Color',
+             'boxLineColorDetail': 'Choose Box line color',
+             'canvasBackend': 'Canvas Backend',
+             'canvasBackendOpenGL': 'OpenGL',
+             'canvasBackendRaster': 'Raster (CPU)',
+             'canvasBackendRestart': 'The canvas backend change takes effect after restarting',
+             'changeSaveDir': 'Change Save Dir',
+             'changeSaveFormat': 'Change save format',
+             'changeSavedAnnotationDir': 'Change default saved Annotation dir',
+             'chooseFillColor': 'Choose Fill Color',
+             'chooseLineColor': 'Choose Line Color',
+             'closeCur': 'Close',
+             'closeCurDetail': 'Close the current file',
+             'copyAllBoxes': 'Copy All',
+             'copyAllBoxesDetail': 'Copy all boxes to clipboard',
+             'copyBox': 'Copy',
+             'copyBoxDetail': 'Copy selected box to clipboard',
+             'copyPrevBounding': 'Copy previous Bounding Boxes in the current image',
+             'crtBox': 'Create RectBox',
+             'crtBoxDetail': 'Draw a new box',
+             'delBox': 'Delete RectBox',
+             'delBoxDetail': 'Remove the box',
+             'deleteImg': 'Delete current image',
+             'deleteImgDetail': 'Delete the current image',
+             'displayLabel': 'Display Labels',
+             'displayResolution': 'Display Resolution',
+             'displayResolutionAuto': 'Auto (Screen and Memory)',
+             'displayResolutionFull': 'Full Resolution',
+             'drawSquares': 'Draw Squares',
+             'dupBox': 'Duplicate RectBox',
+             'dupBoxDetail': 'Create a duplicate of the selected box',
+             'editBox': '&Edit RectBox',
+             'editBoxDetail': 'Move and edit Boxs',
+             'editLabel': 'Edit Label',
+             'editLabelDetail': 'Modify the label of the selected Box',
+             'fileList': 'File List',
+             'files': 'Files',
+             'filterAll': 'All images',
+             'filterBoxCount': 'Box count',
+             'filterClass': 'Contains class',
+             'filterHasLabels': 'Labeled, not verified',
+             'filterNoLabels': 'No labels',
+             'filterValueTip': 'Class name, or a box count such as 3, 2-5 or 5-',
+             'filterVerified': 'Verified',
+             'fitWidth': 'Fit Width',
+             'fitWidthDetail': 'Zoom follows window width',
+             'fitWin': 'Fit Window',
+             'fitWinDetail': 'Zoom follows window size',
+             'galleryMode': 'Gallery Mode',
+             'galleryModeDetail': 'Toggle full-screen gallery view',
+             'galleryView': 'Gallery',
+             'hideAllBox': '&Hide RectBox',
+             'hideAllBoxDetail': 'Hide all bounding boxes',
+             'iconSize': 'Icon Size',
+             'iconSizeAuto': 'Auto (DPI-based)',
+             'iconSizeLarge': 'Large (28px)',
+             'iconSizeMedium': 'Medium (22px)',
+             'iconSizeSmall': 'Small (16px)',
+             'iconSizeXLarge': 'Extra Large (36px)',
+             'info': 'Information',
+             'labels': 'Labels',
+             'leftGallery': 'Gallery',
+             'lightWidgetTitle': 'Image Brightness',
+             'lightbrighten': 'Brighten',
+             'lightbrightenDetail': 'Increase Image Brightness',
+             'lightdarken': 'Darken',
+             'lightdarkenDetail': 'Decrease Image Brightness',
+             'lightreset': 'Original Brightness',
+             'lightresetDetail': 'Restore original brightness',
+             'listView': 'List',
+             'menu_edit': '&Edit',
+             'menu_file': '&File',
+             'menu_help': '&Help',
+             'menu_openRecent': 'Open &Recent',
+             'menu_view': '&View',
+             'nextImg': 'Next Image',
+             'nextImgDetail': 'Open the next Image',
+             'openAnnotation': 'Open Annotation',
+             'openAnnotationDetail': 'Open an annotation file',
+             'openDir': 'Open Dir',
+             'openFile': 'Open',
+             'openFileDetail': 'Open image or label file',
+             'originalsize': 'Original size',
+             'originalsizeDetail': 'Zoom to original size',
+             'pasteBox': 'Paste',
+             'pasteBoxDetail': 'Paste box from clipboard',
+             'prevImg': 'Prev Image',
+             'prevImgDetail': 'Open the previous Image',
+             'quit': 'Quit',
+             'quitApp': 'Quit application',
+             'redo': 'Redo',
+             'redoDetail': 'Redo the last undone action',
+             'resetAll': 'Reset All',
+             'resetAllDetail': 'Reset All',
+             'save': 'Save',
+             'saveAs': 'Save As',
+             'saveAsDetail': 'Save the labels to a different file',
+             'saveDetail': 'Save the labels to a file',
+             'shapeFillColor': 'Shape Fill Color',
+             'shapeFillColorDetail': 'Change the fill color for this specific shape',
+             'shapeLineColor': 'Shape Line Color',
+             'shapeLineColorDetail': 'Change the line color for this specific shape',
+             'shortcut': 'Keyboard shortcuts',
+             'showAllBox': '&Show RectBox',
+             'showAllBoxDetail': 'Show all bounding boxes',
+             'showHide': 'Show/Hide Label Panel',
+             'singleClsMode': 'Single Class Mode',
+             'tiledView': 'Tiled View for Large Images',
+             'tiledViewDetail': 'Show large images at native resolution by decoding only the visible tiles',
+             'trashImg': 'Move selected images to trash',
+             'trashImgDetail': 'Move the selected images and their annotations to the trash folder',
+             'tutorialChrome': 'Tutorial(Chrome)',
+             'tutorialDefault': 'Tutorial',
+             'tutorialDetail': 'Show demo',
+             'undo': 'Undo',
+             'undoDetail': 'Undo the last action',
+             'useDefaultLabel': 'Use default label',
+             'useDifficult': 'difficult',
+             'verifyImg': 'Verify Image',
+             'verifyImgDetail': 'Verify Image',
+             'zoomin': 'Zoom In',
+             'zoominDetail': 'Increase zoom level',
+             'zoomout': 'Zoom Out',
+             'zoomoutDetail': 'Decrease zoom level'},
+ 'strings-ja-JP': {'advancedMode': '上級者向け機能',
+                   'advancedModeDetail': '上級者向け機能を使います。',
+                   'autoSave1m': '1 minute',
+                   'autoSave2m': '2 minutes',
+                   'autoSave30s': '30 seconds',
+                   'autoSave5m': '5 minutes',
+                   'autoSaveEnabled': 'Timed Auto-save',
+                   'autoSaveEnabledDetail': 'Automatically save at regular intervals',
+                   'autoSaveInterval': 'Auto-save Interval',
+                   'autoSaveMode': '自動で保存する',
+                   'autoSaveModeDetail': 'Automatically save when switching to next/previous image',
+                   'boxLabelText': '矩形ラベル',
+                   'boxLineColor': '線の色の編集',
+                   'boxLineColorDetail': '色の編集を行います。',
+                   'canvasBackend': 'Canvas Backend',
+                   'canvasBackendOpenGL': 'OpenGL',
+                   'canvasBackendRaster': 'Raster (CPU)',
+                   'canvasBackendRestart': 'The canvas backend change takes effect after restarting',
+                   'changeSaveDir': '保存先を変更する',
+                   'changeSaveFormat': '保存するデータのフォーマットを変更します。',
+                   'changeSavedAnnotationDir': 'Change default saved Annotation dir',
+                   'chooseFillColor': '塗りつぶす色の編集',
+                   'chooseLineColor': '線の色の編集',
+                   'closeCur': 'このファイルを閉じる',
+                   'closeCurDetail': 'Close the current file',
+                   'copyAllBoxes': 'Copy All',
+                   'copyAllBoxesDetail': 'Copy all boxes to clipboard',
+                   'copyBox': 'Copy',
+                   'copyBoxDetail': 'Copy selected box to clipboard',
+                   'copyPrevBounding': '前の画像の矩形ラベルをこの画像にコピー',
+                   'crtBox': '矩形を作成する',
+                   'crtBoxDetail': '矩形を描画します。',
+                   'delBox': '矩形を削除する',
+                   'delBoxDetail': 'Remove the box',
+                   'deleteImg': 'この画像を削除する',
+                   'deleteImgDetail': 'Delete the current image',
+                   'displayLabel': 'ラベルを表示する',
+                   'displayResolution': 'Display Resolution',
+                   'displayResolutionAuto': 'Auto (Screen and Memory)',
+                   'displayResolutionFull': 'Full Resolution',
+                   'drawSquares': '四角形を書く',
+                   'dupBox': '矩形を複製する',
+                   'dupBoxDetail': 'Create a duplicate of the selected box',
+                   'editBox': '矩形を編集する(&E)',
+                   'editBoxDetail': 'Move and edit Boxs',
+                   'editLabel': 'ラベルを編集する',
+                   'editLabelDetail': '選択した矩形のラベル名を変更します。',
+                   'fileList': 'ファイル一覧',
+                   'files': 'ファイル',
+                   'filterAll': 'All images',
+                   'filterBoxCount': 'Box count',
+                   'filterClass': 'Contains class',
+                   'filterHasLabels': 'Labeled, not verified',
+                   'filterNoLabels': 'No labels',
+                   'filterValueTip': 'Class name, or a box count such as 3, 2-5 or 5-',
+                   'filterVerified': 'Verified',
+                   'fitWidth': 'ウィンドウの幅に合わせる',
+                   'fitWidthDetail': 'ウインドウの幅に合わせて拡大します。',
+                   'fitWin': 'ウィンドウに合わせる',
+                   'fitWinDetail': 'ウィンドウサイズに合わせて拡大します。',
+                   'galleryMode': 'Gallery Mode',
+                   'galleryModeDetail': 'Toggle full-screen gallery view',
+                   'galleryView': 'Gallery',
+                   'hideAll': 'すべての図形を非表示にする',
+                   'hideAllBox': '矩形を非表示にする(&H)',
+                   'hideAllBoxDetail': 'Hide all bounding boxes',
+                   'iconSize': 'Icon Size',
+                   'iconSizeAuto': 'Auto (DPI-based)',
+                   'iconSizeLarge': 'Large (28px)',
+                   'iconSizeMedium': 'Medium (22px)',
+                   'iconSizeSmall': 'Small (16px)',
+                   'iconSizeXLarge': 'Extra Large (36px)',
+                   'info': 'LabelImgについて',
+                   'labels': 'ラベル一覧',
+                   'leftGallery': 'Gallery',
+                   'lightWidgetTitle': '画像の明るさ',
+                   'lightbrighten': '明るくする',
+                   'lightbrightenDetail': '画像の明るさを上げる',
+                   'lightdarken': '暗くする',
+                   'lightdarkenDetail': '画像の明るさを下げる',
+                   'lightreset': '元の明るさ',
+                   'lightresetDetail': '元の明るさを復元する',
+                   'listView': 'List',
+                   'menu_edit': '編集(&E)',
+                   'menu_file': 'ファイル(&F)',
+                   'menu_help': 'ヘルプ(&H)',
+                   'menu_openRecent': '最近開いたファイル(&R)',
+                   'menu_view': '表示(&V)',
+                   'nextImg': '次の画像',
+                   'nextImgDetail': '次の画像を開きます。',
+                   'openAnnotation': 'アノテーションを開く',
+                   'openAnnotationDetail': 'アノテーションファイルを開きます。',
+                   'openDir': 'ディレクトリを開く',
+                   'openFile': 'ファイルを開く',
+                   'openFileDetail': '画像かラベルファイルを開きます。',
+                   'originalsize': '原寸に戻す',
+                   'originalsizeDetail': 'Zoom to original size',
+                   'pasteBox': 'Paste',
+                   'pasteBoxDetail': 'Paste box from clipboard',
+                   'prevImg': '前の画像',
+                   'prevImgDetail': '前の画像を開きます。',
+                   'quit': 'アプリを終了',
+                   'quitApp': 'このアプリを終了します。',
+                   'redo': 'Redo',
+                   'redoDetail': 'Redo the last undone action',
+                   'resetAll': 'すべて初期化する',
+                   'resetAllDetail': 'データをすべて初期状態に戻します。',
+                   'save': '保存する',
+                   'saveAs': '名前を付けて保存',
+                   'saveAsDetail': 'ファイルに名前を付けて現在の編集を保存します。',
+                   'saveDetail': '現在の編集を保存します。',
+                   'shapeFillColor': 'Shape Fill Color',
+                   'shapeFillColorDetail': 'Change the fill color for this specific shape',
+                   'shapeLineColor': 'Shape Line Color',
+                   'shapeLineColorDetail': 'Change the line color for this specific shape',
+                   'shortcut': 'ショートカット一覧を見る（英語）',
+                   'showAllBox': '矩形を表示する(&S)',
+                   'showAllBoxDetail': 'Show all bounding boxes',
+                   'showHide': 'Show/Hide Label Panel',
+                   'singleClsMode': '単一のラベルだけをアノテーションする',
+                   'tiledView': 'Tiled View for Large Images',
+                   'tiledViewDetail': 'Show large images at native resolution by decoding only the visible tiles',
+                   'trashImg': 'Move selected images to trash',
+                   'trashImgDetail': 'Move the selected images and their annotations to the trash folder',
+                   'tutorialChrome': 'Chromeでチュートリアル動画を見る',
+                   'tutorialDefault': 'チュートリアル動画を見る',
+                   'tutorialDetail': 'LabelImgのデモ動画を見ます。',
+                   'undo': 'Undo',
+                   'undoDetail': 'Undo the last action',
+                   'useDefaultLabel': '指定されたラベル名を使う',
+                   'useDifficult': 'difficult',
+                   'verifyImg': '画像を検証する',
+                   'verifyImgDetail': '画像を検証します。',
+                   'viewAll': 'すべての図形を表示する',
+                   'zoomin': '拡大',
+                   'zoominDetail': 'Increase zoom level',
+                   'zoomout': '縮小',
+                   'zoomoutDetail': 'Decrease zoom level'},
+ 'strings-zh-CN': {'advancedMode': '专家模式',
+                   'advancedModeDetail': '切换到专家模式',
+                   'autoSave1m': '1 minute',
+                   'autoSave2m': '2 minutes',
+                   'autoSave30s': '30 seconds',
+                   'autoSave5m': '5 minutes',
+                   'autoSaveEnabled': 'Timed Auto-save',
+                   'autoSaveEnabledDetail': 'Automatically save at regular intervals',
+                   'autoSaveInterval': 'Auto-save Interval',
+                   'autoSaveMode': '自动保存模式',
+                   'autoSaveModeDetail': 'Automatically save when switching to next/previous image',
+                   'boxLabelText': '区块的标签',
+                   'boxLineColor': '区块线条颜色',
+                   'boxLineColorDetail': '选择线框颜色',
+                   'canvasBackend': 'Canvas Backend',
+                   'canvasBackendOpenGL': 'OpenGL',
+                   'canvasBackendRaster': 'Raster (CPU)',
+                   'canvasBackendRestart': 'The canvas backend change takes effect after restarting',
+                   'changeSaveDir': '改变存放目录',
+                   'changeSaveFormat': '更改存储格式',
+                   'changeSavedAnnotationDir': '更改保存标签文件的预设目录',
+                   'chooseFillColor': '选择填充颜色',
+                   'chooseLineColor': '选择线条颜色',
+                   'closeCur': '关闭文件',
+                   'closeCurDetail': '关闭当前文件',
+                   'copyAllBoxes': 'Copy All',
+                   'copyAllBoxesDetail': 'Copy all boxes to clipboard',
+                   'copyBox': 'Copy',
+                   'copyBoxDetail': 'Copy selected box to clipboard',
+                   'copyPrevBounding': '复制当前图像中的上一个边界框',
+                   'crtBox': '创建区块',
+                   'crtBoxDetail': '创建一个新的区块',
+                   'delBox': '删除选择的区块',
+                   'delBoxDetail': '删除区块',
+                   'deleteImg': '删除图像',
+                   'deleteImgDetail': '删除当前图像',
+                   'displayLabel': '显示类别',
+                   'displayResolution': 'Display Resolution',
+                   'displayResolutionAuto': 'Auto (Screen and Memory)',
+                   'displayResolutionFull': 'Full Resolution',
+                   'drawSquares': '绘制正方形',
+                   'dupBox': '复制区块',
+                   'dupBoxDetail': '复制区块',
+                   'editBox': '编辑区块',
+                   'editBoxDetail': '编辑区块',
+                   'editLabel': '编辑标签',
+                   'editLabelDetail': '修改当前所选的区块颜色',
+                   'fileList': '文件列表',
+                   'files': '文件',
+                   'filterAll': '全部图像',
+                   'filterBoxCount': '标注框数量',
+                   'filterClass': '包含类别',
+                   'filterHasLabels': '已标注，未验证',
+                   'filterNoLabels': '未标注',
+                   'filterValueTip': '类别名称，或标注框数量，如 3、2-5 或 5-',
+                   'filterVerified': '已验证',
+                   'fitWidth': '缩放到跟当前画面一样宽',
+                   'fitWidthDetail': '调整宽度适应到窗口宽度',
+                   'fitWin': '调整到窗口大小',
+                   'fitWinDetail': '缩放到当前窗口大小',
+                   'galleryMode': 'Gallery Mode',
+                   'galleryModeDetail': 'Toggle full-screen gallery view',
+                   'galleryView': 'Gallery',
+                   'hideAllBox': '隐藏所有区块',
+                   'hideAllBoxDetail': '隐藏所有区块',
+                   'iconSize': 'Icon Size',
+                   'iconSizeAuto': 'Auto (DPI-based)',
+                   'iconSizeLarge': 'Large (28px)',
+                   'iconSizeMedium': 'Medium (22px)',
+                   'iconSizeSmall': 'Small (16px)',
+                   'iconSizeXLarge': 'Extra Large (36px)',
+                   'info': '版本信息',
+                   'labels': '标签',
+                   'leftGallery': 'Gallery',
+                   'lightWidgetTitle': '图像亮度',
+                   'lightbrighten': '提亮',
+                   'lightbrightenDetail': '增加图像亮度',
+                   'lightdarken': '变暗',
+                   'lightdarkenDetail': '降低图像亮度',
+                   'lightreset': '原始亮度',
+                   'lightresetDetail': '恢复原来的亮度',
+                   'listView': 'List',
+                   'menu_edit': '编辑(&E)',
+                   'menu_file': '文件(&F)',
+                   'menu_help': '帮助(&H)',
+                   'menu_openRecent': '最近打开(&R)',
+                   'menu_view': '查看(&V)',
+                   'nextImg': '下一个图像',
+                   'nextImgDetail': '下一个图像',
+                   'openAnnotation': '开启标签',
+                   'openAnnotationDetail': '打开标签文件',
+                   'openDir': '打开目录',
+                   'openFile': '打开文件',
+                   'openFileDetail': '打开图像文件',
+                   'originalsize': '原始大小',
+                   'originalsizeDetail': '放大到原始大小',
+                   'pasteBox': 'Paste',
+                   'pasteBoxDetail': 'Paste box from clipboard',
+                   'prevImg': '上一个图像',
+                   'prevImgDetail': '上一个图像',
+                   'quit': '退出',
+                   'quitApp': '退出程序',
+                   'redo': 'Redo',
+                   'redoDetail': 'Redo the last undone action',
+                   'resetAll': '全部重置',
+                   'resetAllDetail': '重置所有设定',
+                   'save': '保存',
+                   'saveAs': '另存为',
+                   'saveAsDetail': '將标签保存到其他文件',
+                   'saveDetail': '保存标签文件',
+                   'shapeFillColor': '填充颜色',
+                   'shapeFillColorDetail': '更改填充颜色',
+                   'shapeLineColor': '形状线条颜色',
+                   'shapeLineColorDetail': '更改线条颜色',
+                   'shortcut': '快捷键',
+                   'showAllBox': '显示所有区块',
+                   'showAllBoxDetail': '显示所有区块',
+                   'showHide': '显示/隐藏标签',
+                   'singleClsMode': '单一类别模式',
+                   'tiledView': 'Tiled View for Large Images',
+                   'tiledViewDetail': 'Show large images at native resolution by decoding only the visible tiles',
+                   'trashImg': '将所选图像移到回收站',
+                   'trashImgDetail': '将所选图像及其标注移到回收站文件夹',
+                   'tutorialChrome': 'YouTube教学(Chrome)',
+                   'tutorialDefault': 'YouTube教学',
+                   'tutorialDetail': '显示示范内容',
+                   'undo': 'Undo',
+                   'undoDetail': 'Undo the last action',
+                   'useDefaultLabel': '使用预设标签',
+                   'useDifficult': '有难度的',
+                   'verifyImg': '验证图像',
+                   'verifyImgDetail': '验证图像',
+                   'zoomin': '放大画面',
+                   'zoominDetail': '放大画面',
+                   'zoomout': '缩小画面',
+                   'zoomoutDetail': '缩小画面'},
+ 'strings-zh-TW': {'advancedMode': '進階模式',
+                   'advancedModeDetail': '切到進階模式',
+                   'autoSave1m': '1 minute',
+                   'autoSave2m': '2 minutes',
+                   'autoSave30s': '30 seconds',
+                   'autoSave5m': '5 minutes',
+                   'autoSaveEnabled': 'Timed Auto-save',
+                   'autoSaveEnabledDetail': 'Automatically save at regular intervals',
+                   'autoSaveInterval': 'Auto-save Interval',
+                   'autoSaveMode': '自動儲存模式',
+                   'autoSaveModeDetail': 'Automatically save when switching to next/previous image',
+                   'boxLabelText': '區塊的標籤',
+                   'boxLineColor': '日期分隔線顏色',
+                   'boxLineColorDetail': '選擇框線顏色',
+                   'canvasBackend': 'Canvas Backend',
+                   'canvasBackendOpenGL': 'OpenGL',
+                   'canvasBackendRaster': 'Raster (CPU)',
+                   'canvasBackendRestart': 'The canvas backend change takes effect after restarting',
+                   'changeSaveDir': '改變存放目錄',
+                   'changeSaveFormat': '更改儲存格式',
+                   'changeSavedAnnotationDir': '更改預設標籤存的目錄',
+                   'chooseFillColor': 'Choose Fill Color',
+                   'chooseLineColor': 'Choose Line Color',
+                   'closeCur': '關閉',
+                   'closeCurDetail': '關閉目前檔案',
+                   'copyAllBoxes': 'Copy All',
+                   'copyAllBoxesDetail': 'Copy all boxes to clipboard',
+                   'copyBox': 'Copy',
+                   'copyBoxDetail': 'Copy selected box to clipboard',
+                   'copyPrevBounding': '複製當前圖像中的上一個邊界框',
+                   'crtBox': '創建區塊',
+                   'crtBoxDetail': '畫一個區塊',
+                   'delBox': '刪除選取區塊',
+                   'delBoxDetail': '刪除區塊',
+                   'deleteImg': '刪除圖像',
+                   'deleteImgDetail': '刪除目前圖像',
+                   'displayLabel': '顯示類別',
+                   'displayResolution': 'Display Resolution',
+                   'displayResolutionAuto': 'Auto (Screen and Memory)',
+                   'displayResolutionFull': 'Full Resolution',
+                   'drawSquares': 'Draw Squares',
+                   'dupBox': '複製區塊',
+                   'dupBoxDetail': '複製區塊',
+                   'editBox': '&Edit RectBox',
+                   'editBoxDetail': 'Move and edit Boxs',
+                   'editLabel': '編輯標籤',
+                   'editLabelDetail': '修改所選區塊的標籤',
+                   'fileList': '檔案清單',
+                   'files': '檔案',
+                   'filterAll': '全部圖像',
+                   'filterBoxCount': '標註框數量',
+                   'filterClass': '包含類別',
+                   'filterHasLabels': '已標註，未驗證',
+                   'filterNoLabels': '未標註',
+                   'filterValueTip': '類別名稱，或標註框數量，如 3、2-5 或 5-',
+                   'filterVerified': '已驗證',
+                   'fitWidth': '縮放到跟畫面一樣寬',
+                   'fitWidthDetail': '調整到窗口寬度',
+                   'fitWin': '調整到跟窗口一樣大小',
+                   'fitWinDetail': '縮放到窗口一樣',
+                   'galleryMode': 'Gallery Mode',
+                   'galleryModeDetail': 'Toggle full-screen gallery view',
+                   'galleryView': 'Gallery',
+                   'hideAllBox': '&Hide RectBox',
+                   'hideAllBoxDetail': '隱藏所有區塊',
+                   'iconSize': 'Icon Size',
+                   'iconSizeAuto': 'Auto (DPI-based)',
+                   'iconSizeLarge': 'Large (28px)',
+                   'iconSizeMedium': 'Medium (22px)',
+                   'iconSizeSmall': 'Small (16px)',
+                   'iconSizeXLarge': 'Extra Large (36px)',
+                   'info': '資訊',
+                   'labels': '標籤',
+                   'leftGallery': 'Gallery',
+                   'lightWidgetTitle': '影像量度',
+                   'lightbrighten': '變亮',
+                   'lightbrightenDetail': '增加影像亮度',
+                   'lightdarken': '變暗',
+                   'lightdarkenDetail': '降低影像亮度',
+                   'lightreset': '原本亮度',
+                   'lightresetDetail': '恢復原本亮度',
+                   'listView': 'List',
+                   'menu_edit': '編輯(&E)',
+                   'menu_file': '檔案(&F)',
+                   'menu_help': '說明(&H)',
+                   'menu_openRecent': '最近開啟(&R)',
+                   'menu_view': '檢視(&V)',
+                   'nextImg': '下一張圖片',
+                   'nextImgDetail': '下一個圖像',
+                   'openAnnotation': '開啟標籤',
+                   'openAnnotationDetail': '打開標籤文件',
+                   'openDir': '開啟目錄',
+                   'openFile': '開啟檔案',
+                   'openFileDetail': '打開圖像',
+                   'originalsize': '原始大小',
+                   'originalsizeDetail': '放大到原始大小',
+                   'pasteBox': 'Paste',
+                   'pasteBoxDetail': 'Paste box from clipboard',
+                   'prevImg': '上一個圖像',
+                   'prevImgDetail': '上一個圖像',
+                   'quit': '結束',
+                   'quitApp': '離開本程式',
+                   'redo': 'Redo',
+                   'redoDetail': 'Redo the last undone action',
+                   'resetAll': '重置',
+                   'resetAllDetail': '重設所有設定',
+                   'save': '儲存',
+                   'saveAs': '另存為',
+                   'saveAsDetail': '將標籤保存到其他文件',
+                   'saveDetail': '將標籤存到',
+                   'shapeFillColor': '填充顏色',
+                   'shapeFillColorDetail': '更改填充顏色',
+                   'shapeLineColor': '形狀線條顏色',
+                   'shapeLineColorDetail': '更改線條顏色',
+                   'shortcut': '快捷鍵',
+                   'showAllBox': '&Show RectBox',
+                   'showAllBoxDetail': '顯示所有區塊',
+                   'showHide': '顯示/隱藏標籤',
+                   'singleClsMode': '單一類別模式',
+                   'tiledView': 'Tiled View for Large Images',
+                   'tiledViewDetail': 'Show large images at native resolution by decoding only the visible tiles',
+                   'trashImg': '將所選圖像移到回收站',
+                   'trashImgDetail': '將所選圖像及其標註移到回收站資料夾',
+                   'tutorialChrome': 'YouTube教學(Chrome)',
+                   'tutorialDefault': 'YouTube教學',
+                   'tutorialDetail': '顯示示範內容',
+                   'undo': 'Undo',
+                   'undoDetail': 'Undo the last action',
+                   'useDefaultLabel': '使用預設標籤',
+                   'useDifficult': '有難度的',
+                   'verifyImg': '驗證圖像',
+                   'verifyImgDetail': '驗證圖像',
+                   'zoomin': '放大畫面',
+                   'zoominDetail': '放大',
+                   'zoomout': '縮小畫面',
+                   'zoomoutDetail': '畫面放大'}}
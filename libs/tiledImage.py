@@ -0,0 +1,224 @@
+# libs/tiledImage.py
+"""Tiled, multi-resolution image source for gigapixel and aerial imagery.
+
+Instead of decoding the whole image, only the tiles intersecting the
+visible area are decoded (with ``QImageReader.setClipRect``) at the
+pyramid level matching the current canvas scale.
+"""
+
+try:
+    from PyQt5.QtGui import QImage, QImageIOHandler, QImageReader, QPixmap
+    from PyQt5.QtCore import Qt, QSize, QRect, QRectF, QObject, pyqtSignal, QRunnable, QThreadPool
+except ImportError:
+    from PyQt4.QtGui import QImage, QImageIOHandler, QImageReader, QPixmap
+    from PyQt4.QtCore import Qt, QSize, QRect, QRectF, QObject, pyqtSignal, QRunnable, QThreadPool
+
+import math
+from collections import OrderedDict
+
+TILE_SIZE = 512
+MAX_CACHED_TILES = 256
+OVERVIEW_DIM = 1024
+
+
+class TileCache:
+    """LRU cache for decoded tiles keyed by (level, col, row)."""
+
+    def __init__(self, max_size=MAX_CACHED_TILES):
+        self.max_size = max_size
+        self._cache = OrderedDict()
+
+    def get(self, key):
+        """Retrieve a tile from the cache (O(1) with LRU update)."""
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            return self._cache[key]
+        return None
+
+    def put(self, key, tile):
+        """Store a tile, evicting the least recently used one if full."""
+        if key in self._cache:
+            self._cache.move_to_end(key)
+        elif len(self._cache) >= self.max_size:
+            self._cache.popitem(last=False)
+        self._cache[key] = tile
+
+    def clear(self):
+        """Drop all cached tiles."""
+        self._cache.clear()
+
+    def __contains__(self, key):
+        return key in self._cache
+
+    def __len__(self):
+        return len(self._cache)
+
+
+def decode_region(path, rect, scaled_size=None):
+    """Decode only ``rect`` of the image at ``path``, optionally downscaled."""
+    reader = QImageReader(path)
+    reader.setClipRect(rect)
+    if scaled_size is not None:
+        reader.setScaledSize(scaled_size)
+    return reader.read()
+
+
+class TileLoaderSignals(QObject):
+    """Signals for async tile decoding."""
+    tile_ready = pyqtSignal(object, QImage)  # (level, col, row), image
+
+
+class TileLoaderWorker(QRunnable):
+    """Worker decoding a single tile in a background thread."""
+
+    def __init__(self, path, key, source_rect, scaled_size):
+        super().__init__()
+        self.path = path
+        self.key = key
+        self.source_rect = source_rect
+        self.scaled_size = scaled_size
+        self.signals = TileLoaderSignals()
+
+    def run(self):
+        """Decode the tile region and hand it back to the GUI thread."""
+        try:
+            image = decode_region(self.path, self.source_rect, self.scaled_size)
+            if not image.isNull():
+                self.signals.tile_ready.emit(self.key, image)
+        except Exception:
+            pass
+
+
+class TiledImage(QObject):
+    """Pyramid of tiles over an image that is never fully decoded.
+
+    Level 0 is native resolution, each further level halves the
+    resolution. Tiles are addressed by ``(level, col, row)`` and cover
+    ``TILE_SIZE * 2**level`` source pixels per side.
+    """
+
+    tile_ready = pyqtSignal()
+
+    def __init__(self, path, tile_size=TILE_SIZE, max_cached_tiles=MAX_CACHED_TILES, parent=None):
+        super().__init__(parent)
+        self.path = path
+        self.tile_size = tile_size
+        reader = QImageReader(path)
+        self._size = reader.size()
+        self.cache = TileCache(max_cached_tiles)
+        self._pending = set()
+        self._thread_pool = QThreadPool()
+        self._thread_pool.setMaxThreadCount(2)
+
+        longest = max(self._size.width(), self._size.height(), 1)
+        self.level_count = max(1, int(math.ceil(math.log(max(longest / tile_size, 1), 2))) + 1)
+
+    @staticmethod
+    def supports(path):
+        """Check that ``path`` can be decoded region by region.
+
+        Images with an EXIF orientation are rejected, since the clip rect
+        is applied before the auto transform.
+        """
+        reader = QImageReader(path)
+        if not reader.size().isValid():
+            return False
+        try:
+            return reader.transformation() == QImageIOHandler.TransformationNone
+        except AttributeError:
+            return True
+
+    def size(self):
+        """Native size of the image."""
+        return QSize(self._size)
+
+    def width(self):
+        return self._size.width()
+
+    def height(self):
+        return self._size.height()
+
+    def overview(self, max_dim=OVERVIEW_DIM):
+        """Decode a downsampled copy of the whole image, at most ``max_dim`` per side."""
+        reader = QImageReader(self.path)
+        if self._size.width() > max_dim or self._size.height() > max_dim:
+            reader.setScaledSize(self._size.scaled(max_dim, max_dim, Qt.KeepAspectRatio))
+        return reader.read()
+
+    def level_for_scale(self, scale):
+        """Coarsest pyramid level that still has at least one source pixel per screen pixel."""
+        if scale <= 0:
+            return self.level_count - 1
+        level = int(math.floor(math.log(1.0 / scale, 2))) if scale < 1.0 else 0
+        return min(max(level, 0), self.level_count - 1)
+
+    def tile_rect(self, level, col, row):
+        """Source rectangle (in native image pixels) covered by a tile."""
+        span = self.tile_size << level
+        rect = QRect(col * span, row * span, span, span)
+        return rect.intersected(QRect(0, 0, self._size.width(), self._size.height()))
+
+    def tile_scaled_size(self, level, source_rect):
+        """Size of the decoded tile for ``source_rect`` at ``level``."""
+        factor = 1 << level
+        return QSize(max(1, int(math.ceil(source_rect.width() / factor))),
+                     max(1, int(math.ceil(source_rect.height() / factor))))
+
+    def visible_tiles(self, rect, level):
+        """Keys of the tiles at ``level`` intersecting ``rect`` (native coordinates)."""
+        span = self.tile_size << level
+        rect = QRectF(rect).intersected(QRectF(0, 0, self._size.width(), self._size.height()))
+        if rect.isEmpty():
+            return []
+        first_col = int(rect.left()) // span
+        last_col = int(math.ceil(rect.right())) // span
+        first_row = int(rect.top()) // span
+        last_row = int(math.ceil(rect.bottom())) // span
+        max_col = (self._size.width() - 1) // span
+        max_row = (self._size.height() - 1) // span
+        return [(level, col, row)
+                for row in range(first_row, min(last_row, max_row) + 1)
+                for col in range(first_col, min(last_col, max_col) + 1)]
+
+    def load_tile(self, key):
+        """Decode a tile synchronously and return it as a QImage."""
+        level, col, row = key
+        source_rect = self.tile_rect(level, col, row)
+        scaled_size = self.tile_scaled_size(level, source_rect) if level else None
+        return decode_region(self.path, source_rect, scaled_size)
+
+    def tile(self, key):
+        """Return the cached tile pixmap, scheduling an async decode on a miss."""
+        pixmap = self.cache.get(key)
+        if pixmap is None:
+            self.request_tile(key)
+        return pixmap
+
+    def request_tile(self, key):
+        """Queue ``key`` for background decoding unless already cached or pending."""
+        if key in self._pending or key in self.cache:
+            return
+        self._pending.add(key)
+        level, col, row = key
+        source_rect = self.tile_rect(level, col, row)
+        scaled_size = self.tile_scaled_size(level, source_rect) if level else None
+        worker = TileLoaderWorker(self.path, key, source_rect, scaled_size)
+        worker.signals.tile_ready.connect(self._on_tile_loaded)
+        self._thread_pool.start(worker)
+
+    def cancel_pending(self):
+        """Drop queued decodes that have not started yet (e.g. after a zoom change)."""
+        self._thread_pool.clear()
+        self._pending.clear()
+
+    def _on_tile_loaded(self, key, image):
+        """Convert a decoded tile to a pixmap on the GUI thread and cache it."""
+        self._pending.discard(key)
+        self.cache.put(key, QPixmap.fromImage(image))
+        self.tile_ready.emit()
+
+    def close(self):
+        """Stop background decoding and release cached tiles."""
+        self.cancel_pending()
+        self._thread_pool.waitForDone()
+        self.cache.clear()
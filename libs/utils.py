@@ -1,6 +1,6 @@
 from math import sqrt
 from libs.ustr import ustr
-import hashlib
+from libs.labelColors import label_colors
 import re
 import sys
 
@@ -82,12 +82,8 @@ def format_shortcut(text):
 
 
 def generate_color_by_text(text):
-    s = ustr(text)
-    hash_code = int(hashlib.sha256(s.encode('utf-8')).hexdigest(), 16)
-    r = int((hash_code / 255) % 255)
-    g = int((hash_code / 65025) % 255)
-    b = int((hash_code / 16581375) % 255)
-    return QColor(r, g, b, 100)
+    """Colour of a label, shared with other users of the label; do not modify it."""
+    return label_colors.color(ustr(text))
 
 
 def have_qstring():
@@ -99,15 +95,35 @@ def util_qt_strlistclass():
     return QStringList if have_qstring() else list
 
 
+def natural_sort_key(key=lambda s:s):
+    """
+    Return a sort key function giving natural alphanumeric order.
+    """
+    convert = lambda text: int(text) if text.isdigit() else text
+    return lambda s: [convert(c) for c in re.split('([0-9]+)', key(s))]
+
+
 def natural_sort(list, key=lambda s:s):
     """
     Sort the list into natural alphanumeric order.
     """
-    def get_alphanum_key_func(key):
-        convert = lambda text: int(text) if text.isdigit() else text
-        return lambda s: [convert(c) for c in re.split('([0-9]+)', key(s))]
-    sort_key = get_alphanum_key_func(key)
-    list.sort(key=sort_key)
+    list.sort(key=natural_sort_key(key))
+
+
+def natural_insert_index(sorted_list, item, key=lambda s:s):
+    """
+    Index at which item keeps a natural_sort()ed list sorted, by binary search.
+    """
+    sort_key = natural_sort_key(key)
+    item_key = sort_key(item)
+    low, high = 0, len(sorted_list)
+    while low < high:
+        middle = (low + high) // 2
+        if sort_key(sorted_list[middle]) <= item_key:
+            low = middle + 1
+        else:
+            high = middle
+    return low
 
 
 # QT4 has a trimmed method, in QT5 this is called strip
@@ -0,0 +1,119 @@
+"""Tests for the in-memory annotation index behind image filtering."""
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+
+if 'QT_QPA_PLATFORM' not in os.environ:
+    os.environ['QT_QPA_PLATFORM'] = 'offscreen'
+
+dir_name = os.path.abspath(os.path.dirname(__file__))
+sys.path.insert(0, os.path.join(dir_name, '..'))
+
+from libs.annotationIndex import (AnnotationIndex, ImageFilter, FILTER_ALL, FILTER_NO_LABELS, FILTER_HAS_LABELS,
+                                  FILTER_CLASS, FILTER_BOX_COUNT, parse_count_range, read_annotation_summary,
+                                  yolo_class_names)
+from libs.galleryWidget import AnnotationStatus
+from libs.pascal_voc_io import PascalVocWriter
+
+
+class TestParseCountRange(unittest.TestCase):
+    """Test cases for reading box count ranges typed by the user."""
+
+    def test_ranges(self):
+        """Test single counts, closed and open ranges."""
+        self.assertEqual(parse_count_range('3'), (3, 3))
+        self.assertEqual(parse_count_range(' 2 - 5 '), (2, 5))
+        self.assertEqual(parse_count_range('5-'), (5, None))
+        self.assertEqual(parse_count_range('5+'), (5, None))
+        self.assertEqual(parse_count_range('-4'), (0, 4))
+
+    def test_malformed(self):
+        """Test that text that is no range gives None."""
+        for text in ('', 'x', '5-2', '1-2-3'):
+            self.assertIsNone(parse_count_range(text), text)
+
+
+class TestAnnotationIndex(unittest.TestCase):
+    """Test cases for keeping the reverse sets in step with updates."""
+
+    def setUp(self):
+        self.index = AnnotationIndex()
+        self.index.update('a.jpg', AnnotationStatus.NO_LABELS, [])
+        self.index.update('b.jpg', AnnotationStatus.HAS_LABELS, ['cat', 'cat', 'dog'])
+        self.index.update('c.jpg', AnnotationStatus.VERIFIED, ['dog'])
+
+    def test_queries(self):
+        """Test the status, class and box count queries."""
+        self.assertEqual(self.index.query(ImageFilter(FILTER_NO_LABELS, None)), {'a.jpg'})
+        self.assertEqual(self.index.query(ImageFilter(FILTER_CLASS, 'dog')), {'b.jpg', 'c.jpg'})
+        self.assertEqual(self.index.query(ImageFilter(FILTER_CLASS, 'bird')), set())
+        self.assertEqual(self.index.query(ImageFilter(FILTER_BOX_COUNT, (1, 2))), {'c.jpg'})
+        self.assertEqual(self.index.query(ImageFilter(FILTER_BOX_COUNT, (1, None))), {'b.jpg', 'c.jpg'})
+        self.assertEqual(len(self.index.query(ImageFilter(FILTER_ALL, None))), 3)
+        self.assertEqual(self.index.classes(), ['cat', 'dog'])
+        self.assertEqual(self.index.box_count('b.jpg'), 3)
+
+    def test_update_moves_the_image_between_sets(self):
+        """Test that a changed image leaves its old sets and unused keys disappear."""
+        self.assertFalse(self.index.update('b.jpg', AnnotationStatus.HAS_LABELS, ['dog', 'cat', 'cat']))
+        self.assertTrue(self.index.update('b.jpg', AnnotationStatus.VERIFIED, ['dog']))
+        self.assertEqual(self.index.classes(), ['dog'])
+        self.assertEqual(self.index.query(ImageFilter(FILTER_HAS_LABELS, None)), set())
+        self.assertTrue(self.index.matches('b.jpg', ImageFilter(FILTER_BOX_COUNT, (1, 1))))
+        self.index.discard('c.jpg')
+        self.index.discard('missing.jpg')
+        self.assertNotIn('c.jpg', self.index)
+        self.assertEqual(self.index.query(ImageFilter(FILTER_CLASS, 'dog')), {'b.jpg'})
+        self.assertFalse(self.index.matches('c.jpg', ImageFilter(FILTER_ALL, None)))
+
+
+class TestReadAnnotationSummary(unittest.TestCase):
+    """Test cases for reading status and labels from annotation files."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_pascal_voc(self):
+        """Test that box labels and the verified flag come from the XML file."""
+        writer = PascalVocWriter(self.temp_dir, 'img.jpg', [100, 100, 3])
+        writer.add_bnd_box(1, 1, 10, 10, 'cat', False)
+        writer.add_bnd_box(5, 5, 20, 20, 'dog', False)
+        writer.verified = True
+        writer.save(os.path.join(self.temp_dir, 'img.xml'))
+        status, labels = read_annotation_summary(os.path.join(self.temp_dir, 'img.jpg'), self.temp_dir)
+        self.assertEqual(status, AnnotationStatus.VERIFIED)
+        self.assertEqual(sorted(labels), ['cat', 'dog'])
+
+    def test_yolo_uses_the_class_file(self):
+        """Test that YOLO class indexes are named from classes.txt."""
+        with open(os.path.join(self.temp_dir, 'classes.txt'), 'w') as f:
+            f.write('cat\ndog\n')
+        with open(os.path.join(self.temp_dir, 'img.txt'), 'w') as f:
+            f.write('1 0.5 0.5 0.1 0.1\n1 0.2 0.2 0.1 0.1\n')
+        status, labels = read_annotation_summary(os.path.join(self.temp_dir, 'img.jpg'), self.temp_dir)
+        self.assertEqual(status, AnnotationStatus.HAS_LABELS)
+        self.assertEqual(labels, ['dog', 'dog'])
+        self.assertEqual(read_annotation_summary(os.path.join(self.temp_dir, 'other.jpg'), self.temp_dir),
+                         (AnnotationStatus.NO_LABELS, []))
+
+    def test_yolo_class_file_is_read_once(self):
+        """Test that classes.txt is parsed again only after it changed."""
+        classes_path = os.path.join(self.temp_dir, 'classes.txt')
+        with open(classes_path, 'w') as f:
+            f.write('cat\ndog\n')
+        names = yolo_class_names(classes_path)
+        self.assertEqual(names, ['cat', 'dog'])
+        self.assertIs(yolo_class_names(classes_path), names)
+        with open(classes_path, 'w') as f:
+            f.write('cat\ndog\nbird\n')
+        self.assertEqual(yolo_class_names(classes_path), ['cat', 'dog', 'bird'])
+        self.assertEqual(yolo_class_names(os.path.join(self.temp_dir, 'missing.txt')), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
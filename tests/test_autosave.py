@@ -13,6 +13,7 @@ import sys
 import tempfile
 import shutil
 import unittest
+from unittest import mock
 
 # Set offscreen platform for headless testing
 if 'QT_QPA_PLATFORM' not in os.environ:
@@ -21,7 +22,10 @@ if 'QT_QPA_PLATFORM' not in os.environ:
 dir_name = os.path.abspath(os.path.dirname(__file__))
 sys.path.insert(0, os.path.join(dir_name, '..'))
 
+from PyQt5.QtGui import QPixmap
+
 from labelImg import get_main_app, SETTING_AUTO_SAVE, SETTING_AUTO_SAVE_ENABLED, SETTING_AUTO_SAVE_INTERVAL
+from libs.constants import FORMAT_PASCALVOC
 
 
 class TestAutoSaveTimer(unittest.TestCase):
@@ -183,5 +187,75 @@ class TestAutoSaveIntervalMenu(unittest.TestCase):
         self.assertTrue(self.win.auto_save_interval_group.isExclusive())
 
 
+class TestBackgroundAutoSave(unittest.TestCase):
+    """Auto-saves are written by the save queue while navigation goes on."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Create app once for all tests."""
+        cls.app, cls.win = get_main_app()
+        cls.temp_dir = tempfile.mkdtemp()
+        cls.image_dir = os.path.join(cls.temp_dir, 'images')
+        cls.save_dir = os.path.join(cls.temp_dir, 'labels')
+        os.mkdir(cls.image_dir)
+        os.mkdir(cls.save_dir)
+        for name in ('a.png', 'b.png'):
+            QPixmap(50, 50).save(os.path.join(cls.image_dir, name))
+
+    @classmethod
+    def tearDownClass(cls):
+        """Clean up after tests."""
+        cls.win.save_queue.wait()
+        shutil.rmtree(cls.temp_dir, ignore_errors=True)
+
+    def setUp(self):
+        self.win.settings.dataset_dir = tempfile.mkdtemp(dir=self.temp_dir)
+        self.win.settings._datasets = {}
+        self.win.dir_name = None
+        self.win.default_save_dir = self.save_dir
+        self.win.set_format(FORMAT_PASCALVOC)
+        self.win.import_dir_images(self.image_dir)
+        self.win.load_labels([('cat', [(5, 5), (30, 5), (30, 30), (5, 30)], None, None, False)])
+        self.win.set_dirty()
+
+    def tearDown(self):
+        self.win.auto_saving.setChecked(False)
+        self.win.save_queue.wait()
+        for name in os.listdir(self.save_dir):
+            os.remove(os.path.join(self.save_dir, name))
+
+    def test_navigation_queues_the_save(self):
+        """Test that the next image opens and the annotation of the previous one is written."""
+        self.win.auto_saving.setChecked(True)
+        self.win.open_next_image()
+        self.assertEqual(self.win.cur_img_idx, 1)
+        self.assertFalse(self.win.dirty)
+
+        self.win.save_queue.wait()
+        self.app.processEvents()
+        self.assertTrue(os.path.isfile(os.path.join(self.save_dir, 'a.xml')))
+
+    def test_unchanged_save_is_not_written_again(self):
+        """Test that a second save of the same annotations skips the write and the gallery refresh."""
+        self.win.save_file()
+        path = os.path.join(self.save_dir, 'a.xml')
+        mtime = os.stat(path).st_mtime_ns
+        self.win.set_dirty()
+        with mock.patch.object(self.win, '_update_current_image_gallery_status') as refresh:
+            self.win.save_file()
+            self.win._auto_save_triggered()
+        self.win.save_queue.wait()
+        self.assertFalse(self.win.dirty)
+        self.assertEqual(os.stat(path).st_mtime_ns, mtime)
+        refresh.assert_not_called()
+
+    def test_timer_auto_save_uses_the_save_dir(self):
+        """Test that the interval auto-save writes into the save dir."""
+        self.win._auto_save_triggered()
+        self.assertFalse(self.win.dirty)
+        self.win.save_queue.wait()
+        self.assertTrue(os.path.isfile(os.path.join(self.save_dir, 'a.xml')))
+
+
 if __name__ == '__main__':
     unittest.main()
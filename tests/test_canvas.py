@@ -1,6 +1,7 @@
 """Tests for Canvas widget."""
 import os
 import sys
+import time
 import unittest
 
 # Set offscreen platform for headless testing
@@ -11,12 +12,14 @@ dir_name = os.path.abspath(os.path.dirname(__file__))
 sys.path.insert(0, os.path.join(dir_name, '..'))
 sys.path.insert(0, os.path.join(dir_name, '..', 'libs'))
 
-from PyQt5.QtCore import QPointF, QPoint, Qt
-from PyQt5.QtGui import QPixmap, QColor
-from PyQt5.QtWidgets import QApplication
+from PyQt5.QtCore import QEvent, QPointF, QPoint, QRect, QRectF, Qt
+from PyQt5.QtGui import QPixmap, QColor, QMouseEvent
+from PyQt5.QtTest import QTest
+from PyQt5.QtWidgets import QApplication, QLabel, QVBoxLayout, QWidget
 
 from libs.canvas import Canvas
 from libs.shape import Shape
+from libs.shapeRenderer import ShapeRenderer
 
 # Create QApplication for tests
 app = QApplication.instance() or QApplication(sys.argv)
@@ -358,5 +361,361 @@ class TestCanvasVerified(unittest.TestCase):
         self.assertTrue(self.canvas.verified)
 
 
+class TestCanvasOverlayCache(unittest.TestCase):
+    """Test cases for caching the brightness-adjusted pixmap."""
+
+    def setUp(self):
+        self.canvas = Canvas()
+        pixmap = QPixmap(2048, 2048)
+        pixmap.fill(QColor(100, 100, 100))
+        self.canvas.load_pixmap(pixmap)
+
+    def test_no_overlay_returns_pixmap(self):
+        """Test that the original pixmap is used without an overlay."""
+        self.assertIs(self.canvas.adjusted_pixmap(), self.canvas.pixmap)
+
+    def test_adjusted_pixmap_is_reused(self):
+        """Test that repaints reuse the composite for the same overlay."""
+        self.canvas.overlay_color = QColor(255, 255, 255, 128)
+        first = self.canvas.adjusted_pixmap()
+        self.canvas.grab()
+        self.assertIs(self.canvas.adjusted_pixmap(), first)
+
+        self.canvas.overlay_color = QColor(0, 0, 0, 128)
+        self.assertIsNot(self.canvas.adjusted_pixmap(), first)
+
+    def test_new_pixmap_invalidates_cache(self):
+        """Test that loading another image drops the cached composite."""
+        self.canvas.overlay_color = QColor(255, 255, 255, 128)
+        first = self.canvas.adjusted_pixmap()
+        self.canvas.load_pixmap(QPixmap(64, 64))
+        self.assertEqual(self.canvas.adjusted_pixmap().width(), 64)
+        self.assertIsNot(self.canvas.adjusted_pixmap(), first)
+
+    def test_benchmark_cached_overlay(self):
+        """Benchmark repeated paints with brightness adjusted on a 2048px image."""
+        self.canvas.overlay_color = QColor(255, 255, 255, 128)
+        repaints = 30
+
+        start = time.perf_counter()
+        for _ in range(repaints):
+            self.canvas._overlay_cache = None
+            self.canvas.adjusted_pixmap()
+        uncached = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(repaints):
+            self.canvas.adjusted_pixmap()
+        cached = time.perf_counter() - start
+
+        self.assertLess(cached * 5, uncached)
+
+
+class CountingRenderer(ShapeRenderer):
+    """Renderer recording how many shapes it was asked to paint."""
+
+    def __init__(self):
+        super(CountingRenderer, self).__init__()
+        self.painted = 0
+
+    def paint(self, painter, shapes):
+        self.painted += len(shapes)
+        super(CountingRenderer, self).paint(painter, shapes)
+
+
+def make_box(x, y, size=20):
+    shape = Shape('box')
+    for px, py in ((x, y), (x + size, y), (x + size, y + size), (x, y + size)):
+        shape.add_point(QPointF(px, py))
+    shape.close()
+    return shape
+
+
+class TestCanvasDamageTracking(unittest.TestCase):
+    """Test cases for dirty-region repaints."""
+
+    def setUp(self):
+        self.canvas = Canvas()
+        self.canvas.load_pixmap(QPixmap(1000, 1000))
+        self.canvas.adjustSize()
+        self.updates = []
+        self.canvas.update = lambda *args: self.updates.append(args)
+
+    def test_rect_mapping_roundtrip(self):
+        """Test that image and widget rectangles map onto each other."""
+        self.canvas.scale = 2.0
+        rect = self.canvas.to_widget_rect(QRectF(10, 20, 30, 40))
+        self.assertEqual(rect, QRect(19, 39, 62, 82))
+        self.assertEqual(self.canvas.to_image_rect(QRect(20, 40, 60, 80)), QRectF(10, 20, 30, 40))
+
+    def test_shape_paint_rect_covers_vertices(self):
+        """Test that the damage area includes the vertex markers."""
+        shape = make_box(100, 100)
+        rect = self.canvas.shape_paint_rect(shape)
+        self.assertTrue(rect.contains(QRectF(100 - Shape.point_size, 100 - Shape.point_size,
+                                             20 + 2 * Shape.point_size, 20 + 2 * Shape.point_size)))
+
+    def test_set_shape_visible_updates_shape_area(self):
+        """Test that toggling visibility only damages the shape area."""
+        shape = make_box(100, 100)
+        self.canvas.load_shapes([shape])
+        self.updates.clear()
+        self.canvas.set_shape_visible(shape, False)
+        self.assertEqual(len(self.updates), 1)
+        self.assertLess(self.updates[0][0].width(), 1000)
+
+    def test_move_one_pixel_updates_old_and_new_area(self):
+        """Test that keyboard moves damage the old and the new position."""
+        shape = make_box(100, 100)
+        self.canvas.load_shapes([shape])
+        self.canvas.selected_shape = shape
+        self.updates.clear()
+        self.canvas.move_one_pixel('Right')
+        self.assertEqual(len(self.updates), 2)
+        self.assertEqual(self.updates[1][0], self.updates[0][0].translated(1, 0))
+        self.assertTrue(all(args for args in self.updates))
+
+
+class TestCanvasExposedPainting(unittest.TestCase):
+    """Test cases for clipping painting to the exposed region."""
+
+    def test_only_exposed_shapes_are_painted(self):
+        """Test that shapes outside the exposed area are skipped."""
+        canvas = Canvas()
+        canvas.load_pixmap(QPixmap(1000, 1000))
+        canvas.load_shapes([make_box(x, 500) for x in range(0, 1000, 100)])
+        canvas.resize(1000, 1000)
+        canvas.renderer = CountingRenderer()
+
+        canvas.grab()
+        self.assertEqual(canvas.renderer.painted, 10)
+
+        canvas.renderer.painted = 0
+        canvas.grab(QRect(0, 450, 150, 100))
+        self.assertLess(canvas.renderer.painted, 10)
+        self.assertGreater(canvas.renderer.painted, 0)
+
+
+class TestShapeRenderer(unittest.TestCase):
+    """Test cases for the batched shape renderer."""
+
+    def setUp(self):
+        self.renderer = ShapeRenderer()
+
+    def test_resources_are_cached(self):
+        """Test that pens, brushes, fonts and labels are reused."""
+        color = QColor(10, 20, 30)
+        self.assertIs(self.renderer.pen(color, 2), self.renderer.pen(QColor(10, 20, 30), 2))
+        self.assertIsNot(self.renderer.pen(color, 2), self.renderer.pen(color, 3))
+        self.assertIs(self.renderer.brush(color), self.renderer.brush(color))
+        self.assertIs(self.renderer.font(8), self.renderer.font(8))
+        self.assertIs(self.renderer.static_text('dog', 8), self.renderer.static_text('dog', 8))
+
+    def record_draw_calls(self, shapes):
+        calls = []
+
+        class RecordingPainter(object):
+            def __getattr__(self, name):
+                return lambda *args: calls.append(name)
+
+        self.renderer.paint(RecordingPainter(), shapes)
+        return [c for c in calls if c in ('drawPath', 'fillPath', 'drawRects', 'drawStaticText')]
+
+    def test_draw_calls_do_not_grow_with_shape_count(self):
+        """Test that 2000 boxes of one color are drawn in a few draw calls."""
+        self.renderer = ShapeRenderer(vertex_min_size=0, label_min_size=0, tiny_max_size=0)
+        shapes = [make_box((i % 50) * 20, (i // 50) * 20, 10) for i in range(2000)]
+        shapes[0].selected = True
+        shapes[1].fill = True
+        # Two groups (plain and selected) of outline + vertices + vertex fill, and one fill
+        self.assertEqual(len(self.record_draw_calls(shapes)), 7)
+
+    def test_lod_skips_vertices_and_labels_of_small_boxes(self):
+        """Test that boxes small on screen lose handles and labels, except the selection."""
+        original_scale = Shape.scale
+        try:
+            Shape.scale = 0.5
+            shapes = [make_box(i * 20, 0, 10) for i in range(100)]
+            for shape in shapes:
+                shape.paint_label = True
+            self.assertEqual(self.record_draw_calls(shapes), ['drawPath'])
+
+            shapes[0].selected = True
+            self.assertEqual(self.record_draw_calls(shapes),
+                             ['drawPath', 'drawPath', 'drawPath', 'fillPath', 'drawStaticText'])
+        finally:
+            Shape.scale = original_scale
+
+    def test_lod_keeps_small_boxes_detailed_at_full_zoom(self):
+        """Test that small objects keep handles and labels at 100% zoom."""
+        original_scale = Shape.scale
+        try:
+            Shape.scale = 1.0
+            shapes = [make_box(i * 20, 0, 16) for i in range(10)]
+            for shape in shapes:
+                shape.paint_label = True
+            calls = self.record_draw_calls(shapes)
+            self.assertIn('fillPath', calls)
+            self.assertEqual(calls.count('drawStaticText'), 10)
+        finally:
+            Shape.scale = original_scale
+
+    def test_lod_draws_tiny_boxes_as_rects(self):
+        """Test that sub-threshold boxes are batched into one drawRects call."""
+        original_scale = Shape.scale
+        try:
+            Shape.scale = 0.1
+            shapes = [make_box(i * 20, 0, 10) for i in range(100)]
+            self.assertEqual(self.record_draw_calls(shapes), ['drawRects'])
+        finally:
+            Shape.scale = original_scale
+
+    def test_labels_are_drawn(self):
+        """Test that labelled shapes render without errors."""
+        canvas = Canvas()
+        canvas.load_pixmap(QPixmap(200, 200))
+        shape = make_box(50, 50)
+        shape.paint_label = True
+        canvas.load_shapes([shape])
+        canvas.resize(200, 200)
+        self.assertFalse(canvas.grab().isNull())
+
+
+class CountingLabel(QLabel):
+    """Label counting how often its text is set."""
+
+    def __init__(self):
+        super(CountingLabel, self).__init__()
+        self.set_count = 0
+
+    def setText(self, text):
+        self.set_count += 1
+        super(CountingLabel, self).setText(text)
+
+
+class StatusHost(QWidget):
+    """Minimal stand-in for the main window's status readout."""
+
+    def __init__(self):
+        super(StatusHost, self).__init__()
+        self.file_path = 'image.png'
+        self.label_coordinates = CountingLabel()
+        self.canvas = Canvas()
+        layout = QVBoxLayout(self)
+        layout.addWidget(self.canvas)
+        layout.addWidget(self.label_coordinates)
+
+
+class TestCanvasStatusCoalescing(unittest.TestCase):
+    """Test cases for throttling the coordinate readout."""
+
+    def setUp(self):
+        self.host = StatusHost()
+        self.canvas = self.host.canvas
+        self.canvas.load_pixmap(QPixmap(500, 500))
+        self.canvas.resize(500, 500)
+
+    def move(self, x, y):
+        self.canvas.mouseMoveEvent(QMouseEvent(QEvent.MouseMove, QPointF(x, y),
+                                               Qt.NoButton, Qt.NoButton, Qt.NoModifier))
+
+    def test_window_is_cached(self):
+        """Test that the readout window is looked up once."""
+        self.assertIs(self.canvas.status_window(), self.host)
+        self.assertIs(self.canvas._status_window, self.host)
+
+    def test_moves_are_coalesced_into_one_update(self):
+        """Test that a burst of moves sets the label once, with the last position."""
+        for i in range(1000):
+            self.move(i % 400, 10)
+        self.assertEqual(self.host.label_coordinates.set_count, 0)
+        QTest.qWait(self.canvas.refresh_interval() * 3)
+        self.assertEqual(self.host.label_coordinates.set_count, 1)
+        self.assertEqual(self.host.label_coordinates.text(), 'X: 199; Y: 10')
+
+    def test_benchmark_status_updates(self):
+        """Benchmark 1000 readout updates set directly vs. coalesced."""
+        self.host.show()
+        label = self.host.label_coordinates
+        start = time.perf_counter()
+        for i in range(1000):
+            label.setText('X: %d; Y: %d' % (i, i))
+            app.processEvents()
+        direct = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for i in range(1000):
+            self.canvas.set_status_text('X: %d; Y: %d' % (i, i))
+            app.processEvents()
+        coalesced = time.perf_counter() - start
+        self.host.hide()
+
+        self.assertLess(coalesced, direct)
+
+
+class TestCanvasMoveFinished(unittest.TestCase):
+    """Test cases for reporting finished moves."""
+
+    def setUp(self):
+        self.canvas = Canvas()
+        self.canvas.load_pixmap(QPixmap(1000, 1000))
+        self.canvas.adjustSize()
+        self.shape = make_box(100, 100)
+        self.canvas.load_shapes([self.shape])
+        self.moves = []
+        self.canvas.shapeMoveFinished.connect(lambda shape, old: self.moves.append((shape, old)))
+
+    def mouse(self, kind, x, y, button, buttons):
+        event = QMouseEvent(kind, QPointF(x, y), button, buttons, Qt.NoModifier)
+        handler = {QEvent.MouseButtonPress: self.canvas.mousePressEvent,
+                   QEvent.MouseMove: self.canvas.mouseMoveEvent,
+                   QEvent.MouseButtonRelease: self.canvas.mouseReleaseEvent}[kind]
+        handler(event)
+
+    def test_keyboard_move(self):
+        """Test that each arrow key move is reported with the old points."""
+        self.canvas.selected_shape = self.shape
+        self.canvas.move_one_pixel('Right')
+        self.assertEqual(len(self.moves), 1)
+        shape, old_points = self.moves[0]
+        self.assertIs(shape, self.shape)
+        self.assertEqual(old_points[0], QPointF(100, 100))
+        self.assertEqual(self.shape[0], QPointF(101, 100))
+
+    def test_drag_reported_once_on_release(self):
+        """Test that a drag is reported once, when the button is released."""
+        self.mouse(QEvent.MouseButtonPress, 110, 110, Qt.LeftButton, Qt.LeftButton)
+        for x in range(111, 131):
+            self.mouse(QEvent.MouseMove, x, 110, Qt.NoButton, Qt.LeftButton)
+        self.assertEqual(self.moves, [])
+        self.mouse(QEvent.MouseButtonRelease, 130, 110, Qt.LeftButton, Qt.NoButton)
+
+        self.assertEqual(len(self.moves), 1)
+        self.assertEqual(self.moves[0][1][0], QPointF(100, 100))
+        self.assertEqual(self.shape[0], QPointF(120, 100))
+
+    def test_click_without_move_not_reported(self):
+        """Test that selecting a shape is not reported as a move."""
+        self.mouse(QEvent.MouseButtonPress, 110, 110, Qt.LeftButton, Qt.LeftButton)
+        self.mouse(QEvent.MouseButtonRelease, 110, 110, Qt.LeftButton, Qt.NoButton)
+        self.assertIs(self.canvas.selected_shape, self.shape)
+        self.assertEqual(self.moves, [])
+
+    def test_drag_draws_a_box(self):
+        """Test that pressing, dragging and releasing in create mode finishes a box."""
+        shapes = []
+        self.canvas.newShape.connect(lambda: shapes.append(self.canvas.shapes[-1]))
+        self.canvas.set_editing(False)
+        self.mouse(QEvent.MouseButtonPress, 300, 300, Qt.LeftButton, Qt.LeftButton)
+        for x in range(301, 351, 10):
+            self.mouse(QEvent.MouseMove, x, x + 10, Qt.NoButton, Qt.LeftButton)
+        self.mouse(QEvent.MouseButtonRelease, 350, 360, Qt.LeftButton, Qt.NoButton)
+
+        self.assertEqual(len(shapes), 1)
+        self.assertEqual(len(shapes[0].points), 4)
+        self.assertEqual(shapes[0][0], QPointF(300, 300))
+        self.assertEqual(self.moves, [])
+
+
 if __name__ == '__main__':
     unittest.main()
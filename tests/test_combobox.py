@@ -0,0 +1,96 @@
+"""Tests for the label filter combo box."""
+import os
+import sys
+import unittest
+
+# Set offscreen platform for headless testing
+if 'QT_QPA_PLATFORM' not in os.environ:
+    os.environ['QT_QPA_PLATFORM'] = 'offscreen'
+
+dir_name = os.path.abspath(os.path.dirname(__file__))
+sys.path.insert(0, os.path.join(dir_name, '..'))
+
+from PyQt5.QtWidgets import QApplication, QWidget
+
+from libs.combobox import ComboBox
+
+app = QApplication.instance() or QApplication(sys.argv)
+
+
+class FilterHost(QWidget):
+    """Parent widget recording the filter selections."""
+
+    def __init__(self):
+        super(FilterHost, self).__init__()
+        self.selections = []
+
+    def combo_selection_changed(self, index):
+        self.selections.append(index)
+
+
+class TestComboBoxLabelCounts(unittest.TestCase):
+    """Test cases for the incremental label multiset."""
+
+    def setUp(self):
+        self.host = FilterHost()
+        self.combo = ComboBox(self.host)
+
+    def cb_items(self):
+        return [self.combo.cb.itemText(i) for i in range(self.combo.cb.count())]
+
+    def test_labels_inserted_sorted(self):
+        """Test that new labels are inserted at their sorted position."""
+        for label in ('dog', 'cat', 'dog', 'bird', 'zebra'):
+            self.combo.add_label(label)
+        self.assertEqual(self.combo.items, ['', 'bird', 'cat', 'dog', 'zebra'])
+        self.assertEqual(self.cb_items(), self.combo.items)
+        self.assertEqual(self.combo.label_counts['dog'], 2)
+
+    def test_label_removed_with_last_shape(self):
+        """Test that a label stays until its last shape is removed."""
+        for label in ('dog', 'cat', 'dog'):
+            self.combo.add_label(label)
+        self.combo.remove_label('dog')
+        self.assertEqual(self.cb_items(), ['', 'cat', 'dog'])
+        self.combo.remove_label('dog')
+        self.assertEqual(self.cb_items(), ['', 'cat'])
+        self.assertNotIn('dog', self.combo.label_counts)
+
+    def test_unchanged_labels_do_not_touch_combo(self):
+        """Test that adding a known label does not change the combo items."""
+        self.combo.add_label('dog')
+        self.combo.cb.setCurrentIndex(1)
+        selections = len(self.host.selections)
+        self.combo.add_label('dog')
+        self.combo.remove_label('dog')
+        self.assertEqual(len(self.host.selections), selections)
+        self.assertEqual(self.combo.cb.currentText(), 'dog')
+
+    def test_removing_filtered_label_shows_all(self):
+        """Test that removing the selected filter label goes back to showing all."""
+        for label in ('cat', 'dog'):
+            self.combo.add_label(label)
+        self.combo.cb.setCurrentIndex(2)
+        self.combo.remove_label('dog')
+        self.assertEqual(self.combo.cb.currentIndex(), 0)
+
+    def test_set_labels_matches_incremental(self):
+        """Test that a full rebuild gives the same items as incremental updates."""
+        labels = ['b', 'a', 'c', 'a']
+        for label in labels:
+            self.combo.add_label(label)
+        incremental = list(self.combo.items)
+        self.combo.set_labels(labels)
+        self.assertEqual(self.combo.items, incremental)
+        self.assertEqual(self.combo.label_counts, {'a': 2, 'b': 1, 'c': 1})
+
+    def test_clear_labels(self):
+        """Test that clearing forgets all labels."""
+        self.combo.add_label('dog')
+        self.combo.clear_labels()
+        self.assertEqual(self.combo.items, [])
+        self.assertEqual(self.combo.label_counts, {})
+
+
+if __name__ == '__main__':
+    unittest.main()
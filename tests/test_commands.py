@@ -13,11 +13,18 @@ from PyQt5.QtWidgets import QApplication
 from PyQt5.QtCore import QPointF
 
 from libs.commands import (
+    ALL_VERTICES,
+    ShapeSnapshot,
+    UndoHistoryStore,
     UndoStack,
+    move_deltas,
     CreateShapeCommand,
     DeleteShapeCommand,
     MoveShapeCommand,
     EditLabelCommand,
+    MacroCommand,
+    MOVE_MERGE_INTERVAL,
+    combine_deltas,
 )
 from libs.shape import Shape
 
@@ -500,5 +507,313 @@ class TestEditLabelCommandEdgeCases(unittest.TestCase):
         self.assertEqual(shape.label, 'same')
 
 
+class TestMoveDeltas(unittest.TestCase):
+    """Test cases for the compact move deltas."""
+
+    def test_translation_is_single_delta(self):
+        """Test that moving the whole shape stores one delta."""
+        shape = create_test_shape()
+        new_points = [QPointF(p.x() + 5, p.y() - 3) for p in shape.points]
+        self.assertEqual(move_deltas(shape.points, new_points), ((ALL_VERTICES, 5, -3),))
+
+    def test_vertex_move_stores_moved_vertex_only(self):
+        """Test that a vertex edit stores only the moved vertex."""
+        shape = create_test_shape()
+        new_points = [QPointF(p) for p in shape.points]
+        new_points[2] = QPointF(120, 90)
+        self.assertEqual(move_deltas(shape.points, new_points), ((2, 20, -10),))
+
+    def test_no_move(self):
+        """Test that an unchanged shape has no deltas."""
+        shape = create_test_shape()
+        self.assertEqual(move_deltas(shape.points, shape.points), ())
+
+    def test_vertex_move_undo_redo(self):
+        """Test undoing and redoing a vertex move."""
+        mw = MockMainWindow()
+        shape = create_test_shape()
+        old_points = [QPointF(p) for p in shape.points]
+        shape.move_vertex_by(1, QPointF(7, 8))
+        new_points = [QPointF(p) for p in shape.points]
+
+        cmd = MoveShapeCommand(mw, shape, old_points, new_points)
+        cmd.undo()
+        self.assertEqual(shape.points, old_points)
+        cmd.execute()
+        self.assertEqual(shape.points, new_points)
+
+
+class TestUndoStackBudget(unittest.TestCase):
+    """Test cases for the memory budget of UndoStack."""
+
+    def _push_moves(self, stack, count):
+        """Move ``count`` different shapes by one pixel each."""
+        mw = MockMainWindow()
+        shapes = []
+        for _ in range(count):
+            shape = create_test_shape()
+            old_points = [QPointF(p) for p in shape.points]
+            shape.move_by(QPointF(1, 0))
+            stack.push(MoveShapeCommand(mw, shape, old_points, shape.points))
+            shapes.append(shape)
+        return shapes
+
+    def test_budget_drops_oldest(self):
+        """Test that the oldest commands are dropped beyond the budget."""
+        one = MoveShapeCommand(MockMainWindow(), create_test_shape(), [], []).size_estimate()
+        stack = UndoStack(memory_budget=10 * one)
+        shapes = self._push_moves(stack, 40)
+
+        self.assertLessEqual(stack.size_estimate(), 10 * one)
+        self.assertGreaterEqual(len(stack), 5)
+        self.assertLess(len(stack), 40)
+        # The remaining commands are the latest ones
+        kept = len(stack)
+        while stack.can_undo():
+            stack.undo()
+        self.assertEqual([s.points[0].x() for s in shapes], [1] * (40 - kept) + [0] * kept)
+
+    def test_budget_keeps_latest_command(self):
+        """Test that a command larger than the budget is still undoable."""
+        stack = UndoStack(memory_budget=1)
+        self._push_moves(stack, 3)
+        self.assertEqual(len(stack), 1)
+
+    def test_push_releases_redo_size(self):
+        """Test that dropping the redo branch updates the size estimate."""
+        stack = UndoStack()
+        self._push_moves(stack, 3)
+        stack.undo()
+        stack.undo()
+        self._push_moves(stack, 1)
+        self.assertEqual(stack.size_estimate(),
+                         sum(c.size_estimate() for c in stack._undo_stack))
+
+
+class TestUndoHistoryStore(unittest.TestCase):
+    """Test cases for per-image histories."""
+
+    def _reload(self, mw):
+        """Simulate closing and reopening the image from its saved annotation."""
+        reloaded = [s.copy() for s in mw.canvas.shapes]
+        fresh = MockMainWindow()
+        for shape in reloaded:
+            fresh.canvas.shapes.append(shape)
+            fresh.add_label(shape)
+        return fresh
+
+    def _edit(self, mw, stack):
+        """Create two shapes, move the first and delete the second."""
+        first = create_test_shape('first')
+        second = create_test_shape('second')
+        for shape in (first, second):
+            mw.canvas.shapes.append(shape)
+            mw.add_label(shape)
+            stack.push(CreateShapeCommand(mw, shape))
+        old_points = [QPointF(p) for p in first.points]
+        first.move_by(QPointF(10, 20))
+        stack.push(MoveShapeCommand(mw, first, old_points, first.points))
+        cmd = DeleteShapeCommand(mw, second, 1)
+        cmd.execute()
+        stack.push(cmd)
+
+    def test_history_survives_navigation(self):
+        """Test that undo works on the reloaded shapes after coming back."""
+        store = UndoHistoryStore()
+        stack = UndoStack()
+        mw = MockMainWindow()
+        self._edit(mw, stack)
+
+        store.park('a.jpg', stack, mw.canvas.shapes)
+        self.assertFalse(stack.can_undo())
+        self.assertIn('a.jpg', store)
+
+        mw = self._reload(mw)
+        self.assertTrue(store.restore('a.jpg', stack, mw.canvas.shapes))
+        self.assertEqual(len(stack), 4)
+        for command in stack._undo_stack:
+            command.main_window = mw
+
+        stack.undo()  # delete of 'second'
+        self.assertEqual([s.label for s in mw.canvas.shapes], ['first', 'second'])
+        stack.undo()  # move of 'first'
+        self.assertEqual(mw.canvas.shapes[0].points[0], QPointF(0, 0))
+        stack.undo()
+        stack.undo()
+        self.assertEqual(len(mw.canvas.shapes), 0)
+        stack.redo()
+        stack.redo()
+        self.assertEqual([s.label for s in mw.canvas.shapes], ['first', 'second'])
+
+    def test_parked_history_holds_no_shapes(self):
+        """Test that parked commands refer to shapes by index or snapshot."""
+        store = UndoHistoryStore()
+        stack = UndoStack()
+        mw = MockMainWindow()
+        self._edit(mw, stack)
+        store.park('a.jpg', stack, mw.canvas.shapes)
+
+        history, _ = store._histories['a.jpg']
+        for command in history.commands():
+            self.assertNotIsInstance(command.shape, Shape)
+
+    def test_snapshot_keeps_label_display(self):
+        """Test that a shape rebuilt from a snapshot still paints its label."""
+        shape = create_test_shape('first')
+        shape.paint_label = True
+        shape.difficult = True
+        restored = ShapeSnapshot(shape).to_shape()
+        self.assertTrue(restored.paint_label)
+        self.assertTrue(restored.difficult)
+        self.assertEqual(restored.points, shape.points)
+
+    def test_changed_annotation_drops_history(self):
+        """Test that a history is not applied to different shapes."""
+        store = UndoHistoryStore()
+        stack = UndoStack()
+        mw = MockMainWindow()
+        self._edit(mw, stack)
+        store.park('a.jpg', stack, mw.canvas.shapes)
+
+        mw = self._reload(mw)
+        mw.canvas.shapes[0].move_by(QPointF(50, 0))
+        self.assertFalse(store.restore('a.jpg', stack, mw.canvas.shapes))
+        self.assertFalse(stack.can_undo())
+        self.assertNotIn('a.jpg', store)
+
+    def test_store_budget_drops_oldest_image(self):
+        """Test that the least recently parked histories are dropped first."""
+        def park(store, name):
+            stack = UndoStack()
+            mw = MockMainWindow()
+            shape = create_test_shape(name)
+            mw.canvas.shapes.append(shape)
+            mw.add_label(shape)
+            stack.push(CreateShapeCommand(mw, shape))
+            store.park(name, stack, mw.canvas.shapes)
+
+        probe = UndoHistoryStore()
+        park(probe, 'a')
+        budget = 3 * probe.size_estimate()
+
+        store = UndoHistoryStore(memory_budget=budget)
+        for name in ('a', 'b', 'c', 'd'):
+            park(store, name)
+
+        self.assertNotIn('a', store)
+        self.assertIn('d', store)
+        self.assertEqual(len(store), 3)
+        self.assertLessEqual(store.size_estimate(), budget)
+
+
+class TestMoveMerging(unittest.TestCase):
+    """Test cases for merging consecutive moves."""
+
+    def _nudge(self, stack, mw, shape, dx, dy):
+        old_points = [QPointF(p) for p in shape.points]
+        shape.move_by(QPointF(dx, dy))
+        cmd = MoveShapeCommand(mw, shape, old_points, shape.points)
+        stack.push(cmd)
+        return cmd
+
+    def test_nudges_merge_into_one_step(self):
+        """Test that repeated moves of a shape take one undo step."""
+        stack = UndoStack()
+        mw = MockMainWindow()
+        shape = create_test_shape()
+        for _ in range(10):
+            self._nudge(stack, mw, shape, 1, 0)
+        self._nudge(stack, mw, shape, 0, -1)
+
+        self.assertEqual(len(stack), 1)
+        self.assertEqual(stack._undo_stack[0].deltas, ((ALL_VERTICES, 10, -1),))
+        stack.undo()
+        self.assertEqual(shape.points[0], QPointF(0, 0))
+        stack.redo()
+        self.assertEqual(shape.points[0], QPointF(10, -1))
+
+    def test_other_shape_does_not_merge(self):
+        """Test that moves of different shapes stay separate."""
+        stack = UndoStack()
+        mw = MockMainWindow()
+        self._nudge(stack, mw, create_test_shape(), 1, 0)
+        self._nudge(stack, mw, create_test_shape(), 1, 0)
+        self.assertEqual(len(stack), 2)
+
+    def test_late_move_does_not_merge(self):
+        """Test that moves far apart in time stay separate."""
+        stack = UndoStack()
+        mw = MockMainWindow()
+        shape = create_test_shape()
+        first = self._nudge(stack, mw, shape, 1, 0)
+        first.timestamp -= 2 * MOVE_MERGE_INTERVAL
+        self._nudge(stack, mw, shape, 1, 0)
+        self.assertEqual(len(stack), 2)
+
+    def test_combine_translation_and_vertex_move(self):
+        """Test combining a whole-shape move with a vertex move."""
+        deltas = combine_deltas(((ALL_VERTICES, 2, 0),), ((1, 0, 3),), 4)
+        self.assertEqual(deltas, ((0, 2, 0), (1, 2, 3), (2, 2, 0), (3, 2, 0)))
+        self.assertEqual(combine_deltas(((1, 1, 1),), ((1, -1, -1),), 4), ())
+
+
+class TestMacroCommand(unittest.TestCase):
+    """Test cases for MacroCommand."""
+
+    def _paste(self, mw, stack, count):
+        commands = []
+        for i in range(count):
+            shape = create_test_shape(f'shape{i}')
+            mw.canvas.shapes.append(shape)
+            mw.add_label(shape)
+            commands.append(CreateShapeCommand(mw, shape))
+        stack.push(MacroCommand(mw, commands, 'Paste'))
+
+    def test_single_undo_step(self):
+        """Test that a macro is undone and redone as a whole."""
+        stack = UndoStack()
+        mw = MockMainWindow()
+        self._paste(mw, stack, 5)
+
+        self.assertEqual(len(stack), 1)
+        self.assertEqual(stack.get_undo_description(), 'Paste')
+        stack.undo()
+        self.assertEqual(len(mw.canvas.shapes), 0)
+        stack.redo()
+        self.assertEqual([s.label for s in mw.canvas.shapes], [f'shape{i}' for i in range(5)])
+
+    def test_bulk_edit_wraps_macro(self):
+        """Test that the main window bulk edit context is entered once."""
+        mw = MockMainWindow()
+        entered = []
+
+        from contextlib import contextmanager
+
+        @contextmanager
+        def bulk_edit():
+            entered.append(True)
+            yield
+        mw.bulk_edit = bulk_edit
+
+        stack = UndoStack()
+        self._paste(mw, stack, 3)
+        stack.undo()
+        stack.redo()
+        self.assertEqual(len(entered), 2)
+
+    def test_macro_history_survives_navigation(self):
+        """Test that parked macros re-bind their shapes."""
+        store = UndoHistoryStore()
+        stack = UndoStack()
+        mw = MockMainWindow()
+        self._paste(mw, stack, 3)
+        stack.undo()
+        store.park('a.jpg', stack, mw.canvas.shapes)
+
+        self.assertTrue(store.restore('a.jpg', stack, []))
+        stack.redo()
+        self.assertEqual(len(mw.canvas.shapes), 3)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,151 @@
+#!/usr/bin/env python
+# tests/test_display_policy.py
+"""Tests for the adaptive display resolution policy."""
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+
+# Set offscreen platform for headless testing
+if 'QT_QPA_PLATFORM' not in os.environ:
+    os.environ['QT_QPA_PLATFORM'] = 'offscreen'
+
+dir_name = os.path.abspath(os.path.dirname(__file__))
+sys.path.insert(0, os.path.join(dir_name, '..'))
+
+from PyQt5.QtCore import QSize
+from PyQt5.QtGui import QColor, QImage, QPixmap
+from PyQt5.QtWidgets import QApplication
+
+from libs.canvas import Canvas
+from libs.displayPolicy import (DisplayPolicy, scale_factor, MIN_AUTO_DIM,
+                                DISPLAY_RESOLUTION_AUTO, DISPLAY_RESOLUTION_FULL)
+
+app = QApplication.instance() or QApplication(sys.argv)
+
+LARGE = QSize(10000, 5000)
+
+
+class TestDisplayPolicy(unittest.TestCase):
+    """Test cases for choosing the decode size."""
+
+    def test_fixed_cap_matches_legacy_behavior(self):
+        """Test that a fixed cap downsamples like the old 2048px limit."""
+        policy = DisplayPolicy(2048)
+        self.assertEqual(policy.decode_size(LARGE), QSize(2048, 1024))
+
+    def test_full_resolution_never_downsamples(self):
+        """Test that full resolution keeps the original size."""
+        policy = DisplayPolicy(DISPLAY_RESOLUTION_FULL)
+        self.assertEqual(policy.decode_size(LARGE), LARGE)
+
+    def test_small_image_is_untouched(self):
+        """Test that images below the target are never upscaled."""
+        policy = DisplayPolicy(screen_size=QSize(3840, 2160))
+        self.assertEqual(policy.decode_size(QSize(800, 600)), QSize(800, 600))
+
+    def test_auto_follows_screen_and_pixel_ratio(self):
+        """Test that a HiDPI 4K screen gets a larger decode than a laptop."""
+        laptop = DisplayPolicy(screen_size=QSize(1366, 768))
+        hidpi = DisplayPolicy(screen_size=QSize(1920, 1080), device_pixel_ratio=2.0)
+        self.assertEqual(laptop.target_dim(LARGE), 1366)
+        self.assertEqual(hidpi.target_dim(LARGE), 3840)
+
+    def test_auto_uses_dataset_zoom(self):
+        """Test that the last dataset zoom raises the decode size."""
+        policy = DisplayPolicy(screen_size=QSize(1920, 1080))
+        self.assertEqual(policy.target_dim(LARGE, native_scale=0.5), 5000)
+        self.assertEqual(policy.target_dim(LARGE, native_scale=3.0), 10000)
+
+    def test_auto_respects_memory(self):
+        """Test that low available memory limits the decode size."""
+        # 64 MB -> 8 MB for the image -> 2M pixels at 2:1 -> ~2048 x 1024
+        policy = DisplayPolicy(screen_size=QSize(3840, 2160), memory=64 * 1024 * 1024)
+        self.assertLessEqual(policy.target_dim(LARGE), 2048)
+        self.assertGreaterEqual(policy.target_dim(LARGE), MIN_AUTO_DIM)
+
+    def test_upgrade_size(self):
+        """Test re-decoding only once zoomed past the decoded resolution."""
+        policy = DisplayPolicy(screen_size=QSize(1920, 1080))
+        current = QSize(2000, 1000)
+        self.assertIsNone(policy.upgrade_size(LARGE, current, 0.1))
+        self.assertEqual(policy.upgrade_size(LARGE, current, 0.4), QSize(6000, 3000))
+        self.assertEqual(policy.upgrade_size(LARGE, current, 2.0), LARGE)
+        self.assertIsNone(policy.upgrade_size(LARGE, LARGE, 2.0))
+
+    def test_fixed_cap_never_upgrades(self):
+        """Test that a user-chosen cap is not exceeded by re-decoding."""
+        policy = DisplayPolicy(2048)
+        self.assertIsNone(policy.upgrade_size(LARGE, QSize(2048, 1024), 2.0))
+
+    def test_scale_factor_uses_longer_side(self):
+        """Test that portrait images take the factor from their height."""
+        original = QSize(1001, 10000)
+        scaled = original.scaled(2048, 2048, 1)
+        self.assertAlmostEqual(scale_factor(original, scaled), 0.2048)
+
+
+class TestCanvasDetailPixmap(unittest.TestCase):
+    """Test cases for swapping in a re-decoded pixmap."""
+
+    def test_detail_pixmap_keeps_coordinates(self):
+        """Test that the logical image size survives a higher resolution decode."""
+        canvas = Canvas()
+        canvas.load_pixmap(QPixmap(200, 100))
+        canvas.set_detail_pixmap(QPixmap(800, 400))
+        self.assertEqual(canvas.pixmap.width(), 800)
+        self.assertEqual(canvas.image_size(), QSize(200, 100))
+        self.assertFalse(canvas.grab().isNull())
+
+        canvas.load_pixmap(QPixmap(50, 50))
+        self.assertEqual(canvas.image_size(), QSize(50, 50))
+
+
+class TestMainWindowRedecode(unittest.TestCase):
+    """Test the background re-decode when zooming in."""
+
+    @classmethod
+    def setUpClass(cls):
+        from labelImg import get_main_app
+        cls.app, cls.win = get_main_app()
+        cls.temp_dir = tempfile.mkdtemp()
+        cls.large_path = os.path.join(cls.temp_dir, 'large.png')
+        image = QImage(6000, 300, QImage.Format_RGB32)
+        image.fill(QColor(200, 20, 30))
+        image.save(cls.large_path)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.win.display_resolution_group.actions()[0].setChecked(True)
+        cls.win._dataset_zoom.pop(cls.temp_dir, None)
+        shutil.rmtree(cls.temp_dir, ignore_errors=True)
+
+    def test_setting_selects_fixed_cap(self):
+        """Test that the menu setting drives the decode size."""
+        for action in self.win.display_resolution_group.actions():
+            if action.data() == 2048:
+                action.setChecked(True)
+        self.assertTrue(self.win.load_file(self.large_path))
+        self.assertEqual(self.win.canvas.image_size().width(), 2048)
+
+    def test_zoom_triggers_redecode(self):
+        """Test that zooming in swaps in a sharper pixmap in the same coordinates."""
+        self.win.display_resolution_group.actions()[0].setChecked(True)
+        self.assertEqual(self.win.display_policy().max_dim, DISPLAY_RESOLUTION_AUTO)
+        self.assertTrue(self.win.load_file(self.large_path))
+        logical = self.win.canvas.image_size()
+        decoded_width = self.win.canvas.pixmap.width()
+
+        self.win.set_zoom(400)
+        self.win._request_redecode()
+        self.win._decode_pool.waitForDone()
+        self.app.processEvents()
+
+        self.assertGreater(self.win.canvas.pixmap.width(), decoded_width)
+        self.assertEqual(self.win.canvas.image_size(), logical)
+        self.assertIn(self.temp_dir, self.win._dataset_zoom)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,125 @@
+"""Tests for the folder watcher that keeps image lists up to date."""
+import os
+import sys
+import shutil
+import tempfile
+import time
+import unittest
+
+if 'QT_QPA_PLATFORM' not in os.environ:
+    os.environ['QT_QPA_PLATFORM'] = 'offscreen'
+
+dir_name = os.path.abspath(os.path.dirname(__file__))
+sys.path.insert(0, os.path.join(dir_name, '..'))
+
+from PyQt5.QtWidgets import QApplication
+
+from libs.constants import TRASH_DIR_NAME
+from libs.folderWatcher import FolderWatcher, list_directory
+
+app = QApplication.instance() or QApplication(sys.argv)
+
+
+def touch(path, text=''):
+    with open(path, 'w') as f:
+        f.write(text)
+
+
+class WatcherTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.image_dir = os.path.join(self.temp_dir, 'images')
+        self.save_dir = os.path.join(self.temp_dir, 'labels')
+        os.mkdir(self.image_dir)
+        os.mkdir(self.save_dir)
+        touch(os.path.join(self.image_dir, 'a.png'))
+        touch(os.path.join(self.image_dir, 'b.png'))
+        touch(os.path.join(self.save_dir, 'a.xml'), '<annotation/>')
+        self.added, self.removed, self.annotations = [], [], []
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def make_watcher(self, **kwargs):
+        watcher = FolderWatcher(['.png', '.jpg'], **kwargs)
+        watcher.images_added.connect(self.added.extend)
+        watcher.images_removed.connect(self.removed.extend)
+        watcher.annotations_changed.connect(self.annotations.extend)
+        watcher.watch(self.image_dir, self.save_dir)
+        return watcher
+
+
+class TestListDirectory(WatcherTestCase):
+    """Test cases for listing one directory."""
+
+    def test_images_annotations_and_subdirs_are_told_apart(self):
+        """Test that the trash folder and unrelated files are left out."""
+        os.mkdir(os.path.join(self.image_dir, 'sub'))
+        os.mkdir(os.path.join(self.image_dir, TRASH_DIR_NAME))
+        touch(os.path.join(self.image_dir, 'notes.md'))
+        touch(os.path.join(self.image_dir, 'b.txt'), '0 0.5 0.5 0.1 0.1')
+        listing = list_directory(self.image_dir, ('.png',))
+        self.assertEqual(listing.images, {'a.png', 'b.png'})
+        self.assertEqual(set(listing.annotations), {'b.txt'})
+        self.assertEqual(listing.subdirs, {'sub'})
+        self.assertIsNone(list_directory(os.path.join(self.temp_dir, 'missing'), ('.png',)))
+
+
+class TestPollingWatcher(WatcherTestCase):
+    """Test cases for change detection, using the polling fallback."""
+
+    def test_added_and_removed_images_are_reported(self):
+        """Test that images in new subfolders count and deleted ones are reported."""
+        watcher = self.make_watcher(use_polling=True)
+        self.assertTrue(watcher.is_polling())
+        os.mkdir(os.path.join(self.image_dir, 'sub'))
+        touch(os.path.join(self.image_dir, 'sub', 'c.jpg'))
+        touch(os.path.join(self.image_dir, 'd.png'))
+        os.remove(os.path.join(self.image_dir, 'b.png'))
+        watcher.poll()
+        self.assertEqual(sorted(self.added), [os.path.join(self.image_dir, 'd.png'),
+                                              os.path.join(self.image_dir, 'sub', 'c.jpg')])
+        self.assertEqual(self.removed, [os.path.join(self.image_dir, 'b.png')])
+
+        shutil.rmtree(os.path.join(self.image_dir, 'sub'))
+        watcher.poll()
+        self.assertIn(os.path.join(self.image_dir, 'sub', 'c.jpg'), self.removed)
+        self.assertNotIn(os.path.join(self.image_dir, 'sub'), watcher.watched_directories())
+
+    def test_changed_annotations_are_reported(self):
+        """Test that new, rewritten and deleted annotation files are reported once."""
+        watcher = self.make_watcher(use_polling=True)
+        watcher.poll()
+        self.assertEqual(self.annotations, [])
+        touch(os.path.join(self.save_dir, 'a.xml'), '<annotation><object/></annotation>')
+        touch(os.path.join(self.save_dir, 'b.xml'), '<annotation/>')
+        watcher.poll()
+        self.assertEqual(sorted(self.annotations), [os.path.join(self.save_dir, 'a.xml'),
+                                                    os.path.join(self.save_dir, 'b.xml')])
+        del self.annotations[:]
+        os.remove(os.path.join(self.save_dir, 'b.xml'))
+        watcher.poll()
+        self.assertEqual(self.annotations, [os.path.join(self.save_dir, 'b.xml')])
+        self.assertEqual(self.added, [])
+
+
+class TestSystemWatcher(WatcherTestCase):
+    """Test cases for the QFileSystemWatcher path with its debounce."""
+
+    def test_burst_of_changes_is_reported_together(self):
+        """Test that several new images arrive in one batch after the delay."""
+        watcher = self.make_watcher(delay=50)
+        if watcher.is_polling():
+            self.skipTest('the platform cannot watch directories')
+        for name in ('c.png', 'd.png', 'e.png'):
+            touch(os.path.join(self.image_dir, name))
+        deadline = time.time() + 5
+        while len(self.added) < 3 and time.time() < deadline:
+            app.processEvents()
+            time.sleep(0.01)
+        self.assertEqual(sorted(os.path.basename(path) for path in self.added), ['c.png', 'd.png', 'e.png'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+# tests/test_gl_canvas.py
+"""Tests for the optional OpenGL canvas backend."""
+import os
+import sys
+import unittest
+
+# Set offscreen platform for headless testing
+if 'QT_QPA_PLATFORM' not in os.environ:
+    os.environ['QT_QPA_PLATFORM'] = 'offscreen'
+
+dir_name = os.path.abspath(os.path.dirname(__file__))
+sys.path.insert(0, os.path.join(dir_name, '..'))
+
+from PyQt5.QtCore import QPointF
+from PyQt5.QtGui import QColor, QPixmap
+from PyQt5.QtWidgets import QApplication, QOpenGLWidget
+
+from libs.canvas import Canvas
+from libs.glCanvas import (GLCanvas, create_canvas, opengl_available,
+                           CANVAS_BACKEND_RASTER, CANVAS_BACKEND_OPENGL)
+from libs.shape import Shape
+
+app = QApplication.instance() or QApplication(sys.argv)
+
+
+class TestCreateCanvas(unittest.TestCase):
+    """Test cases for choosing the canvas backend."""
+
+    def test_raster_backend(self):
+        """Test that the default backend is the raster QWidget canvas."""
+        canvas = create_canvas(CANVAS_BACKEND_RASTER)
+        self.assertIs(type(canvas), Canvas)
+
+    def test_opengl_backend_or_fallback(self):
+        """Test that OpenGL is used when available and raster otherwise."""
+        canvas = create_canvas(CANVAS_BACKEND_OPENGL)
+        if opengl_available():
+            self.assertIsInstance(canvas, GLCanvas)
+        else:
+            self.assertIs(type(canvas), Canvas)
+
+    def test_unknown_backend_falls_back(self):
+        """Test that an unknown setting value gives the raster canvas."""
+        self.assertIs(type(create_canvas('vulkan')), Canvas)
+
+
+class TestGLCanvas(unittest.TestCase):
+    """Test cases for the OpenGL canvas class."""
+
+    def setUp(self):
+        self.canvas = GLCanvas()
+
+    def test_keeps_canvas_api(self):
+        """Test that GLCanvas is both a Canvas and a QOpenGLWidget."""
+        self.assertIsInstance(self.canvas, Canvas)
+        self.assertIsInstance(self.canvas, QOpenGLWidget)
+        for signal in ('newShape', 'shapeMoved', 'zoomRequest', 'selectionChanged', 'drawingPolygon'):
+            self.assertTrue(hasattr(self.canvas, signal))
+
+    def test_editing_works_without_context(self):
+        """Test that shape handling does not depend on the GL context."""
+        self.canvas.load_pixmap(QPixmap(100, 100))
+        shape = Shape('box')
+        for x, y in ((10, 10), (50, 10), (50, 50), (10, 50)):
+            shape.add_point(QPointF(x, y))
+        shape.close()
+        self.canvas.load_shapes([shape])
+        self.canvas.select_shape_point(QPointF(20, 20))
+        self.assertIs(self.canvas.selected_shape, shape)
+
+    @unittest.skipUnless(opengl_available(), 'OpenGL context not available')
+    def test_renders_frame(self):
+        """Test that a frame is rendered through OpenGL."""
+        pixmap = QPixmap(64, 64)
+        pixmap.fill(QColor(255, 0, 0))
+        self.canvas.load_pixmap(pixmap)
+        self.canvas.resize(64, 64)
+        image = self.canvas.grabFramebuffer()
+        self.assertEqual(image.pixelColor(32, 32), QColor(255, 0, 0))
+
+
+if __name__ == '__main__':
+    unittest.main()
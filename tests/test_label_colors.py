@@ -0,0 +1,128 @@
+"""Tests for the shared label colour registry."""
+import hashlib
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import unittest
+
+# Set offscreen platform for headless testing
+if 'QT_QPA_PLATFORM' not in os.environ:
+    os.environ['QT_QPA_PLATFORM'] = 'offscreen'
+
+dir_name = os.path.abspath(os.path.dirname(__file__))
+sys.path.insert(0, os.path.join(dir_name, '..'))
+
+from PyQt5.QtWidgets import QApplication
+
+from libs.galleryWidget import ThumbnailLoaderWorker, generate_color_by_text as gallery_color
+from libs.labelColors import LabelColors, LABEL_ALPHA, hashed_rgb, label_colors, read_palette
+from libs.utils import generate_color_by_text
+
+app = QApplication.instance() or QApplication(sys.argv)
+
+
+class TestLabelColors(unittest.TestCase):
+    """Test cases for LabelColors."""
+
+    def setUp(self):
+        self.colors = LabelColors(max_size=3)
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def write_palette(self, text):
+        path = os.path.join(self.temp_dir, 'label_colors.txt')
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(text)
+        return path
+
+    def test_hash_matches_previous_colours(self):
+        """Test that labels keep the colours they had before the registry."""
+        hash_code = int(hashlib.sha256('person'.encode('utf-8')).hexdigest(), 16)
+        expected = (int((hash_code / 255) % 255), int((hash_code / 65025) % 255),
+                    int((hash_code / 16581375) % 255))
+        self.assertEqual(hashed_rgb('person'), expected)
+        color = self.colors.color('person')
+        self.assertEqual((color.red(), color.green(), color.blue(), color.alpha()),
+                         expected + (LABEL_ALPHA,))
+
+    def test_color_and_brush_memoized(self):
+        """Test that repeated lookups return the cached objects."""
+        self.assertIs(self.colors.color('cat'), self.colors.color('cat'))
+        self.assertIs(self.colors.brush('cat'), self.colors.brush('cat'))
+        self.assertEqual(self.colors.brush('cat').color(), self.colors.color('cat'))
+
+    def test_memo_is_bounded(self):
+        """Test that the least recently used labels are evicted."""
+        first = self.colors.color('a')
+        for label in ('b', 'c', 'd'):
+            self.colors.color(label)
+        self.assertEqual(len(self.colors._colors), 3)
+        self.assertIsNot(self.colors.color('a'), first)
+        self.assertEqual(self.colors.color('a'), first)
+
+    def test_palette_overrides_hash(self):
+        """Test that palette colours win over hashed ones."""
+        path = self.write_palette('# comment\nperson #ff0000\ntraffic light 0x00\n'
+                                  'traffic light #00ff00\n\nbad line\n')
+        self.assertEqual(read_palette(path), {'person': (255, 0, 0), 'traffic light': (0, 255, 0)})
+
+        old = self.colors.color('person')
+        self.assertEqual(self.colors.load_palette(path), 2)
+        self.assertEqual(self.colors.rgb('person'), (255, 0, 0))
+        self.assertEqual(self.colors.color('person').red(), 255)
+        self.assertIsNot(self.colors.color('person'), old)
+        self.assertEqual(self.colors.rgb('dog'), hashed_rgb('dog'))
+
+    def test_snapshot_is_independent(self):
+        """Test that a snapshot keeps the palette it was taken with."""
+        self.colors.set_palette({'person': (1, 2, 3)})
+        snapshot = self.colors.snapshot()
+        self.colors.set_palette({})
+        self.assertEqual(snapshot.rgb('person'), (1, 2, 3))
+        self.assertEqual(snapshot.color('dog').getRgb()[:3], hashed_rgb('dog'))
+        self.assertEqual(snapshot.color('dog').alpha(), 255)
+
+    def test_snapshot_used_from_threads(self):
+        """Test that snapshots can be read from several threads at once."""
+        self.colors.set_palette({'label0': (9, 9, 9)})
+        results = []
+
+        def work():
+            snapshot = self.colors.snapshot()
+            results.append([snapshot.rgb('label%d' % i) for i in range(200)])
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(results), 4)
+        self.assertTrue(all(result == results[0] for result in results))
+        self.assertEqual(results[0][0], (9, 9, 9))
+
+
+class TestSharedLabelColors(unittest.TestCase):
+    """The canvas, label list and gallery agree on label colours."""
+
+    def test_gallery_matches_canvas(self):
+        """Test that thumbnails use the canvas colour, only opaque."""
+        canvas = generate_color_by_text('person')
+        gallery = gallery_color('person')
+        self.assertEqual(canvas.getRgb()[:3], gallery.getRgb()[:3])
+        self.assertEqual(gallery.alpha(), 255)
+
+    def test_thumbnail_worker_takes_snapshot(self):
+        """Test that thumbnail workers read colours through a snapshot."""
+        label_colors.set_palette({'person': (10, 20, 30)})
+        try:
+            worker = ThumbnailLoaderWorker('missing.jpg')
+        finally:
+            label_colors.set_palette({})
+        self.assertEqual(worker.label_colors.rgb('person'), (10, 20, 30))
+
+
+if __name__ == '__main__':
+    unittest.main()
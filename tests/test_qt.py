@@ -3,11 +3,14 @@
 These tests verify that the application boots and basic operations don't crash.
 Run with QT_QPA_PLATFORM=offscreen for headless CI environments.
 """
+import json
 import os
 import sys
 import tempfile
 import shutil
+import time
 import unittest
+from unittest import mock
 
 # Set offscreen platform for headless testing if not already set
 if 'QT_QPA_PLATFORM' not in os.environ:
@@ -16,7 +19,17 @@ if 'QT_QPA_PLATFORM' not in os.environ:
 dir_name = os.path.abspath(os.path.dirname(__file__))
 sys.path.insert(0, os.path.join(dir_name, '..'))
 
+from PyQt5.QtCore import QPointF, Qt
+from PyQt5.QtGui import QPixmap
+
 from labelImg import get_main_app
+from libs.commands import CreateShapeCommand
+from libs.constants import DATASET_INDEX, DATASET_LAST_IMAGE, SETTING_LABEL_FILE_FORMAT, TRASH_DIR_NAME
+from libs.annotationIndex import (ImageFilter, FILTER_MODES, FILTER_NO_LABELS, FILTER_CLASS, FILTER_BOX_COUNT,
+                                  read_annotation_summary)
+from libs.galleryWidget import AnnotationStatus
+from libs.labelFile import LabelFileFormat
+from libs.shape import Shape
 
 
 class TestMainWindowSmoke(unittest.TestCase):
@@ -103,5 +116,529 @@ class TestUndoRedoIntegration(unittest.TestCase):
         self.assertFalse(self.win.undo_stack.can_redo())
 
 
+class TestBulkPaste(unittest.TestCase):
+    """Pasting many shapes is one undo step and never rebuilds the label combo box."""
+
+    SHAPE_COUNT = 1000
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app, cls.win = get_main_app()
+
+    def setUp(self):
+        self.win.reset_state()
+        self.win.canvas.load_pixmap(QPixmap(2000, 2000))
+        self.win.clipboard_shapes = [self.make_shape(i) for i in range(self.SHAPE_COUNT)]
+        self.combo_rebuilds = 0
+        set_labels = self.win.combo_box.set_labels
+
+        def counting_set_labels(labels):
+            self.combo_rebuilds += 1
+            set_labels(labels)
+        self.win.combo_box.set_labels = counting_set_labels
+
+    def tearDown(self):
+        del self.win.combo_box.set_labels
+        self.win.reset_state()
+
+    @staticmethod
+    def make_shape(i):
+        shape = Shape(label='label%d' % (i % 20))
+        x, y = (i % 40) * 40, (i // 40) * 40
+        for px, py in ((x, y), (x + 30, y), (x + 30, y + 30), (x, y + 30)):
+            shape.add_point(QPointF(px, py))
+        shape.close()
+        return shape
+
+    def test_paste_is_one_undo_step(self):
+        """Test that a paste is undone and redone as a whole."""
+        self.win.paste_from_clipboard()
+        self.assertEqual(len(self.win.canvas.shapes), self.SHAPE_COUNT)
+        self.assertEqual(self.win.label_list.count(), self.SHAPE_COUNT)
+        self.assertEqual(len(self.win.undo_stack), 1)
+        labels = [''] + sorted('label%d' % i for i in range(20))
+        self.assertEqual(self.win.combo_box.items, labels)
+
+        self.win.undo_action()
+        self.assertEqual(len(self.win.canvas.shapes), 0)
+        self.assertEqual(self.win.label_list.count(), 0)
+        self.assertEqual(self.win.combo_box.items, [''])
+        self.win.redo_action()
+        self.assertEqual(len(self.win.canvas.shapes), self.SHAPE_COUNT)
+        self.assertEqual(self.win.combo_box.items, labels)
+        self.assertEqual(self.combo_rebuilds, 0)
+
+    def test_benchmark_paste(self):
+        """Benchmark a bulk paste against one command and combo rebuild per shape."""
+        start = time.perf_counter()
+        for clipboard_shape in self.win.clipboard_shapes:
+            shape = clipboard_shape.copy()
+            self.win.canvas.shapes.append(shape)
+            self.win.add_label(shape)
+            self.win.update_combo_box()
+            self.win.undo_stack.push(CreateShapeCommand(self.win, shape))
+        per_shape = time.perf_counter() - start
+        self.win.reset_state()
+        self.win.canvas.load_pixmap(QPixmap(2000, 2000))
+
+        start = time.perf_counter()
+        self.win.paste_from_clipboard()
+        bulk = time.perf_counter() - start
+        self.assertEqual(len(self.win.canvas.shapes), self.SHAPE_COUNT)
+        self.assertLess(bulk * 3, per_shape)
+
+
+class TestLabelComboBox(unittest.TestCase):
+    """The label filter follows shapes being added, renamed and removed."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app, cls.win = get_main_app()
+
+    def setUp(self):
+        self.win.reset_state()
+        self.win.canvas.load_pixmap(QPixmap(200, 200))
+
+    def tearDown(self):
+        self.win.reset_state()
+
+    def test_load_rename_and_remove(self):
+        """Test that the combo box items track the shape labels."""
+        points = [(0, 0), (10, 0), (10, 10), (0, 10)]
+        self.win.load_labels([(label, points, None, None, False) for label in ('dog', 'cat', 'dog')])
+        self.assertEqual(self.win.combo_box.items, ['', 'cat', 'dog'])
+
+        item = self.win.shapes_to_items[self.win.canvas.shapes[1]]
+        item.setText('bird')
+        self.assertEqual(self.win.combo_box.items, ['', 'bird', 'dog'])
+
+        self.win.remove_label(self.win.canvas.shapes[0])
+        self.assertEqual(self.win.combo_box.items, ['', 'bird', 'dog'])
+        self.win.remove_label(self.win.canvas.shapes[2])
+        self.assertEqual(self.win.combo_box.items, ['', 'bird'])
+
+
+class TestBulkLabelLoading(unittest.TestCase):
+    """Opening an annotation with thousands of boxes fills the label list in bulk."""
+
+    SHAPE_COUNT = 5000
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app, cls.win = get_main_app()
+
+    def setUp(self):
+        self.win.reset_state()
+        self.win.canvas.load_pixmap(QPixmap(4000, 4000))
+        self.shapes = []
+        for i in range(self.SHAPE_COUNT):
+            x, y = (i % 70) * 50, (i // 70) * 50
+            points = [(x, y), (x + 20, y), (x + 20, y + 20), (x, y + 20)]
+            self.shapes.append(('label%d' % (i % 50), points, None, None, False))
+
+    def tearDown(self):
+        self.win.reset_state()
+
+    def test_load_populates_list(self):
+        """Test that every shape gets a working list item."""
+        self.win.load_labels(self.shapes)
+        self.assertEqual(self.win.label_list.count(), self.SHAPE_COUNT)
+        self.assertEqual(len(self.win.combo_box.items), 51)
+        self.assertTrue(all(action.isEnabled() for action in self.win.actions.onShapesPresent))
+
+        last = self.win.label_list.item(self.SHAPE_COUNT - 1)
+        shape = self.win.items_to_shapes[last]
+        self.assertIs(shape, self.win.canvas.shapes[-1])
+        self.assertEqual(self.win.label_list.row(last), self.SHAPE_COUNT - 1)
+
+        # Signals are live again after loading
+        last.setCheckState(Qt.Unchecked)
+        self.assertFalse(self.win.canvas.isVisible(shape))
+
+    def test_benchmark_load(self):
+        """Benchmark opening an annotation with thousands of boxes."""
+        start = time.perf_counter()
+        self.win.load_labels(self.shapes)
+        elapsed = time.perf_counter() - start
+        self.assertLess(elapsed, 1.0)
+
+
+class TestLazyStartup(unittest.TestCase):
+    """Rarely used parts of the main window are only built when first needed."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app, cls.win = get_main_app()
+        cls.temp_dir = tempfile.mkdtemp()
+        for name in ('a.png', 'b.png'):
+            QPixmap(20, 20).save(os.path.join(cls.temp_dir, name))
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.win.close()
+        shutil.rmtree(cls.temp_dir, ignore_errors=True)
+
+    def test_dialogs_are_built_on_first_use(self):
+        """Test that the label and colour dialogs are created on access and then kept."""
+        self.assertIsNone(self.win._label_dialog)
+        self.assertIsNone(self.win._color_dialog)
+        self.assertIs(self.win.label_dialog, self.win.label_dialog)
+        self.assertIs(self.win.color_dialog, self.win.color_dialog)
+
+    def test_help_menu_is_filled_after_startup(self):
+        """Test that the deferred help actions appear once events are processed."""
+        self.app.processEvents()
+        self.assertEqual(len(self.win.menus.help.actions()), 3)
+        self.win.populate_help_menu()
+        self.assertEqual(len(self.win.menus.help.actions()), 3)
+
+    def test_gallery_is_built_when_its_tab_opens(self):
+        """Test that opening a folder does not build the gallery; its tab does."""
+        self.win.import_dir_images(self.temp_dir)
+        self.assertIsNone(self.win.gallery_widget)
+
+        self.win.file_view_tabs.setCurrentIndex(1)
+        gallery = self.win.gallery_widget
+        self.assertIsNotNone(gallery)
+        self.assertEqual(gallery._image_list, self.win.m_img_list)
+        self.assertEqual(gallery.list_widget.currentItem().data(Qt.UserRole), self.win.file_path)
+
+        self.win.file_view_tabs.setCurrentIndex(0)
+        self.win.file_view_tabs.setCurrentIndex(1)
+        self.assertIs(self.win.gallery_widget, gallery)
+        self.win.file_view_tabs.setCurrentIndex(0)
+
+
+class TestSessionResume(unittest.TestCase):
+    """Reopening a folder returns to the image and view it was left at."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app, cls.win = get_main_app()
+        cls.temp_dir = tempfile.mkdtemp()
+        cls.image_dir = os.path.join(cls.temp_dir, 'images')
+        os.mkdir(cls.image_dir)
+        for i in range(5):
+            QPixmap(200, 200).save(os.path.join(cls.image_dir, 'img%d.png' % i))
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.win.close()
+        shutil.rmtree(cls.temp_dir, ignore_errors=True)
+
+    def setUp(self):
+        # Start every test from a closed folder with no session records
+        self.win.dir_name = None
+        self.win.settings.dataset_dir = tempfile.mkdtemp(dir=self.temp_dir)
+        self.win.settings._datasets = {}
+        self.win.default_save_dir = self.temp_dir
+
+    def test_first_open_starts_at_first_image(self):
+        """Test that a folder without a session record opens its first image."""
+        self.win.import_dir_images(self.image_dir)
+        self.assertEqual(self.win.cur_img_idx, 0)
+        self.assertEqual(self.win.file_path, self.win.m_img_list[0])
+
+    def test_image_zoom_and_scroll_are_restored(self):
+        """Test that the image, zoom and scroll offsets come back on reopening."""
+        self.win.import_dir_images(self.image_dir)
+        for _ in range(3):
+            self.win.open_next_image()
+        self.win.set_zoom(400)
+        v_bar = self.win.scroll_bars[Qt.Vertical]
+        v_bar.setValue(v_bar.maximum() // 2)
+        scroll = v_bar.value()
+
+        self.win.import_dir_images(self.image_dir)
+        self.assertEqual(self.win.cur_img_idx, 3)
+        self.assertEqual(self.win.file_path, self.win.m_img_list[3])
+        self.assertEqual(self.win.zoom_mode, self.win.MANUAL_ZOOM)
+        self.assertEqual(self.win.zoom_widget.value(), 400)
+        self.assertEqual(v_bar.value(), scroll)
+
+    def test_missing_image_falls_back_to_its_index(self):
+        """Test that the image now at the stored index opens when the last one is gone."""
+        session = self.win.settings.dataset(self.image_dir)
+        session[DATASET_LAST_IMAGE] = os.path.join(self.image_dir, 'deleted.png')
+        session[DATASET_INDEX] = 2
+        self.win.import_dir_images(self.image_dir)
+        self.assertEqual(self.win.cur_img_idx, 2)
+
+    def test_session_is_written_in_background(self):
+        """Test that a background save puts the session record on disk."""
+        self.win.import_dir_images(self.image_dir)
+        self.win.open_next_image()
+        settings = self.win.settings
+        settings.save_in_background()
+        settings.wait_for_writes()
+        self.assertFalse(settings.dataset(self.image_dir).is_dirty())
+
+        settings._datasets = {}
+        self.assertEqual(settings.dataset(self.image_dir).get(DATASET_LAST_IMAGE), self.win.m_img_list[1])
+
+
+class TestImageListMutation(unittest.TestCase):
+    """Deleting and trashing images updates the lists in place, without a rescan."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app, cls.win = get_main_app()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.win.close()
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.image_dir = os.path.join(self.temp_dir, 'images')
+        os.mkdir(self.image_dir)
+        for i in range(6):
+            QPixmap(20, 20).save(os.path.join(self.image_dir, 'img%d.png' % i))
+        self.win.settings.dataset_dir = os.path.join(self.temp_dir, 'datasets')
+        self.win.settings._datasets = {}
+        self.win.dir_name = None
+        self.win.default_save_dir = self.image_dir
+        self.win.import_dir_images(self.image_dir)
+        self.win.ensure_gallery_widget()
+
+    def tearDown(self):
+        self.win._trash_pool.waitForDone()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def assert_lists_consistent(self, expected):
+        win = self.win
+        self.assertEqual(win.m_img_list, expected)
+        self.assertEqual(win._path_to_idx, {path: i for i, path in enumerate(expected)})
+        self.assertEqual(win.img_count, len(expected))
+        self.assertEqual([win.file_list_widget.item(i).text() for i in range(win.file_list_widget.count())],
+                         expected)
+        self.assertEqual(win.gallery_widget._image_list, expected)
+        self.assertEqual(win.gallery_widget.list_widget.count(), len(expected))
+
+    def test_delete_image_opens_the_next_one(self):
+        """Test that the deleted image leaves every list and its successor opens."""
+        images = list(self.win.m_img_list)
+        self.win.cur_img_idx = 2
+        self.win.load_file(images[2])
+        with mock.patch.object(self.win, 'import_dir_images') as rescan:
+            self.win.delete_image()
+        rescan.assert_not_called()
+        self.assertFalse(os.path.exists(images[2]))
+        self.assert_lists_consistent(images[:2] + images[3:])
+        self.assertEqual(self.win.file_path, images[3])
+        self.assertEqual(self.win.cur_img_idx, 2)
+
+    def test_remove_image_paths_renumbers_the_rest(self):
+        """Test that removing several paths keeps indexes and the current image in sync."""
+        images = list(self.win.m_img_list)
+        self.win.load_file(images[5])
+        removed = self.win.remove_image_paths([images[4], images[1], '/not/listed.png'])
+        self.assertEqual(removed, [images[1], images[4]])
+        self.assert_lists_consistent([images[0], images[2], images[3], images[5]])
+        self.assertEqual(self.win.cur_img_idx, 3)
+
+    def test_trash_moves_images_and_annotations(self):
+        """Test that a batch goes to the trash folder, which later scans skip."""
+        images = list(self.win.m_img_list)
+        with open(os.path.splitext(images[1])[0] + '.xml', 'w') as f:
+            f.write('<annotation/>')
+        self.win.file_list_widget.clearSelection()
+        self.win.file_list_widget.item(1).setSelected(True)
+        self.win.file_list_widget.item(3).setSelected(True)
+        self.win.trash_selected_images()
+        self.assert_lists_consistent([images[0], images[2], images[4], images[5]])
+        self.assertEqual(self.win.file_path, images[0])
+
+        self.win._trash_pool.waitForDone()
+        trash = os.path.join(self.image_dir, TRASH_DIR_NAME)
+        self.assertEqual(sorted(os.listdir(trash)), ['img1.png', 'img1.xml', 'img3.png'])
+        self.assertEqual(self.win.scan_all_images(self.image_dir), self.win.m_img_list)
+
+    def test_add_image_paths_inserts_in_sorted_order(self):
+        """Test that images appearing in the folder are inserted without a rescan."""
+        images = list(self.win.m_img_list)
+        self.win.load_file(images[3])
+        new = [os.path.join(self.image_dir, name) for name in ('img10.png', 'img2b.png', 'a.png')]
+        added = self.win.add_image_paths(new + [images[0]])
+        self.assertEqual(sorted(added), sorted(new))
+        self.assert_lists_consistent([new[2]] + images[:3] + [new[1]] + images[3:] + [new[0]])
+        self.assertEqual(self.win.cur_img_idx, 5)
+
+    def test_changed_annotation_updates_the_status(self):
+        """Test that an annotation written by someone else marks its image as labeled."""
+        images = list(self.win.m_img_list)
+        gallery = self.win.gallery_widget
+        self.assertEqual(gallery._statuses.get(images[4], AnnotationStatus.NO_LABELS), AnnotationStatus.NO_LABELS)
+        annotation = os.path.splitext(images[4])[0] + '.xml'
+        with open(annotation, 'w') as f:
+            f.write('<annotation><object><name>cat</name></object></annotation>')
+        self.win._on_annotations_changed([annotation])
+        self.assertEqual(gallery._statuses.get(images[4], AnnotationStatus.NO_LABELS), AnnotationStatus.HAS_LABELS)
+        self.assertEqual(gallery._statuses.get(images[3], AnnotationStatus.NO_LABELS), AnnotationStatus.NO_LABELS)
+
+    def test_annotation_lookup_follows_list_changes(self):
+        """Test that changed annotations find added images and skip removed ones without a rebuild."""
+        images = list(self.win.m_img_list)
+        gallery = self.win.gallery_widget
+        keys = self.win._images_by_annotation_key()
+        new_image = os.path.join(self.image_dir, 'img10.png')
+        QPixmap(20, 20).save(new_image)
+        self.win.add_image_paths([new_image])
+        self.win.remove_image_paths([images[2]])
+        self.assertIs(self.win._images_by_annotation_key(), keys)
+        self.assertEqual(keys[(self.image_dir, 'img10')], [new_image])
+        self.assertNotIn((self.image_dir, 'img2'), keys)
+
+        annotation = os.path.join(self.image_dir, 'img10.xml')
+        with open(annotation, 'w') as f:
+            f.write('<annotation><object><name>cat</name></object></annotation>')
+        with mock.patch.object(self.win, '_update_gallery_status') as update:
+            self.win._on_annotations_changed([annotation, os.path.join(self.image_dir, 'img2.xml')])
+        update.assert_called_once_with(new_image)
+
+
+class TestImageFilter(unittest.TestCase):
+    """Filtering the images by annotation status drives next/previous image."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app, cls.win = get_main_app()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.win.close()
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        for i in range(6):
+            QPixmap(20, 20).save(os.path.join(self.temp_dir, 'img%d.png' % i))
+        self.write_labels(1, ['cat'])
+        self.write_labels(4, ['dog', 'dog'])
+        self.win.settings.dataset_dir = tempfile.mkdtemp(dir=self.temp_dir)
+        self.win.settings._datasets = {}
+        self.win.dir_name = None
+        self.win.default_save_dir = self.temp_dir
+        self.win.import_dir_images(self.temp_dir)
+        self.images = list(self.win.m_img_list)
+
+    def tearDown(self):
+        self.win.set_clean()
+        self.win.save_queue.wait()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def wait_for_index(self):
+        while self.win._index_queue:
+            self.app.processEvents()
+
+    def write_labels(self, i, labels):
+        objects = ''.join('<object><name>%s</name><bndbox><xmin>1</xmin><ymin>1</ymin><xmax>5</xmax>'
+                          '<ymax>5</ymax></bndbox></object>' % label for label in labels)
+        with open(os.path.join(self.temp_dir, 'img%d.xml' % i), 'w') as f:
+            f.write('<annotation><filename>img%d.png</filename>%s</annotation>' % (i, objects))
+
+    def test_next_image_skips_non_matching_images(self):
+        """Test that next/previous step through the matching images only."""
+        win = self.win
+        win.set_image_filter(ImageFilter(FILTER_NO_LABELS, None))
+        self.wait_for_index()
+        self.assertEqual(win._filter_rows, [0, 2, 3, 5])
+        self.assertTrue(win.file_list_widget.isRowHidden(1))
+        self.assertFalse(win.file_list_widget.isRowHidden(2))
+        win.load_file(self.images[0])
+        win.cur_img_idx = 0
+        win.open_next_image()
+        self.assertEqual(win.file_path, self.images[2])
+        win.open_next_image()
+        win.open_next_image()
+        self.assertEqual(win.file_path, self.images[5])
+        win.open_next_image()
+        self.assertEqual(win.file_path, self.images[5])
+        win.open_prev_image()
+        self.assertEqual(win.file_path, self.images[3])
+
+        win.set_image_filter(None)
+        self.assertFalse(win.file_list_widget.isRowHidden(1))
+        win.open_prev_image()
+        self.assertEqual(win.file_path, self.images[2])
+
+    def test_class_and_box_count_filters(self):
+        """Test that class and box count filters use the indexed labels."""
+        win = self.win
+        win.set_image_filter(ImageFilter(FILTER_CLASS, 'dog'))
+        self.wait_for_index()
+        self.assertEqual(win._filter_rows, [4])
+        win.set_image_filter(ImageFilter(FILTER_BOX_COUNT, (1, None)))
+        self.assertEqual(win._filter_rows, [1, 4])
+        self.assertEqual(win.annotation_index.classes(), ['cat', 'dog'])
+
+    def test_changed_image_moves_in_and_out_of_the_filter(self):
+        """Test that a re-read image updates the filter without querying every image again."""
+        win = self.win
+        win.set_image_filter(ImageFilter(FILTER_NO_LABELS, None))
+        self.wait_for_index()
+        self.write_labels(2, ['cat'])
+        os.remove(os.path.join(self.temp_dir, 'img4.xml'))
+        with mock.patch.object(win.annotation_index, 'query') as query:
+            win._update_gallery_status(self.images[2])
+            win._update_gallery_status(self.images[4])
+        query.assert_not_called()
+        self.assertEqual(win._filter_rows, [0, 3, 4, 5])
+        self.assertTrue(win.file_list_widget.isRowHidden(2))
+        self.assertFalse(win.file_list_widget.isRowHidden(4))
+
+    def test_indexing_runs_in_batches(self):
+        """Test that choosing a filter reads no file itself and shows matches batch by batch."""
+        win = self.win
+        with mock.patch('labelImg.read_annotation_summary', wraps=read_annotation_summary) as read:
+            win.set_image_filter(ImageFilter(FILTER_NO_LABELS, None))
+            read.assert_not_called()
+            self.assertTrue(all(win.file_list_widget.isRowHidden(row) for row in range(6)))
+            win._index_next_batch(win._index_generation, batch_size=2)
+            self.assertEqual(read.call_count, 2)
+            self.assertEqual(win._filter_rows, [0])
+            self.assertFalse(win.file_list_widget.isRowHidden(0))
+            self.assertTrue(win.file_list_widget.isRowHidden(2))
+            self.wait_for_index()
+        self.assertEqual(read.call_count, 6)
+        self.assertEqual(win._filter_rows, [0, 2, 3, 5])
+
+    def test_filter_controls(self):
+        """Test that the filter combo boxes set the filter and a new folder resets it."""
+        win = self.win
+        win.filter_combo.setCurrentIndex(FILTER_MODES.index(FILTER_CLASS))
+        self.wait_for_index()
+        self.assertFalse(win.filter_value_combo.isHidden())
+        self.assertEqual([win.filter_value_combo.itemText(i) for i in range(win.filter_value_combo.count())],
+                         ['cat', 'dog'])
+        self.assertEqual(win.image_filter, ImageFilter(FILTER_CLASS, 'cat'))
+        win.filter_combo.setCurrentIndex(FILTER_MODES.index(FILTER_BOX_COUNT))
+        win.filter_value_combo.setEditText('2-')
+        win._apply_filter_controls()
+        self.assertEqual(win._filter_rows, [4])
+        win.import_dir_images(self.temp_dir)
+        self.assertIsNone(win.image_filter)
+        self.assertEqual(win.filter_combo.currentIndex(), 0)
+
+
+class TestSettingsRecovery(unittest.TestCase):
+    """Settings edited by hand do not keep the application from starting."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.temp_dir = tempfile.mkdtemp()
+        with open(os.path.join(cls.temp_dir, '.labelImgSettings.json'), 'w') as f:
+            json.dump({SETTING_LABEL_FILE_FORMAT: 7}, f)
+        with mock.patch.dict(os.environ, {'HOME': cls.temp_dir}):
+            cls.app, cls.win = get_main_app()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.win.close()
+        shutil.rmtree(cls.temp_dir, ignore_errors=True)
+
+    def test_unknown_label_format_falls_back_to_pascal_voc(self):
+        """Test that a stored label format that is not a format starts in Pascal VOC."""
+        self.assertEqual(self.win.label_file_format, LabelFileFormat.PASCAL_VOC)
+
 if __name__ == '__main__':
     unittest.main()
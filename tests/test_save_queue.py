@@ -0,0 +1,159 @@
+"""Tests for background annotation saving."""
+import os
+import sys
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+
+if 'QT_QPA_PLATFORM' not in os.environ:
+    os.environ['QT_QPA_PLATFORM'] = 'offscreen'
+
+dir_name = os.path.abspath(os.path.dirname(__file__))
+sys.path.insert(0, os.path.join(dir_name, '..'))
+
+from PyQt5.QtWidgets import QApplication
+
+from libs.labelFile import LabelFileFormat
+from libs.pascal_voc_io import PascalVocReader
+from libs.saveQueue import SaveQueue, SaveSnapshot, annotation_path_for, write_snapshot
+
+app = QApplication.instance() or QApplication(sys.argv)
+
+BOX = dict(label='cat', line_color=(0, 255, 0, 128), fill_color=(255, 0, 0, 128),
+           points=((10, 20), (60, 20), (60, 80), (10, 80)), difficult=False)
+
+
+def make_snapshot(annotation_path, image_path='/data/img.jpg', label_format=LabelFileFormat.PASCAL_VOC,
+                  shapes=(BOX,)):
+    return SaveSnapshot(image_path, annotation_path, label_format, shapes, [100, 200, 3], ('cat',), False)
+
+
+class TestWriteSnapshot(unittest.TestCase):
+    """Test cases for writing a snapshot to disk."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_extension_is_added_once(self):
+        """Test that the format extension is only appended when missing."""
+        self.assertEqual(annotation_path_for('/a/img', LabelFileFormat.YOLO), '/a/img.txt')
+        self.assertEqual(annotation_path_for('/a/img.XML', LabelFileFormat.PASCAL_VOC), '/a/img.XML')
+
+    def test_pascal_voc_is_written_without_the_image(self):
+        """Test that the stored image shape is used; the image file does not exist."""
+        path = write_snapshot(make_snapshot(os.path.join(self.temp_dir, 'img')))
+        self.assertEqual(path, os.path.join(self.temp_dir, 'img.xml'))
+        shapes = PascalVocReader(path).get_shapes()
+        self.assertEqual([s[0] for s in shapes], ['cat'])
+
+    def test_yolo_writes_the_class_list(self):
+        """Test that YOLO output gets its classes file from the snapshot."""
+        write_snapshot(make_snapshot(os.path.join(self.temp_dir, 'img'), label_format=LabelFileFormat.YOLO))
+        with open(os.path.join(self.temp_dir, 'classes.txt')) as f:
+            self.assertEqual(f.read().split(), ['cat'])
+
+
+class TestSaveQueue(unittest.TestCase):
+    """Test cases for ordering, coalescing, skipping and error reporting of the queue."""
+
+    def setUp(self):
+        self.queue = SaveQueue()
+        self.saved = []
+        self.failed = []
+        self.queue.signals.saved.connect(lambda image, path: self.saved.append(path))
+        self.queue.signals.failed.connect(lambda image, message: self.failed.append(message))
+
+    def test_waiting_saves_of_a_file_are_replaced_in_place(self):
+        """Test that saves stay in order and only the newest waiting save of a file is written."""
+        written = []
+        release = threading.Event()
+
+        def fake_write(snapshot):
+            if not written:
+                release.wait(5)
+            written.append(snapshot)
+            return snapshot.annotation_path
+
+        first = make_snapshot('/out/a.xml')
+        newer = make_snapshot('/out/a.xml', shapes=())
+        other = make_snapshot('/out/b.xml', image_path='/data/b.jpg')
+        with mock.patch('libs.saveQueue.write_snapshot', side_effect=fake_write):
+            self.queue.submit(first)
+            while self.queue._in_flight is None:  # Until the worker is blocked writing ``first``
+                time.sleep(0.001)
+            self.assertTrue(self.queue.submit(newer))
+            self.assertTrue(self.queue.submit(other))
+            self.assertTrue(self.queue.submit(make_snapshot('/out/a.xml', shapes=(BOX, BOX))))
+            self.assertTrue(self.queue.submit(newer))
+            self.assertEqual(self.queue.pending_count(), 3)
+            release.set()
+            self.queue.wait()
+        self.assertEqual(written, [first, newer, other])
+        self.assertFalse(self.queue.is_pending('/data/img.jpg'))
+
+        app.processEvents()
+        self.assertEqual(self.saved, ['/out/a.xml', '/out/a.xml', '/out/b.xml'])
+
+    def test_content_already_queued_or_saved_is_skipped(self):
+        """Test that saving the same annotations twice writes the file once."""
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir, True)
+        snapshot = make_snapshot(os.path.join(temp_dir, 'img'))
+        self.assertTrue(self.queue.submit(snapshot))
+        self.assertFalse(self.queue.submit(snapshot))
+        self.queue.wait()
+        self.assertFalse(self.queue.submit(snapshot))
+        self.assertTrue(self.queue.submit(snapshot._replace(verified=True)))
+        self.queue.wait()
+        app.processEvents()
+        self.assertEqual(len(self.saved), 2)
+
+    def test_missing_file_is_written_again(self):
+        """Test that a file deleted after saving is not considered up to date."""
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir, True)
+        snapshot = make_snapshot(os.path.join(temp_dir, 'img'))
+        self.queue.mark_saved(snapshot)
+        self.assertFalse(self.queue.is_unchanged(snapshot))
+        write_snapshot(snapshot)
+        self.queue.mark_saved(snapshot)
+        self.assertTrue(self.queue.is_unchanged(snapshot))
+        self.queue.forget(snapshot)
+        self.assertFalse(self.queue.is_unchanged(snapshot))
+
+    def test_file_rewritten_by_others_is_written_again(self):
+        """Test that saving the same content again restores a file someone else overwrote."""
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir, True)
+        snapshot = make_snapshot(os.path.join(temp_dir, 'img'))
+        self.assertTrue(self.queue.submit(snapshot))
+        self.queue.wait()
+        self.assertTrue(self.queue.is_unchanged(snapshot))
+
+        path = os.path.join(temp_dir, 'img.xml')
+        with open(path, 'w') as f:
+            f.write('<annotation/>')
+        self.assertFalse(self.queue.is_unchanged(snapshot))
+        self.assertTrue(self.queue.submit(snapshot))
+        self.queue.wait()
+        self.assertEqual([s[0] for s in PascalVocReader(path).get_shapes()], ['cat'])
+
+    def test_failures_are_reported(self):
+        """Test that a failing write is reported and does not stop later saves."""
+        with mock.patch('libs.saveQueue.write_snapshot', side_effect=[IOError('disk full'), '/out/b.xml']):
+            self.queue.submit(make_snapshot('/out/a.xml'))
+            self.queue.submit(make_snapshot('/out/b.xml'))
+            self.queue.wait()
+        app.processEvents()
+        self.assertEqual(self.failed, ['disk full'])
+        self.assertEqual(self.saved, ['/out/b.xml'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,14 +1,22 @@
 #!/usr/bin/env python
 """Tests for Settings class with proper isolation (uses temp files)."""
+import json
 import os
+import pickle
+import shutil
 import sys
 import tempfile
 import unittest
+from unittest import mock
 
 dir_name = os.path.abspath(os.path.dirname(__file__))
 libs_path = os.path.join(dir_name, '..', 'libs')
 sys.path.insert(0, libs_path)
-from settings import Settings
+from settings import Settings, JsonStore
+
+from PyQt5.QtCore import QByteArray, QPoint, QSize
+from PyQt5.QtGui import QColor
+from labelFile import LabelFileFormat
 
 
 class TestSettings(unittest.TestCase):
@@ -18,13 +26,22 @@ class TestSettings(unittest.TestCase):
         """Create a temp file for settings to avoid polluting user home."""
         self.temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.pkl')
         self.temp_file.close()
-        self.settings = Settings()
-        self.settings.path = self.temp_file.name
+        self.temp_dir = tempfile.mkdtemp()
+        self.settings = self.make_settings()
 
     def tearDown(self):
         """Clean up temp file."""
         if os.path.exists(self.temp_file.name):
             os.remove(self.temp_file.name)
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def make_settings(self):
+        """Settings stored in the temp locations instead of the home folder."""
+        settings = Settings()
+        settings.path = self.temp_file.name
+        settings.legacy_path = os.path.join(self.temp_dir, 'settings.pkl')
+        settings.dataset_dir = os.path.join(self.temp_dir, 'datasets')
+        return settings
 
     def test_set_and_get(self):
         """Test setting and getting values."""
@@ -48,8 +65,7 @@ class TestSettings(unittest.TestCase):
         self.assertTrue(self.settings.save())
 
         # Create a new settings instance and load
-        new_settings = Settings()
-        new_settings.path = self.temp_file.name
+        new_settings = self.make_settings()
         self.assertTrue(new_settings.load())
         self.assertEqual(new_settings.get('key1'), 'value1')
         self.assertEqual(new_settings.get('key2'), 123)
@@ -69,6 +85,169 @@ class TestSettings(unittest.TestCase):
         self.settings.path = '/nonexistent/path/settings.pkl'
         self.assertFalse(self.settings.load())
 
+    def test_qt_values_round_trip(self):
+        """Test that Qt value types survive a save/load as typed JSON."""
+        self.settings['size'] = QSize(600, 500)
+        self.settings['pos'] = QPoint(10, -20)
+        self.settings['color'] = QColor(1, 2, 3, 128)
+        self.settings['state'] = QByteArray(b'\x00\xffstate')
+        self.settings['format'] = LabelFileFormat.YOLO
+        self.settings['zoom'] = {'/data/a': 0.5}
+        self.assertTrue(self.settings.save())
+
+        with open(self.temp_file.name, encoding='utf-8') as f:
+            raw = json.load(f)
+        self.assertEqual(raw['size'], {'__type__': 'QSize', 'value': [600, 500]})
+
+        loaded = self.make_settings()
+        self.assertTrue(loaded.load())
+        self.assertEqual(loaded.data, {})  # Nothing is decoded until it is read
+        self.assertEqual(loaded.get('size'), QSize(600, 500))
+        self.assertEqual(loaded.get('pos'), QPoint(10, -20))
+        self.assertEqual(loaded.get('color'), QColor(1, 2, 3, 128))
+        self.assertEqual(loaded.get('state'), QByteArray(b'\x00\xffstate'))
+        self.assertEqual(LabelFileFormat(loaded.get('format')), LabelFileFormat.YOLO)
+        self.assertEqual(loaded.get('zoom'), {'/data/a': 0.5})
+        self.assertEqual(set(loaded.data), {'size', 'pos', 'color', 'state', 'format', 'zoom'})
+
+    def test_unsupported_value_is_rejected(self):
+        """Test that values that cannot be stored fail when they are set."""
+        with self.assertRaises(TypeError):
+            self.settings['bad'] = object()
+
+    def test_unchanged_settings_are_not_rewritten(self):
+        """Test that setting the stored value again does not mark the store dirty."""
+        self.settings['key'] = [1, 2]
+        self.settings.save()
+        loaded = self.make_settings()
+        loaded.load()
+        loaded['key'] = [1, 2]
+        self.assertFalse(loaded.is_dirty())
+        value = loaded.get('key')
+        value.append(3)
+        loaded['key'] = value
+        self.assertTrue(loaded.is_dirty())
+
+    def test_save_is_atomic(self):
+        """Test that a write failing half way leaves the previous file intact."""
+        self.settings.path = os.path.join(self.temp_dir, 'settings.json')
+        self.settings['key'] = 'old'
+        self.assertTrue(self.settings.save())
+        self.settings['key'] = 'new'
+        with mock.patch('settings.os.fsync', side_effect=OSError('disk full')):
+            self.assertFalse(self.settings.save())
+        self.assertEqual(os.listdir(self.temp_dir), ['settings.json'])
+        loaded = self.make_settings()
+        loaded.path = self.settings.path
+        loaded.load()
+        self.assertEqual(loaded.get('key'), 'old')
+
+    def test_corrupted_file_is_kept_aside(self):
+        """Test that a corrupted file gives defaults and is not silently overwritten."""
+        with open(self.temp_file.name, 'w') as f:
+            f.write('{"key": ')
+        self.assertFalse(self.settings.load())
+        self.assertIsNone(self.settings.get('key'))
+        self.assertTrue(os.path.exists(self.temp_file.name + '.corrupt'))
+        os.remove(self.temp_file.name + '.corrupt')
+
+    def test_legacy_pickle_is_migrated(self):
+        """Test that pickled settings of older versions are read and saved as JSON."""
+        os.remove(self.temp_file.name)
+        with open(self.settings.legacy_path, 'wb') as f:
+            pickle.dump({'size': QSize(3, 4), 'recent': ['a.jpg']}, f)
+        self.assertTrue(self.settings.load())
+        self.assertEqual(self.settings.get('size'), QSize(3, 4))
+        self.assertTrue(self.settings.save())
+
+        loaded = self.make_settings()
+        os.remove(loaded.legacy_path)
+        self.assertTrue(loaded.load())
+        self.assertEqual(loaded.get('recent'), ['a.jpg'])
+
+    def test_dataset_settings_are_separate(self):
+        """Test that folder settings live in their own files next to the global ones."""
+        self.settings['global'] = 1
+        self.settings.dataset('/data/a')['zoom'] = 0.25
+        self.settings.dataset('/data/b')['zoom'] = 2.0
+        self.assertIs(self.settings.dataset('/data/a'), self.settings.dataset('/data/a'))
+        self.assertTrue(self.settings.save())
+        self.assertEqual(len(os.listdir(self.settings.dataset_dir)), 2)
+
+        loaded = self.make_settings()
+        loaded.load()
+        self.assertEqual(loaded.dataset('/data/a').get('zoom'), 0.25)
+        self.assertEqual(loaded.dataset('/data/b').get('zoom'), 2.0)
+        self.assertIsNone(loaded.dataset('/data/c').get('zoom'))
+        self.assertNotIn('zoom', loaded)
+
+        # Saving one folder leaves the other files alone
+        path_b = loaded.dataset('/data/b').path
+        mtime_b = os.path.getmtime(path_b)
+        os.utime(path_b, (mtime_b - 100, mtime_b - 100))
+        loaded.dataset('/data/a')['zoom'] = 0.5
+        loaded.save()
+        self.assertEqual(os.path.getmtime(path_b), mtime_b - 100)
+
+        loaded.reset()
+        self.assertEqual(os.listdir(self.settings.dataset_dir), [])
+
+
+class TestJsonStore(unittest.TestCase):
+    """Test cases for the JSON file behind the settings."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, 'store.json')
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_values_are_decoded_on_first_read(self):
+        """Test that loading keeps values encoded until each key is read."""
+        store = JsonStore(self.path)
+        store['size'] = QSize(4, 3)
+        store['name'] = 'a'
+        self.assertTrue(store.save())
+
+        loaded = JsonStore(self.path)
+        self.assertTrue(loaded.load())
+        self.assertIn('size', loaded)
+        self.assertEqual(loaded.data, {})
+        with mock.patch.dict('settings.DECODERS', {'QSize': mock.Mock(return_value=QSize(4, 3))}) as decoders:
+            self.assertEqual(loaded['size'], QSize(4, 3))
+            self.assertEqual(loaded['size'], QSize(4, 3))
+            self.assertEqual(decoders['QSize'].call_count, 1)
+        self.assertEqual(set(loaded.data), {'size'})
+
+    def test_save_writes_only_changes(self):
+        """Test that save() leaves the file alone until a value changes."""
+        store = JsonStore(self.path)
+        store['key'] = 1
+        self.assertTrue(store.save())
+        with mock.patch('settings.atomic_write') as write:
+            store['key'] = 1
+            self.assertTrue(store.save())
+            write.assert_not_called()
+            store['key'] = 2
+            self.assertTrue(store.save())
+            write.assert_called_once_with(self.path, store.serialize())
+        self.assertFalse(store.is_dirty())
+
+    def test_failed_write_keeps_old_file(self):
+        """Test that a write failing before the rename leaves the old file and no temp file."""
+        store = JsonStore(self.path)
+        store['key'] = 'old'
+        self.assertTrue(store.save())
+        store['key'] = 'new'
+        with mock.patch('settings.os.replace', side_effect=OSError('read-only')):
+            self.assertFalse(store.save())
+        self.assertTrue(store.is_dirty())
+        self.assertEqual(os.listdir(self.temp_dir), ['store.json'])
+        loaded = JsonStore(self.path)
+        loaded.load()
+        self.assertEqual(loaded.get('key'), 'old')
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -12,6 +12,7 @@ sys.path.insert(0, os.path.join(dir_name, '..'))
 sys.path.insert(0, os.path.join(dir_name, '..', 'libs'))
 
 from PyQt5.QtCore import QPointF
+from PyQt5.QtGui import QColor
 from PyQt5.QtWidgets import QApplication
 
 from libs.shape import Shape
@@ -330,6 +331,59 @@ class TestShapeCopy(unittest.TestCase):
         self.assertTrue(copied.fill)
 
 
+class TestShapeGeometryCache(unittest.TestCase):
+    """Test cases for the compact, cached Shape geometry."""
+
+    def setUp(self):
+        self.shape = Shape('box')
+        for x, y in ((0, 0), (100, 0), (100, 100), (0, 100)):
+            self.shape.add_point(QPointF(x, y))
+        self.shape.close()
+
+    def test_no_instance_dict(self):
+        """Test that shapes use __slots__ instead of a per-instance dict."""
+        self.assertFalse(hasattr(self.shape, '__dict__'))
+        with self.assertRaises(AttributeError):
+            self.shape.unknown_attribute = 1
+
+    def test_path_is_cached_until_mutation(self):
+        """Test that the path is reused and rebuilt after a move."""
+        path = self.shape.make_path()
+        self.assertIs(self.shape.make_path(), path)
+        self.shape.move_by(QPointF(10, 0))
+        self.assertIsNot(self.shape.make_path(), path)
+        self.assertTrue(self.shape.contains_point(QPointF(105, 50)))
+
+    def test_bounding_rect_invalidated_on_vertex_move(self):
+        """Test that moving a vertex updates the cached bounding rect."""
+        self.assertEqual(self.shape.bounding_rect().width(), 100)
+        self.shape.move_vertex_by(1, QPointF(50, 0))
+        self.assertEqual(self.shape.bounding_rect().width(), 150)
+        self.shape[1] = QPointF(20, 0)
+        self.assertEqual(self.shape.bounding_rect().width(), 100)
+
+    def test_added_points_are_not_shared(self):
+        """Test that moving a shape never changes the caller's points."""
+        point = QPointF(5, 5)
+        shape = Shape()
+        shape.add_point(point)
+        shape.move_by(QPointF(1, 1))
+        self.assertEqual(point, QPointF(5, 5))
+
+    def test_colors_follow_class_default(self):
+        """Test that only overridden colors stick to a shape."""
+        original = Shape.default_line_color
+        try:
+            Shape.default_line_color = QColor(1, 2, 3)
+            self.assertEqual(self.shape.line_color, QColor(1, 2, 3))
+            self.shape.fill_color = QColor(4, 5, 6)
+            copied = self.shape.copy()
+            self.assertEqual(copied.fill_color, QColor(4, 5, 6))
+            self.assertEqual(copied.line_color, QColor(1, 2, 3))
+        finally:
+            Shape.default_line_color = original
+
+
 class TestShapeClassConstants(unittest.TestCase):
     """Test cases for Shape class constants."""
 
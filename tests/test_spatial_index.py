@@ -0,0 +1,166 @@
+#!/usr/bin/env python
+# tests/test_spatial_index.py
+"""Tests for the grid spatial index used for canvas hit-testing."""
+import os
+import sys
+import time
+import unittest
+
+# Set offscreen platform for headless testing
+if 'QT_QPA_PLATFORM' not in os.environ:
+    os.environ['QT_QPA_PLATFORM'] = 'offscreen'
+
+dir_name = os.path.abspath(os.path.dirname(__file__))
+sys.path.insert(0, os.path.join(dir_name, '..'))
+
+from PyQt5.QtCore import QPointF, QRectF
+from PyQt5.QtGui import QPixmap
+from PyQt5.QtWidgets import QApplication
+
+from libs.canvas import Canvas
+from libs.shape import Shape
+from libs.spatialIndex import SpatialIndex, IndexedShapeList
+
+app = QApplication.instance() or QApplication(sys.argv)
+
+
+def make_box(x, y, w=20, h=20, label='box'):
+    shape = Shape(label)
+    for px, py in ((x, y), (x + w, y), (x + w, y + h), (x, y + h)):
+        shape.add_point(QPointF(px, py))
+    shape.close()
+    return shape
+
+
+class TestSpatialIndex(unittest.TestCase):
+    """Test cases for the uniform grid."""
+
+    def setUp(self):
+        self.index = SpatialIndex(cell_size=50)
+
+    def test_query_returns_only_nearby_items(self):
+        """Test that far away items are not candidates."""
+        near, far = make_box(10, 10), make_box(500, 500)
+        self.index.insert(near)
+        self.index.insert(far)
+        self.assertEqual(self.index.query_point(QPointF(15, 15)), {near})
+        self.assertEqual(self.index.query(QRectF(0, 0, 1000, 1000)), {near, far})
+
+    def test_update_moves_item_between_cells(self):
+        """Test that updating an item re-registers it at its new place."""
+        shape = make_box(10, 10)
+        self.index.insert(shape)
+        shape.move_by(QPointF(400, 0))
+        self.index.update(shape)
+        self.assertEqual(self.index.query_point(QPointF(15, 15)), set())
+        self.assertEqual(self.index.query_point(QPointF(415, 15)), {shape})
+
+    def test_remove(self):
+        """Test that removed items are no longer returned."""
+        shape = make_box(10, 10)
+        self.index.insert(shape)
+        self.index.remove(shape)
+        self.assertNotIn(shape, self.index)
+        self.assertEqual(self.index.query_point(QPointF(15, 15)), set())
+        self.assertEqual(self.index._cells, {})
+
+    def test_large_items_are_always_candidates(self):
+        """Test that items spanning many cells are found without filling every cell."""
+        large = make_box(0, 0, 5000, 5000)
+        self.index.insert(large)
+        self.assertEqual(self.index._cells, {})
+        self.assertEqual(self.index.query_point(QPointF(2500, 2500)), {large})
+
+
+class TestIndexedShapeList(unittest.TestCase):
+    """Test cases for keeping the index in sync with the shape list."""
+
+    def test_list_mutations_update_index(self):
+        """Test that append, insert, remove and pop keep the index in sync."""
+        a, b, c = make_box(0, 0), make_box(100, 0), make_box(200, 0)
+        shapes = IndexedShapeList([a])
+        shapes.append(c)
+        shapes.insert(1, b)
+        self.assertEqual(len(shapes.spatial_index), 3)
+        self.assertEqual(shapes.in_order({c, a, b}), [a, b, c])
+
+        shapes.remove(b)
+        self.assertIsNone(b.spatial_index)
+        self.assertNotIn(b, shapes.spatial_index)
+        self.assertIs(shapes.pop(), c)
+        self.assertEqual(len(shapes.spatial_index), 1)
+
+    def test_shape_moves_update_index(self):
+        """Test that moving a shape updates its grid cells."""
+        shape = make_box(0, 0)
+        shapes = IndexedShapeList([shape])
+        shape.move_by(QPointF(1000, 1000))
+        self.assertEqual(shapes.near(QPointF(10, 10)), [])
+        self.assertEqual(shapes.near(QPointF(1010, 1010)), [shape])
+
+        shape.move_vertex_by(2, QPointF(500, 0))
+        self.assertEqual(shapes.near(QPointF(1500, 1020)), [shape])
+
+
+class TestCanvasHitTesting(unittest.TestCase):
+    """Test cases for index-backed selection on the canvas."""
+
+    def setUp(self):
+        self.canvas = Canvas()
+        self.canvas.load_pixmap(QPixmap(4000, 4000))
+
+    def test_shapes_assignment_reindexes(self):
+        """Test that replacing the shape list rebuilds the index."""
+        old = make_box(10, 10)
+        self.canvas.load_shapes([old])
+        new = make_box(10, 10)
+        self.canvas.load_shapes([new])
+        self.assertIsNone(old.spatial_index)
+        self.assertEqual(self.canvas.shapes_near(QPointF(15, 15)), [new])
+
+    def test_select_smallest_nested_shape(self):
+        """Test that clicking selects the smallest shape containing the point."""
+        outer = make_box(0, 0, 200, 200)
+        inner = make_box(50, 50, 20, 20)
+        self.canvas.load_shapes([outer, inner])
+        self.canvas.select_shape_point(QPointF(60, 60))
+        self.assertIs(self.canvas.selected_shape, inner)
+
+    def test_hidden_shapes_are_skipped(self):
+        """Test that invisible shapes cannot be hit."""
+        shape = make_box(10, 10)
+        self.canvas.load_shapes([shape])
+        self.canvas.set_shape_visible(shape, False)
+        self.assertIsNone(self.canvas.select_shape_point(QPointF(15, 15)))
+
+    def test_keyboard_move_updates_index(self):
+        """Test that nudging the selection keeps hit-testing accurate."""
+        shape = make_box(10, 10)
+        self.canvas.load_shapes([shape])
+        self.canvas.select_shape(shape)
+        for _ in range(300):
+            self.canvas.move_one_pixel('Right')
+        self.assertEqual(self.canvas.shapes_near(QPointF(315, 15)), [shape])
+        self.assertEqual(self.canvas.shapes_near(QPointF(15, 15)), [])
+
+    def test_benchmark_hit_testing(self):
+        """Benchmark point queries against scanning 3000 boxes."""
+        shapes = [make_box((i % 60) * 60, (i // 60) * 60) for i in range(3000)]
+        self.canvas.load_shapes(shapes)
+        points = [QPointF((i * 37) % 3600, (i * 53) % 3000) for i in range(50)]
+
+        start = time.perf_counter()
+        for point in points:
+            [s for s in shapes if s.contains_point(point)]
+        scan = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for point in points:
+            [s for s in self.canvas.shapes_near(point) if s.contains_point(point)]
+        indexed = time.perf_counter() - start
+
+        self.assertLess(indexed * 10, scan)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+# tests/test_startup_benchmark.py
+"""Tests for the headless startup benchmark and its budgets."""
+import os
+import sys
+import unittest
+
+dir_name = os.path.abspath(os.path.dirname(__file__))
+sys.path.insert(0, os.path.join(dir_name, '..'))
+sys.path.insert(0, os.path.join(dir_name, '..', 'tools'))
+
+from startup_benchmark import (parse_importtime, parse_profile, cumulative_ms, check_budgets,
+                               run_benchmark, DEFAULT_IMAGE)
+
+IMPORTTIME = """\
+import time: self [us] | cumulative | imported package
+import time:       283 |        283 |     libs
+import time:       894 |       1465 |   libs.combobox
+import time:      9238 |       9238 |   PyQt5.QtWidgets
+import time:     25571 |     121631 | labelImg
+"""
+
+PROFILE = """\
+QStandardPaths: XDG_RUNTIME_DIR not set, defaulting to '/tmp/runtime-root'
+Startup profile:
+  imports                      95.2 ms
+  application                   6.0 ms
+  main window                  29.0 ms
+  show                          4.7 ms
+  first paint                   1.9 ms
+  first image                  10.0 ms
+  total                       146.8 ms
+"""
+
+
+class TestParsers(unittest.TestCase):
+    """Test cases for reading importtime and --profile-startup output."""
+
+    def test_parse_importtime(self):
+        """Test that every module line is parsed with its nesting depth."""
+        modules = parse_importtime(IMPORTTIME)
+        self.assertEqual(modules, [
+            ('libs', 283, 283, 2),
+            ('libs.combobox', 894, 1465, 1),
+            ('PyQt5.QtWidgets', 9238, 9238, 1),
+            ('labelImg', 25571, 121631, 0),
+        ])
+
+    def test_parse_profile(self):
+        """Test that the phases are read in order and other output is ignored."""
+        phases = parse_profile(PROFILE)
+        self.assertEqual(phases[0], ('imports', 95.2))
+        self.assertEqual(phases[-1], ('total', 146.8))
+        self.assertEqual(len(phases), 7)
+
+    def test_cumulative_ms(self):
+        """Test that phase times are added up to the end of the requested phase."""
+        phases = parse_profile(PROFILE)
+        self.assertAlmostEqual(cumulative_ms(phases, 'first paint'), 136.8)
+        self.assertAlmostEqual(cumulative_ms(phases, 'first image'), 146.8)
+        self.assertIsNone(cumulative_ms(phases, 'missing'))
+
+
+class TestBudgets(unittest.TestCase):
+    """Test cases for budget checks."""
+
+    RESULT = {'import_ms': 100.0, 'window_ms': 200.0, 'image_ms': 300.0,
+              'modules': [('libs.canvas', 8000, 10000, 1), ('labelImg', 25000, 120000, 0)]}
+
+    def test_within_budget(self):
+        """Test that nothing is reported when every measurement fits."""
+        self.assertEqual(check_budgets(self.RESULT, 150, 250, 350, 30), [])
+
+    def test_exceeded_budgets_are_reported(self):
+        """Test that each exceeded budget gives one message."""
+        failures = check_budgets(self.RESULT, 50, 250, 250, 10)
+        self.assertEqual(len(failures), 3)
+        self.assertIn('import labelImg', failures[0])
+        self.assertIn('first image', failures[1])
+        self.assertIn('labelImg', failures[2])
+
+    def test_missing_image_fails_the_image_budget(self):
+        """Test that an image that never loaded does not pass silently."""
+        result = dict(self.RESULT, image_ms=None)
+        self.assertEqual(len(check_budgets(result, image_budget=1000)), 1)
+        self.assertEqual(check_budgets(result, image_budget=None), [])
+
+
+class TestStartupBudget(unittest.TestCase):
+    """Regression guard: a headless start stays within the default budgets."""
+
+    def test_startup_within_default_budgets(self):
+        """Test a real offscreen start, import to first image."""
+        result = run_benchmark(DEFAULT_IMAGE, repeat=1)
+        self.assertTrue(result['modules'])
+        self.assertEqual(check_budgets(result), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+# tests/test_startup_profiler.py
+"""Tests for the startup phase profiler."""
+import os
+import sys
+import unittest
+
+dir_name = os.path.abspath(os.path.dirname(__file__))
+sys.path.insert(0, os.path.join(dir_name, '..'))
+
+from libs.startupProfiler import StartupProfiler
+
+
+class FakeClock(object):
+    """Clock that advances only when told to."""
+
+    def __init__(self):
+        self.now = 10.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestStartupProfiler(unittest.TestCase):
+    """Test cases for recording startup phases."""
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.profiler = StartupProfiler(clock=self.clock)
+
+    def test_phases_are_measured_from_the_previous_mark(self):
+        """Test that each phase only counts the time since the mark before it."""
+        self.clock.now = 10.5
+        self.profiler.mark('imports')
+        self.clock.now = 10.75
+        self.profiler.mark('main window')
+        self.assertEqual(self.profiler.phases(), [('imports', 0.5), ('main window', 0.25)])
+        self.assertEqual(self.profiler.total(), 0.75)
+
+    def test_explicit_start(self):
+        """Test that a start time taken earlier is used as the origin."""
+        profiler = StartupProfiler(start=9.0, clock=self.clock)
+        self.assertEqual(profiler.mark('imports'), 1.0)
+
+    def test_report_lists_phases_and_total(self):
+        """Test that the report has one line per phase plus the total."""
+        self.clock.now = 10.002
+        self.profiler.mark('imports')
+        lines = self.profiler.report().splitlines()
+        self.assertEqual(len(lines), 3)
+        self.assertIn('imports', lines[1])
+        self.assertIn('2.0 ms', lines[1])
+        self.assertIn('total', lines[2])
+
+    def test_empty_profile(self):
+        """Test that a profile without marks has no phases."""
+        self.assertEqual(self.profiler.phases(), [])
+        self.assertEqual(self.profiler.total(), 0.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
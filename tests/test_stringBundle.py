@@ -1,10 +1,14 @@
 """Tests for StringBundle i18n functionality."""
 import os
 import sys
+import shutil
+import tempfile
 import unittest
 
 import resources
-from stringBundle import StringBundle
+from stringBundle import StringBundle, compile_string_table, write_string_table, fallback_names
+
+LOCALES = ['en', 'en_US', 'zh', 'zh-TW', 'zh_CN', 'ja-JP', 'ja_JP.UTF-8', 'fr-FR']
 
 
 class TestStringBundle(unittest.TestCase):
@@ -50,5 +54,43 @@ class TestStringBundle(unittest.TestCase):
             str_bundle.get_string("nonexistent_string_id")
 
 
+class TestPrecompiledStrings(unittest.TestCase):
+    """The precompiled string table gives the same strings as parsing the resources."""
+
+    def test_fallback_names(self):
+        """Test that a bundle falls back to its more generic bundles."""
+        self.assertEqual(fallback_names('strings-zh-TW'), ['strings', 'strings-zh', 'strings-zh-TW'])
+        self.assertEqual(fallback_names('strings'), ['strings'])
+
+    def test_table_matches_parser(self):
+        """Test every locale against the .properties parser in the Qt resources."""
+        table = compile_string_table()
+        self.assertIn('strings', table)
+        for locale_str in LOCALES:
+            parsed = StringBundle.get_bundle(locale_str, string_table={})
+            compiled = StringBundle.get_bundle(locale_str, string_table=table)
+            self.assertEqual(compiled.id_to_message, parsed.id_to_message, locale_str)
+
+    def test_generated_module_round_trip(self):
+        """Test that the generated module holds the compiled table."""
+        temp_dir = tempfile.mkdtemp()
+        try:
+            path = os.path.join(temp_dir, 'stringTable.py')
+            table = write_string_table(path)
+            namespace = {}
+            with open(path, encoding='utf-8') as f:
+                exec(f.read(), namespace)
+            self.assertEqual(namespace['STRING_TABLE'], table)
+        finally:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+    def test_bundle_does_not_share_the_table(self):
+        """Test that changing a bundle leaves the table untouched."""
+        table = compile_string_table()
+        bundle = StringBundle.get_bundle('en', string_table=table)
+        bundle.id_to_message['openDir'] = 'changed'
+        self.assertEqual(table['strings']['openDir'], 'Open Dir')
+
+
 if __name__ == '__main__':
     unittest.main()
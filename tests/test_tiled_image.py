@@ -0,0 +1,177 @@
+#!/usr/bin/env python
+# tests/test_tiled_image.py
+"""Tests for the tiled, multi-resolution image viewer."""
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+
+# Set offscreen platform for headless testing
+if 'QT_QPA_PLATFORM' not in os.environ:
+    os.environ['QT_QPA_PLATFORM'] = 'offscreen'
+
+dir_name = os.path.abspath(os.path.dirname(__file__))
+sys.path.insert(0, os.path.join(dir_name, '..'))
+
+from PyQt5.QtCore import QPointF, QRectF, QSize
+from PyQt5.QtGui import QColor, QImage, QPixmap
+from PyQt5.QtWidgets import QApplication
+
+from libs.canvas import Canvas
+from libs.tiledImage import TileCache, TiledImage
+
+app = QApplication.instance() or QApplication(sys.argv)
+
+TEST_IMAGE = os.path.join(dir_name, 'test.512.512.bmp')
+
+
+class TestTileCache(unittest.TestCase):
+    """Test cases for the LRU tile cache."""
+
+    def test_lru_eviction(self):
+        """Test that the least recently used tile is evicted first."""
+        cache = TileCache(max_size=2)
+        cache.put((0, 0, 0), 'a')
+        cache.put((0, 1, 0), 'b')
+        cache.get((0, 0, 0))
+        cache.put((0, 2, 0), 'c')
+
+        self.assertIn((0, 0, 0), cache)
+        self.assertNotIn((0, 1, 0), cache)
+        self.assertEqual(len(cache), 2)
+
+
+class TestTiledImage(unittest.TestCase):
+    """Test cases for the tile pyramid geometry and decoding."""
+
+    def setUp(self):
+        self.tiled = TiledImage(TEST_IMAGE, tile_size=128)
+
+    def tearDown(self):
+        self.tiled.close()
+
+    def test_size_and_levels(self):
+        """Test native size and number of pyramid levels."""
+        self.assertEqual(self.tiled.size(), QSize(512, 512))
+        # 512 / 128 = 4 tiles per side -> levels of 4, 2 and 1 tiles
+        self.assertEqual(self.tiled.level_count, 3)
+
+    def test_level_for_scale(self):
+        """Test that zooming out picks coarser levels."""
+        self.assertEqual(self.tiled.level_for_scale(2.0), 0)
+        self.assertEqual(self.tiled.level_for_scale(1.0), 0)
+        self.assertEqual(self.tiled.level_for_scale(0.5), 1)
+        self.assertEqual(self.tiled.level_for_scale(0.3), 1)
+        self.assertEqual(self.tiled.level_for_scale(0.01), 2)
+
+    def test_visible_tiles(self):
+        """Test that only tiles intersecting the view are returned."""
+        tiles = self.tiled.visible_tiles(QRectF(0, 0, 200, 100), 0)
+        self.assertEqual(tiles, [(0, 0, 0), (0, 1, 0)])
+
+        tiles = self.tiled.visible_tiles(QRectF(0, 0, 512, 512), 1)
+        self.assertEqual(len(tiles), 4)
+
+    def test_visible_tiles_outside_image(self):
+        """Test that an area outside the image has no tiles."""
+        self.assertEqual(self.tiled.visible_tiles(QRectF(600, 600, 50, 50), 0), [])
+
+    def test_load_tile_decodes_region(self):
+        """Test that tiles are decoded at the level resolution."""
+        self.assertEqual(self.tiled.load_tile((0, 3, 3)).size(), QSize(128, 128))
+        # A level 1 tile covers 256 source pixels decoded to 128
+        self.assertEqual(self.tiled.tile_rect(1, 1, 0).width(), 256)
+        self.assertEqual(self.tiled.load_tile((1, 1, 0)).size(), QSize(128, 128))
+
+    def test_overview_is_downsampled(self):
+        """Test that the overview respects the requested maximum dimension."""
+        overview = self.tiled.overview(100)
+        self.assertEqual(max(overview.width(), overview.height()), 100)
+
+    def test_async_tile_is_cached(self):
+        """Test that a requested tile ends up in the cache."""
+        self.assertIsNone(self.tiled.tile((0, 0, 0)))
+        self.tiled._thread_pool.waitForDone()
+        app.processEvents()
+        self.assertIsNotNone(self.tiled.tile((0, 0, 0)))
+
+
+class TestCanvasTiledMode(unittest.TestCase):
+    """Test cases for Canvas working in native tiled coordinates."""
+
+    def setUp(self):
+        self.canvas = Canvas()
+        self.tiled = TiledImage(TEST_IMAGE, tile_size=128)
+        overview = QPixmap.fromImage(self.tiled.overview(64))
+        self.canvas.load_tiled_image(self.tiled, overview)
+
+    def test_image_size_is_native(self):
+        """Test that canvas bounds use the native size, not the overview."""
+        self.assertEqual(self.canvas.pixmap.width(), 64)
+        self.assertEqual(self.canvas.image_size(), QSize(512, 512))
+        self.assertFalse(self.canvas.out_of_pixmap(QPointF(500, 500)))
+        self.assertTrue(self.canvas.out_of_pixmap(QPointF(513, 10)))
+
+    def test_snap_point_uses_native_size(self):
+        """Test that snapping clamps to native image bounds."""
+        self.assertEqual(self.canvas.snap_point_to_canvas(600, 20), (512, 20, True))
+
+    def test_paint_requests_visible_tiles(self):
+        """Test that painting queues the visible tiles and then draws them."""
+        self.canvas.scale = 0.5
+        self.canvas.adjustSize()
+        self.canvas.grab()
+        self.tiled._thread_pool.waitForDone()
+        app.processEvents()
+        self.assertEqual(len(self.tiled.cache), 4)
+        self.assertFalse(self.canvas.grab().isNull())
+
+    def test_load_pixmap_leaves_tiled_mode(self):
+        """Test that loading a regular pixmap drops the tiled source."""
+        self.canvas.load_pixmap(QPixmap(100, 50))
+        self.assertIsNone(self.canvas.tiled_image)
+        self.assertEqual(self.canvas.image_size(), QSize(100, 50))
+
+
+class TestMainWindowTiledLoading(unittest.TestCase):
+    """Test that large images open in tiled mode when enabled."""
+
+    @classmethod
+    def setUpClass(cls):
+        from labelImg import get_main_app
+        cls.app, cls.win = get_main_app()
+        cls.temp_dir = tempfile.mkdtemp()
+        cls.large_path = os.path.join(cls.temp_dir, 'large.png')
+        image = QImage(3000, 200, QImage.Format_RGB32)
+        image.fill(QColor(10, 200, 30))
+        image.save(cls.large_path)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.win.tiled_view_option.setChecked(False)
+        shutil.rmtree(cls.temp_dir, ignore_errors=True)
+
+    def test_tiled_view_loads_native_resolution(self):
+        """Test that the canvas works at native resolution in tiled view."""
+        self.win.tiled_view_option.setChecked(True)
+        self.assertTrue(self.win.load_file(self.large_path))
+
+        self.assertIsNotNone(self.win.canvas.tiled_image)
+        self.assertEqual(self.win._image_scale_factor, 1.0)
+        self.assertEqual(self.win.canvas.image_size(), QSize(3000, 200))
+        self.assertEqual(self.win.image_data, [200, 3000, 3])
+
+    def test_downsampled_without_tiled_view(self):
+        """Test that the default path still downsamples large images."""
+        self.win.tiled_view_option.setChecked(False)
+        self.assertTrue(self.win.load_file(self.large_path))
+
+        self.assertIsNone(self.win.canvas.tiled_image)
+        width = self.win.canvas.image_size().width()
+        self.assertLess(width, 3000)
+        self.assertAlmostEqual(self.win._image_scale_factor, width / 3000.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -16,7 +16,7 @@ from PyQt5.QtCore import QPointF
 
 from libs.utils import (
     Struct, new_action, new_icon, add_actions, format_shortcut,
-    generate_color_by_text, natural_sort, distance, trimmed
+    generate_color_by_text, natural_sort, natural_insert_index, distance, trimmed
 )
 
 # Create QApplication for tests
@@ -124,6 +124,16 @@ class TestNaturalSort(unittest.TestCase):
 
         self.assertEqual(items, ['only'])
 
+    def test_insert_index_keeps_natural_order(self):
+        """Test that the insert index matches where natural_sort would put the item."""
+        items = ['f1', 'f3', 'f11']
+
+        self.assertEqual(natural_insert_index(items, 'f5'), 2)
+        self.assertEqual(natural_insert_index(items, 'f0'), 0)
+        self.assertEqual(natural_insert_index(items, 'f20'), 3)
+        self.assertEqual(natural_insert_index([], 'f1'), 0)
+        self.assertEqual(natural_insert_index(items, 'F4', key=lambda x: x.lower()), 2)
+
 
 class TestDistance(unittest.TestCase):
     """Test cases for distance function."""
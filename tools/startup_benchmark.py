@@ -0,0 +1,215 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Startup benchmark for labelImg.
+
+Runs labelImg headless (QT_QPA_PLATFORM=offscreen) in fresh processes and
+measures:
+
+* the import cost of every module pulled in by ``import labelImg``
+  (parsed from ``python -X importtime``),
+* the time until the main window is shown and painted, and
+* the time until the first image given on the command line is loaded
+  (from ``labelImg.py --profile-startup``).
+
+Each measurement is the median over ``--repeat`` runs. The script exits
+with status 1 when a budget is exceeded, so it can guard against startup
+regressions in CI.
+"""
+
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+DEFAULT_IMAGE = os.path.join(ROOT_DIR, 'demo', 'demo.jpg')
+
+# Default budgets in milliseconds, generous enough for a slow CI machine
+DEFAULT_IMPORT_BUDGET = 1500
+DEFAULT_WINDOW_BUDGET = 2500
+DEFAULT_IMAGE_BUDGET = 3000
+
+IMPORTTIME_LINE = re.compile(r'^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$')
+PROFILE_LINE = re.compile(r'^\s+(.+?)\s+(\d+(?:\.\d+)?) ms\s*$')
+
+
+def parse_importtime(text):
+    """Parse ``-X importtime`` output.
+
+    Returns a list of (module, self_us, cumulative_us, depth) tuples in the
+    order they were printed; depth 0 is a top level import.
+    """
+    modules = []
+    for line in text.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            # importtime indents nested imports by two spaces, after one separating space
+            depth = max(0, (len(indent) - 1) // 2)
+            modules.append((name, int(self_us), int(cumulative_us), depth))
+    return modules
+
+
+def parse_profile(text):
+    """Parse the report printed by ``labelImg.py --profile-startup``.
+
+    Returns an ordered list of (phase, milliseconds) pairs, including the
+    trailing total.
+    """
+    phases = []
+    in_report = False
+    for line in text.splitlines():
+        if line.startswith('Startup profile:'):
+            in_report = True
+            phases = []
+            continue
+        match = PROFILE_LINE.match(line) if in_report else None
+        if match:
+            phases.append((match.group(1), float(match.group(2))))
+    return phases
+
+
+def cumulative_ms(phases, name):
+    """Milliseconds from the start of the process until the end of phase ``name``."""
+    total = 0.0
+    for phase, ms in phases:
+        if phase == 'total':
+            break
+        total += ms
+        if phase == name:
+            return total
+    return None
+
+
+def offscreen_env():
+    env = dict(os.environ)
+    env['QT_QPA_PLATFORM'] = 'offscreen'
+    return env
+
+
+def measure_imports(python=sys.executable):
+    """Import labelImg in a fresh interpreter and return the parsed importtime table."""
+    result = subprocess.run([python, '-X', 'importtime', '-c', 'import labelImg'],
+                            cwd=ROOT_DIR, env=offscreen_env(),
+                            stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True)
+    if result.returncode != 0:
+        raise RuntimeError('import labelImg failed:\n%s' % result.stderr)
+    return parse_importtime(result.stderr)
+
+
+def measure_startup(image=None, python=sys.executable, timeout=120):
+    """Start labelImg with --profile-startup and return its phases."""
+    command = [python, os.path.join(ROOT_DIR, 'labelImg.py')]
+    if image:
+        command.append(image)
+    command.append('--profile-startup')
+    result = subprocess.run(command, cwd=ROOT_DIR, env=offscreen_env(), timeout=timeout,
+                            stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True)
+    phases = parse_profile(result.stdout)
+    if result.returncode != 0 or not phases:
+        raise RuntimeError('labelImg --profile-startup failed:\n%s%s' % (result.stdout, result.stderr))
+    return phases
+
+
+def run_benchmark(image=DEFAULT_IMAGE, repeat=3, python=sys.executable):
+    """Measure startup ``repeat`` times and return the medians.
+
+    The result has ``import_ms`` (cumulative cost of ``import labelImg``),
+    ``window_ms`` (process start until the window is painted), ``image_ms``
+    (until the first image is loaded, None without an image) and ``modules``,
+    the importtime table of the last run.
+    """
+    import_ms, window_ms, image_ms = [], [], []
+    modules = []
+    for _ in range(repeat):
+        modules = measure_imports(python)
+        top = [m for m in modules if m[0] == 'labelImg']
+        if top:
+            import_ms.append(top[-1][2] / 1000.0)
+        phases = measure_startup(image, python)
+        window_ms.append(cumulative_ms(phases, 'first paint'))
+        if image:
+            image_ms.append(cumulative_ms(phases, 'first image'))
+    return {
+        'import_ms': statistics.median(import_ms) if import_ms else None,
+        'window_ms': statistics.median(window_ms),
+        'image_ms': statistics.median(image_ms) if image_ms and None not in image_ms else None,
+        'modules': modules,
+    }
+
+
+def check_budgets(result, import_budget=DEFAULT_IMPORT_BUDGET, window_budget=DEFAULT_WINDOW_BUDGET,
+                  image_budget=DEFAULT_IMAGE_BUDGET, module_budget=None):
+    """Return a list of messages, one for every budget the result exceeds.
+
+    A budget of None is not checked. An image that failed to load counts as
+    exceeding the image budget.
+    """
+    failures = []
+    for key, budget, what in (('import_ms', import_budget, 'import labelImg'),
+                              ('window_ms', window_budget, 'main window shown'),
+                              ('image_ms', image_budget, 'first image loaded')):
+        value = result.get(key)
+        if budget is None:
+            continue
+        if value is None:
+            if key == 'image_ms' and 'image_ms' in result:
+                failures.append('%s: no image was loaded' % what)
+            continue
+        if value > budget:
+            failures.append('%s took %.1f ms, budget %.1f ms' % (what, value, budget))
+    if module_budget is not None:
+        for name, self_us, _, _ in result.get('modules', []):
+            if self_us / 1000.0 > module_budget:
+                failures.append('importing %s took %.1f ms, budget %.1f ms'
+                                % (name, self_us / 1000.0, module_budget))
+    return failures
+
+
+def format_result(result, top=15):
+    lines = []
+    if result['import_ms'] is not None:
+        lines.append('import labelImg        %8.1f ms' % result['import_ms'])
+    lines.append('main window shown      %8.1f ms' % result['window_ms'])
+    if result['image_ms'] is not None:
+        lines.append('first image loaded     %8.1f ms' % result['image_ms'])
+    lines.append('')
+    lines.append('Slowest modules (self / cumulative):')
+    slowest = sorted(result['modules'], key=lambda m: m[1], reverse=True)[:top]
+    for name, self_us, cumulative_us, _ in slowest:
+        lines.append('  %-40s %8.1f ms %8.1f ms' % (name, self_us / 1000.0, cumulative_us / 1000.0))
+    return '\n'.join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Measure labelImg startup time headless.')
+    parser.add_argument('-i', '--image', default=DEFAULT_IMAGE,
+                        help='image or folder opened at startup (default: demo/demo.jpg)')
+    parser.add_argument('--no-image', action='store_true', help='only measure the empty window')
+    parser.add_argument('-n', '--repeat', type=int, default=3, help='runs to take the median of')
+    parser.add_argument('--import-budget', type=float, default=DEFAULT_IMPORT_BUDGET,
+                        help='budget for import labelImg in ms')
+    parser.add_argument('--window-budget', type=float, default=DEFAULT_WINDOW_BUDGET,
+                        help='budget until the main window is shown in ms')
+    parser.add_argument('--image-budget', type=float, default=DEFAULT_IMAGE_BUDGET,
+                        help='budget until the first image is loaded in ms')
+    parser.add_argument('--module-budget', type=float, default=None,
+                        help='budget for the self import time of any single module in ms')
+    args = parser.parse_args(argv)
+
+    image = None if args.no_image else args.image
+    result = run_benchmark(image, max(1, args.repeat))
+    print(format_result(result))
+
+    failures = check_budgets(result, args.import_budget, args.window_budget,
+                             args.image_budget if image else None, args.module_budget)
+    for failure in failures:
+        print('BUDGET EXCEEDED: %s' % failure)
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())